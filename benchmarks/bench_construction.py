@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark constructing the generated model classes.
+
+Models carry @type as their msgspec tag, which is a class constant that is
+never stored in or computed for an instance, and define no __post_init__, so
+constructing them runs no Python code. The "lambda default" rows rebuild each
+class with all its fields in the previous form, with an @type field set by
+``default_factory=lambda: "Person"``, which called Python code for every
+instance.
+
+Usage:
+    python benchmarks/bench_construction.py [--count N] [--repeat N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+from documents import best_time
+from msgspec_schemaorg.models import Offer, Person, PostalAddress
+from msgspec_schemaorg.resolve import resolve
+
+
+def lambda_default_class(cls: type) -> type:
+    """Rebuild a model class with the @type field of earlier generated models."""
+    resolve(cls)
+    tag = cls.__struct_config__.tag
+    fields: List[tuple] = [
+        ("type", str, msgspec.field(default_factory=lambda: tag, name="@type"))
+    ]
+    for info in msgspec.structs.fields(cls):
+        if info.default_factory is not msgspec.NODEFAULT:
+            default = msgspec.field(default_factory=info.default_factory, name=info.encode_name)
+        else:
+            default = msgspec.field(default=info.default, name=info.encode_name)
+        fields.append((info.name, Any, default))
+    return msgspec.defstruct(tag, fields, frozen=True, omit_defaults=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000, help="Instances per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    names = [f"Person {i}" for i in range(args.count)]
+    cases: Dict[str, Callable[[type], Callable[[], Any]]] = {
+        "Person(name=...)": lambda cls: lambda: [cls(name=n) for n in names],
+        "PostalAddress(...)": lambda cls: lambda: [
+            cls(streetAddress=n, postalCode="12345", addressCountry="US") for n in names
+        ],
+        "Offer(...)": lambda cls: lambda: [
+            cls(price=1.5, priceCurrency="USD", sku=n) for n in names
+        ],
+    }
+    classes = [Person, PostalAddress, Offer]
+
+    print(f"{'construction':<20} {'lambda default':>16} {'tag':>10}   (ns/object)")
+    for (label, case), cls in zip(cases.items(), classes):
+        before = best_time(case(lambda_default_class(cls)), args.repeat)
+        after = best_time(case(cls), args.repeat)
+        print(
+            f"{label:<20} {before / args.count * 1e9:>16.0f} "
+            f"{after / args.count * 1e9:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
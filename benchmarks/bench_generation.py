@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark model generation on the full Schema.org vocabulary.
+
+Each step is measured serially and with ``--jobs`` workers. A full
+generation writes into an empty directory; an incremental one regenerates
+into the directory of a previous run, where every file is unchanged and
+``write_generated_files`` leaves it alone.
+
+Usage:
+    python benchmarks/bench_generation.py --schema-file schemaorg-current-https.jsonld [--jobs N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from msgspec_schemaorg.generate import SchemaProcessor, write_generated_files
+from msgspec_schemaorg.schema_cache import add_schema_arguments, load_schema_from_args
+
+STEPS = ["init", "render", "write", "rewrite"]
+
+
+def bench_generation(schema_data: Any, jobs: int, repeat: int) -> Dict[str, float]:
+    """
+    Measure the generation steps with a number of workers.
+
+    Args:
+        schema_data: Schema.org JSON-LD data
+        jobs: Rendering and writing workers
+        repeat: Number of runs, the fastest of each step is kept
+
+    Returns:
+        Best seconds by step: ``init`` for SchemaProcessor(), ``render`` for
+        generate_all_structs(), ``write`` for writing into an empty directory
+        and ``rewrite`` for writing the same files again
+    """
+    best = dict.fromkeys(STEPS, float("inf"))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for run in range(repeat):
+            output_dir = Path(temp_dir) / str(run)
+
+            start = time.perf_counter()
+            processor = SchemaProcessor(schema_data)
+            init_done = time.perf_counter()
+            files = processor.generate_all_structs(output_dir, jobs=jobs)
+            render_done = time.perf_counter()
+            write_generated_files(files, output_dir, jobs=jobs)
+            write_done = time.perf_counter()
+            counts = write_generated_files(files, output_dir, jobs=jobs)
+            rewrite_done = time.perf_counter()
+            assert counts["unchanged"] == len(files), counts
+
+            for step, elapsed in zip(
+                STEPS,
+                (
+                    init_done - start,
+                    render_done - init_done,
+                    write_done - render_done,
+                    rewrite_done - write_done,
+                ),
+            ):
+                best[step] = min(best[step], elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_schema_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Rendering and writing workers compared with serial generation "
+        "(default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    schema_data = load_schema_from_args(args)
+    serial = bench_generation(schema_data, 1, args.repeat)
+    parallel = bench_generation(schema_data, args.jobs, args.repeat)
+
+    rows = [
+        ("SchemaProcessor()", lambda t: t["init"]),
+        ("generate_all_structs()", lambda t: t["render"]),
+        ("write_generated_files()", lambda t: t["write"]),
+        ("  incremental", lambda t: t["rewrite"]),
+        ("Total", lambda t: t["init"] + t["render"] + t["write"]),
+        ("  incremental", lambda t: t["init"] + t["render"] + t["rewrite"]),
+    ]
+    print(f"{'step':<24} {'1 job':>9} {f'{args.jobs} jobs':>9} {'speedup':>8}")
+    for label, step in rows:
+        before, after = step(serial), step(parallel)
+        print(f"{label:<24} {before:>8.3f}s {after:>8.3f}s {before / after:>7.2f}x")
+
+    print()
+    print(f"{'full vs incremental':<24} {'full':>9} {'incr.':>9} {'speedup':>8}")
+    for label, times in (("1 job", serial), (f"{args.jobs} jobs", parallel)):
+        full = times["init"] + times["render"] + times["write"]
+        incremental = times["init"] + times["render"] + times["rewrite"]
+        print(f"{label:<24} {full:>8.3f}s {incremental:>8.3f}s {full / incremental:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
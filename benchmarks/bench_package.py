@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark importing, decoder construction and throughput of the generated models.
+
+Import times, memory use and decoder construction are measured in fresh
+interpreters, since they only happen once per process. Encoding and decoding
+throughput is measured in this process. The results can be written as JSON
+to track them across releases and generator changes.
+
+Usage:
+    python benchmarks/bench_package.py [--repeat N] [--documents N] [--json FILE]
+
+The measurements are also available in-process through run_benchmarks().
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+import msgspec_schemaorg
+from documents import DOCUMENTS, best_time
+
+# Classes whose decoder construction is measured by default
+DEFAULT_DECODER_CLASSES = ["Thing", "Product", "Offer", "Event", "Place", "Recipe", "NewsArticle"]
+
+# Run in a fresh interpreter, prints the measurements as JSON. Memory is the
+# current resident set size on Linux, and the peak elsewhere.
+_CHILD_CODE = """
+import importlib, json, os, sys, time
+
+def rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+import msgspec
+result = {"baseline_rss_bytes": rss()}
+mode, name = sys.argv[1], sys.argv[2]
+
+start = time.perf_counter()
+module = importlib.import_module(name)
+result["import_s"] = time.perf_counter() - start
+
+if mode == "import":
+    start = time.perf_counter()
+    if name == "msgspec_schemaorg.models":
+        from msgspec_schemaorg.resolve import resolve_all
+        result["classes"] = len(resolve_all())
+    else:
+        result["classes"] = len([getattr(module, export) for export in module.__all__])
+    result["load_s"] = time.perf_counter() - start
+else:
+    from msgspec_schemaorg.resolve import resolve
+    cls = getattr(module, sys.argv[3])
+    start = time.perf_counter()
+    resolve(cls)
+    msgspec.json.Decoder(cls)
+    result["cold_s"] = time.perf_counter() - start
+    start = time.perf_counter()
+    msgspec.json.Decoder(cls)
+    result["warm_s"] = time.perf_counter() - start
+
+result["rss_bytes"] = rss()
+print(json.dumps(result))
+"""
+
+
+def _run_child(*args: str) -> Dict[str, Any]:
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD_CODE, *args],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def _best_of(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Keep the fastest time of each measurement, and the last other values."""
+    best = dict(runs[-1])
+    for key in best:
+        if key.endswith("_s"):
+            best[key] = min(run[key] for run in runs)
+    return best
+
+
+def categories() -> List[str]:
+    """Return the category modules of the generated models."""
+    from msgspec_schemaorg import models
+
+    return sorted(models.__lazy_submodules__)
+
+
+def bench_imports(repeat: int = 3) -> Dict[str, Dict[str, Any]]:
+    """
+    Measure cold imports of the models package and of each category.
+
+    Each module is imported in ``repeat`` fresh interpreters. ``import_s``
+    is the time of the import statement, ``load_s`` the time to load every
+    class the module exports (for the models package, every class of the
+    vocabulary), and ``rss_bytes`` the resident memory after loading them.
+
+    Args:
+        repeat: Number of interpreters per module
+
+    Returns:
+        Measurements by module name
+    """
+    modules = ["msgspec_schemaorg.models"]
+    modules.extend(f"msgspec_schemaorg.models.{category}" for category in categories())
+    return {
+        module: _best_of([_run_child("import", module) for _ in range(repeat)])
+        for module in modules
+    }
+
+
+def bench_decoder_construction(
+    class_names: List[str], repeat: int = 3
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Measure building a JSON decoder for each class in fresh interpreters.
+
+    ``cold_s`` includes resolving the annotations of every class reachable
+    from the class, ``warm_s`` is building a second decoder for it.
+
+    Args:
+        class_names: Names of the model classes
+        repeat: Number of interpreters per class
+
+    Returns:
+        Measurements by class name
+    """
+    return {
+        name: _best_of(
+            [
+                _run_child("decoder", "msgspec_schemaorg.models", name)
+                for _ in range(repeat)
+            ]
+        )
+        for name in class_names
+    }
+
+
+def bench_throughput(documents: int = 1000, repeat: int = 5) -> Dict[str, Dict[str, Any]]:
+    """
+    Measure decoding and encoding arrays of representative documents.
+
+    Args:
+        documents: Number of documents in each array
+        repeat: Number of runs, the fastest is kept
+
+    Returns:
+        Documents and megabytes per second by document type
+    """
+    from msgspec_schemaorg import models
+    from msgspec_schemaorg.codecs import get_decoder, get_encoder
+
+    encoder = get_encoder()
+    results = {}
+    for name, make_document in DOCUMENTS.items():
+        buf = msgspec.json.encode([make_document(i) for i in range(documents)])
+        decoder = get_decoder(List[getattr(models, name)])
+        objects = decoder.decode(buf)
+
+        decode_s = best_time(lambda: decoder.decode(buf), repeat)
+        encode_s = best_time(lambda: encoder.encode(objects), repeat)
+        results[name] = {
+            "bytes": len(buf),
+            "decode_docs_per_s": documents / decode_s,
+            "decode_mb_per_s": len(buf) / 1e6 / decode_s,
+            "encode_docs_per_s": documents / encode_s,
+            "encode_mb_per_s": len(buf) / 1e6 / encode_s,
+        }
+    return results
+
+
+def run_benchmarks(
+    repeat: int = 3,
+    documents: int = 1000,
+    decoder_classes: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Run all benchmarks.
+
+    Args:
+        repeat: Number of runs per measurement
+        documents: Number of documents per throughput run
+        decoder_classes: Classes whose decoder construction is measured,
+            DEFAULT_DECODER_CLASSES if None
+
+    Returns:
+        The environment and the results of each benchmark, JSON serializable
+    """
+    return {
+        "environment": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "msgspec": msgspec.__version__,
+            "msgspec_schemaorg": msgspec_schemaorg.__version__,
+        },
+        "imports": bench_imports(repeat),
+        "decoder_construction": bench_decoder_construction(
+            decoder_classes or DEFAULT_DECODER_CLASSES, repeat
+        ),
+        "throughput": bench_throughput(documents, repeat),
+    }
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Print the results of run_benchmarks() as tables."""
+    print(f"{'module':<40} {'import ms':>10} {'load ms':>10} {'classes':>8} {'RSS MB':>8}")
+    for module, result in results["imports"].items():
+        rss = result["rss_bytes"]
+        print(
+            f"{module:<40} {result['import_s'] * 1e3:>10.1f} {result['load_s'] * 1e3:>10.1f} "
+            f"{result['classes']:>8} {rss / 1e6 if rss else float('nan'):>8.1f}"
+        )
+
+    print()
+    print(f"{'decoder':<16} {'cold ms':>10} {'warm ms':>10}")
+    for name, result in results["decoder_construction"].items():
+        print(f"{name:<16} {result['cold_s'] * 1e3:>10.1f} {result['warm_s'] * 1e3:>10.3f}")
+
+    print()
+    print(f"{'document':<16} {'decode/s':>10} {'MB/s':>8} {'encode/s':>10} {'MB/s':>8}")
+    for name, result in results["throughput"].items():
+        print(
+            f"{name:<16} {result['decode_docs_per_s']:>10,.0f} {result['decode_mb_per_s']:>8.1f} "
+            f"{result['encode_docs_per_s']:>10,.0f} {result['encode_mb_per_s']:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--documents", type=int, default=1000, help="Documents per throughput run")
+    parser.add_argument(
+        "--decoder-classes",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        default=None,
+        help="Comma-separated classes whose decoder construction is measured "
+        f"(default: {','.join(DEFAULT_DECODER_CLASSES)})",
+    )
+    parser.add_argument("--json", type=Path, help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat, args.documents, args.decoder_classes)
+    print_results(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
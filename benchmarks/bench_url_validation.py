@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark decoding a product feed under each URL validation policy.
+
+The URL policy is set once per process, so each policy is measured in a
+process of its own.
+
+Usage:
+    python benchmarks/bench_url_validation.py [--products N] [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+from documents import best_time, feed_product
+from msgspec_schemaorg.codecs import get_decoder
+from msgspec_schemaorg.models import Product
+from msgspec_schemaorg.resolve import set_url_policy
+from msgspec_schemaorg.utils import URL_POLICIES, is_valid_url, is_valid_url_fast
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", type=int, default=5000, help="Products in the feed")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    parser.add_argument("--policy", choices=URL_POLICIES, help="Only measure one policy")
+    args = parser.parse_args()
+
+    feed = msgspec.json.encode([feed_product(i) for i in range(args.products)])
+    if args.policy:
+        set_url_policy(args.policy)
+        decoder = get_decoder(List[Product])
+        elapsed = best_time(lambda: decoder.decode(feed), args.repeat)
+        print(
+            f"{args.policy:<8} {args.products / elapsed:>12,.0f} "
+            f"{len(feed) / 1e6 / elapsed:>8.1f}"
+        )
+        return
+
+    urls = [
+        "https://shop3.example.com/products/12?ref=feed&utm_source=crawler",
+        "https://www.wikidata.org/wiki/Q1012",
+        "https://brand7.example.org/logo.png",
+    ] * 10000
+
+    print(f"Feed: {args.products} products, {len(feed) / 1e6:.1f} MB")
+    print(f"{'policy':<8} {'products/s':>12} {'MB/s':>8}", flush=True)
+    for policy in URL_POLICIES:
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                f"--products={args.products}",
+                f"--repeat={args.repeat}",
+                f"--policy={policy}",
+            ],
+            check=True,
+        )
+
+    print()
+    print(f"{'validator':<18} {'ns/URL':>8}")
+    for name, validator in [("is_valid_url", is_valid_url), ("is_valid_url_fast", is_valid_url_fast)]:
+        elapsed = best_time(lambda: [validator(url) for url in urls], args.repeat)
+        print(f"{name:<18} {elapsed / len(urls) * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
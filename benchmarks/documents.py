@@ -0,0 +1,202 @@
+"""
+Representative Schema.org documents and timing helpers used by the benchmarks.
+
+Each document function returns the JSON-LD object of one document as it is
+typically published on the web, with nested objects typed by @type. The ``i``
+argument varies names and URLs so that a batch of documents is not one
+repeated string.
+"""
+
+import time
+from typing import Any, Callable, Dict
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of several runs of ``func``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def product_with_offers(i: int = 0) -> Dict[str, Any]:
+    """A product page with a brand, a rating and offers from several sellers."""
+    base = f"https://shop{i % 17}.example.com"
+    return {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "@id": f"{base}/products/{i}#product",
+        "name": f"Trail Running Shoe {i}",
+        "description": "Lightweight trail running shoe with a grippy outsole.",
+        "sku": f"SKU-{i:08d}",
+        "gtin13": f"{4006381333931 + i}",
+        "url": f"{base}/products/{i}",
+        "image": [f"{base}/images/{i}/{n}.jpg" for n in range(3)],
+        "brand": {"@type": "Brand", "name": f"Brand {i % 50}"},
+        "aggregateRating": {
+            "@type": "AggregateRating",
+            "ratingValue": 4.4,
+            "reviewCount": 89 + i % 100,
+        },
+        "offers": [
+            {
+                "@type": "Offer",
+                "url": f"{base}/products/{i}/buy?seller={n}",
+                "price": 119.99 + n,
+                "priceCurrency": "USD",
+                "priceValidUntil": "2030-11-20",
+                "itemCondition": "https://schema.org/NewCondition",
+                "availability": "https://schema.org/InStock",
+                "seller": {"@type": "Organization", "name": f"Seller {n}"},
+            }
+            for n in range(3)
+        ],
+    }
+
+
+def feed_product(i: int = 0) -> Dict[str, Any]:
+    """A product of a shop feed, with the URL fields typical of such feeds."""
+    base = f"https://shop{i % 17}.example.com"
+    return {
+        "@type": "Product",
+        "@id": f"{base}/products/{i}#product",
+        "name": f"Product {i}",
+        "sku": f"SKU-{i:08d}",
+        "url": f"{base}/products/{i}?ref=feed&utm_source=crawler",
+        "image": [f"{base}/images/{i}/{n}.jpg" for n in range(3)],
+        "sameAs": [
+            f"https://www.wikidata.org/wiki/Q{1000 + i}",
+            f"https://en.wikipedia.org/wiki/Product_{i}",
+        ],
+        "brand": {
+            "@type": "Brand",
+            "name": f"Brand {i % 50}",
+            "url": f"https://brand{i % 50}.example.org/",
+            "logo": f"https://brand{i % 50}.example.org/logo.png",
+        },
+        "offers": {
+            "@type": "Offer",
+            "url": f"{base}/products/{i}/buy",
+            "price": 10.0 + i % 100,
+            "priceCurrency": "USD",
+            "seller": {"@type": "Organization", "name": f"Shop {i % 17}", "url": base},
+        },
+    }
+
+
+def event_with_place(i: int = 0) -> Dict[str, Any]:
+    """A concert with its venue, address, performer and ticket offer."""
+    return {
+        "@context": "https://schema.org",
+        "@type": "Event",
+        "name": f"The Adventures of Kira and Morrison, night {i}",
+        "startDate": "2030-07-21T19:00:00-05:00",
+        "endDate": "2030-07-21T23:00:00-05:00",
+        "eventStatus": "https://schema.org/EventScheduled",
+        "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
+        "location": {
+            "@type": "Place",
+            "name": f"Snickerpark Stadium {i % 20}",
+            "address": {
+                "@type": "PostalAddress",
+                "streetAddress": "100 West Snickerpark Dr",
+                "addressLocality": "Snickertown",
+                "postalCode": "19019",
+                "addressRegion": "PA",
+                "addressCountry": "US",
+            },
+            "geo": {"@type": "GeoCoordinates", "latitude": 40.75, "longitude": -73.98},
+        },
+        "image": [f"https://example.com/photos/{i}/1x1/photo.jpg"],
+        "description": "The Adventures of Kira and Morrison is coming to Snickertown.",
+        "performer": {"@type": "Person", "name": "Kira Morrison"},
+        "offers": {
+            "@type": "Offer",
+            "url": f"https://www.example.com/event_offer/{i}",
+            "price": 30,
+            "priceCurrency": "USD",
+            "availability": "https://schema.org/InStock",
+            "validFrom": "2030-05-21T12:00:00",
+        },
+    }
+
+
+def recipe(i: int = 0) -> Dict[str, Any]:
+    """A recipe with its author, nutrition and instructions."""
+    return {
+        "@context": "https://schema.org",
+        "@type": "Recipe",
+        "name": f"Party Coffee Cake {i}",
+        "image": [f"https://example.com/photos/{i}/16x9/photo.jpg"],
+        "author": {"@type": "Person", "name": "Mary Stone"},
+        "datePublished": "2018-03-10",
+        "description": "This coffee cake is awesome and perfect for parties.",
+        "keywords": "cake for a party, coffee",
+        "recipeYield": "10",
+        "recipeCategory": "Dessert",
+        "recipeCuisine": "American",
+        "nutrition": {"@type": "NutritionInformation", "servingSize": "1 slice"},
+        "recipeIngredient": [
+            "2 cups of flour",
+            "3/4 cup white sugar",
+            "2 teaspoons baking powder",
+            "1/2 teaspoon salt",
+            "1/2 cup butter",
+            "2 eggs",
+            "3/4 cup milk",
+        ],
+        "recipeInstructions": [
+            "Preheat the oven to 350 degrees F. Grease and flour a 9x9 inch pan.",
+            "In a large bowl, combine flour, sugar, baking powder, and salt.",
+            "Mix in the butter, eggs, and milk.",
+            "Spread into the prepared pan.",
+            "Bake for 30 to 35 minutes, or until firm.",
+        ],
+        "aggregateRating": {"@type": "AggregateRating", "ratingValue": 5, "ratingCount": 18},
+    }
+
+
+def news_article(i: int = 0) -> Dict[str, Any]:
+    """A news article with its authors, publisher and images."""
+    return {
+        "@context": "https://schema.org",
+        "@type": "NewsArticle",
+        "headline": f"Title of a News Article {i}",
+        "image": [
+            f"https://example.com/photos/{i}/1x1/photo.jpg",
+            f"https://example.com/photos/{i}/4x3/photo.jpg",
+            f"https://example.com/photos/{i}/16x9/photo.jpg",
+        ],
+        "datePublished": "2024-01-05T08:00:00+08:00",
+        "dateModified": "2024-02-05T09:20:00+08:00",
+        "author": [
+            {
+                "@type": "Person",
+                "name": "Jane Doe",
+                "url": "https://example.com/profile/janedoe123",
+            },
+            {
+                "@type": "Person",
+                "name": "John Doe",
+                "url": "https://example.com/profile/johndoe123",
+            },
+        ],
+        "publisher": {
+            "@type": "Organization",
+            "name": "The Example Times",
+            "logo": {"@type": "ImageObject", "url": "https://example.com/logo.png"},
+        },
+        "articleSection": "World",
+        "wordCount": 1200 + i % 500,
+    }
+
+
+# Documents by model class name
+DOCUMENTS: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    "Product": product_with_offers,
+    "Event": event_with_place,
+    "Recipe": recipe,
+    "NewsArticle": news_article,
+}
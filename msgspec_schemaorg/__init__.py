@@ -4,11 +4,16 @@ msgspec_schemaorg - Schema.org models generated using msgspec.
 
 __version__ = "0.2.1"
 
+import importlib
+
 from .base import SchemaOrgBase
+from .decode import AnyThingDecoder, decode_any
 
 # Import modules conditionally to avoid circular dependencies
 __all__ = [
     "SchemaOrgBase",
+    "AnyThingDecoder",
+    "decode_any",
     "models",
     "enums",
 ]
@@ -16,14 +21,10 @@ __all__ = [
 
 # These imports are deferred to avoid circular dependencies when using just one part
 def __getattr__(name):
-    if name == "models":
-        from . import models as _models
-
-        globals()["models"] = _models
-        return _models
-    elif name == "enums":
-        from . import enums as _enums
-
-        globals()["enums"] = _enums
-        return _enums
+    if name in ("models", "enums"):
+        # import_module rather than "from . import", which would look the
+        # attribute up on this package again and recurse into __getattr__
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -3,12 +3,229 @@ Base classes for Schema.org models with JSON-LD compatibility.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Union
+import enum
+import importlib
+import re
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 import msgspec
 from msgspec import field
+from msgspec.structs import force_setattr
 
+from . import utils
 
-class SchemaOrgBase(msgspec.Struct, frozen=True, omit_defaults=True):
+_DATE_WORDS = {"date", "datetime", "time"}
+
+
+class _FieldKinds(NamedTuple):
+    """Names of the fields that need checks after decoding."""
+
+    # Fields decoded as str because they accept several date/time types
+    dates: Tuple[str, ...]
+    # Fields whose range includes enumerations, with the names of the
+    # enumerations and whether the field accepts text as well
+    enums: Tuple[str, ...]
+    enum_types: Tuple[Tuple[Tuple[str, ...], bool], ...]
+    # Return the values of the dates and enums fields as a tuple, None if
+    # there are no such fields
+    date_values: Optional[Callable[[Any], tuple]]
+    enum_values: Optional[Callable[[Any], tuple]]
+
+
+def _values_getter(names: Tuple[str, ...]) -> Optional[Callable[[Any], tuple]]:
+    # attrgetter only returns a tuple for several names, so a single name is
+    # fetched twice; callers zip the values with the names
+    if not names:
+        return None
+    if len(names) == 1:
+        return attrgetter(names[0], names[0])
+    return attrgetter(*names)
+
+
+def _make_field_kinds(
+    dates: Tuple[str, ...],
+    enums: Tuple[str, ...],
+    enum_types: Tuple[Tuple[Tuple[str, ...], bool], ...],
+) -> _FieldKinds:
+    return _FieldKinds(
+        dates,
+        enums,
+        enum_types,
+        _values_getter(dates),
+        _values_getter(enums),
+    )
+
+
+# Field kinds declared by each class itself and including inherited ones
+_OWN_FIELD_KINDS: Dict[type, _FieldKinds] = {}
+_FIELD_KINDS: Dict[type, _FieldKinds] = {}
+
+# Names of the generated enumerations and the modules defining them
+_ENUM_MODULES: Optional[Dict[str, str]] = None
+
+# Members of the enumerations by their values and IRIs, keyed by enum_types
+# entry, and the tables of the enums fields of each class
+_ENUM_TABLES: Dict[Tuple[Tuple[str, ...], bool], Dict[str, enum.Enum]] = {}
+_CLASS_ENUM_TABLES: Dict[type, Tuple[Dict[str, enum.Enum], ...]] = {}
+
+_SCHEMA_PREFIXES = ("schema:", "http://schema.org/", "https://schema.org/")
+
+
+def _get_enum_modules() -> Dict[str, str]:
+    global _ENUM_MODULES
+
+    if _ENUM_MODULES is None:
+        try:
+            from .models._namespace import MODULES
+        except ImportError:
+            MODULES = {}
+        enums_package = f"{__package__}.enums."
+        _ENUM_MODULES = {
+            name: module_name
+            for name, module_name in MODULES.items()
+            if module_name.startswith(enums_package)
+        }
+    return _ENUM_MODULES
+
+
+def _enum_table(enum_type: Tuple[Tuple[str, ...], bool]) -> Dict[str, enum.Enum]:
+    """
+    Build the table of the members of enumerations by their values and IRIs.
+
+    Args:
+        enum_type: Names of the enumerations, most specific first, and
+            whether the field accepts text, in which case bare values are left
+            out of the table
+
+    Returns:
+        Mapping of member values and IRIs to members
+    """
+    table = _ENUM_TABLES.get(enum_type)
+    if table is not None:
+        return table
+
+    names, accepts_text = enum_type
+    modules = _get_enum_modules()
+    table = {}
+    for name in names:
+        cls = getattr(importlib.import_module(modules[name]), name)
+        for member_name, member in cls.__members__.items():
+            # Enumerations generated by earlier versions have their metadata
+            # table as a member
+            if member.value != member_name:
+                continue
+            keys = [prefix + member.value for prefix in _SCHEMA_PREFIXES]
+            if not accepts_text:
+                keys.append(member.value)
+            for key in keys:
+                table.setdefault(key, member)
+    _ENUM_TABLES[enum_type] = table
+    return table
+
+
+def _class_enum_tables(cls: type) -> Tuple[Dict[str, enum.Enum], ...]:
+    """Get the enumeration tables of the enums fields of a class, in order."""
+    tables = _CLASS_ENUM_TABLES.get(cls)
+    if tables is None:
+        tables = tuple(_enum_table(enum_type) for enum_type in _field_kinds(cls).enum_types)
+        _CLASS_ENUM_TABLES[cls] = tables
+    return tables
+
+
+def _own_field_kinds(cls: type) -> _FieldKinds:
+    """
+    Classify the fields a class declares itself.
+
+    Generated annotations name their types as strings, so this must run before
+    ``msgspec_schemaorg.resolve`` replaces them with runtime types. Fields that
+    also accept plain text are left alone.
+    """
+    kinds = _OWN_FIELD_KINDS.get(cls)
+    if kinds is None:
+        dates = []
+        enums = []
+        enum_types = []
+        enum_modules = _get_enum_modules()
+        for name, annotation in cls.__dict__.get("__annotations__", {}).items():
+            if not isinstance(annotation, str):
+                continue
+            words = re.findall(r"\w+", annotation)
+            # Enumerations in the order of the annotation, most specific first
+            enum_names = tuple(dict.fromkeys(w for w in words if w in enum_modules))
+            words = set(words)
+            if enum_names:
+                enums.append(name)
+                enum_types.append((enum_names, "str" in words))
+            if "str" in words:
+                continue
+            date_words = words & _DATE_WORDS
+            if date_words and len(date_words) + ("URL" in words) > 1:
+                dates.append(name)
+        kinds = _OWN_FIELD_KINDS[cls] = _make_field_kinds(
+            tuple(dates), tuple(enums), tuple(enum_types)
+        )
+    return kinds
+
+
+def _field_kinds(cls: type) -> _FieldKinds:
+    kinds = _FIELD_KINDS.get(cls)
+    if kinds is None:
+        own = [_own_field_kinds(klass) for klass in reversed(cls.__mro__)]
+        kinds = _FIELD_KINDS[cls] = _make_field_kinds(
+            tuple(name for k in own for name in k.dates),
+            tuple(name for k in own for name in k.enums),
+            tuple(enum_type for k in own for enum_type in k.enum_types),
+        )
+    return kinds
+
+
+def _apply_field_kinds(
+    obj: Any,
+    parse_dates: bool,
+    parse_enums: bool,
+) -> None:
+    """
+    Convert the date and enumeration fields of a decoded model.
+
+    Args:
+        obj: The model instance, updated in place
+        parse_dates: Parse the strings of date fields with parse_iso8601
+        parse_enums: Replace strings naming a member of an enumeration in
+            the field's range with the member
+    """
+    cls = type(obj)
+    kinds = _FIELD_KINDS.get(cls) or _field_kinds(cls)
+    # Most fields are unset, so the values are fetched in one call and only
+    # looked at one by one if any of them is set
+    if parse_dates and kinds.date_values is not None:
+        values = kinds.date_values(obj)
+        if values.count(None) < len(values):
+            for name, value in zip(kinds.dates, values):
+                if isinstance(value, str):
+                    force_setattr(obj, name, utils.parse_iso8601(value))
+                elif isinstance(value, list):
+                    force_setattr(obj, name, utils.parse_iso8601_many(value))
+
+    if parse_enums and kinds.enum_values is not None:
+        values = kinds.enum_values(obj)
+        if values.count(None) < len(values):
+            tables = _CLASS_ENUM_TABLES.get(cls) or _class_enum_tables(cls)
+            # Enumeration members are str instances too, and hashing them
+            # runs Python code, so only plain strings are looked up
+            for name, table, value in zip(kinds.enums, tables, values):
+                if type(value) is str:
+                    member = table.get(value)
+                    if member is not None:
+                        force_setattr(obj, name, member)
+                elif isinstance(value, list):
+                    force_setattr(
+                        obj,
+                        name,
+                        [table.get(item, item) if type(item) is str else item for item in value],
+                    )
+
+
+class SchemaOrgBase(msgspec.Struct, frozen=True, omit_defaults=True, tag_field="@type"):
     """
     Base class for all Schema.org models with JSON-LD fields.
 
@@ -18,10 +235,56 @@ class SchemaOrgBase(msgspec.Struct, frozen=True, omit_defaults=True):
 
     JSON-LD fields are aliased using msgspec's field renaming to ensure
     that the serialized output uses the @ prefix.
+
+    The @type field is the msgspec tag of each generated class, so models can
+    be decoded as tagged unions that select the class from the @type value.
     """
 
     id: Optional[str] = field(default=None, name="@id")
     context: Optional[Union[str, Dict[str, Any]]] = field(default=None, name="@context")
-    # Note: type field is intentionally omitted since it will be provided by each class
+    # Note: @type is not a field, it is the struct tag set by each generated class
     graph: Optional[List[Dict[str, Any]]] = field(default=None, name="@graph")
     reverse: Optional[Dict[str, Any]] = field(default=None, name="@reverse")
+
+    @property
+    def type(self) -> str:
+        """The JSON-LD @type of this object."""
+        return self.__struct_config__.tag
+
+
+# Metadata of the members of each enumeration, loaded on first access
+_ENUM_METADATA: Dict[type, Dict[str, Dict[str, str]]] = {}
+
+
+class _EnumMetadata:
+    """
+    Descriptor returning the metadata of the members of an enumeration.
+
+    The generated enums package keeps the metadata of all enumerations in its
+    ``_metadata`` module, which is only imported on first access.
+    """
+
+    def __get__(self, member: Any, cls: type) -> Dict[str, Dict[str, str]]:
+        metadata = _ENUM_METADATA.get(cls)
+        if metadata is None:
+            try:
+                from .enums._metadata import METADATA
+            except ImportError:
+                METADATA = {}
+            metadata = _ENUM_METADATA[cls] = {
+                name: {"id": id_, "comment": comment, "label": label}
+                for name, (id_, label, comment) in METADATA.get(cls.__name__, {}).items()
+            }
+        return metadata
+
+
+class SchemaOrgEnum(str, enum.Enum):
+    """
+    Base class for the generated Schema.org enumerations.
+
+    Members are strings with their Schema.org name as value. ``metadata``
+    maps each member name to its Schema.org ``id``, ``label`` and
+    ``comment``, and is loaded the first time it is accessed.
+    """
+
+    metadata = _EnumMetadata()
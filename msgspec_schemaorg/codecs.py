@@ -0,0 +1,632 @@
+"""
+Cached msgspec encoders and decoders for Schema.org models.
+
+Building a decoder makes msgspec walk every type reachable from the target
+class, which for the deeply nested Schema.org graph is far more expensive than
+decoding a single document. This module builds each decoder once and keeps it
+in a bounded, thread-safe LRU cache so call sites can look it up per request.
+
+Decoders of types holding model classes are ModelDecoder instances. The
+properties of the models are decoded as tagged unions of the classes of
+their range, which cannot hold the subclasses Schema.org allows there: adding
+them would make every union span large parts of the vocabulary, and building
+a decoder take seconds. Documents holding such objects fail the msgspec pass
+and are decoded again, each object into its own class.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from typing import get_args
+
+import msgspec
+
+from .base import SchemaOrgBase, _apply_field_kinds, _values_getter
+from .compact import _model_class_of, compact_class
+from .resolve import _get_namespace, resolve
+
+FORMATS = ("json", "msgpack")
+
+# Maximum number of decoders kept before the least recently used is dropped
+DEFAULT_MAXSIZE = 128
+
+MsgspecDecoder = Union[msgspec.json.Decoder, msgspec.msgpack.Decoder]
+Encoder = Union[msgspec.json.Encoder, msgspec.msgpack.Encoder]
+
+_REFERENCE_KEYS = frozenset(("@id", "@type"))
+
+
+class _Classes(NamedTuple):
+    """The model classes a type accepts for an object."""
+
+    # Classes by @type tag
+    by_tag: Dict[str, type]
+    # Class of objects without @type, if the type accepts a single class and
+    # possibly some of its subclasses
+    default: Optional[type]
+    # Whether the classes are compact classes with or without short keys,
+    # None for model classes
+    short_keys: Optional[bool] = None
+
+
+class _Field(NamedTuple):
+    """A field holding model classes."""
+
+    name: str
+    classes: _Classes
+
+
+class _Options(NamedTuple):
+    """Conversions of the fields of decoded models."""
+
+    parse_dates: bool
+    parse_enums: bool
+
+
+def _make_options(parse_dates: bool, parse_enums: bool) -> Optional[_Options]:
+    """Get the options of a decoder, None if they leave the models as decoded."""
+    if not parse_dates and not parse_enums:
+        return None
+    return _Options(bool(parse_dates), bool(parse_enums))
+
+
+# The @type of the nodes of a document by @id
+_TypesById = Dict[str, Union[str, List[str]]]
+
+# Fields holding model classes of each class, by encoded name
+_model_fields_cache: Dict[type, Dict[str, _Field]] = {}
+
+# Encoded names of the fields holding model classes of each class, and a
+# function returning their values as a tuple
+_model_values_cache: Dict[type, Tuple[Tuple[str, ...], Optional[Callable[[Any], tuple]]]] = {}
+
+
+def _accepted_classes_in(tp: Any) -> Iterator[type]:
+    """Yield the model and compact classes referenced by a resolved type."""
+    if isinstance(tp, type):
+        if (issubclass(tp, SchemaOrgBase) and tp is not SchemaOrgBase) or _model_class_of(tp):
+            yield tp
+        return
+    for arg in get_args(tp):
+        yield from _accepted_classes_in(arg)
+
+
+def _model_of(cls: type) -> type:
+    """Get the model class of a model or compact class."""
+    compact = _model_class_of(cls)
+    return cls if compact is None else compact[0]
+
+
+def _classes_of(tp: Any) -> Optional[_Classes]:
+    """Get the model classes a resolved type accepts, None if there are none."""
+    by_tag = {cls.__struct_config__.tag: cls for cls in _accepted_classes_in(tp)}
+    if not by_tag:
+        return None
+    # Compact classes do not inherit from each other, their model classes do
+    models = {_model_of(cls): cls for cls in by_tag.values()}
+    declared = [
+        cls
+        for model, cls in models.items()
+        if not any(base in models for base in model.__mro__[1:])
+    ]
+    compact = _model_class_of(next(iter(by_tag.values())))
+    return _Classes(
+        by_tag,
+        declared[0] if len(declared) == 1 else None,
+        None if compact is None else compact[1],
+    )
+
+
+def _model_fields(cls: type) -> Dict[str, _Field]:
+    fields = _model_fields_cache.get(cls)
+    if fields is None:
+        fields = {}
+        for info in msgspec.structs.fields(cls):
+            classes = _classes_of(info.type)
+            if classes is not None:
+                fields[info.encode_name] = _Field(info.name, classes)
+        _model_fields_cache[cls] = fields
+    return fields
+
+
+def _model_class(tag: Any, classes: _Classes) -> Optional[type]:
+    """Find the model class of a @type, among the accepted or generated classes."""
+    if type(tag) is not str:
+        return None
+    cls = classes.by_tag.get(tag)
+    if cls is not None:
+        return cls
+    try:
+        cls = _get_namespace()[tag]
+    except KeyError:
+        return None
+    # Data types such as URL are generated classes as well, but are resolved
+    # to their Python types
+    if not (isinstance(cls, type) and issubclass(cls, SchemaOrgBase)):
+        return None
+    # Subclasses of the accepted classes are not reachable from the type
+    resolve(cls)
+    if classes.short_keys is not None:
+        return compact_class(cls, classes.short_keys)
+    return cls
+
+
+def _accepted_base(cls: type, classes: _Classes) -> Optional[type]:
+    """Find the closest of a class and its parents that is accepted."""
+    for base in _model_of(cls).__mro__:
+        if base is SchemaOrgBase:
+            break
+        accepted = classes.by_tag.get(base.__struct_config__.tag)
+        if accepted is not None and _model_of(accepted) is base:
+            return accepted
+    return None
+
+
+def _is_unknown(tag: Any, classes: _Classes) -> bool:
+    """Check whether a @type names no model class at all, e.g. an extension type."""
+    names = tag if type(tag) is list else (tag,)
+    return all(type(name) is str and _model_class(name, classes) is None for name in names)
+
+
+def _decode_object(
+    obj: Dict[str, Any], classes: _Classes, types_by_id: _TypesById, always: bool = False
+) -> Optional[Tuple[Any, Optional[type]]]:
+    """
+    Decode a JSON-LD object that msgspec may not decode as part of its parent.
+
+    Objects of a subclass of the accepted classes, and objects holding one,
+    are decoded into their own class. Objects with several types are
+    decoded into the most specific one that is accepted. References such as ``{"@id": ...}``
+    carry no data of their own, and are given the closest accepted class of
+    the referenced node in ``types_by_id`` instead. Objects whose @type is
+    not a Schema.org class are decoded into the class of their property if
+    it accepts a single one, and dropped otherwise.
+
+    Returns:
+        The instance and the accepted class standing in for it in its parent,
+        ``(None, None)`` if the object is dropped, or None if msgspec decodes
+        the object as it is, unless always is set
+    """
+    tag = obj.get("@type")
+    if type(tag) is list:
+        # An object of several types is decoded into the most specific of
+        # them that is accepted, the first one if they are unrelated
+        accepted = []
+        for name in tag:
+            cls = _model_class(name, classes)
+            if cls is not None and _accepted_base(cls, classes) is not None:
+                accepted.append(cls)
+        for cls in accepted:
+            model = _model_of(cls)
+            if not any(
+                other is not cls and issubclass(_model_of(other), model) for other in accepted
+            ):
+                tag = obj["@type"] = cls.__struct_config__.tag
+                break
+    if tag is None and obj.keys() <= _REFERENCE_KEYS:
+        ref_tag = types_by_id.get(obj.get("@id"))
+        for name in ref_tag if type(ref_tag) is list else (ref_tag,):
+            ref_cls = _model_class(name, classes)
+            base = _accepted_base(ref_cls, classes) if ref_cls is not None else None
+            if base is not None:
+                tag = obj["@type"] = base.__struct_config__.tag
+                break
+    if tag is not None and _is_unknown(tag, classes):
+        if classes.default is None:
+            return None, None
+        tag = obj["@type"] = classes.default.__struct_config__.tag
+    if tag is None:
+        cls = base = classes.default
+        if cls is None:
+            return None
+    else:
+        cls = _model_class(tag, classes)
+        base = _accepted_base(cls, classes) if cls is not None else None
+        if base is None:
+            return None
+
+    instance = _decode_model(obj, cls, types_by_id)
+    if instance is None:
+        if cls is base and not always:
+            return None
+        instance = msgspec.convert(obj, cls)
+    return instance, base
+
+
+def _decode_model(obj: Dict[str, Any], cls: type, types_by_id: _TypesById) -> Any:
+    """Decode an object into a class, or return None if msgspec decodes its nested objects."""
+    decoded = {}
+    fields = _model_fields(cls)
+    for key, value in obj.items():
+        field = fields.get(key)
+        if field is not None:
+            try:
+                value, instances = _stand_in(value, field.classes, types_by_id)
+            except msgspec.ValidationError as error:
+                raise _nested_error(error, f".{key}") from None
+            if instances:
+                obj[key] = value
+                decoded[field.name] = instances
+    if not decoded:
+        return None
+
+    instance = msgspec.convert(obj, cls)
+    return msgspec.structs.replace(
+        instance,
+        **{
+            name: _restore(getattr(instance, name), instances)
+            for name, instances in decoded.items()
+        },
+    )
+
+
+def _stand_in(
+    value: Any, classes: _Classes, types_by_id: _TypesById
+) -> Tuple[Any, Dict[Optional[int], Any]]:
+    """
+    Decode the objects of a value that msgspec cannot decode.
+
+    Returns:
+        The value with each of those objects replaced by an empty object of
+        the accepted class it stands in for, and the instances by index in
+        the value, or None for a value that is one object. Dropped objects
+        are removed from lists, and a dropped value is replaced with None.
+    """
+    instances: Dict[Optional[int], Any] = {}
+    if type(value) is dict:
+        decoded = _decode_object(value, classes, types_by_id)
+        if decoded is not None:
+            instances[None] = decoded[0]
+            value = None if decoded[1] is None else {"@type": decoded[1].__struct_config__.tag}
+    elif type(value) is list:
+        kept = []
+        for index, item in enumerate(value):
+            if type(item) is dict:
+                try:
+                    decoded = _decode_object(item, classes, types_by_id)
+                except msgspec.ValidationError as error:
+                    raise _nested_error(error, f"[{index}]") from None
+                if decoded is not None:
+                    if decoded[1] is None:
+                        continue
+                    instances[len(kept)] = decoded[0]
+                    item = {"@type": decoded[1].__struct_config__.tag}
+            kept.append(item)
+        # The list is updated in place, so its parent holds the kept items
+        # even if none of them was decoded here
+        value[:] = kept
+    return value, instances
+
+
+def _nested_error(error: msgspec.ValidationError, path: str) -> msgspec.ValidationError:
+    """Prefix the location of an error in a nested object with its path."""
+    message = str(error)
+    if message.endswith("`") and " - at `$" in message:
+        return msgspec.ValidationError(message.replace(" - at `$", f" - at `${path}", 1))
+    return msgspec.ValidationError(f"{message} - at `${path}`")
+
+
+def _restore(value: Any, instances: Dict[Optional[int], Any]) -> Any:
+    """Put instances back in place of the objects standing in for them."""
+    if None in instances:
+        return instances[None]
+    value = list(value)
+    for index, instance in instances.items():
+        value[index] = instance
+    return value
+
+
+def _model_values(cls: type) -> Tuple[Tuple[str, ...], Optional[Callable[[Any], tuple]]]:
+    model_values = _model_values_cache.get(cls)
+    if model_values is None:
+        fields = _model_fields(cls)
+        model_values = _model_values_cache[cls] = (
+            tuple(fields),
+            _values_getter(tuple(info.name for info in fields.values())),
+        )
+    return model_values
+
+
+def _apply_options(value: Any, options: _Options) -> None:
+    """Apply the options of a decoder to the models of a decoded value."""
+    if isinstance(value, SchemaOrgBase):
+        _apply_field_kinds(value, *options)
+        keys, getter = _model_values_cache.get(type(value)) or _model_values(type(value))
+        if getter is None:
+            return
+        # Most fields are unset, see _apply_field_kinds
+        items = getter(value)
+        if items.count(None) < len(items):
+            for key, item in zip(keys, items):
+                # Fields holding models may hold text and URLs as well
+                if item is not None and type(item) is not str:
+                    try:
+                        _apply_options(item, options)
+                    except msgspec.ValidationError as error:
+                        raise _nested_error(error, f".{key}") from None
+    elif type(value) is list:
+        for index, item in enumerate(value):
+            if type(item) is not str:
+                try:
+                    _apply_options(item, options)
+                except msgspec.ValidationError as error:
+                    raise _nested_error(error, f"[{index}]") from None
+    elif type(value) is dict:
+        for item in value.values():
+            _apply_options(item, options)
+
+
+def _finish(value: Any, options: Optional[_Options]) -> Any:
+    if options is not None:
+        _apply_options(value, options)
+    return value
+
+
+def _decode_builtins(
+    obj: Any, tp: Any, classes: _Classes, types_by_id: _TypesById
+) -> Any:
+    """
+    Decode a document of builtin types that msgspec failed to decode.
+
+    Args:
+        obj: The document, as decoded into builtin types. It is modified.
+        tp: The type to decode into
+        classes: The model classes the type accepts for objects
+        types_by_id: The @type of the nodes of the document by @id
+
+    Returns:
+        The decoded value
+
+    Raises:
+        msgspec.ValidationError: If the document does not match the type
+    """
+    if type(obj) is dict:
+        decoded = _decode_object(obj, classes, types_by_id, always=True)
+        if decoded is not None:
+            if decoded[1] is None:
+                # A document of an unknown @type cannot be dropped
+                msgspec.convert(obj, tp)
+            return decoded[0]
+    value, instances = _stand_in(obj, classes, types_by_id)
+    value = msgspec.convert(value, tp)
+    return _restore(value, instances) if instances else value
+
+
+class ModelDecoder:
+    """
+    Decoder of a type holding Schema.org model classes.
+
+    Documents are decoded in a single msgspec pass, unless they hold an
+    object of a subclass of the classes its property or the type accepts,
+    such as an AggregateOffer in ``offers``, or an object whose @type is an
+    array. Those documents are decoded into builtin types and converted
+    again, with each such object decoded into its own class, or the most
+    specific of its types that is accepted. Objects without @type are
+    decoded into the class of their property, if it accepts a single one.
+
+    Args:
+        type: The type to decode into, with its model classes resolved
+        format: Either ``"json"`` or ``"msgpack"``
+        parse_dates: Parse date fields, see get_decoder
+        parse_enums: Convert enumeration values, see get_decoder
+    """
+
+    def __init__(
+        self,
+        type: Any,
+        format: str,
+        parse_dates: bool = False,
+        parse_enums: bool = False,
+    ):
+        self.type = type
+        self.format = format
+        self._options = _make_options(parse_dates, parse_enums)
+        self._decoder: MsgspecDecoder
+        if format == "json":
+            self._decoder = msgspec.json.Decoder(type)
+        else:
+            self._decoder = msgspec.msgpack.Decoder(type)
+        self._classes = _classes_of(type) or _Classes({}, None)
+
+    def decode(self, buf: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Decode a document.
+
+        Args:
+            buf: The JSON or msgpack document to decode
+
+        Returns:
+            The decoded value
+
+        Raises:
+            msgspec.ValidationError: If the document does not match the type
+        """
+        try:
+            value = self._decoder.decode(buf)
+        except msgspec.ValidationError:
+            if self.format == "json":
+                obj = msgspec.json.decode(buf)
+            else:
+                obj = msgspec.msgpack.decode(buf)
+        else:
+            return _finish(value, self._options)
+        return _finish(_decode_builtins(obj, self.type, self._classes, {}), self._options)
+
+
+Decoder = Union[MsgspecDecoder, ModelDecoder]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the decoder cache, in the style of functools.lru_cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _DecoderCache:
+    """
+    LRU cache of decoders keyed by type, format and options.
+
+    Lookups and construction happen under one lock, so concurrent requests for
+    the same type build its decoder only once.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._decoders: OrderedDict[Tuple[Any, ...], Decoder] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, type: Any, format: str, *options: Any) -> Decoder:
+        key = (type, format, *options)
+        with self._lock:
+            decoder = self._decoders.get(key)
+            if decoder is not None:
+                self.hits += 1
+                self._decoders.move_to_end(key)
+                return decoder
+
+            self.misses += 1
+            decoder = _build_decoder(type, format, *options)
+            self._decoders[key] = decoder
+            if len(self._decoders) > self.maxsize:
+                self._decoders.popitem(last=False)
+            return decoder
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._decoders))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._decoders.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _check_format(format: str) -> None:
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported format {format!r}, expected one of {FORMATS}")
+
+
+def _build_decoder(type: Any, format: str, parse_dates: bool, parse_enums: bool) -> Decoder:
+    # Model annotations reference each other by name, resolve the classes
+    # reachable from the type before msgspec inspects it
+    resolve(type)
+    if _classes_of(type) is not None:
+        return ModelDecoder(type, format, parse_dates, parse_enums)
+    if format == "json":
+        return msgspec.json.Decoder(type)
+    return msgspec.msgpack.Decoder(type)
+
+
+_cache = _DecoderCache()
+_encoders: Dict[str, Encoder] = {}
+_encoders_lock = threading.Lock()
+
+
+def get_decoder(
+    type: Any,
+    format: str = "json",
+    parse_dates: bool = False,
+    parse_enums: bool = False,
+) -> Decoder:
+    """
+    Return a cached decoder for a model class or any other msgspec type.
+
+    The options apply to the models the decoder returns, nested ones
+    included, after the msgspec pass. URL fields are validated by msgspec
+    itself, see ``msgspec_schemaorg.resolve.set_url_policy``.
+
+    - ``parse_dates`` parses the strings of fields accepting several of
+      date, datetime and time, which msgspec cannot tell apart in a union,
+      with ``parse_iso8601``. Values that cannot be parsed are kept.
+    - ``parse_enums`` replaces strings naming a member of an enumeration in
+      the field's range, by value or by IRI (``"https://schema.org/InStock"``,
+      ``"http://schema.org/InStock"`` or ``"schema:InStock"``), with the
+      member. Bare values are only converted in fields that do not also
+      accept text.
+
+    Args:
+        type: The type to decode into, e.g. ``Person`` or ``List[Person]``
+        format: Either ``"json"`` or ``"msgpack"``
+        parse_dates: Parse date fields
+        parse_enums: Convert enumeration values to members
+
+    Returns:
+        A ModelDecoder if the type holds model classes, else a
+        ``msgspec.json.Decoder`` or ``msgspec.msgpack.Decoder`` for the type
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    _check_format(format)
+    return _cache.get(type, format, bool(parse_dates), bool(parse_enums))
+
+
+def get_encoder(format: str = "json") -> Encoder:
+    """
+    Return the shared encoder for a format.
+
+    msgspec encoders do not depend on the type being encoded, so a single
+    instance per format serves every model class.
+
+    Args:
+        format: Either ``"json"`` or ``"msgpack"``
+
+    Returns:
+        A ``msgspec.json.Encoder`` or ``msgspec.msgpack.Encoder``
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    _check_format(format)
+    encoder = _encoders.get(format)
+    if encoder is None:
+        with _encoders_lock:
+            encoder = _encoders.get(format)
+            if encoder is None:
+                if format == "json":
+                    encoder = msgspec.json.Encoder()
+                else:
+                    encoder = msgspec.msgpack.Encoder()
+                _encoders[format] = encoder
+    return encoder
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return hit and miss counters of the decoder cache.
+
+    Returns:
+        CacheInfo with hits, misses, maxsize and current size
+    """
+    return _cache.info()
+
+
+def cache_clear() -> None:
+    """Drop all cached decoders and reset the counters."""
+    _cache.clear()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """
+    Change the maximum number of cached decoders.
+
+    Args:
+        maxsize: New maximum, the least recently used decoders beyond it are dropped
+
+    Raises:
+        ValueError: If maxsize is less than 1
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    with _cache._lock:
+        _cache.maxsize = maxsize
+        while len(_cache._decoders) > maxsize:
+            _cache._decoders.popitem(last=False)
@@ -0,0 +1,222 @@
+"""
+Compact variants of the Schema.org models for high-volume use.
+
+A compact class has the fields, @type tag and field types of its model class,
+with model classes in field types replaced by their compact variants. It is
+defined with ``gc=False``: instances are never tracked by the cyclic garbage
+collector, so holding millions of them does not make collections slower, and
+each instance is smaller by the collector's header. Compact classes do not
+inherit from each other or from the model classes. Their URL fields are
+validated under the URL policy, but the date and enumeration options of the
+decoders do not apply to them.
+
+Compact classes are derived from the model classes on first use, so they
+never differ from the generated models, and they encode to and decode from
+the same JSON and msgpack documents. Decoders of compact classes decode
+objects of a subclass of a property's range into the compact variant of
+their class, as for the models. They are available by name from
+``msgspec_schemaorg.compact.models``::
+
+    from msgspec_schemaorg.codecs import get_decoder
+    from msgspec_schemaorg.compact.models import Offer
+
+    offer = get_decoder(Offer).decode(buf)
+
+Compact instances must not hold reference cycles, which the garbage
+collector could not free.
+
+Short key variants, ``compact_class(cls, short_keys=True)``, encode each
+property under the short key generated for it in
+``msgspec_schemaorg.models._keys`` instead of its Schema.org name, which
+makes msgpack documents exchanged between services a fraction of the size.
+The keys of a property never change when the models are regenerated. Short
+key classes are available by name from ``msgspec_schemaorg.compact.keyed``.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args, get_origin
+
+import msgspec
+
+from ..base import SchemaOrgBase
+from ..properties import get_properties
+from ..resolve import resolve
+
+__all__ = ["compact_class", "to_compact", "from_compact"]
+
+_lock = threading.RLock()
+
+# Compact class of each model class and short_keys flag, and the model class
+# of each compact class
+_compact_classes: Dict[Tuple[type, bool], type] = {}
+_model_classes: Dict[type, type] = {}
+
+# Compact classes whose field types are not set yet
+_defining: Dict[Tuple[type, bool], type] = {}
+
+# Short key of each property name, loaded on first use
+_short_keys: Optional[Dict[str, str]] = None
+
+
+def _get_short_keys() -> Dict[str, str]:
+    global _short_keys
+
+    if _short_keys is None:
+        from ..models._keys import KEYS
+
+        _short_keys = KEYS
+    return _short_keys
+
+
+def _compact_type(tp: Any, short_keys: bool) -> Any:
+    """Replace the model classes in a resolved field type with compact classes."""
+    if isinstance(tp, type) and issubclass(tp, SchemaOrgBase):
+        return compact_class(tp, short_keys)
+    origin = get_origin(tp)
+    if origin is Union:
+        return Union[tuple(_compact_type(arg, short_keys) for arg in get_args(tp))]
+    if origin is list:
+        return List[_compact_type(get_args(tp)[0], short_keys)]
+    return tp
+
+
+def _encode_names(cls: type, fields: Tuple[msgspec.structs.FieldInfo, ...]) -> List[str]:
+    """Get the short keys of the fields of a model class."""
+    keys = _get_short_keys()
+    properties = get_properties(cls)
+    names = []
+    for info in fields:
+        # @id and @context are not Schema.org properties and keep their names
+        prop = properties.get(info.name)
+        names.append(keys.get(prop.property, info.encode_name) if prop else info.encode_name)
+    return names
+
+
+def compact_class(cls: type, short_keys: bool = False) -> type:
+    """
+    Return the compact variant of a model class, defining it on first use.
+
+    Args:
+        cls: A generated model class
+        short_keys: Encode the fields under their short keys instead of
+            their Schema.org property names
+
+    Returns:
+        The compact class, with the same name, fields and @type tag
+
+    Raises:
+        TypeError: If cls is not a model class
+    """
+    key = (cls, short_keys)
+    compact = _compact_classes.get(key)
+    if compact is not None:
+        return compact
+    if not (isinstance(cls, type) and issubclass(cls, SchemaOrgBase)) or cls is SchemaOrgBase:
+        raise TypeError(f"{cls!r} is not a Schema.org model class")
+
+    with _lock:
+        compact = _compact_classes.get(key) or _defining.get(key)
+        if compact is not None:
+            return compact
+
+        resolve(cls)
+        fields = msgspec.structs.fields(cls)
+        if short_keys:
+            encode_names = _encode_names(cls, fields)
+        else:
+            encode_names = [info.encode_name for info in fields]
+        # Field types are set after defining the class, as they may refer back
+        # to it through other compact classes. The classes are only published
+        # once all classes they refer to are complete.
+        outermost = not _defining
+        compact = msgspec.defstruct(
+            cls.__name__,
+            [
+                (info.name, Any, msgspec.field(default=info.default, name=encode_name))
+                for info, encode_name in zip(fields, encode_names)
+            ],
+            module=f"{__name__}.{'keyed' if short_keys else 'models'}",
+            tag_field="@type",
+            tag=cls.__struct_config__.tag,
+            frozen=True,
+            omit_defaults=True,
+            gc=False,
+        )
+        compact.__doc__ = f"Compact variant of {cls.__module__}.{cls.__qualname__}."
+        _defining[key] = compact
+        try:
+            compact.__annotations__ = {
+                info.name: _compact_type(info.type, short_keys) for info in fields
+            }
+        except BaseException:
+            _defining.clear()
+            raise
+
+        if outermost:
+            for (model, _), defined in _defining.items():
+                _model_classes[defined] = model
+            _compact_classes.update(_defining)
+            _defining.clear()
+        return compact
+
+
+def _model_class_of(cls: type) -> Optional[Tuple[type, bool]]:
+    """Get the model class a compact class was derived from, and its short_keys flag."""
+    model = _model_classes.get(cls)
+    if model is None:
+        return None
+    return model, _compact_classes.get((model, True)) is cls
+
+
+def _to_compact_value(value: Any, short_keys: bool) -> Any:
+    if isinstance(value, SchemaOrgBase):
+        return to_compact(value, short_keys)
+    if isinstance(value, list):
+        return [_to_compact_value(item, short_keys) for item in value]
+    return value
+
+
+def _from_compact_value(value: Any) -> Any:
+    if type(value) in _model_classes:
+        return from_compact(value)
+    if isinstance(value, list):
+        return [_from_compact_value(item) for item in value]
+    return value
+
+
+def to_compact(obj: SchemaOrgBase, short_keys: bool = False) -> Any:
+    """
+    Convert a model instance and the model instances it holds to compact instances.
+
+    Args:
+        obj: A model instance
+        short_keys: Convert to the short key variants
+
+    Returns:
+        An instance of the compact variant of the object's class
+    """
+    cls = compact_class(type(obj), short_keys)
+    return cls(
+        *[_to_compact_value(value, short_keys) for value in msgspec.structs.astuple(obj)]
+    )
+
+
+def from_compact(obj: Any) -> SchemaOrgBase:
+    """
+    Convert a compact instance and the compact instances it holds to model instances.
+
+    Args:
+        obj: An instance of a compact class, with or without short keys
+
+    Returns:
+        An instance of the model class the compact class was derived from
+
+    Raises:
+        TypeError: If obj is not a compact instance
+    """
+    cls = _model_classes.get(type(obj))
+    if cls is None:
+        raise TypeError(f"{type(obj).__name__!r} object is not a compact model instance")
+    return cls(*[_from_compact_value(value) for value in msgspec.structs.astuple(obj)])
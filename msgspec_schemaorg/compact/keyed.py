@@ -0,0 +1,26 @@
+"""
+Short key variants of the generated models, by class name.
+
+Accessing a name defines the short key variant of the model class of that name,
+see ``msgspec_schemaorg.compact``.
+"""
+
+from . import compact_class
+
+
+def __getattr__(name: str):
+    from .. import models
+
+    # Module attributes such as __path__ are not looked up on the models
+    cls = None if name.startswith("__") else getattr(models, name, None)
+    if cls is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = compact_class(cls, short_keys=True)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    from .. import models
+
+    return sorted(set(globals()) | set(models.__all__))
@@ -0,0 +1,184 @@
+"""
+Polymorphic decoding of Schema.org JSON-LD objects by their @type.
+
+Every generated model class uses its Schema.org name as the msgspec tag on the
+``@type`` field, so a tagged union of all model classes lets msgspec pick the
+right class in a single decoding pass, from JSON or from msgpack. Nested
+objects of a subclass of their property's range are decoded into their own
+class as well, see ``msgspec_schemaorg.codecs.ModelDecoder``.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import msgspec
+
+from .base import SchemaOrgBase
+from .codecs import (
+    MsgspecDecoder,
+    _check_format,
+    _Classes,
+    _decode_builtins,
+    _finish,
+    _make_options,
+    _TypesById,
+)
+from .resolve import resolve_all
+
+
+class AnyThingDecoder:
+    """
+    Decode JSON-LD objects into the model class named by their @type.
+
+    The decoder is built once over a tagged union of every generated model
+    class, so a single msgspec pass selects the class and decodes nested
+    objects into typed Structs as well. Building it imports the whole
+    vocabulary, so create one instance and reuse it.
+
+    With ``short_keys``, the decoder reads documents encoded from the short
+    key variants of the models and returns instances of those, see
+    ``msgspec_schemaorg.compact``.
+
+    Args:
+        format: Either ``"json"`` or ``"msgpack"``
+        short_keys: Decode into the short key compact classes
+        parse_dates: Parse date fields
+        parse_enums: Convert enumeration values to members
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+
+    def __init__(
+        self,
+        format: str = "json",
+        short_keys: bool = False,
+        parse_dates: bool = False,
+        parse_enums: bool = False,
+    ):
+        _check_format(format)
+        options = _make_options(parse_dates, parse_enums)
+        classes = resolve_all()
+        if short_keys:
+            from .compact import compact_class
+
+            classes = [compact_class(cls, short_keys=True) for cls in classes]
+        self.format = format
+        self.short_keys = short_keys
+        self._options = options
+        self.types: Tuple[type, ...] = tuple(classes)
+        self._classes = _Classes(
+            {cls.__struct_config__.tag: cls for cls in classes}, None, short_keys or None
+        )
+        self._decoder: MsgspecDecoder
+        if format == "json":
+            self._decoder = msgspec.json.Decoder(Union[self.types])
+        else:
+            self._decoder = msgspec.msgpack.Decoder(Union[self.types])
+
+    def decode(self, buf: Union[bytes, bytearray, memoryview, str]) -> SchemaOrgBase:
+        """
+        Decode a JSON-LD object.
+
+        Args:
+            buf: The JSON or msgpack document to decode
+
+        Returns:
+            An instance of the model class named by the top-level @type
+
+        Raises:
+            msgspec.ValidationError: If @type is missing or not a known class,
+                or the document does not match the model
+        """
+        try:
+            value = self._decoder.decode(buf)
+        except msgspec.ValidationError:
+            if self.format == "json":
+                obj = msgspec.json.decode(buf)
+            else:
+                obj = msgspec.msgpack.decode(buf)
+        else:
+            return _finish(value, self._options)
+        value = _decode_builtins(obj, Union[self.types], self._classes, {})
+        return _finish(value, self._options)
+
+    def decode_builtins(self, obj: Any, types_by_id: Optional[_TypesById] = None) -> Any:
+        """
+        Decode a JSON-LD object already decoded into builtin types.
+
+        The object is converted by msgspec into the class of its @type, and
+        decoded again through the slower path decode() falls back to if that
+        fails, e.g. if it holds objects of a subclass of a property's range.
+
+        Args:
+            obj: The object, as decoded by ``msgspec.json.decode``. It is
+                modified.
+            types_by_id: The @type of the nodes of the enclosing document by
+                @id, used to decode references without @type into the class
+                of the node they reference
+
+        Returns:
+            An instance of the model class named by the top-level @type
+
+        Raises:
+            msgspec.ValidationError: If @type is missing or not a known class,
+                or the object does not match the model
+        """
+        tag = obj.get("@type") if type(obj) is dict else None
+        cls = self._classes.by_tag.get(tag) if type(tag) is str else None
+        if cls is not None:
+            try:
+                value = msgspec.convert(obj, cls)
+            except msgspec.ValidationError:
+                pass
+            else:
+                return _finish(value, self._options)
+        value = _decode_builtins(obj, Union[self.types], self._classes, types_by_id or {})
+        return _finish(value, self._options)
+
+
+_default_decoders: Dict[str, AnyThingDecoder] = {}
+_default_decoder_lock = threading.Lock()
+
+
+def get_default_decoder(format: str = "json") -> AnyThingDecoder:
+    """
+    Return the shared AnyThingDecoder of a format, building it on first use.
+
+    Args:
+        format: Either ``"json"`` or ``"msgpack"``
+
+    Returns:
+        The AnyThingDecoder used by decode_any
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    decoder = _default_decoders.get(format)
+    if decoder is None:
+        _check_format(format)
+        with _default_decoder_lock:
+            decoder = _default_decoders.get(format)
+            if decoder is None:
+                decoder = _default_decoders[format] = AnyThingDecoder(format)
+    return decoder
+
+
+def decode_any(
+    buf: Union[bytes, bytearray, memoryview, str], format: str = "json"
+) -> SchemaOrgBase:
+    """
+    Decode a JSON-LD object into the model class named by its @type.
+
+    Uses a shared AnyThingDecoder that is built on first use.
+
+    Args:
+        buf: The JSON or msgpack document to decode
+        format: Either ``"json"`` or ``"msgpack"``
+
+    Returns:
+        An instance of the model class named by the top-level @type
+    """
+    return get_default_decoder(format).decode(buf)
@@ -1,9 +1,89 @@
 """Schema.org enumeration types."""
 
-from . import intangible
+from typing import TYPE_CHECKING
 
-# Import all enum classes directly
-from .intangible import *
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from . import intangible
+    from .intangible import ActionStatusType
+    from .intangible import AdultOrientedEnumeration
+    from .intangible import BoardingPolicyType
+    from .intangible import BodyMeasurementTypeEnumeration
+    from .intangible import BookFormatType
+    from .intangible import CarUsageType
+    from .intangible import CertificationStatusEnumeration
+    from .intangible import ContactPointOption
+    from .intangible import DayOfWeek
+    from .intangible import DeliveryMethod
+    from .intangible import DigitalDocumentPermissionType
+    from .intangible import DigitalPlatformEnumeration
+    from .intangible import DriveWheelConfigurationValue
+    from .intangible import DrugCostCategory
+    from .intangible import DrugPregnancyCategory
+    from .intangible import DrugPrescriptionStatus
+    from .intangible import EUEnergyEfficiencyEnumeration
+    from .intangible import EnergyStarEnergyEfficiencyEnumeration
+    from .intangible import EventAttendanceModeEnumeration
+    from .intangible import EventStatusType
+    from .intangible import FulfillmentTypeEnumeration
+    from .intangible import GameAvailabilityEnumeration
+    from .intangible import GamePlayMode
+    from .intangible import GameServerStatus
+    from .intangible import GenderType
+    from .intangible import GovernmentBenefitsType
+    from .intangible import HealthAspectEnumeration
+    from .intangible import IPTCDigitalSourceEnumeration
+    from .intangible import IncentiveQualifiedExpenseType
+    from .intangible import IncentiveStatus
+    from .intangible import IncentiveType
+    from .intangible import InfectiousAgentClass
+    from .intangible import ItemAvailability
+    from .intangible import ItemListOrderType
+    from .intangible import LegalForceStatus
+    from .intangible import LegalValueLevel
+    from .intangible import MapCategoryType
+    from .intangible import MeasurementMethodEnum
+    from .intangible import MediaManipulationRatingEnumeration
+    from .intangible import MedicalAudienceType
+    from .intangible import MedicalDevicePurpose
+    from .intangible import MedicalEvidenceLevel
+    from .intangible import MedicalImagingTechnique
+    from .intangible import MedicalObservationalStudyDesign
+    from .intangible import MedicalProcedureType
+    from .intangible import MedicalSpecialty
+    from .intangible import MedicalStudyStatus
+    from .intangible import MedicalTrialDesign
+    from .intangible import MedicineSystem
+    from .intangible import MerchantReturnEnumeration
+    from .intangible import MusicAlbumProductionType
+    from .intangible import MusicAlbumReleaseType
+    from .intangible import MusicReleaseFormatType
+    from .intangible import NLNonprofitType
+    from .intangible import OfferItemCondition
+    from .intangible import OrderStatus
+    from .intangible import PaymentMethodType
+    from .intangible import PaymentStatusType
+    from .intangible import PhysicalActivityCategory
+    from .intangible import PhysicalExam
+    from .intangible import PriceComponentTypeEnumeration
+    from .intangible import PriceTypeEnumeration
+    from .intangible import PurchaseType
+    from .intangible import RefundTypeEnumeration
+    from .intangible import ReservationStatusType
+    from .intangible import RestrictedDiet
+    from .intangible import ReturnFeesEnumeration
+    from .intangible import ReturnLabelSourceEnumeration
+    from .intangible import ReturnMethodEnumeration
+    from .intangible import RsvpResponseType
+    from .intangible import SizeSystemEnumeration
+    from .intangible import SteeringPositionValue
+    from .intangible import TierBenefitEnumeration
+    from .intangible import UKNonprofitType
+    from .intangible import USNonprofitType
+    from .intangible import WearableMeasurementTypeEnumeration
+    from .intangible import WearableSizeGroupEnumeration
+    from .intangible import WearableSizeSystemEnumeration
 
 __all__ = [
     'intangible',
@@ -86,3 +166,88 @@ __all__ = [
     'WearableSizeGroupEnumeration',
     'WearableSizeSystemEnumeration',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'ActionStatusType': 'intangible',
+        'AdultOrientedEnumeration': 'intangible',
+        'BoardingPolicyType': 'intangible',
+        'BodyMeasurementTypeEnumeration': 'intangible',
+        'BookFormatType': 'intangible',
+        'CarUsageType': 'intangible',
+        'CertificationStatusEnumeration': 'intangible',
+        'ContactPointOption': 'intangible',
+        'DayOfWeek': 'intangible',
+        'DeliveryMethod': 'intangible',
+        'DigitalDocumentPermissionType': 'intangible',
+        'DigitalPlatformEnumeration': 'intangible',
+        'DriveWheelConfigurationValue': 'intangible',
+        'DrugCostCategory': 'intangible',
+        'DrugPregnancyCategory': 'intangible',
+        'DrugPrescriptionStatus': 'intangible',
+        'EUEnergyEfficiencyEnumeration': 'intangible',
+        'EnergyStarEnergyEfficiencyEnumeration': 'intangible',
+        'EventAttendanceModeEnumeration': 'intangible',
+        'EventStatusType': 'intangible',
+        'FulfillmentTypeEnumeration': 'intangible',
+        'GameAvailabilityEnumeration': 'intangible',
+        'GamePlayMode': 'intangible',
+        'GameServerStatus': 'intangible',
+        'GenderType': 'intangible',
+        'GovernmentBenefitsType': 'intangible',
+        'HealthAspectEnumeration': 'intangible',
+        'IPTCDigitalSourceEnumeration': 'intangible',
+        'IncentiveQualifiedExpenseType': 'intangible',
+        'IncentiveStatus': 'intangible',
+        'IncentiveType': 'intangible',
+        'InfectiousAgentClass': 'intangible',
+        'ItemAvailability': 'intangible',
+        'ItemListOrderType': 'intangible',
+        'LegalForceStatus': 'intangible',
+        'LegalValueLevel': 'intangible',
+        'MapCategoryType': 'intangible',
+        'MeasurementMethodEnum': 'intangible',
+        'MediaManipulationRatingEnumeration': 'intangible',
+        'MedicalAudienceType': 'intangible',
+        'MedicalDevicePurpose': 'intangible',
+        'MedicalEvidenceLevel': 'intangible',
+        'MedicalImagingTechnique': 'intangible',
+        'MedicalObservationalStudyDesign': 'intangible',
+        'MedicalProcedureType': 'intangible',
+        'MedicalSpecialty': 'intangible',
+        'MedicalStudyStatus': 'intangible',
+        'MedicalTrialDesign': 'intangible',
+        'MedicineSystem': 'intangible',
+        'MerchantReturnEnumeration': 'intangible',
+        'MusicAlbumProductionType': 'intangible',
+        'MusicAlbumReleaseType': 'intangible',
+        'MusicReleaseFormatType': 'intangible',
+        'NLNonprofitType': 'intangible',
+        'OfferItemCondition': 'intangible',
+        'OrderStatus': 'intangible',
+        'PaymentMethodType': 'intangible',
+        'PaymentStatusType': 'intangible',
+        'PhysicalActivityCategory': 'intangible',
+        'PhysicalExam': 'intangible',
+        'PriceComponentTypeEnumeration': 'intangible',
+        'PriceTypeEnumeration': 'intangible',
+        'PurchaseType': 'intangible',
+        'RefundTypeEnumeration': 'intangible',
+        'ReservationStatusType': 'intangible',
+        'RestrictedDiet': 'intangible',
+        'ReturnFeesEnumeration': 'intangible',
+        'ReturnLabelSourceEnumeration': 'intangible',
+        'ReturnMethodEnumeration': 'intangible',
+        'RsvpResponseType': 'intangible',
+        'SizeSystemEnumeration': 'intangible',
+        'SteeringPositionValue': 'intangible',
+        'TierBenefitEnumeration': 'intangible',
+        'UKNonprofitType': 'intangible',
+        'USNonprofitType': 'intangible',
+        'WearableMeasurementTypeEnumeration': 'intangible',
+        'WearableSizeGroupEnumeration': 'intangible',
+        'WearableSizeSystemEnumeration': 'intangible',
+    },
+    submodules=['intangible'],
+)
@@ -0,0 +1,682 @@
+"""Metadata of the members of the Schema.org enumerations.
+
+Maps every enum name to the ID, label and comment of each of its members,
+by member name.
+"""
+
+METADATA = {
+    'ActionStatusType': {
+        'ActiveActionStatus': ('schema:ActiveActionStatus', 'ActiveActionStatus', 'An in-progress action (e.g., while watching the movie, or driving to a location).'),
+        'CompletedActionStatus': ('schema:CompletedActionStatus', 'CompletedActionStatus', 'An action that has already taken place.'),
+        'FailedActionStatus': ('schema:FailedActionStatus', 'FailedActionStatus', "An action that failed to complete. The action's error property and the HTTP return code contain more information about the failure."),
+        'PotentialActionStatus': ('schema:PotentialActionStatus', 'PotentialActionStatus', 'A description of an action that is supported.'),
+    },
+    'AdultOrientedEnumeration': {
+        'AlcoholConsideration': ('schema:AlcoholConsideration', 'AlcoholConsideration', 'Item contains alcohol or promotes alcohol consumption.'),
+        'DangerousGoodConsideration': ('schema:DangerousGoodConsideration', 'DangerousGoodConsideration', 'The item is dangerous and requires careful handling and/or special training of the user. See also the [UN Model Classification](https://unece.org/DAM/trans/danger/publi/unrec/rev17/English/02EREv17_Part2.pdf) defining the 9 classes of dangerous goods such as explosives, gases, flammables, and more.'),
+        'HealthcareConsideration': ('schema:HealthcareConsideration', 'HealthcareConsideration', 'Item is a pharmaceutical (e.g., a prescription or OTC drug) or a restricted medical device.'),
+        'NarcoticConsideration': ('schema:NarcoticConsideration', 'NarcoticConsideration', 'Item is a narcotic as defined by the [1961 UN convention](https://www.incb.org/incb/en/narcotic-drugs/Yellowlist/yellow-list.html), for example marijuana or heroin.'),
+        'ReducedRelevanceForChildrenConsideration': ('schema:ReducedRelevanceForChildrenConsideration', 'ReducedRelevanceForChildrenConsideration', 'A general code for cases where relevance to children is reduced, e.g. adult education, mortgages, retirement-related products, etc.'),
+        'SexualContentConsideration': ('schema:SexualContentConsideration', 'SexualContentConsideration', 'The item contains sexually oriented content such as nudity, suggestive or explicit material, or related online services, or is intended to enhance sexual activity. Examples: Erotic videos or magazine, sexual enhancement devices, sex toys.'),
+        'TobaccoNicotineConsideration': ('schema:TobaccoNicotineConsideration', 'TobaccoNicotineConsideration', 'Item contains tobacco and/or nicotine, for example cigars, cigarettes, chewing tobacco, e-cigarettes, or hookahs.'),
+        'UnclassifiedAdultConsideration': ('schema:UnclassifiedAdultConsideration', 'UnclassifiedAdultConsideration', 'The item is suitable only for adults, without indicating why. Due to widespread use of "adult" as a euphemism for "sexual", many such items are likely suited also for the SexualContentConsideration code.'),
+        'ViolenceConsideration': ('schema:ViolenceConsideration', 'ViolenceConsideration', 'Item shows or promotes violence.'),
+        'WeaponConsideration': ('schema:WeaponConsideration', 'WeaponConsideration', 'The item is intended to induce bodily harm, for example guns, mace, combat knives, brass knuckles, nail or other bombs, and spears.'),
+    },
+    'BoardingPolicyType': {
+        'GroupBoardingPolicy': ('schema:GroupBoardingPolicy', 'GroupBoardingPolicy', 'The airline boards by groups based on check-in time, priority, etc.'),
+        'ZoneBoardingPolicy': ('schema:ZoneBoardingPolicy', 'ZoneBoardingPolicy', 'The airline boards by zones of the plane.'),
+    },
+    'BodyMeasurementTypeEnumeration': {
+        'BodyMeasurementArm': ('schema:BodyMeasurementArm', 'BodyMeasurementArm', 'Arm length (measured between arms/shoulder line intersection and the prominent wrist bone). Used, for example, to fit shirts.'),
+        'BodyMeasurementBust': ('schema:BodyMeasurementBust', 'BodyMeasurementBust', "Maximum girth of bust. Used, for example, to fit women's suits."),
+        'BodyMeasurementChest': ('schema:BodyMeasurementChest', 'BodyMeasurementChest', "Maximum girth of chest. Used, for example, to fit men's suits."),
+        'BodyMeasurementFoot': ('schema:BodyMeasurementFoot', 'BodyMeasurementFoot', 'Foot length (measured between end of the most prominent toe and the most prominent part of the heel). Used, for example, to measure socks.'),
+        'BodyMeasurementHand': ('schema:BodyMeasurementHand', 'BodyMeasurementHand', 'Maximum hand girth (measured over the knuckles of the open right hand excluding thumb, fingers together). Used, for example, to fit gloves.'),
+        'BodyMeasurementHead': ('schema:BodyMeasurementHead', 'BodyMeasurementHead', 'Maximum girth of head above the ears. Used, for example, to fit hats.'),
+        'BodyMeasurementHeight': ('schema:BodyMeasurementHeight', 'BodyMeasurementHeight', 'Body height (measured between crown of head and soles of feet). Used, for example, to fit jackets.'),
+        'BodyMeasurementHips': ('schema:BodyMeasurementHips', 'BodyMeasurementHips', 'Girth of hips (measured around the buttocks). Used, for example, to fit skirts.'),
+        'BodyMeasurementInsideLeg': ('schema:BodyMeasurementInsideLeg', 'BodyMeasurementInsideLeg', 'Inside leg (measured between crotch and soles of feet). Used, for example, to fit pants.'),
+        'BodyMeasurementNeck': ('schema:BodyMeasurementNeck', 'BodyMeasurementNeck', 'Girth of neck. Used, for example, to fit shirts.'),
+        'BodyMeasurementUnderbust': ('schema:BodyMeasurementUnderbust', 'BodyMeasurementUnderbust', "Girth of body just below the bust. Used, for example, to fit women's swimwear."),
+        'BodyMeasurementWaist': ('schema:BodyMeasurementWaist', 'BodyMeasurementWaist', 'Girth of natural waistline (between hip bones and lower ribs). Used, for example, to fit pants.'),
+        'BodyMeasurementWeight': ('schema:BodyMeasurementWeight', 'BodyMeasurementWeight', 'Body weight. Used, for example, to measure pantyhose.'),
+    },
+    'BookFormatType': {
+        'AudiobookFormat': ('schema:AudiobookFormat', 'AudiobookFormat', "Book format: Audiobook. This is an enumerated value for use with the bookFormat property. There is also a type 'Audiobook' in the bib extension which includes Audiobook specific properties."),
+        'EBook': ('schema:EBook', 'EBook', 'Book format: Ebook.'),
+        'GraphicNovel': ('schema:GraphicNovel', 'GraphicNovel', 'Book format: GraphicNovel. May represent a bound collection of ComicIssue instances.'),
+        'Hardcover': ('schema:Hardcover', 'Hardcover', 'Book format: Hardcover.'),
+        'Paperback': ('schema:Paperback', 'Paperback', 'Book format: Paperback.'),
+    },
+    'CarUsageType': {
+        'DrivingSchoolVehicleUsage': ('schema:DrivingSchoolVehicleUsage', 'DrivingSchoolVehicleUsage', 'Indicates the usage of the vehicle for driving school.'),
+        'RentalVehicleUsage': ('schema:RentalVehicleUsage', 'RentalVehicleUsage', 'Indicates the usage of the vehicle as a rental car.'),
+        'TaxiVehicleUsage': ('schema:TaxiVehicleUsage', 'TaxiVehicleUsage', 'Indicates the usage of the car as a taxi.'),
+    },
+    'CertificationStatusEnumeration': {
+        'CertificationActive': ('schema:CertificationActive', 'CertificationActive', 'Specifies that a certification is active.'),
+        'CertificationInactive': ('schema:CertificationInactive', 'CertificationInactive', 'Specifies that a certification is inactive (no longer in effect).'),
+    },
+    'ContactPointOption': {
+        'HearingImpairedSupported': ('schema:HearingImpairedSupported', 'HearingImpairedSupported', 'Uses devices to support users with hearing impairments.'),
+        'TollFree': ('schema:TollFree', 'TollFree', 'The associated telephone number is toll free.'),
+    },
+    'DayOfWeek': {
+        'Friday': ('schema:Friday', 'Friday', 'The day of the week between Thursday and Saturday.'),
+        'Monday': ('schema:Monday', 'Monday', 'The day of the week between Sunday and Tuesday.'),
+        'PublicHolidays': ('schema:PublicHolidays', 'PublicHolidays', 'This stands for any day that is a public holiday; it is a placeholder for all official public holidays in some particular location. While not technically a "day of the week", it can be used with [[OpeningHoursSpecification]]. In the context of an opening hours specification it can be used to indicate opening hours on public holidays, overriding general opening hours for the day of the week on which a public holiday occurs.'),
+        'Saturday': ('schema:Saturday', 'Saturday', 'The day of the week between Friday and Sunday.'),
+        'Sunday': ('schema:Sunday', 'Sunday', 'The day of the week between Saturday and Monday.'),
+        'Thursday': ('schema:Thursday', 'Thursday', 'The day of the week between Wednesday and Friday.'),
+        'Tuesday': ('schema:Tuesday', 'Tuesday', 'The day of the week between Monday and Wednesday.'),
+        'Wednesday': ('schema:Wednesday', 'Wednesday', 'The day of the week between Tuesday and Thursday.'),
+    },
+    'DeliveryMethod': {
+        'LockerDelivery': ('schema:LockerDelivery', 'LockerDelivery', 'A DeliveryMethod in which an item is made available via locker.'),
+        'OnSitePickup': ('schema:OnSitePickup', 'OnSitePickup', 'A DeliveryMethod in which an item is collected on site, e.g. in a store or at a box office.'),
+        'ParcelService': ('schema:ParcelService', 'ParcelService', 'A private parcel service as the delivery mode available for a certain offer.\n\nCommonly used values:\n\n* http://purl.org/goodrelations/v1#DHL\n* http://purl.org/goodrelations/v1#FederalExpress\n* http://purl.org/goodrelations/v1#UPS\n      '),
+    },
+    'DigitalDocumentPermissionType': {
+        'CommentPermission': ('schema:CommentPermission', 'CommentPermission', 'Permission to add comments to the document.'),
+        'ReadPermission': ('schema:ReadPermission', 'ReadPermission', 'Permission to read or view the document.'),
+        'WritePermission': ('schema:WritePermission', 'WritePermission', 'Permission to write or edit the document.'),
+    },
+    'DigitalPlatformEnumeration': {
+        'AndroidPlatform': ('schema:AndroidPlatform', 'AndroidPlatform', 'Represents the broad notion of Android-based operating systems.'),
+        'DesktopWebPlatform': ('schema:DesktopWebPlatform', 'DesktopWebPlatform', "Represents the broad notion of 'desktop' browsers as a Web Platform."),
+        'GenericWebPlatform': ('schema:GenericWebPlatform', 'GenericWebPlatform', 'Represents the generic notion of the Web Platform. More specific codes include [[MobileWebPlatform]] and [[DesktopWebPlatform]], as an incomplete list. '),
+        'IOSPlatform': ('schema:IOSPlatform', 'IOSPlatform', 'Represents the broad notion of iOS-based operating systems.'),
+        'MobileWebPlatform': ('schema:MobileWebPlatform', 'MobileWebPlatform', "Represents the broad notion of 'mobile' browsers as a Web Platform."),
+    },
+    'DriveWheelConfigurationValue': {
+        'AllWheelDriveConfiguration': ('schema:AllWheelDriveConfiguration', 'AllWheelDriveConfiguration', 'All-wheel Drive is a transmission layout where the engine drives all four wheels.'),
+        'FourWheelDriveConfiguration': ('schema:FourWheelDriveConfiguration', 'FourWheelDriveConfiguration', 'Four-wheel drive is a transmission layout where the engine primarily drives two wheels with a part-time four-wheel drive capability.'),
+        'FrontWheelDriveConfiguration': ('schema:FrontWheelDriveConfiguration', 'FrontWheelDriveConfiguration', 'Front-wheel drive is a transmission layout where the engine drives the front wheels.'),
+        'RearWheelDriveConfiguration': ('schema:RearWheelDriveConfiguration', 'RearWheelDriveConfiguration', 'Real-wheel drive is a transmission layout where the engine drives the rear wheels.'),
+    },
+    'DrugCostCategory': {
+        'ReimbursementCap': ('schema:ReimbursementCap', 'ReimbursementCap', "The drug's cost represents the maximum reimbursement paid by an insurer for the drug."),
+        'Retail': ('schema:Retail', 'Retail', "The drug's cost represents the retail cost of the drug."),
+        'Wholesale': ('schema:Wholesale', 'Wholesale', "The drug's cost represents the wholesale acquisition cost of the drug."),
+    },
+    'DrugPregnancyCategory': {
+        'FDAcategoryA': ('schema:FDAcategoryA', 'FDAcategoryA', 'A designation by the US FDA signifying that adequate and well-controlled studies have failed to demonstrate a risk to the fetus in the first trimester of pregnancy (and there is no evidence of risk in later trimesters).'),
+        'FDAcategoryB': ('schema:FDAcategoryB', 'FDAcategoryB', 'A designation by the US FDA signifying that animal reproduction studies have failed to demonstrate a risk to the fetus and there are no adequate and well-controlled studies in pregnant women.'),
+        'FDAcategoryC': ('schema:FDAcategoryC', 'FDAcategoryC', 'A designation by the US FDA signifying that animal reproduction studies have shown an adverse effect on the fetus and there are no adequate and well-controlled studies in humans, but potential benefits may warrant use of the drug in pregnant women despite potential risks.'),
+        'FDAcategoryD': ('schema:FDAcategoryD', 'FDAcategoryD', 'A designation by the US FDA signifying that there is positive evidence of human fetal risk based on adverse reaction data from investigational or marketing experience or studies in humans, but potential benefits may warrant use of the drug in pregnant women despite potential risks.'),
+        'FDAcategoryX': ('schema:FDAcategoryX', 'FDAcategoryX', 'A designation by the US FDA signifying that studies in animals or humans have demonstrated fetal abnormalities and/or there is positive evidence of human fetal risk based on adverse reaction data from investigational or marketing experience, and the risks involved in use of the drug in pregnant women clearly outweigh potential benefits.'),
+        'FDAnotEvaluated': ('schema:FDAnotEvaluated', 'FDAnotEvaluated', 'A designation that the drug in question has not been assigned a pregnancy category designation by the US FDA.'),
+    },
+    'DrugPrescriptionStatus': {
+        'OTC': ('schema:OTC', 'OTC', 'The character of a medical substance, typically a medicine, of being available over the counter or not.'),
+        'PrescriptionOnly': ('schema:PrescriptionOnly', 'PrescriptionOnly', 'Available by prescription only.'),
+    },
+    'EUEnergyEfficiencyEnumeration': {
+        'EUEnergyEfficiencyCategoryA': ('schema:EUEnergyEfficiencyCategoryA', 'EUEnergyEfficiencyCategoryA', 'Represents EU Energy Efficiency Class A as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryA1Plus': ('schema:EUEnergyEfficiencyCategoryA1Plus', 'EUEnergyEfficiencyCategoryA1Plus', 'Represents EU Energy Efficiency Class A+ as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryA2Plus': ('schema:EUEnergyEfficiencyCategoryA2Plus', 'EUEnergyEfficiencyCategoryA2Plus', 'Represents EU Energy Efficiency Class A++ as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryA3Plus': ('schema:EUEnergyEfficiencyCategoryA3Plus', 'EUEnergyEfficiencyCategoryA3Plus', 'Represents EU Energy Efficiency Class A+++ as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryB': ('schema:EUEnergyEfficiencyCategoryB', 'EUEnergyEfficiencyCategoryB', 'Represents EU Energy Efficiency Class B as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryC': ('schema:EUEnergyEfficiencyCategoryC', 'EUEnergyEfficiencyCategoryC', 'Represents EU Energy Efficiency Class C as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryD': ('schema:EUEnergyEfficiencyCategoryD', 'EUEnergyEfficiencyCategoryD', 'Represents EU Energy Efficiency Class D as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryE': ('schema:EUEnergyEfficiencyCategoryE', 'EUEnergyEfficiencyCategoryE', 'Represents EU Energy Efficiency Class E as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryF': ('schema:EUEnergyEfficiencyCategoryF', 'EUEnergyEfficiencyCategoryF', 'Represents EU Energy Efficiency Class F as defined in EU energy labeling regulations.'),
+        'EUEnergyEfficiencyCategoryG': ('schema:EUEnergyEfficiencyCategoryG', 'EUEnergyEfficiencyCategoryG', 'Represents EU Energy Efficiency Class G as defined in EU energy labeling regulations.'),
+    },
+    'EnergyStarEnergyEfficiencyEnumeration': {
+        'EnergyStarCertified': ('schema:EnergyStarCertified', 'EnergyStarCertified', 'Represents EnergyStar certification.'),
+    },
+    'EventAttendanceModeEnumeration': {
+        'MixedEventAttendanceMode': ('schema:MixedEventAttendanceMode', 'MixedEventAttendanceMode', 'MixedEventAttendanceMode - an event that is conducted as a combination of both offline and online modes.'),
+        'OfflineEventAttendanceMode': ('schema:OfflineEventAttendanceMode', 'OfflineEventAttendanceMode', 'OfflineEventAttendanceMode - an event that is primarily conducted offline. '),
+        'OnlineEventAttendanceMode': ('schema:OnlineEventAttendanceMode', 'OnlineEventAttendanceMode', 'OnlineEventAttendanceMode - an event that is primarily conducted online. '),
+    },
+    'EventStatusType': {
+        'EventCancelled': ('schema:EventCancelled', 'EventCancelled', "The event has been cancelled. If the event has multiple startDate values, all are assumed to be cancelled. Either startDate or previousStartDate may be used to specify the event's cancelled date(s)."),
+        'EventMovedOnline': ('schema:EventMovedOnline', 'EventMovedOnline', 'Indicates that the event was changed to allow online participation. See [[eventAttendanceMode]] for specifics of whether it is now fully or partially online.'),
+        'EventPostponed': ('schema:EventPostponed', 'EventPostponed', "The event has been postponed and no new date has been set. The event's previousStartDate should be set."),
+        'EventRescheduled': ('schema:EventRescheduled', 'EventRescheduled', "The event has been rescheduled. The event's previousStartDate should be set to the old date and the startDate should be set to the event's new date. (If the event has been rescheduled multiple times, the previousStartDate property may be repeated.)"),
+        'EventScheduled': ('schema:EventScheduled', 'EventScheduled', 'The event is taking place or has taken place on the startDate as scheduled. Use of this value is optional, as it is assumed by default.'),
+    },
+    'FulfillmentTypeEnumeration': {
+        'FulfillmentTypeCollectionPoint': ('schema:FulfillmentTypeCollectionPoint', 'FulfillmentTypeCollectionPoint', 'Fulfillment to a collection point location.'),
+        'FulfillmentTypeDelivery': ('schema:FulfillmentTypeDelivery', 'FulfillmentTypeDelivery', 'Fulfillment to a customer selected address.'),
+        'FulfillmentTypePickupDropoff': ('schema:FulfillmentTypePickupDropoff', 'FulfillmentTypePickupDropoff', 'Fulfillment through pick-up drop-off locations.'),
+        'FulfillmentTypePickupInStore': ('schema:FulfillmentTypePickupInStore', 'FulfillmentTypePickupInStore', 'Fulfillment through pick-up in a store.'),
+        'FulfillmentTypeScheduledDelivery': ('schema:FulfillmentTypeScheduledDelivery', 'FulfillmentTypeScheduledDelivery', 'Fulfillment to a customer selected address after scheduling with the customer.'),
+    },
+    'GameAvailabilityEnumeration': {
+        'DemoGameAvailability': ('schema:DemoGameAvailability', 'DemoGameAvailability', 'Indicates demo game availability, i.e. a somehow limited demonstration of the full game.'),
+        'FullGameAvailability': ('schema:FullGameAvailability', 'FullGameAvailability', 'Indicates full game availability.'),
+    },
+    'GamePlayMode': {
+        'CoOp': ('schema:CoOp', 'CoOp', 'Play mode: CoOp. Co-operative games, where you play on the same team with friends.'),
+        'MultiPlayer': ('schema:MultiPlayer', 'MultiPlayer', 'Play mode: MultiPlayer. Requiring or allowing multiple human players to play simultaneously.'),
+        'SinglePlayer': ('schema:SinglePlayer', 'SinglePlayer', 'Play mode: SinglePlayer. Which is played by a lone player.'),
+    },
+    'GameServerStatus': {
+        'OfflinePermanently': ('schema:OfflinePermanently', 'OfflinePermanently', 'Game server status: OfflinePermanently. Server is offline and not available.'),
+        'OfflineTemporarily': ('schema:OfflineTemporarily', 'OfflineTemporarily', 'Game server status: OfflineTemporarily. Server is offline now but it can be online soon.'),
+        'Online': ('schema:Online', 'Online', 'Game server status: Online. Server is available.'),
+        'OnlineFull': ('schema:OnlineFull', 'OnlineFull', 'Game server status: OnlineFull. Server is online but unavailable. The maximum number of players has reached.'),
+    },
+    'GenderType': {
+        'Female': ('schema:Female', 'Female', 'The female gender.'),
+        'Male': ('schema:Male', 'Male', 'The male gender.'),
+    },
+    'GovernmentBenefitsType': {
+        'BasicIncome': ('schema:BasicIncome', 'BasicIncome', 'BasicIncome: this is a benefit for basic income.'),
+        'BusinessSupport': ('schema:BusinessSupport', 'BusinessSupport', 'BusinessSupport: this is a benefit for supporting businesses.'),
+        'DisabilitySupport': ('schema:DisabilitySupport', 'DisabilitySupport', 'DisabilitySupport: this is a benefit for disability support.'),
+        'HealthCare': ('schema:HealthCare', 'HealthCare', 'HealthCare: this is a benefit for health care.'),
+        'OneTimePayments': ('schema:OneTimePayments', 'OneTimePayments', 'OneTimePayments: this is a benefit for one-time payments for individuals.'),
+        'PaidLeave': ('schema:PaidLeave', 'PaidLeave', 'PaidLeave: this is a benefit for paid leave.'),
+        'ParentalSupport': ('schema:ParentalSupport', 'ParentalSupport', 'ParentalSupport: this is a benefit for parental support.'),
+        'UnemploymentSupport': ('schema:UnemploymentSupport', 'UnemploymentSupport', 'UnemploymentSupport: this is a benefit for unemployment support.'),
+    },
+    'HealthAspectEnumeration': {
+        'AllergiesHealthAspect': ('schema:AllergiesHealthAspect', 'AllergiesHealthAspect', 'Content about the allergy-related aspects of a health topic.'),
+        'BenefitsHealthAspect': ('schema:BenefitsHealthAspect', 'BenefitsHealthAspect', 'Content about the benefits and advantages of usage or utilization of topic.'),
+        'CausesHealthAspect': ('schema:CausesHealthAspect', 'CausesHealthAspect', 'Information about the causes and main actions that gave rise to the topic.'),
+        'ContagiousnessHealthAspect': ('schema:ContagiousnessHealthAspect', 'ContagiousnessHealthAspect', 'Content about contagion mechanisms and contagiousness information over the topic.'),
+        'EffectivenessHealthAspect': ('schema:EffectivenessHealthAspect', 'EffectivenessHealthAspect', 'Content about the effectiveness-related aspects of a health topic.'),
+        'GettingAccessHealthAspect': ('schema:GettingAccessHealthAspect', 'GettingAccessHealthAspect', 'Content that discusses practical and policy aspects for getting access to specific kinds of healthcare (e.g. distribution mechanisms for vaccines).'),
+        'HowItWorksHealthAspect': ('schema:HowItWorksHealthAspect', 'HowItWorksHealthAspect', 'Content that discusses and explains how a particular health-related topic works, e.g. in terms of mechanisms and underlying science.'),
+        'HowOrWhereHealthAspect': ('schema:HowOrWhereHealthAspect', 'HowOrWhereHealthAspect', 'Information about how or where to find a topic. Also may contain location data that can be used for where to look for help if the topic is observed.'),
+        'IngredientsHealthAspect': ('schema:IngredientsHealthAspect', 'IngredientsHealthAspect', 'Content discussing ingredients-related aspects of a health topic.'),
+        'LivingWithHealthAspect': ('schema:LivingWithHealthAspect', 'LivingWithHealthAspect', 'Information about coping or life related to the topic.'),
+        'MayTreatHealthAspect': ('schema:MayTreatHealthAspect', 'MayTreatHealthAspect', 'Related topics may be treated by a Topic.'),
+        'MisconceptionsHealthAspect': ('schema:MisconceptionsHealthAspect', 'MisconceptionsHealthAspect', 'Content about common misconceptions and myths that are related to a topic.'),
+        'OverviewHealthAspect': ('schema:OverviewHealthAspect', 'OverviewHealthAspect', 'Overview of the content. Contains a summarized view of the topic with the most relevant information for an introduction.'),
+        'PatientExperienceHealthAspect': ('schema:PatientExperienceHealthAspect', 'PatientExperienceHealthAspect', 'Content about the real life experience of patients or people that have lived a similar experience about the topic. May be forums, topics, Q-and-A and related material.'),
+        'PregnancyHealthAspect': ('schema:PregnancyHealthAspect', 'PregnancyHealthAspect', 'Content discussing pregnancy-related aspects of a health topic.'),
+        'PreventionHealthAspect': ('schema:PreventionHealthAspect', 'PreventionHealthAspect', 'Information about actions or measures that can be taken to avoid getting the topic or reaching a critical situation related to the topic.'),
+        'PrognosisHealthAspect': ('schema:PrognosisHealthAspect', 'PrognosisHealthAspect', 'Typical progression and happenings of life course of the topic.'),
+        'RelatedTopicsHealthAspect': ('schema:RelatedTopicsHealthAspect', 'RelatedTopicsHealthAspect', 'Other prominent or relevant topics tied to the main topic.'),
+        'RisksOrComplicationsHealthAspect': ('schema:RisksOrComplicationsHealthAspect', 'RisksOrComplicationsHealthAspect', 'Information about the risk factors and possible complications that may follow a topic.'),
+        'SafetyHealthAspect': ('schema:SafetyHealthAspect', 'SafetyHealthAspect', 'Content about the safety-related aspects of a health topic.'),
+        'ScreeningHealthAspect': ('schema:ScreeningHealthAspect', 'ScreeningHealthAspect', 'Content about how to screen or further filter a topic.'),
+        'SeeDoctorHealthAspect': ('schema:SeeDoctorHealthAspect', 'SeeDoctorHealthAspect', 'Information about questions that may be asked, when to see a professional, measures before seeing a doctor or content about the first consultation.'),
+        'SelfCareHealthAspect': ('schema:SelfCareHealthAspect', 'SelfCareHealthAspect', 'Self care actions or measures that can be taken to sooth, health or avoid a topic. This may be carried at home and can be carried/managed by the person itself.'),
+        'SideEffectsHealthAspect': ('schema:SideEffectsHealthAspect', 'SideEffectsHealthAspect', 'Side effects that can be observed from the usage of the topic.'),
+        'StagesHealthAspect': ('schema:StagesHealthAspect', 'StagesHealthAspect', 'Stages that can be observed from a topic.'),
+        'SymptomsHealthAspect': ('schema:SymptomsHealthAspect', 'SymptomsHealthAspect', 'Symptoms or related symptoms of a Topic.'),
+        'TreatmentsHealthAspect': ('schema:TreatmentsHealthAspect', 'TreatmentsHealthAspect', 'Treatments or related therapies for a Topic.'),
+        'TypesHealthAspect': ('schema:TypesHealthAspect', 'TypesHealthAspect', 'Categorization and other types related to a topic.'),
+        'UsageOrScheduleHealthAspect': ('schema:UsageOrScheduleHealthAspect', 'UsageOrScheduleHealthAspect', 'Content about how, when, frequency and dosage of a topic.'),
+    },
+    'IPTCDigitalSourceEnumeration': {
+        'AlgorithmicMediaDigitalSource': ('schema:AlgorithmicMediaDigitalSource', 'AlgorithmicMediaDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/algorithmicMedia">algorithmic media</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'AlgorithmicallyEnhancedDigitalSource': ('schema:AlgorithmicallyEnhancedDigitalSource', 'AlgorithmicallyEnhancedDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/algorithmicallyEnhanced">algorithmically enhanced</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'CompositeCaptureDigitalSource': ('schema:CompositeCaptureDigitalSource', 'CompositeCaptureDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/compositeCapture">composite capture</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'CompositeDigitalSource': ('schema:CompositeDigitalSource', 'CompositeDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/algorithmicMedia">algorithmic media</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'CompositeSyntheticDigitalSource': ('schema:CompositeSyntheticDigitalSource', 'CompositeSyntheticDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/compositeSynthetic">composite synthetic</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'CompositeWithTrainedAlgorithmicMediaDigitalSource': ('schema:CompositeWithTrainedAlgorithmicMediaDigitalSource', 'CompositeWithTrainedAlgorithmicMediaDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/compositeWithTrainedAlgorithmicMedia">composite with trained algorithmic media</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'DataDrivenMediaDigitalSource': ('schema:DataDrivenMediaDigitalSource', 'DataDrivenMediaDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/dataDrivenMedia">data driven media</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'DigitalArtDigitalSource': ('schema:DigitalArtDigitalSource', 'DigitalArtDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/digitalArt">digital art</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'DigitalCaptureDigitalSource': ('schema:DigitalCaptureDigitalSource', 'DigitalCaptureDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/digitalCapture">digital capture</a></a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'MinorHumanEditsDigitalSource': ('schema:MinorHumanEditsDigitalSource', 'MinorHumanEditsDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/minorHumanEdits">minor human edits</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'MultiFrameComputationalCaptureDigitalSource': ('schema:MultiFrameComputationalCaptureDigitalSource', 'MultiFrameComputationalCaptureDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/algorithmicMedia">algorithmic media</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'NegativeFilmDigitalSource': ('schema:NegativeFilmDigitalSource', 'NegativeFilmDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/negativeFilm">negative film</a></a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'PositiveFilmDigitalSource': ('schema:PositiveFilmDigitalSource', 'PositiveFilmDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/positiveFilm">positive film</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'PrintDigitalSource': ('schema:PrintDigitalSource', 'PrintDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/print">print</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'ScreenCaptureDigitalSource': ('schema:ScreenCaptureDigitalSource', 'ScreenCaptureDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/algorithmicMedia">algorithmic media</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'TrainedAlgorithmicMediaDigitalSource': ('schema:TrainedAlgorithmicMediaDigitalSource', 'TrainedAlgorithmicMediaDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/trainedAlgorithmicMedia">trained algorithmic media</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+        'VirtualRecordingDigitalSource': ('schema:VirtualRecordingDigitalSource', 'VirtualRecordingDigitalSource', 'Content coded as \'<a href="https://cv.iptc.org/newscodes/digitalsourcetype/virtualRecording">virtual recording</a>\' using the IPTC <a href="https://cv.iptc.org/newscodes/digitalsourcetype/">digital source type</a> vocabulary.'),
+    },
+    'IncentiveQualifiedExpenseType': {
+        'IncentiveQualifiedExpenseTypeGoodsOnly': ('schema:IncentiveQualifiedExpenseTypeGoodsOnly', 'IncentiveQualifiedExpenseTypeGoodsOnly', 'This incentive applies to goods only.'),
+        'IncentiveQualifiedExpenseTypeGoodsOrServices': ('schema:IncentiveQualifiedExpenseTypeGoodsOrServices', 'IncentiveQualifiedExpenseTypeGoodsOrServices', 'This incentive can apply to either goods or services (or both).'),
+        'IncentiveQualifiedExpenseTypeServicesOnly': ('schema:IncentiveQualifiedExpenseTypeServicesOnly', 'IncentiveQualifiedExpenseTypeServicesOnly', 'This incentive applies to services only.'),
+        'IncentiveQualifiedExpenseTypeUtilityBill': ('schema:IncentiveQualifiedExpenseTypeUtilityBill', 'IncentiveQualifiedExpenseTypeUtilityBill', 'This incentive applies to utility bills.'),
+    },
+    'IncentiveStatus': {
+        'IncentiveStatusActive': ('schema:IncentiveStatusActive', 'IncentiveStatusActive', 'This incentive is currently active.'),
+        'IncentiveStatusInDevelopment': ('schema:IncentiveStatusInDevelopment', 'IncentiveStatusInDevelopment', 'This incentive is currently being developed, and may become active/retired in the future.'),
+        'IncentiveStatusOnHold': ('schema:IncentiveStatusOnHold', 'IncentiveStatusOnHold', 'This incentive is currently active, but may not be accepting new applicants (e.g. max number of redemptions reached for a year)'),
+        'IncentiveStatusRetired': ('schema:IncentiveStatusRetired', 'IncentiveStatusRetired', 'This incentive is not longer available.'),
+    },
+    'IncentiveType': {
+        'IncentiveTypeLoan': ('schema:IncentiveTypeLoan', 'IncentiveTypeLoan', 'An incentive where the recipient can receive additional funding for the purchase/lease of the good/service, which must be paid back.'),
+        'IncentiveTypeRebateOrSubsidy': ('schema:IncentiveTypeRebateOrSubsidy', 'IncentiveTypeRebateOrSubsidy', 'An incentive that reduces the purchase/lease cost of the good/service in question.'),
+        'IncentiveTypeTaxCredit': ('schema:IncentiveTypeTaxCredit', 'IncentiveTypeTaxCredit', 'An incentive that directly reduces the amount of tax owed by the recipient.'),
+        'IncentiveTypeTaxDeduction': ('schema:IncentiveTypeTaxDeduction', 'IncentiveTypeTaxDeduction', "An incentive that reduces the recipient's amount of taxable income."),
+        'IncentiveTypeTaxWaiver': ('schema:IncentiveTypeTaxWaiver', 'IncentiveTypeTaxWaiver', 'An incentive that reduces/exempts the recipient from taxation applicable to the incentivized good/service (e.g. luxury taxes, registration taxes, circulation tax).'),
+    },
+    'InfectiousAgentClass': {
+        'Bacteria': ('schema:Bacteria', 'Bacteria', 'Pathogenic bacteria that cause bacterial infection.'),
+        'Fungus': ('schema:Fungus', 'Fungus', 'Pathogenic fungus.'),
+        'MulticellularParasite': ('schema:MulticellularParasite', 'MulticellularParasite', 'Multicellular parasite that causes an infection.'),
+        'Prion': ('schema:Prion', 'Prion', 'A prion is an infectious agent composed of protein in a misfolded form.'),
+        'Protozoa': ('schema:Protozoa', 'Protozoa', 'Single-celled organism that causes an infection.'),
+        'Virus': ('schema:Virus', 'Virus', 'Pathogenic virus that causes viral infection.'),
+    },
+    'ItemAvailability': {
+        'BackOrder': ('schema:BackOrder', 'BackOrder', 'Indicates that the item is available on back order.'),
+        'Discontinued': ('schema:Discontinued', 'Discontinued', 'Indicates that the item has been discontinued.'),
+        'InStock': ('schema:InStock', 'InStock', 'Indicates that the item is in stock.'),
+        'InStoreOnly': ('schema:InStoreOnly', 'InStoreOnly', 'Indicates that the item is available only at physical locations.'),
+        'LimitedAvailability': ('schema:LimitedAvailability', 'LimitedAvailability', 'Indicates that the item has limited availability.'),
+        'MadeToOrder': ('schema:MadeToOrder', 'MadeToOrder', 'Indicates that the item is made to order (custom made).'),
+        'OnlineOnly': ('schema:OnlineOnly', 'OnlineOnly', 'Indicates that the item is available only online.'),
+        'OutOfStock': ('schema:OutOfStock', 'OutOfStock', 'Indicates that the item is out of stock.'),
+        'PreOrder': ('schema:PreOrder', 'PreOrder', 'Indicates that the item is available for pre-order.'),
+        'PreSale': ('schema:PreSale', 'PreSale', 'Indicates that the item is available for ordering and delivery before general availability.'),
+        'Reserved': ('schema:Reserved', 'Reserved', 'Indicates that the item is reserved and therefore not available.'),
+        'SoldOut': ('schema:SoldOut', 'SoldOut', 'Indicates that the item has sold out.'),
+    },
+    'ItemListOrderType': {
+        'ItemListOrderAscending': ('schema:ItemListOrderAscending', 'ItemListOrderAscending', 'An ItemList ordered with lower values listed first.'),
+        'ItemListOrderDescending': ('schema:ItemListOrderDescending', 'ItemListOrderDescending', 'An ItemList ordered with higher values listed first.'),
+        'ItemListUnordered': ('schema:ItemListUnordered', 'ItemListUnordered', 'An ItemList ordered with no explicit order.'),
+    },
+    'LegalForceStatus': {
+        'InForce': ('schema:InForce', 'InForce', 'Indicates that a legislation is in force.'),
+        'NotInForce': ('schema:NotInForce', 'NotInForce', 'Indicates that a legislation is currently not in force.'),
+        'PartiallyInForce': ('schema:PartiallyInForce', 'PartiallyInForce', 'Indicates that parts of the legislation are in force, and parts are not.'),
+    },
+    'LegalValueLevel': {
+        'AuthoritativeLegalValue': ('schema:AuthoritativeLegalValue', 'AuthoritativeLegalValue', 'Indicates that the publisher gives some special status to the publication of the document. ("The Queens Printer" version of a UK Act of Parliament, or the PDF version of a Directive published by the EU Office of Publications). Something "Authoritative" is considered to be also [[OfficialLegalValue]]".'),
+        'DefinitiveLegalValue': ('schema:DefinitiveLegalValue', 'DefinitiveLegalValue', 'Indicates a document for which the text is conclusively what the law says and is legally binding. (e.g. The digitally signed version of an Official Journal.)\n  Something "Definitive" is considered to be also [[AuthoritativeLegalValue]].'),
+        'OfficialLegalValue': ('schema:OfficialLegalValue', 'OfficialLegalValue', 'All the documents published by an official publisher should have at least the legal value level "OfficialLegalValue". This indicates that the document was published by an organisation with the public task of making it available (e.g. a consolidated version of a EU directive published by the EU Office of Publications).'),
+        'UnofficialLegalValue': ('schema:UnofficialLegalValue', 'UnofficialLegalValue', 'Indicates that a document has no particular or special standing (e.g. a republication of a law by a private publisher).'),
+    },
+    'MapCategoryType': {
+        'ParkingMap': ('schema:ParkingMap', 'ParkingMap', 'A parking map.'),
+        'SeatingMap': ('schema:SeatingMap', 'SeatingMap', 'A seating map.'),
+        'TransitMap': ('schema:TransitMap', 'TransitMap', 'A transit map.'),
+        'VenueMap': ('schema:VenueMap', 'VenueMap', 'A venue map (e.g. for malls, auditoriums, museums, etc.).'),
+    },
+    'MeasurementMethodEnum': {
+        'ExampleMeasurementMethodEnum': ('schema:ExampleMeasurementMethodEnum', 'ExampleMeasurementMethodEnum', 'An example [[MeasurementMethodEnum]] (to remove when real enums are added).'),
+    },
+    'MediaManipulationRatingEnumeration': {
+        'DecontextualizedContent': ('schema:DecontextualizedContent', 'DecontextualizedContent', "Content coded 'missing context' in a [[MediaReview]], considered in the context of how it was published or shared.\n\nFor a [[VideoObject]] to be 'missing context': Presenting unaltered video in an inaccurate manner that misrepresents the footage. For example, using incorrect dates or locations, altering the transcript or sharing brief clips from a longer video to mislead viewers. (A video rated 'original' can also be missing context.)\n\nFor an [[ImageObject]] to be 'missing context': Presenting unaltered images in an inaccurate manner to misrepresent the image and mislead the viewer. For example, a common tactic is using an unaltered image but saying it came from a different time or place. (An image rated 'original' can also be missing context.)\n\nFor an [[ImageObject]] with embedded text to be 'missing context': An unaltered image presented in an inaccurate manner to misrepresent the image and mislead the viewer. For example, a common tactic is using an unaltered image but saying it came from a different time or place. (An 'original' image with inaccurate text would generally fall in this category.)\n\nFor an [[AudioObject]] to be 'missing context': Unaltered audio presented in an inaccurate manner that misrepresents it. For example, using incorrect dates or locations, or sharing brief clips from a longer recording to mislead viewers. (Audio rated “original” can also be missing context.)\n"),
+        'EditedOrCroppedContent': ('schema:EditedOrCroppedContent', 'EditedOrCroppedContent', "Content coded 'edited or cropped content' in a [[MediaReview]], considered in the context of how it was published or shared.\n\nFor a [[VideoObject]] to be 'edited or cropped content': The video has been edited or rearranged. This category applies to time edits, including editing multiple videos together to alter the story being told or editing out large portions from a video.\n\nFor an [[ImageObject]] to be 'edited or cropped content': Presenting a part of an image from a larger whole to mislead the viewer.\n\nFor an [[ImageObject]] with embedded text to be 'edited or cropped content': Presenting a part of an image from a larger whole to mislead the viewer.\n\nFor an [[AudioObject]] to be 'edited or cropped content': The audio has been edited or rearranged. This category applies to time edits, including editing multiple audio clips together to alter the story being told or editing out large portions from the recording.\n"),
+        'OriginalMediaContent': ('schema:OriginalMediaContent', 'OriginalMediaContent', "Content coded 'as original media content' in a [[MediaReview]], considered in the context of how it was published or shared.\n\nFor a [[VideoObject]] to be 'original': No evidence the footage has been misleadingly altered or manipulated, though it may contain false or misleading claims.\n\nFor an [[ImageObject]] to be 'original': No evidence the image has been misleadingly altered or manipulated, though it may still contain false or misleading claims.\n\nFor an [[ImageObject]] with embedded text to be 'original': No evidence the image has been misleadingly altered or manipulated, though it may still contain false or misleading claims.\n\nFor an [[AudioObject]] to be 'original': No evidence the audio has been misleadingly altered or manipulated, though it may contain false or misleading claims.\n"),
+        'SatireOrParodyContent': ('schema:SatireOrParodyContent', 'SatireOrParodyContent', "Content coded 'satire or parody content' in a [[MediaReview]], considered in the context of how it was published or shared.\n\nFor a [[VideoObject]] to be 'satire or parody content': A video that was created as political or humorous commentary and is presented in that context. (Reshares of satire/parody content that do not include relevant context are more likely to fall under the “missing context” rating.)\n\nFor an [[ImageObject]] to be 'satire or parody content': An image that was created as political or humorous commentary and is presented in that context. (Reshares of satire/parody content that do not include relevant context are more likely to fall under the “missing context” rating.)\n\nFor an [[ImageObject]] with embedded text to be 'satire or parody content': An image that was created as political or humorous commentary and is presented in that context. (Reshares of satire/parody content that do not include relevant context are more likely to fall under the “missing context” rating.)\n\nFor an [[AudioObject]] to be 'satire or parody content': Audio that was created as political or humorous commentary and is presented in that context. (Reshares of satire/parody content that do not include relevant context are more likely to fall under the “missing context” rating.)\n"),
+        'StagedContent': ('schema:StagedContent', 'StagedContent', "Content coded 'staged content' in a [[MediaReview]], considered in the context of how it was published or shared.\n\nFor a [[VideoObject]] to be 'staged content': A video that has been created using actors or similarly contrived.\n\nFor an [[ImageObject]] to be 'staged content': An image that was created using actors or similarly contrived, such as a screenshot of a fake tweet.\n\nFor an [[ImageObject]] with embedded text to be 'staged content': An image that was created using actors or similarly contrived, such as a screenshot of a fake tweet.\n\nFor an [[AudioObject]] to be 'staged content': Audio that has been created using actors or similarly contrived.\n"),
+        'TransformedContent': ('schema:TransformedContent', 'TransformedContent', "Content coded 'transformed content' in a [[MediaReview]], considered in the context of how it was published or shared.\n\nFor a [[VideoObject]] to be 'transformed content':  or all of the video has been manipulated to transform the footage itself. This category includes using tools like the Adobe Suite to change the speed of the video, add or remove visual elements or dub audio. Deepfakes are also a subset of transformation.\n\nFor an [[ImageObject]] to be 'transformed content': Adding or deleting visual elements to give the image a different meaning with the intention to mislead.\n\nFor an [[ImageObject]] with embedded text to be 'transformed content': Adding or deleting visual elements to give the image a different meaning with the intention to mislead.\n\nFor an [[AudioObject]] to be 'transformed content': Part or all of the audio has been manipulated to alter the words or sounds, or the audio has been synthetically generated, such as to create a sound-alike voice.\n"),
+    },
+    'MedicalAudienceType': {
+        'Clinician': ('schema:Clinician', 'Clinician', 'Medical clinicians, including practicing physicians and other medical professionals involved in clinical practice.'),
+        'MedicalResearcher': ('schema:MedicalResearcher', 'MedicalResearcher', 'Medical researchers.'),
+    },
+    'MedicalDevicePurpose': {
+        'Diagnostic': ('schema:Diagnostic', 'Diagnostic', 'A medical device used for diagnostic purposes.'),
+        'Therapeutic': ('schema:Therapeutic', 'Therapeutic', 'A medical device used for therapeutic purposes.'),
+    },
+    'MedicalEvidenceLevel': {
+        'EvidenceLevelA': ('schema:EvidenceLevelA', 'EvidenceLevelA', 'Data derived from multiple randomized clinical trials or meta-analyses.'),
+        'EvidenceLevelB': ('schema:EvidenceLevelB', 'EvidenceLevelB', 'Data derived from a single randomized trial, or nonrandomized studies.'),
+        'EvidenceLevelC': ('schema:EvidenceLevelC', 'EvidenceLevelC', 'Only consensus opinion of experts, case studies, or standard-of-care.'),
+    },
+    'MedicalImagingTechnique': {
+        'CT': ('schema:CT', 'CT', 'X-ray computed tomography imaging.'),
+        'MRI': ('schema:MRI', 'MRI', 'Magnetic resonance imaging.'),
+        'PET': ('schema:PET', 'PET', 'Positron emission tomography imaging.'),
+        'Radiography': ('schema:Radiography', 'Radiography', 'Radiography is an imaging technique that uses electromagnetic radiation other than visible light, especially X-rays, to view the internal structure of a non-uniformly composed and opaque object such as the human body.'),
+        'Ultrasound': ('schema:Ultrasound', 'Ultrasound', 'Ultrasound imaging.'),
+        'XRay': ('schema:XRay', 'XRay', 'X-ray imaging.'),
+    },
+    'MedicalObservationalStudyDesign': {
+        'CaseSeries': ('schema:CaseSeries', 'CaseSeries', 'A case series (also known as a clinical series) is a medical research study that tracks patients with a known exposure given similar treatment or examines their medical records for exposure and outcome. A case series can be retrospective or prospective and usually involves a smaller number of patients than the more powerful case-control studies or randomized controlled trials. Case series may be consecutive or non-consecutive, depending on whether all cases presenting to the reporting authors over a period of time were included, or only a selection.'),
+        'CohortStudy': ('schema:CohortStudy', 'CohortStudy', 'Also known as a panel study. A cohort study is a form of longitudinal study used in medicine and social science. It is one type of study design and should be compared with a cross-sectional study.  A cohort is a group of people who share a common characteristic or experience within a defined period (e.g., are born, leave school, lose their job, are exposed to a drug or a vaccine, etc.). The comparison group may be the general population from which the cohort is drawn, or it may be another cohort of persons thought to have had little or no exposure to the substance under investigation, but otherwise similar. Alternatively, subgroups within the cohort may be compared with each other.'),
+        'CrossSectional': ('schema:CrossSectional', 'CrossSectional', "Studies carried out on pre-existing data (usually from 'snapshot' surveys), such as that collected by the Census Bureau. Sometimes called Prevalence Studies."),
+        'Longitudinal': ('schema:Longitudinal', 'Longitudinal', 'Unlike cross-sectional studies, longitudinal studies track the same people, and therefore the differences observed in those people are less likely to be the result of cultural differences across generations. Longitudinal studies are also used in medicine to uncover predictors of certain diseases.'),
+        'Observational': ('schema:Observational', 'Observational', 'An observational study design.'),
+        'Registry': ('schema:Registry', 'Registry', 'A registry-based study design.'),
+    },
+    'MedicalProcedureType': {
+        'NoninvasiveProcedure': ('schema:NoninvasiveProcedure', 'NoninvasiveProcedure', 'A type of medical procedure that involves noninvasive techniques.'),
+        'PercutaneousProcedure': ('schema:PercutaneousProcedure', 'PercutaneousProcedure', 'A type of medical procedure that involves percutaneous techniques, where access to organs or tissue is achieved via needle-puncture of the skin. For example, catheter-based procedures like stent delivery.'),
+    },
+    'MedicalSpecialty': {
+        'Anesthesia': ('schema:Anesthesia', 'Anesthesia', 'A specific branch of medical science that pertains to study of anesthetics and their application.'),
+        'Cardiovascular': ('schema:Cardiovascular', 'Cardiovascular', 'A specific branch of medical science that pertains to diagnosis and treatment of disorders of heart and vasculature.'),
+        'CommunityHealth': ('schema:CommunityHealth', 'CommunityHealth', 'A field of public health focusing on improving health characteristics of a defined population in relation with their geographical or environment areas.'),
+        'Dentistry': ('schema:Dentistry', 'Dentistry', 'A branch of medicine that is involved in the dental care.'),
+        'Dermatologic': ('schema:Dermatologic', 'Dermatologic', 'Something relating to or practicing dermatology.'),
+        'Dermatology': ('schema:Dermatology', 'Dermatology', 'A specific branch of medical science that pertains to diagnosis and treatment of disorders of skin.'),
+        'DietNutrition': ('schema:DietNutrition', 'DietNutrition', 'Dietetics and nutrition as a medical specialty.'),
+        'Emergency': ('schema:Emergency', 'Emergency', 'A specific branch of medical science that deals with the evaluation and initial treatment of medical conditions caused by trauma or sudden illness.'),
+        'Endocrine': ('schema:Endocrine', 'Endocrine', 'A specific branch of medical science that pertains to diagnosis and treatment of disorders of endocrine glands and their secretions.'),
+        'Gastroenterologic': ('schema:Gastroenterologic', 'Gastroenterologic', 'A specific branch of medical science that pertains to diagnosis and treatment of disorders of digestive system.'),
+        'Genetic': ('schema:Genetic', 'Genetic', 'A specific branch of medical science that pertains to hereditary transmission and the variation of inherited characteristics and disorders.'),
+        'Geriatric': ('schema:Geriatric', 'Geriatric', 'A specific branch of medical science that is concerned with the diagnosis and treatment of diseases, debilities and provision of care to the aged.'),
+        'Gynecologic': ('schema:Gynecologic', 'Gynecologic', 'A specific branch of medical science that pertains to the health care of women, particularly in the diagnosis and treatment of disorders affecting the female reproductive system.'),
+        'Hematologic': ('schema:Hematologic', 'Hematologic', 'A specific branch of medical science that pertains to diagnosis and treatment of disorders of blood and blood producing organs.'),
+        'Infectious': ('schema:Infectious', 'Infectious', 'Something in medical science that pertains to infectious diseases, i.e. caused by bacterial, viral, fungal or parasitic infections.'),
+        'LaboratoryScience': ('schema:LaboratoryScience', 'LaboratoryScience', 'A medical science pertaining to chemical, hematological, immunologic, microscopic, or bacteriological diagnostic analyses or research.'),
+        'Midwifery': ('schema:Midwifery', 'Midwifery', 'A nurse-like health profession that deals with pregnancy, childbirth, and the postpartum period (including care of the newborn), besides sexual and reproductive health of women throughout their lives.'),
+        'Musculoskeletal': ('schema:Musculoskeletal', 'Musculoskeletal', 'A specific branch of medical science that pertains to diagnosis and treatment of disorders of muscles, ligaments and skeletal system.'),
+        'Neurologic': ('schema:Neurologic', 'Neurologic', 'A specific branch of medical science that studies the nerves and nervous system and its respective disease states.'),
+        'Nursing': ('schema:Nursing', 'Nursing', 'A health profession of a person formally educated and trained in the care of the sick or infirm person.'),
+        'Obstetric': ('schema:Obstetric', 'Obstetric', 'A specific branch of medical science that specializes in the care of women during the prenatal and postnatal care and with the delivery of the child.'),
+        'Oncologic': ('schema:Oncologic', 'Oncologic', 'A specific branch of medical science that deals with benign and malignant tumors, including the study of their development, diagnosis, treatment and prevention.'),
+        'Optometric': ('schema:Optometric', 'Optometric', 'The science or practice of testing visual acuity and prescribing corrective lenses.'),
+        'Otolaryngologic': ('schema:Otolaryngologic', 'Otolaryngologic', 'A specific branch of medical science that is concerned with the ear, nose and throat and their respective disease states.'),
+        'Pathology': ('schema:Pathology', 'Pathology', 'A specific branch of medical science that is concerned with the study of the cause, origin and nature of a disease state, including its consequences as a result of manifestation of the disease. In clinical care, the term is used to designate a branch of medicine using laboratory tests to diagnose and determine the prognostic significance of illness.'),
+        'Pediatric': ('schema:Pediatric', 'Pediatric', 'A specific branch of medical science that specializes in the care of infants, children and adolescents.'),
+        'PharmacySpecialty': ('schema:PharmacySpecialty', 'PharmacySpecialty', 'The practice or art and science of preparing and dispensing drugs and medicines.'),
+        'Physiotherapy': ('schema:Physiotherapy', 'Physiotherapy', 'The practice of treatment of disease, injury, or deformity by physical methods such as massage, heat treatment, and exercise rather than by drugs or surgery.'),
+        'PlasticSurgery': ('schema:PlasticSurgery', 'PlasticSurgery', 'A specific branch of medical science that pertains to therapeutic or cosmetic repair or re-formation of missing, injured or malformed tissues or body parts by manual and instrumental means.'),
+        'Podiatric': ('schema:Podiatric', 'Podiatric', 'Podiatry is the care of the human foot, especially the diagnosis and treatment of foot disorders.'),
+        'PrimaryCare': ('schema:PrimaryCare', 'PrimaryCare', "The medical care by a physician, or other health-care professional, who is the patient's first contact with the health-care system and who may recommend a specialist if necessary."),
+        'Psychiatric': ('schema:Psychiatric', 'Psychiatric', 'A specific branch of medical science that is concerned with the study, treatment, and prevention of mental illness, using both medical and psychological therapies.'),
+        'PublicHealth': ('schema:PublicHealth', 'PublicHealth', 'Branch of medicine that pertains to the health services to improve and protect community health, especially epidemiology, sanitation, immunization, and preventive medicine.'),
+        'Pulmonary': ('schema:Pulmonary', 'Pulmonary', 'A specific branch of medical science that pertains to the study of the respiratory system and its respective disease states.'),
+        'Radiography': ('schema:Radiography', 'Radiography', 'Radiography is an imaging technique that uses electromagnetic radiation other than visible light, especially X-rays, to view the internal structure of a non-uniformly composed and opaque object such as the human body.'),
+        'Renal': ('schema:Renal', 'Renal', 'A specific branch of medical science that pertains to the study of the kidneys and its respective disease states.'),
+        'RespiratoryTherapy': ('schema:RespiratoryTherapy', 'RespiratoryTherapy', 'The therapy that is concerned with the maintenance or improvement of respiratory function (as in patients with pulmonary disease).'),
+        'Rheumatologic': ('schema:Rheumatologic', 'Rheumatologic', 'A specific branch of medical science that deals with the study and treatment of rheumatic, autoimmune or joint diseases.'),
+        'SpeechPathology': ('schema:SpeechPathology', 'SpeechPathology', 'The scientific study and treatment of defects, disorders, and malfunctions of speech and voice, as stuttering, lisping, or lalling, and of language disturbances, as aphasia or delayed language acquisition.'),
+        'Surgical': ('schema:Surgical', 'Surgical', 'A specific branch of medical science that pertains to treating diseases, injuries and deformities by manual and instrumental means.'),
+        'Toxicologic': ('schema:Toxicologic', 'Toxicologic', 'A specific branch of medical science that is concerned with poisons, their nature, effects and detection and involved in the treatment of poisoning.'),
+        'Urologic': ('schema:Urologic', 'Urologic', 'A specific branch of medical science that is concerned with the diagnosis and treatment of diseases pertaining to the urinary tract and the urogenital system.'),
+    },
+    'MedicalStudyStatus': {
+        'ActiveNotRecruiting': ('schema:ActiveNotRecruiting', 'ActiveNotRecruiting', 'Active, but not recruiting new participants.'),
+        'Completed': ('schema:Completed', 'Completed', 'Completed.'),
+        'EnrollingByInvitation': ('schema:EnrollingByInvitation', 'EnrollingByInvitation', 'Enrolling participants by invitation only.'),
+        'NotYetRecruiting': ('schema:NotYetRecruiting', 'NotYetRecruiting', 'Not yet recruiting.'),
+        'Recruiting': ('schema:Recruiting', 'Recruiting', 'Recruiting participants.'),
+        'ResultsAvailable': ('schema:ResultsAvailable', 'ResultsAvailable', 'Results are available.'),
+        'ResultsNotAvailable': ('schema:ResultsNotAvailable', 'ResultsNotAvailable', 'Results are not available.'),
+        'Suspended': ('schema:Suspended', 'Suspended', 'Suspended.'),
+        'Terminated': ('schema:Terminated', 'Terminated', 'Terminated.'),
+        'Withdrawn': ('schema:Withdrawn', 'Withdrawn', 'Withdrawn.'),
+    },
+    'MedicalTrialDesign': {
+        'DoubleBlindedTrial': ('schema:DoubleBlindedTrial', 'DoubleBlindedTrial', 'A trial design in which neither the researcher nor the patient knows the details of the treatment the patient was randomly assigned to.'),
+        'InternationalTrial': ('schema:InternationalTrial', 'InternationalTrial', 'An international trial.'),
+        'MultiCenterTrial': ('schema:MultiCenterTrial', 'MultiCenterTrial', 'A trial that takes place at multiple centers.'),
+        'OpenTrial': ('schema:OpenTrial', 'OpenTrial', 'A trial design in which the researcher knows the full details of the treatment, and so does the patient.'),
+        'PlaceboControlledTrial': ('schema:PlaceboControlledTrial', 'PlaceboControlledTrial', 'A placebo-controlled trial design.'),
+        'RandomizedTrial': ('schema:RandomizedTrial', 'RandomizedTrial', 'A randomized trial design.'),
+        'SingleBlindedTrial': ('schema:SingleBlindedTrial', 'SingleBlindedTrial', 'A trial design in which the researcher knows which treatment the patient was randomly assigned to but the patient does not.'),
+        'SingleCenterTrial': ('schema:SingleCenterTrial', 'SingleCenterTrial', 'A trial that takes place at a single center.'),
+        'TripleBlindedTrial': ('schema:TripleBlindedTrial', 'TripleBlindedTrial', 'A trial design in which neither the researcher, the person administering the therapy nor the patient knows the details of the treatment the patient was randomly assigned to.'),
+    },
+    'MedicineSystem': {
+        'Ayurvedic': ('schema:Ayurvedic', 'Ayurvedic', 'A system of medicine that originated in India over thousands of years and that focuses on integrating and balancing the body, mind, and spirit.'),
+        'Chiropractic': ('schema:Chiropractic', 'Chiropractic', "A system of medicine focused on the relationship between the body's structure, mainly the spine, and its functioning."),
+        'Homeopathic': ('schema:Homeopathic', 'Homeopathic', 'A system of medicine based on the principle that a disease can be cured by a substance that produces similar symptoms in healthy people.'),
+        'Osteopathic': ('schema:Osteopathic', 'Osteopathic', "A system of medicine focused on promoting the body's innate ability to heal itself."),
+        'TraditionalChinese': ('schema:TraditionalChinese', 'TraditionalChinese', 'A system of medicine based on common theoretical concepts that originated in China and evolved over thousands of years, that uses herbs, acupuncture, exercise, massage, dietary therapy, and other methods to treat a wide range of conditions.'),
+        'WesternConventional': ('schema:WesternConventional', 'WesternConventional', 'The conventional Western system of medicine, that aims to apply the best available evidence gained from the scientific method to clinical decision making. Also known as conventional or Western medicine.'),
+    },
+    'MerchantReturnEnumeration': {
+        'MerchantReturnFiniteReturnWindow': ('schema:MerchantReturnFiniteReturnWindow', 'MerchantReturnFiniteReturnWindow', 'Specifies that there is a finite window for product returns.'),
+        'MerchantReturnNotPermitted': ('schema:MerchantReturnNotPermitted', 'MerchantReturnNotPermitted', 'Specifies that product returns are not permitted.'),
+        'MerchantReturnUnlimitedWindow': ('schema:MerchantReturnUnlimitedWindow', 'MerchantReturnUnlimitedWindow', 'Specifies that there is an unlimited window for product returns.'),
+        'MerchantReturnUnspecified': ('schema:MerchantReturnUnspecified', 'MerchantReturnUnspecified', 'Specifies that a product return policy is not provided.'),
+    },
+    'MusicAlbumProductionType': {
+        'CompilationAlbum': ('schema:CompilationAlbum', 'CompilationAlbum', 'CompilationAlbum.'),
+        'DJMixAlbum': ('schema:DJMixAlbum', 'DJMixAlbum', 'DJMixAlbum.'),
+        'DemoAlbum': ('schema:DemoAlbum', 'DemoAlbum', 'DemoAlbum.'),
+        'LiveAlbum': ('schema:LiveAlbum', 'LiveAlbum', 'LiveAlbum.'),
+        'MixtapeAlbum': ('schema:MixtapeAlbum', 'MixtapeAlbum', 'MixtapeAlbum.'),
+        'RemixAlbum': ('schema:RemixAlbum', 'RemixAlbum', 'RemixAlbum.'),
+        'SoundtrackAlbum': ('schema:SoundtrackAlbum', 'SoundtrackAlbum', 'SoundtrackAlbum.'),
+        'SpokenWordAlbum': ('schema:SpokenWordAlbum', 'SpokenWordAlbum', 'SpokenWordAlbum.'),
+        'StudioAlbum': ('schema:StudioAlbum', 'StudioAlbum', 'StudioAlbum.'),
+    },
+    'MusicAlbumReleaseType': {
+        'AlbumRelease': ('schema:AlbumRelease', 'AlbumRelease', 'AlbumRelease.'),
+        'BroadcastRelease': ('schema:BroadcastRelease', 'BroadcastRelease', 'BroadcastRelease.'),
+        'EPRelease': ('schema:EPRelease', 'EPRelease', 'EPRelease.'),
+        'SingleRelease': ('schema:SingleRelease', 'SingleRelease', 'SingleRelease.'),
+    },
+    'MusicReleaseFormatType': {
+        'CDFormat': ('schema:CDFormat', 'CDFormat', 'CDFormat.'),
+        'CassetteFormat': ('schema:CassetteFormat', 'CassetteFormat', 'CassetteFormat.'),
+        'DVDFormat': ('schema:DVDFormat', 'DVDFormat', 'DVDFormat.'),
+        'DigitalAudioTapeFormat': ('schema:DigitalAudioTapeFormat', 'DigitalAudioTapeFormat', 'DigitalAudioTapeFormat.'),
+        'DigitalFormat': ('schema:DigitalFormat', 'DigitalFormat', 'DigitalFormat.'),
+        'LaserDiscFormat': ('schema:LaserDiscFormat', 'LaserDiscFormat', 'LaserDiscFormat.'),
+        'VinylFormat': ('schema:VinylFormat', 'VinylFormat', 'VinylFormat.'),
+    },
+    'NLNonprofitType': {
+        'NonprofitANBI': ('schema:NonprofitANBI', 'NonprofitANBI', 'NonprofitANBI: Non-profit type referring to a Public Benefit Organization (NL).'),
+        'NonprofitSBBI': ('schema:NonprofitSBBI', 'NonprofitSBBI', 'NonprofitSBBI: Non-profit type referring to a Social Interest Promoting Institution (NL).'),
+    },
+    'OfferItemCondition': {
+        'DamagedCondition': ('schema:DamagedCondition', 'DamagedCondition', 'Indicates that the item is damaged.'),
+        'NewCondition': ('schema:NewCondition', 'NewCondition', 'Indicates that the item is new.'),
+        'RefurbishedCondition': ('schema:RefurbishedCondition', 'RefurbishedCondition', 'Indicates that the item is refurbished.'),
+        'UsedCondition': ('schema:UsedCondition', 'UsedCondition', 'Indicates that the item is used.'),
+    },
+    'OrderStatus': {
+        'OrderCancelled': ('schema:OrderCancelled', 'OrderCancelled', 'OrderStatus representing cancellation of an order.'),
+        'OrderDelivered': ('schema:OrderDelivered', 'OrderDelivered', 'OrderStatus representing successful delivery of an order.'),
+        'OrderInTransit': ('schema:OrderInTransit', 'OrderInTransit', 'OrderStatus representing that an order is in transit.'),
+        'OrderPaymentDue': ('schema:OrderPaymentDue', 'OrderPaymentDue', 'OrderStatus representing that payment is due on an order.'),
+        'OrderPickupAvailable': ('schema:OrderPickupAvailable', 'OrderPickupAvailable', 'OrderStatus representing availability of an order for pickup.'),
+        'OrderProblem': ('schema:OrderProblem', 'OrderProblem', 'OrderStatus representing that there is a problem with the order.'),
+        'OrderProcessing': ('schema:OrderProcessing', 'OrderProcessing', 'OrderStatus representing that an order is being processed.'),
+        'OrderReturned': ('schema:OrderReturned', 'OrderReturned', 'OrderStatus representing that an order has been returned.'),
+    },
+    'PaymentMethodType': {
+        'ByBankTransferInAdvance': ('schema:ByBankTransferInAdvance', 'ByBankTransferInAdvance', 'Payment in advance by bank transfer, equivalent to <code>http://purl.org/goodrelations/v1#ByBankTransferInAdvance</code>.'),
+        'ByInvoice': ('schema:ByInvoice', 'ByInvoice', 'Payment by invoice, typically after the goods were delivered, equivalent to <code>http://purl.org/goodrelations/v1#ByInvoice</code>.'),
+        'COD': ('schema:COD', 'COD', 'Cash on Delivery (COD) payment, equivalent to <code>http://purl.org/goodrelations/v1#COD</code>.'),
+        'Cash': ('schema:Cash', 'Cash', 'Payment using cash, on premises, equivalent to <code>http://purl.org/goodrelations/v1#Cash</code>.'),
+        'CheckInAdvance': ('schema:CheckInAdvance', 'CheckInAdvance', 'Payment in advance by sending a check, equivalent to <code>http://purl.org/goodrelations/v1#CheckInAdvance</code>.'),
+        'DirectDebit': ('schema:DirectDebit', 'DirectDebit', 'Payment in advance by direct debit from the bank, equivalent to <code>http://purl.org/goodrelations/v1#DirectDebit</code>.'),
+        'InStorePrepay': ('schema:InStorePrepay', 'InStorePrepay', 'Payment in advance in some form of shop or kiosk for goods purchased online.'),
+        'PhoneCarrierPayment': ('schema:PhoneCarrierPayment', 'PhoneCarrierPayment', 'Payment by billing via the phone carrier.'),
+    },
+    'PaymentStatusType': {
+        'PaymentAutomaticallyApplied': ('schema:PaymentAutomaticallyApplied', 'PaymentAutomaticallyApplied', 'An automatic payment system is in place and will be used.'),
+        'PaymentComplete': ('schema:PaymentComplete', 'PaymentComplete', 'The payment has been received and processed.'),
+        'PaymentDeclined': ('schema:PaymentDeclined', 'PaymentDeclined', 'The payee received the payment, but it was declined for some reason.'),
+        'PaymentDue': ('schema:PaymentDue', 'PaymentDue', 'The payment is due, but still within an acceptable time to be received.'),
+        'PaymentPastDue': ('schema:PaymentPastDue', 'PaymentPastDue', 'The payment is due and considered late.'),
+    },
+    'PhysicalActivityCategory': {
+        'AerobicActivity': ('schema:AerobicActivity', 'AerobicActivity', 'Physical activity of relatively low intensity that depends primarily on the aerobic energy-generating process; during activity, the aerobic metabolism uses oxygen to adequately meet energy demands during exercise.'),
+        'AnaerobicActivity': ('schema:AnaerobicActivity', 'AnaerobicActivity', 'Physical activity that is of high-intensity which utilizes the anaerobic metabolism of the body.'),
+        'Balance': ('schema:Balance', 'Balance', 'Physical activity that is engaged to help maintain posture and balance.'),
+        'Flexibility': ('schema:Flexibility', 'Flexibility', 'Physical activity that is engaged in to improve joint and muscle flexibility.'),
+        'LeisureTimeActivity': ('schema:LeisureTimeActivity', 'LeisureTimeActivity', 'Any physical activity engaged in for recreational purposes. Examples may include ballroom dancing, roller skating, canoeing, fishing, etc.'),
+        'OccupationalActivity': ('schema:OccupationalActivity', 'OccupationalActivity', 'Any physical activity engaged in for job-related purposes. Examples may include waiting tables, maid service, carrying a mailbag, picking fruits or vegetables, construction work, etc.'),
+        'StrengthTraining': ('schema:StrengthTraining', 'StrengthTraining', 'Physical activity that is engaged in to improve muscle and bone strength. Also referred to as resistance training.'),
+    },
+    'PhysicalExam': {
+        'Abdomen': ('schema:Abdomen', 'Abdomen', 'Abdomen clinical examination.'),
+        'Appearance': ('schema:Appearance', 'Appearance', 'Appearance assessment with clinical examination.'),
+        'CardiovascularExam': ('schema:CardiovascularExam', 'CardiovascularExam', 'Cardiovascular system assessment with clinical examination.'),
+        'Ear': ('schema:Ear', 'Ear', 'Ear function assessment with clinical examination.'),
+        'Eye': ('schema:Eye', 'Eye', 'Eye or ophthalmological function assessment with clinical examination.'),
+        'Genitourinary': ('schema:Genitourinary', 'Genitourinary', 'Genitourinary system function assessment with clinical examination.'),
+        'Head': ('schema:Head', 'Head', 'Head assessment with clinical examination.'),
+        'Lung': ('schema:Lung', 'Lung', 'Lung and respiratory system clinical examination.'),
+        'MusculoskeletalExam': ('schema:MusculoskeletalExam', 'MusculoskeletalExam', 'Musculoskeletal system clinical examination.'),
+        'Neck': ('schema:Neck', 'Neck', 'Neck assessment with clinical examination.'),
+        'Neuro': ('schema:Neuro', 'Neuro', 'Neurological system clinical examination.'),
+        'Nose': ('schema:Nose', 'Nose', 'Nose function assessment with clinical examination.'),
+        'Skin': ('schema:Skin', 'Skin', 'Skin assessment with clinical examination.'),
+        'Throat': ('schema:Throat', 'Throat', 'Throat assessment with  clinical examination.'),
+    },
+    'PriceComponentTypeEnumeration': {
+        'ActivationFee': ('schema:ActivationFee', 'ActivationFee', 'Represents the activation fee part of the total price for an offered product, for example a cellphone contract.'),
+        'CleaningFee': ('schema:CleaningFee', 'CleaningFee', 'Represents the cleaning fee part of the total price for an offered product, for example a vacation rental.'),
+        'DistanceFee': ('schema:DistanceFee', 'DistanceFee', 'Represents the distance fee (e.g., price per km or mile) part of the total price for an offered product, for example a car rental.'),
+        'Downpayment': ('schema:Downpayment', 'Downpayment', 'Represents the downpayment (up-front payment) price component of the total price for an offered product that has additional installment payments.'),
+        'Installment': ('schema:Installment', 'Installment', 'Represents the installment pricing component of the total price for an offered product.'),
+        'Subscription': ('schema:Subscription', 'Subscription', 'Represents the subscription pricing component of the total price for an offered product.'),
+    },
+    'PriceTypeEnumeration': {
+        'InvoicePrice': ('schema:InvoicePrice', 'InvoicePrice', 'Represents the invoice price of an offered product.'),
+        'ListPrice': ('schema:ListPrice', 'ListPrice', 'Represents the list price of an offered product. Typically the same as the [MSRP](https://schema.org/MSRP).'),
+        'MSRP': ('schema:MSRP', 'MSRP', 'Represents the manufacturer suggested retail price ("MSRP") of an offered product.'),
+        'MinimumAdvertisedPrice': ('schema:MinimumAdvertisedPrice', 'MinimumAdvertisedPrice', 'Represents the minimum advertised price ("MAP") (as dictated by the manufacturer) of an offered product.'),
+        'RegularPrice': ('schema:RegularPrice', 'RegularPrice', 'Represents the regular price of an offered product. This is usually the advertised price before a temporary sale. Once the sale period ends the advertised price will go back to the regular price.'),
+        'SRP': ('schema:SRP', 'SRP', 'Represents the suggested retail price ("SRP") of an offered product.'),
+        'SalePrice': ('schema:SalePrice', 'SalePrice', 'Represents a sale price (usually active for a limited period) of an offered product.'),
+        'StrikethroughPrice': ('schema:StrikethroughPrice', 'StrikethroughPrice', 'Represents the strikethrough price (the previous advertised price) of an offered product.'),
+    },
+    'PurchaseType': {
+        'PurchaseTypeLease': ('schema:PurchaseTypeLease', 'PurchaseTypeLease', 'This is a lease of an item.'),
+        'PurchaseTypeNewPurchase': ('schema:PurchaseTypeNewPurchase', 'PurchaseTypeNewPurchase', 'This is a purchase of a new item.'),
+        'PurchaseTypeTradeIn': ('schema:PurchaseTypeTradeIn', 'PurchaseTypeTradeIn', 'This is a trade-in for an item.'),
+        'PurchaseTypeUsedPurchase': ('schema:PurchaseTypeUsedPurchase', 'PurchaseTypeUsedPurchase', 'This is a purchase of a used item.'),
+    },
+    'RefundTypeEnumeration': {
+        'ExchangeRefund': ('schema:ExchangeRefund', 'ExchangeRefund', 'Specifies that a refund can be done as an exchange for the same product.'),
+        'FullRefund': ('schema:FullRefund', 'FullRefund', 'Specifies that a refund can be done in the full amount the customer paid for the product.'),
+        'StoreCreditRefund': ('schema:StoreCreditRefund', 'StoreCreditRefund', 'Specifies that the customer receives a store credit as refund when returning a product.'),
+    },
+    'ReservationStatusType': {
+        'ReservationCancelled': ('schema:ReservationCancelled', 'ReservationCancelled', 'The status for a previously confirmed reservation that is now cancelled.'),
+        'ReservationConfirmed': ('schema:ReservationConfirmed', 'ReservationConfirmed', 'The status of a confirmed reservation.'),
+        'ReservationHold': ('schema:ReservationHold', 'ReservationHold', 'The status of a reservation on hold pending an update like credit card number or flight changes.'),
+        'ReservationPending': ('schema:ReservationPending', 'ReservationPending', 'The status of a reservation when a request has been sent, but not confirmed.'),
+    },
+    'RestrictedDiet': {
+        'DiabeticDiet': ('schema:DiabeticDiet', 'DiabeticDiet', 'A diet appropriate for people with diabetes.'),
+        'GlutenFreeDiet': ('schema:GlutenFreeDiet', 'GlutenFreeDiet', 'A diet exclusive of gluten.'),
+        'HalalDiet': ('schema:HalalDiet', 'HalalDiet', 'A diet conforming to Islamic dietary practices.'),
+        'HinduDiet': ('schema:HinduDiet', 'HinduDiet', 'A diet conforming to Hindu dietary practices, in particular, beef-free.'),
+        'KosherDiet': ('schema:KosherDiet', 'KosherDiet', 'A diet conforming to Jewish dietary practices.'),
+        'LowCalorieDiet': ('schema:LowCalorieDiet', 'LowCalorieDiet', 'A diet focused on reduced calorie intake.'),
+        'LowFatDiet': ('schema:LowFatDiet', 'LowFatDiet', 'A diet focused on reduced fat and cholesterol intake.'),
+        'LowLactoseDiet': ('schema:LowLactoseDiet', 'LowLactoseDiet', 'A diet appropriate for people with lactose intolerance.'),
+        'LowSaltDiet': ('schema:LowSaltDiet', 'LowSaltDiet', 'A diet focused on reduced sodium intake.'),
+        'VeganDiet': ('schema:VeganDiet', 'VeganDiet', 'A diet exclusive of all animal products.'),
+        'VegetarianDiet': ('schema:VegetarianDiet', 'VegetarianDiet', 'A diet exclusive of animal meat.'),
+    },
+    'ReturnFeesEnumeration': {
+        'FreeReturn': ('schema:FreeReturn', 'FreeReturn', 'Specifies that product returns are free of charge for the customer.'),
+        'OriginalShippingFees': ('schema:OriginalShippingFees', 'OriginalShippingFees', 'Specifies that the customer must pay the original shipping costs when returning a product.'),
+        'RestockingFees': ('schema:RestockingFees', 'RestockingFees', 'Specifies that the customer must pay a restocking fee when returning a product.'),
+        'ReturnFeesCustomerResponsibility': ('schema:ReturnFeesCustomerResponsibility', 'ReturnFeesCustomerResponsibility', 'Specifies that product returns must be paid for, and are the responsibility of, the customer.'),
+        'ReturnShippingFees': ('schema:ReturnShippingFees', 'ReturnShippingFees', 'Specifies that the customer must pay the return shipping costs when returning a product.'),
+    },
+    'ReturnLabelSourceEnumeration': {
+        'ReturnLabelCustomerResponsibility': ('schema:ReturnLabelCustomerResponsibility', 'ReturnLabelCustomerResponsibility', 'Indicated that creating a return label is the responsibility of the customer.'),
+        'ReturnLabelDownloadAndPrint': ('schema:ReturnLabelDownloadAndPrint', 'ReturnLabelDownloadAndPrint', 'Indicated that a return label must be downloaded and printed by the customer.'),
+        'ReturnLabelInBox': ('schema:ReturnLabelInBox', 'ReturnLabelInBox', 'Specifies that a return label will be provided by the seller in the shipping box.'),
+    },
+    'ReturnMethodEnumeration': {
+        'KeepProduct': ('schema:KeepProduct', 'KeepProduct', 'Specifies that the consumer can keep the product, even when receiving a refund or store credit.'),
+        'ReturnAtKiosk': ('schema:ReturnAtKiosk', 'ReturnAtKiosk', 'Specifies that product returns must be made at a kiosk.'),
+        'ReturnByMail': ('schema:ReturnByMail', 'ReturnByMail', 'Specifies that product returns must be done by mail.'),
+        'ReturnInStore': ('schema:ReturnInStore', 'ReturnInStore', 'Specifies that product returns must be made in a store.'),
+    },
+    'RsvpResponseType': {
+        'RsvpResponseMaybe': ('schema:RsvpResponseMaybe', 'RsvpResponseMaybe', 'The invitee may or may not attend.'),
+        'RsvpResponseNo': ('schema:RsvpResponseNo', 'RsvpResponseNo', 'The invitee will not attend.'),
+        'RsvpResponseYes': ('schema:RsvpResponseYes', 'RsvpResponseYes', 'The invitee will attend.'),
+    },
+    'SizeSystemEnumeration': {
+        'SizeSystemImperial': ('schema:SizeSystemImperial', 'SizeSystemImperial', 'Imperial size system.'),
+        'SizeSystemMetric': ('schema:SizeSystemMetric', 'SizeSystemMetric', 'Metric size system.'),
+    },
+    'SteeringPositionValue': {
+        'LeftHandDriving': ('schema:LeftHandDriving', 'LeftHandDriving', 'The steering position is on the left side of the vehicle (viewed from the main direction of driving).'),
+        'RightHandDriving': ('schema:RightHandDriving', 'RightHandDriving', 'The steering position is on the right side of the vehicle (viewed from the main direction of driving).'),
+    },
+    'TierBenefitEnumeration': {
+        'TierBenefitLoyaltyPoints': ('schema:TierBenefitLoyaltyPoints', 'TierBenefitLoyaltyPoints', 'Benefit of the tier is earning of loyalty points.'),
+        'TierBenefitLoyaltyPrice': ('schema:TierBenefitLoyaltyPrice', 'TierBenefitLoyaltyPrice', 'Benefit of the tier is a members-only price.'),
+        'TierBenefitLoyaltyReturns': ('schema:TierBenefitLoyaltyReturns', 'TierBenefitLoyaltyReturns', 'Benefit of the tier is members-only returns, for example free unlimited returns.'),
+        'TierBenefitLoyaltyShipping': ('schema:TierBenefitLoyaltyShipping', 'TierBenefitLoyaltyShipping', 'Benefit of the tier is a members-only shipping price or speed (for example free shipping or 1-day shipping).'),
+    },
+    'UKNonprofitType': {
+        'CharitableIncorporatedOrganization': ('schema:CharitableIncorporatedOrganization', 'CharitableIncorporatedOrganization', 'CharitableIncorporatedOrganization: Non-profit type referring to a Charitable Incorporated Organization (UK).'),
+        'LimitedByGuaranteeCharity': ('schema:LimitedByGuaranteeCharity', 'LimitedByGuaranteeCharity', 'LimitedByGuaranteeCharity: Non-profit type referring to a charitable company that is limited by guarantee (UK).'),
+        'UKTrust': ('schema:UKTrust', 'UKTrust', 'UKTrust: Non-profit type referring to a UK trust.'),
+        'UnincorporatedAssociationCharity': ('schema:UnincorporatedAssociationCharity', 'UnincorporatedAssociationCharity', 'UnincorporatedAssociationCharity: Non-profit type referring to a charitable company that is not incorporated (UK).'),
+    },
+    'USNonprofitType': {
+        'Nonprofit501a': ('schema:Nonprofit501a', 'Nonprofit501a', 'Nonprofit501a: Non-profit type referring to Farmers’ Cooperative Associations.'),
+        'Nonprofit501c1': ('schema:Nonprofit501c1', 'Nonprofit501c1', 'Nonprofit501c1: Non-profit type referring to Corporations Organized Under Act of Congress, including Federal Credit Unions and National Farm Loan Associations.'),
+        'Nonprofit501c10': ('schema:Nonprofit501c10', 'Nonprofit501c10', 'Nonprofit501c10: Non-profit type referring to Domestic Fraternal Societies and Associations.'),
+        'Nonprofit501c11': ('schema:Nonprofit501c11', 'Nonprofit501c11', "Nonprofit501c11: Non-profit type referring to Teachers' Retirement Fund Associations."),
+        'Nonprofit501c12': ('schema:Nonprofit501c12', 'Nonprofit501c12', 'Nonprofit501c12: Non-profit type referring to Benevolent Life Insurance Associations, Mutual Ditch or Irrigation Companies, Mutual or Cooperative Telephone Companies.'),
+        'Nonprofit501c13': ('schema:Nonprofit501c13', 'Nonprofit501c13', 'Nonprofit501c13: Non-profit type referring to Cemetery Companies.'),
+        'Nonprofit501c14': ('schema:Nonprofit501c14', 'Nonprofit501c14', 'Nonprofit501c14: Non-profit type referring to State-Chartered Credit Unions, Mutual Reserve Funds.'),
+        'Nonprofit501c15': ('schema:Nonprofit501c15', 'Nonprofit501c15', 'Nonprofit501c15: Non-profit type referring to Mutual Insurance Companies or Associations.'),
+        'Nonprofit501c16': ('schema:Nonprofit501c16', 'Nonprofit501c16', 'Nonprofit501c16: Non-profit type referring to Cooperative Organizations to Finance Crop Operations.'),
+        'Nonprofit501c17': ('schema:Nonprofit501c17', 'Nonprofit501c17', 'Nonprofit501c17: Non-profit type referring to Supplemental Unemployment Benefit Trusts.'),
+        'Nonprofit501c18': ('schema:Nonprofit501c18', 'Nonprofit501c18', 'Nonprofit501c18: Non-profit type referring to Employee Funded Pension Trust (created before 25 June 1959).'),
+        'Nonprofit501c19': ('schema:Nonprofit501c19', 'Nonprofit501c19', 'Nonprofit501c19: Non-profit type referring to Post or Organization of Past or Present Members of the Armed Forces.'),
+        'Nonprofit501c2': ('schema:Nonprofit501c2', 'Nonprofit501c2', 'Nonprofit501c2: Non-profit type referring to Title-holding Corporations for Exempt Organizations.'),
+        'Nonprofit501c20': ('schema:Nonprofit501c20', 'Nonprofit501c20', 'Nonprofit501c20: Non-profit type referring to Group Legal Services Plan Organizations.'),
+        'Nonprofit501c21': ('schema:Nonprofit501c21', 'Nonprofit501c21', 'Nonprofit501c21: Non-profit type referring to Black Lung Benefit Trusts.'),
+        'Nonprofit501c22': ('schema:Nonprofit501c22', 'Nonprofit501c22', 'Nonprofit501c22: Non-profit type referring to Withdrawal Liability Payment Funds.'),
+        'Nonprofit501c23': ('schema:Nonprofit501c23', 'Nonprofit501c23', 'Nonprofit501c23: Non-profit type referring to Veterans Organizations.'),
+        'Nonprofit501c24': ('schema:Nonprofit501c24', 'Nonprofit501c24', 'Nonprofit501c24: Non-profit type referring to Section 4049 ERISA Trusts.'),
+        'Nonprofit501c25': ('schema:Nonprofit501c25', 'Nonprofit501c25', 'Nonprofit501c25: Non-profit type referring to Real Property Title-Holding Corporations or Trusts with Multiple Parents.'),
+        'Nonprofit501c26': ('schema:Nonprofit501c26', 'Nonprofit501c26', 'Nonprofit501c26: Non-profit type referring to State-Sponsored Organizations Providing Health Coverage for High-Risk Individuals.'),
+        'Nonprofit501c27': ('schema:Nonprofit501c27', 'Nonprofit501c27', "Nonprofit501c27: Non-profit type referring to State-Sponsored Workers' Compensation Reinsurance Organizations."),
+        'Nonprofit501c28': ('schema:Nonprofit501c28', 'Nonprofit501c28', 'Nonprofit501c28: Non-profit type referring to National Railroad Retirement Investment Trusts.'),
+        'Nonprofit501c3': ('schema:Nonprofit501c3', 'Nonprofit501c3', 'Nonprofit501c3: Non-profit type referring to Religious, Educational, Charitable, Scientific, Literary, Testing for Public Safety, Fostering National or International Amateur Sports Competition, or Prevention of Cruelty to Children or Animals Organizations.'),
+        'Nonprofit501c4': ('schema:Nonprofit501c4', 'Nonprofit501c4', 'Nonprofit501c4: Non-profit type referring to Civic Leagues, Social Welfare Organizations, and Local Associations of Employees.'),
+        'Nonprofit501c5': ('schema:Nonprofit501c5', 'Nonprofit501c5', 'Nonprofit501c5: Non-profit type referring to Labor, Agricultural and Horticultural Organizations.'),
+        'Nonprofit501c6': ('schema:Nonprofit501c6', 'Nonprofit501c6', 'Nonprofit501c6: Non-profit type referring to Business Leagues, Chambers of Commerce, Real Estate Boards.'),
+        'Nonprofit501c7': ('schema:Nonprofit501c7', 'Nonprofit501c7', 'Nonprofit501c7: Non-profit type referring to Social and Recreational Clubs.'),
+        'Nonprofit501c8': ('schema:Nonprofit501c8', 'Nonprofit501c8', 'Nonprofit501c8: Non-profit type referring to Fraternal Beneficiary Societies and Associations.'),
+        'Nonprofit501c9': ('schema:Nonprofit501c9', 'Nonprofit501c9', 'Nonprofit501c9: Non-profit type referring to Voluntary Employee Beneficiary Associations.'),
+        'Nonprofit501d': ('schema:Nonprofit501d', 'Nonprofit501d', 'Nonprofit501d: Non-profit type referring to Religious and Apostolic Associations.'),
+        'Nonprofit501e': ('schema:Nonprofit501e', 'Nonprofit501e', 'Nonprofit501e: Non-profit type referring to Cooperative Hospital Service Organizations.'),
+        'Nonprofit501f': ('schema:Nonprofit501f', 'Nonprofit501f', 'Nonprofit501f: Non-profit type referring to Cooperative Service Organizations.'),
+        'Nonprofit501k': ('schema:Nonprofit501k', 'Nonprofit501k', 'Nonprofit501k: Non-profit type referring to Child Care Organizations.'),
+        'Nonprofit501n': ('schema:Nonprofit501n', 'Nonprofit501n', 'Nonprofit501n: Non-profit type referring to Charitable Risk Pools.'),
+        'Nonprofit501q': ('schema:Nonprofit501q', 'Nonprofit501q', 'Nonprofit501q: Non-profit type referring to Credit Counseling Organizations.'),
+        'Nonprofit527': ('schema:Nonprofit527', 'Nonprofit527', 'Nonprofit527: Non-profit type referring to political organizations.'),
+    },
+    'WearableMeasurementTypeEnumeration': {
+        'WearableMeasurementBack': ('schema:WearableMeasurementBack', 'WearableMeasurementBack', 'Measurement of the back section, for example of a jacket.'),
+        'WearableMeasurementChestOrBust': ('schema:WearableMeasurementChestOrBust', 'WearableMeasurementChestOrBust', 'Measurement of the chest/bust section, for example of a suit.'),
+        'WearableMeasurementCollar': ('schema:WearableMeasurementCollar', 'WearableMeasurementCollar', 'Measurement of the collar, for example of a shirt.'),
+        'WearableMeasurementCup': ('schema:WearableMeasurementCup', 'WearableMeasurementCup', 'Measurement of the cup, for example of a bra.'),
+        'WearableMeasurementHeight': ('schema:WearableMeasurementHeight', 'WearableMeasurementHeight', 'Measurement of the height, for example the heel height of a shoe.'),
+        'WearableMeasurementHips': ('schema:WearableMeasurementHips', 'WearableMeasurementHips', 'Measurement of the hip section, for example of a skirt.'),
+        'WearableMeasurementInseam': ('schema:WearableMeasurementInseam', 'WearableMeasurementInseam', 'Measurement of the inseam, for example of pants.'),
+        'WearableMeasurementLength': ('schema:WearableMeasurementLength', 'WearableMeasurementLength', 'Represents the length, for example of a dress.'),
+        'WearableMeasurementOutsideLeg': ('schema:WearableMeasurementOutsideLeg', 'WearableMeasurementOutsideLeg', 'Measurement of the outside leg, for example of pants.'),
+        'WearableMeasurementSleeve': ('schema:WearableMeasurementSleeve', 'WearableMeasurementSleeve', 'Measurement of the sleeve length, for example of a shirt.'),
+        'WearableMeasurementWaist': ('schema:WearableMeasurementWaist', 'WearableMeasurementWaist', 'Measurement of the waist section, for example of pants.'),
+        'WearableMeasurementWidth': ('schema:WearableMeasurementWidth', 'WearableMeasurementWidth', 'Measurement of the width, for example of shoes.'),
+    },
+    'WearableSizeGroupEnumeration': {
+        'WearableSizeGroupBig': ('schema:WearableSizeGroupBig', 'WearableSizeGroupBig', 'Size group "Big" for wearables.'),
+        'WearableSizeGroupBoys': ('schema:WearableSizeGroupBoys', 'WearableSizeGroupBoys', 'Size group "Boys" for wearables.'),
+        'WearableSizeGroupExtraShort': ('schema:WearableSizeGroupExtraShort', 'WearableSizeGroupExtraShort', 'Size group "Extra Short" for wearables.'),
+        'WearableSizeGroupExtraTall': ('schema:WearableSizeGroupExtraTall', 'WearableSizeGroupExtraTall', 'Size group "Extra Tall" for wearables.'),
+        'WearableSizeGroupGirls': ('schema:WearableSizeGroupGirls', 'WearableSizeGroupGirls', 'Size group "Girls" for wearables.'),
+        'WearableSizeGroupHusky': ('schema:WearableSizeGroupHusky', 'WearableSizeGroupHusky', 'Size group "Husky" (or "Stocky") for wearables.'),
+        'WearableSizeGroupInfants': ('schema:WearableSizeGroupInfants', 'WearableSizeGroupInfants', 'Size group "Infants" for wearables.'),
+        'WearableSizeGroupJuniors': ('schema:WearableSizeGroupJuniors', 'WearableSizeGroupJuniors', 'Size group "Juniors" for wearables.'),
+        'WearableSizeGroupMaternity': ('schema:WearableSizeGroupMaternity', 'WearableSizeGroupMaternity', 'Size group "Maternity" for wearables.'),
+        'WearableSizeGroupMens': ('schema:WearableSizeGroupMens', 'WearableSizeGroupMens', 'Size group "Mens" for wearables.'),
+        'WearableSizeGroupMisses': ('schema:WearableSizeGroupMisses', 'WearableSizeGroupMisses', 'Size group "Misses" (also known as "Missy") for wearables.'),
+        'WearableSizeGroupPetite': ('schema:WearableSizeGroupPetite', 'WearableSizeGroupPetite', 'Size group "Petite" for wearables.'),
+        'WearableSizeGroupPlus': ('schema:WearableSizeGroupPlus', 'WearableSizeGroupPlus', 'Size group "Plus" for wearables.'),
+        'WearableSizeGroupRegular': ('schema:WearableSizeGroupRegular', 'WearableSizeGroupRegular', 'Size group "Regular" for wearables.'),
+        'WearableSizeGroupShort': ('schema:WearableSizeGroupShort', 'WearableSizeGroupShort', 'Size group "Short" for wearables.'),
+        'WearableSizeGroupTall': ('schema:WearableSizeGroupTall', 'WearableSizeGroupTall', 'Size group "Tall" for wearables.'),
+        'WearableSizeGroupWomens': ('schema:WearableSizeGroupWomens', 'WearableSizeGroupWomens', 'Size group "Womens" for wearables.'),
+    },
+    'WearableSizeSystemEnumeration': {
+        'WearableSizeSystemAU': ('schema:WearableSizeSystemAU', 'WearableSizeSystemAU', 'Australian size system for wearables.'),
+        'WearableSizeSystemBR': ('schema:WearableSizeSystemBR', 'WearableSizeSystemBR', 'Brazilian size system for wearables.'),
+        'WearableSizeSystemCN': ('schema:WearableSizeSystemCN', 'WearableSizeSystemCN', 'Chinese size system for wearables.'),
+        'WearableSizeSystemContinental': ('schema:WearableSizeSystemContinental', 'WearableSizeSystemContinental', 'Continental size system for wearables.'),
+        'WearableSizeSystemDE': ('schema:WearableSizeSystemDE', 'WearableSizeSystemDE', 'German size system for wearables.'),
+        'WearableSizeSystemEN13402': ('schema:WearableSizeSystemEN13402', 'WearableSizeSystemEN13402', 'EN 13402 (joint European standard for size labelling of clothes).'),
+        'WearableSizeSystemEurope': ('schema:WearableSizeSystemEurope', 'WearableSizeSystemEurope', 'European size system for wearables.'),
+        'WearableSizeSystemFR': ('schema:WearableSizeSystemFR', 'WearableSizeSystemFR', 'French size system for wearables.'),
+        'WearableSizeSystemGS1': ('schema:WearableSizeSystemGS1', 'WearableSizeSystemGS1', 'GS1 (formerly NRF) size system for wearables.'),
+        'WearableSizeSystemIT': ('schema:WearableSizeSystemIT', 'WearableSizeSystemIT', 'Italian size system for wearables.'),
+        'WearableSizeSystemJP': ('schema:WearableSizeSystemJP', 'WearableSizeSystemJP', 'Japanese size system for wearables.'),
+        'WearableSizeSystemMX': ('schema:WearableSizeSystemMX', 'WearableSizeSystemMX', 'Mexican size system for wearables.'),
+        'WearableSizeSystemUK': ('schema:WearableSizeSystemUK', 'WearableSizeSystemUK', 'United Kingdom size system for wearables.'),
+        'WearableSizeSystemUS': ('schema:WearableSizeSystemUS', 'WearableSizeSystemUS', 'United States size system for wearables.'),
+    },
+}
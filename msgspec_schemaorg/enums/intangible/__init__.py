@@ -1,80 +1,250 @@
 """Schema.org intangible enumeration types."""
 
-from .PriceTypeEnumeration import PriceTypeEnumeration
-from .MedicalSpecialty import MedicalSpecialty
-from .BodyMeasurementTypeEnumeration import BodyMeasurementTypeEnumeration
-from .USNonprofitType import USNonprofitType
-from .PaymentMethodType import PaymentMethodType
-from .WearableSizeSystemEnumeration import WearableSizeSystemEnumeration
-from .MedicalTrialDesign import MedicalTrialDesign
-from .IncentiveQualifiedExpenseType import IncentiveQualifiedExpenseType
-from .PurchaseType import PurchaseType
-from .TierBenefitEnumeration import TierBenefitEnumeration
-from .GenderType import GenderType
-from .GameServerStatus import GameServerStatus
-from .BookFormatType import BookFormatType
-from .PhysicalExam import PhysicalExam
-from .IPTCDigitalSourceEnumeration import IPTCDigitalSourceEnumeration
-from .LegalForceStatus import LegalForceStatus
-from .DriveWheelConfigurationValue import DriveWheelConfigurationValue
-from .HealthAspectEnumeration import HealthAspectEnumeration
-from .RestrictedDiet import RestrictedDiet
-from .SteeringPositionValue import SteeringPositionValue
-from .DeliveryMethod import DeliveryMethod
-from .InfectiousAgentClass import InfectiousAgentClass
-from .GovernmentBenefitsType import GovernmentBenefitsType
-from .AdultOrientedEnumeration import AdultOrientedEnumeration
-from .MediaManipulationRatingEnumeration import MediaManipulationRatingEnumeration
-from .ItemAvailability import ItemAvailability
-from .CertificationStatusEnumeration import CertificationStatusEnumeration
-from .MusicAlbumProductionType import MusicAlbumProductionType
-from .MedicineSystem import MedicineSystem
-from .WearableMeasurementTypeEnumeration import WearableMeasurementTypeEnumeration
-from .DrugPregnancyCategory import DrugPregnancyCategory
-from .WearableSizeGroupEnumeration import WearableSizeGroupEnumeration
-from .PriceComponentTypeEnumeration import PriceComponentTypeEnumeration
-from .MusicReleaseFormatType import MusicReleaseFormatType
-from .LegalValueLevel import LegalValueLevel
-from .DigitalPlatformEnumeration import DigitalPlatformEnumeration
-from .ReturnMethodEnumeration import ReturnMethodEnumeration
-from .DigitalDocumentPermissionType import DigitalDocumentPermissionType
-from .ReturnFeesEnumeration import ReturnFeesEnumeration
-from .EventAttendanceModeEnumeration import EventAttendanceModeEnumeration
-from .FulfillmentTypeEnumeration import FulfillmentTypeEnumeration
-from .DrugPrescriptionStatus import DrugPrescriptionStatus
-from .RefundTypeEnumeration import RefundTypeEnumeration
-from .EventStatusType import EventStatusType
-from .ReservationStatusType import ReservationStatusType
-from .DayOfWeek import DayOfWeek
-from .ItemListOrderType import ItemListOrderType
-from .EUEnergyEfficiencyEnumeration import EUEnergyEfficiencyEnumeration
-from .UKNonprofitType import UKNonprofitType
-from .OrderStatus import OrderStatus
-from .IncentiveType import IncentiveType
-from .MedicalStudyStatus import MedicalStudyStatus
-from .GameAvailabilityEnumeration import GameAvailabilityEnumeration
-from .ContactPointOption import ContactPointOption
-from .MerchantReturnEnumeration import MerchantReturnEnumeration
-from .ReturnLabelSourceEnumeration import ReturnLabelSourceEnumeration
-from .MedicalObservationalStudyDesign import MedicalObservationalStudyDesign
-from .MedicalImagingTechnique import MedicalImagingTechnique
-from .OfferItemCondition import OfferItemCondition
-from .PaymentStatusType import PaymentStatusType
-from .NLNonprofitType import NLNonprofitType
-from .MapCategoryType import MapCategoryType
-from .IncentiveStatus import IncentiveStatus
-from .RsvpResponseType import RsvpResponseType
-from .SizeSystemEnumeration import SizeSystemEnumeration
-from .ActionStatusType import ActionStatusType
-from .EnergyStarEnergyEfficiencyEnumeration import EnergyStarEnergyEfficiencyEnumeration
-from .MedicalDevicePurpose import MedicalDevicePurpose
-from .MedicalProcedureType import MedicalProcedureType
-from .CarUsageType import CarUsageType
-from .MusicAlbumReleaseType import MusicAlbumReleaseType
-from .GamePlayMode import GamePlayMode
-from .BoardingPolicyType import BoardingPolicyType
-from .PhysicalActivityCategory import PhysicalActivityCategory
-from .MedicalAudienceType import MedicalAudienceType
-from .MeasurementMethodEnum import MeasurementMethodEnum
-from .MedicalEvidenceLevel import MedicalEvidenceLevel
-from .DrugCostCategory import DrugCostCategory
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .ActionStatusType import ActionStatusType
+    from .AdultOrientedEnumeration import AdultOrientedEnumeration
+    from .BoardingPolicyType import BoardingPolicyType
+    from .BodyMeasurementTypeEnumeration import BodyMeasurementTypeEnumeration
+    from .BookFormatType import BookFormatType
+    from .CarUsageType import CarUsageType
+    from .CertificationStatusEnumeration import CertificationStatusEnumeration
+    from .ContactPointOption import ContactPointOption
+    from .DayOfWeek import DayOfWeek
+    from .DeliveryMethod import DeliveryMethod
+    from .DigitalDocumentPermissionType import DigitalDocumentPermissionType
+    from .DigitalPlatformEnumeration import DigitalPlatformEnumeration
+    from .DriveWheelConfigurationValue import DriveWheelConfigurationValue
+    from .DrugCostCategory import DrugCostCategory
+    from .DrugPregnancyCategory import DrugPregnancyCategory
+    from .DrugPrescriptionStatus import DrugPrescriptionStatus
+    from .EUEnergyEfficiencyEnumeration import EUEnergyEfficiencyEnumeration
+    from .EnergyStarEnergyEfficiencyEnumeration import EnergyStarEnergyEfficiencyEnumeration
+    from .EventAttendanceModeEnumeration import EventAttendanceModeEnumeration
+    from .EventStatusType import EventStatusType
+    from .FulfillmentTypeEnumeration import FulfillmentTypeEnumeration
+    from .GameAvailabilityEnumeration import GameAvailabilityEnumeration
+    from .GamePlayMode import GamePlayMode
+    from .GameServerStatus import GameServerStatus
+    from .GenderType import GenderType
+    from .GovernmentBenefitsType import GovernmentBenefitsType
+    from .HealthAspectEnumeration import HealthAspectEnumeration
+    from .IPTCDigitalSourceEnumeration import IPTCDigitalSourceEnumeration
+    from .IncentiveQualifiedExpenseType import IncentiveQualifiedExpenseType
+    from .IncentiveStatus import IncentiveStatus
+    from .IncentiveType import IncentiveType
+    from .InfectiousAgentClass import InfectiousAgentClass
+    from .ItemAvailability import ItemAvailability
+    from .ItemListOrderType import ItemListOrderType
+    from .LegalForceStatus import LegalForceStatus
+    from .LegalValueLevel import LegalValueLevel
+    from .MapCategoryType import MapCategoryType
+    from .MeasurementMethodEnum import MeasurementMethodEnum
+    from .MediaManipulationRatingEnumeration import MediaManipulationRatingEnumeration
+    from .MedicalAudienceType import MedicalAudienceType
+    from .MedicalDevicePurpose import MedicalDevicePurpose
+    from .MedicalEvidenceLevel import MedicalEvidenceLevel
+    from .MedicalImagingTechnique import MedicalImagingTechnique
+    from .MedicalObservationalStudyDesign import MedicalObservationalStudyDesign
+    from .MedicalProcedureType import MedicalProcedureType
+    from .MedicalSpecialty import MedicalSpecialty
+    from .MedicalStudyStatus import MedicalStudyStatus
+    from .MedicalTrialDesign import MedicalTrialDesign
+    from .MedicineSystem import MedicineSystem
+    from .MerchantReturnEnumeration import MerchantReturnEnumeration
+    from .MusicAlbumProductionType import MusicAlbumProductionType
+    from .MusicAlbumReleaseType import MusicAlbumReleaseType
+    from .MusicReleaseFormatType import MusicReleaseFormatType
+    from .NLNonprofitType import NLNonprofitType
+    from .OfferItemCondition import OfferItemCondition
+    from .OrderStatus import OrderStatus
+    from .PaymentMethodType import PaymentMethodType
+    from .PaymentStatusType import PaymentStatusType
+    from .PhysicalActivityCategory import PhysicalActivityCategory
+    from .PhysicalExam import PhysicalExam
+    from .PriceComponentTypeEnumeration import PriceComponentTypeEnumeration
+    from .PriceTypeEnumeration import PriceTypeEnumeration
+    from .PurchaseType import PurchaseType
+    from .RefundTypeEnumeration import RefundTypeEnumeration
+    from .ReservationStatusType import ReservationStatusType
+    from .RestrictedDiet import RestrictedDiet
+    from .ReturnFeesEnumeration import ReturnFeesEnumeration
+    from .ReturnLabelSourceEnumeration import ReturnLabelSourceEnumeration
+    from .ReturnMethodEnumeration import ReturnMethodEnumeration
+    from .RsvpResponseType import RsvpResponseType
+    from .SizeSystemEnumeration import SizeSystemEnumeration
+    from .SteeringPositionValue import SteeringPositionValue
+    from .TierBenefitEnumeration import TierBenefitEnumeration
+    from .UKNonprofitType import UKNonprofitType
+    from .USNonprofitType import USNonprofitType
+    from .WearableMeasurementTypeEnumeration import WearableMeasurementTypeEnumeration
+    from .WearableSizeGroupEnumeration import WearableSizeGroupEnumeration
+    from .WearableSizeSystemEnumeration import WearableSizeSystemEnumeration
+
+__all__ = [
+    'ActionStatusType',
+    'AdultOrientedEnumeration',
+    'BoardingPolicyType',
+    'BodyMeasurementTypeEnumeration',
+    'BookFormatType',
+    'CarUsageType',
+    'CertificationStatusEnumeration',
+    'ContactPointOption',
+    'DayOfWeek',
+    'DeliveryMethod',
+    'DigitalDocumentPermissionType',
+    'DigitalPlatformEnumeration',
+    'DriveWheelConfigurationValue',
+    'DrugCostCategory',
+    'DrugPregnancyCategory',
+    'DrugPrescriptionStatus',
+    'EUEnergyEfficiencyEnumeration',
+    'EnergyStarEnergyEfficiencyEnumeration',
+    'EventAttendanceModeEnumeration',
+    'EventStatusType',
+    'FulfillmentTypeEnumeration',
+    'GameAvailabilityEnumeration',
+    'GamePlayMode',
+    'GameServerStatus',
+    'GenderType',
+    'GovernmentBenefitsType',
+    'HealthAspectEnumeration',
+    'IPTCDigitalSourceEnumeration',
+    'IncentiveQualifiedExpenseType',
+    'IncentiveStatus',
+    'IncentiveType',
+    'InfectiousAgentClass',
+    'ItemAvailability',
+    'ItemListOrderType',
+    'LegalForceStatus',
+    'LegalValueLevel',
+    'MapCategoryType',
+    'MeasurementMethodEnum',
+    'MediaManipulationRatingEnumeration',
+    'MedicalAudienceType',
+    'MedicalDevicePurpose',
+    'MedicalEvidenceLevel',
+    'MedicalImagingTechnique',
+    'MedicalObservationalStudyDesign',
+    'MedicalProcedureType',
+    'MedicalSpecialty',
+    'MedicalStudyStatus',
+    'MedicalTrialDesign',
+    'MedicineSystem',
+    'MerchantReturnEnumeration',
+    'MusicAlbumProductionType',
+    'MusicAlbumReleaseType',
+    'MusicReleaseFormatType',
+    'NLNonprofitType',
+    'OfferItemCondition',
+    'OrderStatus',
+    'PaymentMethodType',
+    'PaymentStatusType',
+    'PhysicalActivityCategory',
+    'PhysicalExam',
+    'PriceComponentTypeEnumeration',
+    'PriceTypeEnumeration',
+    'PurchaseType',
+    'RefundTypeEnumeration',
+    'ReservationStatusType',
+    'RestrictedDiet',
+    'ReturnFeesEnumeration',
+    'ReturnLabelSourceEnumeration',
+    'ReturnMethodEnumeration',
+    'RsvpResponseType',
+    'SizeSystemEnumeration',
+    'SteeringPositionValue',
+    'TierBenefitEnumeration',
+    'UKNonprofitType',
+    'USNonprofitType',
+    'WearableMeasurementTypeEnumeration',
+    'WearableSizeGroupEnumeration',
+    'WearableSizeSystemEnumeration',
+]
+
+install_lazy_module(
+    __name__,
+    {
+        'ActionStatusType': 'ActionStatusType',
+        'AdultOrientedEnumeration': 'AdultOrientedEnumeration',
+        'BoardingPolicyType': 'BoardingPolicyType',
+        'BodyMeasurementTypeEnumeration': 'BodyMeasurementTypeEnumeration',
+        'BookFormatType': 'BookFormatType',
+        'CarUsageType': 'CarUsageType',
+        'CertificationStatusEnumeration': 'CertificationStatusEnumeration',
+        'ContactPointOption': 'ContactPointOption',
+        'DayOfWeek': 'DayOfWeek',
+        'DeliveryMethod': 'DeliveryMethod',
+        'DigitalDocumentPermissionType': 'DigitalDocumentPermissionType',
+        'DigitalPlatformEnumeration': 'DigitalPlatformEnumeration',
+        'DriveWheelConfigurationValue': 'DriveWheelConfigurationValue',
+        'DrugCostCategory': 'DrugCostCategory',
+        'DrugPregnancyCategory': 'DrugPregnancyCategory',
+        'DrugPrescriptionStatus': 'DrugPrescriptionStatus',
+        'EUEnergyEfficiencyEnumeration': 'EUEnergyEfficiencyEnumeration',
+        'EnergyStarEnergyEfficiencyEnumeration': 'EnergyStarEnergyEfficiencyEnumeration',
+        'EventAttendanceModeEnumeration': 'EventAttendanceModeEnumeration',
+        'EventStatusType': 'EventStatusType',
+        'FulfillmentTypeEnumeration': 'FulfillmentTypeEnumeration',
+        'GameAvailabilityEnumeration': 'GameAvailabilityEnumeration',
+        'GamePlayMode': 'GamePlayMode',
+        'GameServerStatus': 'GameServerStatus',
+        'GenderType': 'GenderType',
+        'GovernmentBenefitsType': 'GovernmentBenefitsType',
+        'HealthAspectEnumeration': 'HealthAspectEnumeration',
+        'IPTCDigitalSourceEnumeration': 'IPTCDigitalSourceEnumeration',
+        'IncentiveQualifiedExpenseType': 'IncentiveQualifiedExpenseType',
+        'IncentiveStatus': 'IncentiveStatus',
+        'IncentiveType': 'IncentiveType',
+        'InfectiousAgentClass': 'InfectiousAgentClass',
+        'ItemAvailability': 'ItemAvailability',
+        'ItemListOrderType': 'ItemListOrderType',
+        'LegalForceStatus': 'LegalForceStatus',
+        'LegalValueLevel': 'LegalValueLevel',
+        'MapCategoryType': 'MapCategoryType',
+        'MeasurementMethodEnum': 'MeasurementMethodEnum',
+        'MediaManipulationRatingEnumeration': 'MediaManipulationRatingEnumeration',
+        'MedicalAudienceType': 'MedicalAudienceType',
+        'MedicalDevicePurpose': 'MedicalDevicePurpose',
+        'MedicalEvidenceLevel': 'MedicalEvidenceLevel',
+        'MedicalImagingTechnique': 'MedicalImagingTechnique',
+        'MedicalObservationalStudyDesign': 'MedicalObservationalStudyDesign',
+        'MedicalProcedureType': 'MedicalProcedureType',
+        'MedicalSpecialty': 'MedicalSpecialty',
+        'MedicalStudyStatus': 'MedicalStudyStatus',
+        'MedicalTrialDesign': 'MedicalTrialDesign',
+        'MedicineSystem': 'MedicineSystem',
+        'MerchantReturnEnumeration': 'MerchantReturnEnumeration',
+        'MusicAlbumProductionType': 'MusicAlbumProductionType',
+        'MusicAlbumReleaseType': 'MusicAlbumReleaseType',
+        'MusicReleaseFormatType': 'MusicReleaseFormatType',
+        'NLNonprofitType': 'NLNonprofitType',
+        'OfferItemCondition': 'OfferItemCondition',
+        'OrderStatus': 'OrderStatus',
+        'PaymentMethodType': 'PaymentMethodType',
+        'PaymentStatusType': 'PaymentStatusType',
+        'PhysicalActivityCategory': 'PhysicalActivityCategory',
+        'PhysicalExam': 'PhysicalExam',
+        'PriceComponentTypeEnumeration': 'PriceComponentTypeEnumeration',
+        'PriceTypeEnumeration': 'PriceTypeEnumeration',
+        'PurchaseType': 'PurchaseType',
+        'RefundTypeEnumeration': 'RefundTypeEnumeration',
+        'ReservationStatusType': 'ReservationStatusType',
+        'RestrictedDiet': 'RestrictedDiet',
+        'ReturnFeesEnumeration': 'ReturnFeesEnumeration',
+        'ReturnLabelSourceEnumeration': 'ReturnLabelSourceEnumeration',
+        'ReturnMethodEnumeration': 'ReturnMethodEnumeration',
+        'RsvpResponseType': 'RsvpResponseType',
+        'SizeSystemEnumeration': 'SizeSystemEnumeration',
+        'SteeringPositionValue': 'SteeringPositionValue',
+        'TierBenefitEnumeration': 'TierBenefitEnumeration',
+        'UKNonprofitType': 'UKNonprofitType',
+        'USNonprofitType': 'USNonprofitType',
+        'WearableMeasurementTypeEnumeration': 'WearableMeasurementTypeEnumeration',
+        'WearableSizeGroupEnumeration': 'WearableSizeGroupEnumeration',
+        'WearableSizeSystemEnumeration': 'WearableSizeSystemEnumeration',
+    },
+)
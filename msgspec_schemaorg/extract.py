@@ -0,0 +1,219 @@
+"""
+Extraction of JSON-LD script blocks from HTML pages.
+
+Pages are scanned as bytes without parsing the HTML: the scanner searches for
+the ``ld+json`` media type, checks that it is the type attribute of a
+``<script>`` tag, and slices the script content up to the closing tag. Blocks
+are returned as memoryview slices of the page, so they are decoded without
+copying them. Only blocks whose JSON is written with HTML entities, which
+some templates produce, are unescaped into a copy.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Any, Iterator, List, Union
+
+import msgspec
+
+from .codecs import get_decoder
+from .decode import get_default_decoder
+from .graph import Graph
+
+# Spellings of the media type searched for once the quick scan gives up.
+# MIME types are case-insensitive, but pages write them in lower case, or
+# rarely in upper case.
+_MEDIA_TYPES = (b"ld+json", b"LD+JSON")
+
+# Number of "+" not starting the media type after which the quick scan gives up
+_QUICK_SCAN_LIMIT = 64
+
+# A script start tag whose type attribute is application/ld+json, in any
+# position among the other attributes, quoted or not
+_SCRIPT_TAG = re.compile(
+    rb"""<script\s(?:[^>"']|"[^"]*"|'[^']*')*?(?<![\w-])type\s*=\s*"""
+    rb"""(?:"\s*application/ld\+json\s*(?:;[^"]*)?"|'\s*application/ld\+json\s*(?:;[^']*)?'"""
+    rb"""|application/ld\+json(?=[\s;>/]))(?:[^>"']|"[^"]*"|'[^']*')*>""",
+    re.IGNORECASE,
+)
+
+# Whitespace, and comment or CDATA wrappers around the JSON, at the start of
+# a block. The end is stripped by _block_end(), as searching backwards with a
+# regular expression tries every position.
+_BLOCK_START = re.compile(rb"\s*(?:<!--|(?://|/\*)?\s*<!\[CDATA\[(?:\s*\*/)?)?\s*")
+_BLOCK_END_SIZE = 32
+
+
+def _block_end(data: bytes, start: int, end: int) -> int:
+    # The last bytes are enough to hold any wrapper end
+    tail = data[max(start, end - _BLOCK_END_SIZE) : end]
+    size = len(tail)
+    tail = tail.rstrip()
+    if tail.endswith(b"*/") and tail[:-2].rstrip().endswith(b"]]>"):
+        tail = tail[:-2].rstrip()
+    if tail.endswith(b"-->"):
+        tail = tail[:-3].rstrip()
+    elif tail.endswith(b"]]>"):
+        tail = tail[:-3].rstrip()
+        if tail.endswith((b"//", b"/*")):
+            tail = tail[:-2].rstrip()
+    return end - size + len(tail)
+
+
+def _script_end(data: bytes, start: int) -> int:
+    # Script content ends at the first closing script tag, whatever its case.
+    # Other closing tags may appear in the JSON strings.
+    end = data.find(b"</", start)
+    while end >= 0 and data[end + 2 : end + 8].lower() != b"script":
+        end = data.find(b"</", end + 2)
+    return end if end >= 0 else len(data)
+
+
+def _media_type_positions(data: bytes) -> Iterator[int]:
+    """Yield the positions of the ld+json media type, in page order."""
+    # A single byte is found with memchr, many times faster than the media
+    # type itself, and "+" is rare outside scripts. Pages whose scripts use
+    # it a lot are searched for the usual spellings of the media type instead.
+    position = data.find(b"+", 2)
+    misses = 0
+    while position >= 0:
+        if data[position - 2 : position + 5].lower() == b"ld+json":
+            yield position - 2
+        else:
+            misses += 1
+            if misses > _QUICK_SCAN_LIMIT:
+                break
+        position = data.find(b"+", position + 1)
+    else:
+        return
+
+    positions = []
+    for media_type in _MEDIA_TYPES:
+        found = data.find(media_type, position - 2)
+        while found >= 0:
+            positions.append(found)
+            found = data.find(media_type, found + len(media_type))
+    yield from sorted(positions)
+
+
+def _iter_blocks(data: bytes) -> Iterator[tuple]:
+    """Yield the start and end offsets of the content of ld+json scripts."""
+    end = 0
+    for position in _media_type_positions(data):
+        if position < end:
+            continue
+        tag_start = data.rfind(b"<", end, position)
+        match = _SCRIPT_TAG.match(data, tag_start) if tag_start >= 0 else None
+        # The media type must be inside the tag, not in text or code after it
+        if match is None or match.end() <= position:
+            continue
+
+        start = match.end()
+        end = _script_end(data, start)
+        yield start, end
+
+
+def iter_json_ld(page: Union[bytes, bytearray, memoryview, str]) -> Iterator[Any]:
+    """
+    Find the JSON-LD script blocks of an HTML page.
+
+    Script tags are recognized by their ``type="application/ld+json"``
+    attribute wherever it is among the other attributes, with or without
+    quotes and with optional parameters. Whitespace and ``<!-- -->`` or
+    ``<![CDATA[ ]]>`` wrappers around the JSON are removed, and empty blocks
+    are skipped.
+
+    Args:
+        page: The HTML page. Text is encoded as UTF-8 first.
+
+    Yields:
+        The JSON of each block in page order: a memoryview slice of the page,
+        or, for a block written with HTML entities, the unescaped bytes
+    """
+    if isinstance(page, str):
+        page = page.encode("utf-8")
+    view = memoryview(page).cast("B")
+    # Searching needs bytes, other buffers are copied for it
+    data = page if isinstance(page, (bytes, bytearray)) else view.tobytes()
+
+    for start, end in _iter_blocks(data):
+        start = _BLOCK_START.match(data, start, end).end()
+        end = _block_end(data, start, end)
+        if start >= end:
+            continue
+
+        block = view[start:end]
+        # JSON holding no quotes but an entity was escaped as HTML text
+        if data.find(b'"', start, end) < 0 and data.find(b"&", start, end) >= 0:
+            yield html.unescape(str(block, "utf-8")).encode("utf-8")
+        else:
+            yield block
+
+
+def extract_json_ld(
+    page: Union[bytes, bytearray, memoryview, str],
+    type: Any = None,
+    skip_invalid: bool = False,
+) -> List[Any]:
+    """
+    Extract and decode the JSON-LD of an HTML page.
+
+    Each block is decoded straight from the page, see iter_json_ld(). Blocks
+    holding an array of objects or a ``@graph`` document give one object per
+    node.
+
+    Args:
+        page: The HTML page
+        type: Type to decode each object into. If None, each object is
+            decoded into the model class named by its @type, as with
+            decode_any, and @graph documents are decoded as with Graph.decode
+        skip_invalid: Skip blocks that are not valid JSON, and objects and
+            @graph nodes that do not match the models, instead of raising
+
+    Returns:
+        The decoded objects of all blocks, in page order
+
+    Raises:
+        msgspec.DecodeError: If a block cannot be decoded and skip_invalid
+            is not set
+    """
+    objects: List[Any] = []
+    if type is None:
+        decode = get_default_decoder().decode
+    else:
+        decode = get_decoder(type).decode
+
+    for block in iter_json_ld(page):
+        try:
+            if block[:1] == b"[":
+                # Objects are skipped one by one, so an invalid object
+                # leaves no part of the array behind it in the result
+                for raw in _raw_list_decoder.decode(block):
+                    try:
+                        objects.append(decode(raw))
+                    except msgspec.ValidationError:
+                        if not skip_invalid:
+                            raise
+                continue
+            try:
+                objects.append(decode(block))
+            except msgspec.ValidationError:
+                # Documents of a @graph have no @type of their own
+                if type is not None or _graph_decoder.decode(block).graph is None:
+                    raise
+                objects.extend(Graph.decode(block, skip_invalid=skip_invalid).nodes)
+        except msgspec.DecodeError:
+            if not skip_invalid:
+                raise
+    return objects
+
+
+class _GraphHeader(msgspec.Struct):
+    """Top level of a JSON-LD document, with the nodes left undecoded."""
+
+    graph: Any = msgspec.field(default=None, name="@graph")
+
+
+_raw_list_decoder = msgspec.json.Decoder(List[msgspec.Raw])
+_graph_decoder = msgspec.json.Decoder(_GraphHeader)
@@ -4,11 +4,16 @@ Core logic for processing Schema.org definitions and generating msgspec.Struct c
 
 from __future__ import annotations
 
+import ast
 import re
 import os
+import json
+import hashlib
 import keyword
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional, Union
+from typing import Dict, List, Set, Any, Optional, Tuple, Union
 from collections import defaultdict
 
 from .mapping import resolve_type_reference, get_type_specificity
@@ -25,14 +30,45 @@ class SchemaProcessor:
     # The root type in Schema.org, where we'll start inheritance from SchemaOrgBase
     ROOT_TYPE = "http://schema.org/Thing"
 
-    def __init__(self, schema_data: Dict[str, Any]):
+    # Classes whose subclasses are enumerations
+    ENUMERATION_TYPES = {"schema:Enumeration", "http://schema.org/Enumeration"}
+
+    # Annotation of references to classes left out by an include list
+    EXCLUDED_REFERENCE_TYPE = "Dict[str, Any]"
+
+    # Output layouts of generate_all_structs
+    LAYOUTS = ("files", "categories", "bundle")
+
+    # Module of the whole vocabulary in the bundle layout
+    BUNDLE_MODULE = "_bundle"
+
+    def __init__(
+        self,
+        schema_data: Dict[str, Any],
+        use_enums: bool = False,
+        include: Optional[List[str]] = None,
+        include_depth: Optional[int] = None,
+    ):
         """
         Initialize with schema data.
 
         Args:
             schema_data: The loaded JSON-LD Schema.org data
+            use_enums: Reference enumeration types that have members from the
+                generated enums package instead of generating Struct classes
+                for them
+            include: Names or IDs of the classes to generate. Their parents and
+                the classes their properties refer to are generated as well.
+                All classes are generated if None.
+            include_depth: Number of property references followed from the
+                included classes, unlimited if None. Classes beyond it are
+                not generated and references to them are collapsed.
+
+        Raises:
+            ValueError: If an included class is not in the schema
         """
         self.schema_data = schema_data
+        self.use_enums = use_enums
         self.graph = schema_data.get("@graph", [])
 
         # Index entities by ID for quick lookup
@@ -68,10 +104,16 @@ class SchemaProcessor:
         # Store normalized class names
         self.normalized_class_names: Dict[str, str] = {}
 
+        # Reverse index of normalized class names to class IDs
+        self.class_ids_by_name: Dict[str, str] = {}
+
         # First, collect all classes and properties
         self.classes = self._collect_classes()
         self.properties = self._collect_properties()
 
+        # Index the properties by the classes in their domain
+        self.domain_properties = self._index_domain_properties()
+
         # Process immediate parents for all classes (for inheritance)
         self._process_immediate_parents()
 
@@ -84,9 +126,20 @@ class SchemaProcessor:
         # Normalize all class names for consistency
         self._normalize_all_class_names()
 
+        # Find the members of enumeration types
+        self.enum_members = self._collect_enum_members()
+
+        # Module defining each class, in the models or the enums package
+        self.class_modules = self._determine_class_modules()
+
         # Analyze dependencies between classes
         self._analyze_dependencies()
 
+        # Classes to generate, None for all
+        self.included_classes: Optional[Set[str]] = None
+        if include is not None:
+            self.included_classes = self._compute_closure(include, include_depth)
+
         # Detect circular dependencies
         self.circular_dependencies = self._detect_circular_dependencies()
 
@@ -108,6 +161,214 @@ class SchemaProcessor:
                     classes[class_id] = entity
         return classes
 
+    def _collect_enum_members(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find the member values of all enumeration types.
+
+        Returns:
+            Dictionary mapping the IDs of enumeration types that have members
+            to their members' id, label and comment, in schema order
+        """
+        # Members refer to their type by full ID or by short name
+        enum_ids_by_type: Dict[str, List[str]] = defaultdict(list)
+        for class_id in self.classes:
+            if self.ENUMERATION_TYPES.intersection(self._get_parent_classes(class_id)):
+                enum_ids_by_type[class_id].append(class_id)
+                enum_ids_by_type[self._get_type_tag(class_id)].append(class_id)
+
+        enum_members: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for entity in self.graph:
+            entity_id = entity.get("@id", "")
+            entity_types = entity.get("@type")
+            if not entity_id or not entity_types:
+                continue
+            if not isinstance(entity_types, list):
+                entity_types = [entity_types]
+
+            found = set()
+            for entity_type in entity_types:
+                if not isinstance(entity_type, str):
+                    continue
+                for enum_id in enum_ids_by_type.get(entity_type, ()):
+                    if enum_id not in found:
+                        found.add(enum_id)
+                        enum_members[enum_id].append(
+                            {
+                                "id": entity_id,
+                                "label": entity.get("rdfs:label", ""),
+                                "comment": entity.get("rdfs:comment", ""),
+                            }
+                        )
+        return dict(enum_members)
+
+    def _determine_class_modules(self) -> Dict[str, str]:
+        """
+        Determine the module that defines each class.
+
+        Returns:
+            Dictionary mapping class IDs to fully qualified module names
+        """
+        class_modules = {}
+        for class_id, class_name in self.normalized_class_names.items():
+            category = self.class_categories.get(class_id, "misc")
+            package = "enums" if self.is_enum_class(class_id) else "models"
+            class_modules[class_id] = f"msgspec_schemaorg.{package}.{category}.{class_name}"
+        return class_modules
+
+    def _find_class_id(self, name: str) -> str:
+        """
+        Find the ID of a class from its name, label or ID.
+
+        Args:
+            name: Normalized class name, Schema.org label or class ID
+
+        Returns:
+            The class ID
+
+        Raises:
+            ValueError: If no class matches
+        """
+        if name in self.classes:
+            return name
+        if name in self.class_ids_by_name:
+            return self.class_ids_by_name[name]
+        for class_id in self.classes:
+            if self._get_type_tag(class_id) == name:
+                return class_id
+        raise ValueError(f"Unknown Schema.org class {name!r}")
+
+    def _compute_closure(
+        self, include: List[str], max_depth: Optional[int] = None
+    ) -> Set[str]:
+        """
+        Find the classes needed by a set of classes.
+
+        Args:
+            include: Names or IDs of the requested classes
+            max_depth: Number of property references to follow, unlimited if None
+
+        Returns:
+            IDs of the requested classes, their parents and, transitively, the
+            classes referenced by their properties
+        """
+        closure: Set[str] = set()
+        level = [self._find_class_id(name) for name in include]
+        depth = 0
+        while level:
+            # Parents are always needed, so they belong to the same level
+            current = []
+            while level:
+                class_id = level.pop()
+                if class_id in closure:
+                    continue
+                closure.add(class_id)
+                # Enums are generated on their own, without parents or fields
+                if self.is_enum_class(class_id):
+                    continue
+                current.append(class_id)
+                parent_id = self.immediate_parents.get(class_id)
+                if parent_id in self.classes:
+                    level.append(parent_id)
+
+            if max_depth is not None and depth >= max_depth:
+                break
+            depth += 1
+            for class_id in current:
+                level.extend(
+                    dep_id
+                    for dep_id in self.class_dependencies.get(class_id, ())
+                    if dep_id not in closure
+                )
+        return closure
+
+    def is_included(self, class_id: str) -> bool:
+        """
+        Check whether a class is generated with the current include list.
+
+        Args:
+            class_id: ID of the class
+
+        Returns:
+            True if no include list was given or the class is in its closure
+        """
+        return self.included_classes is None or class_id in self.included_classes
+
+    def _collapse_excluded_types(self, types: List[Any]) -> List[Any]:
+        """
+        Replace references to classes outside the include closure.
+
+        Excluded enumerations become plain strings. If a property refers to an
+        excluded model class, all its model classes are replaced with a plain
+        dictionary: msgspec cannot combine a dict with Structs in one union,
+        and a Struct fallback such as Thing would reject the @type of the
+        excluded classes when decoding.
+
+        Args:
+            types: Types of a property
+
+        Returns:
+            The types with excluded classes replaced
+        """
+        if self.included_classes is None:
+            return types
+
+        class_ids = {
+            typ: self.class_ids_by_name[typ]
+            for typ in types
+            if isinstance(typ, str) and typ in self.class_ids_by_name
+        }
+        excluded = {
+            typ for typ, class_id in class_ids.items() if class_id not in self.included_classes
+        }
+        if not excluded:
+            return types
+
+        struct_excluded = any(not self.is_enum_class(class_ids[typ]) for typ in excluded)
+        collapsed = []
+        for typ in types:
+            if typ not in class_ids:
+                collapsed.append(typ)
+            elif self.is_enum_class(class_ids[typ]):
+                if typ not in excluded:
+                    collapsed.append(typ)
+                elif str not in collapsed:
+                    collapsed.append(str)
+            elif not struct_excluded:
+                collapsed.append(typ)
+        if struct_excluded:
+            collapsed.append(self.EXCLUDED_REFERENCE_TYPE)
+        return collapsed
+
+    def is_enum_class(self, class_id: str) -> bool:
+        """
+        Check whether a class is generated as an enum instead of a Struct.
+
+        Args:
+            class_id: ID of the class
+
+        Returns:
+            True if enums are used and the class is an enumeration with members
+        """
+        return self.use_enums and class_id in self.enum_members
+
+    def _index_domain_properties(self) -> Dict[str, List[str]]:
+        """
+        Index properties by the classes listed in their schema:domainIncludes.
+
+        Returns:
+            Dictionary mapping class IDs to property IDs, in schema order
+        """
+        domain_properties: Dict[str, List[str]] = defaultdict(list)
+        for prop_id, prop_entity in self.properties.items():
+            domain_includes = prop_entity.get("schema:domainIncludes", [])
+            if not isinstance(domain_includes, list):
+                domain_includes = [domain_includes]
+
+            for domain in domain_includes:
+                if isinstance(domain, dict) and "@id" in domain:
+                    domain_properties[domain["@id"]].append(prop_id)
+        return domain_properties
+
     def _collect_properties(self) -> Dict[str, Dict[str, Any]]:
         """
         Identify all entities that are rdf:Property.
@@ -238,6 +499,32 @@ class SchemaProcessor:
 
         return types or [str]  # Default to str if no type specified
 
+    def _process_property_range(self, property_entity: Dict[str, Any]) -> List[str]:
+        """
+        Get the names of the range types of a property.
+
+        Args:
+            property_entity: The property entity to process
+
+        Returns:
+            Schema.org names of the range types, in the order of
+            _process_property_types (most specific first)
+        """
+        range_includes = property_entity.get("schema:rangeIncludes", [])
+        if not isinstance(range_includes, list):
+            range_includes = [range_includes]
+
+        names = []
+        for range_type in range_includes:
+            if isinstance(range_type, dict):
+                range_type = range_type.get("@id")
+            if isinstance(range_type, str):
+                names.append(self._get_type_tag(range_type))
+
+        # sort() is stable, so types of equal specificity keep their order
+        names.sort(key=get_type_specificity, reverse=True)
+        return names
+
     def _normalize_property_name(self, prop_name: str) -> str:
         """
         Normalize a property name to be a valid Python identifier.
@@ -287,32 +574,29 @@ class SchemaProcessor:
                         self.class_properties[class_id][prop_name] = prop_info
 
         # Find direct properties for this class
-        for prop_id, prop_entity in self.properties.items():
-            domain_includes = prop_entity.get("schema:domainIncludes", [])
-            if not isinstance(domain_includes, list):
-                domain_includes = [domain_includes]
-
-            for domain in domain_includes:
-                if isinstance(domain, dict) and domain.get("@id") == class_id:
-                    # Extract the property name from the ID
-                    prop_name = prop_id.split("/")[-1]
-                    if ":" in prop_name:
-                        prop_name = prop_name.split(":")[-1]
-
-                    # Python-friendly property name
-                    py_prop_name = self._normalize_property_name(prop_name)
-
-                    # Store property info
-                    prop_info = {
-                        "id": prop_id,
-                        "name": prop_name,
-                        "types": self._process_property_types(prop_entity),
-                        "description": prop_entity.get("rdfs:comment", ""),
-                    }
-
-                    # Store both in full property map and direct property map
-                    self.class_properties[class_id][py_prop_name] = prop_info
-                    self.direct_class_properties[class_id][py_prop_name] = prop_info
+        for prop_id in self.domain_properties.get(class_id, ()):
+            prop_entity = self.properties[prop_id]
+
+            # Extract the property name from the ID
+            prop_name = prop_id.split("/")[-1]
+            if ":" in prop_name:
+                prop_name = prop_name.split(":")[-1]
+
+            # Python-friendly property name
+            py_prop_name = self._normalize_property_name(prop_name)
+
+            # Store property info
+            prop_info = {
+                "id": prop_id,
+                "name": prop_name,
+                "types": self._process_property_types(prop_entity),
+                "range": self._process_property_range(prop_entity),
+                "description": prop_entity.get("rdfs:comment", ""),
+            }
+
+            # Store both in full property map and direct property map
+            self.class_properties[class_id][py_prop_name] = prop_info
+            self.direct_class_properties[class_id][py_prop_name] = prop_info
 
     def _determine_class_categories(self):
         """
@@ -409,6 +693,8 @@ class SchemaProcessor:
 
             normalized_name = self._normalize_class_name(class_name)
             self.normalized_class_names[class_id] = normalized_name
+            # The first class with a name wins, as with a scan in class order
+            self.class_ids_by_name.setdefault(normalized_name, class_id)
 
     def _analyze_dependencies(self):
         """
@@ -429,13 +715,9 @@ class SchemaProcessor:
                         "time",
                     }:
                         # Try to find the full class ID in our normalized names
-                        for (
-                            other_class_id,
-                            norm_name,
-                        ) in self.normalized_class_names.items():
-                            if norm_name == typ:
-                                self.class_dependencies[class_id].add(other_class_id)
-                                break
+                        other_class_id = self.class_ids_by_name.get(typ)
+                        if other_class_id is not None:
+                            self.class_dependencies[class_id].add(other_class_id)
 
     def _detect_circular_dependencies(self) -> Dict[str, Set[str]]:
         """
@@ -541,8 +823,8 @@ class SchemaProcessor:
             if node not in visited:
                 visit(node)
 
-        # Reverse to get the correct order
-        return list(reversed(order))
+        # Each class is appended after all of its parents
+        return order
 
     def generate_struct_code(self, schema_class_id: str) -> tuple[str, list[str]]:
         """Generate a msgspec.Struct definition for a Schema.org class.
@@ -605,43 +887,36 @@ class SchemaProcessor:
                     f"from msgspec_schemaorg.models.{parent_category}.{parent_name} import {parent_name}"
                 )
 
-        # Flag to track if this class uses date types
-        needs_date_handling = False
+        # The @type value is the Schema.org label, which may differ from the
+        # normalized Python class name (e.g. "3DModel" vs "Model3DModel")
+        type_tag = self._get_type_tag(schema_class_id)
 
-        # Generate code
+        # Generate code, using @type as the msgspec tag for tagged unions
         if is_root:
             # Root class inherits from SchemaOrgBase
-            code = [f"class {class_name}(SchemaOrgBase):"]
+            code = [f'class {class_name}(SchemaOrgBase, tag="{type_tag}"):']
         else:
             # Other classes inherit from their parent
-            code = [f"class {class_name}({parent_name}):"]
+            code = [f'class {class_name}({parent_name}, tag="{type_tag}"):']
 
         # Add docstring
         if class_description:
             code.append(f'    """{class_description}"""')
 
-        # Add type field with this class's name as the default value
-        code.append(
-            f'    type: str = field(default_factory=lambda: "{class_name}", name="@type")'
-        )
-
         # Add fields and collect dependencies
         for prop_name, prop_info in properties.items():
-            types = prop_info["types"]
+            types = self._collapse_excluded_types(prop_info["types"])
 
             # Track dependencies
             prop_type_imports = []
 
             # Check if this property has date/datetime type or URL type
-            has_date_type = False
             for typ in types:
                 if isinstance(typ, type):
                     if typ.__name__ == "date":
                         has_date = True
-                        has_date_type = True
                     elif typ.__name__ == "datetime":
                         has_datetime = True
-                        has_date_type = True
                     elif typ.__name__ == "time":
                         has_time = True
                 elif isinstance(typ, str):
@@ -649,19 +924,12 @@ class SchemaProcessor:
                         has_url = True
                     else:
                         # If it's a string (class name), find the class ID and add it to imports
-                        for (
-                            other_class_id,
-                            norm_name,
-                        ) in self.normalized_class_names.items():
-                            if norm_name == typ:
-                                # For all Schema.org types, use string annotations and put imports under TYPE_CHECKING
-                                other_category = self.class_categories.get(
-                                    other_class_id, "misc"
-                                )
-                                typed_imports.add(
-                                    f"from msgspec_schemaorg.models.{other_category}.{norm_name} import {norm_name}"
-                                )
-                                break
+                        other_class_id = self.class_ids_by_name.get(typ)
+                        if other_class_id is not None:
+                            # For all Schema.org types, use string annotations and put imports under TYPE_CHECKING
+                            typed_imports.add(
+                                f"from {self.class_modules[other_class_id]} import {typ}"
+                            )
 
             # Create type annotation string
             if len(types) > 1:
@@ -680,18 +948,10 @@ class SchemaProcessor:
                 f"    {prop_name}: Union[List[{type_str}], {type_str}, None] = None"
             )
 
-            # Mark if we need date handling
-            if has_date_type:
-                needs_date_handling = True
-
-        # If no properties (other than type), add pass
-        if len(code) == 2:  # Just class definition and type field
+        # If no docstring and no properties, add pass
+        if len(code) == 1:  # Just class definition
             code.append("    pass")
 
-        # Add utilities for ISO8601 parsing if needed
-        if needs_date_handling:
-            imports.append("from msgspec_schemaorg.utils import parse_iso8601")
-
         # Add URL imports if needed
         if has_url:
             imports.append("from msgspec_schemaorg.utils import URL")
@@ -720,6 +980,21 @@ class SchemaProcessor:
         # Combine imports and code
         return "\n".join(code), imports
 
+    def _get_type_tag(self, class_id: str) -> str:
+        """
+        Get the @type tag value for a class.
+
+        Args:
+            class_id: ID of the class
+
+        Returns:
+            The Schema.org name of the class without namespace prefix
+        """
+        type_tag = class_id.split("/")[-1]
+        if ":" in type_tag:
+            type_tag = type_tag.split(":")[-1]
+        return type_tag
+
     def _get_string_type_annotation(self, type_obj: Union[type, str]) -> str:
         """
         Convert a type to its string representation for annotations, using quoted strings for Schema.org types.
@@ -734,12 +1009,11 @@ class SchemaProcessor:
             return type_obj.__name__
         else:
             # Check if it's a Schema.org type (one of our model classes)
-            for norm_name in self.normalized_class_names.values():
-                if norm_name == type_obj:
-                    # Already a string (likely a class name for forward reference)
-                    # Strip quotes if already quoted to prevent double quoting
-                    clean_type = str(type_obj).strip("'\"")
-                    return f"'{clean_type}'"
+            if type_obj in self.class_ids_by_name:
+                # Already a string (likely a class name for forward reference)
+                # Strip quotes if already quoted to prevent double quoting
+                clean_type = str(type_obj).strip("'\"")
+                return f"'{clean_type}'"
 
             # Handle special case for Union and List types
             if str(type_obj).startswith(("Union[", "List[")):
@@ -748,17 +1022,70 @@ class SchemaProcessor:
             # It's a primitive type or unknown
             return str(type_obj)
 
-    def generate_all_structs(self, output_dir: Path) -> Dict[str, str]:
+    def render_structs(
+        self, class_ids: List[str], jobs: int = 1
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Generate the code of several classes, optionally in worker processes.
+
+        The processor is not modified after ``__init__``, so each worker gets
+        a copy once and renders a contiguous share of the classes.
+
+        Args:
+            class_ids: IDs of the classes to generate
+            jobs: Number of worker processes, 1 renders in this process
+
+        Returns:
+            The (class_code, import_statements) of each class, in the order
+            of class_ids
         """
-        Generate msgspec.Struct definitions for all Schema.org classes,
-        with each class in its own file organized by category.
+        if jobs <= 1 or len(class_ids) < 2 * jobs:
+            return [self.generate_struct_code(class_id) for class_id in class_ids]
+
+        # A few chunks per worker balance the load without much overhead
+        chunk_size = -(-len(class_ids) // (jobs * 4))
+        chunks = [
+            class_ids[i : i + chunk_size] for i in range(0, len(class_ids), chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_render_worker, initargs=(self,)
+        ) as executor:
+            return [
+                result
+                for chunk_results in executor.map(_render_chunk, chunks)
+                for result in chunk_results
+            ]
+
+    def generate_all_structs(
+        self, output_dir: Path, jobs: int = 1, layout: str = "files"
+    ) -> Dict[str, str]:
+        """
+        Generate msgspec.Struct definitions for all Schema.org classes.
+
+        The ``files`` layout puts each class in its own file organized by
+        category. The ``categories`` layout puts all classes of a category
+        in one module, and the ``bundle`` layout puts the whole vocabulary
+        in a single ``_bundle`` module with one re-exporting module per
+        category. Combined modules define their classes in topological
+        order, so parents are defined before their subclasses in the same
+        module.
 
         Args:
             output_dir: Root directory to save the generated files
+            jobs: Number of worker processes used to render the classes
+            layout: One of LAYOUTS
 
         Returns:
             Dictionary mapping file paths to generated code
+
+        Raises:
+            ValueError: If the layout is unknown
         """
+        if layout not in self.LAYOUTS:
+            raise ValueError(
+                f"Unknown layout {layout!r}, expected one of {', '.join(self.LAYOUTS)}"
+            )
+
         # Create output directory if it doesn't exist
         output_dir = Path(output_dir)
         os.makedirs(output_dir, exist_ok=True)
@@ -766,100 +1093,346 @@ class SchemaProcessor:
         # Map to store generated files
         files = {}
 
-        # Create one file per class, in topological order by inheritance
+        # Class names generated for each category, in generation order
+        category_classes: Dict[str, List[str]] = defaultdict(list)
+
+        # Classes and their code for each combined module, in generation order
+        module_classes: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+
+        # IDs of the generated classes by name, for the property metadata
+        class_fields: Dict[str, str] = {}
+
+        # Classes to generate, in topological order by inheritance
         # This ensures parent classes are processed before child classes
+        class_ids = []
         for class_id in self.sorted_classes:
+            # Enumerations are generated into the enums package instead
+            if self.is_enum_class(class_id) or not self.is_included(class_id):
+                continue
+
             category = self.class_categories.get(class_id, "misc")
             class_name = self.normalized_class_names.get(class_id, "Unknown")
 
             # Create category directory if it doesn't exist
-            category_dir = output_dir / category
-            os.makedirs(category_dir, exist_ok=True)
+            if layout == "files":
+                os.makedirs(output_dir / category, exist_ok=True)
 
             # Skip if we couldn't get a valid class name
             if class_name == "Unknown":
                 continue
 
-            # Generate code for this class
-            class_code, imports = self.generate_struct_code(class_id)
+            class_ids.append(class_id)
+
+        # Render the classes, in the same order whatever the number of jobs
+        rendered = self.render_structs(class_ids, jobs)
+        for class_id, (class_code, imports) in zip(class_ids, rendered):
+            category = self.class_categories.get(class_id, "misc")
+            class_name = self.normalized_class_names[class_id]
 
             # Skip if we couldn't generate code
             if not class_code:
                 continue
 
-            # Create file path
-            file_path = category_dir / f"{class_name}.py"
+            # Track the class for the category modules
+            category_classes[category].append(class_name)
+            class_fields[class_name] = class_id
 
-            # Combine imports and code
-            full_code = "\n".join(imports) + "\n\n\n" + class_code
+            if layout == "files":
+                # Combine imports and code into one file per class
+                file_path = output_dir / category / f"{class_name}.py"
+                files[file_path] = "\n".join(imports) + "\n\n\n" + class_code
+            else:
+                module_classes[self._layout_module(class_id, layout)].append(
+                    (class_id, class_code)
+                )
 
-            # Add to files map
-            files[file_path] = full_code
+        if layout == "files":
+            # Create lazy-loading category __init__.py files
+            for category, class_names in category_classes.items():
+                init_path = output_dir / category / "__init__.py"
+                files[init_path] = render_lazy_init(
+                    f"Generated Schema.org {category} models using msgspec.",
+                    {name: name for name in sorted(class_names)},
+                )
+        elif layout == "categories":
+            for category in category_classes:
+                module_name = f"msgspec_schemaorg.models.{category}"
+                files[output_dir / f"{category}.py"] = self._render_combined_module(
+                    f"Generated Schema.org {category} models using msgspec.",
+                    module_name,
+                    module_classes[module_name],
+                    layout,
+                )
+        else:
+            module_name = f"msgspec_schemaorg.models.{self.BUNDLE_MODULE}"
+            files[output_dir / f"{self.BUNDLE_MODULE}.py"] = self._render_combined_module(
+                "Generated Schema.org models using msgspec, bundled in one module.",
+                module_name,
+                module_classes[module_name],
+                layout,
+            )
+            for category, class_names in category_classes.items():
+                files[output_dir / f"{category}.py"] = render_reexport_module(
+                    f"Generated Schema.org {category} models using msgspec.",
+                    self.BUNDLE_MODULE,
+                    sorted(class_names),
+                )
 
-            # Create/update category __init__.py
-            init_path = category_dir / "__init__.py"
-            if init_path not in files:
-                files[init_path] = (
-                    f'"""Generated Schema.org {category} models using msgspec."""\n\n'
+        # Create main models/__init__.py, resolving classes through their
+        # category, or directly from the bundle
+        generated = {
+            (category, name)
+            for category, class_names in category_classes.items()
+            for name in class_names
+        }
+        exports = {}
+        modules = {}
+        for class_id, class_name in sorted(self.normalized_class_names.items()):
+            category = self.class_categories.get(class_id, "misc")
+            if (category, class_name) in generated:
+                exports[class_name] = (
+                    self.BUNDLE_MODULE if layout == "bundle" else category
                 )
+                modules[class_name] = self._layout_module(class_id, layout)
 
-            # Add import to category __init__.py
-            init_content = files[init_path]
-            import_line = f"from .{class_name} import {class_name}\n"
-            if import_line not in init_content:
-                files[init_path] += import_line
-
-        # Create category __all__ statements
-        for category in set(self.class_categories.values()):
-            category_dir = output_dir / category
-            init_path = category_dir / "__init__.py"
-            if init_path in files:
-                # Get all classes in this category
-                class_names = []
-                for class_id, cat in self.class_categories.items():
-                    if cat == category:
-                        class_name = self.normalized_class_names.get(class_id)
-                        if class_name:
-                            class_names.append(class_name)
-
-                # Add __all__ statement
-                if class_names:
-                    init_content = files[init_path]
-                    init_content += "\n__all__ = [\n"
-                    for name in sorted(class_names):
-                        init_content += f"    '{name}',\n"
-                    init_content += "]\n"
-                    files[init_path] = init_content
-
-        # Create main models/__init__.py
         main_init_path = output_dir / "__init__.py"
-        main_init_content = '"""Generated Schema.org models using msgspec."""\n\n'
+        files[main_init_path] = render_lazy_init(
+            "Generated Schema.org models using msgspec.",
+            exports,
+            submodules=sorted(category_classes),
+        )
+
+        # Create the namespace table used to resolve annotations at runtime,
+        # which includes the enumerations annotations refer to
+        for class_id in self.enum_members:
+            if self.is_enum_class(class_id) and self.is_included(class_id):
+                modules[self.normalized_class_names[class_id]] = self.class_modules[class_id]
+        files[output_dir / "_namespace.py"] = render_namespace_module(
+            dict(sorted(modules.items()))
+        )
+
+        # Create the table of the Schema.org properties each class declares
+        files[output_dir / "_fields.py"] = render_fields_module(
+            {
+                name: self._class_property_metadata(class_id)
+                for name, class_id in sorted(class_fields.items())
+            }
+        )
 
-        # Get all categories (directories)
-        categories = set(self.class_categories.values())
+        # Create the table of short property keys, keeping the keys of the
+        # previous generation so documents encoded with them stay readable
+        properties = {
+            prop_info["name"]
+            for class_id in class_fields.values()
+            for prop_info in self.direct_class_properties.get(class_id, {}).values()
+        }
+        keys_path = output_dir / "_keys.py"
+        files[keys_path] = render_keys_module(
+            assign_short_keys(properties, load_short_keys(keys_path))
+        )
 
-        # Add imports for each category
-        for category in sorted(categories):
-            main_init_content += f"from . import {category}\n"
+        return files
 
-        # Add all class imports to the top level
-        main_init_content += "\n# Import all classes directly\n"
-        for category in sorted(categories):
-            main_init_content += f"from .{category} import *\n"
+    def _class_property_metadata(
+        self, class_id: str
+    ) -> Tuple[Optional[str], Dict[str, Tuple[str, str, Tuple[str, ...]]]]:
+        """
+        Get the parent and the properties a class declares, for render_fields_module().
 
-        # Add __all__ list
-        main_init_content += "\n__all__ = [\n"
-        for category in sorted(categories):
-            main_init_content += f"    '{category}',\n"
+        Args:
+            class_id: ID of the class
 
-        # Add all class names to __all__
-        for class_id, class_name in sorted(self.normalized_class_names.items()):
-            if class_name != "Unknown":
-                main_init_content += f"    '{class_name}',\n"
+        Returns:
+            Tuple of the parent class name (None for the root class) and a
+            mapping of field names to the property name, the property IRI
+            and the names of its range types, most specific first
+        """
+        parent_id = self.immediate_parents.get(class_id)
+        parent_name = self.normalized_class_names.get(parent_id) if parent_id else None
 
-        main_init_content += "]\n"
+        properties = {}
+        for field_name, prop_info in self.direct_class_properties.get(class_id, {}).items():
+            prop_id = prop_info["id"]
+            if prop_id.startswith("schema:"):
+                prop_id = "http://schema.org/" + prop_id[len("schema:") :]
+            properties[field_name] = (prop_info["name"], prop_id, tuple(prop_info["range"]))
+        return parent_name, properties
+
+    def _layout_module(self, class_id: str, layout: str) -> str:
+        """
+        Get the module that defines a class in an output layout.
+
+        Args:
+            class_id: ID of the class
+            layout: One of LAYOUTS
+
+        Returns:
+            Fully qualified module name
+        """
+        if layout == "files" or self.is_enum_class(class_id):
+            return self.class_modules[class_id]
+        if layout == "categories":
+            category = self.class_categories.get(class_id, "misc")
+            return f"msgspec_schemaorg.models.{category}"
+        return f"msgspec_schemaorg.models.{self.BUNDLE_MODULE}"
+
+    def _referenced_classes(self, class_id: str) -> Set[str]:
+        """
+        Find the classes the direct properties of a class refer to.
+
+        Args:
+            class_id: ID of the class
+
+        Returns:
+            IDs of the referenced classes, after collapsing excluded classes
+        """
+        references = set()
+        for prop_info in self.direct_class_properties.get(class_id, {}).values():
+            for typ in self._collapse_excluded_types(prop_info["types"]):
+                # "URL" is the string type from msgspec_schemaorg.utils
+                if isinstance(typ, str) and typ != "URL":
+                    other_class_id = self.class_ids_by_name.get(typ)
+                    if other_class_id is not None:
+                        references.add(other_class_id)
+        return references
+
+    def _uses_url(self, class_id: str) -> bool:
+        """Check whether a direct property of a class has the URL string type."""
+        return any(
+            typ == "URL"
+            for prop_info in self.direct_class_properties.get(class_id, {}).values()
+            for typ in self._collapse_excluded_types(prop_info["types"])
+        )
+
+    def _render_combined_module(
+        self,
+        docstring: str,
+        module_name: str,
+        classes: List[Tuple[str, str]],
+        layout: str,
+    ) -> str:
+        """
+        Render a module defining several classes.
+
+        Parents from other modules are imported at runtime. Enumerations are
+        imported at runtime as well, as the enums package never imports the
+        models. Only classes referenced from other model modules, which may
+        refer back to this one, are imported under ``TYPE_CHECKING``; the
+        bundle refers to no other model module.
+
+        Args:
+            docstring: Module docstring
+            module_name: Fully qualified name of the module
+            classes: IDs and rendered code of the classes, parents first
+            layout: One of LAYOUTS
+
+        Returns:
+            Source code of the module
+        """
+        names = {self.normalized_class_names[class_id] for class_id, _ in classes}
+        imports = set()
+        typed_imports = set()
 
-        files[main_init_path] = main_init_content
+        for class_id, _ in classes:
+            parent_id = self.immediate_parents.get(class_id)
+            parent_name = self.normalized_class_names.get(parent_id) if parent_id else None
+            if parent_name and class_id != self.ROOT_TYPE:
+                parent_module = self._layout_module(parent_id, layout)
+                if parent_module != module_name:
+                    imports.add(f"from {parent_module} import {parent_name}")
+
+            for other_class_id in self._referenced_classes(class_id):
+                other_module = self._layout_module(other_class_id, layout)
+                if other_module == module_name:
+                    continue
+                line = f"from {other_module} import {self.normalized_class_names[other_class_id]}"
+                if self.is_enum_class(other_class_id):
+                    imports.add(line)
+                else:
+                    typed_imports.add(line)
+
+        lines = [
+            f'"""{docstring}"""',
+            "",
+            "from __future__ import annotations",
+            "",
+            "from datetime import date, datetime, time",
+            "from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union"
+            if typed_imports
+            else "from typing import Any, Dict, List, Optional, Union",
+            "",
+            "from msgspec import Struct, field",
+            "",
+            "from msgspec_schemaorg.base import SchemaOrgBase",
+        ]
+        # A generated class named URL takes the place of the string type,
+        # annotations are resolved against the runtime namespace either way
+        if "URL" not in names and any(self._uses_url(class_id) for class_id, _ in classes):
+            lines.append("from msgspec_schemaorg.utils import URL")
+        lines.extend(sorted(imports))
+
+        if typed_imports:
+            lines.append("")
+            lines.append("if TYPE_CHECKING:")
+            lines.extend(f"    {line}" for line in sorted(typed_imports))
+
+        body = "\n\n\n".join(class_code for _, class_code in classes)
+        return "\n".join(lines) + "\n\n\n" + body + "\n"
+
+    def generate_all_enums(self, output_dir: Path) -> Dict[Path, str]:
+        """
+        Generate enum classes for all enumeration types that have members,
+        with each enum in its own file organized by category.
+
+        Args:
+            output_dir: Root directory of the enums package
+
+        Returns:
+            Dictionary mapping file paths to generated code
+        """
+        output_dir = Path(output_dir)
+        files = {}
+
+        # Enum names generated for each category, in generation order
+        category_enums: Dict[str, List[str]] = defaultdict(list)
+        enum_names = {}
+        metadata = {}
+
+        for enum_id, members in self.enum_members.items():
+            if not self.is_included(enum_id):
+                continue
+            enum_name = self.normalized_class_names[enum_id]
+            category = self.class_categories.get(enum_id, "misc")
+
+            files[output_dir / category / f"{enum_name}.py"] = render_enum_module(
+                enum_name, members
+            )
+            category_enums[category].append(enum_name)
+            enum_names[enum_id] = enum_name
+            metadata[enum_name] = members
+
+        # Create lazy-loading category __init__.py files
+        for category, names in category_enums.items():
+            files[output_dir / category / "__init__.py"] = render_lazy_init(
+                f"Schema.org {category} enumeration types.",
+                {name: name for name in sorted(names)},
+            )
+
+        # Create the main enums/__init__.py, resolving enums through their category
+        exports = {
+            name: self.class_categories.get(enum_id, "misc")
+            for enum_id, name in sorted(enum_names.items())
+        }
+        files[output_dir / "__init__.py"] = render_lazy_init(
+            "Schema.org enumeration types.",
+            exports,
+            submodules=sorted(category_enums),
+        )
+
+        # Create the metadata table loaded on first access to enum metadata
+        files[output_dir / "_metadata.py"] = render_enum_metadata_module(
+            dict(sorted(metadata.items()))
+        )
 
         return files
 
@@ -893,6 +1466,524 @@ class SchemaProcessor:
         return parents
 
 
+# Processor used by the worker processes of SchemaProcessor.render_structs
+_render_processor: Optional[SchemaProcessor] = None
+
+
+def _init_render_worker(processor: SchemaProcessor) -> None:
+    global _render_processor
+    _render_processor = processor
+
+
+def _render_chunk(class_ids: List[str]) -> List[Tuple[str, List[str]]]:
+    return [_render_processor.generate_struct_code(class_id) for class_id in class_ids]
+
+
+def render_enum_module(enum_name: str, members: List[Dict[str, Any]]) -> str:
+    """
+    Render the module of a Python enum class for a Schema.org enumeration type.
+
+    The metadata of the members is not part of the module, see
+    render_enum_metadata_module().
+
+    Args:
+        enum_name: The name of the enumeration type
+        members: The enumeration members with their id, label and comment
+
+    Returns:
+        Source code for the enum module
+    """
+    # Sort members by ID for consistent ordering
+    members = sorted(members, key=lambda x: x["id"])
+
+    # Prepare the enum class code
+    code = [
+        "from msgspec_schemaorg.base import SchemaOrgEnum\n\n",
+        f"class {enum_name}(SchemaOrgEnum):",
+        f'    """Schema.org enumeration values for {enum_name}."""\n',
+    ]
+
+    # Add enum values
+    for member in members:
+        value_id = _enum_member_name(member)
+
+        # Clean up the comment if present
+        comment = member.get("comment", "")
+        if comment and isinstance(comment, str):
+            # Truncate long comments and escape quotes
+            if len(comment) > 60:
+                comment = comment[:57] + "..."
+            comment = comment.replace('"', '\\"')
+            comment_str = f'  # "{comment}"'
+        else:
+            comment_str = ""
+
+        # Add the enum value
+        code.append(f'    {value_id} = "{value_id}"{comment_str}')
+
+    return "\n".join(code) + "\n"
+
+
+def _enum_member_name(member: Dict[str, Any]) -> str:
+    # The member name and value is the last segment of its ID
+    value_id = member["id"].split("/")[-1]
+    if ":" in value_id:
+        value_id = value_id.split(":")[-1]
+    return value_id
+
+
+def render_enum_metadata_module(enums: Dict[str, List[Dict[str, Any]]]) -> str:
+    """
+    Render the ``_metadata.py`` module of the generated enums package.
+
+    ``SchemaOrgEnum.metadata`` loads the table the first time the metadata of
+    an enumeration is accessed, so importing an enum class does not load the
+    comments of its members.
+
+    Args:
+        enums: Mapping of enum names to their members with their id, label
+            and comment
+
+    Returns:
+        Source code for the ``_metadata.py`` file
+    """
+    lines = [
+        '"""Metadata of the members of the Schema.org enumerations.',
+        "",
+        "Maps every enum name to the ID, label and comment of each of its members,",
+        "by member name.",
+        '"""',
+        "",
+        "METADATA = {",
+    ]
+    for enum_name, members in enums.items():
+        lines.append(f"    {enum_name!r}: {{")
+        for member in sorted(members, key=lambda x: x["id"]):
+            comment = member.get("comment", "")
+            if not isinstance(comment, str):
+                comment = str(comment)
+            label = str(member.get("label") or "")
+            lines.append(
+                f"        {_enum_member_name(member)!r}: {(member['id'], label, comment)!r},"
+            )
+        lines.append("    },")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def render_lazy_init(
+    docstring: str,
+    exports: Dict[str, str],
+    submodules: Optional[List[str]] = None,
+) -> str:
+    """
+    Render an ``__init__.py`` that loads its exports on first attribute access.
+
+    The module keeps an explicit ``__all__`` and a ``TYPE_CHECKING`` import block
+    for static analysis, while at runtime classes are imported lazily through
+    ``msgspec_schemaorg.lazy.install_lazy_module``.
+
+    Args:
+        docstring: Module docstring
+        exports: Mapping of exported names to the submodule that defines them
+        submodules: Subpackages to expose as attributes (listed first in ``__all__``)
+
+    Returns:
+        Source code for the ``__init__.py`` file
+    """
+    submodules = submodules or []
+
+    lines = [
+        f'"""{docstring}"""',
+        "",
+        "from typing import TYPE_CHECKING",
+        "",
+        "from msgspec_schemaorg.lazy import install_lazy_module",
+        "",
+        "if TYPE_CHECKING:",
+    ]
+    for submodule in submodules:
+        lines.append(f"    from . import {submodule}")
+    for name, module_name in sorted(exports.items(), key=lambda item: item[1]):
+        lines.append(f"    from .{module_name} import {name}")
+    if not submodules and not exports:
+        lines.append("    pass")
+
+    lines.append("")
+    lines.append("__all__ = [")
+    for name in [*submodules, *exports]:
+        lines.append(f"    '{name}',")
+    lines.append("]")
+
+    lines.append("")
+    lines.append("install_lazy_module(")
+    lines.append("    __name__,")
+    lines.append("    {")
+    for name, module_name in exports.items():
+        lines.append(f"        '{name}': '{module_name}',")
+    lines.append("    },")
+    if submodules:
+        lines.append(f"    submodules={submodules!r},")
+    lines.append(")")
+
+    return "\n".join(lines) + "\n"
+
+
+def render_reexport_module(docstring: str, module_name: str, names: List[str]) -> str:
+    """
+    Render a module re-exporting classes defined in a sibling module.
+
+    Args:
+        docstring: Module docstring
+        module_name: Name of the sibling module defining the classes
+        names: Names of the classes to re-export
+
+    Returns:
+        Source code of the module
+    """
+    lines = [f'"""{docstring}"""', "", f"from .{module_name} import ("]
+    lines.extend(f"    {name}," for name in names)
+    lines.append(")")
+    lines.append("")
+    lines.append("__all__ = [")
+    lines.extend(f"    '{name}'," for name in names)
+    lines.append("]")
+    return "\n".join(lines) + "\n"
+
+
+def render_namespace_module(modules: Dict[str, str]) -> str:
+    """
+    Render the ``_namespace.py`` module mapping class names to their modules.
+
+    Generated annotations refer to other classes by quoted name only, and
+    ``msgspec_schemaorg.resolve`` evaluates them against this table at runtime.
+
+    Args:
+        modules: Mapping of class names to the fully qualified module defining them
+
+    Returns:
+        Source code for the ``_namespace.py`` file
+    """
+    lines = [
+        '"""Runtime namespace of the generated Schema.org models.',
+        "",
+        "Maps every class name used in a model annotation to the module defining it.",
+        '"""',
+        "",
+        "MODULES = {",
+    ]
+    for name, module_name in modules.items():
+        lines.append(f"    '{name}': '{module_name}',")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def render_fields_module(
+    classes: Dict[str, Tuple[Optional[str], Dict[str, Tuple[str, str, Tuple[str, ...]]]]],
+) -> str:
+    """
+    Render the ``_fields.py`` module describing the properties of each class.
+
+    ``msgspec_schemaorg.properties`` loads the table on first use, so reading
+    property metadata needs no introspection of the classes.
+
+    Args:
+        classes: Mapping of class names to the parent class name and the
+            properties the class declares, see
+            SchemaProcessor._class_property_metadata()
+
+    Returns:
+        Source code for the ``_fields.py`` file
+    """
+    lines = [
+        '"""Schema.org properties of the generated models.',
+        "",
+        "Maps every class name to its parent class name and to the properties the",
+        "class declares itself, by field name: the Schema.org property name, its IRI",
+        "and the names of its range types, most specific first.",
+        '"""',
+        "",
+        "CLASSES = {",
+    ]
+    for name, (parent, properties) in classes.items():
+        if not properties:
+            lines.append(f"    {name!r}: ({parent!r}, {{}}),")
+            continue
+        lines.append(f"    {name!r}: ({parent!r}, {{")
+        for field_name, metadata in properties.items():
+            lines.append(f"        {field_name!r}: {metadata!r},")
+        lines.append("    }),")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+# Characters of short property keys, in the order keys are assigned
+SHORT_KEY_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _short_key(index: int) -> str:
+    # Bijective base 62: "0" to "Z", then "00" to "ZZ", and so on
+    key = ""
+    index += 1
+    while index:
+        index, digit = divmod(index - 1, len(SHORT_KEY_ALPHABET))
+        key = SHORT_KEY_ALPHABET[digit] + key
+    return key
+
+
+def load_short_keys(file_path: Path) -> Dict[str, str]:
+    """
+    Read the short property keys of a previously generated ``_keys.py``.
+
+    Args:
+        file_path: Path of the ``_keys.py`` file
+
+    Returns:
+        Mapping of property names to short keys, empty if the file does not
+        exist or cannot be read
+    """
+    try:
+        source = Path(file_path).read_text(encoding="utf-8")
+        for node in ast.parse(source).body:
+            if (
+                isinstance(node, ast.Assign)
+                and [getattr(target, "id", None) for target in node.targets] == ["KEYS"]
+            ):
+                keys = ast.literal_eval(node.value)
+                if isinstance(keys, dict):
+                    return keys
+    except (OSError, SyntaxError, ValueError):
+        pass
+    return {}
+
+
+def assign_short_keys(
+    properties: Set[str], previous: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """
+    Assign a short key to every property, keeping previously assigned keys.
+
+    Keys are never reassigned: properties of the previous assignment keep
+    their keys even when they are no longer generated, and new properties
+    get unused keys in the order of their names. Generating from a newer
+    schema therefore never changes the meaning of a key.
+
+    Args:
+        properties: Names of the Schema.org properties to assign keys to
+        previous: Keys assigned by a previous generation
+
+    Returns:
+        Mapping of property names to short keys, sorted by property name
+    """
+    keys = dict(previous or {})
+    used = set(keys.values())
+    index = 0
+    for prop_name in sorted(properties - set(keys)):
+        while _short_key(index) in used:
+            index += 1
+        keys[prop_name] = _short_key(index)
+        used.add(keys[prop_name])
+    return dict(sorted(keys.items()))
+
+
+def render_keys_module(keys: Dict[str, str]) -> str:
+    """
+    Render the ``_keys.py`` module mapping property names to short keys.
+
+    ``msgspec_schemaorg.compact`` encodes fields under these keys in the
+    short key variants of the models.
+
+    Args:
+        keys: Mapping of property names to short keys, see assign_short_keys()
+
+    Returns:
+        Source code for the ``_keys.py`` file
+    """
+    lines = [
+        '"""Short keys of the Schema.org properties.',
+        "",
+        "Maps every property name to the key it is encoded under by the short key",
+        "variants of the models. Regenerating the models keeps the assigned keys.",
+        '"""',
+        "",
+        "KEYS = {",
+    ]
+    for prop_name, key in keys.items():
+        lines.append(f"    {prop_name!r}: {key!r},")
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+# Manifest of the files written by write_generated_files, kept in the output directory
+MANIFEST_NAME = ".generated.json"
+
+
+def _write_if_changed(file_path: Path, data: bytes) -> str:
+    # Compare with the file on disk, returning the outcome for the counts
+    try:
+        if file_path.read_bytes() == data:
+            return "unchanged"
+        status = "changed"
+    except FileNotFoundError:
+        status = "added"
+    file_path.write_bytes(data)
+    return status
+
+
+def _remove_shadowing_paths(current: Set[str], output_dir: Path) -> int:
+    # Remove the modules and packages another layout left under the name of a
+    # written package or module. A package shadows the module of the same
+    # name, and a layout switch would otherwise leave both, as the files of
+    # the tracked packages are in no manifest on a fresh checkout.
+    removed = 0
+    for relative in current:
+        parts = relative.split("/")
+        if parts[-1] == "__init__.py" and len(parts) > 1:
+            module = output_dir.joinpath(*parts[:-2], parts[-2] + ".py")
+            if "/".join(parts[:-1]) + ".py" not in current and module.is_file():
+                module.unlink()
+                removed += 1
+        elif relative.endswith(".py"):
+            package = output_dir / relative[: -len(".py")]
+            prefix = relative[: -len(".py")] + "/"
+            if (package / "__init__.py").is_file() and not any(
+                other.startswith(prefix) for other in current
+            ):
+                removed += sum(1 for path in package.rglob("*.py") if path.is_file())
+                shutil.rmtree(package)
+    return removed
+
+
+def write_generated_files(
+    files: Dict[Path, str],
+    output_dir: Path,
+    manifest_name: str = MANIFEST_NAME,
+    jobs: int = 1,
+) -> Dict[str, int]:
+    """
+    Write generated files, touching only the ones whose content changed.
+
+    Files whose rendered content matches the file on disk are not rewritten,
+    so their modification times and bytecode caches stay valid. A manifest in
+    ``output_dir`` records the content hash of every generated file.
+    Files listed in the previous manifest but no longer generated are deleted,
+    along with directories left empty. Files not in the manifest are never
+    deleted, except for a package named like a generated module or a module
+    named like a generated package, which another layout left and which
+    would shadow the generated one.
+
+    Args:
+        files: Dictionary mapping file paths under ``output_dir`` to their content
+        output_dir: Root directory of the generated files
+        manifest_name: File name of the manifest inside ``output_dir``
+        jobs: Number of threads comparing and writing files
+
+    Returns:
+        Counts of ``added``, ``changed``, ``unchanged`` and ``removed`` files
+    """
+    output_dir = Path(output_dir)
+    manifest_path = output_dir / manifest_name
+    try:
+        with open(manifest_path, "r") as f:
+            previous = json.load(f).get("files", {})
+    except (OSError, ValueError):
+        previous = {}
+
+    counts = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+    current = {}
+    paths = []
+    contents = []
+
+    for file_path, content in files.items():
+        file_path = Path(file_path)
+        relative = file_path.relative_to(output_dir).as_posix()
+        data = content.encode("utf-8")
+        current[relative] = hashlib.sha256(data).hexdigest()
+        paths.append(file_path)
+        contents.append(data)
+
+    # Create the directories first so the writes do not depend on each other
+    for directory in {file_path.parent for file_path in paths}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            statuses = list(executor.map(_write_if_changed, paths, contents))
+    else:
+        statuses = list(map(_write_if_changed, paths, contents))
+    for status in statuses:
+        counts[status] += 1
+
+    for relative in sorted(set(previous) - set(current)):
+        file_path = output_dir / relative
+        if file_path.exists():
+            file_path.unlink()
+            counts["removed"] += 1
+
+            # Remove directories the deletion left empty
+            parent = file_path.parent
+            while parent != output_dir and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+
+    counts["removed"] += _remove_shadowing_paths(set(current), output_dir)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump({"files": dict(sorted(current.items()))}, f, indent=2)
+        f.write("\n")
+
+    return counts
+
+
+def generate_package(
+    schema_data: Dict[str, Any],
+    models_dir: Path,
+    enums_dir: Path,
+    include_enums: bool = False,
+    jobs: int = 1,
+    include: Optional[List[str]] = None,
+    include_depth: Optional[int] = None,
+    layout: str = "files",
+) -> Tuple[Dict[Path, str], Dict[Path, str]]:
+    """
+    Generate the models and enums packages in a single pass over the schema.
+
+    Enumeration types are classified in memory, so models refer to the
+    generated enums directly and no generated file needs rewriting.
+
+    Args:
+        schema_data: The loaded JSON-LD Schema.org data
+        models_dir: Directory of the generated models package
+        enums_dir: Directory of the generated enums package
+        include_enums: Generate Struct classes for enumeration types as well,
+            instead of enum classes
+        jobs: Number of worker processes used to render the models
+        include: Names of the classes to generate, with the classes they
+            need. All classes are generated if None.
+        include_depth: Number of property references followed from the
+            included classes, unlimited if None
+        layout: Layout of the models package, one of SchemaProcessor.LAYOUTS
+
+    Returns:
+        Tuple of the model files and the enum files, each mapping file paths
+        to generated code. The enum files are empty if include_enums is set.
+    """
+    processor = SchemaProcessor(
+        schema_data,
+        use_enums=not include_enums,
+        include=include,
+        include_depth=include_depth,
+    )
+    model_files = processor.generate_all_structs(models_dir, jobs, layout)
+    enum_files = {} if include_enums else processor.generate_all_enums(enums_dir)
+    return model_files, enum_files
+
+
 def fetch_and_generate(schema_data: Dict[str, Any], output_dir: Path) -> Dict[str, str]:
     """
     Process Schema.org data and generate Python code.
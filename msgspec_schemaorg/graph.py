@@ -0,0 +1,201 @@
+"""
+Typed access to JSON-LD documents holding a @graph of cross-referencing nodes.
+
+A Graph decodes every node into its model class, indexes the nodes by @id and
+dereferences ``{"@id": ...}`` references on access instead of requiring a walk
+over raw dictionaries.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, Union
+
+import msgspec
+from msgspec import field
+
+from .base import SchemaOrgBase
+from .decode import get_default_decoder
+
+T = TypeVar("T", bound=SchemaOrgBase)
+
+
+class _GraphDocument(msgspec.Struct):
+    """Top level of a JSON-LD document, with the nodes left undecoded."""
+
+    context: Any = field(default=None, name="@context")
+    graph: Optional[List[msgspec.Raw]] = field(default=None, name="@graph")
+
+
+class _NodeHeader(msgspec.Struct):
+    """The identifying keys of a node, all other keys are skipped."""
+
+    id: Optional[str] = field(default=None, name="@id")
+    type: Union[str, List[str], None] = field(default=None, name="@type")
+
+
+_document_decoder = msgspec.json.Decoder(Union[_GraphDocument, List[msgspec.Raw]])
+_header_decoder = msgspec.json.Decoder(_NodeHeader)
+
+
+class Graph:
+    """
+    The nodes of a JSON-LD @graph, indexed by @id.
+
+    Nodes are decoded into their model classes by @type. References between
+    nodes stay as decoded (usually objects with only ``id`` set) and are
+    dereferenced when accessed through resolve() or follow().
+    """
+
+    def __init__(self, nodes: List[SchemaOrgBase], context: Any = None):
+        self.nodes = nodes
+        self.context = context
+        self._index: Dict[str, SchemaOrgBase] = {}
+        for node in nodes:
+            if node.id is not None:
+                self._index[node.id] = node
+
+    @classmethod
+    def decode(
+        cls, buf: Union[bytes, bytearray, memoryview, str], skip_invalid: bool = False
+    ) -> "Graph":
+        """
+        Decode a JSON-LD document into a Graph.
+
+        The document may be an object with a @graph array, an array of nodes,
+        or a single node.
+
+        Args:
+            buf: The JSON document to decode
+            skip_invalid: Leave out nodes that have no known @type or do not
+                match their model, instead of raising
+
+        Returns:
+            A Graph of the decoded nodes
+
+        Raises:
+            msgspec.ValidationError: If a node has no known @type or does not
+                match its model, and skip_invalid is not set
+        """
+        document = _document_decoder.decode(buf)
+        context = None
+        if isinstance(document, list):
+            raw_nodes = document
+        else:
+            context = document.context
+            if document.graph is None:
+                raw_nodes = [msgspec.Raw(buf)]
+            else:
+                raw_nodes = document.graph
+
+        decoder = get_default_decoder()
+        nodes: List[Optional[SchemaOrgBase]] = []
+        failed = []
+        for i, raw in enumerate(raw_nodes):
+            try:
+                nodes.append(decoder.decode(raw))
+            except msgspec.ValidationError:
+                nodes.append(None)
+                failed.append(i)
+
+        if failed:
+            # References to other nodes are often written without @type,
+            # which decode() can only type if their property accepts a
+            # single class. Decode those nodes again, typing references
+            # from their node.
+            types_by_id: Dict[str, Union[str, List[str]]] = {}
+            for raw in raw_nodes:
+                header = _header_decoder.decode(raw)
+                if header.id is not None and header.type is not None:
+                    types_by_id[header.id] = header.type
+
+            for i in failed:
+                try:
+                    nodes[i] = decoder.decode_builtins(
+                        msgspec.json.decode(raw_nodes[i]), types_by_id
+                    )
+                except msgspec.ValidationError:
+                    if not skip_invalid:
+                        raise
+            if skip_invalid:
+                nodes = [node for node in nodes if node is not None]
+
+        return cls(nodes, context=context)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[SchemaOrgBase]:
+        return iter(self.nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._index
+
+    def __getitem__(self, node_id: str) -> SchemaOrgBase:
+        return self._index[node_id]
+
+    def get(self, node_id: str, default: Any = None) -> Any:
+        """
+        Look up a node by its @id.
+
+        Args:
+            node_id: The @id of the node
+            default: Value returned if no node has that @id
+
+        Returns:
+            The node, or default
+        """
+        return self._index.get(node_id, default)
+
+    def resolve(self, ref: Union[str, SchemaOrgBase]) -> Any:
+        """
+        Dereference a node reference.
+
+        Args:
+            ref: An @id, or a model instance that may be a reference-only node
+
+        Returns:
+            The node with that @id. A model instance whose @id is not in the
+            graph is returned unchanged, as it holds its data inline.
+
+        Raises:
+            KeyError: If ref is an @id that is not in the graph
+        """
+        if isinstance(ref, str):
+            return self._index[ref]
+        if ref.id is None:
+            return ref
+        return self._index.get(ref.id, ref)
+
+    def follow(self, node: SchemaOrgBase, name: str) -> Any:
+        """
+        Get a property of a node with references replaced by the nodes.
+
+        Args:
+            node: The node to read from
+            name: Attribute name of the property
+
+        Returns:
+            The property value, with each referenced model instance resolved.
+            Lists are returned as new lists.
+        """
+        value = getattr(node, name)
+        if isinstance(value, SchemaOrgBase):
+            return self.resolve(value)
+        if isinstance(value, list):
+            return [
+                self.resolve(item) if isinstance(item, SchemaOrgBase) else item
+                for item in value
+            ]
+        return value
+
+    def of_type(self, cls: Type[T]) -> List[T]:
+        """
+        Get all nodes that are instances of a model class.
+
+        Args:
+            cls: The model class, subclasses match as well
+
+        Returns:
+            The matching nodes in document order
+        """
+        return [node for node in self.nodes if isinstance(node, cls)]
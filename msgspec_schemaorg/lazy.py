@@ -0,0 +1,77 @@
+"""
+Lazy attribute loading for the generated model packages.
+
+The generated ``__init__.py`` files do not import their classes eagerly.
+Instead they register a table mapping each exported name to the submodule
+that defines it, and the class is imported the first time it is accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional
+
+
+class LazyModule(ModuleType):
+    """
+    Module type that resolves exported names on first attribute access.
+
+    Resolved values are cached in the module namespace, so each name is only
+    looked up through the export table once.
+    """
+
+    __lazy_exports__: Dict[str, str]
+    __lazy_submodules__: frozenset
+
+    def __getattr__(self, name: str):
+        if name in self.__lazy_submodules__:
+            return importlib.import_module(f"{self.__name__}.{name}")
+
+        module_name = self.__lazy_exports__.get(name)
+        if module_name is None:
+            raise AttributeError(f"module '{self.__name__}' has no attribute '{name}'")
+
+        module = importlib.import_module(f"{self.__name__}.{module_name}")
+        value = getattr(module, name)
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value):
+        # The import system binds a freshly loaded submodule on its parent
+        # package. For one-class-per-file modules the submodule has the same
+        # name as the class it defines, so bind the class instead of letting
+        # the module shadow it.
+        if (
+            isinstance(value, ModuleType)
+            and self.__lazy_exports__.get(name) == name
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:
+        return sorted(
+            set(self.__dict__) | set(self.__lazy_exports__) | self.__lazy_submodules__
+        )
+
+
+def install_lazy_module(
+    module_name: str,
+    exports: Dict[str, str],
+    submodules: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Turn an already imported module into a LazyModule.
+
+    Args:
+        module_name: Name of the module to convert (usually ``__name__``)
+        exports: Mapping of exported attribute names to the submodule (relative
+            to ``module_name``) that defines them
+        submodules: Names of subpackages that should be imported on access
+    """
+    module = sys.modules[module_name]
+    module.__dict__["__lazy_exports__"] = exports
+    module.__dict__["__lazy_submodules__"] = frozenset(submodules or ())
+    module.__class__ = LazyModule
@@ -0,0 +1,421 @@
+"""
+Extraction of Schema.org microdata and RDFa from HTML pages.
+
+The parser is a ``html.parser.HTMLParser`` that follows the item attributes
+of each element as it streams over the page, without building a DOM:
+``itemscope``/``itemtype``/``itemprop``/``itemid`` for microdata and
+``typeof``/``property``/``resource`` for RDFa. Each top-level item is turned
+into the JSON-LD object it stands for, using the property table of the
+generated models to convert values to the range of their property, and
+decoded by the polymorphic decoder, so the same model instances are produced
+as for the equivalent JSON-LD.
+"""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+import msgspec
+
+from .base import SchemaOrgBase
+from .decode import get_default_decoder
+from .mapping import SCHEMA_TO_PYTHON_TYPE_MAPPING
+from .properties import _get_classes, get_properties
+
+__all__ = ["MicrodataParser", "extract_microdata"]
+
+# Prefixes of Schema.org types and properties in itemtype, itemprop, typeof
+# and property attributes. Bare names are accepted as well, as written in
+# RDFa with a vocab attribute.
+_PREFIXES = ("https://schema.org/", "http://schema.org/", "schema:")
+
+# Elements without an end tag
+_VOID_ELEMENTS = frozenset(
+    (
+        "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+        "meta", "param", "source", "track", "wbr",
+    )
+)
+
+# Open elements closed by the start of another element, as the end tags of
+# list items, paragraphs and table cells may be left out
+_IMPLIED_END = {
+    "li": ("li",),
+    "dt": ("dt", "dd"),
+    "dd": ("dt", "dd"),
+    "option": ("option",),
+    "tr": ("tr", "td", "th"),
+    "td": ("td", "th"),
+    "th": ("td", "th"),
+}
+_IMPLIED_END.update(
+    dict.fromkeys(
+        (
+            "address", "article", "aside", "blockquote", "div", "dl", "fieldset",
+            "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+            "header", "hr", "main", "nav", "ol", "p", "pre", "section", "table", "ul",
+        ),
+        ("p",),
+    )
+)
+
+# Attribute holding the value of a property, by element, after ``content``.
+# These values are URLs, except for data, meter and time.
+_VALUE_ATTRIBUTES = {
+    "a": "href",
+    "area": "href",
+    "link": "href",
+    "audio": "src",
+    "embed": "src",
+    "iframe": "src",
+    "img": "src",
+    "source": "src",
+    "track": "src",
+    "video": "src",
+    "object": "data",
+}
+_LITERAL_ATTRIBUTES = {"data": "value", "meter": "value", "time": "datetime"}
+
+_NUMBER_TYPES = (int, float, "int | float")
+_BOOLEAN_TYPES = (bool, "Literal[True]", "Literal[False]")
+_TRUE = frozenset(("true", "https://schema.org/true", "http://schema.org/true", "schema:true"))
+_FALSE = frozenset(
+    ("false", "https://schema.org/false", "http://schema.org/false", "schema:false")
+)
+
+
+class _Range(NamedTuple):
+    """The kinds of value a property accepts."""
+
+    # Strings: text, URLs, dates and enumeration members
+    text: bool
+    number: bool
+    boolean: bool
+    # Model classes, most specific first
+    classes: Tuple[str, ...]
+
+
+_ranges: Dict[str, Dict[str, _Range]] = {}
+
+
+def _property_ranges(class_name: str) -> Dict[str, _Range]:
+    """Ranges of the properties of a model class, by Schema.org property name."""
+    ranges = _ranges.get(class_name)
+    if ranges is None:
+        classes = _get_classes()
+        ranges = {}
+        for info in get_properties(class_name).values():
+            text = number = boolean = False
+            models = []
+            for name in info.range:
+                # Data types such as URL are model classes as well, but
+                # properties hold them as Python values
+                python_type = SCHEMA_TO_PYTHON_TYPE_MAPPING.get(name)
+                if python_type in _NUMBER_TYPES:
+                    number = True
+                elif python_type in _BOOLEAN_TYPES:
+                    boolean = True
+                elif python_type is not None or name not in classes:
+                    text = True
+                else:
+                    models.append(name)
+            ranges[info.property] = _Range(text, number, boolean, tuple(models))
+        _ranges[class_name] = ranges
+    return ranges
+
+
+def _schema_name(iri: str) -> str:
+    for prefix in _PREFIXES:
+        if iri.startswith(prefix):
+            return iri[len(prefix) :]
+    return iri
+
+
+def _model_class_name(types: Optional[str]) -> Optional[str]:
+    """The first generated model class among space-separated type IRIs."""
+    if types:
+        classes = _get_classes()
+        for iri in types.split():
+            name = _schema_name(iri)
+            if name in classes:
+                return name
+    return None
+
+
+class _Value:
+    """A literal property value, of an attribute or the text of an element."""
+
+    __slots__ = ("parts", "link")
+
+    def __init__(self, parts: List[str], link: bool = False):
+        self.parts = parts
+        self.link = link
+
+
+class _Item:
+    """An item and its property values in document order."""
+
+    __slots__ = ("type", "id", "properties", "closed")
+
+    def __init__(self, type: Optional[str], id: Optional[str]):
+        self.type = type
+        self.id = id
+        self.properties: Dict[str, List[Union[_Value, _Item]]] = {}
+        self.closed = False
+
+    def add(self, names: List[str], value: Union[_Value, _Item]) -> None:
+        for name in names:
+            self.properties.setdefault(_schema_name(name), []).append(value)
+
+
+class _Element:
+    """An open element, with the item its descendants belong to."""
+
+    __slots__ = ("tag", "scope", "item", "text")
+
+    def __init__(
+        self,
+        tag: str,
+        scope: Optional[_Item],
+        item: Optional[_Item],
+        text: Optional[_Value],
+    ):
+        self.tag = tag
+        self.scope = scope
+        self.item = item
+        self.text = text
+
+
+def _convert(value: Union[_Value, _Item], range_: _Range) -> Any:
+    """
+    Convert a property value to its JSON-LD form.
+
+    Returns None for values the property cannot hold: text where only model
+    classes are accepted, and untyped items whose class cannot be told from
+    the range.
+    """
+    if isinstance(value, _Item):
+        if value.type is None:
+            if len(range_.classes) != 1:
+                return None
+            value.type = range_.classes[0]
+        return _to_json_ld(value)
+
+    text = "".join(value.parts)
+    if not value.link:
+        text = " ".join(text.split())
+    if range_.text:
+        return text
+    if range_.number:
+        for number_type in (int, float):
+            try:
+                return number_type(text)
+            except ValueError:
+                pass
+    if range_.boolean:
+        lowered = text.lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    if range_.classes:
+        # A link to another node is a reference to it
+        return {"@type": range_.classes[0], "@id": text} if value.link else None
+    return text
+
+
+def _to_json_ld(item: _Item) -> Dict[str, Any]:
+    """Build the JSON-LD object of a typed item."""
+    document: Dict[str, Any] = {"@type": item.type}
+    if item.id is not None:
+        document["@id"] = item.id
+
+    ranges = _property_ranges(item.type)
+    for name, values in item.properties.items():
+        range_ = ranges.get(name)
+        if range_ is None:
+            continue
+        converted = [_convert(value, range_) for value in values]
+        converted = [value for value in converted if value is not None]
+        if converted:
+            document[name] = converted[0] if len(converted) == 1 else converted
+    return document
+
+
+class MicrodataParser(HTMLParser):
+    """
+    Streaming parser of Schema.org microdata and RDFa.
+
+    Feed the page in chunks of text with feed(), and call close() at the
+    end. Top-level items are decoded as soon as their element is closed, in
+    page order, and collected until taken with pop_objects().
+
+    The value of a property is its ``content`` attribute, the URL or value
+    attribute of its element (``href``, ``src``, ``datetime``...), or its
+    text with whitespace collapsed. Items whose type is not a generated
+    model class are skipped, as are property values the model cannot hold.
+    ``itemref`` is not followed.
+
+    Relative URLs in ``itemid``, ``resource`` and ``about``, and in the URL
+    attributes of property elements, are resolved against the first
+    ``<base href>`` of the page, itself resolved against base_url.
+
+    Args:
+        skip_invalid: Skip items that do not match their model, instead of
+            raising from feed() or close()
+        base_url: URL of the page. Relative URLs are kept as they are if
+            neither it nor a ``<base>`` element is given.
+    """
+
+    def __init__(self, skip_invalid: bool = False, base_url: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.skip_invalid = skip_invalid
+        self.base_url = base_url
+        self._base_seen = False
+        self._decoder = get_default_decoder()
+        self._stack: List[_Element] = []
+        self._texts: List[_Value] = []
+        self._top: List[_Item] = []
+        self._objects: List[SchemaOrgBase] = []
+
+    def pop_objects(self) -> List[SchemaOrgBase]:
+        """
+        Take the objects decoded so far.
+
+        Returns:
+            The model instances of the items closed since the last call
+        """
+        objects = self._objects
+        self._objects = []
+        return objects
+
+    def close(self) -> None:
+        """Finish the page, closing the elements left open."""
+        super().close()
+        while self._stack:
+            self._close(self._stack.pop())
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        implied = _IMPLIED_END.get(tag)
+        if implied is not None:
+            while self._stack and self._stack[-1].tag in implied:
+                self._close(self._stack.pop())
+
+        attributes = dict(attrs)
+        if tag == "base" and not self._base_seen and attributes.get("href"):
+            # Only the first base element with an href applies
+            self._base_seen = True
+            self.base_url = self._url(attributes["href"])
+        scope = self._stack[-1].scope if self._stack else None
+        names = attributes.get("itemprop") or attributes.get("property")
+        names = names.split() if names else None
+
+        item = text = None
+        if "itemscope" in attributes or "typeof" in attributes:
+            item_id = (
+                attributes.get("itemid") or attributes.get("resource") or attributes.get("about")
+            )
+            item = _Item(
+                _model_class_name(attributes.get("itemtype") or attributes.get("typeof")),
+                self._url(item_id) if item_id is not None else None,
+            )
+            if names and scope is not None:
+                scope.add(names, item)
+            else:
+                self._top.append(item)
+        elif names and scope is not None:
+            value = attributes.get("content")
+            link = False
+            if value is None:
+                attribute = _VALUE_ATTRIBUTES.get(tag)
+                if attribute is not None:
+                    value = attributes.get(attribute)
+                    link = value is not None
+                if value is None:
+                    value = attributes.get("resource")
+                    link = value is not None
+                if link:
+                    value = self._url(value)
+                if value is None and tag in _LITERAL_ATTRIBUTES:
+                    value = attributes.get(_LITERAL_ATTRIBUTES[tag])
+
+            if value is not None:
+                scope.add(names, _Value([value], link))
+            elif tag not in _VOID_ELEMENTS:
+                text = _Value([])
+                scope.add(names, text)
+                self._texts.append(text)
+
+        if tag not in _VOID_ELEMENTS:
+            self._stack.append(_Element(tag, item or scope, item, text))
+        elif item is not None:
+            self._close_item(item)
+
+    def handle_endtag(self, tag: str) -> None:
+        # Elements left open inside the closed one, as in sloppy HTML, are
+        # closed with it. End tags of elements that are not open are ignored.
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index].tag == tag:
+                while len(self._stack) > index:
+                    self._close(self._stack.pop())
+                return
+
+    def handle_data(self, data: str) -> None:
+        for text in self._texts:
+            text.parts.append(data)
+
+    def _url(self, url: str) -> str:
+        return urljoin(self.base_url, url) if self.base_url else url
+
+    def _close(self, element: _Element) -> None:
+        if element.text is not None:
+            self._texts.remove(element.text)
+        if element.item is not None:
+            self._close_item(element.item)
+
+    def _close_item(self, item: _Item) -> None:
+        item.closed = True
+        # Items are decoded in the order they start, so an item waits for the
+        # top-level items it is nested in
+        while self._top and self._top[0].closed:
+            top = self._top.pop(0)
+            if top.type is None:
+                continue
+            try:
+                self._objects.append(self._decoder.decode_builtins(_to_json_ld(top)))
+            except msgspec.ValidationError:
+                if not self.skip_invalid:
+                    raise
+
+
+def extract_microdata(
+    page: Union[bytes, bytearray, memoryview, str],
+    skip_invalid: bool = False,
+    base_url: Optional[str] = None,
+) -> List[SchemaOrgBase]:
+    """
+    Extract and decode the microdata and RDFa items of an HTML page.
+
+    See MicrodataParser for how items and values are read.
+
+    Args:
+        page: The HTML page. Bytes are decoded as UTF-8.
+        skip_invalid: Skip items that do not match their model, instead of
+            raising
+        base_url: URL of the page, to resolve relative URLs against
+
+    Returns:
+        The model instances of the top-level items, in page order
+
+    Raises:
+        msgspec.ValidationError: If an item does not match its model and
+            skip_invalid is not set
+    """
+    if not isinstance(page, str):
+        page = str(page, "utf-8", "replace")
+    parser = MicrodataParser(skip_invalid=skip_invalid, base_url=base_url)
+    parser.feed(page)
+    parser.close()
+    return parser.pop_objects()
@@ -1,27 +1,855 @@
 """Generated Schema.org models using msgspec."""
 
-from . import action
-from . import creativework
-from . import event
-from . import intangible
-from . import misc
-from . import organization
-from . import person
-from . import place
-from . import product
-from . import thing
+from typing import TYPE_CHECKING
 
-# Import all classes directly
-from .action import *
-from .creativework import *
-from .event import *
-from .intangible import *
-from .misc import *
-from .organization import *
-from .person import *
-from .place import *
-from .product import *
-from .thing import *
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from . import action
+    from . import creativework
+    from . import event
+    from . import intangible
+    from . import misc
+    from . import organization
+    from . import person
+    from . import place
+    from . import product
+    from . import thing
+    from .action import AcceptAction
+    from .action import AchieveAction
+    from .action import Action
+    from .action import ActivateAction
+    from .action import AddAction
+    from .action import AgreeAction
+    from .action import AllocateAction
+    from .action import AppendAction
+    from .action import ApplyAction
+    from .action import ArriveAction
+    from .action import AskAction
+    from .action import AssessAction
+    from .action import AssignAction
+    from .action import AuthorizeAction
+    from .action import BefriendAction
+    from .action import BookmarkAction
+    from .action import BorrowAction
+    from .action import BuyAction
+    from .action import CancelAction
+    from .action import CheckAction
+    from .action import CheckInAction
+    from .action import CheckOutAction
+    from .action import ChooseAction
+    from .action import CommentAction
+    from .action import CommunicateAction
+    from .action import ConfirmAction
+    from .action import ConsumeAction
+    from .action import ControlAction
+    from .action import CookAction
+    from .action import CreateAction
+    from .action import DeactivateAction
+    from .action import DeleteAction
+    from .action import DepartAction
+    from .action import DisagreeAction
+    from .action import DiscoverAction
+    from .action import DislikeAction
+    from .action import DonateAction
+    from .action import DownloadAction
+    from .action import DrawAction
+    from .action import DrinkAction
+    from .action import EatAction
+    from .action import EndorseAction
+    from .action import ExerciseAction
+    from .action import FilmAction
+    from .action import FindAction
+    from .action import FollowAction
+    from .action import GiveAction
+    from .action import IgnoreAction
+    from .action import InformAction
+    from .action import InsertAction
+    from .action import InstallAction
+    from .action import InteractAction
+    from .action import InviteAction
+    from .action import JoinAction
+    from .action import LeaveAction
+    from .action import LendAction
+    from .action import LikeAction
+    from .action import ListenAction
+    from .action import LoseAction
+    from .action import MarryAction
+    from .action import MoneyTransfer
+    from .action import MoveAction
+    from .action import OrderAction
+    from .action import OrganizeAction
+    from .action import PaintAction
+    from .action import PayAction
+    from .action import PerformAction
+    from .action import PhotographAction
+    from .action import PlanAction
+    from .action import PlayAction
+    from .action import PlayGameAction
+    from .action import PreOrderAction
+    from .action import PrependAction
+    from .action import QuoteAction
+    from .action import ReactAction
+    from .action import ReadAction
+    from .action import ReceiveAction
+    from .action import RegisterAction
+    from .action import RejectAction
+    from .action import RentAction
+    from .action import ReplaceAction
+    from .action import ReplyAction
+    from .action import ReserveAction
+    from .action import ResumeAction
+    from .action import ReturnAction
+    from .action import ReviewAction
+    from .action import RsvpAction
+    from .action import ScheduleAction
+    from .action import SearchAction
+    from .action import SeekToAction
+    from .action import SellAction
+    from .action import SendAction
+    from .action import ShareAction
+    from .action import SolveMathAction
+    from .action import SubscribeAction
+    from .action import SuspendAction
+    from .action import TakeAction
+    from .action import TieAction
+    from .action import TipAction
+    from .action import TrackAction
+    from .action import TradeAction
+    from .action import TransferAction
+    from .action import TravelAction
+    from .action import UnRegisterAction
+    from .action import UpdateAction
+    from .action import UseAction
+    from .action import ViewAction
+    from .action import VoteAction
+    from .action import WantAction
+    from .action import WatchAction
+    from .action import WearAction
+    from .action import WinAction
+    from .action import WriteAction
+    from .creativework import Model3DModel
+    from .creativework import APIReference
+    from .creativework import AboutPage
+    from .creativework import AdvertiserContentArticle
+    from .creativework import AmpStory
+    from .creativework import AnalysisNewsArticle
+    from .creativework import Answer
+    from .creativework import ArchiveComponent
+    from .creativework import Article
+    from .creativework import AskPublicNewsArticle
+    from .creativework import Atlas
+    from .creativework import AudioObject
+    from .creativework import AudioObjectSnapshot
+    from .creativework import Audiobook
+    from .creativework import BackgroundNewsArticle
+    from .creativework import Barcode
+    from .creativework import Blog
+    from .creativework import BlogPosting
+    from .creativework import Book
+    from .creativework import BookSeries
+    from .creativework import CategoryCodeSet
+    from .creativework import Certification
+    from .creativework import Chapter
+    from .creativework import CheckoutPage
+    from .creativework import Claim
+    from .creativework import ClaimReview
+    from .creativework import Clip
+    from .creativework import Code
+    from .creativework import Collection
+    from .creativework import CollectionPage
+    from .creativework import ComicCoverArt
+    from .creativework import ComicIssue
+    from .creativework import ComicSeries
+    from .creativework import ComicStory
+    from .creativework import Comment
+    from .creativework import CompleteDataFeed
+    from .creativework import ContactPage
+    from .creativework import Conversation
+    from .creativework import CorrectionComment
+    from .creativework import Course
+    from .creativework import CoverArt
+    from .creativework import CreativeWork
+    from .creativework import CreativeWorkSeason
+    from .creativework import CreativeWorkSeries
+    from .creativework import CriticReview
+    from .creativework import DataCatalog
+    from .creativework import DataDownload
+    from .creativework import DataFeed
+    from .creativework import Dataset
+    from .creativework import DefinedTermSet
+    from .creativework import Diet
+    from .creativework import DigitalDocument
+    from .creativework import DiscussionForumPosting
+    from .creativework import Drawing
+    from .creativework import EducationalOccupationalCredential
+    from .creativework import EmailMessage
+    from .creativework import EmployerReview
+    from .creativework import Episode
+    from .creativework import FAQPage
+    from .creativework import Game
+    from .creativework import Guide
+    from .creativework import HealthTopicContent
+    from .creativework import HowTo
+    from .creativework import HowToSection
+    from .creativework import HowToTip
+    from .creativework import HyperToc
+    from .creativework import HyperTocEntry
+    from .creativework import ImageGallery
+    from .creativework import ImageObject
+    from .creativework import ImageObjectSnapshot
+    from .creativework import ItemPage
+    from .creativework import LearningResource
+    from .creativework import Legislation
+    from .creativework import LegislationObject
+    from .creativework import LiveBlogPosting
+    from .creativework import Manuscript
+    from .creativework import Map
+    from .creativework import MathSolver
+    from .creativework import MediaGallery
+    from .creativework import MediaObject
+    from .creativework import MediaReview
+    from .creativework import MediaReviewItem
+    from .creativework import MedicalScholarlyArticle
+    from .creativework import MedicalWebPage
+    from .creativework import Menu
+    from .creativework import MenuSection
+    from .creativework import Message
+    from .creativework import MobileApplication
+    from .creativework import Movie
+    from .creativework import MovieClip
+    from .creativework import MovieSeries
+    from .creativework import MusicAlbum
+    from .creativework import MusicComposition
+    from .creativework import MusicPlaylist
+    from .creativework import MusicRecording
+    from .creativework import MusicRelease
+    from .creativework import MusicVideoObject
+    from .creativework import NewsArticle
+    from .creativework import Newspaper
+    from .creativework import NoteDigitalDocument
+    from .creativework import OpinionNewsArticle
+    from .creativework import Painting
+    from .creativework import Periodical
+    from .creativework import Photograph
+    from .creativework import Play
+    from .creativework import PodcastEpisode
+    from .creativework import PodcastSeason
+    from .creativework import PodcastSeries
+    from .creativework import Poster
+    from .creativework import PresentationDigitalDocument
+    from .creativework import ProfilePage
+    from .creativework import PublicationIssue
+    from .creativework import PublicationVolume
+    from .creativework import QAPage
+    from .creativework import Question
+    from .creativework import Quiz
+    from .creativework import Quotation
+    from .creativework import RadioClip
+    from .creativework import RadioEpisode
+    from .creativework import RadioSeason
+    from .creativework import RadioSeries
+    from .creativework import RealEstateListing
+    from .creativework import Recipe
+    from .creativework import Recommendation
+    from .creativework import Report
+    from .creativework import ReportageNewsArticle
+    from .creativework import Review
+    from .creativework import ReviewNewsArticle
+    from .creativework import SatiricalArticle
+    from .creativework import ScholarlyArticle
+    from .creativework import Sculpture
+    from .creativework import SearchResultsPage
+    from .creativework import Season
+    from .creativework import SheetMusic
+    from .creativework import ShortStory
+    from .creativework import SiteNavigationElement
+    from .creativework import SocialMediaPosting
+    from .creativework import SoftwareApplication
+    from .creativework import SoftwareSourceCode
+    from .creativework import SpecialAnnouncement
+    from .creativework import SpreadsheetDigitalDocument
+    from .creativework import Statement
+    from .creativework import Syllabus
+    from .creativework import TVClip
+    from .creativework import TVEpisode
+    from .creativework import TVSeason
+    from .creativework import TVSeries
+    from .creativework import Table
+    from .creativework import TechArticle
+    from .creativework import TextDigitalDocument
+    from .creativework import TextObject
+    from .creativework import Thesis
+    from .creativework import UserReview
+    from .creativework import VideoGallery
+    from .creativework import VideoGame
+    from .creativework import VideoGameClip
+    from .creativework import VideoGameSeries
+    from .creativework import VideoObject
+    from .creativework import VideoObjectSnapshot
+    from .creativework import VisualArtwork
+    from .creativework import WPAdBlock
+    from .creativework import WPFooter
+    from .creativework import WPHeader
+    from .creativework import WPSideBar
+    from .creativework import WebApplication
+    from .creativework import WebContent
+    from .creativework import WebPage
+    from .creativework import WebPageElement
+    from .creativework import WebSite
+    from .event import BroadcastEvent
+    from .event import BusinessEvent
+    from .event import ChildrensEvent
+    from .event import ComedyEvent
+    from .event import CourseInstance
+    from .event import DanceEvent
+    from .event import DeliveryEvent
+    from .event import EducationEvent
+    from .event import Event
+    from .event import ExhibitionEvent
+    from .event import Festival
+    from .event import FoodEvent
+    from .event import Hackathon
+    from .event import LiteraryEvent
+    from .event import MusicEvent
+    from .event import OnDemandEvent
+    from .event import PublicationEvent
+    from .event import SaleEvent
+    from .event import ScreeningEvent
+    from .event import SocialEvent
+    from .event import SportsEvent
+    from .event import TheaterEvent
+    from .event import UserBlocks
+    from .event import UserCheckins
+    from .event import UserComments
+    from .event import UserDownloads
+    from .event import UserInteraction
+    from .event import UserLikes
+    from .event import UserPageVisits
+    from .event import UserPlays
+    from .event import UserPlusOnes
+    from .event import UserTweets
+    from .event import VisualArtsEvent
+    from .intangible import AMRadioChannel
+    from .intangible import ActionAccessSpecification
+    from .intangible import AggregateOffer
+    from .intangible import AggregateRating
+    from .intangible import AlignmentObject
+    from .intangible import Audience
+    from .intangible import BankAccount
+    from .intangible import BedDetails
+    from .intangible import BedType
+    from .intangible import BoatReservation
+    from .intangible import BoatTrip
+    from .intangible import Brand
+    from .intangible import BreadcrumbList
+    from .intangible import BroadcastChannel
+    from .intangible import BroadcastFrequencySpecification
+    from .intangible import BroadcastService
+    from .intangible import BrokerageAccount
+    from .intangible import BusReservation
+    from .intangible import BusTrip
+    from .intangible import BusinessAudience
+    from .intangible import BusinessEntityType
+    from .intangible import BusinessFunction
+    from .intangible import CDCPMDRecord
+    from .intangible import CableOrSatelliteService
+    from .intangible import CategoryCode
+    from .intangible import Class
+    from .intangible import CompoundPriceSpecification
+    from .intangible import ComputerLanguage
+    from .intangible import ConstraintNode
+    from .intangible import ContactPoint
+    from .intangible import CreditCard
+    from .intangible import CurrencyConversionService
+    from .intangible import DataFeedItem
+    from .intangible import DatedMoneySpecification
+    from .intangible import DefinedRegion
+    from .intangible import DefinedTerm
+    from .intangible import DeliveryChargeSpecification
+    from .intangible import Demand
+    from .intangible import DepositAccount
+    from .intangible import DigitalDocumentPermission
+    from .intangible import Distance
+    from .intangible import Duration
+    from .intangible import EducationalAudience
+    from .intangible import EducationalOccupationalProgram
+    from .intangible import EmployeeRole
+    from .intangible import EmployerAggregateRating
+    from .intangible import EndorsementRating
+    from .intangible import Energy
+    from .intangible import EnergyConsumptionDetails
+    from .intangible import EnergyEfficiencyEnumeration
+    from .intangible import EngineSpecification
+    from .intangible import EntryPoint
+    from .intangible import Enumeration
+    from .intangible import EventReservation
+    from .intangible import EventSeries
+    from .intangible import ExchangeRateSpecification
+    from .intangible import FMRadioChannel
+    from .intangible import FinancialIncentive
+    from .intangible import FinancialProduct
+    from .intangible import Flight
+    from .intangible import FlightReservation
+    from .intangible import FloorPlan
+    from .intangible import FoodEstablishmentReservation
+    from .intangible import FoodService
+    from .intangible import GameServer
+    from .intangible import GeoCircle
+    from .intangible import GeoCoordinates
+    from .intangible import GeoShape
+    from .intangible import GeospatialGeometry
+    from .intangible import GovernmentPermit
+    from .intangible import GovernmentService
+    from .intangible import Grant
+    from .intangible import HealthInsurancePlan
+    from .intangible import HealthPlanCostSharingSpecification
+    from .intangible import HealthPlanFormulary
+    from .intangible import HealthPlanNetwork
+    from .intangible import HowToDirection
+    from .intangible import HowToItem
+    from .intangible import HowToStep
+    from .intangible import HowToSupply
+    from .intangible import HowToTool
+    from .intangible import Intangible
+    from .intangible import InteractionCounter
+    from .intangible import InvestmentFund
+    from .intangible import InvestmentOrDeposit
+    from .intangible import Invoice
+    from .intangible import ItemList
+    from .intangible import JobPosting
+    from .intangible import Language
+    from .intangible import LinkRole
+    from .intangible import ListItem
+    from .intangible import LoanOrCredit
+    from .intangible import LocationFeatureSpecification
+    from .intangible import LodgingReservation
+    from .intangible import Mass
+    from .intangible import MeasurementTypeEnumeration
+    from .intangible import MediaEnumeration
+    from .intangible import MediaSubscription
+    from .intangible import MedicalAudience
+    from .intangible import MedicalEnumeration
+    from .intangible import MemberProgram
+    from .intangible import MemberProgramTier
+    from .intangible import MenuItem
+    from .intangible import MerchantReturnPolicy
+    from .intangible import MerchantReturnPolicySeasonalOverride
+    from .intangible import MonetaryAmount
+    from .intangible import MonetaryAmountDistribution
+    from .intangible import MonetaryGrant
+    from .intangible import MortgageLoan
+    from .intangible import NonprofitType
+    from .intangible import NutritionInformation
+    from .intangible import Observation
+    from .intangible import Occupation
+    from .intangible import OccupationalExperienceRequirements
+    from .intangible import Offer
+    from .intangible import OfferCatalog
+    from .intangible import OfferForLease
+    from .intangible import OfferForPurchase
+    from .intangible import OfferShippingDetails
+    from .intangible import OpeningHoursSpecification
+    from .intangible import Order
+    from .intangible import OrderItem
+    from .intangible import OrganizationRole
+    from .intangible import OwnershipInfo
+    from .intangible import ParcelDelivery
+    from .intangible import ParentAudience
+    from .intangible import Patient
+    from .intangible import PaymentCard
+    from .intangible import PaymentChargeSpecification
+    from .intangible import PaymentMethod
+    from .intangible import PaymentService
+    from .intangible import PeopleAudience
+    from .intangible import PerformanceRole
+    from .intangible import Permit
+    from .intangible import PostalAddress
+    from .intangible import PostalCodeRangeSpecification
+    from .intangible import PriceSpecification
+    from .intangible import ProgramMembership
+    from .intangible import Property
+    from .intangible import PropertyValue
+    from .intangible import PropertyValueSpecification
+    from .intangible import QualitativeValue
+    from .intangible import QuantitativeValue
+    from .intangible import QuantitativeValueDistribution
+    from .intangible import Quantity
+    from .intangible import RadioBroadcastService
+    from .intangible import RadioChannel
+    from .intangible import Rating
+    from .intangible import RentalCarReservation
+    from .intangible import RepaymentSpecification
+    from .intangible import Researcher
+    from .intangible import Reservation
+    from .intangible import ReservationPackage
+    from .intangible import Role
+    from .intangible import Schedule
+    from .intangible import Seat
+    from .intangible import Series
+    from .intangible import Service
+    from .intangible import ServiceChannel
+    from .intangible import ServicePeriod
+    from .intangible import ShippingConditions
+    from .intangible import ShippingDeliveryTime
+    from .intangible import ShippingRateSettings
+    from .intangible import ShippingService
+    from .intangible import SizeGroupEnumeration
+    from .intangible import SizeSpecification
+    from .intangible import SpeakableSpecification
+    from .intangible import Specialty
+    from .intangible import StatisticalPopulation
+    from .intangible import StatisticalVariable
+    from .intangible import StatusEnumeration
+    from .intangible import StructuredValue
+    from .intangible import Taxi
+    from .intangible import TaxiReservation
+    from .intangible import TaxiService
+    from .intangible import TelevisionChannel
+    from .intangible import Ticket
+    from .intangible import TouristTrip
+    from .intangible import TrainReservation
+    from .intangible import TrainTrip
+    from .intangible import Trip
+    from .intangible import TypeAndQuantityNode
+    from .intangible import UnitPriceSpecification
+    from .intangible import VirtualLocation
+    from .intangible import WarrantyPromise
+    from .intangible import WarrantyScope
+    from .intangible import WebAPI
+    from .intangible import WorkBasedProgram
+    from .misc import CssSelectorType
+    from .misc import DataType
+    from .misc import Float
+    from .misc import Integer
+    from .misc import PronounceableText
+    from .misc import URL
+    from .misc import XPathType
+    from .organization import AccountingService
+    from .organization import AdultEntertainment
+    from .organization import Airline
+    from .organization import AmusementPark
+    from .organization import AnimalShelter
+    from .organization import ArchiveOrganization
+    from .organization import ArtGallery
+    from .organization import Attorney
+    from .organization import AutoBodyShop
+    from .organization import AutoDealer
+    from .organization import AutoPartsStore
+    from .organization import AutoRental
+    from .organization import AutoRepair
+    from .organization import AutoWash
+    from .organization import AutomatedTeller
+    from .organization import AutomotiveBusiness
+    from .organization import Bakery
+    from .organization import BankOrCreditUnion
+    from .organization import BarOrPub
+    from .organization import BeautySalon
+    from .organization import BedAndBreakfast
+    from .organization import BikeStore
+    from .organization import BookStore
+    from .organization import BowlingAlley
+    from .organization import Brewery
+    from .organization import CafeOrCoffeeShop
+    from .organization import Casino
+    from .organization import ChildCare
+    from .organization import ClothingStore
+    from .organization import ComedyClub
+    from .organization import ComputerStore
+    from .organization import Consortium
+    from .organization import ConvenienceStore
+    from .organization import Cooperative
+    from .organization import Corporation
+    from .organization import CovidTestingFacility
+    from .organization import DanceGroup
+    from .organization import DaySpa
+    from .organization import Dentist
+    from .organization import DepartmentStore
+    from .organization import DiagnosticLab
+    from .organization import Distillery
+    from .organization import DryCleaningOrLaundry
+    from .organization import Electrician
+    from .organization import ElectronicsStore
+    from .organization import EmergencyService
+    from .organization import EmploymentAgency
+    from .organization import EntertainmentBusiness
+    from .organization import ExerciseGym
+    from .organization import FastFoodRestaurant
+    from .organization import FinancialService
+    from .organization import Florist
+    from .organization import FoodEstablishment
+    from .organization import FundingAgency
+    from .organization import FundingScheme
+    from .organization import FurnitureStore
+    from .organization import GardenStore
+    from .organization import GasStation
+    from .organization import GeneralContractor
+    from .organization import GolfCourse
+    from .organization import GovernmentOffice
+    from .organization import GovernmentOrganization
+    from .organization import GroceryStore
+    from .organization import HVACBusiness
+    from .organization import HairSalon
+    from .organization import HardwareStore
+    from .organization import HealthAndBeautyBusiness
+    from .organization import HealthClub
+    from .organization import HobbyShop
+    from .organization import HomeAndConstructionBusiness
+    from .organization import HomeGoodsStore
+    from .organization import Hospital
+    from .organization import Hostel
+    from .organization import Hotel
+    from .organization import HousePainter
+    from .organization import IceCreamShop
+    from .organization import IndividualPhysician
+    from .organization import InsuranceAgency
+    from .organization import InternetCafe
+    from .organization import JewelryStore
+    from .organization import LegalService
+    from .organization import Library
+    from .organization import LibrarySystem
+    from .organization import LiquorStore
+    from .organization import LocalBusiness
+    from .organization import Locksmith
+    from .organization import LodgingBusiness
+    from .organization import MedicalBusiness
+    from .organization import MedicalClinic
+    from .organization import MedicalOrganization
+    from .organization import MensClothingStore
+    from .organization import MobilePhoneStore
+    from .organization import Motel
+    from .organization import MotorcycleDealer
+    from .organization import MotorcycleRepair
+    from .organization import MovieRentalStore
+    from .organization import MovingCompany
+    from .organization import MusicGroup
+    from .organization import MusicStore
+    from .organization import NGO
+    from .organization import NailSalon
+    from .organization import NewsMediaOrganization
+    from .organization import NightClub
+    from .organization import Notary
+    from .organization import OfficeEquipmentStore
+    from .organization import OnlineBusiness
+    from .organization import OnlineStore
+    from .organization import Optician
+    from .organization import Organization
+    from .organization import OutletStore
+    from .organization import PawnShop
+    from .organization import PerformingGroup
+    from .organization import PetStore
+    from .organization import Pharmacy
+    from .organization import Physician
+    from .organization import PhysiciansOffice
+    from .organization import Plumber
+    from .organization import PoliticalParty
+    from .organization import PostOffice
+    from .organization import ProfessionalService
+    from .organization import Project
+    from .organization import PublicSwimmingPool
+    from .organization import RadioStation
+    from .organization import RealEstateAgent
+    from .organization import RecyclingCenter
+    from .organization import ResearchOrganization
+    from .organization import ResearchProject
+    from .organization import Resort
+    from .organization import Restaurant
+    from .organization import RoofingContractor
+    from .organization import SearchRescueOrganization
+    from .organization import SelfStorage
+    from .organization import ShoeStore
+    from .organization import ShoppingCenter
+    from .organization import SkiResort
+    from .organization import SportingGoodsStore
+    from .organization import SportsActivityLocation
+    from .organization import SportsClub
+    from .organization import SportsOrganization
+    from .organization import SportsTeam
+    from .organization import StadiumOrArena
+    from .organization import Store
+    from .organization import TattooParlor
+    from .organization import TelevisionStation
+    from .organization import TennisComplex
+    from .organization import TheaterGroup
+    from .organization import TireShop
+    from .organization import TouristInformationCenter
+    from .organization import ToyStore
+    from .organization import TravelAgency
+    from .organization import VacationRental
+    from .organization import VeterinaryCare
+    from .organization import WholesaleStore
+    from .organization import Winery
+    from .organization import WorkersUnion
+    from .person import Person
+    from .place import Accommodation
+    from .place import AdministrativeArea
+    from .place import Airport
+    from .place import Apartment
+    from .place import ApartmentComplex
+    from .place import Aquarium
+    from .place import Beach
+    from .place import BoatTerminal
+    from .place import BodyOfWater
+    from .place import Bridge
+    from .place import BuddhistTemple
+    from .place import BusStation
+    from .place import BusStop
+    from .place import Campground
+    from .place import CampingPitch
+    from .place import Canal
+    from .place import CatholicChurch
+    from .place import Cemetery
+    from .place import Church
+    from .place import City
+    from .place import CityHall
+    from .place import CivicStructure
+    from .place import CollegeOrUniversity
+    from .place import Continent
+    from .place import Country
+    from .place import Courthouse
+    from .place import Crematorium
+    from .place import DefenceEstablishment
+    from .place import EducationalOrganization
+    from .place import ElementarySchool
+    from .place import Embassy
+    from .place import EventVenue
+    from .place import FireStation
+    from .place import GatedResidenceCommunity
+    from .place import GovernmentBuilding
+    from .place import HighSchool
+    from .place import HinduTemple
+    from .place import HotelRoom
+    from .place import House
+    from .place import LakeBodyOfWater
+    from .place import Landform
+    from .place import LandmarksOrHistoricalBuildings
+    from .place import LegislativeBuilding
+    from .place import MeetingRoom
+    from .place import MiddleSchool
+    from .place import Mosque
+    from .place import Mountain
+    from .place import MovieTheater
+    from .place import Museum
+    from .place import MusicVenue
+    from .place import OceanBodyOfWater
+    from .place import Park
+    from .place import ParkingFacility
+    from .place import PerformingArtsTheater
+    from .place import Place
+    from .place import PlaceOfWorship
+    from .place import Playground
+    from .place import PoliceStation
+    from .place import Pond
+    from .place import Preschool
+    from .place import PublicToilet
+    from .place import RVPark
+    from .place import Reservoir
+    from .place import Residence
+    from .place import RiverBodyOfWater
+    from .place import Room
+    from .place import School
+    from .place import SchoolDistrict
+    from .place import SeaBodyOfWater
+    from .place import SingleFamilyResidence
+    from .place import State
+    from .place import SubwayStation
+    from .place import Suite
+    from .place import Synagogue
+    from .place import TaxiStand
+    from .place import TouristAttraction
+    from .place import TouristDestination
+    from .place import TrainStation
+    from .place import Volcano
+    from .place import Waterfall
+    from .place import Zoo
+    from .product import BusOrCoach
+    from .product import Car
+    from .product import Drug
+    from .product import IndividualProduct
+    from .product import Motorcycle
+    from .product import MotorizedBicycle
+    from .product import Product
+    from .product import ProductCollection
+    from .product import ProductGroup
+    from .product import ProductModel
+    from .product import SomeProducts
+    from .product import Vehicle
+    from .thing import AnatomicalStructure
+    from .thing import AnatomicalSystem
+    from .thing import ApprovedIndication
+    from .thing import Artery
+    from .thing import BioChemEntity
+    from .thing import BloodTest
+    from .thing import Bone
+    from .thing import BrainStructure
+    from .thing import ChemicalSubstance
+    from .thing import DDxElement
+    from .thing import DiagnosticProcedure
+    from .thing import DietarySupplement
+    from .thing import DoseSchedule
+    from .thing import DrugClass
+    from .thing import DrugCost
+    from .thing import DrugLegalStatus
+    from .thing import DrugStrength
+    from .thing import ExercisePlan
+    from .thing import Gene
+    from .thing import ImagingTest
+    from .thing import InfectiousDisease
+    from .thing import Joint
+    from .thing import LifestyleModification
+    from .thing import Ligament
+    from .thing import LymphaticVessel
+    from .thing import MaximumDoseSchedule
+    from .thing import MedicalCause
+    from .thing import MedicalCode
+    from .thing import MedicalCondition
+    from .thing import MedicalConditionStage
+    from .thing import MedicalContraindication
+    from .thing import MedicalDevice
+    from .thing import MedicalEntity
+    from .thing import MedicalGuideline
+    from .thing import MedicalGuidelineContraindication
+    from .thing import MedicalGuidelineRecommendation
+    from .thing import MedicalIndication
+    from .thing import MedicalIntangible
+    from .thing import MedicalObservationalStudy
+    from .thing import MedicalProcedure
+    from .thing import MedicalRiskCalculator
+    from .thing import MedicalRiskEstimator
+    from .thing import MedicalRiskFactor
+    from .thing import MedicalRiskScore
+    from .thing import MedicalSign
+    from .thing import MedicalSignOrSymptom
+    from .thing import MedicalStudy
+    from .thing import MedicalSymptom
+    from .thing import MedicalTest
+    from .thing import MedicalTestPanel
+    from .thing import MedicalTherapy
+    from .thing import MedicalTrial
+    from .thing import MolecularEntity
+    from .thing import Muscle
+    from .thing import Nerve
+    from .thing import OccupationalTherapy
+    from .thing import PalliativeProcedure
+    from .thing import PathologyTest
+    from .thing import PhysicalActivity
+    from .thing import PhysicalTherapy
+    from .thing import PreventionIndication
+    from .thing import Protein
+    from .thing import PsychologicalTreatment
+    from .thing import RadiationTherapy
+    from .thing import RecommendedDoseSchedule
+    from .thing import ReportedDoseSchedule
+    from .thing import Substance
+    from .thing import SuperficialAnatomy
+    from .thing import SurgicalProcedure
+    from .thing import Taxon
+    from .thing import TherapeuticProcedure
+    from .thing import Thing
+    from .thing import TreatmentIndication
+    from .thing import Vein
+    from .thing import Vessel
+    from .thing import VitalSign
 
 __all__ = [
     'action',
@@ -44,12 +872,10 @@ __all__ = [
     'AchieveAction',
     'Action',
     'ActionAccessSpecification',
-    
     'ActivateAction',
     'AddAction',
     'AdministrativeArea',
     'AdultEntertainment',
-    
     'AdvertiserContentArticle',
     'AggregateOffer',
     'AggregateRating',
@@ -113,15 +939,12 @@ __all__ = [
     'Blog',
     'BlogPosting',
     'BloodTest',
-    
     'BoatReservation',
     'BoatTerminal',
     'BoatTrip',
-    
     'BodyOfWater',
     'Bone',
     'Book',
-    
     'BookSeries',
     'BookStore',
     'BookmarkAction',
@@ -156,14 +979,12 @@ __all__ = [
     'Canal',
     'CancelAction',
     'Car',
-    
     'Casino',
     'CategoryCode',
     'CategoryCodeSet',
     'CatholicChurch',
     'Cemetery',
     'Certification',
-    
     'Chapter',
     'CheckAction',
     'CheckInAction',
@@ -205,7 +1026,6 @@ __all__ = [
     'ConsumeAction',
     'ContactPage',
     'ContactPoint',
-    
     'Continent',
     'ControlAction',
     'ConvenienceStore',
@@ -239,7 +1059,6 @@ __all__ = [
     'DataType',
     'Dataset',
     'DatedMoneySpecification',
-    
     'DaySpa',
     'DeactivateAction',
     'DefenceEstablishment',
@@ -249,7 +1068,6 @@ __all__ = [
     'DeleteAction',
     'DeliveryChargeSpecification',
     'DeliveryEvent',
-    
     'Demand',
     'Dentist',
     'DepartAction',
@@ -261,8 +1079,6 @@ __all__ = [
     'DietarySupplement',
     'DigitalDocument',
     'DigitalDocumentPermission',
-    
-    
     'DisagreeAction',
     'DiscoverAction',
     'DiscussionForumPosting',
@@ -275,18 +1091,13 @@ __all__ = [
     'DrawAction',
     'Drawing',
     'DrinkAction',
-    
     'Drug',
     'DrugClass',
     'DrugCost',
-    
     'DrugLegalStatus',
-    
-    
     'DrugStrength',
     'DryCleaningOrLaundry',
     'Duration',
-    
     'EatAction',
     'EducationEvent',
     'EducationalAudience',
@@ -308,17 +1119,14 @@ __all__ = [
     'Energy',
     'EnergyConsumptionDetails',
     'EnergyEfficiencyEnumeration',
-    
     'EngineSpecification',
     'EntertainmentBusiness',
     'EntryPoint',
     'Enumeration',
     'Episode',
     'Event',
-    
     'EventReservation',
     'EventSeries',
-    
     'EventVenue',
     'ExchangeRateSpecification',
     'ExerciseAction',
@@ -345,19 +1153,14 @@ __all__ = [
     'FoodEstablishmentReservation',
     'FoodEvent',
     'FoodService',
-    
     'FundingAgency',
     'FundingScheme',
     'FurnitureStore',
     'Game',
-    
-    
     'GameServer',
-    
     'GardenStore',
     'GasStation',
     'GatedResidenceCommunity',
-    
     'Gene',
     'GeneralContractor',
     'GeoCircle',
@@ -366,7 +1169,6 @@ __all__ = [
     'GeospatialGeometry',
     'GiveAction',
     'GolfCourse',
-    
     'GovernmentBuilding',
     'GovernmentOffice',
     'GovernmentOrganization',
@@ -380,7 +1182,6 @@ __all__ = [
     'HairSalon',
     'HardwareStore',
     'HealthAndBeautyBusiness',
-    
     'HealthClub',
     'HealthInsurancePlan',
     'HealthPlanCostSharingSpecification',
@@ -408,19 +1209,14 @@ __all__ = [
     'HowToTool',
     'HyperToc',
     'HyperTocEntry',
-    
     'IceCreamShop',
     'IgnoreAction',
     'ImageGallery',
     'ImageObject',
     'ImageObjectSnapshot',
     'ImagingTest',
-    
-    
-    
     'IndividualPhysician',
     'IndividualProduct',
-    
     'InfectiousDisease',
     'InformAction',
     'InsertAction',
@@ -435,9 +1231,7 @@ __all__ = [
     'InvestmentOrDeposit',
     'InviteAction',
     'Invoice',
-    
     'ItemList',
-    
     'ItemPage',
     'JewelryStore',
     'JobPosting',
@@ -449,9 +1243,7 @@ __all__ = [
     'Language',
     'LearningResource',
     'LeaveAction',
-    
     'LegalService',
-    
     'Legislation',
     'LegislationObject',
     'LegislativeBuilding',
@@ -477,22 +1269,18 @@ __all__ = [
     'LymphaticVessel',
     'Manuscript',
     'Map',
-    
     'MarryAction',
     'Mass',
     'MathSolver',
     'MaximumDoseSchedule',
-    
     'MeasurementTypeEnumeration',
     'MediaEnumeration',
     'MediaGallery',
-    
     'MediaObject',
     'MediaReview',
     'MediaReviewItem',
     'MediaSubscription',
     'MedicalAudience',
-    
     'MedicalBusiness',
     'MedicalCause',
     'MedicalClinic',
@@ -501,21 +1289,16 @@ __all__ = [
     'MedicalConditionStage',
     'MedicalContraindication',
     'MedicalDevice',
-    
     'MedicalEntity',
     'MedicalEnumeration',
-    
     'MedicalGuideline',
     'MedicalGuidelineContraindication',
     'MedicalGuidelineRecommendation',
-    
     'MedicalIndication',
     'MedicalIntangible',
     'MedicalObservationalStudy',
-    
     'MedicalOrganization',
     'MedicalProcedure',
-    
     'MedicalRiskCalculator',
     'MedicalRiskEstimator',
     'MedicalRiskFactor',
@@ -523,17 +1306,13 @@ __all__ = [
     'MedicalScholarlyArticle',
     'MedicalSign',
     'MedicalSignOrSymptom',
-    
     'MedicalStudy',
-    
     'MedicalSymptom',
     'MedicalTest',
     'MedicalTestPanel',
     'MedicalTherapy',
     'MedicalTrial',
-    
     'MedicalWebPage',
-    
     'MeetingRoom',
     'MemberProgram',
     'MemberProgramTier',
@@ -541,7 +1320,6 @@ __all__ = [
     'Menu',
     'MenuItem',
     'MenuSection',
-    
     'MerchantReturnPolicy',
     'MerchantReturnPolicySeasonalOverride',
     'Message',
@@ -571,20 +1349,16 @@ __all__ = [
     'Muscle',
     'Museum',
     'MusicAlbum',
-    
-    
     'MusicComposition',
     'MusicEvent',
     'MusicGroup',
     'MusicPlaylist',
     'MusicRecording',
     'MusicRelease',
-    
     'MusicStore',
     'MusicVenue',
     'MusicVideoObject',
     'NGO',
-    
     'NailSalon',
     'Nerve',
     'NewsArticle',
@@ -604,7 +1378,6 @@ __all__ = [
     'OfferCatalog',
     'OfferForLease',
     'OfferForPurchase',
-    
     'OfferShippingDetails',
     'OfficeEquipmentStore',
     'OnDemandEvent',
@@ -616,7 +1389,6 @@ __all__ = [
     'Order',
     'OrderAction',
     'OrderItem',
-    
     'Organization',
     'OrganizationRole',
     'OrganizeAction',
@@ -636,9 +1408,7 @@ __all__ = [
     'PaymentCard',
     'PaymentChargeSpecification',
     'PaymentMethod',
-    
     'PaymentService',
-    
     'PeopleAudience',
     'PerformAction',
     'PerformanceRole',
@@ -652,8 +1422,6 @@ __all__ = [
     'Photograph',
     'PhotographAction',
     'PhysicalActivity',
-    
-    
     'PhysicalTherapy',
     'Physician',
     'PhysiciansOffice',
@@ -680,9 +1448,7 @@ __all__ = [
     'Preschool',
     'PresentationDigitalDocument',
     'PreventionIndication',
-    
     'PriceSpecification',
-    
     'Product',
     'ProductCollection',
     'ProductGroup',
@@ -702,7 +1468,6 @@ __all__ = [
     'PublicationEvent',
     'PublicationIssue',
     'PublicationVolume',
-    
     'QAPage',
     'QualitativeValue',
     'QuantitativeValue',
@@ -731,7 +1496,6 @@ __all__ = [
     'Recommendation',
     'RecommendedDoseSchedule',
     'RecyclingCenter',
-    
     'RegisterAction',
     'RejectAction',
     'RentAction',
@@ -747,18 +1511,13 @@ __all__ = [
     'Researcher',
     'Reservation',
     'ReservationPackage',
-    
     'ReserveAction',
     'Reservoir',
     'Residence',
     'Resort',
     'Restaurant',
-    
     'ResumeAction',
     'ReturnAction',
-    
-    
-    
     'Review',
     'ReviewAction',
     'ReviewNewsArticle',
@@ -767,7 +1526,6 @@ __all__ = [
     'RoofingContractor',
     'Room',
     'RsvpAction',
-    
     'SaleEvent',
     'SatiricalArticle',
     'Schedule',
@@ -804,7 +1562,6 @@ __all__ = [
     'SiteNavigationElement',
     'SizeGroupEnumeration',
     'SizeSpecification',
-    
     'SkiResort',
     'SocialEvent',
     'SocialMediaPosting',
@@ -828,7 +1585,6 @@ __all__ = [
     'StatisticalPopulation',
     'StatisticalVariable',
     'StatusEnumeration',
-    
     'Store',
     'StructuredValue',
     'SubscribeAction',
@@ -865,7 +1621,6 @@ __all__ = [
     'Thing',
     'Ticket',
     'TieAction',
-    
     'TipAction',
     'TireShop',
     'TouristAttraction',
@@ -884,9 +1639,7 @@ __all__ = [
     'TreatmentIndication',
     'Trip',
     'TypeAndQuantityNode',
-    
     'URL',
-    
     'UnRegisterAction',
     'UnitPriceSpecification',
     'UpdateAction',
@@ -930,9 +1683,6 @@ __all__ = [
     'WatchAction',
     'Waterfall',
     'WearAction',
-    
-    
-    
     'WebAPI',
     'WebApplication',
     'WebContent',
@@ -948,3 +1698,845 @@ __all__ = [
     'XPathType',
     'Zoo',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'Model3DModel': 'creativework',
+        'AMRadioChannel': 'intangible',
+        'APIReference': 'creativework',
+        'AboutPage': 'creativework',
+        'AcceptAction': 'action',
+        'Accommodation': 'place',
+        'AccountingService': 'organization',
+        'AchieveAction': 'action',
+        'Action': 'action',
+        'ActionAccessSpecification': 'intangible',
+        'ActivateAction': 'action',
+        'AddAction': 'action',
+        'AdministrativeArea': 'place',
+        'AdultEntertainment': 'organization',
+        'AdvertiserContentArticle': 'creativework',
+        'AggregateOffer': 'intangible',
+        'AggregateRating': 'intangible',
+        'AgreeAction': 'action',
+        'Airline': 'organization',
+        'Airport': 'place',
+        'AlignmentObject': 'intangible',
+        'AllocateAction': 'action',
+        'AmpStory': 'creativework',
+        'AmusementPark': 'organization',
+        'AnalysisNewsArticle': 'creativework',
+        'AnatomicalStructure': 'thing',
+        'AnatomicalSystem': 'thing',
+        'AnimalShelter': 'organization',
+        'Answer': 'creativework',
+        'Apartment': 'place',
+        'ApartmentComplex': 'place',
+        'AppendAction': 'action',
+        'ApplyAction': 'action',
+        'ApprovedIndication': 'thing',
+        'Aquarium': 'place',
+        'ArchiveComponent': 'creativework',
+        'ArchiveOrganization': 'organization',
+        'ArriveAction': 'action',
+        'ArtGallery': 'organization',
+        'Artery': 'thing',
+        'Article': 'creativework',
+        'AskAction': 'action',
+        'AskPublicNewsArticle': 'creativework',
+        'AssessAction': 'action',
+        'AssignAction': 'action',
+        'Atlas': 'creativework',
+        'Attorney': 'organization',
+        'Audience': 'intangible',
+        'AudioObject': 'creativework',
+        'AudioObjectSnapshot': 'creativework',
+        'Audiobook': 'creativework',
+        'AuthorizeAction': 'action',
+        'AutoBodyShop': 'organization',
+        'AutoDealer': 'organization',
+        'AutoPartsStore': 'organization',
+        'AutoRental': 'organization',
+        'AutoRepair': 'organization',
+        'AutoWash': 'organization',
+        'AutomatedTeller': 'organization',
+        'AutomotiveBusiness': 'organization',
+        'BackgroundNewsArticle': 'creativework',
+        'Bakery': 'organization',
+        'BankAccount': 'intangible',
+        'BankOrCreditUnion': 'organization',
+        'BarOrPub': 'organization',
+        'Barcode': 'creativework',
+        'Beach': 'place',
+        'BeautySalon': 'organization',
+        'BedAndBreakfast': 'organization',
+        'BedDetails': 'intangible',
+        'BedType': 'intangible',
+        'BefriendAction': 'action',
+        'BikeStore': 'organization',
+        'BioChemEntity': 'thing',
+        'Blog': 'creativework',
+        'BlogPosting': 'creativework',
+        'BloodTest': 'thing',
+        'BoatReservation': 'intangible',
+        'BoatTerminal': 'place',
+        'BoatTrip': 'intangible',
+        'BodyOfWater': 'place',
+        'Bone': 'thing',
+        'Book': 'creativework',
+        'BookSeries': 'creativework',
+        'BookStore': 'organization',
+        'BookmarkAction': 'action',
+        'BorrowAction': 'action',
+        'BowlingAlley': 'organization',
+        'BrainStructure': 'thing',
+        'Brand': 'intangible',
+        'BreadcrumbList': 'intangible',
+        'Brewery': 'organization',
+        'Bridge': 'place',
+        'BroadcastChannel': 'intangible',
+        'BroadcastEvent': 'event',
+        'BroadcastFrequencySpecification': 'intangible',
+        'BroadcastService': 'intangible',
+        'BrokerageAccount': 'intangible',
+        'BuddhistTemple': 'place',
+        'BusOrCoach': 'product',
+        'BusReservation': 'intangible',
+        'BusStation': 'place',
+        'BusStop': 'place',
+        'BusTrip': 'intangible',
+        'BusinessAudience': 'intangible',
+        'BusinessEntityType': 'intangible',
+        'BusinessEvent': 'event',
+        'BusinessFunction': 'intangible',
+        'BuyAction': 'action',
+        'CDCPMDRecord': 'intangible',
+        'CableOrSatelliteService': 'intangible',
+        'CafeOrCoffeeShop': 'organization',
+        'Campground': 'place',
+        'CampingPitch': 'place',
+        'Canal': 'place',
+        'CancelAction': 'action',
+        'Car': 'product',
+        'Casino': 'organization',
+        'CategoryCode': 'intangible',
+        'CategoryCodeSet': 'creativework',
+        'CatholicChurch': 'place',
+        'Cemetery': 'place',
+        'Certification': 'creativework',
+        'Chapter': 'creativework',
+        'CheckAction': 'action',
+        'CheckInAction': 'action',
+        'CheckOutAction': 'action',
+        'CheckoutPage': 'creativework',
+        'ChemicalSubstance': 'thing',
+        'ChildCare': 'organization',
+        'ChildrensEvent': 'event',
+        'ChooseAction': 'action',
+        'Church': 'place',
+        'City': 'place',
+        'CityHall': 'place',
+        'CivicStructure': 'place',
+        'Claim': 'creativework',
+        'ClaimReview': 'creativework',
+        'Class': 'intangible',
+        'Clip': 'creativework',
+        'ClothingStore': 'organization',
+        'Code': 'creativework',
+        'Collection': 'creativework',
+        'CollectionPage': 'creativework',
+        'CollegeOrUniversity': 'place',
+        'ComedyClub': 'organization',
+        'ComedyEvent': 'event',
+        'ComicCoverArt': 'creativework',
+        'ComicIssue': 'creativework',
+        'ComicSeries': 'creativework',
+        'ComicStory': 'creativework',
+        'Comment': 'creativework',
+        'CommentAction': 'action',
+        'CommunicateAction': 'action',
+        'CompleteDataFeed': 'creativework',
+        'CompoundPriceSpecification': 'intangible',
+        'ComputerLanguage': 'intangible',
+        'ComputerStore': 'organization',
+        'ConfirmAction': 'action',
+        'Consortium': 'organization',
+        'ConstraintNode': 'intangible',
+        'ConsumeAction': 'action',
+        'ContactPage': 'creativework',
+        'ContactPoint': 'intangible',
+        'Continent': 'place',
+        'ControlAction': 'action',
+        'ConvenienceStore': 'organization',
+        'Conversation': 'creativework',
+        'CookAction': 'action',
+        'Cooperative': 'organization',
+        'Corporation': 'organization',
+        'CorrectionComment': 'creativework',
+        'Country': 'place',
+        'Course': 'creativework',
+        'CourseInstance': 'event',
+        'Courthouse': 'place',
+        'CoverArt': 'creativework',
+        'CovidTestingFacility': 'organization',
+        'CreateAction': 'action',
+        'CreativeWork': 'creativework',
+        'CreativeWorkSeason': 'creativework',
+        'CreativeWorkSeries': 'creativework',
+        'CreditCard': 'intangible',
+        'Crematorium': 'place',
+        'CriticReview': 'creativework',
+        'CssSelectorType': 'misc',
+        'CurrencyConversionService': 'intangible',
+        'DDxElement': 'thing',
+        'DanceEvent': 'event',
+        'DanceGroup': 'organization',
+        'DataCatalog': 'creativework',
+        'DataDownload': 'creativework',
+        'DataFeed': 'creativework',
+        'DataFeedItem': 'intangible',
+        'DataType': 'misc',
+        'Dataset': 'creativework',
+        'DatedMoneySpecification': 'intangible',
+        'DaySpa': 'organization',
+        'DeactivateAction': 'action',
+        'DefenceEstablishment': 'place',
+        'DefinedRegion': 'intangible',
+        'DefinedTerm': 'intangible',
+        'DefinedTermSet': 'creativework',
+        'DeleteAction': 'action',
+        'DeliveryChargeSpecification': 'intangible',
+        'DeliveryEvent': 'event',
+        'Demand': 'intangible',
+        'Dentist': 'organization',
+        'DepartAction': 'action',
+        'DepartmentStore': 'organization',
+        'DepositAccount': 'intangible',
+        'DiagnosticLab': 'organization',
+        'DiagnosticProcedure': 'thing',
+        'Diet': 'creativework',
+        'DietarySupplement': 'thing',
+        'DigitalDocument': 'creativework',
+        'DigitalDocumentPermission': 'intangible',
+        'DisagreeAction': 'action',
+        'DiscoverAction': 'action',
+        'DiscussionForumPosting': 'creativework',
+        'DislikeAction': 'action',
+        'Distance': 'intangible',
+        'Distillery': 'organization',
+        'DonateAction': 'action',
+        'DoseSchedule': 'thing',
+        'DownloadAction': 'action',
+        'DrawAction': 'action',
+        'Drawing': 'creativework',
+        'DrinkAction': 'action',
+        'Drug': 'product',
+        'DrugClass': 'thing',
+        'DrugCost': 'thing',
+        'DrugLegalStatus': 'thing',
+        'DrugStrength': 'thing',
+        'DryCleaningOrLaundry': 'organization',
+        'Duration': 'intangible',
+        'EatAction': 'action',
+        'EducationEvent': 'event',
+        'EducationalAudience': 'intangible',
+        'EducationalOccupationalCredential': 'creativework',
+        'EducationalOccupationalProgram': 'intangible',
+        'EducationalOrganization': 'place',
+        'Electrician': 'organization',
+        'ElectronicsStore': 'organization',
+        'ElementarySchool': 'place',
+        'EmailMessage': 'creativework',
+        'Embassy': 'place',
+        'EmergencyService': 'organization',
+        'EmployeeRole': 'intangible',
+        'EmployerAggregateRating': 'intangible',
+        'EmployerReview': 'creativework',
+        'EmploymentAgency': 'organization',
+        'EndorseAction': 'action',
+        'EndorsementRating': 'intangible',
+        'Energy': 'intangible',
+        'EnergyConsumptionDetails': 'intangible',
+        'EnergyEfficiencyEnumeration': 'intangible',
+        'EngineSpecification': 'intangible',
+        'EntertainmentBusiness': 'organization',
+        'EntryPoint': 'intangible',
+        'Enumeration': 'intangible',
+        'Episode': 'creativework',
+        'Event': 'event',
+        'EventReservation': 'intangible',
+        'EventSeries': 'intangible',
+        'EventVenue': 'place',
+        'ExchangeRateSpecification': 'intangible',
+        'ExerciseAction': 'action',
+        'ExerciseGym': 'organization',
+        'ExercisePlan': 'thing',
+        'ExhibitionEvent': 'event',
+        'FAQPage': 'creativework',
+        'FMRadioChannel': 'intangible',
+        'FastFoodRestaurant': 'organization',
+        'Festival': 'event',
+        'FilmAction': 'action',
+        'FinancialIncentive': 'intangible',
+        'FinancialProduct': 'intangible',
+        'FinancialService': 'organization',
+        'FindAction': 'action',
+        'FireStation': 'place',
+        'Flight': 'intangible',
+        'FlightReservation': 'intangible',
+        'Float': 'misc',
+        'FloorPlan': 'intangible',
+        'Florist': 'organization',
+        'FollowAction': 'action',
+        'FoodEstablishment': 'organization',
+        'FoodEstablishmentReservation': 'intangible',
+        'FoodEvent': 'event',
+        'FoodService': 'intangible',
+        'FundingAgency': 'organization',
+        'FundingScheme': 'organization',
+        'FurnitureStore': 'organization',
+        'Game': 'creativework',
+        'GameServer': 'intangible',
+        'GardenStore': 'organization',
+        'GasStation': 'organization',
+        'GatedResidenceCommunity': 'place',
+        'Gene': 'thing',
+        'GeneralContractor': 'organization',
+        'GeoCircle': 'intangible',
+        'GeoCoordinates': 'intangible',
+        'GeoShape': 'intangible',
+        'GeospatialGeometry': 'intangible',
+        'GiveAction': 'action',
+        'GolfCourse': 'organization',
+        'GovernmentBuilding': 'place',
+        'GovernmentOffice': 'organization',
+        'GovernmentOrganization': 'organization',
+        'GovernmentPermit': 'intangible',
+        'GovernmentService': 'intangible',
+        'Grant': 'intangible',
+        'GroceryStore': 'organization',
+        'Guide': 'creativework',
+        'HVACBusiness': 'organization',
+        'Hackathon': 'event',
+        'HairSalon': 'organization',
+        'HardwareStore': 'organization',
+        'HealthAndBeautyBusiness': 'organization',
+        'HealthClub': 'organization',
+        'HealthInsurancePlan': 'intangible',
+        'HealthPlanCostSharingSpecification': 'intangible',
+        'HealthPlanFormulary': 'intangible',
+        'HealthPlanNetwork': 'intangible',
+        'HealthTopicContent': 'creativework',
+        'HighSchool': 'place',
+        'HinduTemple': 'place',
+        'HobbyShop': 'organization',
+        'HomeAndConstructionBusiness': 'organization',
+        'HomeGoodsStore': 'organization',
+        'Hospital': 'organization',
+        'Hostel': 'organization',
+        'Hotel': 'organization',
+        'HotelRoom': 'place',
+        'House': 'place',
+        'HousePainter': 'organization',
+        'HowTo': 'creativework',
+        'HowToDirection': 'intangible',
+        'HowToItem': 'intangible',
+        'HowToSection': 'creativework',
+        'HowToStep': 'intangible',
+        'HowToSupply': 'intangible',
+        'HowToTip': 'creativework',
+        'HowToTool': 'intangible',
+        'HyperToc': 'creativework',
+        'HyperTocEntry': 'creativework',
+        'IceCreamShop': 'organization',
+        'IgnoreAction': 'action',
+        'ImageGallery': 'creativework',
+        'ImageObject': 'creativework',
+        'ImageObjectSnapshot': 'creativework',
+        'ImagingTest': 'thing',
+        'IndividualPhysician': 'organization',
+        'IndividualProduct': 'product',
+        'InfectiousDisease': 'thing',
+        'InformAction': 'action',
+        'InsertAction': 'action',
+        'InstallAction': 'action',
+        'InsuranceAgency': 'organization',
+        'Intangible': 'intangible',
+        'Integer': 'misc',
+        'InteractAction': 'action',
+        'InteractionCounter': 'intangible',
+        'InternetCafe': 'organization',
+        'InvestmentFund': 'intangible',
+        'InvestmentOrDeposit': 'intangible',
+        'InviteAction': 'action',
+        'Invoice': 'intangible',
+        'ItemList': 'intangible',
+        'ItemPage': 'creativework',
+        'JewelryStore': 'organization',
+        'JobPosting': 'intangible',
+        'JoinAction': 'action',
+        'Joint': 'thing',
+        'LakeBodyOfWater': 'place',
+        'Landform': 'place',
+        'LandmarksOrHistoricalBuildings': 'place',
+        'Language': 'intangible',
+        'LearningResource': 'creativework',
+        'LeaveAction': 'action',
+        'LegalService': 'organization',
+        'Legislation': 'creativework',
+        'LegislationObject': 'creativework',
+        'LegislativeBuilding': 'place',
+        'LendAction': 'action',
+        'Library': 'organization',
+        'LibrarySystem': 'organization',
+        'LifestyleModification': 'thing',
+        'Ligament': 'thing',
+        'LikeAction': 'action',
+        'LinkRole': 'intangible',
+        'LiquorStore': 'organization',
+        'ListItem': 'intangible',
+        'ListenAction': 'action',
+        'LiteraryEvent': 'event',
+        'LiveBlogPosting': 'creativework',
+        'LoanOrCredit': 'intangible',
+        'LocalBusiness': 'organization',
+        'LocationFeatureSpecification': 'intangible',
+        'Locksmith': 'organization',
+        'LodgingBusiness': 'organization',
+        'LodgingReservation': 'intangible',
+        'LoseAction': 'action',
+        'LymphaticVessel': 'thing',
+        'Manuscript': 'creativework',
+        'Map': 'creativework',
+        'MarryAction': 'action',
+        'Mass': 'intangible',
+        'MathSolver': 'creativework',
+        'MaximumDoseSchedule': 'thing',
+        'MeasurementTypeEnumeration': 'intangible',
+        'MediaEnumeration': 'intangible',
+        'MediaGallery': 'creativework',
+        'MediaObject': 'creativework',
+        'MediaReview': 'creativework',
+        'MediaReviewItem': 'creativework',
+        'MediaSubscription': 'intangible',
+        'MedicalAudience': 'intangible',
+        'MedicalBusiness': 'organization',
+        'MedicalCause': 'thing',
+        'MedicalClinic': 'organization',
+        'MedicalCode': 'thing',
+        'MedicalCondition': 'thing',
+        'MedicalConditionStage': 'thing',
+        'MedicalContraindication': 'thing',
+        'MedicalDevice': 'thing',
+        'MedicalEntity': 'thing',
+        'MedicalEnumeration': 'intangible',
+        'MedicalGuideline': 'thing',
+        'MedicalGuidelineContraindication': 'thing',
+        'MedicalGuidelineRecommendation': 'thing',
+        'MedicalIndication': 'thing',
+        'MedicalIntangible': 'thing',
+        'MedicalObservationalStudy': 'thing',
+        'MedicalOrganization': 'organization',
+        'MedicalProcedure': 'thing',
+        'MedicalRiskCalculator': 'thing',
+        'MedicalRiskEstimator': 'thing',
+        'MedicalRiskFactor': 'thing',
+        'MedicalRiskScore': 'thing',
+        'MedicalScholarlyArticle': 'creativework',
+        'MedicalSign': 'thing',
+        'MedicalSignOrSymptom': 'thing',
+        'MedicalStudy': 'thing',
+        'MedicalSymptom': 'thing',
+        'MedicalTest': 'thing',
+        'MedicalTestPanel': 'thing',
+        'MedicalTherapy': 'thing',
+        'MedicalTrial': 'thing',
+        'MedicalWebPage': 'creativework',
+        'MeetingRoom': 'place',
+        'MemberProgram': 'intangible',
+        'MemberProgramTier': 'intangible',
+        'MensClothingStore': 'organization',
+        'Menu': 'creativework',
+        'MenuItem': 'intangible',
+        'MenuSection': 'creativework',
+        'MerchantReturnPolicy': 'intangible',
+        'MerchantReturnPolicySeasonalOverride': 'intangible',
+        'Message': 'creativework',
+        'MiddleSchool': 'place',
+        'MobileApplication': 'creativework',
+        'MobilePhoneStore': 'organization',
+        'MolecularEntity': 'thing',
+        'MonetaryAmount': 'intangible',
+        'MonetaryAmountDistribution': 'intangible',
+        'MonetaryGrant': 'intangible',
+        'MoneyTransfer': 'action',
+        'MortgageLoan': 'intangible',
+        'Mosque': 'place',
+        'Motel': 'organization',
+        'Motorcycle': 'product',
+        'MotorcycleDealer': 'organization',
+        'MotorcycleRepair': 'organization',
+        'MotorizedBicycle': 'product',
+        'Mountain': 'place',
+        'MoveAction': 'action',
+        'Movie': 'creativework',
+        'MovieClip': 'creativework',
+        'MovieRentalStore': 'organization',
+        'MovieSeries': 'creativework',
+        'MovieTheater': 'place',
+        'MovingCompany': 'organization',
+        'Muscle': 'thing',
+        'Museum': 'place',
+        'MusicAlbum': 'creativework',
+        'MusicComposition': 'creativework',
+        'MusicEvent': 'event',
+        'MusicGroup': 'organization',
+        'MusicPlaylist': 'creativework',
+        'MusicRecording': 'creativework',
+        'MusicRelease': 'creativework',
+        'MusicStore': 'organization',
+        'MusicVenue': 'place',
+        'MusicVideoObject': 'creativework',
+        'NGO': 'organization',
+        'NailSalon': 'organization',
+        'Nerve': 'thing',
+        'NewsArticle': 'creativework',
+        'NewsMediaOrganization': 'organization',
+        'Newspaper': 'creativework',
+        'NightClub': 'organization',
+        'NonprofitType': 'intangible',
+        'Notary': 'organization',
+        'NoteDigitalDocument': 'creativework',
+        'NutritionInformation': 'intangible',
+        'Observation': 'intangible',
+        'Occupation': 'intangible',
+        'OccupationalExperienceRequirements': 'intangible',
+        'OccupationalTherapy': 'thing',
+        'OceanBodyOfWater': 'place',
+        'Offer': 'intangible',
+        'OfferCatalog': 'intangible',
+        'OfferForLease': 'intangible',
+        'OfferForPurchase': 'intangible',
+        'OfferShippingDetails': 'intangible',
+        'OfficeEquipmentStore': 'organization',
+        'OnDemandEvent': 'event',
+        'OnlineBusiness': 'organization',
+        'OnlineStore': 'organization',
+        'OpeningHoursSpecification': 'intangible',
+        'OpinionNewsArticle': 'creativework',
+        'Optician': 'organization',
+        'Order': 'intangible',
+        'OrderAction': 'action',
+        'OrderItem': 'intangible',
+        'Organization': 'organization',
+        'OrganizationRole': 'intangible',
+        'OrganizeAction': 'action',
+        'OutletStore': 'organization',
+        'OwnershipInfo': 'intangible',
+        'PaintAction': 'action',
+        'Painting': 'creativework',
+        'PalliativeProcedure': 'thing',
+        'ParcelDelivery': 'intangible',
+        'ParentAudience': 'intangible',
+        'Park': 'place',
+        'ParkingFacility': 'place',
+        'PathologyTest': 'thing',
+        'Patient': 'intangible',
+        'PawnShop': 'organization',
+        'PayAction': 'action',
+        'PaymentCard': 'intangible',
+        'PaymentChargeSpecification': 'intangible',
+        'PaymentMethod': 'intangible',
+        'PaymentService': 'intangible',
+        'PeopleAudience': 'intangible',
+        'PerformAction': 'action',
+        'PerformanceRole': 'intangible',
+        'PerformingArtsTheater': 'place',
+        'PerformingGroup': 'organization',
+        'Periodical': 'creativework',
+        'Permit': 'intangible',
+        'Person': 'person',
+        'PetStore': 'organization',
+        'Pharmacy': 'organization',
+        'Photograph': 'creativework',
+        'PhotographAction': 'action',
+        'PhysicalActivity': 'thing',
+        'PhysicalTherapy': 'thing',
+        'Physician': 'organization',
+        'PhysiciansOffice': 'organization',
+        'Place': 'place',
+        'PlaceOfWorship': 'place',
+        'PlanAction': 'action',
+        'Play': 'creativework',
+        'PlayAction': 'action',
+        'PlayGameAction': 'action',
+        'Playground': 'place',
+        'Plumber': 'organization',
+        'PodcastEpisode': 'creativework',
+        'PodcastSeason': 'creativework',
+        'PodcastSeries': 'creativework',
+        'PoliceStation': 'place',
+        'PoliticalParty': 'organization',
+        'Pond': 'place',
+        'PostOffice': 'organization',
+        'PostalAddress': 'intangible',
+        'PostalCodeRangeSpecification': 'intangible',
+        'Poster': 'creativework',
+        'PreOrderAction': 'action',
+        'PrependAction': 'action',
+        'Preschool': 'place',
+        'PresentationDigitalDocument': 'creativework',
+        'PreventionIndication': 'thing',
+        'PriceSpecification': 'intangible',
+        'Product': 'product',
+        'ProductCollection': 'product',
+        'ProductGroup': 'product',
+        'ProductModel': 'product',
+        'ProfessionalService': 'organization',
+        'ProfilePage': 'creativework',
+        'ProgramMembership': 'intangible',
+        'Project': 'organization',
+        'PronounceableText': 'misc',
+        'Property': 'intangible',
+        'PropertyValue': 'intangible',
+        'PropertyValueSpecification': 'intangible',
+        'Protein': 'thing',
+        'PsychologicalTreatment': 'thing',
+        'PublicSwimmingPool': 'organization',
+        'PublicToilet': 'place',
+        'PublicationEvent': 'event',
+        'PublicationIssue': 'creativework',
+        'PublicationVolume': 'creativework',
+        'QAPage': 'creativework',
+        'QualitativeValue': 'intangible',
+        'QuantitativeValue': 'intangible',
+        'QuantitativeValueDistribution': 'intangible',
+        'Quantity': 'intangible',
+        'Question': 'creativework',
+        'Quiz': 'creativework',
+        'Quotation': 'creativework',
+        'QuoteAction': 'action',
+        'RVPark': 'place',
+        'RadiationTherapy': 'thing',
+        'RadioBroadcastService': 'intangible',
+        'RadioChannel': 'intangible',
+        'RadioClip': 'creativework',
+        'RadioEpisode': 'creativework',
+        'RadioSeason': 'creativework',
+        'RadioSeries': 'creativework',
+        'RadioStation': 'organization',
+        'Rating': 'intangible',
+        'ReactAction': 'action',
+        'ReadAction': 'action',
+        'RealEstateAgent': 'organization',
+        'RealEstateListing': 'creativework',
+        'ReceiveAction': 'action',
+        'Recipe': 'creativework',
+        'Recommendation': 'creativework',
+        'RecommendedDoseSchedule': 'thing',
+        'RecyclingCenter': 'organization',
+        'RegisterAction': 'action',
+        'RejectAction': 'action',
+        'RentAction': 'action',
+        'RentalCarReservation': 'intangible',
+        'RepaymentSpecification': 'intangible',
+        'ReplaceAction': 'action',
+        'ReplyAction': 'action',
+        'Report': 'creativework',
+        'ReportageNewsArticle': 'creativework',
+        'ReportedDoseSchedule': 'thing',
+        'ResearchOrganization': 'organization',
+        'ResearchProject': 'organization',
+        'Researcher': 'intangible',
+        'Reservation': 'intangible',
+        'ReservationPackage': 'intangible',
+        'ReserveAction': 'action',
+        'Reservoir': 'place',
+        'Residence': 'place',
+        'Resort': 'organization',
+        'Restaurant': 'organization',
+        'ResumeAction': 'action',
+        'ReturnAction': 'action',
+        'Review': 'creativework',
+        'ReviewAction': 'action',
+        'ReviewNewsArticle': 'creativework',
+        'RiverBodyOfWater': 'place',
+        'Role': 'intangible',
+        'RoofingContractor': 'organization',
+        'Room': 'place',
+        'RsvpAction': 'action',
+        'SaleEvent': 'event',
+        'SatiricalArticle': 'creativework',
+        'Schedule': 'intangible',
+        'ScheduleAction': 'action',
+        'ScholarlyArticle': 'creativework',
+        'School': 'place',
+        'SchoolDistrict': 'place',
+        'ScreeningEvent': 'event',
+        'Sculpture': 'creativework',
+        'SeaBodyOfWater': 'place',
+        'SearchAction': 'action',
+        'SearchRescueOrganization': 'organization',
+        'SearchResultsPage': 'creativework',
+        'Season': 'creativework',
+        'Seat': 'intangible',
+        'SeekToAction': 'action',
+        'SelfStorage': 'organization',
+        'SellAction': 'action',
+        'SendAction': 'action',
+        'Series': 'intangible',
+        'Service': 'intangible',
+        'ServiceChannel': 'intangible',
+        'ServicePeriod': 'intangible',
+        'ShareAction': 'action',
+        'SheetMusic': 'creativework',
+        'ShippingConditions': 'intangible',
+        'ShippingDeliveryTime': 'intangible',
+        'ShippingRateSettings': 'intangible',
+        'ShippingService': 'intangible',
+        'ShoeStore': 'organization',
+        'ShoppingCenter': 'organization',
+        'ShortStory': 'creativework',
+        'SingleFamilyResidence': 'place',
+        'SiteNavigationElement': 'creativework',
+        'SizeGroupEnumeration': 'intangible',
+        'SizeSpecification': 'intangible',
+        'SkiResort': 'organization',
+        'SocialEvent': 'event',
+        'SocialMediaPosting': 'creativework',
+        'SoftwareApplication': 'creativework',
+        'SoftwareSourceCode': 'creativework',
+        'SolveMathAction': 'action',
+        'SomeProducts': 'product',
+        'SpeakableSpecification': 'intangible',
+        'SpecialAnnouncement': 'creativework',
+        'Specialty': 'intangible',
+        'SportingGoodsStore': 'organization',
+        'SportsActivityLocation': 'organization',
+        'SportsClub': 'organization',
+        'SportsEvent': 'event',
+        'SportsOrganization': 'organization',
+        'SportsTeam': 'organization',
+        'SpreadsheetDigitalDocument': 'creativework',
+        'StadiumOrArena': 'organization',
+        'State': 'place',
+        'Statement': 'creativework',
+        'StatisticalPopulation': 'intangible',
+        'StatisticalVariable': 'intangible',
+        'StatusEnumeration': 'intangible',
+        'Store': 'organization',
+        'StructuredValue': 'intangible',
+        'SubscribeAction': 'action',
+        'Substance': 'thing',
+        'SubwayStation': 'place',
+        'Suite': 'place',
+        'SuperficialAnatomy': 'thing',
+        'SurgicalProcedure': 'thing',
+        'SuspendAction': 'action',
+        'Syllabus': 'creativework',
+        'Synagogue': 'place',
+        'TVClip': 'creativework',
+        'TVEpisode': 'creativework',
+        'TVSeason': 'creativework',
+        'TVSeries': 'creativework',
+        'Table': 'creativework',
+        'TakeAction': 'action',
+        'TattooParlor': 'organization',
+        'Taxi': 'intangible',
+        'TaxiReservation': 'intangible',
+        'TaxiService': 'intangible',
+        'TaxiStand': 'place',
+        'Taxon': 'thing',
+        'TechArticle': 'creativework',
+        'TelevisionChannel': 'intangible',
+        'TelevisionStation': 'organization',
+        'TennisComplex': 'organization',
+        'TextDigitalDocument': 'creativework',
+        'TextObject': 'creativework',
+        'TheaterEvent': 'event',
+        'TheaterGroup': 'organization',
+        'TherapeuticProcedure': 'thing',
+        'Thesis': 'creativework',
+        'Thing': 'thing',
+        'Ticket': 'intangible',
+        'TieAction': 'action',
+        'TipAction': 'action',
+        'TireShop': 'organization',
+        'TouristAttraction': 'place',
+        'TouristDestination': 'place',
+        'TouristInformationCenter': 'organization',
+        'TouristTrip': 'intangible',
+        'ToyStore': 'organization',
+        'TrackAction': 'action',
+        'TradeAction': 'action',
+        'TrainReservation': 'intangible',
+        'TrainStation': 'place',
+        'TrainTrip': 'intangible',
+        'TransferAction': 'action',
+        'TravelAction': 'action',
+        'TravelAgency': 'organization',
+        'TreatmentIndication': 'thing',
+        'Trip': 'intangible',
+        'TypeAndQuantityNode': 'intangible',
+        'URL': 'misc',
+        'UnRegisterAction': 'action',
+        'UnitPriceSpecification': 'intangible',
+        'UpdateAction': 'action',
+        'UseAction': 'action',
+        'UserBlocks': 'event',
+        'UserCheckins': 'event',
+        'UserComments': 'event',
+        'UserDownloads': 'event',
+        'UserInteraction': 'event',
+        'UserLikes': 'event',
+        'UserPageVisits': 'event',
+        'UserPlays': 'event',
+        'UserPlusOnes': 'event',
+        'UserReview': 'creativework',
+        'UserTweets': 'event',
+        'VacationRental': 'organization',
+        'Vehicle': 'product',
+        'Vein': 'thing',
+        'Vessel': 'thing',
+        'VeterinaryCare': 'organization',
+        'VideoGallery': 'creativework',
+        'VideoGame': 'creativework',
+        'VideoGameClip': 'creativework',
+        'VideoGameSeries': 'creativework',
+        'VideoObject': 'creativework',
+        'VideoObjectSnapshot': 'creativework',
+        'ViewAction': 'action',
+        'VirtualLocation': 'intangible',
+        'VisualArtsEvent': 'event',
+        'VisualArtwork': 'creativework',
+        'VitalSign': 'thing',
+        'Volcano': 'place',
+        'VoteAction': 'action',
+        'WPAdBlock': 'creativework',
+        'WPFooter': 'creativework',
+        'WPHeader': 'creativework',
+        'WPSideBar': 'creativework',
+        'WantAction': 'action',
+        'WarrantyPromise': 'intangible',
+        'WarrantyScope': 'intangible',
+        'WatchAction': 'action',
+        'Waterfall': 'place',
+        'WearAction': 'action',
+        'WebAPI': 'intangible',
+        'WebApplication': 'creativework',
+        'WebContent': 'creativework',
+        'WebPage': 'creativework',
+        'WebPageElement': 'creativework',
+        'WebSite': 'creativework',
+        'WholesaleStore': 'organization',
+        'WinAction': 'action',
+        'Winery': 'organization',
+        'WorkBasedProgram': 'intangible',
+        'WorkersUnion': 'organization',
+        'WriteAction': 'action',
+        'XPathType': 'misc',
+        'Zoo': 'place',
+    },
+    submodules=['action', 'creativework', 'event', 'intangible', 'misc', 'organization', 'person', 'place', 'product', 'thing'],
+)
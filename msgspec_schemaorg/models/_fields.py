@@ -0,0 +1,3514 @@
+"""Schema.org properties of the generated models.
+
+Maps every class name to its parent class name and to the properties the
+class declares itself, by field name: the Schema.org property name, its IRI
+and the names of its range types, most specific first.
+"""
+
+CLASSES = {
+    'AMRadioChannel': ('RadioChannel', {}),
+    'APIReference': ('TechArticle', {
+        'executableLibraryName': ('executableLibraryName', 'http://schema.org/executableLibraryName', ('Text',)),
+        'targetPlatform': ('targetPlatform', 'http://schema.org/targetPlatform', ('Text',)),
+        'programmingModel': ('programmingModel', 'http://schema.org/programmingModel', ('Text',)),
+        'assembly': ('assembly', 'http://schema.org/assembly', ('Text',)),
+        'assemblyVersion': ('assemblyVersion', 'http://schema.org/assemblyVersion', ('Text',)),
+    }),
+    'AboutPage': ('WebPage', {}),
+    'AcceptAction': ('AllocateAction', {}),
+    'Accommodation': ('Place', {
+        'permittedUsage': ('permittedUsage', 'http://schema.org/permittedUsage', ('Text',)),
+        'floorLevel': ('floorLevel', 'http://schema.org/floorLevel', ('Text',)),
+        'yearBuilt': ('yearBuilt', 'http://schema.org/yearBuilt', ('Number',)),
+        'accommodationFloorPlan': ('accommodationFloorPlan', 'http://schema.org/accommodationFloorPlan', ('FloorPlan',)),
+        'numberOfFullBathrooms': ('numberOfFullBathrooms', 'http://schema.org/numberOfFullBathrooms', ('Number',)),
+        'occupancy': ('occupancy', 'http://schema.org/occupancy', ('QuantitativeValue',)),
+        'leaseLength': ('leaseLength', 'http://schema.org/leaseLength', ('Duration', 'QuantitativeValue')),
+        'numberOfPartialBathrooms': ('numberOfPartialBathrooms', 'http://schema.org/numberOfPartialBathrooms', ('Number',)),
+        'tourBookingPage': ('tourBookingPage', 'http://schema.org/tourBookingPage', ('URL',)),
+        'floorSize': ('floorSize', 'http://schema.org/floorSize', ('QuantitativeValue',)),
+        'numberOfBedrooms': ('numberOfBedrooms', 'http://schema.org/numberOfBedrooms', ('Number', 'QuantitativeValue')),
+        'numberOfRooms': ('numberOfRooms', 'http://schema.org/numberOfRooms', ('Number', 'QuantitativeValue')),
+        'numberOfBathroomsTotal': ('numberOfBathroomsTotal', 'http://schema.org/numberOfBathroomsTotal', ('Integer',)),
+        'amenityFeature': ('amenityFeature', 'http://schema.org/amenityFeature', ('LocationFeatureSpecification',)),
+        'petsAllowed': ('petsAllowed', 'http://schema.org/petsAllowed', ('Boolean', 'Text')),
+        'accommodationCategory': ('accommodationCategory', 'http://schema.org/accommodationCategory', ('Text',)),
+        'bed': ('bed', 'http://schema.org/bed', ('Text', 'BedDetails', 'BedType')),
+    }),
+    'AccountingService': ('FinancialService', {}),
+    'AchieveAction': ('Action', {}),
+    'Action': ('Thing', {
+        'startTime': ('startTime', 'http://schema.org/startTime', ('DateTime', 'Time')),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'actionStatus': ('actionStatus', 'http://schema.org/actionStatus', ('ActionStatusType',)),
+        'object': ('object', 'http://schema.org/object', ('Thing',)),
+        'actionProcess': ('actionProcess', 'http://schema.org/actionProcess', ('HowTo',)),
+        'target': ('target', 'http://schema.org/target', ('URL', 'EntryPoint')),
+        'location': ('location', 'http://schema.org/location', ('Text', 'VirtualLocation', 'PostalAddress', 'Place')),
+        'instrument': ('instrument', 'http://schema.org/instrument', ('Thing',)),
+        'endTime': ('endTime', 'http://schema.org/endTime', ('DateTime', 'Time')),
+        'result': ('result', 'http://schema.org/result', ('Thing',)),
+        'error': ('error', 'http://schema.org/error', ('Thing',)),
+        'participant': ('participant', 'http://schema.org/participant', ('Organization', 'Person')),
+        'agent': ('agent', 'http://schema.org/agent', ('Organization', 'Person')),
+    }),
+    'ActionAccessSpecification': ('Intangible', {
+        'eligibleRegion': ('eligibleRegion', 'http://schema.org/eligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'requiresSubscription': ('requiresSubscription', 'http://schema.org/requiresSubscription', ('Boolean', 'MediaSubscription')),
+        'ineligibleRegion': ('ineligibleRegion', 'http://schema.org/ineligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'availabilityStarts': ('availabilityStarts', 'http://schema.org/availabilityStarts', ('DateTime', 'Date', 'Time')),
+        'availabilityEnds': ('availabilityEnds', 'http://schema.org/availabilityEnds', ('DateTime', 'Date', 'Time')),
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+        'expectsAcceptanceOf': ('expectsAcceptanceOf', 'http://schema.org/expectsAcceptanceOf', ('Offer',)),
+    }),
+    'ActivateAction': ('ControlAction', {}),
+    'AddAction': ('UpdateAction', {}),
+    'AdministrativeArea': ('Place', {}),
+    'AdultEntertainment': ('EntertainmentBusiness', {}),
+    'AdvertiserContentArticle': ('Article', {}),
+    'AggregateOffer': ('Offer', {
+        'highPrice': ('highPrice', 'http://schema.org/highPrice', ('Number', 'Text')),
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'lowPrice': ('lowPrice', 'http://schema.org/lowPrice', ('Number', 'Text')),
+        'offerCount': ('offerCount', 'http://schema.org/offerCount', ('Integer',)),
+    }),
+    'AggregateRating': ('Rating', {
+        'reviewCount': ('reviewCount', 'http://schema.org/reviewCount', ('Integer',)),
+        'itemReviewed': ('itemReviewed', 'http://schema.org/itemReviewed', ('Thing',)),
+        'ratingCount': ('ratingCount', 'http://schema.org/ratingCount', ('Integer',)),
+    }),
+    'AgreeAction': ('ReactAction', {}),
+    'Airline': ('Organization', {
+        'boardingPolicy': ('boardingPolicy', 'http://schema.org/boardingPolicy', ('BoardingPolicyType',)),
+        'iataCode': ('iataCode', 'http://schema.org/iataCode', ('Text',)),
+    }),
+    'Airport': ('CivicStructure', {
+        'iataCode': ('iataCode', 'http://schema.org/iataCode', ('Text',)),
+        'icaoCode': ('icaoCode', 'http://schema.org/icaoCode', ('Text',)),
+    }),
+    'AlignmentObject': ('Intangible', {
+        'targetName': ('targetName', 'http://schema.org/targetName', ('Text',)),
+        'targetDescription': ('targetDescription', 'http://schema.org/targetDescription', ('Text',)),
+        'educationalFramework': ('educationalFramework', 'http://schema.org/educationalFramework', ('Text',)),
+        'alignmentType': ('alignmentType', 'http://schema.org/alignmentType', ('Text',)),
+        'targetUrl': ('targetUrl', 'http://schema.org/targetUrl', ('URL',)),
+    }),
+    'AllocateAction': ('OrganizeAction', {}),
+    'AmpStory': ('MediaObject', {}),
+    'AmusementPark': ('EntertainmentBusiness', {}),
+    'AnalysisNewsArticle': ('NewsArticle', {}),
+    'AnatomicalStructure': ('MedicalEntity', {
+        'subStructure': ('subStructure', 'http://schema.org/subStructure', ('AnatomicalStructure',)),
+        'associatedPathophysiology': ('associatedPathophysiology', 'http://schema.org/associatedPathophysiology', ('Text',)),
+        'diagram': ('diagram', 'http://schema.org/diagram', ('ImageObject',)),
+        'relatedTherapy': ('relatedTherapy', 'http://schema.org/relatedTherapy', ('MedicalTherapy',)),
+        'relatedCondition': ('relatedCondition', 'http://schema.org/relatedCondition', ('MedicalCondition',)),
+        'connectedTo': ('connectedTo', 'http://schema.org/connectedTo', ('AnatomicalStructure',)),
+        'partOfSystem': ('partOfSystem', 'http://schema.org/partOfSystem', ('AnatomicalSystem',)),
+        'bodyLocation': ('bodyLocation', 'http://schema.org/bodyLocation', ('Text',)),
+    }),
+    'AnatomicalSystem': ('MedicalEntity', {
+        'associatedPathophysiology': ('associatedPathophysiology', 'http://schema.org/associatedPathophysiology', ('Text',)),
+        'relatedTherapy': ('relatedTherapy', 'http://schema.org/relatedTherapy', ('MedicalTherapy',)),
+        'relatedCondition': ('relatedCondition', 'http://schema.org/relatedCondition', ('MedicalCondition',)),
+        'comprisedOf': ('comprisedOf', 'http://schema.org/comprisedOf', ('AnatomicalStructure', 'AnatomicalSystem')),
+        'relatedStructure': ('relatedStructure', 'http://schema.org/relatedStructure', ('AnatomicalStructure',)),
+    }),
+    'AnimalShelter': ('LocalBusiness', {}),
+    'Answer': ('Comment', {
+        'parentItem': ('parentItem', 'http://schema.org/parentItem', ('Comment', 'CreativeWork')),
+        'answerExplanation': ('answerExplanation', 'http://schema.org/answerExplanation', ('WebContent', 'Comment')),
+    }),
+    'Apartment': ('Accommodation', {
+        'occupancy': ('occupancy', 'http://schema.org/occupancy', ('QuantitativeValue',)),
+        'numberOfRooms': ('numberOfRooms', 'http://schema.org/numberOfRooms', ('Number', 'QuantitativeValue')),
+    }),
+    'ApartmentComplex': ('Residence', {
+        'tourBookingPage': ('tourBookingPage', 'http://schema.org/tourBookingPage', ('URL',)),
+        'numberOfAvailableAccommodationUnits': ('numberOfAvailableAccommodationUnits', 'http://schema.org/numberOfAvailableAccommodationUnits', ('QuantitativeValue',)),
+        'numberOfAccommodationUnits': ('numberOfAccommodationUnits', 'http://schema.org/numberOfAccommodationUnits', ('QuantitativeValue',)),
+        'numberOfBedrooms': ('numberOfBedrooms', 'http://schema.org/numberOfBedrooms', ('Number', 'QuantitativeValue')),
+        'petsAllowed': ('petsAllowed', 'http://schema.org/petsAllowed', ('Boolean', 'Text')),
+    }),
+    'AppendAction': ('InsertAction', {}),
+    'ApplyAction': ('OrganizeAction', {}),
+    'ApprovedIndication': ('MedicalIndication', {}),
+    'Aquarium': ('CivicStructure', {}),
+    'ArchiveComponent': ('CreativeWork', {
+        'itemLocation': ('itemLocation', 'http://schema.org/itemLocation', ('Text', 'PostalAddress', 'Place')),
+        'holdingArchive': ('holdingArchive', 'http://schema.org/holdingArchive', ('ArchiveOrganization',)),
+    }),
+    'ArchiveOrganization': ('LocalBusiness', {
+        'archiveHeld': ('archiveHeld', 'http://schema.org/archiveHeld', ('ArchiveComponent',)),
+    }),
+    'ArriveAction': ('MoveAction', {}),
+    'ArtGallery': ('EntertainmentBusiness', {}),
+    'Artery': ('Vessel', {
+        'arterialBranch': ('arterialBranch', 'http://schema.org/arterialBranch', ('AnatomicalStructure',)),
+        'supplyTo': ('supplyTo', 'http://schema.org/supplyTo', ('AnatomicalStructure',)),
+    }),
+    'Article': ('CreativeWork', {
+        'pageStart': ('pageStart', 'http://schema.org/pageStart', ('Integer', 'Text')),
+        'wordCount': ('wordCount', 'http://schema.org/wordCount', ('Integer',)),
+        'pagination': ('pagination', 'http://schema.org/pagination', ('Text',)),
+        'pageEnd': ('pageEnd', 'http://schema.org/pageEnd', ('Integer', 'Text')),
+        'speakable': ('speakable', 'http://schema.org/speakable', ('URL', 'SpeakableSpecification')),
+        'backstory': ('backstory', 'http://schema.org/backstory', ('Text', 'CreativeWork')),
+        'articleSection': ('articleSection', 'http://schema.org/articleSection', ('Text',)),
+        'articleBody': ('articleBody', 'http://schema.org/articleBody', ('Text',)),
+    }),
+    'AskAction': ('CommunicateAction', {
+        'question': ('question', 'http://schema.org/question', ('Question',)),
+    }),
+    'AskPublicNewsArticle': ('NewsArticle', {}),
+    'AssessAction': ('Action', {}),
+    'AssignAction': ('AllocateAction', {}),
+    'Atlas': ('CreativeWork', {}),
+    'Attorney': ('LegalService', {}),
+    'Audience': ('Intangible', {
+        'geographicArea': ('geographicArea', 'http://schema.org/geographicArea', ('AdministrativeArea',)),
+        'audienceType': ('audienceType', 'http://schema.org/audienceType', ('Text',)),
+    }),
+    'AudioObject': ('MediaObject', {
+        'caption': ('caption', 'http://schema.org/caption', ('Text', 'MediaObject')),
+        'transcript': ('transcript', 'http://schema.org/transcript', ('Text',)),
+        'embeddedTextCaption': ('embeddedTextCaption', 'http://schema.org/embeddedTextCaption', ('Text',)),
+    }),
+    'AudioObjectSnapshot': ('AudioObject', {}),
+    'Audiobook': ('Book', {
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'readBy': ('readBy', 'http://schema.org/readBy', ('Person',)),
+    }),
+    'AuthorizeAction': ('AllocateAction', {
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+    }),
+    'AutoBodyShop': ('AutomotiveBusiness', {}),
+    'AutoDealer': ('AutomotiveBusiness', {}),
+    'AutoPartsStore': ('AutomotiveBusiness', {}),
+    'AutoRental': ('AutomotiveBusiness', {}),
+    'AutoRepair': ('AutomotiveBusiness', {}),
+    'AutoWash': ('AutomotiveBusiness', {}),
+    'AutomatedTeller': ('FinancialService', {}),
+    'AutomotiveBusiness': ('LocalBusiness', {}),
+    'BackgroundNewsArticle': ('NewsArticle', {}),
+    'Bakery': ('FoodEstablishment', {}),
+    'BankAccount': ('FinancialProduct', {
+        'accountOverdraftLimit': ('accountOverdraftLimit', 'http://schema.org/accountOverdraftLimit', ('MonetaryAmount',)),
+        'accountMinimumInflow': ('accountMinimumInflow', 'http://schema.org/accountMinimumInflow', ('MonetaryAmount',)),
+        'bankAccountType': ('bankAccountType', 'http://schema.org/bankAccountType', ('URL', 'Text')),
+    }),
+    'BankOrCreditUnion': ('FinancialService', {}),
+    'BarOrPub': ('FoodEstablishment', {}),
+    'Barcode': ('ImageObject', {}),
+    'Beach': ('CivicStructure', {}),
+    'BeautySalon': ('HealthAndBeautyBusiness', {}),
+    'BedAndBreakfast': ('LodgingBusiness', {}),
+    'BedDetails': ('Intangible', {
+        'typeOfBed': ('typeOfBed', 'http://schema.org/typeOfBed', ('Text', 'BedType')),
+        'numberOfBeds': ('numberOfBeds', 'http://schema.org/numberOfBeds', ('Number',)),
+    }),
+    'BedType': ('QualitativeValue', {}),
+    'BefriendAction': ('InteractAction', {}),
+    'BikeStore': ('Store', {}),
+    'BioChemEntity': ('Thing', {
+        'taxonomicRange': ('taxonomicRange', 'http://schema.org/taxonomicRange', ('URL', 'Text', 'Taxon', 'DefinedTerm')),
+        'hasBioChemEntityPart': ('hasBioChemEntityPart', 'http://schema.org/hasBioChemEntityPart', ('BioChemEntity',)),
+        'associatedDisease': ('associatedDisease', 'http://schema.org/associatedDisease', ('URL', 'PropertyValue', 'MedicalCondition')),
+        'funding': ('funding', 'http://schema.org/funding', ('Grant',)),
+        'bioChemInteraction': ('bioChemInteraction', 'http://schema.org/bioChemInteraction', ('BioChemEntity',)),
+        'isEncodedByBioChemEntity': ('isEncodedByBioChemEntity', 'http://schema.org/isEncodedByBioChemEntity', ('Gene',)),
+        'isInvolvedInBiologicalProcess': ('isInvolvedInBiologicalProcess', 'http://schema.org/isInvolvedInBiologicalProcess', ('URL', 'PropertyValue', 'DefinedTerm')),
+        'hasMolecularFunction': ('hasMolecularFunction', 'http://schema.org/hasMolecularFunction', ('URL', 'DefinedTerm', 'PropertyValue')),
+        'biologicalRole': ('biologicalRole', 'http://schema.org/biologicalRole', ('DefinedTerm',)),
+        'bioChemSimilarity': ('bioChemSimilarity', 'http://schema.org/bioChemSimilarity', ('BioChemEntity',)),
+        'hasRepresentation': ('hasRepresentation', 'http://schema.org/hasRepresentation', ('URL', 'Text', 'PropertyValue')),
+        'isPartOfBioChemEntity': ('isPartOfBioChemEntity', 'http://schema.org/isPartOfBioChemEntity', ('BioChemEntity',)),
+        'isLocatedInSubcellularLocation': ('isLocatedInSubcellularLocation', 'http://schema.org/isLocatedInSubcellularLocation', ('URL', 'PropertyValue', 'DefinedTerm')),
+    }),
+    'Blog': ('CreativeWork', {
+        'blogPost': ('blogPost', 'http://schema.org/blogPost', ('BlogPosting',)),
+        'blogPosts': ('blogPosts', 'http://schema.org/blogPosts', ('BlogPosting',)),
+        'issn': ('issn', 'http://schema.org/issn', ('Text',)),
+    }),
+    'BlogPosting': ('SocialMediaPosting', {}),
+    'BloodTest': ('MedicalTest', {}),
+    'BoatReservation': ('Reservation', {}),
+    'BoatTerminal': ('CivicStructure', {}),
+    'BoatTrip': ('Trip', {
+        'departureBoatTerminal': ('departureBoatTerminal', 'http://schema.org/departureBoatTerminal', ('BoatTerminal',)),
+        'arrivalBoatTerminal': ('arrivalBoatTerminal', 'http://schema.org/arrivalBoatTerminal', ('BoatTerminal',)),
+    }),
+    'BodyOfWater': ('Landform', {}),
+    'Bone': ('AnatomicalStructure', {}),
+    'Book': ('CreativeWork', {
+        'bookEdition': ('bookEdition', 'http://schema.org/bookEdition', ('Text',)),
+        'isbn': ('isbn', 'http://schema.org/isbn', ('Text',)),
+        'bookFormat': ('bookFormat', 'http://schema.org/bookFormat', ('BookFormatType',)),
+        'numberOfPages': ('numberOfPages', 'http://schema.org/numberOfPages', ('Integer',)),
+        'abridged': ('abridged', 'http://schema.org/abridged', ('Boolean',)),
+        'illustrator': ('illustrator', 'http://schema.org/illustrator', ('Person',)),
+    }),
+    'BookSeries': ('CreativeWorkSeries', {}),
+    'BookStore': ('Store', {}),
+    'BookmarkAction': ('OrganizeAction', {}),
+    'BorrowAction': ('TransferAction', {
+        'lender': ('lender', 'http://schema.org/lender', ('Organization', 'Person')),
+    }),
+    'BowlingAlley': ('SportsActivityLocation', {}),
+    'BrainStructure': ('AnatomicalStructure', {}),
+    'Brand': ('Intangible', {
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'slogan': ('slogan', 'http://schema.org/slogan', ('Text',)),
+        'logo': ('logo', 'http://schema.org/logo', ('URL', 'ImageObject')),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+    }),
+    'BreadcrumbList': ('ItemList', {}),
+    'Brewery': ('FoodEstablishment', {}),
+    'Bridge': ('CivicStructure', {}),
+    'BroadcastChannel': ('Intangible', {
+        'inBroadcastLineup': ('inBroadcastLineup', 'http://schema.org/inBroadcastLineup', ('CableOrSatelliteService',)),
+        'broadcastFrequency': ('broadcastFrequency', 'http://schema.org/broadcastFrequency', ('Text', 'BroadcastFrequencySpecification')),
+        'broadcastServiceTier': ('broadcastServiceTier', 'http://schema.org/broadcastServiceTier', ('Text',)),
+        'providesBroadcastService': ('providesBroadcastService', 'http://schema.org/providesBroadcastService', ('BroadcastService',)),
+        'broadcastChannelId': ('broadcastChannelId', 'http://schema.org/broadcastChannelId', ('Text',)),
+        'genre': ('genre', 'http://schema.org/genre', ('URL', 'Text')),
+    }),
+    'BroadcastEvent': ('PublicationEvent', {
+        'isLiveBroadcast': ('isLiveBroadcast', 'http://schema.org/isLiveBroadcast', ('Boolean',)),
+        'subtitleLanguage': ('subtitleLanguage', 'http://schema.org/subtitleLanguage', ('Text', 'Language')),
+        'videoFormat': ('videoFormat', 'http://schema.org/videoFormat', ('Text',)),
+        'broadcastOfEvent': ('broadcastOfEvent', 'http://schema.org/broadcastOfEvent', ('Event',)),
+    }),
+    'BroadcastFrequencySpecification': ('Intangible', {
+        'broadcastFrequencyValue': ('broadcastFrequencyValue', 'http://schema.org/broadcastFrequencyValue', ('Number', 'QuantitativeValue')),
+        'broadcastSignalModulation': ('broadcastSignalModulation', 'http://schema.org/broadcastSignalModulation', ('Text', 'QualitativeValue')),
+        'broadcastSubChannel': ('broadcastSubChannel', 'http://schema.org/broadcastSubChannel', ('Text',)),
+    }),
+    'BroadcastService': ('Service', {
+        'broadcastAffiliateOf': ('broadcastAffiliateOf', 'http://schema.org/broadcastAffiliateOf', ('Organization',)),
+        'area': ('area', 'http://schema.org/area', ('Place',)),
+        'broadcastTimezone': ('broadcastTimezone', 'http://schema.org/broadcastTimezone', ('Text',)),
+        'broadcastDisplayName': ('broadcastDisplayName', 'http://schema.org/broadcastDisplayName', ('Text',)),
+        'parentService': ('parentService', 'http://schema.org/parentService', ('BroadcastService',)),
+        'broadcastFrequency': ('broadcastFrequency', 'http://schema.org/broadcastFrequency', ('Text', 'BroadcastFrequencySpecification')),
+        'hasBroadcastChannel': ('hasBroadcastChannel', 'http://schema.org/hasBroadcastChannel', ('BroadcastChannel',)),
+        'inLanguage': ('inLanguage', 'http://schema.org/inLanguage', ('Text', 'Language')),
+        'videoFormat': ('videoFormat', 'http://schema.org/videoFormat', ('Text',)),
+        'broadcaster': ('broadcaster', 'http://schema.org/broadcaster', ('Organization',)),
+        'callSign': ('callSign', 'http://schema.org/callSign', ('Text',)),
+    }),
+    'BrokerageAccount': ('InvestmentOrDeposit', {}),
+    'BuddhistTemple': ('PlaceOfWorship', {}),
+    'BusOrCoach': ('Vehicle', {
+        'roofLoad': ('roofLoad', 'http://schema.org/roofLoad', ('QuantitativeValue',)),
+        'acrissCode': ('acrissCode', 'http://schema.org/acrissCode', ('Text',)),
+    }),
+    'BusReservation': ('Reservation', {}),
+    'BusStation': ('CivicStructure', {}),
+    'BusStop': ('CivicStructure', {}),
+    'BusTrip': ('Trip', {
+        'arrivalBusStop': ('arrivalBusStop', 'http://schema.org/arrivalBusStop', ('BusStop', 'BusStation')),
+        'busNumber': ('busNumber', 'http://schema.org/busNumber', ('Text',)),
+        'departureBusStop': ('departureBusStop', 'http://schema.org/departureBusStop', ('BusStop', 'BusStation')),
+        'busName': ('busName', 'http://schema.org/busName', ('Text',)),
+    }),
+    'BusinessAudience': ('Audience', {
+        'numberOfEmployees': ('numberOfEmployees', 'http://schema.org/numberOfEmployees', ('QuantitativeValue',)),
+        'yearsInOperation': ('yearsInOperation', 'http://schema.org/yearsInOperation', ('QuantitativeValue',)),
+        'yearlyRevenue': ('yearlyRevenue', 'http://schema.org/yearlyRevenue', ('QuantitativeValue',)),
+    }),
+    'BusinessEntityType': ('Enumeration', {}),
+    'BusinessEvent': ('Event', {}),
+    'BusinessFunction': ('Enumeration', {}),
+    'BuyAction': ('TradeAction', {
+        'seller': ('seller', 'http://schema.org/seller', ('Organization', 'Person')),
+        'warrantyPromise': ('warrantyPromise', 'http://schema.org/warrantyPromise', ('WarrantyPromise',)),
+        'vendor': ('vendor', 'http://schema.org/vendor', ('Person', 'Organization')),
+    }),
+    'CDCPMDRecord': ('StructuredValue', {
+        'cvdCollectionDate': ('cvdCollectionDate', 'http://schema.org/cvdCollectionDate', ('DateTime', 'Text')),
+        'cvdNumVent': ('cvdNumVent', 'http://schema.org/cvdNumVent', ('Number',)),
+        'datePosted': ('datePosted', 'http://schema.org/datePosted', ('DateTime', 'Date')),
+        'cvdNumVentUse': ('cvdNumVentUse', 'http://schema.org/cvdNumVentUse', ('Number',)),
+        'cvdNumICUBeds': ('cvdNumICUBeds', 'http://schema.org/cvdNumICUBeds', ('Number',)),
+        'cvdNumC19OverflowPats': ('cvdNumC19OverflowPats', 'http://schema.org/cvdNumC19OverflowPats', ('Number',)),
+        'cvdNumBeds': ('cvdNumBeds', 'http://schema.org/cvdNumBeds', ('Number',)),
+        'cvdFacilityCounty': ('cvdFacilityCounty', 'http://schema.org/cvdFacilityCounty', ('Text',)),
+        'cvdFacilityId': ('cvdFacilityId', 'http://schema.org/cvdFacilityId', ('Text',)),
+        'cvdNumC19OFMechVentPats': ('cvdNumC19OFMechVentPats', 'http://schema.org/cvdNumC19OFMechVentPats', ('Number',)),
+        'cvdNumC19HospPats': ('cvdNumC19HospPats', 'http://schema.org/cvdNumC19HospPats', ('Number',)),
+        'cvdNumBedsOcc': ('cvdNumBedsOcc', 'http://schema.org/cvdNumBedsOcc', ('Number',)),
+        'cvdNumC19HOPats': ('cvdNumC19HOPats', 'http://schema.org/cvdNumC19HOPats', ('Number',)),
+        'cvdNumICUBedsOcc': ('cvdNumICUBedsOcc', 'http://schema.org/cvdNumICUBedsOcc', ('Number',)),
+        'cvdNumC19Died': ('cvdNumC19Died', 'http://schema.org/cvdNumC19Died', ('Number',)),
+        'cvdNumC19MechVentPats': ('cvdNumC19MechVentPats', 'http://schema.org/cvdNumC19MechVentPats', ('Number',)),
+        'cvdNumTotBeds': ('cvdNumTotBeds', 'http://schema.org/cvdNumTotBeds', ('Number',)),
+    }),
+    'CableOrSatelliteService': ('Service', {}),
+    'CafeOrCoffeeShop': ('FoodEstablishment', {}),
+    'Campground': ('CivicStructure', {}),
+    'CampingPitch': ('Accommodation', {}),
+    'Canal': ('BodyOfWater', {}),
+    'CancelAction': ('PlanAction', {}),
+    'Car': ('Vehicle', {
+        'roofLoad': ('roofLoad', 'http://schema.org/roofLoad', ('QuantitativeValue',)),
+        'acrissCode': ('acrissCode', 'http://schema.org/acrissCode', ('Text',)),
+    }),
+    'Casino': ('EntertainmentBusiness', {}),
+    'CategoryCode': ('DefinedTerm', {
+        'codeValue': ('codeValue', 'http://schema.org/codeValue', ('Text',)),
+        'inCodeSet': ('inCodeSet', 'http://schema.org/inCodeSet', ('URL', 'CategoryCodeSet')),
+    }),
+    'CategoryCodeSet': ('DefinedTermSet', {
+        'hasCategoryCode': ('hasCategoryCode', 'http://schema.org/hasCategoryCode', ('CategoryCode',)),
+    }),
+    'CatholicChurch': ('Church', {}),
+    'Cemetery': ('CivicStructure', {}),
+    'Certification': ('CreativeWork', {
+        'issuedBy': ('issuedBy', 'http://schema.org/issuedBy', ('Organization',)),
+        'about': ('about', 'http://schema.org/about', ('Thing',)),
+        'auditDate': ('auditDate', 'http://schema.org/auditDate', ('DateTime', 'Date')),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'certificationIdentification': ('certificationIdentification', 'http://schema.org/certificationIdentification', ('Text', 'DefinedTerm')),
+        'datePublished': ('datePublished', 'http://schema.org/datePublished', ('DateTime', 'Date')),
+        'expires': ('expires', 'http://schema.org/expires', ('DateTime', 'Date')),
+        'certificationStatus': ('certificationStatus', 'http://schema.org/certificationStatus', ('CertificationStatusEnumeration',)),
+        'certificationRating': ('certificationRating', 'http://schema.org/certificationRating', ('Rating',)),
+        'logo': ('logo', 'http://schema.org/logo', ('URL', 'ImageObject')),
+        'hasMeasurement': ('hasMeasurement', 'http://schema.org/hasMeasurement', ('QuantitativeValue',)),
+        'validIn': ('validIn', 'http://schema.org/validIn', ('AdministrativeArea',)),
+    }),
+    'Chapter': ('CreativeWork', {
+        'pageStart': ('pageStart', 'http://schema.org/pageStart', ('Integer', 'Text')),
+        'pagination': ('pagination', 'http://schema.org/pagination', ('Text',)),
+        'pageEnd': ('pageEnd', 'http://schema.org/pageEnd', ('Integer', 'Text')),
+    }),
+    'CheckAction': ('FindAction', {}),
+    'CheckInAction': ('CommunicateAction', {}),
+    'CheckOutAction': ('CommunicateAction', {}),
+    'CheckoutPage': ('WebPage', {}),
+    'ChemicalSubstance': ('BioChemEntity', {
+        'potentialUse': ('potentialUse', 'http://schema.org/potentialUse', ('DefinedTerm',)),
+        'chemicalComposition': ('chemicalComposition', 'http://schema.org/chemicalComposition', ('Text',)),
+        'chemicalRole': ('chemicalRole', 'http://schema.org/chemicalRole', ('DefinedTerm',)),
+    }),
+    'ChildCare': ('LocalBusiness', {}),
+    'ChildrensEvent': ('Event', {}),
+    'ChooseAction': ('AssessAction', {
+        'option': ('option', 'http://schema.org/option', ('Text', 'Thing')),
+        'actionOption': ('actionOption', 'http://schema.org/actionOption', ('Text', 'Thing')),
+    }),
+    'Church': ('PlaceOfWorship', {}),
+    'City': ('AdministrativeArea', {}),
+    'CityHall': ('GovernmentBuilding', {}),
+    'CivicStructure': ('Place', {
+        'openingHours': ('openingHours', 'http://schema.org/openingHours', ('Text',)),
+    }),
+    'Claim': ('CreativeWork', {
+        'appearance': ('appearance', 'http://schema.org/appearance', ('CreativeWork',)),
+        'firstAppearance': ('firstAppearance', 'http://schema.org/firstAppearance', ('CreativeWork',)),
+        'claimInterpreter': ('claimInterpreter', 'http://schema.org/claimInterpreter', ('Organization', 'Person')),
+    }),
+    'ClaimReview': ('Review', {
+        'claimReviewed': ('claimReviewed', 'http://schema.org/claimReviewed', ('Text',)),
+    }),
+    'Class': ('Intangible', {
+        'supersededBy': ('supersededBy', 'http://schema.org/supersededBy', ('Enumeration', 'Class', 'Property')),
+    }),
+    'Clip': ('CreativeWork', {
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'clipNumber': ('clipNumber', 'http://schema.org/clipNumber', ('Integer', 'Text')),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'endOffset': ('endOffset', 'http://schema.org/endOffset', ('Number', 'HyperTocEntry')),
+        'partOfSeries': ('partOfSeries', 'http://schema.org/partOfSeries', ('CreativeWorkSeries',)),
+        'startOffset': ('startOffset', 'http://schema.org/startOffset', ('Number', 'HyperTocEntry')),
+        'partOfEpisode': ('partOfEpisode', 'http://schema.org/partOfEpisode', ('Episode',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'partOfSeason': ('partOfSeason', 'http://schema.org/partOfSeason', ('CreativeWorkSeason',)),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+    }),
+    'ClothingStore': ('Store', {}),
+    'Code': ('CreativeWork', {}),
+    'Collection': ('CreativeWork', {
+        'collectionSize': ('collectionSize', 'http://schema.org/collectionSize', ('Integer',)),
+    }),
+    'CollectionPage': ('WebPage', {}),
+    'CollegeOrUniversity': ('EducationalOrganization', {}),
+    'ComedyClub': ('EntertainmentBusiness', {}),
+    'ComedyEvent': ('Event', {}),
+    'ComicCoverArt': ('ComicStory', {}),
+    'ComicIssue': ('PublicationIssue', {
+        'artist': ('artist', 'http://schema.org/artist', ('Person',)),
+        'penciler': ('penciler', 'http://schema.org/penciler', ('Person',)),
+        'variantCover': ('variantCover', 'http://schema.org/variantCover', ('Text',)),
+        'letterer': ('letterer', 'http://schema.org/letterer', ('Person',)),
+        'colorist': ('colorist', 'http://schema.org/colorist', ('Person',)),
+        'inker': ('inker', 'http://schema.org/inker', ('Person',)),
+    }),
+    'ComicSeries': ('Periodical', {}),
+    'ComicStory': ('CreativeWork', {
+        'artist': ('artist', 'http://schema.org/artist', ('Person',)),
+        'penciler': ('penciler', 'http://schema.org/penciler', ('Person',)),
+        'letterer': ('letterer', 'http://schema.org/letterer', ('Person',)),
+        'colorist': ('colorist', 'http://schema.org/colorist', ('Person',)),
+        'inker': ('inker', 'http://schema.org/inker', ('Person',)),
+    }),
+    'Comment': ('CreativeWork', {
+        'parentItem': ('parentItem', 'http://schema.org/parentItem', ('Comment', 'CreativeWork')),
+        'upvoteCount': ('upvoteCount', 'http://schema.org/upvoteCount', ('Integer',)),
+        'downvoteCount': ('downvoteCount', 'http://schema.org/downvoteCount', ('Integer',)),
+        'sharedContent': ('sharedContent', 'http://schema.org/sharedContent', ('CreativeWork',)),
+    }),
+    'CommentAction': ('CommunicateAction', {
+        'resultComment': ('resultComment', 'http://schema.org/resultComment', ('Comment',)),
+    }),
+    'CommunicateAction': ('InteractAction', {
+        'about': ('about', 'http://schema.org/about', ('Thing',)),
+        'language': ('language', 'http://schema.org/language', ('Language',)),
+        'inLanguage': ('inLanguage', 'http://schema.org/inLanguage', ('Text', 'Language')),
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+    }),
+    'CompleteDataFeed': ('DataFeed', {}),
+    'CompoundPriceSpecification': ('PriceSpecification', {
+        'priceType': ('priceType', 'http://schema.org/priceType', ('Text', 'PriceTypeEnumeration')),
+        'priceComponent': ('priceComponent', 'http://schema.org/priceComponent', ('UnitPriceSpecification',)),
+    }),
+    'ComputerLanguage': ('Intangible', {}),
+    'ComputerStore': ('Store', {}),
+    'ConfirmAction': ('InformAction', {}),
+    'Consortium': ('Organization', {}),
+    'ConstraintNode': ('Intangible', {
+        'numConstraints': ('numConstraints', 'http://schema.org/numConstraints', ('Integer',)),
+        'constraintProperty': ('constraintProperty', 'http://schema.org/constraintProperty', ('URL', 'Property')),
+    }),
+    'ConsumeAction': ('Action', {
+        'actionAccessibilityRequirement': ('actionAccessibilityRequirement', 'http://schema.org/actionAccessibilityRequirement', ('ActionAccessSpecification',)),
+        'expectsAcceptanceOf': ('expectsAcceptanceOf', 'http://schema.org/expectsAcceptanceOf', ('Offer',)),
+    }),
+    'ContactPage': ('WebPage', {}),
+    'ContactPoint': ('StructuredValue', {
+        'serviceArea': ('serviceArea', 'http://schema.org/serviceArea', ('Place', 'AdministrativeArea', 'GeoShape')),
+        'email': ('email', 'http://schema.org/email', ('Text',)),
+        'contactType': ('contactType', 'http://schema.org/contactType', ('Text',)),
+        'contactOption': ('contactOption', 'http://schema.org/contactOption', ('ContactPointOption',)),
+        'telephone': ('telephone', 'http://schema.org/telephone', ('Text',)),
+        'areaServed': ('areaServed', 'http://schema.org/areaServed', ('Text', 'AdministrativeArea', 'Place', 'GeoShape')),
+        'productSupported': ('productSupported', 'http://schema.org/productSupported', ('Text', 'Product')),
+        'availableLanguage': ('availableLanguage', 'http://schema.org/availableLanguage', ('Text', 'Language')),
+        'hoursAvailable': ('hoursAvailable', 'http://schema.org/hoursAvailable', ('OpeningHoursSpecification',)),
+        'faxNumber': ('faxNumber', 'http://schema.org/faxNumber', ('Text',)),
+    }),
+    'Continent': ('Landform', {}),
+    'ControlAction': ('Action', {}),
+    'ConvenienceStore': ('Store', {}),
+    'Conversation': ('CreativeWork', {}),
+    'CookAction': ('CreateAction', {
+        'recipe': ('recipe', 'http://schema.org/recipe', ('Recipe',)),
+        'foodEstablishment': ('foodEstablishment', 'http://schema.org/foodEstablishment', ('Place', 'FoodEstablishment')),
+        'foodEvent': ('foodEvent', 'http://schema.org/foodEvent', ('FoodEvent',)),
+    }),
+    'Cooperative': ('Organization', {}),
+    'Corporation': ('Organization', {
+        'tickerSymbol': ('tickerSymbol', 'http://schema.org/tickerSymbol', ('Text',)),
+    }),
+    'CorrectionComment': ('Comment', {}),
+    'Country': ('AdministrativeArea', {}),
+    'Course': ('LearningResource', {
+        'numberOfCredits': ('numberOfCredits', 'http://schema.org/numberOfCredits', ('Integer', 'StructuredValue')),
+        'educationalCredentialAwarded': ('educationalCredentialAwarded', 'http://schema.org/educationalCredentialAwarded', ('URL', 'Text', 'EducationalOccupationalCredential')),
+        'hasCourseInstance': ('hasCourseInstance', 'http://schema.org/hasCourseInstance', ('CourseInstance',)),
+        'financialAidEligible': ('financialAidEligible', 'http://schema.org/financialAidEligible', ('Text', 'DefinedTerm')),
+        'syllabusSections': ('syllabusSections', 'http://schema.org/syllabusSections', ('Syllabus',)),
+        'coursePrerequisites': ('coursePrerequisites', 'http://schema.org/coursePrerequisites', ('Text', 'AlignmentObject', 'Course')),
+        'occupationalCredentialAwarded': ('occupationalCredentialAwarded', 'http://schema.org/occupationalCredentialAwarded', ('URL', 'Text', 'EducationalOccupationalCredential')),
+        'courseCode': ('courseCode', 'http://schema.org/courseCode', ('Text',)),
+        'availableLanguage': ('availableLanguage', 'http://schema.org/availableLanguage', ('Text', 'Language')),
+        'totalHistoricalEnrollment': ('totalHistoricalEnrollment', 'http://schema.org/totalHistoricalEnrollment', ('Integer',)),
+    }),
+    'CourseInstance': ('Event', {
+        'instructor': ('instructor', 'http://schema.org/instructor', ('Person',)),
+        'courseSchedule': ('courseSchedule', 'http://schema.org/courseSchedule', ('Schedule',)),
+        'courseWorkload': ('courseWorkload', 'http://schema.org/courseWorkload', ('Text',)),
+        'courseMode': ('courseMode', 'http://schema.org/courseMode', ('URL', 'Text')),
+    }),
+    'Courthouse': ('GovernmentBuilding', {}),
+    'CoverArt': ('VisualArtwork', {}),
+    'CovidTestingFacility': ('MedicalClinic', {}),
+    'CreateAction': ('Action', {}),
+    'CreativeWork': ('Thing', {
+        'hasPart': ('hasPart', 'http://schema.org/hasPart', ('CreativeWork',)),
+        'award': ('award', 'http://schema.org/award', ('Text',)),
+        'accessModeSufficient': ('accessModeSufficient', 'http://schema.org/accessModeSufficient', ('ItemList',)),
+        'reviews': ('reviews', 'http://schema.org/reviews', ('Review',)),
+        'dateModified': ('dateModified', 'http://schema.org/dateModified', ('DateTime', 'Date')),
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'contentLocation': ('contentLocation', 'http://schema.org/contentLocation', ('Place',)),
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'contentRating': ('contentRating', 'http://schema.org/contentRating', ('Text', 'Rating')),
+        'accessibilityControl': ('accessibilityControl', 'http://schema.org/accessibilityControl', ('Text',)),
+        'releasedEvent': ('releasedEvent', 'http://schema.org/releasedEvent', ('PublicationEvent',)),
+        'contributor': ('contributor', 'http://schema.org/contributor', ('Organization', 'Person')),
+        'educationalAlignment': ('educationalAlignment', 'http://schema.org/educationalAlignment', ('AlignmentObject',)),
+        'translator': ('translator', 'http://schema.org/translator', ('Organization', 'Person')),
+        'about': ('about', 'http://schema.org/about', ('Thing',)),
+        'copyrightNotice': ('copyrightNotice', 'http://schema.org/copyrightNotice', ('Text',)),
+        'typicalAgeRange': ('typicalAgeRange', 'http://schema.org/typicalAgeRange', ('Text',)),
+        'keywords': ('keywords', 'http://schema.org/keywords', ('URL', 'Text', 'DefinedTerm')),
+        'publishingPrinciples': ('publishingPrinciples', 'http://schema.org/publishingPrinciples', ('URL', 'CreativeWork')),
+        'funding': ('funding', 'http://schema.org/funding', ('Grant',)),
+        'encodings': ('encodings', 'http://schema.org/encodings', ('MediaObject',)),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'isPartOf': ('isPartOf', 'http://schema.org/isPartOf', ('URL', 'CreativeWork')),
+        'encoding': ('encoding', 'http://schema.org/encoding', ('MediaObject',)),
+        'video': ('video', 'http://schema.org/video', ('Clip', 'VideoObject')),
+        'thumbnail': ('thumbnail', 'http://schema.org/thumbnail', ('ImageObject',)),
+        'discussionUrl': ('discussionUrl', 'http://schema.org/discussionUrl', ('URL',)),
+        'interactivityType': ('interactivityType', 'http://schema.org/interactivityType', ('Text',)),
+        'timeRequired': ('timeRequired', 'http://schema.org/timeRequired', ('Duration',)),
+        'text': ('text', 'http://schema.org/text', ('Text',)),
+        'isBasedOn': ('isBasedOn', 'http://schema.org/isBasedOn', ('URL', 'CreativeWork', 'Product')),
+        'awards': ('awards', 'http://schema.org/awards', ('Text',)),
+        'interactionStatistic': ('interactionStatistic', 'http://schema.org/interactionStatistic', ('InteractionCounter',)),
+        'conditionsOfAccess': ('conditionsOfAccess', 'http://schema.org/conditionsOfAccess', ('Text',)),
+        'temporalCoverage': ('temporalCoverage', 'http://schema.org/temporalCoverage', ('DateTime', 'URL', 'Text')),
+        'version': ('version', 'http://schema.org/version', ('Number', 'Text')),
+        'encodingFormat': ('encodingFormat', 'http://schema.org/encodingFormat', ('URL', 'Text')),
+        'publication': ('publication', 'http://schema.org/publication', ('PublicationEvent',)),
+        'isFamilyFriendly': ('isFamilyFriendly', 'http://schema.org/isFamilyFriendly', ('Boolean',)),
+        'materialExtent': ('materialExtent', 'http://schema.org/materialExtent', ('Text', 'QuantitativeValue')),
+        'headline': ('headline', 'http://schema.org/headline', ('Text',)),
+        'accessMode': ('accessMode', 'http://schema.org/accessMode', ('Text',)),
+        'accountablePerson': ('accountablePerson', 'http://schema.org/accountablePerson', ('Person',)),
+        'accessibilitySummary': ('accessibilitySummary', 'http://schema.org/accessibilitySummary', ('Text',)),
+        'educationalUse': ('educationalUse', 'http://schema.org/educationalUse', ('Text', 'DefinedTerm')),
+        'workExample': ('workExample', 'http://schema.org/workExample', ('CreativeWork',)),
+        'editor': ('editor', 'http://schema.org/editor', ('Person',)),
+        'schemaVersion': ('schemaVersion', 'http://schema.org/schemaVersion', ('URL', 'Text')),
+        'size': ('size', 'http://schema.org/size', ('Text', 'DefinedTerm', 'SizeSpecification', 'QuantitativeValue')),
+        'assesses': ('assesses', 'http://schema.org/assesses', ('Text', 'DefinedTerm')),
+        'audio': ('audio', 'http://schema.org/audio', ('MusicRecording', 'AudioObject', 'Clip')),
+        'associatedMedia': ('associatedMedia', 'http://schema.org/associatedMedia', ('MediaObject',)),
+        'author': ('author', 'http://schema.org/author', ('Organization', 'Person')),
+        'mentions': ('mentions', 'http://schema.org/mentions', ('Thing',)),
+        'fileFormat': ('fileFormat', 'http://schema.org/fileFormat', ('URL', 'Text')),
+        'spatialCoverage': ('spatialCoverage', 'http://schema.org/spatialCoverage', ('Place',)),
+        'wordCount': ('wordCount', 'http://schema.org/wordCount', ('Integer',)),
+        'isAccessibleForFree': ('isAccessibleForFree', 'http://schema.org/isAccessibleForFree', ('Boolean',)),
+        'contentReferenceTime': ('contentReferenceTime', 'http://schema.org/contentReferenceTime', ('DateTime',)),
+        'position': ('position', 'http://schema.org/position', ('Integer', 'Text')),
+        'exampleOfWork': ('exampleOfWork', 'http://schema.org/exampleOfWork', ('CreativeWork',)),
+        'datePublished': ('datePublished', 'http://schema.org/datePublished', ('DateTime', 'Date')),
+        'material': ('material', 'http://schema.org/material', ('URL', 'Text', 'Product')),
+        'producer': ('producer', 'http://schema.org/producer', ('Organization', 'Person')),
+        'abstract': ('abstract', 'http://schema.org/abstract', ('Text',)),
+        'acquireLicensePage': ('acquireLicensePage', 'http://schema.org/acquireLicensePage', ('URL', 'CreativeWork')),
+        'usageInfo': ('usageInfo', 'http://schema.org/usageInfo', ('URL', 'CreativeWork')),
+        'expires': ('expires', 'http://schema.org/expires', ('DateTime', 'Date')),
+        'mainEntity': ('mainEntity', 'http://schema.org/mainEntity', ('Thing',)),
+        'copyrightHolder': ('copyrightHolder', 'http://schema.org/copyrightHolder', ('Organization', 'Person')),
+        'alternativeHeadline': ('alternativeHeadline', 'http://schema.org/alternativeHeadline', ('Text',)),
+        'creator': ('creator', 'http://schema.org/creator', ('Organization', 'Person')),
+        'countryOfOrigin': ('countryOfOrigin', 'http://schema.org/countryOfOrigin', ('Country',)),
+        'teaches': ('teaches', 'http://schema.org/teaches', ('Text', 'DefinedTerm')),
+        'educationalLevel': ('educationalLevel', 'http://schema.org/educationalLevel', ('URL', 'Text', 'DefinedTerm')),
+        'digitalSourceType': ('digitalSourceType', 'http://schema.org/digitalSourceType', ('IPTCDigitalSourceEnumeration',)),
+        'recordedAt': ('recordedAt', 'http://schema.org/recordedAt', ('Event',)),
+        'learningResourceType': ('learningResourceType', 'http://schema.org/learningResourceType', ('Text', 'DefinedTerm')),
+        'workTranslation': ('workTranslation', 'http://schema.org/workTranslation', ('CreativeWork',)),
+        'isBasedOnUrl': ('isBasedOnUrl', 'http://schema.org/isBasedOnUrl', ('URL', 'CreativeWork', 'Product')),
+        'publisherImprint': ('publisherImprint', 'http://schema.org/publisherImprint', ('Organization',)),
+        'sponsor': ('sponsor', 'http://schema.org/sponsor', ('Person', 'Organization')),
+        'creativeWorkStatus': ('creativeWorkStatus', 'http://schema.org/creativeWorkStatus', ('Text', 'DefinedTerm')),
+        'audience': ('audience', 'http://schema.org/audience', ('Audience',)),
+        'thumbnailUrl': ('thumbnailUrl', 'http://schema.org/thumbnailUrl', ('URL',)),
+        'funder': ('funder', 'http://schema.org/funder', ('Organization', 'Person')),
+        'inLanguage': ('inLanguage', 'http://schema.org/inLanguage', ('Text', 'Language')),
+        'creditText': ('creditText', 'http://schema.org/creditText', ('Text',)),
+        'copyrightYear': ('copyrightYear', 'http://schema.org/copyrightYear', ('Number',)),
+        'translationOfWork': ('translationOfWork', 'http://schema.org/translationOfWork', ('CreativeWork',)),
+        'sourceOrganization': ('sourceOrganization', 'http://schema.org/sourceOrganization', ('Organization',)),
+        'locationCreated': ('locationCreated', 'http://schema.org/locationCreated', ('Place',)),
+        'accessibilityAPI': ('accessibilityAPI', 'http://schema.org/accessibilityAPI', ('Text',)),
+        'correction': ('correction', 'http://schema.org/correction', ('URL', 'Text', 'CorrectionComment')),
+        'sdDatePublished': ('sdDatePublished', 'http://schema.org/sdDatePublished', ('Date',)),
+        'character': ('character', 'http://schema.org/character', ('Person',)),
+        'archivedAt': ('archivedAt', 'http://schema.org/archivedAt', ('URL', 'WebPage')),
+        'spatial': ('spatial', 'http://schema.org/spatial', ('Place',)),
+        'accessibilityFeature': ('accessibilityFeature', 'http://schema.org/accessibilityFeature', ('Text',)),
+        'sdPublisher': ('sdPublisher', 'http://schema.org/sdPublisher', ('Organization', 'Person')),
+        'sdLicense': ('sdLicense', 'http://schema.org/sdLicense', ('URL', 'CreativeWork')),
+        'license': ('license', 'http://schema.org/license', ('URL', 'CreativeWork')),
+        'editEIDR': ('editEIDR', 'http://schema.org/editEIDR', ('URL', 'Text')),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+        'dateCreated': ('dateCreated', 'http://schema.org/dateCreated', ('DateTime', 'Date')),
+        'accessibilityHazard': ('accessibilityHazard', 'http://schema.org/accessibilityHazard', ('Text',)),
+        'publisher': ('publisher', 'http://schema.org/publisher', ('Organization', 'Person')),
+        'citation': ('citation', 'http://schema.org/citation', ('Text', 'CreativeWork')),
+        'genre': ('genre', 'http://schema.org/genre', ('URL', 'Text')),
+        'maintainer': ('maintainer', 'http://schema.org/maintainer', ('Organization', 'Person')),
+        'pattern': ('pattern', 'http://schema.org/pattern', ('Text', 'DefinedTerm')),
+        'temporal': ('temporal', 'http://schema.org/temporal', ('DateTime', 'Text')),
+        'comment': ('comment', 'http://schema.org/comment', ('Comment',)),
+        'commentCount': ('commentCount', 'http://schema.org/commentCount', ('Integer',)),
+        'interpretedAsClaim': ('interpretedAsClaim', 'http://schema.org/interpretedAsClaim', ('Claim',)),
+    }),
+    'CreativeWorkSeason': ('CreativeWork', {
+        'episodes': ('episodes', 'http://schema.org/episodes', ('Episode',)),
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'seasonNumber': ('seasonNumber', 'http://schema.org/seasonNumber', ('Integer', 'Text')),
+        'episode': ('episode', 'http://schema.org/episode', ('Episode',)),
+        'partOfSeries': ('partOfSeries', 'http://schema.org/partOfSeries', ('CreativeWorkSeries',)),
+        'numberOfEpisodes': ('numberOfEpisodes', 'http://schema.org/numberOfEpisodes', ('Integer',)),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+    }),
+    'CreativeWorkSeries': ('CreativeWork', {
+        'issn': ('issn', 'http://schema.org/issn', ('Text',)),
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+    }),
+    'CreditCard': ('PaymentCard', {}),
+    'Crematorium': ('CivicStructure', {}),
+    'CriticReview': ('Review', {}),
+    'CssSelectorType': (None, {}),
+    'CurrencyConversionService': ('FinancialProduct', {}),
+    'DDxElement': ('MedicalIntangible', {
+        'diagnosis': ('diagnosis', 'http://schema.org/diagnosis', ('MedicalCondition',)),
+        'distinguishingSign': ('distinguishingSign', 'http://schema.org/distinguishingSign', ('MedicalSignOrSymptom',)),
+    }),
+    'DanceEvent': ('Event', {}),
+    'DanceGroup': ('PerformingGroup', {}),
+    'DataCatalog': ('CreativeWork', {
+        'measurementTechnique': ('measurementTechnique', 'http://schema.org/measurementTechnique', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'measurementMethod': ('measurementMethod', 'http://schema.org/measurementMethod', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'dataset': ('dataset', 'http://schema.org/dataset', ('Dataset',)),
+    }),
+    'DataDownload': ('MediaObject', {
+        'measurementTechnique': ('measurementTechnique', 'http://schema.org/measurementTechnique', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'measurementMethod': ('measurementMethod', 'http://schema.org/measurementMethod', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+    }),
+    'DataFeed': ('Dataset', {
+        'dataFeedElement': ('dataFeedElement', 'http://schema.org/dataFeedElement', ('Text', 'DataFeedItem', 'Thing')),
+    }),
+    'DataFeedItem': ('Intangible', {
+        'dateModified': ('dateModified', 'http://schema.org/dateModified', ('DateTime', 'Date')),
+        'dateDeleted': ('dateDeleted', 'http://schema.org/dateDeleted', ('DateTime', 'Date')),
+        'item': ('item', 'http://schema.org/item', ('Thing',)),
+        'dateCreated': ('dateCreated', 'http://schema.org/dateCreated', ('DateTime', 'Date')),
+    }),
+    'DataType': (None, {}),
+    'Dataset': ('CreativeWork', {
+        'includedInDataCatalog': ('includedInDataCatalog', 'http://schema.org/includedInDataCatalog', ('DataCatalog',)),
+        'issn': ('issn', 'http://schema.org/issn', ('Text',)),
+        'measurementTechnique': ('measurementTechnique', 'http://schema.org/measurementTechnique', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'catalog': ('catalog', 'http://schema.org/catalog', ('DataCatalog',)),
+        'measurementMethod': ('measurementMethod', 'http://schema.org/measurementMethod', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'variableMeasured': ('variableMeasured', 'http://schema.org/variableMeasured', ('Text', 'Property', 'StatisticalVariable', 'PropertyValue')),
+        'distribution': ('distribution', 'http://schema.org/distribution', ('DataDownload',)),
+        'includedDataCatalog': ('includedDataCatalog', 'http://schema.org/includedDataCatalog', ('DataCatalog',)),
+        'datasetTimeInterval': ('datasetTimeInterval', 'http://schema.org/datasetTimeInterval', ('DateTime',)),
+    }),
+    'DatedMoneySpecification': ('StructuredValue', {
+        'currency': ('currency', 'http://schema.org/currency', ('Text',)),
+        'amount': ('amount', 'http://schema.org/amount', ('Number', 'MonetaryAmount')),
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+    }),
+    'DaySpa': ('HealthAndBeautyBusiness', {}),
+    'DeactivateAction': ('ControlAction', {}),
+    'DefenceEstablishment': ('GovernmentBuilding', {}),
+    'DefinedRegion': ('StructuredValue', {
+        'postalCodeRange': ('postalCodeRange', 'http://schema.org/postalCodeRange', ('PostalCodeRangeSpecification',)),
+        'postalCode': ('postalCode', 'http://schema.org/postalCode', ('Text',)),
+        'addressCountry': ('addressCountry', 'http://schema.org/addressCountry', ('Text', 'Country')),
+        'addressRegion': ('addressRegion', 'http://schema.org/addressRegion', ('Text',)),
+        'postalCodePrefix': ('postalCodePrefix', 'http://schema.org/postalCodePrefix', ('Text',)),
+    }),
+    'DefinedTerm': ('Intangible', {
+        'inDefinedTermSet': ('inDefinedTermSet', 'http://schema.org/inDefinedTermSet', ('URL', 'DefinedTermSet')),
+        'termCode': ('termCode', 'http://schema.org/termCode', ('Text',)),
+    }),
+    'DefinedTermSet': ('CreativeWork', {
+        'hasDefinedTerm': ('hasDefinedTerm', 'http://schema.org/hasDefinedTerm', ('DefinedTerm',)),
+    }),
+    'DeleteAction': ('UpdateAction', {}),
+    'DeliveryChargeSpecification': ('PriceSpecification', {
+        'eligibleRegion': ('eligibleRegion', 'http://schema.org/eligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'areaServed': ('areaServed', 'http://schema.org/areaServed', ('Text', 'AdministrativeArea', 'Place', 'GeoShape')),
+        'ineligibleRegion': ('ineligibleRegion', 'http://schema.org/ineligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'appliesToDeliveryMethod': ('appliesToDeliveryMethod', 'http://schema.org/appliesToDeliveryMethod', ('DeliveryMethod',)),
+    }),
+    'DeliveryEvent': ('Event', {
+        'availableFrom': ('availableFrom', 'http://schema.org/availableFrom', ('DateTime',)),
+        'hasDeliveryMethod': ('hasDeliveryMethod', 'http://schema.org/hasDeliveryMethod', ('DeliveryMethod',)),
+        'availableThrough': ('availableThrough', 'http://schema.org/availableThrough', ('DateTime',)),
+        'accessCode': ('accessCode', 'http://schema.org/accessCode', ('Text',)),
+    }),
+    'Demand': ('Intangible', {
+        'warranty': ('warranty', 'http://schema.org/warranty', ('WarrantyPromise',)),
+        'gtin8': ('gtin8', 'http://schema.org/gtin8', ('Text',)),
+        'asin': ('asin', 'http://schema.org/asin', ('URL', 'Text')),
+        'eligibleRegion': ('eligibleRegion', 'http://schema.org/eligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'eligibleTransactionVolume': ('eligibleTransactionVolume', 'http://schema.org/eligibleTransactionVolume', ('PriceSpecification',)),
+        'availability': ('availability', 'http://schema.org/availability', ('ItemAvailability',)),
+        'businessFunction': ('businessFunction', 'http://schema.org/businessFunction', ('BusinessFunction',)),
+        'inventoryLevel': ('inventoryLevel', 'http://schema.org/inventoryLevel', ('QuantitativeValue',)),
+        'advanceBookingRequirement': ('advanceBookingRequirement', 'http://schema.org/advanceBookingRequirement', ('QuantitativeValue',)),
+        'eligibleDuration': ('eligibleDuration', 'http://schema.org/eligibleDuration', ('QuantitativeValue',)),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'availableAtOrFrom': ('availableAtOrFrom', 'http://schema.org/availableAtOrFrom', ('Place',)),
+        'seller': ('seller', 'http://schema.org/seller', ('Organization', 'Person')),
+        'itemOffered': ('itemOffered', 'http://schema.org/itemOffered', ('Service', 'AggregateOffer', 'CreativeWork', 'Event', 'MenuItem', 'Product', 'Trip')),
+        'areaServed': ('areaServed', 'http://schema.org/areaServed', ('Text', 'AdministrativeArea', 'Place', 'GeoShape')),
+        'mpn': ('mpn', 'http://schema.org/mpn', ('Text',)),
+        'gtin12': ('gtin12', 'http://schema.org/gtin12', ('Text',)),
+        'ineligibleRegion': ('ineligibleRegion', 'http://schema.org/ineligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'eligibleQuantity': ('eligibleQuantity', 'http://schema.org/eligibleQuantity', ('QuantitativeValue',)),
+        'gtin13': ('gtin13', 'http://schema.org/gtin13', ('Text',)),
+        'availabilityStarts': ('availabilityStarts', 'http://schema.org/availabilityStarts', ('DateTime', 'Date', 'Time')),
+        'eligibleCustomerType': ('eligibleCustomerType', 'http://schema.org/eligibleCustomerType', ('BusinessEntityType',)),
+        'gtin': ('gtin', 'http://schema.org/gtin', ('URL', 'Text')),
+        'availabilityEnds': ('availabilityEnds', 'http://schema.org/availabilityEnds', ('DateTime', 'Date', 'Time')),
+        'priceSpecification': ('priceSpecification', 'http://schema.org/priceSpecification', ('PriceSpecification',)),
+        'sku': ('sku', 'http://schema.org/sku', ('Text',)),
+        'gtin14': ('gtin14', 'http://schema.org/gtin14', ('Text',)),
+        'serialNumber': ('serialNumber', 'http://schema.org/serialNumber', ('Text',)),
+        'availableDeliveryMethod': ('availableDeliveryMethod', 'http://schema.org/availableDeliveryMethod', ('DeliveryMethod',)),
+        'acceptedPaymentMethod': ('acceptedPaymentMethod', 'http://schema.org/acceptedPaymentMethod', ('Text', 'LoanOrCredit', 'PaymentMethod')),
+        'includesObject': ('includesObject', 'http://schema.org/includesObject', ('TypeAndQuantityNode',)),
+        'itemCondition': ('itemCondition', 'http://schema.org/itemCondition', ('OfferItemCondition',)),
+        'deliveryLeadTime': ('deliveryLeadTime', 'http://schema.org/deliveryLeadTime', ('QuantitativeValue',)),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'Dentist': ('MedicalOrganization', {}),
+    'DepartAction': ('MoveAction', {}),
+    'DepartmentStore': ('Store', {}),
+    'DepositAccount': ('BankAccount', {}),
+    'DiagnosticLab': ('MedicalOrganization', {
+        'availableTest': ('availableTest', 'http://schema.org/availableTest', ('MedicalTest',)),
+    }),
+    'DiagnosticProcedure': ('MedicalProcedure', {}),
+    'Diet': ('CreativeWork', {
+        'expertConsiderations': ('expertConsiderations', 'http://schema.org/expertConsiderations', ('Text',)),
+        'dietFeatures': ('dietFeatures', 'http://schema.org/dietFeatures', ('Text',)),
+        'physiologicalBenefits': ('physiologicalBenefits', 'http://schema.org/physiologicalBenefits', ('Text',)),
+        'endorsers': ('endorsers', 'http://schema.org/endorsers', ('Organization', 'Person')),
+        'risks': ('risks', 'http://schema.org/risks', ('Text',)),
+    }),
+    'DietarySupplement': ('Substance', {
+        'isProprietary': ('isProprietary', 'http://schema.org/isProprietary', ('Boolean',)),
+        'activeIngredient': ('activeIngredient', 'http://schema.org/activeIngredient', ('Text',)),
+        'safetyConsideration': ('safetyConsideration', 'http://schema.org/safetyConsideration', ('Text',)),
+        'recommendedIntake': ('recommendedIntake', 'http://schema.org/recommendedIntake', ('RecommendedDoseSchedule',)),
+        'maximumIntake': ('maximumIntake', 'http://schema.org/maximumIntake', ('MaximumDoseSchedule',)),
+        'legalStatus': ('legalStatus', 'http://schema.org/legalStatus', ('Text', 'MedicalEnumeration', 'DrugLegalStatus')),
+        'targetPopulation': ('targetPopulation', 'http://schema.org/targetPopulation', ('Text',)),
+        'proprietaryName': ('proprietaryName', 'http://schema.org/proprietaryName', ('Text',)),
+        'nonProprietaryName': ('nonProprietaryName', 'http://schema.org/nonProprietaryName', ('Text',)),
+        'mechanismOfAction': ('mechanismOfAction', 'http://schema.org/mechanismOfAction', ('Text',)),
+    }),
+    'DigitalDocument': ('CreativeWork', {
+        'hasDigitalDocumentPermission': ('hasDigitalDocumentPermission', 'http://schema.org/hasDigitalDocumentPermission', ('DigitalDocumentPermission',)),
+    }),
+    'DigitalDocumentPermission': ('Intangible', {
+        'permissionType': ('permissionType', 'http://schema.org/permissionType', ('DigitalDocumentPermissionType',)),
+        'grantee': ('grantee', 'http://schema.org/grantee', ('Audience', 'Organization', 'ContactPoint', 'Person')),
+    }),
+    'DisagreeAction': ('ReactAction', {}),
+    'DiscoverAction': ('FindAction', {}),
+    'DiscussionForumPosting': ('SocialMediaPosting', {}),
+    'DislikeAction': ('ReactAction', {}),
+    'Distance': ('Quantity', {}),
+    'Distillery': ('FoodEstablishment', {}),
+    'DonateAction': ('TransferAction', {
+        'priceCurrency': ('priceCurrency', 'http://schema.org/priceCurrency', ('Text',)),
+        'priceSpecification': ('priceSpecification', 'http://schema.org/priceSpecification', ('PriceSpecification',)),
+        'price': ('price', 'http://schema.org/price', ('Number', 'Text')),
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+    }),
+    'DoseSchedule': ('MedicalIntangible', {
+        'frequency': ('frequency', 'http://schema.org/frequency', ('Text',)),
+        'targetPopulation': ('targetPopulation', 'http://schema.org/targetPopulation', ('Text',)),
+        'doseUnit': ('doseUnit', 'http://schema.org/doseUnit', ('Text',)),
+        'doseValue': ('doseValue', 'http://schema.org/doseValue', ('Number', 'QualitativeValue')),
+    }),
+    'DownloadAction': ('TransferAction', {}),
+    'DrawAction': ('CreateAction', {}),
+    'Drawing': ('CreativeWork', {}),
+    'DrinkAction': ('ConsumeAction', {}),
+    'Drug': ('Product', {
+        'isProprietary': ('isProprietary', 'http://schema.org/isProprietary', ('Boolean',)),
+        'activeIngredient': ('activeIngredient', 'http://schema.org/activeIngredient', ('Text',)),
+        'pregnancyWarning': ('pregnancyWarning', 'http://schema.org/pregnancyWarning', ('Text',)),
+        'foodWarning': ('foodWarning', 'http://schema.org/foodWarning', ('Text',)),
+        'relatedDrug': ('relatedDrug', 'http://schema.org/relatedDrug', ('Drug',)),
+        'clinicalPharmacology': ('clinicalPharmacology', 'http://schema.org/clinicalPharmacology', ('Text',)),
+        'alcoholWarning': ('alcoholWarning', 'http://schema.org/alcoholWarning', ('Text',)),
+        'drugClass': ('drugClass', 'http://schema.org/drugClass', ('DrugClass',)),
+        'dosageForm': ('dosageForm', 'http://schema.org/dosageForm', ('Text',)),
+        'interactingDrug': ('interactingDrug', 'http://schema.org/interactingDrug', ('Drug',)),
+        'availableStrength': ('availableStrength', 'http://schema.org/availableStrength', ('DrugStrength',)),
+        'maximumIntake': ('maximumIntake', 'http://schema.org/maximumIntake', ('MaximumDoseSchedule',)),
+        'rxcui': ('rxcui', 'http://schema.org/rxcui', ('Text',)),
+        'administrationRoute': ('administrationRoute', 'http://schema.org/administrationRoute', ('Text',)),
+        'prescriptionStatus': ('prescriptionStatus', 'http://schema.org/prescriptionStatus', ('Text', 'DrugPrescriptionStatus')),
+        'drugUnit': ('drugUnit', 'http://schema.org/drugUnit', ('Text',)),
+        'legalStatus': ('legalStatus', 'http://schema.org/legalStatus', ('Text', 'MedicalEnumeration', 'DrugLegalStatus')),
+        'pregnancyCategory': ('pregnancyCategory', 'http://schema.org/pregnancyCategory', ('DrugPregnancyCategory',)),
+        'warning': ('warning', 'http://schema.org/warning', ('URL', 'Text')),
+        'overdosage': ('overdosage', 'http://schema.org/overdosage', ('Text',)),
+        'isAvailableGenerically': ('isAvailableGenerically', 'http://schema.org/isAvailableGenerically', ('Boolean',)),
+        'breastfeedingWarning': ('breastfeedingWarning', 'http://schema.org/breastfeedingWarning', ('Text',)),
+        'proprietaryName': ('proprietaryName', 'http://schema.org/proprietaryName', ('Text',)),
+        'includedInHealthInsurancePlan': ('includedInHealthInsurancePlan', 'http://schema.org/includedInHealthInsurancePlan', ('HealthInsurancePlan',)),
+        'labelDetails': ('labelDetails', 'http://schema.org/labelDetails', ('URL',)),
+        'prescribingInfo': ('prescribingInfo', 'http://schema.org/prescribingInfo', ('URL',)),
+        'doseSchedule': ('doseSchedule', 'http://schema.org/doseSchedule', ('DoseSchedule',)),
+        'nonProprietaryName': ('nonProprietaryName', 'http://schema.org/nonProprietaryName', ('Text',)),
+        'clincalPharmacology': ('clincalPharmacology', 'http://schema.org/clincalPharmacology', ('Text',)),
+        'mechanismOfAction': ('mechanismOfAction', 'http://schema.org/mechanismOfAction', ('Text',)),
+    }),
+    'DrugClass': ('MedicalEntity', {
+        'drug': ('drug', 'http://schema.org/drug', ('Drug',)),
+    }),
+    'DrugCost': ('MedicalEntity', {
+        'costCategory': ('costCategory', 'http://schema.org/costCategory', ('DrugCostCategory',)),
+        'costCurrency': ('costCurrency', 'http://schema.org/costCurrency', ('Text',)),
+        'drugUnit': ('drugUnit', 'http://schema.org/drugUnit', ('Text',)),
+        'costOrigin': ('costOrigin', 'http://schema.org/costOrigin', ('Text',)),
+        'applicableLocation': ('applicableLocation', 'http://schema.org/applicableLocation', ('AdministrativeArea',)),
+        'costPerUnit': ('costPerUnit', 'http://schema.org/costPerUnit', ('Number', 'Text', 'QualitativeValue')),
+    }),
+    'DrugLegalStatus': ('MedicalIntangible', {
+        'applicableLocation': ('applicableLocation', 'http://schema.org/applicableLocation', ('AdministrativeArea',)),
+    }),
+    'DrugStrength': ('MedicalIntangible', {
+        'activeIngredient': ('activeIngredient', 'http://schema.org/activeIngredient', ('Text',)),
+        'strengthUnit': ('strengthUnit', 'http://schema.org/strengthUnit', ('Text',)),
+        'maximumIntake': ('maximumIntake', 'http://schema.org/maximumIntake', ('MaximumDoseSchedule',)),
+        'strengthValue': ('strengthValue', 'http://schema.org/strengthValue', ('Number',)),
+        'availableIn': ('availableIn', 'http://schema.org/availableIn', ('AdministrativeArea',)),
+    }),
+    'DryCleaningOrLaundry': ('LocalBusiness', {}),
+    'Duration': ('Quantity', {}),
+    'EatAction': ('ConsumeAction', {}),
+    'EducationEvent': ('Event', {
+        'assesses': ('assesses', 'http://schema.org/assesses', ('Text', 'DefinedTerm')),
+        'teaches': ('teaches', 'http://schema.org/teaches', ('Text', 'DefinedTerm')),
+        'educationalLevel': ('educationalLevel', 'http://schema.org/educationalLevel', ('URL', 'Text', 'DefinedTerm')),
+    }),
+    'EducationalAudience': ('Audience', {
+        'educationalRole': ('educationalRole', 'http://schema.org/educationalRole', ('Text',)),
+    }),
+    'EducationalOccupationalCredential': ('CreativeWork', {
+        'recognizedBy': ('recognizedBy', 'http://schema.org/recognizedBy', ('Organization',)),
+        'credentialCategory': ('credentialCategory', 'http://schema.org/credentialCategory', ('URL', 'Text', 'DefinedTerm')),
+        'validFor': ('validFor', 'http://schema.org/validFor', ('Duration',)),
+        'educationalLevel': ('educationalLevel', 'http://schema.org/educationalLevel', ('URL', 'Text', 'DefinedTerm')),
+        'competencyRequired': ('competencyRequired', 'http://schema.org/competencyRequired', ('URL', 'Text', 'DefinedTerm')),
+        'validIn': ('validIn', 'http://schema.org/validIn', ('AdministrativeArea',)),
+    }),
+    'EducationalOccupationalProgram': ('Intangible', {
+        'termDuration': ('termDuration', 'http://schema.org/termDuration', ('Duration',)),
+        'numberOfCredits': ('numberOfCredits', 'http://schema.org/numberOfCredits', ('Integer', 'StructuredValue')),
+        'applicationStartDate': ('applicationStartDate', 'http://schema.org/applicationStartDate', ('Date',)),
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'educationalCredentialAwarded': ('educationalCredentialAwarded', 'http://schema.org/educationalCredentialAwarded', ('URL', 'Text', 'EducationalOccupationalCredential')),
+        'dayOfWeek': ('dayOfWeek', 'http://schema.org/dayOfWeek', ('DayOfWeek',)),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'financialAidEligible': ('financialAidEligible', 'http://schema.org/financialAidEligible', ('Text', 'DefinedTerm')),
+        'programPrerequisites': ('programPrerequisites', 'http://schema.org/programPrerequisites', ('Text', 'EducationalOccupationalCredential', 'AlignmentObject', 'Course')),
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'hasCourse': ('hasCourse', 'http://schema.org/hasCourse', ('Course',)),
+        'occupationalCategory': ('occupationalCategory', 'http://schema.org/occupationalCategory', ('Text', 'CategoryCode')),
+        'typicalCreditsPerTerm': ('typicalCreditsPerTerm', 'http://schema.org/typicalCreditsPerTerm', ('Integer', 'StructuredValue')),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+        'occupationalCredentialAwarded': ('occupationalCredentialAwarded', 'http://schema.org/occupationalCredentialAwarded', ('URL', 'Text', 'EducationalOccupationalCredential')),
+        'maximumEnrollment': ('maximumEnrollment', 'http://schema.org/maximumEnrollment', ('Integer',)),
+        'timeToComplete': ('timeToComplete', 'http://schema.org/timeToComplete', ('Duration',)),
+        'applicationDeadline': ('applicationDeadline', 'http://schema.org/applicationDeadline', ('Date', 'Text')),
+        'timeOfDay': ('timeOfDay', 'http://schema.org/timeOfDay', ('Text',)),
+        'trainingSalary': ('trainingSalary', 'http://schema.org/trainingSalary', ('MonetaryAmountDistribution',)),
+        'programType': ('programType', 'http://schema.org/programType', ('Text', 'DefinedTerm')),
+        'termsPerYear': ('termsPerYear', 'http://schema.org/termsPerYear', ('Number',)),
+        'salaryUponCompletion': ('salaryUponCompletion', 'http://schema.org/salaryUponCompletion', ('MonetaryAmountDistribution',)),
+        'educationalProgramMode': ('educationalProgramMode', 'http://schema.org/educationalProgramMode', ('URL', 'Text')),
+    }),
+    'EducationalOrganization': ('CivicStructure', {
+        'alumni': ('alumni', 'http://schema.org/alumni', ('Person',)),
+    }),
+    'Electrician': ('HomeAndConstructionBusiness', {}),
+    'ElectronicsStore': ('Store', {}),
+    'ElementarySchool': ('EducationalOrganization', {}),
+    'EmailMessage': ('Message', {}),
+    'Embassy': ('GovernmentBuilding', {}),
+    'EmergencyService': ('LocalBusiness', {}),
+    'EmployeeRole': ('OrganizationRole', {
+        'baseSalary': ('baseSalary', 'http://schema.org/baseSalary', ('Number', 'PriceSpecification', 'MonetaryAmount')),
+        'salaryCurrency': ('salaryCurrency', 'http://schema.org/salaryCurrency', ('Text',)),
+    }),
+    'EmployerAggregateRating': ('AggregateRating', {}),
+    'EmployerReview': ('Review', {}),
+    'EmploymentAgency': ('LocalBusiness', {}),
+    'EndorseAction': ('ReactAction', {
+        'endorsee': ('endorsee', 'http://schema.org/endorsee', ('Organization', 'Person')),
+    }),
+    'EndorsementRating': ('Rating', {}),
+    'Energy': ('Quantity', {}),
+    'EnergyConsumptionDetails': ('Intangible', {
+        'hasEnergyEfficiencyCategory': ('hasEnergyEfficiencyCategory', 'http://schema.org/hasEnergyEfficiencyCategory', ('EnergyEfficiencyEnumeration',)),
+        'energyEfficiencyScaleMax': ('energyEfficiencyScaleMax', 'http://schema.org/energyEfficiencyScaleMax', ('EUEnergyEfficiencyEnumeration',)),
+        'energyEfficiencyScaleMin': ('energyEfficiencyScaleMin', 'http://schema.org/energyEfficiencyScaleMin', ('EUEnergyEfficiencyEnumeration',)),
+    }),
+    'EnergyEfficiencyEnumeration': ('Enumeration', {}),
+    'EngineSpecification': ('StructuredValue', {
+        'fuelType': ('fuelType', 'http://schema.org/fuelType', ('URL', 'Text', 'QualitativeValue')),
+        'enginePower': ('enginePower', 'http://schema.org/enginePower', ('QuantitativeValue',)),
+        'engineType': ('engineType', 'http://schema.org/engineType', ('URL', 'Text', 'QualitativeValue')),
+        'torque': ('torque', 'http://schema.org/torque', ('QuantitativeValue',)),
+        'engineDisplacement': ('engineDisplacement', 'http://schema.org/engineDisplacement', ('QuantitativeValue',)),
+    }),
+    'EntertainmentBusiness': ('LocalBusiness', {}),
+    'EntryPoint': ('Intangible', {
+        'httpMethod': ('httpMethod', 'http://schema.org/httpMethod', ('Text',)),
+        'actionPlatform': ('actionPlatform', 'http://schema.org/actionPlatform', ('URL', 'Text', 'DigitalPlatformEnumeration')),
+        'actionApplication': ('actionApplication', 'http://schema.org/actionApplication', ('SoftwareApplication',)),
+        'urlTemplate': ('urlTemplate', 'http://schema.org/urlTemplate', ('Text',)),
+        'encodingType': ('encodingType', 'http://schema.org/encodingType', ('Text',)),
+        'contentType': ('contentType', 'http://schema.org/contentType', ('Text',)),
+        'application': ('application', 'http://schema.org/application', ('SoftwareApplication',)),
+    }),
+    'Enumeration': ('Intangible', {
+        'supersededBy': ('supersededBy', 'http://schema.org/supersededBy', ('Enumeration', 'Class', 'Property')),
+    }),
+    'Episode': ('CreativeWork', {
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'episodeNumber': ('episodeNumber', 'http://schema.org/episodeNumber', ('Integer', 'Text')),
+        'partOfSeries': ('partOfSeries', 'http://schema.org/partOfSeries', ('CreativeWorkSeries',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'partOfSeason': ('partOfSeason', 'http://schema.org/partOfSeason', ('CreativeWorkSeason',)),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+    }),
+    'Event': ('Thing', {
+        'superEvent': ('superEvent', 'http://schema.org/superEvent', ('Event',)),
+        'performers': ('performers', 'http://schema.org/performers', ('Organization', 'Person')),
+        'subEvent': ('subEvent', 'http://schema.org/subEvent', ('Event',)),
+        'eventStatus': ('eventStatus', 'http://schema.org/eventStatus', ('EventStatusType',)),
+        'maximumPhysicalAttendeeCapacity': ('maximumPhysicalAttendeeCapacity', 'http://schema.org/maximumPhysicalAttendeeCapacity', ('Integer',)),
+        'workFeatured': ('workFeatured', 'http://schema.org/workFeatured', ('CreativeWork',)),
+        'remainingAttendeeCapacity': ('remainingAttendeeCapacity', 'http://schema.org/remainingAttendeeCapacity', ('Integer',)),
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'attendee': ('attendee', 'http://schema.org/attendee', ('Organization', 'Person')),
+        'contributor': ('contributor', 'http://schema.org/contributor', ('Organization', 'Person')),
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'translator': ('translator', 'http://schema.org/translator', ('Organization', 'Person')),
+        'performer': ('performer', 'http://schema.org/performer', ('Organization', 'Person')),
+        'maximumAttendeeCapacity': ('maximumAttendeeCapacity', 'http://schema.org/maximumAttendeeCapacity', ('Integer',)),
+        'about': ('about', 'http://schema.org/about', ('Thing',)),
+        'typicalAgeRange': ('typicalAgeRange', 'http://schema.org/typicalAgeRange', ('Text',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'keywords': ('keywords', 'http://schema.org/keywords', ('URL', 'Text', 'DefinedTerm')),
+        'funding': ('funding', 'http://schema.org/funding', ('Grant',)),
+        'recordedIn': ('recordedIn', 'http://schema.org/recordedIn', ('CreativeWork',)),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'doorTime': ('doorTime', 'http://schema.org/doorTime', ('DateTime', 'Time')),
+        'isAccessibleForFree': ('isAccessibleForFree', 'http://schema.org/isAccessibleForFree', ('Boolean',)),
+        'location': ('location', 'http://schema.org/location', ('Text', 'VirtualLocation', 'PostalAddress', 'Place')),
+        'previousStartDate': ('previousStartDate', 'http://schema.org/previousStartDate', ('Date',)),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+        'organizer': ('organizer', 'http://schema.org/organizer', ('Organization', 'Person')),
+        'workPerformed': ('workPerformed', 'http://schema.org/workPerformed', ('CreativeWork',)),
+        'sponsor': ('sponsor', 'http://schema.org/sponsor', ('Person', 'Organization')),
+        'eventAttendanceMode': ('eventAttendanceMode', 'http://schema.org/eventAttendanceMode', ('EventAttendanceModeEnumeration',)),
+        'audience': ('audience', 'http://schema.org/audience', ('Audience',)),
+        'subEvents': ('subEvents', 'http://schema.org/subEvents', ('Event',)),
+        'maximumVirtualAttendeeCapacity': ('maximumVirtualAttendeeCapacity', 'http://schema.org/maximumVirtualAttendeeCapacity', ('Integer',)),
+        'funder': ('funder', 'http://schema.org/funder', ('Organization', 'Person')),
+        'inLanguage': ('inLanguage', 'http://schema.org/inLanguage', ('Text', 'Language')),
+        'attendees': ('attendees', 'http://schema.org/attendees', ('Organization', 'Person')),
+        'eventSchedule': ('eventSchedule', 'http://schema.org/eventSchedule', ('Schedule',)),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+        'composer': ('composer', 'http://schema.org/composer', ('Organization', 'Person')),
+    }),
+    'EventReservation': ('Reservation', {}),
+    'EventSeries': ('Series', {}),
+    'EventVenue': ('CivicStructure', {}),
+    'ExchangeRateSpecification': ('StructuredValue', {
+        'currency': ('currency', 'http://schema.org/currency', ('Text',)),
+        'currentExchangeRate': ('currentExchangeRate', 'http://schema.org/currentExchangeRate', ('UnitPriceSpecification',)),
+        'exchangeRateSpread': ('exchangeRateSpread', 'http://schema.org/exchangeRateSpread', ('Number', 'MonetaryAmount')),
+    }),
+    'ExerciseAction': ('PlayAction', {
+        'exercisePlan': ('exercisePlan', 'http://schema.org/exercisePlan', ('ExercisePlan',)),
+        'exerciseRelatedDiet': ('exerciseRelatedDiet', 'http://schema.org/exerciseRelatedDiet', ('Diet',)),
+        'sportsActivityLocation': ('sportsActivityLocation', 'http://schema.org/sportsActivityLocation', ('SportsActivityLocation',)),
+        'course': ('course', 'http://schema.org/course', ('Place',)),
+        'exerciseType': ('exerciseType', 'http://schema.org/exerciseType', ('Text',)),
+        'distance': ('distance', 'http://schema.org/distance', ('Distance',)),
+        'opponent': ('opponent', 'http://schema.org/opponent', ('Person',)),
+        'diet': ('diet', 'http://schema.org/diet', ('Diet',)),
+        'fromLocation': ('fromLocation', 'http://schema.org/fromLocation', ('Place',)),
+        'sportsEvent': ('sportsEvent', 'http://schema.org/sportsEvent', ('SportsEvent',)),
+        'exerciseCourse': ('exerciseCourse', 'http://schema.org/exerciseCourse', ('Place',)),
+        'sportsTeam': ('sportsTeam', 'http://schema.org/sportsTeam', ('SportsTeam',)),
+        'toLocation': ('toLocation', 'http://schema.org/toLocation', ('Place',)),
+    }),
+    'ExerciseGym': ('SportsActivityLocation', {}),
+    'ExercisePlan': ('PhysicalActivity', {
+        'activityFrequency': ('activityFrequency', 'http://schema.org/activityFrequency', ('Text', 'QuantitativeValue')),
+        'additionalVariable': ('additionalVariable', 'http://schema.org/additionalVariable', ('Text',)),
+        'exerciseType': ('exerciseType', 'http://schema.org/exerciseType', ('Text',)),
+        'restPeriods': ('restPeriods', 'http://schema.org/restPeriods', ('Text', 'QuantitativeValue')),
+        'repetitions': ('repetitions', 'http://schema.org/repetitions', ('Number', 'QuantitativeValue')),
+        'activityDuration': ('activityDuration', 'http://schema.org/activityDuration', ('QuantitativeValue', 'Duration')),
+        'intensity': ('intensity', 'http://schema.org/intensity', ('Text', 'QuantitativeValue')),
+        'workload': ('workload', 'http://schema.org/workload', ('Energy', 'QuantitativeValue')),
+    }),
+    'ExhibitionEvent': ('Event', {}),
+    'FAQPage': ('WebPage', {}),
+    'FMRadioChannel': ('RadioChannel', {}),
+    'FastFoodRestaurant': ('FoodEstablishment', {}),
+    'Festival': ('Event', {}),
+    'FilmAction': ('CreateAction', {}),
+    'FinancialIncentive': ('Intangible', {
+        'incentivizedItem': ('incentivizedItem', 'http://schema.org/incentivizedItem', ('Product', 'DefinedTerm')),
+        'purchasePriceLimit': ('purchasePriceLimit', 'http://schema.org/purchasePriceLimit', ('MonetaryAmount',)),
+        'incentiveStatus': ('incentiveStatus', 'http://schema.org/incentiveStatus', ('IncentiveStatus',)),
+        'purchaseType': ('purchaseType', 'http://schema.org/purchaseType', ('PurchaseType',)),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'areaServed': ('areaServed', 'http://schema.org/areaServed', ('Text', 'AdministrativeArea', 'Place', 'GeoShape')),
+        'eligibleWithSupplier': ('eligibleWithSupplier', 'http://schema.org/eligibleWithSupplier', ('Organization',)),
+        'qualifiedExpense': ('qualifiedExpense', 'http://schema.org/qualifiedExpense', ('IncentiveQualifiedExpenseType',)),
+        'incentiveAmount': ('incentiveAmount', 'http://schema.org/incentiveAmount', ('QuantitativeValue', 'UnitPriceSpecification', 'LoanOrCredit')),
+        'incentiveType': ('incentiveType', 'http://schema.org/incentiveType', ('IncentiveType',)),
+        'incomeLimit': ('incomeLimit', 'http://schema.org/incomeLimit', ('Text', 'MonetaryAmount')),
+        'publisher': ('publisher', 'http://schema.org/publisher', ('Organization', 'Person')),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'FinancialProduct': ('Service', {
+        'interestRate': ('interestRate', 'http://schema.org/interestRate', ('Number', 'QuantitativeValue')),
+        'feesAndCommissionsSpecification': ('feesAndCommissionsSpecification', 'http://schema.org/feesAndCommissionsSpecification', ('URL', 'Text')),
+        'annualPercentageRate': ('annualPercentageRate', 'http://schema.org/annualPercentageRate', ('Number', 'QuantitativeValue')),
+    }),
+    'FinancialService': ('LocalBusiness', {
+        'feesAndCommissionsSpecification': ('feesAndCommissionsSpecification', 'http://schema.org/feesAndCommissionsSpecification', ('URL', 'Text')),
+    }),
+    'FindAction': ('Action', {}),
+    'FireStation': ('CivicStructure', {}),
+    'Flight': ('Trip', {
+        'flightNumber': ('flightNumber', 'http://schema.org/flightNumber', ('Text',)),
+        'mealService': ('mealService', 'http://schema.org/mealService', ('Text',)),
+        'estimatedFlightDuration': ('estimatedFlightDuration', 'http://schema.org/estimatedFlightDuration', ('Text', 'Duration')),
+        'webCheckinTime': ('webCheckinTime', 'http://schema.org/webCheckinTime', ('DateTime',)),
+        'boardingPolicy': ('boardingPolicy', 'http://schema.org/boardingPolicy', ('BoardingPolicyType',)),
+        'carrier': ('carrier', 'http://schema.org/carrier', ('Organization',)),
+        'seller': ('seller', 'http://schema.org/seller', ('Organization', 'Person')),
+        'arrivalGate': ('arrivalGate', 'http://schema.org/arrivalGate', ('Text',)),
+        'departureTerminal': ('departureTerminal', 'http://schema.org/departureTerminal', ('Text',)),
+        'arrivalAirport': ('arrivalAirport', 'http://schema.org/arrivalAirport', ('Airport',)),
+        'departureGate': ('departureGate', 'http://schema.org/departureGate', ('Text',)),
+        'aircraft': ('aircraft', 'http://schema.org/aircraft', ('Text', 'Vehicle')),
+        'flightDistance': ('flightDistance', 'http://schema.org/flightDistance', ('Text', 'Distance')),
+        'arrivalTerminal': ('arrivalTerminal', 'http://schema.org/arrivalTerminal', ('Text',)),
+        'departureAirport': ('departureAirport', 'http://schema.org/departureAirport', ('Airport',)),
+    }),
+    'FlightReservation': ('Reservation', {
+        'boardingGroup': ('boardingGroup', 'http://schema.org/boardingGroup', ('Text',)),
+        'securityScreening': ('securityScreening', 'http://schema.org/securityScreening', ('Text',)),
+        'passengerPriorityStatus': ('passengerPriorityStatus', 'http://schema.org/passengerPriorityStatus', ('Text', 'QualitativeValue')),
+        'passengerSequenceNumber': ('passengerSequenceNumber', 'http://schema.org/passengerSequenceNumber', ('Text',)),
+    }),
+    'Float': (None, {}),
+    'FloorPlan': ('Intangible', {
+        'numberOfFullBathrooms': ('numberOfFullBathrooms', 'http://schema.org/numberOfFullBathrooms', ('Number',)),
+        'numberOfPartialBathrooms': ('numberOfPartialBathrooms', 'http://schema.org/numberOfPartialBathrooms', ('Number',)),
+        'numberOfAvailableAccommodationUnits': ('numberOfAvailableAccommodationUnits', 'http://schema.org/numberOfAvailableAccommodationUnits', ('QuantitativeValue',)),
+        'numberOfAccommodationUnits': ('numberOfAccommodationUnits', 'http://schema.org/numberOfAccommodationUnits', ('QuantitativeValue',)),
+        'floorSize': ('floorSize', 'http://schema.org/floorSize', ('QuantitativeValue',)),
+        'numberOfBedrooms': ('numberOfBedrooms', 'http://schema.org/numberOfBedrooms', ('Number', 'QuantitativeValue')),
+        'numberOfRooms': ('numberOfRooms', 'http://schema.org/numberOfRooms', ('Number', 'QuantitativeValue')),
+        'layoutImage': ('layoutImage', 'http://schema.org/layoutImage', ('URL', 'ImageObject')),
+        'numberOfBathroomsTotal': ('numberOfBathroomsTotal', 'http://schema.org/numberOfBathroomsTotal', ('Integer',)),
+        'amenityFeature': ('amenityFeature', 'http://schema.org/amenityFeature', ('LocationFeatureSpecification',)),
+        'petsAllowed': ('petsAllowed', 'http://schema.org/petsAllowed', ('Boolean', 'Text')),
+        'isPlanForApartment': ('isPlanForApartment', 'http://schema.org/isPlanForApartment', ('Accommodation',)),
+    }),
+    'Florist': ('Store', {}),
+    'FollowAction': ('InteractAction', {
+        'followee': ('followee', 'http://schema.org/followee', ('Person', 'Organization')),
+    }),
+    'FoodEstablishment': ('LocalBusiness', {
+        'menu': ('menu', 'http://schema.org/menu', ('URL', 'Text', 'Menu')),
+        'servesCuisine': ('servesCuisine', 'http://schema.org/servesCuisine', ('Text',)),
+        'acceptsReservations': ('acceptsReservations', 'http://schema.org/acceptsReservations', ('URL', 'Boolean', 'Text')),
+        'starRating': ('starRating', 'http://schema.org/starRating', ('Rating',)),
+        'hasMenu': ('hasMenu', 'http://schema.org/hasMenu', ('URL', 'Text', 'Menu')),
+    }),
+    'FoodEstablishmentReservation': ('Reservation', {
+        'startTime': ('startTime', 'http://schema.org/startTime', ('DateTime', 'Time')),
+        'partySize': ('partySize', 'http://schema.org/partySize', ('Integer', 'QuantitativeValue')),
+        'endTime': ('endTime', 'http://schema.org/endTime', ('DateTime', 'Time')),
+    }),
+    'FoodEvent': ('Event', {}),
+    'FoodService': ('Service', {}),
+    'FundingAgency': ('Project', {}),
+    'FundingScheme': ('Organization', {}),
+    'FurnitureStore': ('Store', {}),
+    'Game': ('CreativeWork', {
+        'characterAttribute': ('characterAttribute', 'http://schema.org/characterAttribute', ('Thing',)),
+        'numberOfPlayers': ('numberOfPlayers', 'http://schema.org/numberOfPlayers', ('QuantitativeValue',)),
+        'gameItem': ('gameItem', 'http://schema.org/gameItem', ('Thing',)),
+        'gameLocation': ('gameLocation', 'http://schema.org/gameLocation', ('URL', 'Place', 'PostalAddress')),
+        'quest': ('quest', 'http://schema.org/quest', ('Thing',)),
+    }),
+    'GameServer': ('Intangible', {
+        'game': ('game', 'http://schema.org/game', ('VideoGame',)),
+        'playersOnline': ('playersOnline', 'http://schema.org/playersOnline', ('Integer',)),
+        'serverStatus': ('serverStatus', 'http://schema.org/serverStatus', ('GameServerStatus',)),
+    }),
+    'GardenStore': ('Store', {}),
+    'GasStation': ('AutomotiveBusiness', {}),
+    'GatedResidenceCommunity': ('Residence', {}),
+    'Gene': ('BioChemEntity', {
+        'encodesBioChemEntity': ('encodesBioChemEntity', 'http://schema.org/encodesBioChemEntity', ('BioChemEntity',)),
+        'expressedIn': ('expressedIn', 'http://schema.org/expressedIn', ('AnatomicalStructure', 'DefinedTerm', 'BioChemEntity', 'AnatomicalSystem')),
+        'alternativeOf': ('alternativeOf', 'http://schema.org/alternativeOf', ('Gene',)),
+        'hasBioPolymerSequence': ('hasBioPolymerSequence', 'http://schema.org/hasBioPolymerSequence', ('Text',)),
+    }),
+    'GeneralContractor': ('HomeAndConstructionBusiness', {}),
+    'GeoCircle': ('GeoShape', {
+        'geoRadius': ('geoRadius', 'http://schema.org/geoRadius', ('Number', 'Text', 'Distance')),
+        'geoMidpoint': ('geoMidpoint', 'http://schema.org/geoMidpoint', ('GeoCoordinates',)),
+    }),
+    'GeoCoordinates': ('StructuredValue', {
+        'longitude': ('longitude', 'http://schema.org/longitude', ('Number', 'Text')),
+        'address': ('address', 'http://schema.org/address', ('Text', 'PostalAddress')),
+        'postalCode': ('postalCode', 'http://schema.org/postalCode', ('Text',)),
+        'latitude': ('latitude', 'http://schema.org/latitude', ('Number', 'Text')),
+        'addressCountry': ('addressCountry', 'http://schema.org/addressCountry', ('Text', 'Country')),
+        'elevation': ('elevation', 'http://schema.org/elevation', ('Number', 'Text')),
+    }),
+    'GeoShape': ('StructuredValue', {
+        'polygon': ('polygon', 'http://schema.org/polygon', ('Text',)),
+        'address': ('address', 'http://schema.org/address', ('Text', 'PostalAddress')),
+        'postalCode': ('postalCode', 'http://schema.org/postalCode', ('Text',)),
+        'box': ('box', 'http://schema.org/box', ('Text',)),
+        'addressCountry': ('addressCountry', 'http://schema.org/addressCountry', ('Text', 'Country')),
+        'line': ('line', 'http://schema.org/line', ('Text',)),
+        'elevation': ('elevation', 'http://schema.org/elevation', ('Number', 'Text')),
+        'circle': ('circle', 'http://schema.org/circle', ('Text',)),
+    }),
+    'GeospatialGeometry': ('Intangible', {
+        'geoTouches': ('geoTouches', 'http://schema.org/geoTouches', ('Place', 'GeospatialGeometry')),
+        'geoCrosses': ('geoCrosses', 'http://schema.org/geoCrosses', ('GeospatialGeometry', 'Place')),
+        'geoIntersects': ('geoIntersects', 'http://schema.org/geoIntersects', ('GeospatialGeometry', 'Place')),
+        'geoCovers': ('geoCovers', 'http://schema.org/geoCovers', ('GeospatialGeometry', 'Place')),
+        'geoWithin': ('geoWithin', 'http://schema.org/geoWithin', ('Place', 'GeospatialGeometry')),
+        'geoOverlaps': ('geoOverlaps', 'http://schema.org/geoOverlaps', ('GeospatialGeometry', 'Place')),
+        'geoContains': ('geoContains', 'http://schema.org/geoContains', ('Place', 'GeospatialGeometry')),
+        'geoEquals': ('geoEquals', 'http://schema.org/geoEquals', ('Place', 'GeospatialGeometry')),
+        'geoDisjoint': ('geoDisjoint', 'http://schema.org/geoDisjoint', ('Place', 'GeospatialGeometry')),
+        'geoCoveredBy': ('geoCoveredBy', 'http://schema.org/geoCoveredBy', ('GeospatialGeometry', 'Place')),
+    }),
+    'GiveAction': ('TransferAction', {
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+    }),
+    'GolfCourse': ('SportsActivityLocation', {}),
+    'GovernmentBuilding': ('CivicStructure', {}),
+    'GovernmentOffice': ('LocalBusiness', {}),
+    'GovernmentOrganization': ('Organization', {}),
+    'GovernmentPermit': ('Permit', {}),
+    'GovernmentService': ('Service', {
+        'jurisdiction': ('jurisdiction', 'http://schema.org/jurisdiction', ('Text', 'AdministrativeArea')),
+        'serviceOperator': ('serviceOperator', 'http://schema.org/serviceOperator', ('Organization',)),
+    }),
+    'Grant': ('Intangible', {
+        'fundedItem': ('fundedItem', 'http://schema.org/fundedItem', ('Organization', 'CreativeWork', 'Person', 'Product', 'BioChemEntity', 'MedicalEntity', 'Event')),
+        'sponsor': ('sponsor', 'http://schema.org/sponsor', ('Person', 'Organization')),
+        'funder': ('funder', 'http://schema.org/funder', ('Organization', 'Person')),
+    }),
+    'GroceryStore': ('Store', {}),
+    'Guide': ('CreativeWork', {
+        'reviewAspect': ('reviewAspect', 'http://schema.org/reviewAspect', ('Text',)),
+    }),
+    'HVACBusiness': ('HomeAndConstructionBusiness', {}),
+    'Hackathon': ('Event', {}),
+    'HairSalon': ('HealthAndBeautyBusiness', {}),
+    'HardwareStore': ('Store', {}),
+    'HealthAndBeautyBusiness': ('LocalBusiness', {}),
+    'HealthClub': ('HealthAndBeautyBusiness', {}),
+    'HealthInsurancePlan': ('Intangible', {
+        'healthPlanDrugOption': ('healthPlanDrugOption', 'http://schema.org/healthPlanDrugOption', ('Text',)),
+        'healthPlanId': ('healthPlanId', 'http://schema.org/healthPlanId', ('Text',)),
+        'healthPlanMarketingUrl': ('healthPlanMarketingUrl', 'http://schema.org/healthPlanMarketingUrl', ('URL',)),
+        'healthPlanDrugTier': ('healthPlanDrugTier', 'http://schema.org/healthPlanDrugTier', ('Text',)),
+        'usesHealthPlanIdStandard': ('usesHealthPlanIdStandard', 'http://schema.org/usesHealthPlanIdStandard', ('URL', 'Text')),
+        'includesHealthPlanFormulary': ('includesHealthPlanFormulary', 'http://schema.org/includesHealthPlanFormulary', ('HealthPlanFormulary',)),
+        'contactPoint': ('contactPoint', 'http://schema.org/contactPoint', ('ContactPoint',)),
+        'benefitsSummaryUrl': ('benefitsSummaryUrl', 'http://schema.org/benefitsSummaryUrl', ('URL',)),
+        'includesHealthPlanNetwork': ('includesHealthPlanNetwork', 'http://schema.org/includesHealthPlanNetwork', ('HealthPlanNetwork',)),
+    }),
+    'HealthPlanCostSharingSpecification': ('Intangible', {
+        'healthPlanPharmacyCategory': ('healthPlanPharmacyCategory', 'http://schema.org/healthPlanPharmacyCategory', ('Text',)),
+        'healthPlanCoinsuranceOption': ('healthPlanCoinsuranceOption', 'http://schema.org/healthPlanCoinsuranceOption', ('Text',)),
+        'healthPlanCopayOption': ('healthPlanCopayOption', 'http://schema.org/healthPlanCopayOption', ('Text',)),
+        'healthPlanCoinsuranceRate': ('healthPlanCoinsuranceRate', 'http://schema.org/healthPlanCoinsuranceRate', ('Number',)),
+        'healthPlanCopay': ('healthPlanCopay', 'http://schema.org/healthPlanCopay', ('PriceSpecification',)),
+    }),
+    'HealthPlanFormulary': ('Intangible', {
+        'offersPrescriptionByMail': ('offersPrescriptionByMail', 'http://schema.org/offersPrescriptionByMail', ('Boolean',)),
+        'healthPlanCostSharing': ('healthPlanCostSharing', 'http://schema.org/healthPlanCostSharing', ('Boolean',)),
+        'healthPlanDrugTier': ('healthPlanDrugTier', 'http://schema.org/healthPlanDrugTier', ('Text',)),
+    }),
+    'HealthPlanNetwork': ('Intangible', {
+        'healthPlanNetworkId': ('healthPlanNetworkId', 'http://schema.org/healthPlanNetworkId', ('Text',)),
+        'healthPlanCostSharing': ('healthPlanCostSharing', 'http://schema.org/healthPlanCostSharing', ('Boolean',)),
+        'healthPlanNetworkTier': ('healthPlanNetworkTier', 'http://schema.org/healthPlanNetworkTier', ('Text',)),
+    }),
+    'HealthTopicContent': ('WebContent', {
+        'hasHealthAspect': ('hasHealthAspect', 'http://schema.org/hasHealthAspect', ('HealthAspectEnumeration',)),
+    }),
+    'HighSchool': ('EducationalOrganization', {}),
+    'HinduTemple': ('PlaceOfWorship', {}),
+    'HobbyShop': ('Store', {}),
+    'HomeAndConstructionBusiness': ('LocalBusiness', {}),
+    'HomeGoodsStore': ('Store', {}),
+    'Hospital': ('EmergencyService', {
+        'healthcareReportingData': ('healthcareReportingData', 'http://schema.org/healthcareReportingData', ('CDCPMDRecord', 'Dataset')),
+        'medicalSpecialty': ('medicalSpecialty', 'http://schema.org/medicalSpecialty', ('MedicalSpecialty',)),
+        'availableService': ('availableService', 'http://schema.org/availableService', ('MedicalProcedure', 'MedicalTest', 'MedicalTherapy')),
+    }),
+    'Hostel': ('LodgingBusiness', {}),
+    'Hotel': ('LodgingBusiness', {}),
+    'HotelRoom': ('Room', {
+        'occupancy': ('occupancy', 'http://schema.org/occupancy', ('QuantitativeValue',)),
+        'bed': ('bed', 'http://schema.org/bed', ('Text', 'BedDetails', 'BedType')),
+    }),
+    'House': ('Accommodation', {
+        'numberOfRooms': ('numberOfRooms', 'http://schema.org/numberOfRooms', ('Number', 'QuantitativeValue')),
+    }),
+    'HousePainter': ('HomeAndConstructionBusiness', {}),
+    'HowTo': ('CreativeWork', {
+        'totalTime': ('totalTime', 'http://schema.org/totalTime', ('Duration',)),
+        'step': ('step', 'http://schema.org/step', ('Text', 'CreativeWork', 'HowToSection', 'HowToStep')),
+        'tool': ('tool', 'http://schema.org/tool', ('Text', 'HowToTool')),
+        'performTime': ('performTime', 'http://schema.org/performTime', ('Duration',)),
+        'supply': ('supply', 'http://schema.org/supply', ('Text', 'HowToSupply')),
+        'prepTime': ('prepTime', 'http://schema.org/prepTime', ('Duration',)),
+        'steps': ('steps', 'http://schema.org/steps', ('Text', 'ItemList', 'CreativeWork')),
+        'estimatedCost': ('estimatedCost', 'http://schema.org/estimatedCost', ('Text', 'MonetaryAmount')),
+        'yield_': ('yield', 'http://schema.org/yield', ('Text', 'QuantitativeValue')),
+    }),
+    'HowToDirection': ('ListItem', {
+        'totalTime': ('totalTime', 'http://schema.org/totalTime', ('Duration',)),
+        'beforeMedia': ('beforeMedia', 'http://schema.org/beforeMedia', ('URL', 'MediaObject')),
+        'tool': ('tool', 'http://schema.org/tool', ('Text', 'HowToTool')),
+        'performTime': ('performTime', 'http://schema.org/performTime', ('Duration',)),
+        'supply': ('supply', 'http://schema.org/supply', ('Text', 'HowToSupply')),
+        'duringMedia': ('duringMedia', 'http://schema.org/duringMedia', ('URL', 'MediaObject')),
+        'prepTime': ('prepTime', 'http://schema.org/prepTime', ('Duration',)),
+        'afterMedia': ('afterMedia', 'http://schema.org/afterMedia', ('URL', 'MediaObject')),
+    }),
+    'HowToItem': ('ListItem', {
+        'requiredQuantity': ('requiredQuantity', 'http://schema.org/requiredQuantity', ('Number', 'Text', 'QuantitativeValue')),
+    }),
+    'HowToSection': ('CreativeWork', {
+        'steps': ('steps', 'http://schema.org/steps', ('Text', 'ItemList', 'CreativeWork')),
+    }),
+    'HowToStep': ('ListItem', {}),
+    'HowToSupply': ('HowToItem', {
+        'estimatedCost': ('estimatedCost', 'http://schema.org/estimatedCost', ('Text', 'MonetaryAmount')),
+    }),
+    'HowToTip': ('CreativeWork', {}),
+    'HowToTool': ('HowToItem', {}),
+    'HyperToc': ('CreativeWork', {
+        'associatedMedia': ('associatedMedia', 'http://schema.org/associatedMedia', ('MediaObject',)),
+        'tocEntry': ('tocEntry', 'http://schema.org/tocEntry', ('HyperTocEntry',)),
+    }),
+    'HyperTocEntry': ('CreativeWork', {
+        'utterances': ('utterances', 'http://schema.org/utterances', ('Text',)),
+        'tocContinuation': ('tocContinuation', 'http://schema.org/tocContinuation', ('HyperTocEntry',)),
+        'associatedMedia': ('associatedMedia', 'http://schema.org/associatedMedia', ('MediaObject',)),
+    }),
+    'IceCreamShop': ('FoodEstablishment', {}),
+    'IgnoreAction': ('AssessAction', {}),
+    'ImageGallery': ('MediaGallery', {}),
+    'ImageObject': ('MediaObject', {
+        'caption': ('caption', 'http://schema.org/caption', ('Text', 'MediaObject')),
+        'representativeOfPage': ('representativeOfPage', 'http://schema.org/representativeOfPage', ('Boolean',)),
+        'embeddedTextCaption': ('embeddedTextCaption', 'http://schema.org/embeddedTextCaption', ('Text',)),
+        'exifData': ('exifData', 'http://schema.org/exifData', ('Text', 'PropertyValue')),
+    }),
+    'ImageObjectSnapshot': ('ImageObject', {}),
+    'ImagingTest': ('MedicalTest', {
+        'imagingTechnique': ('imagingTechnique', 'http://schema.org/imagingTechnique', ('MedicalImagingTechnique',)),
+    }),
+    'IndividualPhysician': ('Physician', {
+        'practicesAt': ('practicesAt', 'http://schema.org/practicesAt', ('MedicalOrganization',)),
+    }),
+    'IndividualProduct': ('Product', {
+        'serialNumber': ('serialNumber', 'http://schema.org/serialNumber', ('Text',)),
+    }),
+    'InfectiousDisease': ('MedicalCondition', {
+        'infectiousAgentClass': ('infectiousAgentClass', 'http://schema.org/infectiousAgentClass', ('InfectiousAgentClass',)),
+        'infectiousAgent': ('infectiousAgent', 'http://schema.org/infectiousAgent', ('Text',)),
+        'transmissionMethod': ('transmissionMethod', 'http://schema.org/transmissionMethod', ('Text',)),
+    }),
+    'InformAction': ('CommunicateAction', {
+        'event': ('event', 'http://schema.org/event', ('Event',)),
+    }),
+    'InsertAction': ('AddAction', {
+        'toLocation': ('toLocation', 'http://schema.org/toLocation', ('Place',)),
+    }),
+    'InstallAction': ('ConsumeAction', {}),
+    'InsuranceAgency': ('FinancialService', {}),
+    'Intangible': ('Thing', {}),
+    'Integer': (None, {}),
+    'InteractAction': ('Action', {}),
+    'InteractionCounter': ('StructuredValue', {
+        'startTime': ('startTime', 'http://schema.org/startTime', ('DateTime', 'Time')),
+        'interactionService': ('interactionService', 'http://schema.org/interactionService', ('WebSite', 'SoftwareApplication')),
+        'userInteractionCount': ('userInteractionCount', 'http://schema.org/userInteractionCount', ('Integer',)),
+        'location': ('location', 'http://schema.org/location', ('Text', 'VirtualLocation', 'PostalAddress', 'Place')),
+        'endTime': ('endTime', 'http://schema.org/endTime', ('DateTime', 'Time')),
+        'interactionType': ('interactionType', 'http://schema.org/interactionType', ('Action',)),
+    }),
+    'InternetCafe': ('LocalBusiness', {}),
+    'InvestmentFund': ('InvestmentOrDeposit', {}),
+    'InvestmentOrDeposit': ('FinancialProduct', {
+        'amount': ('amount', 'http://schema.org/amount', ('Number', 'MonetaryAmount')),
+    }),
+    'InviteAction': ('CommunicateAction', {
+        'event': ('event', 'http://schema.org/event', ('Event',)),
+    }),
+    'Invoice': ('Intangible', {
+        'paymentMethodId': ('paymentMethodId', 'http://schema.org/paymentMethodId', ('Text',)),
+        'minimumPaymentDue': ('minimumPaymentDue', 'http://schema.org/minimumPaymentDue', ('PriceSpecification', 'MonetaryAmount')),
+        'scheduledPaymentDate': ('scheduledPaymentDate', 'http://schema.org/scheduledPaymentDate', ('Date',)),
+        'confirmationNumber': ('confirmationNumber', 'http://schema.org/confirmationNumber', ('Text',)),
+        'paymentMethod': ('paymentMethod', 'http://schema.org/paymentMethod', ('Text', 'PaymentMethod')),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'totalPaymentDue': ('totalPaymentDue', 'http://schema.org/totalPaymentDue', ('PriceSpecification', 'MonetaryAmount')),
+        'paymentDueDate': ('paymentDueDate', 'http://schema.org/paymentDueDate', ('DateTime', 'Date')),
+        'accountId': ('accountId', 'http://schema.org/accountId', ('Text',)),
+        'broker': ('broker', 'http://schema.org/broker', ('Organization', 'Person')),
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+        'billingPeriod': ('billingPeriod', 'http://schema.org/billingPeriod', ('Duration',)),
+        'customer': ('customer', 'http://schema.org/customer', ('Organization', 'Person')),
+        'paymentStatus': ('paymentStatus', 'http://schema.org/paymentStatus', ('Text', 'PaymentStatusType')),
+        'referencesOrder': ('referencesOrder', 'http://schema.org/referencesOrder', ('Order',)),
+        'paymentDue': ('paymentDue', 'http://schema.org/paymentDue', ('DateTime',)),
+    }),
+    'ItemList': ('Intangible', {
+        'aggregateElement': ('aggregateElement', 'http://schema.org/aggregateElement', ('Thing',)),
+        'itemListOrder': ('itemListOrder', 'http://schema.org/itemListOrder', ('Text', 'ItemListOrderType')),
+        'numberOfItems': ('numberOfItems', 'http://schema.org/numberOfItems', ('Integer',)),
+        'itemListElement': ('itemListElement', 'http://schema.org/itemListElement', ('Text', 'ListItem', 'Thing')),
+    }),
+    'ItemPage': ('WebPage', {}),
+    'JewelryStore': ('Store', {}),
+    'JobPosting': ('Intangible', {
+        'experienceRequirements': ('experienceRequirements', 'http://schema.org/experienceRequirements', ('Text', 'OccupationalExperienceRequirements')),
+        'jobImmediateStart': ('jobImmediateStart', 'http://schema.org/jobImmediateStart', ('Boolean',)),
+        'responsibilities': ('responsibilities', 'http://schema.org/responsibilities', ('Text',)),
+        'jobStartDate': ('jobStartDate', 'http://schema.org/jobStartDate', ('Date', 'Text')),
+        'datePosted': ('datePosted', 'http://schema.org/datePosted', ('DateTime', 'Date')),
+        'applicationContact': ('applicationContact', 'http://schema.org/applicationContact', ('ContactPoint',)),
+        'benefits': ('benefits', 'http://schema.org/benefits', ('Text',)),
+        'skills': ('skills', 'http://schema.org/skills', ('Text', 'DefinedTerm')),
+        'employerOverview': ('employerOverview', 'http://schema.org/employerOverview', ('Text',)),
+        'jobBenefits': ('jobBenefits', 'http://schema.org/jobBenefits', ('Text',)),
+        'directApply': ('directApply', 'http://schema.org/directApply', ('Boolean',)),
+        'workHours': ('workHours', 'http://schema.org/workHours', ('Text',)),
+        'hiringOrganization': ('hiringOrganization', 'http://schema.org/hiringOrganization', ('Organization', 'Person')),
+        'applicantLocationRequirements': ('applicantLocationRequirements', 'http://schema.org/applicantLocationRequirements', ('AdministrativeArea',)),
+        'totalJobOpenings': ('totalJobOpenings', 'http://schema.org/totalJobOpenings', ('Integer',)),
+        'eligibilityToWorkRequirement': ('eligibilityToWorkRequirement', 'http://schema.org/eligibilityToWorkRequirement', ('Text',)),
+        'specialCommitments': ('specialCommitments', 'http://schema.org/specialCommitments', ('Text',)),
+        'occupationalCategory': ('occupationalCategory', 'http://schema.org/occupationalCategory', ('Text', 'CategoryCode')),
+        'incentiveCompensation': ('incentiveCompensation', 'http://schema.org/incentiveCompensation', ('Text',)),
+        'jobLocationType': ('jobLocationType', 'http://schema.org/jobLocationType', ('Text',)),
+        'employmentUnit': ('employmentUnit', 'http://schema.org/employmentUnit', ('Organization',)),
+        'employmentType': ('employmentType', 'http://schema.org/employmentType', ('Text',)),
+        'qualifications': ('qualifications', 'http://schema.org/qualifications', ('Text', 'EducationalOccupationalCredential')),
+        'experienceInPlaceOfEducation': ('experienceInPlaceOfEducation', 'http://schema.org/experienceInPlaceOfEducation', ('Boolean',)),
+        'relevantOccupation': ('relevantOccupation', 'http://schema.org/relevantOccupation', ('Occupation',)),
+        'educationRequirements': ('educationRequirements', 'http://schema.org/educationRequirements', ('Text', 'EducationalOccupationalCredential')),
+        'estimatedSalary': ('estimatedSalary', 'http://schema.org/estimatedSalary', ('Number', 'MonetaryAmount', 'MonetaryAmountDistribution')),
+        'baseSalary': ('baseSalary', 'http://schema.org/baseSalary', ('Number', 'PriceSpecification', 'MonetaryAmount')),
+        'incentives': ('incentives', 'http://schema.org/incentives', ('Text',)),
+        'industry': ('industry', 'http://schema.org/industry', ('Text', 'DefinedTerm')),
+        'title': ('title', 'http://schema.org/title', ('Text',)),
+        'salaryCurrency': ('salaryCurrency', 'http://schema.org/salaryCurrency', ('Text',)),
+        'sensoryRequirement': ('sensoryRequirement', 'http://schema.org/sensoryRequirement', ('URL', 'Text', 'DefinedTerm')),
+        'jobLocation': ('jobLocation', 'http://schema.org/jobLocation', ('Place',)),
+        'securityClearanceRequirement': ('securityClearanceRequirement', 'http://schema.org/securityClearanceRequirement', ('URL', 'Text')),
+        'physicalRequirement': ('physicalRequirement', 'http://schema.org/physicalRequirement', ('URL', 'Text', 'DefinedTerm')),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'JoinAction': ('InteractAction', {
+        'event': ('event', 'http://schema.org/event', ('Event',)),
+    }),
+    'Joint': ('AnatomicalStructure', {
+        'biomechnicalClass': ('biomechnicalClass', 'http://schema.org/biomechnicalClass', ('Text',)),
+        'structuralClass': ('structuralClass', 'http://schema.org/structuralClass', ('Text',)),
+        'functionalClass': ('functionalClass', 'http://schema.org/functionalClass', ('Text', 'MedicalEntity')),
+    }),
+    'LakeBodyOfWater': ('BodyOfWater', {}),
+    'Landform': ('Place', {}),
+    'LandmarksOrHistoricalBuildings': ('Place', {}),
+    'Language': ('Intangible', {}),
+    'LearningResource': ('CreativeWork', {
+        'educationalAlignment': ('educationalAlignment', 'http://schema.org/educationalAlignment', ('AlignmentObject',)),
+        'educationalUse': ('educationalUse', 'http://schema.org/educationalUse', ('Text', 'DefinedTerm')),
+        'assesses': ('assesses', 'http://schema.org/assesses', ('Text', 'DefinedTerm')),
+        'teaches': ('teaches', 'http://schema.org/teaches', ('Text', 'DefinedTerm')),
+        'educationalLevel': ('educationalLevel', 'http://schema.org/educationalLevel', ('URL', 'Text', 'DefinedTerm')),
+        'learningResourceType': ('learningResourceType', 'http://schema.org/learningResourceType', ('Text', 'DefinedTerm')),
+        'competencyRequired': ('competencyRequired', 'http://schema.org/competencyRequired', ('URL', 'Text', 'DefinedTerm')),
+    }),
+    'LeaveAction': ('InteractAction', {
+        'event': ('event', 'http://schema.org/event', ('Event',)),
+    }),
+    'LegalService': ('LocalBusiness', {}),
+    'Legislation': ('CreativeWork', {
+        'legislationResponsible': ('legislationResponsible', 'http://schema.org/legislationResponsible', ('Organization', 'Person')),
+        'legislationCommences': ('legislationCommences', 'http://schema.org/legislationCommences', ('Legislation',)),
+        'legislationDate': ('legislationDate', 'http://schema.org/legislationDate', ('Date',)),
+        'legislationCountersignedBy': ('legislationCountersignedBy', 'http://schema.org/legislationCountersignedBy', ('Organization', 'Person')),
+        'jurisdiction': ('jurisdiction', 'http://schema.org/jurisdiction', ('Text', 'AdministrativeArea')),
+        'legislationLegalForce': ('legislationLegalForce', 'http://schema.org/legislationLegalForce', ('LegalForceStatus',)),
+        'legislationEnsuresImplementationOf': ('legislationEnsuresImplementationOf', 'http://schema.org/legislationEnsuresImplementationOf', ('Legislation',)),
+        'legislationIdentifier': ('legislationIdentifier', 'http://schema.org/legislationIdentifier', ('URL', 'Text')),
+        'legislationChanges': ('legislationChanges', 'http://schema.org/legislationChanges', ('Legislation',)),
+        'legislationPassedBy': ('legislationPassedBy', 'http://schema.org/legislationPassedBy', ('Organization', 'Person')),
+        'legislationDateOfApplicability': ('legislationDateOfApplicability', 'http://schema.org/legislationDateOfApplicability', ('Date',)),
+        'legislationDateVersion': ('legislationDateVersion', 'http://schema.org/legislationDateVersion', ('Date',)),
+        'legislationConsolidates': ('legislationConsolidates', 'http://schema.org/legislationConsolidates', ('Legislation',)),
+        'legislationJurisdiction': ('legislationJurisdiction', 'http://schema.org/legislationJurisdiction', ('Text', 'AdministrativeArea')),
+        'legislationTransposes': ('legislationTransposes', 'http://schema.org/legislationTransposes', ('Legislation',)),
+        'legislationApplies': ('legislationApplies', 'http://schema.org/legislationApplies', ('Legislation',)),
+        'legislationAmends': ('legislationAmends', 'http://schema.org/legislationAmends', ('Legislation',)),
+        'legislationCorrects': ('legislationCorrects', 'http://schema.org/legislationCorrects', ('Legislation',)),
+        'legislationRepeals': ('legislationRepeals', 'http://schema.org/legislationRepeals', ('Legislation',)),
+        'legislationType': ('legislationType', 'http://schema.org/legislationType', ('Text', 'CategoryCode')),
+    }),
+    'LegislationObject': ('Legislation', {
+        'legislationLegalValue': ('legislationLegalValue', 'http://schema.org/legislationLegalValue', ('LegalValueLevel',)),
+    }),
+    'LegislativeBuilding': ('GovernmentBuilding', {}),
+    'LendAction': ('TransferAction', {
+        'borrower': ('borrower', 'http://schema.org/borrower', ('Person',)),
+    }),
+    'Library': ('LocalBusiness', {}),
+    'LibrarySystem': ('Organization', {}),
+    'LifestyleModification': ('MedicalEntity', {}),
+    'Ligament': ('AnatomicalStructure', {}),
+    'LikeAction': ('ReactAction', {}),
+    'LinkRole': ('Role', {
+        'linkRelationship': ('linkRelationship', 'http://schema.org/linkRelationship', ('Text',)),
+        'inLanguage': ('inLanguage', 'http://schema.org/inLanguage', ('Text', 'Language')),
+    }),
+    'LiquorStore': ('Store', {}),
+    'ListItem': ('Intangible', {
+        'nextItem': ('nextItem', 'http://schema.org/nextItem', ('ListItem',)),
+        'position': ('position', 'http://schema.org/position', ('Integer', 'Text')),
+        'item': ('item', 'http://schema.org/item', ('Thing',)),
+        'previousItem': ('previousItem', 'http://schema.org/previousItem', ('ListItem',)),
+    }),
+    'ListenAction': ('ConsumeAction', {}),
+    'LiteraryEvent': ('Event', {}),
+    'LiveBlogPosting': ('BlogPosting', {
+        'coverageEndTime': ('coverageEndTime', 'http://schema.org/coverageEndTime', ('DateTime',)),
+        'liveBlogUpdate': ('liveBlogUpdate', 'http://schema.org/liveBlogUpdate', ('BlogPosting',)),
+        'coverageStartTime': ('coverageStartTime', 'http://schema.org/coverageStartTime', ('DateTime',)),
+    }),
+    'LoanOrCredit': ('FinancialProduct', {
+        'currency': ('currency', 'http://schema.org/currency', ('Text',)),
+        'amount': ('amount', 'http://schema.org/amount', ('Number', 'MonetaryAmount')),
+        'renegotiableLoan': ('renegotiableLoan', 'http://schema.org/renegotiableLoan', ('Boolean',)),
+        'gracePeriod': ('gracePeriod', 'http://schema.org/gracePeriod', ('Duration',)),
+        'loanTerm': ('loanTerm', 'http://schema.org/loanTerm', ('QuantitativeValue',)),
+        'requiredCollateral': ('requiredCollateral', 'http://schema.org/requiredCollateral', ('Text', 'Thing')),
+        'recourseLoan': ('recourseLoan', 'http://schema.org/recourseLoan', ('Boolean',)),
+        'loanType': ('loanType', 'http://schema.org/loanType', ('URL', 'Text')),
+        'loanRepaymentForm': ('loanRepaymentForm', 'http://schema.org/loanRepaymentForm', ('RepaymentSpecification',)),
+    }),
+    'LocalBusiness': ('Organization', {
+        'currenciesAccepted': ('currenciesAccepted', 'http://schema.org/currenciesAccepted', ('Text',)),
+        'openingHours': ('openingHours', 'http://schema.org/openingHours', ('Text',)),
+        'priceRange': ('priceRange', 'http://schema.org/priceRange', ('Text',)),
+        'paymentAccepted': ('paymentAccepted', 'http://schema.org/paymentAccepted', ('Text',)),
+        'branchOf': ('branchOf', 'http://schema.org/branchOf', ('Organization',)),
+    }),
+    'LocationFeatureSpecification': ('PropertyValue', {
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'hoursAvailable': ('hoursAvailable', 'http://schema.org/hoursAvailable', ('OpeningHoursSpecification',)),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'Locksmith': ('HomeAndConstructionBusiness', {}),
+    'LodgingBusiness': ('LocalBusiness', {
+        'numberOfRooms': ('numberOfRooms', 'http://schema.org/numberOfRooms', ('Number', 'QuantitativeValue')),
+        'availableLanguage': ('availableLanguage', 'http://schema.org/availableLanguage', ('Text', 'Language')),
+        'checkoutTime': ('checkoutTime', 'http://schema.org/checkoutTime', ('DateTime', 'Time')),
+        'audience': ('audience', 'http://schema.org/audience', ('Audience',)),
+        'amenityFeature': ('amenityFeature', 'http://schema.org/amenityFeature', ('LocationFeatureSpecification',)),
+        'petsAllowed': ('petsAllowed', 'http://schema.org/petsAllowed', ('Boolean', 'Text')),
+        'starRating': ('starRating', 'http://schema.org/starRating', ('Rating',)),
+        'checkinTime': ('checkinTime', 'http://schema.org/checkinTime', ('DateTime', 'Time')),
+    }),
+    'LodgingReservation': ('Reservation', {
+        'lodgingUnitType': ('lodgingUnitType', 'http://schema.org/lodgingUnitType', ('Text', 'QualitativeValue')),
+        'lodgingUnitDescription': ('lodgingUnitDescription', 'http://schema.org/lodgingUnitDescription', ('Text',)),
+        'numChildren': ('numChildren', 'http://schema.org/numChildren', ('Integer', 'QuantitativeValue')),
+        'numAdults': ('numAdults', 'http://schema.org/numAdults', ('Integer', 'QuantitativeValue')),
+        'checkoutTime': ('checkoutTime', 'http://schema.org/checkoutTime', ('DateTime', 'Time')),
+        'checkinTime': ('checkinTime', 'http://schema.org/checkinTime', ('DateTime', 'Time')),
+    }),
+    'LoseAction': ('AchieveAction', {
+        'winner': ('winner', 'http://schema.org/winner', ('Person',)),
+    }),
+    'LymphaticVessel': ('Vessel', {
+        'originatesFrom': ('originatesFrom', 'http://schema.org/originatesFrom', ('Vessel',)),
+        'regionDrained': ('regionDrained', 'http://schema.org/regionDrained', ('AnatomicalStructure', 'AnatomicalSystem')),
+        'runsTo': ('runsTo', 'http://schema.org/runsTo', ('Vessel',)),
+    }),
+    'Manuscript': ('CreativeWork', {}),
+    'Map': ('CreativeWork', {
+        'mapType': ('mapType', 'http://schema.org/mapType', ('MapCategoryType',)),
+    }),
+    'MarryAction': ('InteractAction', {}),
+    'Mass': ('Quantity', {}),
+    'MathSolver': ('CreativeWork', {
+        'mathExpression': ('mathExpression', 'http://schema.org/mathExpression', ('Text', 'SolveMathAction')),
+    }),
+    'MaximumDoseSchedule': ('DoseSchedule', {}),
+    'MeasurementTypeEnumeration': ('Enumeration', {}),
+    'MediaEnumeration': ('Enumeration', {}),
+    'MediaGallery': ('CollectionPage', {}),
+    'MediaObject': ('CreativeWork', {
+        'startTime': ('startTime', 'http://schema.org/startTime', ('DateTime', 'Time')),
+        'bitrate': ('bitrate', 'http://schema.org/bitrate', ('Text',)),
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'encodesCreativeWork': ('encodesCreativeWork', 'http://schema.org/encodesCreativeWork', ('CreativeWork',)),
+        'contentUrl': ('contentUrl', 'http://schema.org/contentUrl', ('URL',)),
+        'uploadDate': ('uploadDate', 'http://schema.org/uploadDate', ('DateTime', 'Date')),
+        'height': ('height', 'http://schema.org/height', ('Distance', 'QuantitativeValue')),
+        'encodingFormat': ('encodingFormat', 'http://schema.org/encodingFormat', ('URL', 'Text')),
+        'embedUrl': ('embedUrl', 'http://schema.org/embedUrl', ('URL',)),
+        'requiresSubscription': ('requiresSubscription', 'http://schema.org/requiresSubscription', ('Boolean', 'MediaSubscription')),
+        'ineligibleRegion': ('ineligibleRegion', 'http://schema.org/ineligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'playerType': ('playerType', 'http://schema.org/playerType', ('Text',)),
+        'width': ('width', 'http://schema.org/width', ('Distance', 'QuantitativeValue')),
+        'endTime': ('endTime', 'http://schema.org/endTime', ('DateTime', 'Time')),
+        'regionsAllowed': ('regionsAllowed', 'http://schema.org/regionsAllowed', ('Place',)),
+        'contentSize': ('contentSize', 'http://schema.org/contentSize', ('Text',)),
+        'sha256': ('sha256', 'http://schema.org/sha256', ('Text',)),
+        'associatedArticle': ('associatedArticle', 'http://schema.org/associatedArticle', ('NewsArticle',)),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+        'interpretedAsClaim': ('interpretedAsClaim', 'http://schema.org/interpretedAsClaim', ('Claim',)),
+    }),
+    'MediaReview': ('Review', {
+        'originalMediaLink': ('originalMediaLink', 'http://schema.org/originalMediaLink', ('URL', 'MediaObject', 'WebPage')),
+        'originalMediaContextDescription': ('originalMediaContextDescription', 'http://schema.org/originalMediaContextDescription', ('Text',)),
+        'mediaAuthenticityCategory': ('mediaAuthenticityCategory', 'http://schema.org/mediaAuthenticityCategory', ('MediaManipulationRatingEnumeration',)),
+    }),
+    'MediaReviewItem': ('CreativeWork', {
+        'mediaItemAppearance': ('mediaItemAppearance', 'http://schema.org/mediaItemAppearance', ('MediaObject',)),
+    }),
+    'MediaSubscription': ('Intangible', {
+        'authenticator': ('authenticator', 'http://schema.org/authenticator', ('Organization',)),
+        'expectsAcceptanceOf': ('expectsAcceptanceOf', 'http://schema.org/expectsAcceptanceOf', ('Offer',)),
+    }),
+    'MedicalAudience': ('PeopleAudience', {}),
+    'MedicalBusiness': ('LocalBusiness', {}),
+    'MedicalCause': ('MedicalEntity', {
+        'causeOf': ('causeOf', 'http://schema.org/causeOf', ('MedicalEntity',)),
+    }),
+    'MedicalClinic': ('MedicalOrganization', {
+        'medicalSpecialty': ('medicalSpecialty', 'http://schema.org/medicalSpecialty', ('MedicalSpecialty',)),
+        'availableService': ('availableService', 'http://schema.org/availableService', ('MedicalProcedure', 'MedicalTest', 'MedicalTherapy')),
+    }),
+    'MedicalCode': ('MedicalIntangible', {
+        'codingSystem': ('codingSystem', 'http://schema.org/codingSystem', ('Text',)),
+        'codeValue': ('codeValue', 'http://schema.org/codeValue', ('Text',)),
+    }),
+    'MedicalCondition': ('MedicalEntity', {
+        'primaryPrevention': ('primaryPrevention', 'http://schema.org/primaryPrevention', ('MedicalTherapy',)),
+        'signOrSymptom': ('signOrSymptom', 'http://schema.org/signOrSymptom', ('MedicalSignOrSymptom',)),
+        'status': ('status', 'http://schema.org/status', ('Text', 'MedicalStudyStatus', 'EventStatusType')),
+        'naturalProgression': ('naturalProgression', 'http://schema.org/naturalProgression', ('Text',)),
+        'stage': ('stage', 'http://schema.org/stage', ('MedicalConditionStage',)),
+        'riskFactor': ('riskFactor', 'http://schema.org/riskFactor', ('MedicalRiskFactor',)),
+        'secondaryPrevention': ('secondaryPrevention', 'http://schema.org/secondaryPrevention', ('MedicalTherapy',)),
+        'possibleComplication': ('possibleComplication', 'http://schema.org/possibleComplication', ('Text',)),
+        'expectedPrognosis': ('expectedPrognosis', 'http://schema.org/expectedPrognosis', ('Text',)),
+        'possibleTreatment': ('possibleTreatment', 'http://schema.org/possibleTreatment', ('MedicalTherapy',)),
+        'drug': ('drug', 'http://schema.org/drug', ('Drug',)),
+        'associatedAnatomy': ('associatedAnatomy', 'http://schema.org/associatedAnatomy', ('AnatomicalStructure', 'SuperficialAnatomy', 'AnatomicalSystem')),
+        'epidemiology': ('epidemiology', 'http://schema.org/epidemiology', ('Text',)),
+        'pathophysiology': ('pathophysiology', 'http://schema.org/pathophysiology', ('Text',)),
+        'differentialDiagnosis': ('differentialDiagnosis', 'http://schema.org/differentialDiagnosis', ('DDxElement',)),
+        'typicalTest': ('typicalTest', 'http://schema.org/typicalTest', ('MedicalTest',)),
+    }),
+    'MedicalConditionStage': ('MedicalIntangible', {
+        'subStageSuffix': ('subStageSuffix', 'http://schema.org/subStageSuffix', ('Text',)),
+        'stageAsNumber': ('stageAsNumber', 'http://schema.org/stageAsNumber', ('Number',)),
+    }),
+    'MedicalContraindication': ('MedicalEntity', {}),
+    'MedicalDevice': ('MedicalEntity', {
+        'preOp': ('preOp', 'http://schema.org/preOp', ('Text',)),
+        'postOp': ('postOp', 'http://schema.org/postOp', ('Text',)),
+        'contraindication': ('contraindication', 'http://schema.org/contraindication', ('Text', 'MedicalContraindication')),
+        'seriousAdverseOutcome': ('seriousAdverseOutcome', 'http://schema.org/seriousAdverseOutcome', ('MedicalEntity',)),
+        'procedure': ('procedure', 'http://schema.org/procedure', ('Text',)),
+        'adverseOutcome': ('adverseOutcome', 'http://schema.org/adverseOutcome', ('MedicalEntity',)),
+    }),
+    'MedicalEntity': ('Thing', {
+        'relevantSpecialty': ('relevantSpecialty', 'http://schema.org/relevantSpecialty', ('MedicalSpecialty',)),
+        'funding': ('funding', 'http://schema.org/funding', ('Grant',)),
+        'study': ('study', 'http://schema.org/study', ('MedicalStudy',)),
+        'recognizingAuthority': ('recognizingAuthority', 'http://schema.org/recognizingAuthority', ('Organization',)),
+        'medicineSystem': ('medicineSystem', 'http://schema.org/medicineSystem', ('MedicineSystem',)),
+        'code': ('code', 'http://schema.org/code', ('MedicalCode',)),
+        'legalStatus': ('legalStatus', 'http://schema.org/legalStatus', ('Text', 'MedicalEnumeration', 'DrugLegalStatus')),
+        'guideline': ('guideline', 'http://schema.org/guideline', ('MedicalGuideline',)),
+    }),
+    'MedicalEnumeration': ('Enumeration', {}),
+    'MedicalGuideline': ('MedicalEntity', {
+        'guidelineSubject': ('guidelineSubject', 'http://schema.org/guidelineSubject', ('MedicalEntity',)),
+        'evidenceOrigin': ('evidenceOrigin', 'http://schema.org/evidenceOrigin', ('Text',)),
+        'guidelineDate': ('guidelineDate', 'http://schema.org/guidelineDate', ('Date',)),
+        'evidenceLevel': ('evidenceLevel', 'http://schema.org/evidenceLevel', ('MedicalEvidenceLevel',)),
+    }),
+    'MedicalGuidelineContraindication': ('MedicalGuideline', {}),
+    'MedicalGuidelineRecommendation': ('MedicalGuideline', {
+        'recommendationStrength': ('recommendationStrength', 'http://schema.org/recommendationStrength', ('Text',)),
+    }),
+    'MedicalIndication': ('MedicalEntity', {}),
+    'MedicalIntangible': ('MedicalEntity', {}),
+    'MedicalObservationalStudy': ('MedicalStudy', {
+        'studyDesign': ('studyDesign', 'http://schema.org/studyDesign', ('MedicalObservationalStudyDesign',)),
+    }),
+    'MedicalOrganization': ('Organization', {
+        'healthPlanNetworkId': ('healthPlanNetworkId', 'http://schema.org/healthPlanNetworkId', ('Text',)),
+        'isAcceptingNewPatients': ('isAcceptingNewPatients', 'http://schema.org/isAcceptingNewPatients', ('Boolean',)),
+        'medicalSpecialty': ('medicalSpecialty', 'http://schema.org/medicalSpecialty', ('MedicalSpecialty',)),
+    }),
+    'MedicalProcedure': ('MedicalEntity', {
+        'status': ('status', 'http://schema.org/status', ('Text', 'MedicalStudyStatus', 'EventStatusType')),
+        'procedureType': ('procedureType', 'http://schema.org/procedureType', ('MedicalProcedureType',)),
+        'preparation': ('preparation', 'http://schema.org/preparation', ('Text', 'MedicalEntity')),
+        'followup': ('followup', 'http://schema.org/followup', ('Text',)),
+        'howPerformed': ('howPerformed', 'http://schema.org/howPerformed', ('Text',)),
+        'bodyLocation': ('bodyLocation', 'http://schema.org/bodyLocation', ('Text',)),
+    }),
+    'MedicalRiskCalculator': ('MedicalRiskEstimator', {}),
+    'MedicalRiskEstimator': ('MedicalEntity', {
+        'estimatesRiskOf': ('estimatesRiskOf', 'http://schema.org/estimatesRiskOf', ('MedicalEntity',)),
+        'includedRiskFactor': ('includedRiskFactor', 'http://schema.org/includedRiskFactor', ('MedicalRiskFactor',)),
+    }),
+    'MedicalRiskFactor': ('MedicalEntity', {
+        'increasesRiskOf': ('increasesRiskOf', 'http://schema.org/increasesRiskOf', ('MedicalEntity',)),
+    }),
+    'MedicalRiskScore': ('MedicalRiskEstimator', {
+        'algorithm': ('algorithm', 'http://schema.org/algorithm', ('Text',)),
+    }),
+    'MedicalScholarlyArticle': ('ScholarlyArticle', {
+        'publicationType': ('publicationType', 'http://schema.org/publicationType', ('Text',)),
+    }),
+    'MedicalSign': ('MedicalSignOrSymptom', {
+        'identifyingTest': ('identifyingTest', 'http://schema.org/identifyingTest', ('MedicalTest',)),
+        'identifyingExam': ('identifyingExam', 'http://schema.org/identifyingExam', ('PhysicalExam',)),
+    }),
+    'MedicalSignOrSymptom': ('MedicalCondition', {
+        'possibleTreatment': ('possibleTreatment', 'http://schema.org/possibleTreatment', ('MedicalTherapy',)),
+    }),
+    'MedicalStudy': ('MedicalEntity', {
+        'status': ('status', 'http://schema.org/status', ('Text', 'MedicalStudyStatus', 'EventStatusType')),
+        'studyLocation': ('studyLocation', 'http://schema.org/studyLocation', ('AdministrativeArea',)),
+        'studySubject': ('studySubject', 'http://schema.org/studySubject', ('MedicalEntity',)),
+        'healthCondition': ('healthCondition', 'http://schema.org/healthCondition', ('MedicalCondition',)),
+        'sponsor': ('sponsor', 'http://schema.org/sponsor', ('Person', 'Organization')),
+    }),
+    'MedicalSymptom': ('MedicalSignOrSymptom', {}),
+    'MedicalTest': ('MedicalEntity', {
+        'usedToDiagnose': ('usedToDiagnose', 'http://schema.org/usedToDiagnose', ('MedicalCondition',)),
+        'normalRange': ('normalRange', 'http://schema.org/normalRange', ('Text', 'MedicalEnumeration')),
+        'affectedBy': ('affectedBy', 'http://schema.org/affectedBy', ('Drug',)),
+        'signDetected': ('signDetected', 'http://schema.org/signDetected', ('MedicalSign',)),
+        'usesDevice': ('usesDevice', 'http://schema.org/usesDevice', ('MedicalDevice',)),
+    }),
+    'MedicalTestPanel': ('MedicalTest', {
+        'subTest': ('subTest', 'http://schema.org/subTest', ('MedicalTest',)),
+    }),
+    'MedicalTherapy': ('TherapeuticProcedure', {
+        'contraindication': ('contraindication', 'http://schema.org/contraindication', ('Text', 'MedicalContraindication')),
+        'seriousAdverseOutcome': ('seriousAdverseOutcome', 'http://schema.org/seriousAdverseOutcome', ('MedicalEntity',)),
+        'duplicateTherapy': ('duplicateTherapy', 'http://schema.org/duplicateTherapy', ('MedicalTherapy',)),
+    }),
+    'MedicalTrial': ('MedicalStudy', {
+        'trialDesign': ('trialDesign', 'http://schema.org/trialDesign', ('MedicalTrialDesign',)),
+    }),
+    'MedicalWebPage': ('WebPage', {
+        'medicalAudience': ('medicalAudience', 'http://schema.org/medicalAudience', ('MedicalAudienceType', 'MedicalAudience')),
+        'aspect': ('aspect', 'http://schema.org/aspect', ('Text',)),
+    }),
+    'MeetingRoom': ('Room', {}),
+    'MemberProgram': ('Intangible', {
+        'hasTiers': ('hasTiers', 'http://schema.org/hasTiers', ('MemberProgramTier',)),
+        'hostingOrganization': ('hostingOrganization', 'http://schema.org/hostingOrganization', ('Organization',)),
+    }),
+    'MemberProgramTier': ('Intangible', {
+        'hasTierBenefit': ('hasTierBenefit', 'http://schema.org/hasTierBenefit', ('TierBenefitEnumeration',)),
+        'membershipPointsEarned': ('membershipPointsEarned', 'http://schema.org/membershipPointsEarned', ('Number', 'QuantitativeValue')),
+        'hasTierRequirement': ('hasTierRequirement', 'http://schema.org/hasTierRequirement', ('Text', 'CreditCard', 'MonetaryAmount', 'UnitPriceSpecification')),
+        'isTierOf': ('isTierOf', 'http://schema.org/isTierOf', ('MemberProgram',)),
+    }),
+    'MensClothingStore': ('Store', {}),
+    'Menu': ('CreativeWork', {
+        'hasMenuItem': ('hasMenuItem', 'http://schema.org/hasMenuItem', ('MenuItem',)),
+        'hasMenuSection': ('hasMenuSection', 'http://schema.org/hasMenuSection', ('MenuSection',)),
+    }),
+    'MenuItem': ('Intangible', {
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'nutrition': ('nutrition', 'http://schema.org/nutrition', ('NutritionInformation',)),
+        'suitableForDiet': ('suitableForDiet', 'http://schema.org/suitableForDiet', ('RestrictedDiet',)),
+        'menuAddOn': ('menuAddOn', 'http://schema.org/menuAddOn', ('MenuItem', 'MenuSection')),
+    }),
+    'MenuSection': ('CreativeWork', {
+        'hasMenuItem': ('hasMenuItem', 'http://schema.org/hasMenuItem', ('MenuItem',)),
+        'hasMenuSection': ('hasMenuSection', 'http://schema.org/hasMenuSection', ('MenuSection',)),
+    }),
+    'MerchantReturnPolicy': ('Intangible', {
+        'itemDefectReturnShippingFeesAmount': ('itemDefectReturnShippingFeesAmount', 'http://schema.org/itemDefectReturnShippingFeesAmount', ('MonetaryAmount',)),
+        'applicableCountry': ('applicableCountry', 'http://schema.org/applicableCountry', ('Text', 'Country')),
+        'returnPolicyCountry': ('returnPolicyCountry', 'http://schema.org/returnPolicyCountry', ('Text', 'Country')),
+        'returnPolicySeasonalOverride': ('returnPolicySeasonalOverride', 'http://schema.org/returnPolicySeasonalOverride', ('MerchantReturnPolicySeasonalOverride',)),
+        'additionalProperty': ('additionalProperty', 'http://schema.org/additionalProperty', ('PropertyValue',)),
+        'returnPolicyCategory': ('returnPolicyCategory', 'http://schema.org/returnPolicyCategory', ('MerchantReturnEnumeration',)),
+        'merchantReturnLink': ('merchantReturnLink', 'http://schema.org/merchantReturnLink', ('URL',)),
+        'customerRemorseReturnShippingFeesAmount': ('customerRemorseReturnShippingFeesAmount', 'http://schema.org/customerRemorseReturnShippingFeesAmount', ('MonetaryAmount',)),
+        'returnMethod': ('returnMethod', 'http://schema.org/returnMethod', ('ReturnMethodEnumeration',)),
+        'customerRemorseReturnLabelSource': ('customerRemorseReturnLabelSource', 'http://schema.org/customerRemorseReturnLabelSource', ('ReturnLabelSourceEnumeration',)),
+        'returnFees': ('returnFees', 'http://schema.org/returnFees', ('ReturnFeesEnumeration',)),
+        'itemDefectReturnLabelSource': ('itemDefectReturnLabelSource', 'http://schema.org/itemDefectReturnLabelSource', ('ReturnLabelSourceEnumeration',)),
+        'inStoreReturnsOffered': ('inStoreReturnsOffered', 'http://schema.org/inStoreReturnsOffered', ('Boolean',)),
+        'customerRemorseReturnFees': ('customerRemorseReturnFees', 'http://schema.org/customerRemorseReturnFees', ('ReturnFeesEnumeration',)),
+        'merchantReturnDays': ('merchantReturnDays', 'http://schema.org/merchantReturnDays', ('Integer', 'DateTime', 'Date')),
+        'returnLabelSource': ('returnLabelSource', 'http://schema.org/returnLabelSource', ('ReturnLabelSourceEnumeration',)),
+        'restockingFee': ('restockingFee', 'http://schema.org/restockingFee', ('Number', 'MonetaryAmount')),
+        'refundType': ('refundType', 'http://schema.org/refundType', ('RefundTypeEnumeration',)),
+        'itemDefectReturnFees': ('itemDefectReturnFees', 'http://schema.org/itemDefectReturnFees', ('ReturnFeesEnumeration',)),
+        'validForMemberTier': ('validForMemberTier', 'http://schema.org/validForMemberTier', ('MemberProgramTier',)),
+        'itemCondition': ('itemCondition', 'http://schema.org/itemCondition', ('OfferItemCondition',)),
+        'returnShippingFeesAmount': ('returnShippingFeesAmount', 'http://schema.org/returnShippingFeesAmount', ('MonetaryAmount',)),
+    }),
+    'MerchantReturnPolicySeasonalOverride': ('Intangible', {
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'returnPolicyCategory': ('returnPolicyCategory', 'http://schema.org/returnPolicyCategory', ('MerchantReturnEnumeration',)),
+        'returnMethod': ('returnMethod', 'http://schema.org/returnMethod', ('ReturnMethodEnumeration',)),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+        'returnFees': ('returnFees', 'http://schema.org/returnFees', ('ReturnFeesEnumeration',)),
+        'merchantReturnDays': ('merchantReturnDays', 'http://schema.org/merchantReturnDays', ('Integer', 'DateTime', 'Date')),
+        'restockingFee': ('restockingFee', 'http://schema.org/restockingFee', ('Number', 'MonetaryAmount')),
+        'refundType': ('refundType', 'http://schema.org/refundType', ('RefundTypeEnumeration',)),
+        'returnShippingFeesAmount': ('returnShippingFeesAmount', 'http://schema.org/returnShippingFeesAmount', ('MonetaryAmount',)),
+    }),
+    'Message': ('CreativeWork', {
+        'dateReceived': ('dateReceived', 'http://schema.org/dateReceived', ('DateTime',)),
+        'toRecipient': ('toRecipient', 'http://schema.org/toRecipient', ('Audience', 'Organization', 'ContactPoint', 'Person')),
+        'sender': ('sender', 'http://schema.org/sender', ('Person', 'Audience', 'Organization')),
+        'bccRecipient': ('bccRecipient', 'http://schema.org/bccRecipient', ('Organization', 'ContactPoint', 'Person')),
+        'ccRecipient': ('ccRecipient', 'http://schema.org/ccRecipient', ('Organization', 'ContactPoint', 'Person')),
+        'dateSent': ('dateSent', 'http://schema.org/dateSent', ('DateTime',)),
+        'dateRead': ('dateRead', 'http://schema.org/dateRead', ('DateTime', 'Date')),
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+        'messageAttachment': ('messageAttachment', 'http://schema.org/messageAttachment', ('CreativeWork',)),
+    }),
+    'MiddleSchool': ('EducationalOrganization', {}),
+    'MobileApplication': ('SoftwareApplication', {
+        'carrierRequirements': ('carrierRequirements', 'http://schema.org/carrierRequirements', ('Text',)),
+    }),
+    'MobilePhoneStore': ('Store', {}),
+    'Model3DModel': ('MediaObject', {
+        'isResizable': ('isResizable', 'http://schema.org/isResizable', ('Boolean',)),
+    }),
+    'MolecularEntity': ('BioChemEntity', {
+        'inChIKey': ('inChIKey', 'http://schema.org/inChIKey', ('Text',)),
+        'molecularWeight': ('molecularWeight', 'http://schema.org/molecularWeight', ('Text', 'QuantitativeValue')),
+        'smiles': ('smiles', 'http://schema.org/smiles', ('Text',)),
+        'molecularFormula': ('molecularFormula', 'http://schema.org/molecularFormula', ('Text',)),
+        'potentialUse': ('potentialUse', 'http://schema.org/potentialUse', ('DefinedTerm',)),
+        'iupacName': ('iupacName', 'http://schema.org/iupacName', ('Text',)),
+        'chemicalRole': ('chemicalRole', 'http://schema.org/chemicalRole', ('DefinedTerm',)),
+        'inChI': ('inChI', 'http://schema.org/inChI', ('Text',)),
+        'monoisotopicMolecularWeight': ('monoisotopicMolecularWeight', 'http://schema.org/monoisotopicMolecularWeight', ('Text', 'QuantitativeValue')),
+    }),
+    'MonetaryAmount': ('StructuredValue', {
+        'currency': ('currency', 'http://schema.org/currency', ('Text',)),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'minValue': ('minValue', 'http://schema.org/minValue', ('Number',)),
+        'value': ('value', 'http://schema.org/value', ('Number', 'Text', 'Boolean', 'StructuredValue')),
+        'maxValue': ('maxValue', 'http://schema.org/maxValue', ('Number',)),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'MonetaryAmountDistribution': ('QuantitativeValueDistribution', {
+        'currency': ('currency', 'http://schema.org/currency', ('Text',)),
+    }),
+    'MonetaryGrant': ('Grant', {
+        'amount': ('amount', 'http://schema.org/amount', ('Number', 'MonetaryAmount')),
+        'funder': ('funder', 'http://schema.org/funder', ('Organization', 'Person')),
+    }),
+    'MoneyTransfer': ('TransferAction', {
+        'beneficiaryBank': ('beneficiaryBank', 'http://schema.org/beneficiaryBank', ('Text', 'BankOrCreditUnion')),
+        'amount': ('amount', 'http://schema.org/amount', ('Number', 'MonetaryAmount')),
+    }),
+    'MortgageLoan': ('LoanOrCredit', {
+        'loanMortgageMandateAmount': ('loanMortgageMandateAmount', 'http://schema.org/loanMortgageMandateAmount', ('MonetaryAmount',)),
+        'domiciledMortgage': ('domiciledMortgage', 'http://schema.org/domiciledMortgage', ('Boolean',)),
+    }),
+    'Mosque': ('PlaceOfWorship', {}),
+    'Motel': ('LodgingBusiness', {}),
+    'Motorcycle': ('Vehicle', {}),
+    'MotorcycleDealer': ('AutomotiveBusiness', {}),
+    'MotorcycleRepair': ('AutomotiveBusiness', {}),
+    'MotorizedBicycle': ('Vehicle', {}),
+    'Mountain': ('Landform', {}),
+    'MoveAction': ('Action', {
+        'fromLocation': ('fromLocation', 'http://schema.org/fromLocation', ('Place',)),
+        'toLocation': ('toLocation', 'http://schema.org/toLocation', ('Place',)),
+    }),
+    'Movie': ('CreativeWork', {
+        'titleEIDR': ('titleEIDR', 'http://schema.org/titleEIDR', ('URL', 'Text')),
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'countryOfOrigin': ('countryOfOrigin', 'http://schema.org/countryOfOrigin', ('Country',)),
+        'subtitleLanguage': ('subtitleLanguage', 'http://schema.org/subtitleLanguage', ('Text', 'Language')),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+    }),
+    'MovieClip': ('Clip', {}),
+    'MovieRentalStore': ('Store', {}),
+    'MovieSeries': ('CreativeWorkSeries', {
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+    }),
+    'MovieTheater': ('CivicStructure', {
+        'screenCount': ('screenCount', 'http://schema.org/screenCount', ('Number',)),
+    }),
+    'MovingCompany': ('HomeAndConstructionBusiness', {}),
+    'Muscle': ('AnatomicalStructure', {
+        'nerve': ('nerve', 'http://schema.org/nerve', ('Nerve',)),
+        'antagonist': ('antagonist', 'http://schema.org/antagonist', ('Muscle',)),
+        'bloodSupply': ('bloodSupply', 'http://schema.org/bloodSupply', ('Vessel',)),
+        'muscleAction': ('muscleAction', 'http://schema.org/muscleAction', ('Text',)),
+        'insertion': ('insertion', 'http://schema.org/insertion', ('AnatomicalStructure',)),
+    }),
+    'Museum': ('CivicStructure', {}),
+    'MusicAlbum': ('MusicPlaylist', {
+        'albumReleaseType': ('albumReleaseType', 'http://schema.org/albumReleaseType', ('MusicAlbumReleaseType',)),
+        'byArtist': ('byArtist', 'http://schema.org/byArtist', ('MusicGroup', 'Person')),
+        'albumProductionType': ('albumProductionType', 'http://schema.org/albumProductionType', ('MusicAlbumProductionType',)),
+        'albumRelease': ('albumRelease', 'http://schema.org/albumRelease', ('MusicRelease',)),
+    }),
+    'MusicComposition': ('CreativeWork', {
+        'musicCompositionForm': ('musicCompositionForm', 'http://schema.org/musicCompositionForm', ('Text',)),
+        'lyricist': ('lyricist', 'http://schema.org/lyricist', ('Person',)),
+        'musicArrangement': ('musicArrangement', 'http://schema.org/musicArrangement', ('MusicComposition',)),
+        'iswcCode': ('iswcCode', 'http://schema.org/iswcCode', ('Text',)),
+        'musicalKey': ('musicalKey', 'http://schema.org/musicalKey', ('Text',)),
+        'recordedAs': ('recordedAs', 'http://schema.org/recordedAs', ('MusicRecording',)),
+        'includedComposition': ('includedComposition', 'http://schema.org/includedComposition', ('MusicComposition',)),
+        'firstPerformance': ('firstPerformance', 'http://schema.org/firstPerformance', ('Event',)),
+        'lyrics': ('lyrics', 'http://schema.org/lyrics', ('CreativeWork',)),
+        'composer': ('composer', 'http://schema.org/composer', ('Organization', 'Person')),
+    }),
+    'MusicEvent': ('Event', {}),
+    'MusicGroup': ('PerformingGroup', {
+        'musicGroupMember': ('musicGroupMember', 'http://schema.org/musicGroupMember', ('Person',)),
+        'tracks': ('tracks', 'http://schema.org/tracks', ('MusicRecording',)),
+        'album': ('album', 'http://schema.org/album', ('MusicAlbum',)),
+        'track': ('track', 'http://schema.org/track', ('MusicRecording', 'ItemList')),
+        'albums': ('albums', 'http://schema.org/albums', ('MusicAlbum',)),
+        'genre': ('genre', 'http://schema.org/genre', ('URL', 'Text')),
+    }),
+    'MusicPlaylist': ('CreativeWork', {
+        'tracks': ('tracks', 'http://schema.org/tracks', ('MusicRecording',)),
+        'track': ('track', 'http://schema.org/track', ('MusicRecording', 'ItemList')),
+        'numTracks': ('numTracks', 'http://schema.org/numTracks', ('Integer',)),
+    }),
+    'MusicRecording': ('CreativeWork', {
+        'isrcCode': ('isrcCode', 'http://schema.org/isrcCode', ('Text',)),
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'recordingOf': ('recordingOf', 'http://schema.org/recordingOf', ('MusicComposition',)),
+        'inAlbum': ('inAlbum', 'http://schema.org/inAlbum', ('MusicAlbum',)),
+        'byArtist': ('byArtist', 'http://schema.org/byArtist', ('MusicGroup', 'Person')),
+        'inPlaylist': ('inPlaylist', 'http://schema.org/inPlaylist', ('MusicPlaylist',)),
+    }),
+    'MusicRelease': ('MusicPlaylist', {
+        'catalogNumber': ('catalogNumber', 'http://schema.org/catalogNumber', ('Text',)),
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'creditedTo': ('creditedTo', 'http://schema.org/creditedTo', ('Organization', 'Person')),
+        'musicReleaseFormat': ('musicReleaseFormat', 'http://schema.org/musicReleaseFormat', ('MusicReleaseFormatType',)),
+        'recordLabel': ('recordLabel', 'http://schema.org/recordLabel', ('Organization',)),
+        'releaseOf': ('releaseOf', 'http://schema.org/releaseOf', ('MusicAlbum',)),
+    }),
+    'MusicStore': ('Store', {}),
+    'MusicVenue': ('CivicStructure', {}),
+    'MusicVideoObject': ('MediaObject', {}),
+    'NGO': ('Organization', {}),
+    'NailSalon': ('HealthAndBeautyBusiness', {}),
+    'Nerve': ('AnatomicalStructure', {
+        'nerveMotor': ('nerveMotor', 'http://schema.org/nerveMotor', ('Muscle',)),
+        'sourcedFrom': ('sourcedFrom', 'http://schema.org/sourcedFrom', ('BrainStructure',)),
+        'sensoryUnit': ('sensoryUnit', 'http://schema.org/sensoryUnit', ('AnatomicalStructure', 'SuperficialAnatomy')),
+        'branch': ('branch', 'http://schema.org/branch', ('AnatomicalStructure',)),
+    }),
+    'NewsArticle': ('Article', {
+        'printColumn': ('printColumn', 'http://schema.org/printColumn', ('Text',)),
+        'printSection': ('printSection', 'http://schema.org/printSection', ('Text',)),
+        'printPage': ('printPage', 'http://schema.org/printPage', ('Text',)),
+        'printEdition': ('printEdition', 'http://schema.org/printEdition', ('Text',)),
+        'dateline': ('dateline', 'http://schema.org/dateline', ('Text',)),
+    }),
+    'NewsMediaOrganization': ('Organization', {
+        'diversityPolicy': ('diversityPolicy', 'http://schema.org/diversityPolicy', ('URL', 'CreativeWork')),
+        'unnamedSourcesPolicy': ('unnamedSourcesPolicy', 'http://schema.org/unnamedSourcesPolicy', ('URL', 'CreativeWork')),
+        'actionableFeedbackPolicy': ('actionableFeedbackPolicy', 'http://schema.org/actionableFeedbackPolicy', ('URL', 'CreativeWork')),
+        'noBylinesPolicy': ('noBylinesPolicy', 'http://schema.org/noBylinesPolicy', ('URL', 'CreativeWork')),
+        'ownershipFundingInfo': ('ownershipFundingInfo', 'http://schema.org/ownershipFundingInfo', ('URL', 'Text', 'AboutPage', 'CreativeWork')),
+        'correctionsPolicy': ('correctionsPolicy', 'http://schema.org/correctionsPolicy', ('URL', 'CreativeWork')),
+        'verificationFactCheckingPolicy': ('verificationFactCheckingPolicy', 'http://schema.org/verificationFactCheckingPolicy', ('URL', 'CreativeWork')),
+        'masthead': ('masthead', 'http://schema.org/masthead', ('URL', 'CreativeWork')),
+        'diversityStaffingReport': ('diversityStaffingReport', 'http://schema.org/diversityStaffingReport', ('URL', 'Article')),
+        'missionCoveragePrioritiesPolicy': ('missionCoveragePrioritiesPolicy', 'http://schema.org/missionCoveragePrioritiesPolicy', ('URL', 'CreativeWork')),
+        'ethicsPolicy': ('ethicsPolicy', 'http://schema.org/ethicsPolicy', ('URL', 'CreativeWork')),
+    }),
+    'Newspaper': ('Periodical', {}),
+    'NightClub': ('EntertainmentBusiness', {}),
+    'NonprofitType': ('Enumeration', {}),
+    'Notary': ('LegalService', {}),
+    'NoteDigitalDocument': ('DigitalDocument', {}),
+    'NutritionInformation': ('StructuredValue', {
+        'saturatedFatContent': ('saturatedFatContent', 'http://schema.org/saturatedFatContent', ('Mass',)),
+        'unsaturatedFatContent': ('unsaturatedFatContent', 'http://schema.org/unsaturatedFatContent', ('Mass',)),
+        'sodiumContent': ('sodiumContent', 'http://schema.org/sodiumContent', ('Mass',)),
+        'fatContent': ('fatContent', 'http://schema.org/fatContent', ('Mass',)),
+        'transFatContent': ('transFatContent', 'http://schema.org/transFatContent', ('Mass',)),
+        'servingSize': ('servingSize', 'http://schema.org/servingSize', ('Text',)),
+        'sugarContent': ('sugarContent', 'http://schema.org/sugarContent', ('Mass',)),
+        'proteinContent': ('proteinContent', 'http://schema.org/proteinContent', ('Mass',)),
+        'calories': ('calories', 'http://schema.org/calories', ('Energy',)),
+        'carbohydrateContent': ('carbohydrateContent', 'http://schema.org/carbohydrateContent', ('Mass',)),
+        'fiberContent': ('fiberContent', 'http://schema.org/fiberContent', ('Mass',)),
+        'cholesterolContent': ('cholesterolContent', 'http://schema.org/cholesterolContent', ('Mass',)),
+    }),
+    'Observation': ('Intangible', {
+        'marginOfError': ('marginOfError', 'http://schema.org/marginOfError', ('QuantitativeValue',)),
+        'measuredProperty': ('measuredProperty', 'http://schema.org/measuredProperty', ('Property',)),
+        'measurementTechnique': ('measurementTechnique', 'http://schema.org/measurementTechnique', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'measurementDenominator': ('measurementDenominator', 'http://schema.org/measurementDenominator', ('StatisticalVariable',)),
+        'measurementMethod': ('measurementMethod', 'http://schema.org/measurementMethod', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'observationPeriod': ('observationPeriod', 'http://schema.org/observationPeriod', ('Text',)),
+        'variableMeasured': ('variableMeasured', 'http://schema.org/variableMeasured', ('Text', 'Property', 'StatisticalVariable', 'PropertyValue')),
+        'observationDate': ('observationDate', 'http://schema.org/observationDate', ('DateTime',)),
+        'observationAbout': ('observationAbout', 'http://schema.org/observationAbout', ('Place', 'Thing')),
+        'measurementQualifier': ('measurementQualifier', 'http://schema.org/measurementQualifier', ('Enumeration',)),
+    }),
+    'Occupation': ('Intangible', {
+        'experienceRequirements': ('experienceRequirements', 'http://schema.org/experienceRequirements', ('Text', 'OccupationalExperienceRequirements')),
+        'responsibilities': ('responsibilities', 'http://schema.org/responsibilities', ('Text',)),
+        'skills': ('skills', 'http://schema.org/skills', ('Text', 'DefinedTerm')),
+        'occupationalCategory': ('occupationalCategory', 'http://schema.org/occupationalCategory', ('Text', 'CategoryCode')),
+        'qualifications': ('qualifications', 'http://schema.org/qualifications', ('Text', 'EducationalOccupationalCredential')),
+        'occupationLocation': ('occupationLocation', 'http://schema.org/occupationLocation', ('AdministrativeArea',)),
+        'educationRequirements': ('educationRequirements', 'http://schema.org/educationRequirements', ('Text', 'EducationalOccupationalCredential')),
+        'estimatedSalary': ('estimatedSalary', 'http://schema.org/estimatedSalary', ('Number', 'MonetaryAmount', 'MonetaryAmountDistribution')),
+    }),
+    'OccupationalExperienceRequirements': ('Intangible', {
+        'monthsOfExperience': ('monthsOfExperience', 'http://schema.org/monthsOfExperience', ('Number',)),
+    }),
+    'OccupationalTherapy': ('MedicalTherapy', {}),
+    'OceanBodyOfWater': ('BodyOfWater', {}),
+    'Offer': ('Intangible', {
+        'warranty': ('warranty', 'http://schema.org/warranty', ('WarrantyPromise',)),
+        'gtin8': ('gtin8', 'http://schema.org/gtin8', ('Text',)),
+        'asin': ('asin', 'http://schema.org/asin', ('URL', 'Text')),
+        'reviews': ('reviews', 'http://schema.org/reviews', ('Review',)),
+        'eligibleRegion': ('eligibleRegion', 'http://schema.org/eligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'eligibleTransactionVolume': ('eligibleTransactionVolume', 'http://schema.org/eligibleTransactionVolume', ('PriceSpecification',)),
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'availability': ('availability', 'http://schema.org/availability', ('ItemAvailability',)),
+        'checkoutPageURLTemplate': ('checkoutPageURLTemplate', 'http://schema.org/checkoutPageURLTemplate', ('Text',)),
+        'businessFunction': ('businessFunction', 'http://schema.org/businessFunction', ('BusinessFunction',)),
+        'inventoryLevel': ('inventoryLevel', 'http://schema.org/inventoryLevel', ('QuantitativeValue',)),
+        'mobileUrl': ('mobileUrl', 'http://schema.org/mobileUrl', ('Text',)),
+        'addOn': ('addOn', 'http://schema.org/addOn', ('Offer',)),
+        'advanceBookingRequirement': ('advanceBookingRequirement', 'http://schema.org/advanceBookingRequirement', ('QuantitativeValue',)),
+        'leaseLength': ('leaseLength', 'http://schema.org/leaseLength', ('Duration', 'QuantitativeValue')),
+        'eligibleDuration': ('eligibleDuration', 'http://schema.org/eligibleDuration', ('QuantitativeValue',)),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'priceValidUntil': ('priceValidUntil', 'http://schema.org/priceValidUntil', ('Date',)),
+        'isFamilyFriendly': ('isFamilyFriendly', 'http://schema.org/isFamilyFriendly', ('Boolean',)),
+        'availableAtOrFrom': ('availableAtOrFrom', 'http://schema.org/availableAtOrFrom', ('Place',)),
+        'priceCurrency': ('priceCurrency', 'http://schema.org/priceCurrency', ('Text',)),
+        'seller': ('seller', 'http://schema.org/seller', ('Organization', 'Person')),
+        'itemOffered': ('itemOffered', 'http://schema.org/itemOffered', ('Service', 'AggregateOffer', 'CreativeWork', 'Event', 'MenuItem', 'Product', 'Trip')),
+        'areaServed': ('areaServed', 'http://schema.org/areaServed', ('Text', 'AdministrativeArea', 'Place', 'GeoShape')),
+        'mpn': ('mpn', 'http://schema.org/mpn', ('Text',)),
+        'additionalProperty': ('additionalProperty', 'http://schema.org/additionalProperty', ('PropertyValue',)),
+        'gtin12': ('gtin12', 'http://schema.org/gtin12', ('Text',)),
+        'ineligibleRegion': ('ineligibleRegion', 'http://schema.org/ineligibleRegion', ('Text', 'Place', 'GeoShape')),
+        'eligibleQuantity': ('eligibleQuantity', 'http://schema.org/eligibleQuantity', ('QuantitativeValue',)),
+        'gtin13': ('gtin13', 'http://schema.org/gtin13', ('Text',)),
+        'availabilityStarts': ('availabilityStarts', 'http://schema.org/availabilityStarts', ('DateTime', 'Date', 'Time')),
+        'eligibleCustomerType': ('eligibleCustomerType', 'http://schema.org/eligibleCustomerType', ('BusinessEntityType',)),
+        'hasMerchantReturnPolicy': ('hasMerchantReturnPolicy', 'http://schema.org/hasMerchantReturnPolicy', ('MerchantReturnPolicy',)),
+        'offeredBy': ('offeredBy', 'http://schema.org/offeredBy', ('Organization', 'Person')),
+        'hasGS1DigitalLink': ('hasGS1DigitalLink', 'http://schema.org/hasGS1DigitalLink', ('URL',)),
+        'gtin': ('gtin', 'http://schema.org/gtin', ('URL', 'Text')),
+        'availabilityEnds': ('availabilityEnds', 'http://schema.org/availabilityEnds', ('DateTime', 'Date', 'Time')),
+        'priceSpecification': ('priceSpecification', 'http://schema.org/priceSpecification', ('PriceSpecification',)),
+        'hasAdultConsideration': ('hasAdultConsideration', 'http://schema.org/hasAdultConsideration', ('AdultOrientedEnumeration',)),
+        'sku': ('sku', 'http://schema.org/sku', ('Text',)),
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+        'shippingDetails': ('shippingDetails', 'http://schema.org/shippingDetails', ('OfferShippingDetails',)),
+        'price': ('price', 'http://schema.org/price', ('Number', 'Text')),
+        'gtin14': ('gtin14', 'http://schema.org/gtin14', ('Text',)),
+        'serialNumber': ('serialNumber', 'http://schema.org/serialNumber', ('Text',)),
+        'availableDeliveryMethod': ('availableDeliveryMethod', 'http://schema.org/availableDeliveryMethod', ('DeliveryMethod',)),
+        'acceptedPaymentMethod': ('acceptedPaymentMethod', 'http://schema.org/acceptedPaymentMethod', ('Text', 'LoanOrCredit', 'PaymentMethod')),
+        'includesObject': ('includesObject', 'http://schema.org/includesObject', ('TypeAndQuantityNode',)),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+        'validForMemberTier': ('validForMemberTier', 'http://schema.org/validForMemberTier', ('MemberProgramTier',)),
+        'itemCondition': ('itemCondition', 'http://schema.org/itemCondition', ('OfferItemCondition',)),
+        'deliveryLeadTime': ('deliveryLeadTime', 'http://schema.org/deliveryLeadTime', ('QuantitativeValue',)),
+        'hasMeasurement': ('hasMeasurement', 'http://schema.org/hasMeasurement', ('QuantitativeValue',)),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'OfferCatalog': ('ItemList', {}),
+    'OfferForLease': ('Offer', {}),
+    'OfferForPurchase': ('Offer', {}),
+    'OfferShippingDetails': ('StructuredValue', {
+        'deliveryTime': ('deliveryTime', 'http://schema.org/deliveryTime', ('ShippingDeliveryTime',)),
+        'shippingRate': ('shippingRate', 'http://schema.org/shippingRate', ('ShippingRateSettings', 'MonetaryAmount')),
+        'shippingDestination': ('shippingDestination', 'http://schema.org/shippingDestination', ('DefinedRegion',)),
+        'hasShippingService': ('hasShippingService', 'http://schema.org/hasShippingService', ('ShippingService',)),
+        'height': ('height', 'http://schema.org/height', ('Distance', 'QuantitativeValue')),
+        'shippingOrigin': ('shippingOrigin', 'http://schema.org/shippingOrigin', ('DefinedRegion',)),
+        'width': ('width', 'http://schema.org/width', ('Distance', 'QuantitativeValue')),
+        'depth': ('depth', 'http://schema.org/depth', ('QuantitativeValue', 'Distance')),
+        'weight': ('weight', 'http://schema.org/weight', ('Mass', 'QuantitativeValue')),
+        'validForMemberTier': ('validForMemberTier', 'http://schema.org/validForMemberTier', ('MemberProgramTier',)),
+        'doesNotShip': ('doesNotShip', 'http://schema.org/doesNotShip', ('Boolean',)),
+    }),
+    'OfficeEquipmentStore': ('Store', {}),
+    'OnDemandEvent': ('PublicationEvent', {}),
+    'OnlineBusiness': ('Organization', {}),
+    'OnlineStore': ('OnlineBusiness', {}),
+    'OpeningHoursSpecification': ('StructuredValue', {
+        'opens': ('opens', 'http://schema.org/opens', ('Time',)),
+        'closes': ('closes', 'http://schema.org/closes', ('Time',)),
+        'dayOfWeek': ('dayOfWeek', 'http://schema.org/dayOfWeek', ('DayOfWeek',)),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'OpinionNewsArticle': ('NewsArticle', {}),
+    'Optician': ('MedicalBusiness', {}),
+    'Order': ('Intangible', {
+        'paymentMethodId': ('paymentMethodId', 'http://schema.org/paymentMethodId', ('Text',)),
+        'billingAddress': ('billingAddress', 'http://schema.org/billingAddress', ('PostalAddress',)),
+        'confirmationNumber': ('confirmationNumber', 'http://schema.org/confirmationNumber', ('Text',)),
+        'paymentMethod': ('paymentMethod', 'http://schema.org/paymentMethod', ('Text', 'PaymentMethod')),
+        'discountCurrency': ('discountCurrency', 'http://schema.org/discountCurrency', ('Text',)),
+        'orderedItem': ('orderedItem', 'http://schema.org/orderedItem', ('Service', 'OrderItem', 'Product')),
+        'merchant': ('merchant', 'http://schema.org/merchant', ('Organization', 'Person')),
+        'seller': ('seller', 'http://schema.org/seller', ('Organization', 'Person')),
+        'partOfInvoice': ('partOfInvoice', 'http://schema.org/partOfInvoice', ('Invoice',)),
+        'isGift': ('isGift', 'http://schema.org/isGift', ('Boolean',)),
+        'orderDelivery': ('orderDelivery', 'http://schema.org/orderDelivery', ('ParcelDelivery',)),
+        'discountCode': ('discountCode', 'http://schema.org/discountCode', ('Text',)),
+        'paymentDueDate': ('paymentDueDate', 'http://schema.org/paymentDueDate', ('DateTime', 'Date')),
+        'broker': ('broker', 'http://schema.org/broker', ('Organization', 'Person')),
+        'discount': ('discount', 'http://schema.org/discount', ('Number', 'Text')),
+        'orderDate': ('orderDate', 'http://schema.org/orderDate', ('DateTime', 'Date')),
+        'acceptedOffer': ('acceptedOffer', 'http://schema.org/acceptedOffer', ('Offer',)),
+        'customer': ('customer', 'http://schema.org/customer', ('Organization', 'Person')),
+        'paymentUrl': ('paymentUrl', 'http://schema.org/paymentUrl', ('URL',)),
+        'orderNumber': ('orderNumber', 'http://schema.org/orderNumber', ('Text',)),
+        'orderStatus': ('orderStatus', 'http://schema.org/orderStatus', ('OrderStatus',)),
+        'paymentDue': ('paymentDue', 'http://schema.org/paymentDue', ('DateTime',)),
+    }),
+    'OrderAction': ('TradeAction', {
+        'deliveryMethod': ('deliveryMethod', 'http://schema.org/deliveryMethod', ('DeliveryMethod',)),
+    }),
+    'OrderItem': ('Intangible', {
+        'orderItemNumber': ('orderItemNumber', 'http://schema.org/orderItemNumber', ('Text',)),
+        'orderedItem': ('orderedItem', 'http://schema.org/orderedItem', ('Service', 'OrderItem', 'Product')),
+        'orderDelivery': ('orderDelivery', 'http://schema.org/orderDelivery', ('ParcelDelivery',)),
+        'orderItemStatus': ('orderItemStatus', 'http://schema.org/orderItemStatus', ('OrderStatus',)),
+        'orderQuantity': ('orderQuantity', 'http://schema.org/orderQuantity', ('Number', 'QuantitativeValue')),
+    }),
+    'Organization': ('Thing', {
+        'member': ('member', 'http://schema.org/member', ('Organization', 'Person')),
+        'award': ('award', 'http://schema.org/award', ('Text',)),
+        'isicV4': ('isicV4', 'http://schema.org/isicV4', ('Text',)),
+        'agentInteractionStatistic': ('agentInteractionStatistic', 'http://schema.org/agentInteractionStatistic', ('InteractionCounter',)),
+        'serviceArea': ('serviceArea', 'http://schema.org/serviceArea', ('Place', 'AdministrativeArea', 'GeoShape')),
+        'alumni': ('alumni', 'http://schema.org/alumni', ('Person',)),
+        'diversityPolicy': ('diversityPolicy', 'http://schema.org/diversityPolicy', ('URL', 'CreativeWork')),
+        'reviews': ('reviews', 'http://schema.org/reviews', ('Review',)),
+        'duns': ('duns', 'http://schema.org/duns', ('Text',)),
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'members': ('members', 'http://schema.org/members', ('Organization', 'Person')),
+        'email': ('email', 'http://schema.org/email', ('Text',)),
+        'keywords': ('keywords', 'http://schema.org/keywords', ('URL', 'Text', 'DefinedTerm')),
+        'founders': ('founders', 'http://schema.org/founders', ('Person',)),
+        'publishingPrinciples': ('publishingPrinciples', 'http://schema.org/publishingPrinciples', ('URL', 'CreativeWork')),
+        'unnamedSourcesPolicy': ('unnamedSourcesPolicy', 'http://schema.org/unnamedSourcesPolicy', ('URL', 'CreativeWork')),
+        'funding': ('funding', 'http://schema.org/funding', ('Grant',)),
+        'memberOf': ('memberOf', 'http://schema.org/memberOf', ('ProgramMembership', 'MemberProgramTier', 'Organization')),
+        'dissolutionDate': ('dissolutionDate', 'http://schema.org/dissolutionDate', ('Date',)),
+        'hasShippingService': ('hasShippingService', 'http://schema.org/hasShippingService', ('ShippingService',)),
+        'skills': ('skills', 'http://schema.org/skills', ('Text', 'DefinedTerm')),
+        'nonprofitStatus': ('nonprofitStatus', 'http://schema.org/nonprofitStatus', ('NonprofitType',)),
+        'employee': ('employee', 'http://schema.org/employee', ('Person',)),
+        'founder': ('founder', 'http://schema.org/founder', ('Person', 'Organization')),
+        'naics': ('naics', 'http://schema.org/naics', ('Text',)),
+        'awards': ('awards', 'http://schema.org/awards', ('Text',)),
+        'interactionStatistic': ('interactionStatistic', 'http://schema.org/interactionStatistic', ('InteractionCounter',)),
+        'telephone': ('telephone', 'http://schema.org/telephone', ('Text',)),
+        'legalRepresentative': ('legalRepresentative', 'http://schema.org/legalRepresentative', ('Person',)),
+        'actionableFeedbackPolicy': ('actionableFeedbackPolicy', 'http://schema.org/actionableFeedbackPolicy', ('URL', 'CreativeWork')),
+        'event': ('event', 'http://schema.org/event', ('Event',)),
+        'ownershipFundingInfo': ('ownershipFundingInfo', 'http://schema.org/ownershipFundingInfo', ('URL', 'Text', 'AboutPage', 'CreativeWork')),
+        'foundingDate': ('foundingDate', 'http://schema.org/foundingDate', ('Date',)),
+        'legalName': ('legalName', 'http://schema.org/legalName', ('Text',)),
+        'knowsAbout': ('knowsAbout', 'http://schema.org/knowsAbout', ('URL', 'Text', 'Thing')),
+        'areaServed': ('areaServed', 'http://schema.org/areaServed', ('Text', 'AdministrativeArea', 'Place', 'GeoShape')),
+        'iso6523Code': ('iso6523Code', 'http://schema.org/iso6523Code', ('Text',)),
+        'employees': ('employees', 'http://schema.org/employees', ('Person',)),
+        'numberOfEmployees': ('numberOfEmployees', 'http://schema.org/numberOfEmployees', ('QuantitativeValue',)),
+        'foundingLocation': ('foundingLocation', 'http://schema.org/foundingLocation', ('Place',)),
+        'address': ('address', 'http://schema.org/address', ('Text', 'PostalAddress')),
+        'contactPoints': ('contactPoints', 'http://schema.org/contactPoints', ('ContactPoint',)),
+        'events': ('events', 'http://schema.org/events', ('Event',)),
+        'department': ('department', 'http://schema.org/department', ('Organization',)),
+        'hasPOS': ('hasPOS', 'http://schema.org/hasPOS', ('Place',)),
+        'globalLocationNumber': ('globalLocationNumber', 'http://schema.org/globalLocationNumber', ('Text',)),
+        'leiCode': ('leiCode', 'http://schema.org/leiCode', ('Text',)),
+        'taxID': ('taxID', 'http://schema.org/taxID', ('Text',)),
+        'hasMerchantReturnPolicy': ('hasMerchantReturnPolicy', 'http://schema.org/hasMerchantReturnPolicy', ('MerchantReturnPolicy',)),
+        'legalAddress': ('legalAddress', 'http://schema.org/legalAddress', ('PostalAddress',)),
+        'correctionsPolicy': ('correctionsPolicy', 'http://schema.org/correctionsPolicy', ('URL', 'CreativeWork')),
+        'hasGS1DigitalLink': ('hasGS1DigitalLink', 'http://schema.org/hasGS1DigitalLink', ('URL',)),
+        'makesOffer': ('makesOffer', 'http://schema.org/makesOffer', ('Offer',)),
+        'parentOrganization': ('parentOrganization', 'http://schema.org/parentOrganization', ('Organization',)),
+        'hasMemberProgram': ('hasMemberProgram', 'http://schema.org/hasMemberProgram', ('MemberProgram',)),
+        'slogan': ('slogan', 'http://schema.org/slogan', ('Text',)),
+        'contactPoint': ('contactPoint', 'http://schema.org/contactPoint', ('ContactPoint',)),
+        'location': ('location', 'http://schema.org/location', ('Text', 'VirtualLocation', 'PostalAddress', 'Place')),
+        'vatID': ('vatID', 'http://schema.org/vatID', ('Text',)),
+        'seeks': ('seeks', 'http://schema.org/seeks', ('Demand',)),
+        'sponsor': ('sponsor', 'http://schema.org/sponsor', ('Person', 'Organization')),
+        'funder': ('funder', 'http://schema.org/funder', ('Organization', 'Person')),
+        'diversityStaffingReport': ('diversityStaffingReport', 'http://schema.org/diversityStaffingReport', ('URL', 'Article')),
+        'companyRegistration': ('companyRegistration', 'http://schema.org/companyRegistration', ('Certification',)),
+        'subOrganization': ('subOrganization', 'http://schema.org/subOrganization', ('Organization',)),
+        'owns': ('owns', 'http://schema.org/owns', ('Product', 'OwnershipInfo')),
+        'logo': ('logo', 'http://schema.org/logo', ('URL', 'ImageObject')),
+        'acceptedPaymentMethod': ('acceptedPaymentMethod', 'http://schema.org/acceptedPaymentMethod', ('Text', 'LoanOrCredit', 'PaymentMethod')),
+        'faxNumber': ('faxNumber', 'http://schema.org/faxNumber', ('Text',)),
+        'ethicsPolicy': ('ethicsPolicy', 'http://schema.org/ethicsPolicy', ('URL', 'CreativeWork')),
+        'hasCredential': ('hasCredential', 'http://schema.org/hasCredential', ('EducationalOccupationalCredential',)),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+        'hasCertification': ('hasCertification', 'http://schema.org/hasCertification', ('Certification',)),
+        'brand': ('brand', 'http://schema.org/brand', ('Brand', 'Organization')),
+        'knowsLanguage': ('knowsLanguage', 'http://schema.org/knowsLanguage', ('Text', 'Language')),
+        'hasOfferCatalog': ('hasOfferCatalog', 'http://schema.org/hasOfferCatalog', ('OfferCatalog',)),
+    }),
+    'OrganizationRole': ('Role', {
+        'numberedPosition': ('numberedPosition', 'http://schema.org/numberedPosition', ('Number',)),
+    }),
+    'OrganizeAction': ('Action', {}),
+    'OutletStore': ('Store', {}),
+    'OwnershipInfo': ('StructuredValue', {
+        'acquiredFrom': ('acquiredFrom', 'http://schema.org/acquiredFrom', ('Person', 'Organization')),
+        'typeOfGood': ('typeOfGood', 'http://schema.org/typeOfGood', ('Product', 'Service')),
+        'ownedThrough': ('ownedThrough', 'http://schema.org/ownedThrough', ('DateTime',)),
+        'ownedFrom': ('ownedFrom', 'http://schema.org/ownedFrom', ('DateTime',)),
+    }),
+    'PaintAction': ('CreateAction', {}),
+    'Painting': ('CreativeWork', {}),
+    'PalliativeProcedure': ('MedicalProcedure', {}),
+    'ParcelDelivery': ('Intangible', {
+        'expectedArrivalUntil': ('expectedArrivalUntil', 'http://schema.org/expectedArrivalUntil', ('DateTime', 'Date')),
+        'deliveryStatus': ('deliveryStatus', 'http://schema.org/deliveryStatus', ('DeliveryEvent',)),
+        'trackingNumber': ('trackingNumber', 'http://schema.org/trackingNumber', ('Text',)),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'carrier': ('carrier', 'http://schema.org/carrier', ('Organization',)),
+        'hasDeliveryMethod': ('hasDeliveryMethod', 'http://schema.org/hasDeliveryMethod', ('DeliveryMethod',)),
+        'expectedArrivalFrom': ('expectedArrivalFrom', 'http://schema.org/expectedArrivalFrom', ('DateTime', 'Date')),
+        'trackingUrl': ('trackingUrl', 'http://schema.org/trackingUrl', ('URL',)),
+        'partOfOrder': ('partOfOrder', 'http://schema.org/partOfOrder', ('Order',)),
+        'originAddress': ('originAddress', 'http://schema.org/originAddress', ('PostalAddress',)),
+        'deliveryAddress': ('deliveryAddress', 'http://schema.org/deliveryAddress', ('PostalAddress',)),
+        'itemShipped': ('itemShipped', 'http://schema.org/itemShipped', ('Product',)),
+    }),
+    'ParentAudience': ('PeopleAudience', {
+        'childMaxAge': ('childMaxAge', 'http://schema.org/childMaxAge', ('Number',)),
+        'childMinAge': ('childMinAge', 'http://schema.org/childMinAge', ('Number',)),
+    }),
+    'Park': ('CivicStructure', {}),
+    'ParkingFacility': ('CivicStructure', {}),
+    'PathologyTest': ('MedicalTest', {
+        'tissueSample': ('tissueSample', 'http://schema.org/tissueSample', ('Text',)),
+    }),
+    'Patient': ('MedicalAudience', {
+        'diagnosis': ('diagnosis', 'http://schema.org/diagnosis', ('MedicalCondition',)),
+        'healthCondition': ('healthCondition', 'http://schema.org/healthCondition', ('MedicalCondition',)),
+        'drug': ('drug', 'http://schema.org/drug', ('Drug',)),
+    }),
+    'PawnShop': ('Store', {}),
+    'PayAction': ('TradeAction', {
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+    }),
+    'PaymentCard': ('PaymentMethod', {
+        'contactlessPayment': ('contactlessPayment', 'http://schema.org/contactlessPayment', ('Boolean',)),
+        'floorLimit': ('floorLimit', 'http://schema.org/floorLimit', ('MonetaryAmount',)),
+        'cashBack': ('cashBack', 'http://schema.org/cashBack', ('Number', 'Boolean')),
+        'monthlyMinimumRepaymentAmount': ('monthlyMinimumRepaymentAmount', 'http://schema.org/monthlyMinimumRepaymentAmount', ('Number', 'MonetaryAmount')),
+    }),
+    'PaymentChargeSpecification': ('PriceSpecification', {
+        'appliesToPaymentMethod': ('appliesToPaymentMethod', 'http://schema.org/appliesToPaymentMethod', ('PaymentMethod',)),
+        'appliesToDeliveryMethod': ('appliesToDeliveryMethod', 'http://schema.org/appliesToDeliveryMethod', ('DeliveryMethod',)),
+    }),
+    'PaymentMethod': ('Intangible', {
+        'paymentMethodType': ('paymentMethodType', 'http://schema.org/paymentMethodType', ('PaymentMethodType',)),
+    }),
+    'PaymentService': ('PaymentMethod', {}),
+    'PeopleAudience': ('Audience', {
+        'suggestedGender': ('suggestedGender', 'http://schema.org/suggestedGender', ('Text', 'GenderType')),
+        'suggestedAge': ('suggestedAge', 'http://schema.org/suggestedAge', ('QuantitativeValue',)),
+        'requiredMaxAge': ('requiredMaxAge', 'http://schema.org/requiredMaxAge', ('Integer',)),
+        'requiredMinAge': ('requiredMinAge', 'http://schema.org/requiredMinAge', ('Integer',)),
+        'healthCondition': ('healthCondition', 'http://schema.org/healthCondition', ('MedicalCondition',)),
+        'suggestedMinAge': ('suggestedMinAge', 'http://schema.org/suggestedMinAge', ('Number',)),
+        'suggestedMeasurement': ('suggestedMeasurement', 'http://schema.org/suggestedMeasurement', ('QuantitativeValue',)),
+        'suggestedMaxAge': ('suggestedMaxAge', 'http://schema.org/suggestedMaxAge', ('Number',)),
+        'requiredGender': ('requiredGender', 'http://schema.org/requiredGender', ('Text',)),
+    }),
+    'PerformAction': ('PlayAction', {
+        'entertainmentBusiness': ('entertainmentBusiness', 'http://schema.org/entertainmentBusiness', ('EntertainmentBusiness',)),
+    }),
+    'PerformanceRole': ('Role', {
+        'characterName': ('characterName', 'http://schema.org/characterName', ('Text',)),
+    }),
+    'PerformingArtsTheater': ('CivicStructure', {}),
+    'PerformingGroup': ('Organization', {}),
+    'Periodical': ('CreativeWorkSeries', {}),
+    'Permit': ('Intangible', {
+        'issuedBy': ('issuedBy', 'http://schema.org/issuedBy', ('Organization',)),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'issuedThrough': ('issuedThrough', 'http://schema.org/issuedThrough', ('Service',)),
+        'validUntil': ('validUntil', 'http://schema.org/validUntil', ('Date',)),
+        'validFor': ('validFor', 'http://schema.org/validFor', ('Duration',)),
+        'validIn': ('validIn', 'http://schema.org/validIn', ('AdministrativeArea',)),
+        'permitAudience': ('permitAudience', 'http://schema.org/permitAudience', ('Audience',)),
+    }),
+    'Person': ('Thing', {
+        'jobTitle': ('jobTitle', 'http://schema.org/jobTitle', ('Text', 'DefinedTerm')),
+        'award': ('award', 'http://schema.org/award', ('Text',)),
+        'isicV4': ('isicV4', 'http://schema.org/isicV4', ('Text',)),
+        'agentInteractionStatistic': ('agentInteractionStatistic', 'http://schema.org/agentInteractionStatistic', ('InteractionCounter',)),
+        'duns': ('duns', 'http://schema.org/duns', ('Text',)),
+        'colleague': ('colleague', 'http://schema.org/colleague', ('URL', 'Person')),
+        'additionalName': ('additionalName', 'http://schema.org/additionalName', ('Text',)),
+        'email': ('email', 'http://schema.org/email', ('Text',)),
+        'parents': ('parents', 'http://schema.org/parents', ('Person',)),
+        'parent': ('parent', 'http://schema.org/parent', ('Person',)),
+        'gender': ('gender', 'http://schema.org/gender', ('Text', 'GenderType')),
+        'publishingPrinciples': ('publishingPrinciples', 'http://schema.org/publishingPrinciples', ('URL', 'CreativeWork')),
+        'colleagues': ('colleagues', 'http://schema.org/colleagues', ('Person',)),
+        'funding': ('funding', 'http://schema.org/funding', ('Grant',)),
+        'memberOf': ('memberOf', 'http://schema.org/memberOf', ('ProgramMembership', 'MemberProgramTier', 'Organization')),
+        'worksFor': ('worksFor', 'http://schema.org/worksFor', ('Organization',)),
+        'height': ('height', 'http://schema.org/height', ('Distance', 'QuantitativeValue')),
+        'skills': ('skills', 'http://schema.org/skills', ('Text', 'DefinedTerm')),
+        'givenName': ('givenName', 'http://schema.org/givenName', ('Text',)),
+        'naics': ('naics', 'http://schema.org/naics', ('Text',)),
+        'awards': ('awards', 'http://schema.org/awards', ('Text',)),
+        'interactionStatistic': ('interactionStatistic', 'http://schema.org/interactionStatistic', ('InteractionCounter',)),
+        'telephone': ('telephone', 'http://schema.org/telephone', ('Text',)),
+        'netWorth': ('netWorth', 'http://schema.org/netWorth', ('PriceSpecification', 'MonetaryAmount')),
+        'deathDate': ('deathDate', 'http://schema.org/deathDate', ('Date',)),
+        'affiliation': ('affiliation', 'http://schema.org/affiliation', ('Organization',)),
+        'workLocation': ('workLocation', 'http://schema.org/workLocation', ('ContactPoint', 'Place')),
+        'siblings': ('siblings', 'http://schema.org/siblings', ('Person',)),
+        'knowsAbout': ('knowsAbout', 'http://schema.org/knowsAbout', ('URL', 'Text', 'Thing')),
+        'pronouns': ('pronouns', 'http://schema.org/pronouns', ('Text', 'StructuredValue', 'DefinedTerm')),
+        'address': ('address', 'http://schema.org/address', ('Text', 'PostalAddress')),
+        'performerIn': ('performerIn', 'http://schema.org/performerIn', ('Event',)),
+        'contactPoints': ('contactPoints', 'http://schema.org/contactPoints', ('ContactPoint',)),
+        'hasPOS': ('hasPOS', 'http://schema.org/hasPOS', ('Place',)),
+        'globalLocationNumber': ('globalLocationNumber', 'http://schema.org/globalLocationNumber', ('Text',)),
+        'taxID': ('taxID', 'http://schema.org/taxID', ('Text',)),
+        'children': ('children', 'http://schema.org/children', ('Person',)),
+        'makesOffer': ('makesOffer', 'http://schema.org/makesOffer', ('Offer',)),
+        'hasOccupation': ('hasOccupation', 'http://schema.org/hasOccupation', ('Occupation',)),
+        'contactPoint': ('contactPoint', 'http://schema.org/contactPoint', ('ContactPoint',)),
+        'birthPlace': ('birthPlace', 'http://schema.org/birthPlace', ('Place',)),
+        'sibling': ('sibling', 'http://schema.org/sibling', ('Person',)),
+        'vatID': ('vatID', 'http://schema.org/vatID', ('Text',)),
+        'seeks': ('seeks', 'http://schema.org/seeks', ('Demand',)),
+        'sponsor': ('sponsor', 'http://schema.org/sponsor', ('Person', 'Organization')),
+        'relatedTo': ('relatedTo', 'http://schema.org/relatedTo', ('Person',)),
+        'knows': ('knows', 'http://schema.org/knows', ('Person',)),
+        'spouse': ('spouse', 'http://schema.org/spouse', ('Person',)),
+        'honorificSuffix': ('honorificSuffix', 'http://schema.org/honorificSuffix', ('Text',)),
+        'nationality': ('nationality', 'http://schema.org/nationality', ('Country',)),
+        'funder': ('funder', 'http://schema.org/funder', ('Organization', 'Person')),
+        'birthDate': ('birthDate', 'http://schema.org/birthDate', ('Date',)),
+        'owns': ('owns', 'http://schema.org/owns', ('Product', 'OwnershipInfo')),
+        'alumniOf': ('alumniOf', 'http://schema.org/alumniOf', ('EducationalOrganization', 'Organization')),
+        'weight': ('weight', 'http://schema.org/weight', ('Mass', 'QuantitativeValue')),
+        'faxNumber': ('faxNumber', 'http://schema.org/faxNumber', ('Text',)),
+        'hasCredential': ('hasCredential', 'http://schema.org/hasCredential', ('EducationalOccupationalCredential',)),
+        'follows': ('follows', 'http://schema.org/follows', ('Person',)),
+        'familyName': ('familyName', 'http://schema.org/familyName', ('Text',)),
+        'callSign': ('callSign', 'http://schema.org/callSign', ('Text',)),
+        'hasCertification': ('hasCertification', 'http://schema.org/hasCertification', ('Certification',)),
+        'brand': ('brand', 'http://schema.org/brand', ('Brand', 'Organization')),
+        'knowsLanguage': ('knowsLanguage', 'http://schema.org/knowsLanguage', ('Text', 'Language')),
+        'hasOfferCatalog': ('hasOfferCatalog', 'http://schema.org/hasOfferCatalog', ('OfferCatalog',)),
+        'honorificPrefix': ('honorificPrefix', 'http://schema.org/honorificPrefix', ('Text',)),
+        'deathPlace': ('deathPlace', 'http://schema.org/deathPlace', ('Place',)),
+        'homeLocation': ('homeLocation', 'http://schema.org/homeLocation', ('ContactPoint', 'Place')),
+    }),
+    'PetStore': ('Store', {}),
+    'Pharmacy': ('MedicalOrganization', {}),
+    'Photograph': ('CreativeWork', {}),
+    'PhotographAction': ('CreateAction', {}),
+    'PhysicalActivity': ('LifestyleModification', {
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+        'associatedAnatomy': ('associatedAnatomy', 'http://schema.org/associatedAnatomy', ('AnatomicalStructure', 'SuperficialAnatomy', 'AnatomicalSystem')),
+        'epidemiology': ('epidemiology', 'http://schema.org/epidemiology', ('Text',)),
+        'pathophysiology': ('pathophysiology', 'http://schema.org/pathophysiology', ('Text',)),
+    }),
+    'PhysicalTherapy': ('MedicalTherapy', {}),
+    'Physician': ('MedicalBusiness', {
+        'usNPI': ('usNPI', 'http://schema.org/usNPI', ('Text',)),
+        'occupationalCategory': ('occupationalCategory', 'http://schema.org/occupationalCategory', ('Text', 'CategoryCode')),
+        'medicalSpecialty': ('medicalSpecialty', 'http://schema.org/medicalSpecialty', ('MedicalSpecialty',)),
+        'hospitalAffiliation': ('hospitalAffiliation', 'http://schema.org/hospitalAffiliation', ('Hospital',)),
+        'availableService': ('availableService', 'http://schema.org/availableService', ('MedicalProcedure', 'MedicalTest', 'MedicalTherapy')),
+    }),
+    'PhysiciansOffice': ('Physician', {}),
+    'Place': ('Thing', {
+        'isicV4': ('isicV4', 'http://schema.org/isicV4', ('Text',)),
+        'branchCode': ('branchCode', 'http://schema.org/branchCode', ('Text',)),
+        'reviews': ('reviews', 'http://schema.org/reviews', ('Review',)),
+        'longitude': ('longitude', 'http://schema.org/longitude', ('Number', 'Text')),
+        'geoTouches': ('geoTouches', 'http://schema.org/geoTouches', ('Place', 'GeospatialGeometry')),
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'geoCrosses': ('geoCrosses', 'http://schema.org/geoCrosses', ('GeospatialGeometry', 'Place')),
+        'maximumAttendeeCapacity': ('maximumAttendeeCapacity', 'http://schema.org/maximumAttendeeCapacity', ('Integer',)),
+        'keywords': ('keywords', 'http://schema.org/keywords', ('URL', 'Text', 'DefinedTerm')),
+        'tourBookingPage': ('tourBookingPage', 'http://schema.org/tourBookingPage', ('URL',)),
+        'openingHoursSpecification': ('openingHoursSpecification', 'http://schema.org/openingHoursSpecification', ('OpeningHoursSpecification',)),
+        'telephone': ('telephone', 'http://schema.org/telephone', ('Text',)),
+        'containedInPlace': ('containedInPlace', 'http://schema.org/containedInPlace', ('Place',)),
+        'geoIntersects': ('geoIntersects', 'http://schema.org/geoIntersects', ('GeospatialGeometry', 'Place')),
+        'event': ('event', 'http://schema.org/event', ('Event',)),
+        'containsPlace': ('containsPlace', 'http://schema.org/containsPlace', ('Place',)),
+        'hasMap': ('hasMap', 'http://schema.org/hasMap', ('URL', 'Map')),
+        'map': ('map', 'http://schema.org/map', ('URL',)),
+        'photos': ('photos', 'http://schema.org/photos', ('ImageObject', 'Photograph')),
+        'geoCovers': ('geoCovers', 'http://schema.org/geoCovers', ('GeospatialGeometry', 'Place')),
+        'photo': ('photo', 'http://schema.org/photo', ('ImageObject', 'Photograph')),
+        'additionalProperty': ('additionalProperty', 'http://schema.org/additionalProperty', ('PropertyValue',)),
+        'address': ('address', 'http://schema.org/address', ('Text', 'PostalAddress')),
+        'events': ('events', 'http://schema.org/events', ('Event',)),
+        'globalLocationNumber': ('globalLocationNumber', 'http://schema.org/globalLocationNumber', ('Text',)),
+        'publicAccess': ('publicAccess', 'http://schema.org/publicAccess', ('Boolean',)),
+        'isAccessibleForFree': ('isAccessibleForFree', 'http://schema.org/isAccessibleForFree', ('Boolean',)),
+        'hasGS1DigitalLink': ('hasGS1DigitalLink', 'http://schema.org/hasGS1DigitalLink', ('URL',)),
+        'slogan': ('slogan', 'http://schema.org/slogan', ('Text',)),
+        'maps': ('maps', 'http://schema.org/maps', ('URL',)),
+        'smokingAllowed': ('smokingAllowed', 'http://schema.org/smokingAllowed', ('Boolean',)),
+        'geo': ('geo', 'http://schema.org/geo', ('GeoShape', 'GeoCoordinates')),
+        'geoWithin': ('geoWithin', 'http://schema.org/geoWithin', ('Place', 'GeospatialGeometry')),
+        'amenityFeature': ('amenityFeature', 'http://schema.org/amenityFeature', ('LocationFeatureSpecification',)),
+        'geoOverlaps': ('geoOverlaps', 'http://schema.org/geoOverlaps', ('GeospatialGeometry', 'Place')),
+        'containedIn': ('containedIn', 'http://schema.org/containedIn', ('Place',)),
+        'hasDriveThroughService': ('hasDriveThroughService', 'http://schema.org/hasDriveThroughService', ('Boolean',)),
+        'logo': ('logo', 'http://schema.org/logo', ('URL', 'ImageObject')),
+        'latitude': ('latitude', 'http://schema.org/latitude', ('Number', 'Text')),
+        'specialOpeningHoursSpecification': ('specialOpeningHoursSpecification', 'http://schema.org/specialOpeningHoursSpecification', ('OpeningHoursSpecification',)),
+        'faxNumber': ('faxNumber', 'http://schema.org/faxNumber', ('Text',)),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+        'hasCertification': ('hasCertification', 'http://schema.org/hasCertification', ('Certification',)),
+        'geoContains': ('geoContains', 'http://schema.org/geoContains', ('Place', 'GeospatialGeometry')),
+        'geoEquals': ('geoEquals', 'http://schema.org/geoEquals', ('Place', 'GeospatialGeometry')),
+        'geoDisjoint': ('geoDisjoint', 'http://schema.org/geoDisjoint', ('Place', 'GeospatialGeometry')),
+        'geoCoveredBy': ('geoCoveredBy', 'http://schema.org/geoCoveredBy', ('GeospatialGeometry', 'Place')),
+    }),
+    'PlaceOfWorship': ('CivicStructure', {}),
+    'PlanAction': ('OrganizeAction', {
+        'scheduledTime': ('scheduledTime', 'http://schema.org/scheduledTime', ('DateTime', 'Date')),
+    }),
+    'Play': ('CreativeWork', {}),
+    'PlayAction': ('Action', {
+        'event': ('event', 'http://schema.org/event', ('Event',)),
+        'audience': ('audience', 'http://schema.org/audience', ('Audience',)),
+    }),
+    'PlayGameAction': ('ConsumeAction', {
+        'gameAvailabilityType': ('gameAvailabilityType', 'http://schema.org/gameAvailabilityType', ('Text', 'GameAvailabilityEnumeration')),
+    }),
+    'Playground': ('CivicStructure', {}),
+    'Plumber': ('HomeAndConstructionBusiness', {}),
+    'PodcastEpisode': ('Episode', {}),
+    'PodcastSeason': ('CreativeWorkSeason', {}),
+    'PodcastSeries': ('CreativeWorkSeries', {
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'webFeed': ('webFeed', 'http://schema.org/webFeed', ('URL', 'DataFeed')),
+    }),
+    'PoliceStation': ('CivicStructure', {}),
+    'PoliticalParty': ('Organization', {}),
+    'Pond': ('BodyOfWater', {}),
+    'PostOffice': ('GovernmentOffice', {}),
+    'PostalAddress': ('ContactPoint', {
+        'postOfficeBoxNumber': ('postOfficeBoxNumber', 'http://schema.org/postOfficeBoxNumber', ('Text',)),
+        'streetAddress': ('streetAddress', 'http://schema.org/streetAddress', ('Text',)),
+        'postalCode': ('postalCode', 'http://schema.org/postalCode', ('Text',)),
+        'extendedAddress': ('extendedAddress', 'http://schema.org/extendedAddress', ('Text',)),
+        'addressLocality': ('addressLocality', 'http://schema.org/addressLocality', ('Text',)),
+        'addressCountry': ('addressCountry', 'http://schema.org/addressCountry', ('Text', 'Country')),
+        'addressRegion': ('addressRegion', 'http://schema.org/addressRegion', ('Text',)),
+    }),
+    'PostalCodeRangeSpecification': ('StructuredValue', {
+        'postalCodeEnd': ('postalCodeEnd', 'http://schema.org/postalCodeEnd', ('Text',)),
+        'postalCodeBegin': ('postalCodeBegin', 'http://schema.org/postalCodeBegin', ('Text',)),
+    }),
+    'Poster': ('CreativeWork', {}),
+    'PreOrderAction': ('TradeAction', {}),
+    'PrependAction': ('InsertAction', {}),
+    'Preschool': ('EducationalOrganization', {}),
+    'PresentationDigitalDocument': ('DigitalDocument', {}),
+    'PreventionIndication': ('MedicalIndication', {}),
+    'PriceSpecification': ('StructuredValue', {
+        'eligibleTransactionVolume': ('eligibleTransactionVolume', 'http://schema.org/eligibleTransactionVolume', ('PriceSpecification',)),
+        'validFrom': ('validFrom', 'http://schema.org/validFrom', ('DateTime', 'Date')),
+        'maxPrice': ('maxPrice', 'http://schema.org/maxPrice', ('Number',)),
+        'priceCurrency': ('priceCurrency', 'http://schema.org/priceCurrency', ('Text',)),
+        'eligibleQuantity': ('eligibleQuantity', 'http://schema.org/eligibleQuantity', ('QuantitativeValue',)),
+        'membershipPointsEarned': ('membershipPointsEarned', 'http://schema.org/membershipPointsEarned', ('Number', 'QuantitativeValue')),
+        'minPrice': ('minPrice', 'http://schema.org/minPrice', ('Number',)),
+        'valueAddedTaxIncluded': ('valueAddedTaxIncluded', 'http://schema.org/valueAddedTaxIncluded', ('Boolean',)),
+        'price': ('price', 'http://schema.org/price', ('Number', 'Text')),
+        'validForMemberTier': ('validForMemberTier', 'http://schema.org/validForMemberTier', ('MemberProgramTier',)),
+        'validThrough': ('validThrough', 'http://schema.org/validThrough', ('DateTime', 'Date')),
+    }),
+    'Product': ('Thing', {
+        'color': ('color', 'http://schema.org/color', ('Text',)),
+        'award': ('award', 'http://schema.org/award', ('Text',)),
+        'gtin8': ('gtin8', 'http://schema.org/gtin8', ('Text',)),
+        'isRelatedTo': ('isRelatedTo', 'http://schema.org/isRelatedTo', ('Service', 'Product')),
+        'asin': ('asin', 'http://schema.org/asin', ('URL', 'Text')),
+        'reviews': ('reviews', 'http://schema.org/reviews', ('Review',)),
+        'hasEnergyConsumptionDetails': ('hasEnergyConsumptionDetails', 'http://schema.org/hasEnergyConsumptionDetails', ('EnergyConsumptionDetails',)),
+        'manufacturer': ('manufacturer', 'http://schema.org/manufacturer', ('Organization',)),
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'countryOfAssembly': ('countryOfAssembly', 'http://schema.org/countryOfAssembly', ('Text',)),
+        'mobileUrl': ('mobileUrl', 'http://schema.org/mobileUrl', ('Text',)),
+        'countryOfLastProcessing': ('countryOfLastProcessing', 'http://schema.org/countryOfLastProcessing', ('Text',)),
+        'keywords': ('keywords', 'http://schema.org/keywords', ('URL', 'Text', 'DefinedTerm')),
+        'colorSwatch': ('colorSwatch', 'http://schema.org/colorSwatch', ('URL', 'ImageObject')),
+        'funding': ('funding', 'http://schema.org/funding', ('Grant',)),
+        'height': ('height', 'http://schema.org/height', ('Distance', 'QuantitativeValue')),
+        'awards': ('awards', 'http://schema.org/awards', ('Text',)),
+        'inProductGroupWithID': ('inProductGroupWithID', 'http://schema.org/inProductGroupWithID', ('Text',)),
+        'isFamilyFriendly': ('isFamilyFriendly', 'http://schema.org/isFamilyFriendly', ('Boolean',)),
+        'mpn': ('mpn', 'http://schema.org/mpn', ('Text',)),
+        'productionDate': ('productionDate', 'http://schema.org/productionDate', ('Date',)),
+        'additionalProperty': ('additionalProperty', 'http://schema.org/additionalProperty', ('PropertyValue',)),
+        'gtin12': ('gtin12', 'http://schema.org/gtin12', ('Text',)),
+        'size': ('size', 'http://schema.org/size', ('Text', 'DefinedTerm', 'SizeSpecification', 'QuantitativeValue')),
+        'gtin13': ('gtin13', 'http://schema.org/gtin13', ('Text',)),
+        'isVariantOf': ('isVariantOf', 'http://schema.org/isVariantOf', ('ProductModel', 'ProductGroup')),
+        'purchaseDate': ('purchaseDate', 'http://schema.org/purchaseDate', ('Date',)),
+        'isAccessoryOrSparePartFor': ('isAccessoryOrSparePartFor', 'http://schema.org/isAccessoryOrSparePartFor', ('Product',)),
+        'hasMerchantReturnPolicy': ('hasMerchantReturnPolicy', 'http://schema.org/hasMerchantReturnPolicy', ('MerchantReturnPolicy',)),
+        'hasGS1DigitalLink': ('hasGS1DigitalLink', 'http://schema.org/hasGS1DigitalLink', ('URL',)),
+        'material': ('material', 'http://schema.org/material', ('URL', 'Text', 'Product')),
+        'slogan': ('slogan', 'http://schema.org/slogan', ('Text',)),
+        'gtin': ('gtin', 'http://schema.org/gtin', ('URL', 'Text')),
+        'width': ('width', 'http://schema.org/width', ('Distance', 'QuantitativeValue')),
+        'countryOfOrigin': ('countryOfOrigin', 'http://schema.org/countryOfOrigin', ('Country',)),
+        'hasAdultConsideration': ('hasAdultConsideration', 'http://schema.org/hasAdultConsideration', ('AdultOrientedEnumeration',)),
+        'sku': ('sku', 'http://schema.org/sku', ('Text',)),
+        'model': ('model', 'http://schema.org/model', ('Text', 'ProductModel')),
+        'negativeNotes': ('negativeNotes', 'http://schema.org/negativeNotes', ('Text', 'ListItem', 'WebContent', 'ItemList')),
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+        'audience': ('audience', 'http://schema.org/audience', ('Audience',)),
+        'gtin14': ('gtin14', 'http://schema.org/gtin14', ('Text',)),
+        'depth': ('depth', 'http://schema.org/depth', ('QuantitativeValue', 'Distance')),
+        'logo': ('logo', 'http://schema.org/logo', ('URL', 'ImageObject')),
+        'releaseDate': ('releaseDate', 'http://schema.org/releaseDate', ('Date',)),
+        'productID': ('productID', 'http://schema.org/productID', ('Text',)),
+        'weight': ('weight', 'http://schema.org/weight', ('Mass', 'QuantitativeValue')),
+        'nsn': ('nsn', 'http://schema.org/nsn', ('Text',)),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+        'itemCondition': ('itemCondition', 'http://schema.org/itemCondition', ('OfferItemCondition',)),
+        'hasCertification': ('hasCertification', 'http://schema.org/hasCertification', ('Certification',)),
+        'brand': ('brand', 'http://schema.org/brand', ('Brand', 'Organization')),
+        'positiveNotes': ('positiveNotes', 'http://schema.org/positiveNotes', ('Text', 'ListItem', 'ItemList', 'WebContent')),
+        'isSimilarTo': ('isSimilarTo', 'http://schema.org/isSimilarTo', ('Product', 'Service')),
+        'pattern': ('pattern', 'http://schema.org/pattern', ('Text', 'DefinedTerm')),
+        'isConsumableFor': ('isConsumableFor', 'http://schema.org/isConsumableFor', ('Product',)),
+        'hasMeasurement': ('hasMeasurement', 'http://schema.org/hasMeasurement', ('QuantitativeValue',)),
+    }),
+    'ProductCollection': ('Product', {
+        'includesObject': ('includesObject', 'http://schema.org/includesObject', ('TypeAndQuantityNode',)),
+    }),
+    'ProductGroup': ('Product', {
+        'hasVariant': ('hasVariant', 'http://schema.org/hasVariant', ('Product',)),
+        'variesBy': ('variesBy', 'http://schema.org/variesBy', ('Text', 'DefinedTerm')),
+        'productGroupID': ('productGroupID', 'http://schema.org/productGroupID', ('Text',)),
+    }),
+    'ProductModel': ('Product', {
+        'successorOf': ('successorOf', 'http://schema.org/successorOf', ('ProductModel',)),
+        'isVariantOf': ('isVariantOf', 'http://schema.org/isVariantOf', ('ProductModel', 'ProductGroup')),
+        'predecessorOf': ('predecessorOf', 'http://schema.org/predecessorOf', ('ProductModel',)),
+    }),
+    'ProfessionalService': ('LocalBusiness', {}),
+    'ProfilePage': ('WebPage', {}),
+    'ProgramMembership': ('Intangible', {
+        'member': ('member', 'http://schema.org/member', ('Organization', 'Person')),
+        'members': ('members', 'http://schema.org/members', ('Organization', 'Person')),
+        'membershipNumber': ('membershipNumber', 'http://schema.org/membershipNumber', ('Text',)),
+        'program': ('program', 'http://schema.org/program', ('MemberProgram',)),
+        'membershipPointsEarned': ('membershipPointsEarned', 'http://schema.org/membershipPointsEarned', ('Number', 'QuantitativeValue')),
+        'hostingOrganization': ('hostingOrganization', 'http://schema.org/hostingOrganization', ('Organization',)),
+        'programName': ('programName', 'http://schema.org/programName', ('Text',)),
+    }),
+    'Project': ('Organization', {}),
+    'PronounceableText': (None, {
+        'textValue': ('textValue', 'http://schema.org/textValue', ('Text',)),
+        'phoneticText': ('phoneticText', 'http://schema.org/phoneticText', ('Text',)),
+        'speechToTextMarkup': ('speechToTextMarkup', 'http://schema.org/speechToTextMarkup', ('Text',)),
+        'inLanguage': ('inLanguage', 'http://schema.org/inLanguage', ('Text', 'Language')),
+    }),
+    'Property': ('Intangible', {
+        'supersededBy': ('supersededBy', 'http://schema.org/supersededBy', ('Enumeration', 'Class', 'Property')),
+        'domainIncludes': ('domainIncludes', 'http://schema.org/domainIncludes', ('Class',)),
+        'inverseOf': ('inverseOf', 'http://schema.org/inverseOf', ('Property',)),
+        'rangeIncludes': ('rangeIncludes', 'http://schema.org/rangeIncludes', ('Class',)),
+    }),
+    'PropertyValue': ('StructuredValue', {
+        'unitText': ('unitText', 'http://schema.org/unitText', ('Text',)),
+        'minValue': ('minValue', 'http://schema.org/minValue', ('Number',)),
+        'value': ('value', 'http://schema.org/value', ('Number', 'Text', 'Boolean', 'StructuredValue')),
+        'measurementTechnique': ('measurementTechnique', 'http://schema.org/measurementTechnique', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'propertyID': ('propertyID', 'http://schema.org/propertyID', ('URL', 'Text')),
+        'measurementMethod': ('measurementMethod', 'http://schema.org/measurementMethod', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'maxValue': ('maxValue', 'http://schema.org/maxValue', ('Number',)),
+        'valueReference': ('valueReference', 'http://schema.org/valueReference', ('Text', 'QualitativeValue', 'DefinedTerm', 'MeasurementTypeEnumeration', 'Enumeration', 'PropertyValue', 'StructuredValue', 'QuantitativeValue')),
+        'unitCode': ('unitCode', 'http://schema.org/unitCode', ('URL', 'Text')),
+    }),
+    'PropertyValueSpecification': ('Intangible', {
+        'valueMaxLength': ('valueMaxLength', 'http://schema.org/valueMaxLength', ('Number',)),
+        'readonlyValue': ('readonlyValue', 'http://schema.org/readonlyValue', ('Boolean',)),
+        'valueRequired': ('valueRequired', 'http://schema.org/valueRequired', ('Boolean',)),
+        'valueMinLength': ('valueMinLength', 'http://schema.org/valueMinLength', ('Number',)),
+        'minValue': ('minValue', 'http://schema.org/minValue', ('Number',)),
+        'multipleValues': ('multipleValues', 'http://schema.org/multipleValues', ('Boolean',)),
+        'defaultValue': ('defaultValue', 'http://schema.org/defaultValue', ('Text', 'Thing')),
+        'maxValue': ('maxValue', 'http://schema.org/maxValue', ('Number',)),
+        'valueName': ('valueName', 'http://schema.org/valueName', ('Text',)),
+        'stepValue': ('stepValue', 'http://schema.org/stepValue', ('Number',)),
+        'valuePattern': ('valuePattern', 'http://schema.org/valuePattern', ('Text',)),
+    }),
+    'Protein': ('BioChemEntity', {
+        'hasBioPolymerSequence': ('hasBioPolymerSequence', 'http://schema.org/hasBioPolymerSequence', ('Text',)),
+    }),
+    'PsychologicalTreatment': ('TherapeuticProcedure', {}),
+    'PublicSwimmingPool': ('SportsActivityLocation', {}),
+    'PublicToilet': ('CivicStructure', {}),
+    'PublicationEvent': ('Event', {
+        'free': ('free', 'http://schema.org/free', ('Boolean',)),
+        'publishedOn': ('publishedOn', 'http://schema.org/publishedOn', ('BroadcastService',)),
+        'publishedBy': ('publishedBy', 'http://schema.org/publishedBy', ('Person', 'Organization')),
+    }),
+    'PublicationIssue': ('CreativeWork', {
+        'pageStart': ('pageStart', 'http://schema.org/pageStart', ('Integer', 'Text')),
+        'pagination': ('pagination', 'http://schema.org/pagination', ('Text',)),
+        'issueNumber': ('issueNumber', 'http://schema.org/issueNumber', ('Integer', 'Text')),
+        'pageEnd': ('pageEnd', 'http://schema.org/pageEnd', ('Integer', 'Text')),
+    }),
+    'PublicationVolume': ('CreativeWork', {
+        'pageStart': ('pageStart', 'http://schema.org/pageStart', ('Integer', 'Text')),
+        'pagination': ('pagination', 'http://schema.org/pagination', ('Text',)),
+        'pageEnd': ('pageEnd', 'http://schema.org/pageEnd', ('Integer', 'Text')),
+        'volumeNumber': ('volumeNumber', 'http://schema.org/volumeNumber', ('Integer', 'Text')),
+    }),
+    'QAPage': ('WebPage', {}),
+    'QualitativeValue': ('Enumeration', {
+        'nonEqual': ('nonEqual', 'http://schema.org/nonEqual', ('QualitativeValue',)),
+        'lesser': ('lesser', 'http://schema.org/lesser', ('QualitativeValue',)),
+        'greaterOrEqual': ('greaterOrEqual', 'http://schema.org/greaterOrEqual', ('QualitativeValue',)),
+        'equal': ('equal', 'http://schema.org/equal', ('QualitativeValue',)),
+        'additionalProperty': ('additionalProperty', 'http://schema.org/additionalProperty', ('PropertyValue',)),
+        'greater': ('greater', 'http://schema.org/greater', ('QualitativeValue',)),
+        'valueReference': ('valueReference', 'http://schema.org/valueReference', ('Text', 'QualitativeValue', 'DefinedTerm', 'MeasurementTypeEnumeration', 'Enumeration', 'PropertyValue', 'StructuredValue', 'QuantitativeValue')),
+        'lesserOrEqual': ('lesserOrEqual', 'http://schema.org/lesserOrEqual', ('QualitativeValue',)),
+    }),
+    'QuantitativeValue': ('StructuredValue', {
+        'unitText': ('unitText', 'http://schema.org/unitText', ('Text',)),
+        'minValue': ('minValue', 'http://schema.org/minValue', ('Number',)),
+        'value': ('value', 'http://schema.org/value', ('Number', 'Text', 'Boolean', 'StructuredValue')),
+        'additionalProperty': ('additionalProperty', 'http://schema.org/additionalProperty', ('PropertyValue',)),
+        'maxValue': ('maxValue', 'http://schema.org/maxValue', ('Number',)),
+        'valueReference': ('valueReference', 'http://schema.org/valueReference', ('Text', 'QualitativeValue', 'DefinedTerm', 'MeasurementTypeEnumeration', 'Enumeration', 'PropertyValue', 'StructuredValue', 'QuantitativeValue')),
+        'unitCode': ('unitCode', 'http://schema.org/unitCode', ('URL', 'Text')),
+    }),
+    'QuantitativeValueDistribution': ('StructuredValue', {
+        'percentile25': ('percentile25', 'http://schema.org/percentile25', ('Number',)),
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'percentile10': ('percentile10', 'http://schema.org/percentile10', ('Number',)),
+        'median': ('median', 'http://schema.org/median', ('Number',)),
+        'percentile75': ('percentile75', 'http://schema.org/percentile75', ('Number',)),
+        'percentile90': ('percentile90', 'http://schema.org/percentile90', ('Number',)),
+    }),
+    'Quantity': ('Intangible', {}),
+    'Question': ('Comment', {
+        'parentItem': ('parentItem', 'http://schema.org/parentItem', ('Comment', 'CreativeWork')),
+        'answerCount': ('answerCount', 'http://schema.org/answerCount', ('Integer',)),
+        'suggestedAnswer': ('suggestedAnswer', 'http://schema.org/suggestedAnswer', ('ItemList', 'Answer')),
+        'eduQuestionType': ('eduQuestionType', 'http://schema.org/eduQuestionType', ('Text',)),
+        'acceptedAnswer': ('acceptedAnswer', 'http://schema.org/acceptedAnswer', ('ItemList', 'Answer')),
+    }),
+    'Quiz': ('LearningResource', {}),
+    'Quotation': ('CreativeWork', {
+        'spokenByCharacter': ('spokenByCharacter', 'http://schema.org/spokenByCharacter', ('Organization', 'Person')),
+    }),
+    'QuoteAction': ('TradeAction', {}),
+    'RVPark': ('CivicStructure', {}),
+    'RadiationTherapy': ('MedicalTherapy', {}),
+    'RadioBroadcastService': ('BroadcastService', {}),
+    'RadioChannel': ('BroadcastChannel', {}),
+    'RadioClip': ('Clip', {}),
+    'RadioEpisode': ('Episode', {}),
+    'RadioSeason': ('CreativeWorkSeason', {}),
+    'RadioSeries': ('CreativeWorkSeries', {
+        'episodes': ('episodes', 'http://schema.org/episodes', ('Episode',)),
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'season': ('season', 'http://schema.org/season', ('URL', 'CreativeWorkSeason')),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'numberOfSeasons': ('numberOfSeasons', 'http://schema.org/numberOfSeasons', ('Integer',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'episode': ('episode', 'http://schema.org/episode', ('Episode',)),
+        'numberOfEpisodes': ('numberOfEpisodes', 'http://schema.org/numberOfEpisodes', ('Integer',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'containsSeason': ('containsSeason', 'http://schema.org/containsSeason', ('CreativeWorkSeason',)),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+        'seasons': ('seasons', 'http://schema.org/seasons', ('CreativeWorkSeason',)),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+    }),
+    'RadioStation': ('LocalBusiness', {}),
+    'Rating': ('Intangible', {
+        'worstRating': ('worstRating', 'http://schema.org/worstRating', ('Number', 'Text')),
+        'author': ('author', 'http://schema.org/author', ('Organization', 'Person')),
+        'ratingValue': ('ratingValue', 'http://schema.org/ratingValue', ('Number', 'Text')),
+        'bestRating': ('bestRating', 'http://schema.org/bestRating', ('Number', 'Text')),
+        'ratingExplanation': ('ratingExplanation', 'http://schema.org/ratingExplanation', ('Text',)),
+        'reviewAspect': ('reviewAspect', 'http://schema.org/reviewAspect', ('Text',)),
+    }),
+    'ReactAction': ('AssessAction', {}),
+    'ReadAction': ('ConsumeAction', {}),
+    'RealEstateAgent': ('LocalBusiness', {}),
+    'RealEstateListing': ('WebPage', {
+        'datePosted': ('datePosted', 'http://schema.org/datePosted', ('DateTime', 'Date')),
+        'leaseLength': ('leaseLength', 'http://schema.org/leaseLength', ('Duration', 'QuantitativeValue')),
+    }),
+    'ReceiveAction': ('TransferAction', {
+        'sender': ('sender', 'http://schema.org/sender', ('Person', 'Audience', 'Organization')),
+        'deliveryMethod': ('deliveryMethod', 'http://schema.org/deliveryMethod', ('DeliveryMethod',)),
+    }),
+    'Recipe': ('HowTo', {
+        'recipeCuisine': ('recipeCuisine', 'http://schema.org/recipeCuisine', ('Text',)),
+        'recipeInstructions': ('recipeInstructions', 'http://schema.org/recipeInstructions', ('Text', 'ItemList', 'CreativeWork')),
+        'ingredients': ('ingredients', 'http://schema.org/ingredients', ('Text',)),
+        'nutrition': ('nutrition', 'http://schema.org/nutrition', ('NutritionInformation',)),
+        'recipeIngredient': ('recipeIngredient', 'http://schema.org/recipeIngredient', ('Text',)),
+        'recipeCategory': ('recipeCategory', 'http://schema.org/recipeCategory', ('Text',)),
+        'cookingMethod': ('cookingMethod', 'http://schema.org/cookingMethod', ('Text',)),
+        'recipeYield': ('recipeYield', 'http://schema.org/recipeYield', ('Text', 'QuantitativeValue')),
+        'suitableForDiet': ('suitableForDiet', 'http://schema.org/suitableForDiet', ('RestrictedDiet',)),
+        'cookTime': ('cookTime', 'http://schema.org/cookTime', ('Duration',)),
+    }),
+    'Recommendation': ('Review', {
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+    }),
+    'RecommendedDoseSchedule': ('DoseSchedule', {}),
+    'RecyclingCenter': ('LocalBusiness', {}),
+    'RegisterAction': ('InteractAction', {}),
+    'RejectAction': ('AllocateAction', {}),
+    'RentAction': ('TradeAction', {
+        'realEstateAgent': ('realEstateAgent', 'http://schema.org/realEstateAgent', ('RealEstateAgent',)),
+        'landlord': ('landlord', 'http://schema.org/landlord', ('Organization', 'Person')),
+    }),
+    'RentalCarReservation': ('Reservation', {
+        'pickupLocation': ('pickupLocation', 'http://schema.org/pickupLocation', ('Place',)),
+        'dropoffTime': ('dropoffTime', 'http://schema.org/dropoffTime', ('DateTime',)),
+        'dropoffLocation': ('dropoffLocation', 'http://schema.org/dropoffLocation', ('Place',)),
+        'pickupTime': ('pickupTime', 'http://schema.org/pickupTime', ('DateTime',)),
+    }),
+    'RepaymentSpecification': ('StructuredValue', {
+        'loanPaymentFrequency': ('loanPaymentFrequency', 'http://schema.org/loanPaymentFrequency', ('Number',)),
+        'downPayment': ('downPayment', 'http://schema.org/downPayment', ('Number', 'MonetaryAmount')),
+        'numberOfLoanPayments': ('numberOfLoanPayments', 'http://schema.org/numberOfLoanPayments', ('Number',)),
+        'loanPaymentAmount': ('loanPaymentAmount', 'http://schema.org/loanPaymentAmount', ('MonetaryAmount',)),
+        'earlyPrepaymentPenalty': ('earlyPrepaymentPenalty', 'http://schema.org/earlyPrepaymentPenalty', ('MonetaryAmount',)),
+    }),
+    'ReplaceAction': ('UpdateAction', {
+        'replacee': ('replacee', 'http://schema.org/replacee', ('Thing',)),
+        'replacer': ('replacer', 'http://schema.org/replacer', ('Thing',)),
+    }),
+    'ReplyAction': ('CommunicateAction', {
+        'resultComment': ('resultComment', 'http://schema.org/resultComment', ('Comment',)),
+    }),
+    'Report': ('Article', {
+        'reportNumber': ('reportNumber', 'http://schema.org/reportNumber', ('Text',)),
+    }),
+    'ReportageNewsArticle': ('NewsArticle', {}),
+    'ReportedDoseSchedule': ('DoseSchedule', {}),
+    'ResearchOrganization': ('Organization', {}),
+    'ResearchProject': ('Project', {}),
+    'Researcher': ('Audience', {}),
+    'Reservation': ('Intangible', {
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'totalPrice': ('totalPrice', 'http://schema.org/totalPrice', ('Number', 'Text', 'PriceSpecification')),
+        'priceCurrency': ('priceCurrency', 'http://schema.org/priceCurrency', ('Text',)),
+        'modifiedTime': ('modifiedTime', 'http://schema.org/modifiedTime', ('DateTime',)),
+        'reservedTicket': ('reservedTicket', 'http://schema.org/reservedTicket', ('Ticket',)),
+        'bookingAgent': ('bookingAgent', 'http://schema.org/bookingAgent', ('Organization', 'Person')),
+        'reservationStatus': ('reservationStatus', 'http://schema.org/reservationStatus', ('ReservationStatusType',)),
+        'underName': ('underName', 'http://schema.org/underName', ('Organization', 'Person')),
+        'reservationFor': ('reservationFor', 'http://schema.org/reservationFor', ('Thing',)),
+        'broker': ('broker', 'http://schema.org/broker', ('Organization', 'Person')),
+        'programMembershipUsed': ('programMembershipUsed', 'http://schema.org/programMembershipUsed', ('ProgramMembership',)),
+        'bookingTime': ('bookingTime', 'http://schema.org/bookingTime', ('DateTime',)),
+        'reservationId': ('reservationId', 'http://schema.org/reservationId', ('Text',)),
+    }),
+    'ReservationPackage': ('Reservation', {
+        'subReservation': ('subReservation', 'http://schema.org/subReservation', ('Reservation',)),
+    }),
+    'ReserveAction': ('PlanAction', {}),
+    'Reservoir': ('BodyOfWater', {}),
+    'Residence': ('Place', {
+        'accommodationFloorPlan': ('accommodationFloorPlan', 'http://schema.org/accommodationFloorPlan', ('FloorPlan',)),
+    }),
+    'Resort': ('LodgingBusiness', {}),
+    'Restaurant': ('FoodEstablishment', {}),
+    'ResumeAction': ('ControlAction', {}),
+    'ReturnAction': ('TransferAction', {
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+    }),
+    'Review': ('CreativeWork', {
+        'associatedMediaReview': ('associatedMediaReview', 'http://schema.org/associatedMediaReview', ('Review',)),
+        'itemReviewed': ('itemReviewed', 'http://schema.org/itemReviewed', ('Thing',)),
+        'reviewRating': ('reviewRating', 'http://schema.org/reviewRating', ('Rating',)),
+        'reviewBody': ('reviewBody', 'http://schema.org/reviewBody', ('Text',)),
+        'associatedClaimReview': ('associatedClaimReview', 'http://schema.org/associatedClaimReview', ('Review',)),
+        'negativeNotes': ('negativeNotes', 'http://schema.org/negativeNotes', ('Text', 'ListItem', 'WebContent', 'ItemList')),
+        'associatedReview': ('associatedReview', 'http://schema.org/associatedReview', ('Review',)),
+        'reviewAspect': ('reviewAspect', 'http://schema.org/reviewAspect', ('Text',)),
+        'positiveNotes': ('positiveNotes', 'http://schema.org/positiveNotes', ('Text', 'ListItem', 'ItemList', 'WebContent')),
+    }),
+    'ReviewAction': ('AssessAction', {
+        'resultReview': ('resultReview', 'http://schema.org/resultReview', ('Review',)),
+    }),
+    'ReviewNewsArticle': ('NewsArticle', {}),
+    'RiverBodyOfWater': ('BodyOfWater', {}),
+    'Role': ('Intangible', {
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'roleName': ('roleName', 'http://schema.org/roleName', ('URL', 'Text')),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+        'namedPosition': ('namedPosition', 'http://schema.org/namedPosition', ('URL', 'Text')),
+    }),
+    'RoofingContractor': ('HomeAndConstructionBusiness', {}),
+    'Room': ('Accommodation', {}),
+    'RsvpAction': ('InformAction', {
+        'additionalNumberOfGuests': ('additionalNumberOfGuests', 'http://schema.org/additionalNumberOfGuests', ('Number',)),
+        'rsvpResponse': ('rsvpResponse', 'http://schema.org/rsvpResponse', ('RsvpResponseType',)),
+        'comment': ('comment', 'http://schema.org/comment', ('Comment',)),
+    }),
+    'SaleEvent': ('Event', {}),
+    'SatiricalArticle': ('Article', {}),
+    'Schedule': ('Intangible', {
+        'repeatCount': ('repeatCount', 'http://schema.org/repeatCount', ('Integer',)),
+        'byMonthDay': ('byMonthDay', 'http://schema.org/byMonthDay', ('Integer',)),
+        'startTime': ('startTime', 'http://schema.org/startTime', ('DateTime', 'Time')),
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'endDate': ('endDate', 'http://schema.org/endDate', ('DateTime', 'Date')),
+        'scheduleTimezone': ('scheduleTimezone', 'http://schema.org/scheduleTimezone', ('Text',)),
+        'startDate': ('startDate', 'http://schema.org/startDate', ('DateTime', 'Date')),
+        'endTime': ('endTime', 'http://schema.org/endTime', ('DateTime', 'Time')),
+        'repeatFrequency': ('repeatFrequency', 'http://schema.org/repeatFrequency', ('Text', 'Duration')),
+        'byMonthWeek': ('byMonthWeek', 'http://schema.org/byMonthWeek', ('Integer',)),
+        'byDay': ('byDay', 'http://schema.org/byDay', ('Text', 'DayOfWeek')),
+        'byMonth': ('byMonth', 'http://schema.org/byMonth', ('Integer',)),
+        'exceptDate': ('exceptDate', 'http://schema.org/exceptDate', ('DateTime', 'Date')),
+    }),
+    'ScheduleAction': ('PlanAction', {}),
+    'ScholarlyArticle': ('Article', {}),
+    'School': ('EducationalOrganization', {}),
+    'SchoolDistrict': ('AdministrativeArea', {}),
+    'ScreeningEvent': ('Event', {
+        'workPresented': ('workPresented', 'http://schema.org/workPresented', ('Movie',)),
+        'subtitleLanguage': ('subtitleLanguage', 'http://schema.org/subtitleLanguage', ('Text', 'Language')),
+        'videoFormat': ('videoFormat', 'http://schema.org/videoFormat', ('Text',)),
+    }),
+    'Sculpture': ('CreativeWork', {}),
+    'SeaBodyOfWater': ('BodyOfWater', {}),
+    'SearchAction': ('Action', {
+        'query': ('query', 'http://schema.org/query', ('Text',)),
+    }),
+    'SearchRescueOrganization': ('Organization', {}),
+    'SearchResultsPage': ('WebPage', {}),
+    'Season': ('CreativeWork', {}),
+    'Seat': ('Intangible', {
+        'seatSection': ('seatSection', 'http://schema.org/seatSection', ('Text',)),
+        'seatRow': ('seatRow', 'http://schema.org/seatRow', ('Text',)),
+        'seatingType': ('seatingType', 'http://schema.org/seatingType', ('Text', 'QualitativeValue')),
+        'seatNumber': ('seatNumber', 'http://schema.org/seatNumber', ('Text',)),
+    }),
+    'SeekToAction': ('Action', {
+        'startOffset': ('startOffset', 'http://schema.org/startOffset', ('Number', 'HyperTocEntry')),
+    }),
+    'SelfStorage': ('LocalBusiness', {}),
+    'SellAction': ('TradeAction', {
+        'buyer': ('buyer', 'http://schema.org/buyer', ('Organization', 'Person')),
+        'warrantyPromise': ('warrantyPromise', 'http://schema.org/warrantyPromise', ('WarrantyPromise',)),
+    }),
+    'SendAction': ('TransferAction', {
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+        'deliveryMethod': ('deliveryMethod', 'http://schema.org/deliveryMethod', ('DeliveryMethod',)),
+    }),
+    'Series': ('Intangible', {}),
+    'Service': ('Intangible', {
+        'award': ('award', 'http://schema.org/award', ('Text',)),
+        'isRelatedTo': ('isRelatedTo', 'http://schema.org/isRelatedTo', ('Service', 'Product')),
+        'serviceOutput': ('serviceOutput', 'http://schema.org/serviceOutput', ('Thing',)),
+        'serviceArea': ('serviceArea', 'http://schema.org/serviceArea', ('Place', 'AdministrativeArea', 'GeoShape')),
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'review': ('review', 'http://schema.org/review', ('Review',)),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'termsOfService': ('termsOfService', 'http://schema.org/termsOfService', ('URL', 'Text')),
+        'providerMobility': ('providerMobility', 'http://schema.org/providerMobility', ('Text',)),
+        'areaServed': ('areaServed', 'http://schema.org/areaServed', ('Text', 'AdministrativeArea', 'Place', 'GeoShape')),
+        'produces': ('produces', 'http://schema.org/produces', ('Thing',)),
+        'availableChannel': ('availableChannel', 'http://schema.org/availableChannel', ('ServiceChannel',)),
+        'serviceType': ('serviceType', 'http://schema.org/serviceType', ('Text', 'GovernmentBenefitsType')),
+        'slogan': ('slogan', 'http://schema.org/slogan', ('Text',)),
+        'broker': ('broker', 'http://schema.org/broker', ('Organization', 'Person')),
+        'serviceAudience': ('serviceAudience', 'http://schema.org/serviceAudience', ('Audience',)),
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+        'audience': ('audience', 'http://schema.org/audience', ('Audience',)),
+        'logo': ('logo', 'http://schema.org/logo', ('URL', 'ImageObject')),
+        'hoursAvailable': ('hoursAvailable', 'http://schema.org/hoursAvailable', ('OpeningHoursSpecification',)),
+        'aggregateRating': ('aggregateRating', 'http://schema.org/aggregateRating', ('AggregateRating',)),
+        'hasCertification': ('hasCertification', 'http://schema.org/hasCertification', ('Certification',)),
+        'brand': ('brand', 'http://schema.org/brand', ('Brand', 'Organization')),
+        'hasOfferCatalog': ('hasOfferCatalog', 'http://schema.org/hasOfferCatalog', ('OfferCatalog',)),
+        'isSimilarTo': ('isSimilarTo', 'http://schema.org/isSimilarTo', ('Product', 'Service')),
+    }),
+    'ServiceChannel': ('Intangible', {
+        'providesService': ('providesService', 'http://schema.org/providesService', ('Service',)),
+        'servicePhone': ('servicePhone', 'http://schema.org/servicePhone', ('ContactPoint',)),
+        'serviceUrl': ('serviceUrl', 'http://schema.org/serviceUrl', ('URL',)),
+        'processingTime': ('processingTime', 'http://schema.org/processingTime', ('Duration',)),
+        'servicePostalAddress': ('servicePostalAddress', 'http://schema.org/servicePostalAddress', ('PostalAddress',)),
+        'availableLanguage': ('availableLanguage', 'http://schema.org/availableLanguage', ('Text', 'Language')),
+        'serviceLocation': ('serviceLocation', 'http://schema.org/serviceLocation', ('Place',)),
+        'serviceSmsNumber': ('serviceSmsNumber', 'http://schema.org/serviceSmsNumber', ('ContactPoint',)),
+    }),
+    'ServicePeriod': ('StructuredValue', {
+        'duration': ('duration', 'http://schema.org/duration', ('QuantitativeValue', 'Duration')),
+        'cutoffTime': ('cutoffTime', 'http://schema.org/cutoffTime', ('Time',)),
+        'businessDays': ('businessDays', 'http://schema.org/businessDays', ('DayOfWeek', 'OpeningHoursSpecification')),
+    }),
+    'ShareAction': ('CommunicateAction', {}),
+    'SheetMusic': ('CreativeWork', {}),
+    'ShippingConditions': ('StructuredValue', {
+        'shippingRate': ('shippingRate', 'http://schema.org/shippingRate', ('ShippingRateSettings', 'MonetaryAmount')),
+        'shippingDestination': ('shippingDestination', 'http://schema.org/shippingDestination', ('DefinedRegion',)),
+        'transitTime': ('transitTime', 'http://schema.org/transitTime', ('QuantitativeValue', 'ServicePeriod')),
+        'height': ('height', 'http://schema.org/height', ('Distance', 'QuantitativeValue')),
+        'seasonalOverride': ('seasonalOverride', 'http://schema.org/seasonalOverride', ('OpeningHoursSpecification',)),
+        'shippingOrigin': ('shippingOrigin', 'http://schema.org/shippingOrigin', ('DefinedRegion',)),
+        'numItems': ('numItems', 'http://schema.org/numItems', ('QuantitativeValue',)),
+        'width': ('width', 'http://schema.org/width', ('Distance', 'QuantitativeValue')),
+        'orderValue': ('orderValue', 'http://schema.org/orderValue', ('MonetaryAmount',)),
+        'depth': ('depth', 'http://schema.org/depth', ('QuantitativeValue', 'Distance')),
+        'weight': ('weight', 'http://schema.org/weight', ('Mass', 'QuantitativeValue')),
+        'doesNotShip': ('doesNotShip', 'http://schema.org/doesNotShip', ('Boolean',)),
+    }),
+    'ShippingDeliveryTime': ('StructuredValue', {
+        'cutoffTime': ('cutoffTime', 'http://schema.org/cutoffTime', ('Time',)),
+        'transitTime': ('transitTime', 'http://schema.org/transitTime', ('QuantitativeValue', 'ServicePeriod')),
+        'businessDays': ('businessDays', 'http://schema.org/businessDays', ('DayOfWeek', 'OpeningHoursSpecification')),
+        'handlingTime': ('handlingTime', 'http://schema.org/handlingTime', ('ServicePeriod', 'QuantitativeValue')),
+    }),
+    'ShippingRateSettings': ('StructuredValue', {
+        'shippingRate': ('shippingRate', 'http://schema.org/shippingRate', ('ShippingRateSettings', 'MonetaryAmount')),
+        'shippingDestination': ('shippingDestination', 'http://schema.org/shippingDestination', ('DefinedRegion',)),
+        'weightPercentage': ('weightPercentage', 'http://schema.org/weightPercentage', ('Number',)),
+        'isUnlabelledFallback': ('isUnlabelledFallback', 'http://schema.org/isUnlabelledFallback', ('Boolean',)),
+        'freeShippingThreshold': ('freeShippingThreshold', 'http://schema.org/freeShippingThreshold', ('DeliveryChargeSpecification', 'MonetaryAmount')),
+        'orderPercentage': ('orderPercentage', 'http://schema.org/orderPercentage', ('Number',)),
+        'doesNotShip': ('doesNotShip', 'http://schema.org/doesNotShip', ('Boolean',)),
+    }),
+    'ShippingService': ('StructuredValue', {
+        'fulfillmentType': ('fulfillmentType', 'http://schema.org/fulfillmentType', ('FulfillmentTypeEnumeration',)),
+        'shippingConditions': ('shippingConditions', 'http://schema.org/shippingConditions', ('ShippingConditions',)),
+        'validForMemberTier': ('validForMemberTier', 'http://schema.org/validForMemberTier', ('MemberProgramTier',)),
+        'handlingTime': ('handlingTime', 'http://schema.org/handlingTime', ('ServicePeriod', 'QuantitativeValue')),
+    }),
+    'ShoeStore': ('Store', {}),
+    'ShoppingCenter': ('LocalBusiness', {}),
+    'ShortStory': ('CreativeWork', {}),
+    'SingleFamilyResidence': ('House', {
+        'occupancy': ('occupancy', 'http://schema.org/occupancy', ('QuantitativeValue',)),
+        'numberOfRooms': ('numberOfRooms', 'http://schema.org/numberOfRooms', ('Number', 'QuantitativeValue')),
+    }),
+    'SiteNavigationElement': ('WebPageElement', {}),
+    'SizeGroupEnumeration': ('Enumeration', {}),
+    'SizeSpecification': ('QualitativeValue', {
+        'suggestedGender': ('suggestedGender', 'http://schema.org/suggestedGender', ('Text', 'GenderType')),
+        'suggestedAge': ('suggestedAge', 'http://schema.org/suggestedAge', ('QuantitativeValue',)),
+        'sizeSystem': ('sizeSystem', 'http://schema.org/sizeSystem', ('Text', 'SizeSystemEnumeration')),
+        'suggestedMeasurement': ('suggestedMeasurement', 'http://schema.org/suggestedMeasurement', ('QuantitativeValue',)),
+        'hasMeasurement': ('hasMeasurement', 'http://schema.org/hasMeasurement', ('QuantitativeValue',)),
+        'sizeGroup': ('sizeGroup', 'http://schema.org/sizeGroup', ('Text', 'SizeGroupEnumeration')),
+    }),
+    'SkiResort': ('Resort', {}),
+    'SocialEvent': ('Event', {}),
+    'SocialMediaPosting': ('Article', {
+        'sharedContent': ('sharedContent', 'http://schema.org/sharedContent', ('CreativeWork',)),
+    }),
+    'SoftwareApplication': ('CreativeWork', {
+        'screenshot': ('screenshot', 'http://schema.org/screenshot', ('URL', 'ImageObject')),
+        'downloadUrl': ('downloadUrl', 'http://schema.org/downloadUrl', ('URL',)),
+        'operatingSystem': ('operatingSystem', 'http://schema.org/operatingSystem', ('Text',)),
+        'requirements': ('requirements', 'http://schema.org/requirements', ('URL', 'Text')),
+        'softwareHelp': ('softwareHelp', 'http://schema.org/softwareHelp', ('CreativeWork',)),
+        'permissions': ('permissions', 'http://schema.org/permissions', ('Text',)),
+        'installUrl': ('installUrl', 'http://schema.org/installUrl', ('URL',)),
+        'applicationCategory': ('applicationCategory', 'http://schema.org/applicationCategory', ('URL', 'Text')),
+        'memoryRequirements': ('memoryRequirements', 'http://schema.org/memoryRequirements', ('URL', 'Text')),
+        'fileSize': ('fileSize', 'http://schema.org/fileSize', ('Text',)),
+        'applicationSubCategory': ('applicationSubCategory', 'http://schema.org/applicationSubCategory', ('URL', 'Text')),
+        'softwareVersion': ('softwareVersion', 'http://schema.org/softwareVersion', ('Text',)),
+        'applicationSuite': ('applicationSuite', 'http://schema.org/applicationSuite', ('Text',)),
+        'storageRequirements': ('storageRequirements', 'http://schema.org/storageRequirements', ('URL', 'Text')),
+        'countriesSupported': ('countriesSupported', 'http://schema.org/countriesSupported', ('Text',)),
+        'countriesNotSupported': ('countriesNotSupported', 'http://schema.org/countriesNotSupported', ('Text',)),
+        'softwareRequirements': ('softwareRequirements', 'http://schema.org/softwareRequirements', ('URL', 'Text')),
+        'releaseNotes': ('releaseNotes', 'http://schema.org/releaseNotes', ('URL', 'Text')),
+        'processorRequirements': ('processorRequirements', 'http://schema.org/processorRequirements', ('Text',)),
+        'supportingData': ('supportingData', 'http://schema.org/supportingData', ('DataFeed',)),
+        'softwareAddOn': ('softwareAddOn', 'http://schema.org/softwareAddOn', ('SoftwareApplication',)),
+        'availableOnDevice': ('availableOnDevice', 'http://schema.org/availableOnDevice', ('Text',)),
+        'featureList': ('featureList', 'http://schema.org/featureList', ('URL', 'Text')),
+        'device': ('device', 'http://schema.org/device', ('Text',)),
+    }),
+    'SoftwareSourceCode': ('CreativeWork', {
+        'targetProduct': ('targetProduct', 'http://schema.org/targetProduct', ('SoftwareApplication',)),
+        'runtime': ('runtime', 'http://schema.org/runtime', ('Text',)),
+        'runtimePlatform': ('runtimePlatform', 'http://schema.org/runtimePlatform', ('Text',)),
+        'codeRepository': ('codeRepository', 'http://schema.org/codeRepository', ('URL',)),
+        'sampleType': ('sampleType', 'http://schema.org/sampleType', ('Text',)),
+        'programmingLanguage': ('programmingLanguage', 'http://schema.org/programmingLanguage', ('Text', 'ComputerLanguage')),
+        'codeSampleType': ('codeSampleType', 'http://schema.org/codeSampleType', ('Text',)),
+    }),
+    'SolveMathAction': ('Action', {
+        'eduQuestionType': ('eduQuestionType', 'http://schema.org/eduQuestionType', ('Text',)),
+    }),
+    'SomeProducts': ('Product', {
+        'inventoryLevel': ('inventoryLevel', 'http://schema.org/inventoryLevel', ('QuantitativeValue',)),
+    }),
+    'SpeakableSpecification': ('Intangible', {
+        'xpath': ('xpath', 'http://schema.org/xpath', ('Text',)),
+        'cssSelector': ('cssSelector', 'http://schema.org/cssSelector', ('Text',)),
+    }),
+    'SpecialAnnouncement': ('CreativeWork', {
+        'travelBans': ('travelBans', 'http://schema.org/travelBans', ('URL', 'WebContent')),
+        'datePosted': ('datePosted', 'http://schema.org/datePosted', ('DateTime', 'Date')),
+        'webFeed': ('webFeed', 'http://schema.org/webFeed', ('URL', 'DataFeed')),
+        'publicTransportClosuresInfo': ('publicTransportClosuresInfo', 'http://schema.org/publicTransportClosuresInfo', ('URL', 'WebContent')),
+        'gettingTestedInfo': ('gettingTestedInfo', 'http://schema.org/gettingTestedInfo', ('URL', 'WebContent')),
+        'diseasePreventionInfo': ('diseasePreventionInfo', 'http://schema.org/diseasePreventionInfo', ('URL', 'WebContent')),
+        'quarantineGuidelines': ('quarantineGuidelines', 'http://schema.org/quarantineGuidelines', ('URL', 'WebContent')),
+        'category': ('category', 'http://schema.org/category', ('URL', 'Text', 'Thing', 'PhysicalActivityCategory', 'CategoryCode')),
+        'diseaseSpreadStatistics': ('diseaseSpreadStatistics', 'http://schema.org/diseaseSpreadStatistics', ('URL', 'Observation', 'Dataset', 'WebContent')),
+        'announcementLocation': ('announcementLocation', 'http://schema.org/announcementLocation', ('LocalBusiness', 'CivicStructure')),
+        'governmentBenefitsInfo': ('governmentBenefitsInfo', 'http://schema.org/governmentBenefitsInfo', ('GovernmentService',)),
+        'newsUpdatesAndGuidelines': ('newsUpdatesAndGuidelines', 'http://schema.org/newsUpdatesAndGuidelines', ('URL', 'WebContent')),
+        'schoolClosuresInfo': ('schoolClosuresInfo', 'http://schema.org/schoolClosuresInfo', ('URL', 'WebContent')),
+    }),
+    'Specialty': ('Enumeration', {}),
+    'SportingGoodsStore': ('Store', {}),
+    'SportsActivityLocation': ('LocalBusiness', {}),
+    'SportsClub': ('SportsActivityLocation', {}),
+    'SportsEvent': ('Event', {
+        'referee': ('referee', 'http://schema.org/referee', ('Person',)),
+        'sport': ('sport', 'http://schema.org/sport', ('URL', 'Text')),
+        'homeTeam': ('homeTeam', 'http://schema.org/homeTeam', ('Person', 'SportsTeam')),
+        'competitor': ('competitor', 'http://schema.org/competitor', ('Person', 'SportsTeam')),
+        'awayTeam': ('awayTeam', 'http://schema.org/awayTeam', ('Person', 'SportsTeam')),
+    }),
+    'SportsOrganization': ('Organization', {
+        'sport': ('sport', 'http://schema.org/sport', ('URL', 'Text')),
+    }),
+    'SportsTeam': ('SportsOrganization', {
+        'coach': ('coach', 'http://schema.org/coach', ('Person',)),
+        'gender': ('gender', 'http://schema.org/gender', ('Text', 'GenderType')),
+        'athlete': ('athlete', 'http://schema.org/athlete', ('Person',)),
+    }),
+    'SpreadsheetDigitalDocument': ('DigitalDocument', {}),
+    'StadiumOrArena': ('SportsActivityLocation', {}),
+    'State': ('AdministrativeArea', {}),
+    'Statement': ('CreativeWork', {}),
+    'StatisticalPopulation': ('Intangible', {
+        'populationType': ('populationType', 'http://schema.org/populationType', ('Class',)),
+    }),
+    'StatisticalVariable': ('ConstraintNode', {
+        'measuredProperty': ('measuredProperty', 'http://schema.org/measuredProperty', ('Property',)),
+        'statType': ('statType', 'http://schema.org/statType', ('URL', 'Text', 'Property')),
+        'measurementTechnique': ('measurementTechnique', 'http://schema.org/measurementTechnique', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'measurementDenominator': ('measurementDenominator', 'http://schema.org/measurementDenominator', ('StatisticalVariable',)),
+        'measurementMethod': ('measurementMethod', 'http://schema.org/measurementMethod', ('URL', 'Text', 'DefinedTerm', 'MeasurementMethodEnum')),
+        'populationType': ('populationType', 'http://schema.org/populationType', ('Class',)),
+        'measurementQualifier': ('measurementQualifier', 'http://schema.org/measurementQualifier', ('Enumeration',)),
+    }),
+    'StatusEnumeration': ('Enumeration', {}),
+    'Store': ('LocalBusiness', {}),
+    'StructuredValue': ('Intangible', {}),
+    'SubscribeAction': ('InteractAction', {}),
+    'Substance': ('MedicalEntity', {
+        'activeIngredient': ('activeIngredient', 'http://schema.org/activeIngredient', ('Text',)),
+        'maximumIntake': ('maximumIntake', 'http://schema.org/maximumIntake', ('MaximumDoseSchedule',)),
+    }),
+    'SubwayStation': ('CivicStructure', {}),
+    'Suite': ('Accommodation', {
+        'occupancy': ('occupancy', 'http://schema.org/occupancy', ('QuantitativeValue',)),
+        'numberOfRooms': ('numberOfRooms', 'http://schema.org/numberOfRooms', ('Number', 'QuantitativeValue')),
+        'bed': ('bed', 'http://schema.org/bed', ('Text', 'BedDetails', 'BedType')),
+    }),
+    'SuperficialAnatomy': ('MedicalEntity', {
+        'relatedAnatomy': ('relatedAnatomy', 'http://schema.org/relatedAnatomy', ('AnatomicalStructure', 'AnatomicalSystem')),
+        'associatedPathophysiology': ('associatedPathophysiology', 'http://schema.org/associatedPathophysiology', ('Text',)),
+        'relatedTherapy': ('relatedTherapy', 'http://schema.org/relatedTherapy', ('MedicalTherapy',)),
+        'relatedCondition': ('relatedCondition', 'http://schema.org/relatedCondition', ('MedicalCondition',)),
+        'significance': ('significance', 'http://schema.org/significance', ('Text',)),
+    }),
+    'SurgicalProcedure': ('MedicalProcedure', {}),
+    'SuspendAction': ('ControlAction', {}),
+    'Syllabus': ('LearningResource', {}),
+    'Synagogue': ('PlaceOfWorship', {}),
+    'TVClip': ('Clip', {
+        'partOfTVSeries': ('partOfTVSeries', 'http://schema.org/partOfTVSeries', ('TVSeries',)),
+    }),
+    'TVEpisode': ('Episode', {
+        'titleEIDR': ('titleEIDR', 'http://schema.org/titleEIDR', ('URL', 'Text')),
+        'countryOfOrigin': ('countryOfOrigin', 'http://schema.org/countryOfOrigin', ('Country',)),
+        'subtitleLanguage': ('subtitleLanguage', 'http://schema.org/subtitleLanguage', ('Text', 'Language')),
+        'partOfTVSeries': ('partOfTVSeries', 'http://schema.org/partOfTVSeries', ('TVSeries',)),
+    }),
+    'TVSeason': ('CreativeWork', {
+        'titleEIDR': ('titleEIDR', 'http://schema.org/titleEIDR', ('URL', 'Text')),
+        'countryOfOrigin': ('countryOfOrigin', 'http://schema.org/countryOfOrigin', ('Country',)),
+        'partOfTVSeries': ('partOfTVSeries', 'http://schema.org/partOfTVSeries', ('TVSeries',)),
+    }),
+    'TVSeries': ('CreativeWorkSeries', {
+        'episodes': ('episodes', 'http://schema.org/episodes', ('Episode',)),
+        'titleEIDR': ('titleEIDR', 'http://schema.org/titleEIDR', ('URL', 'Text')),
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'season': ('season', 'http://schema.org/season', ('URL', 'CreativeWorkSeason')),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'numberOfSeasons': ('numberOfSeasons', 'http://schema.org/numberOfSeasons', ('Integer',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'episode': ('episode', 'http://schema.org/episode', ('Episode',)),
+        'numberOfEpisodes': ('numberOfEpisodes', 'http://schema.org/numberOfEpisodes', ('Integer',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'countryOfOrigin': ('countryOfOrigin', 'http://schema.org/countryOfOrigin', ('Country',)),
+        'containsSeason': ('containsSeason', 'http://schema.org/containsSeason', ('CreativeWorkSeason',)),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+        'seasons': ('seasons', 'http://schema.org/seasons', ('CreativeWorkSeason',)),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+    }),
+    'Table': ('WebPageElement', {}),
+    'TakeAction': ('TransferAction', {}),
+    'TattooParlor': ('HealthAndBeautyBusiness', {}),
+    'Taxi': ('Service', {}),
+    'TaxiReservation': ('Reservation', {
+        'pickupLocation': ('pickupLocation', 'http://schema.org/pickupLocation', ('Place',)),
+        'partySize': ('partySize', 'http://schema.org/partySize', ('Integer', 'QuantitativeValue')),
+        'pickupTime': ('pickupTime', 'http://schema.org/pickupTime', ('DateTime',)),
+    }),
+    'TaxiService': ('Service', {}),
+    'TaxiStand': ('CivicStructure', {}),
+    'Taxon': ('Thing', {
+        'taxonRank': ('taxonRank', 'http://schema.org/taxonRank', ('URL', 'Text', 'PropertyValue')),
+        'parentTaxon': ('parentTaxon', 'http://schema.org/parentTaxon', ('URL', 'Text', 'Taxon')),
+        'hasDefinedTerm': ('hasDefinedTerm', 'http://schema.org/hasDefinedTerm', ('DefinedTerm',)),
+        'childTaxon': ('childTaxon', 'http://schema.org/childTaxon', ('URL', 'Text', 'Taxon')),
+    }),
+    'TechArticle': ('Article', {
+        'proficiencyLevel': ('proficiencyLevel', 'http://schema.org/proficiencyLevel', ('Text',)),
+        'dependencies': ('dependencies', 'http://schema.org/dependencies', ('Text',)),
+    }),
+    'TelevisionChannel': ('BroadcastChannel', {}),
+    'TelevisionStation': ('LocalBusiness', {}),
+    'TennisComplex': ('SportsActivityLocation', {}),
+    'TextDigitalDocument': ('DigitalDocument', {}),
+    'TextObject': ('MediaObject', {}),
+    'TheaterEvent': ('Event', {}),
+    'TheaterGroup': ('PerformingGroup', {}),
+    'TherapeuticProcedure': ('MedicalProcedure', {
+        'drug': ('drug', 'http://schema.org/drug', ('Drug',)),
+        'adverseOutcome': ('adverseOutcome', 'http://schema.org/adverseOutcome', ('MedicalEntity',)),
+        'doseSchedule': ('doseSchedule', 'http://schema.org/doseSchedule', ('DoseSchedule',)),
+    }),
+    'Thesis': ('CreativeWork', {
+        'inSupportOf': ('inSupportOf', 'http://schema.org/inSupportOf', ('Text',)),
+    }),
+    'Thing': (None, {
+        'image': ('image', 'http://schema.org/image', ('URL', 'ImageObject')),
+        'url': ('url', 'http://schema.org/url', ('URL',)),
+        'alternateName': ('alternateName', 'http://schema.org/alternateName', ('Text',)),
+        'potentialAction': ('potentialAction', 'http://schema.org/potentialAction', ('Action',)),
+        'sameAs': ('sameAs', 'http://schema.org/sameAs', ('URL',)),
+        'identifier': ('identifier', 'http://schema.org/identifier', ('URL', 'Text', 'PropertyValue')),
+        'additionalType': ('additionalType', 'http://schema.org/additionalType', ('URL', 'Text')),
+        'subjectOf': ('subjectOf', 'http://schema.org/subjectOf', ('CreativeWork', 'Event')),
+        'name': ('name', 'http://schema.org/name', ('Text',)),
+        'description': ('description', 'http://schema.org/description', ('Text', 'TextObject')),
+        'disambiguatingDescription': ('disambiguatingDescription', 'http://schema.org/disambiguatingDescription', ('Text',)),
+        'mainEntityOfPage': ('mainEntityOfPage', 'http://schema.org/mainEntityOfPage', ('URL', 'CreativeWork')),
+    }),
+    'Ticket': ('Intangible', {
+        'issuedBy': ('issuedBy', 'http://schema.org/issuedBy', ('Organization',)),
+        'ticketToken': ('ticketToken', 'http://schema.org/ticketToken', ('URL', 'Text')),
+        'ticketNumber': ('ticketNumber', 'http://schema.org/ticketNumber', ('Text',)),
+        'totalPrice': ('totalPrice', 'http://schema.org/totalPrice', ('Number', 'Text', 'PriceSpecification')),
+        'priceCurrency': ('priceCurrency', 'http://schema.org/priceCurrency', ('Text',)),
+        'underName': ('underName', 'http://schema.org/underName', ('Organization', 'Person')),
+        'dateIssued': ('dateIssued', 'http://schema.org/dateIssued', ('DateTime', 'Date')),
+        'ticketedSeat': ('ticketedSeat', 'http://schema.org/ticketedSeat', ('Seat',)),
+    }),
+    'TieAction': ('AchieveAction', {}),
+    'TipAction': ('TradeAction', {
+        'recipient': ('recipient', 'http://schema.org/recipient', ('Organization', 'Audience', 'ContactPoint', 'Person')),
+    }),
+    'TireShop': ('Store', {}),
+    'TouristAttraction': ('Place', {
+        'touristType': ('touristType', 'http://schema.org/touristType', ('Text', 'Audience')),
+        'availableLanguage': ('availableLanguage', 'http://schema.org/availableLanguage', ('Text', 'Language')),
+    }),
+    'TouristDestination': ('Place', {
+        'touristType': ('touristType', 'http://schema.org/touristType', ('Text', 'Audience')),
+        'includesAttraction': ('includesAttraction', 'http://schema.org/includesAttraction', ('TouristAttraction',)),
+    }),
+    'TouristInformationCenter': ('LocalBusiness', {}),
+    'TouristTrip': ('Trip', {
+        'touristType': ('touristType', 'http://schema.org/touristType', ('Text', 'Audience')),
+    }),
+    'ToyStore': ('Store', {}),
+    'TrackAction': ('FindAction', {
+        'deliveryMethod': ('deliveryMethod', 'http://schema.org/deliveryMethod', ('DeliveryMethod',)),
+    }),
+    'TradeAction': ('Action', {
+        'priceCurrency': ('priceCurrency', 'http://schema.org/priceCurrency', ('Text',)),
+        'priceSpecification': ('priceSpecification', 'http://schema.org/priceSpecification', ('PriceSpecification',)),
+        'price': ('price', 'http://schema.org/price', ('Number', 'Text')),
+    }),
+    'TrainReservation': ('Reservation', {}),
+    'TrainStation': ('CivicStructure', {}),
+    'TrainTrip': ('Trip', {
+        'arrivalStation': ('arrivalStation', 'http://schema.org/arrivalStation', ('TrainStation',)),
+        'departureStation': ('departureStation', 'http://schema.org/departureStation', ('TrainStation',)),
+        'trainNumber': ('trainNumber', 'http://schema.org/trainNumber', ('Text',)),
+        'departurePlatform': ('departurePlatform', 'http://schema.org/departurePlatform', ('Text',)),
+        'trainName': ('trainName', 'http://schema.org/trainName', ('Text',)),
+        'arrivalPlatform': ('arrivalPlatform', 'http://schema.org/arrivalPlatform', ('Text',)),
+    }),
+    'TransferAction': ('Action', {
+        'fromLocation': ('fromLocation', 'http://schema.org/fromLocation', ('Place',)),
+        'toLocation': ('toLocation', 'http://schema.org/toLocation', ('Place',)),
+    }),
+    'TravelAction': ('MoveAction', {
+        'distance': ('distance', 'http://schema.org/distance', ('Distance',)),
+    }),
+    'TravelAgency': ('LocalBusiness', {}),
+    'TreatmentIndication': ('MedicalIndication', {}),
+    'Trip': ('Intangible', {
+        'offers': ('offers', 'http://schema.org/offers', ('Demand', 'Offer')),
+        'tripOrigin': ('tripOrigin', 'http://schema.org/tripOrigin', ('Place',)),
+        'provider': ('provider', 'http://schema.org/provider', ('Organization', 'Person')),
+        'subTrip': ('subTrip', 'http://schema.org/subTrip', ('Trip',)),
+        'departureTime': ('departureTime', 'http://schema.org/departureTime', ('DateTime', 'Time')),
+        'itinerary': ('itinerary', 'http://schema.org/itinerary', ('ItemList', 'Place')),
+        'arrivalTime': ('arrivalTime', 'http://schema.org/arrivalTime', ('DateTime', 'Time')),
+        'partOfTrip': ('partOfTrip', 'http://schema.org/partOfTrip', ('Trip',)),
+    }),
+    'TypeAndQuantityNode': ('StructuredValue', {
+        'amountOfThisGood': ('amountOfThisGood', 'http://schema.org/amountOfThisGood', ('Number',)),
+        'businessFunction': ('businessFunction', 'http://schema.org/businessFunction', ('BusinessFunction',)),
+        'unitText': ('unitText', 'http://schema.org/unitText', ('Text',)),
+        'typeOfGood': ('typeOfGood', 'http://schema.org/typeOfGood', ('Product', 'Service')),
+        'unitCode': ('unitCode', 'http://schema.org/unitCode', ('URL', 'Text')),
+    }),
+    'URL': (None, {}),
+    'UnRegisterAction': ('InteractAction', {}),
+    'UnitPriceSpecification': ('PriceSpecification', {
+        'billingIncrement': ('billingIncrement', 'http://schema.org/billingIncrement', ('Number',)),
+        'priceType': ('priceType', 'http://schema.org/priceType', ('Text', 'PriceTypeEnumeration')),
+        'unitText': ('unitText', 'http://schema.org/unitText', ('Text',)),
+        'referenceQuantity': ('referenceQuantity', 'http://schema.org/referenceQuantity', ('QuantitativeValue',)),
+        'billingDuration': ('billingDuration', 'http://schema.org/billingDuration', ('Number', 'Duration', 'QuantitativeValue')),
+        'unitCode': ('unitCode', 'http://schema.org/unitCode', ('URL', 'Text')),
+        'billingStart': ('billingStart', 'http://schema.org/billingStart', ('Number',)),
+        'priceComponentType': ('priceComponentType', 'http://schema.org/priceComponentType', ('PriceComponentTypeEnumeration',)),
+    }),
+    'UpdateAction': ('Action', {
+        'collection': ('collection', 'http://schema.org/collection', ('Thing',)),
+        'targetCollection': ('targetCollection', 'http://schema.org/targetCollection', ('Thing',)),
+    }),
+    'UseAction': ('ConsumeAction', {}),
+    'UserBlocks': ('UserInteraction', {}),
+    'UserCheckins': ('UserInteraction', {}),
+    'UserComments': ('UserInteraction', {
+        'discusses': ('discusses', 'http://schema.org/discusses', ('CreativeWork',)),
+        'creator': ('creator', 'http://schema.org/creator', ('Organization', 'Person')),
+        'commentTime': ('commentTime', 'http://schema.org/commentTime', ('DateTime', 'Date')),
+        'commentText': ('commentText', 'http://schema.org/commentText', ('Text',)),
+        'replyToUrl': ('replyToUrl', 'http://schema.org/replyToUrl', ('URL',)),
+    }),
+    'UserDownloads': ('UserInteraction', {}),
+    'UserInteraction': ('Event', {}),
+    'UserLikes': ('UserInteraction', {}),
+    'UserPageVisits': ('UserInteraction', {}),
+    'UserPlays': ('UserInteraction', {}),
+    'UserPlusOnes': ('UserInteraction', {}),
+    'UserReview': ('Review', {}),
+    'UserTweets': ('UserInteraction', {}),
+    'VacationRental': ('LodgingBusiness', {}),
+    'Vehicle': ('Product', {
+        'fuelType': ('fuelType', 'http://schema.org/fuelType', ('URL', 'Text', 'QualitativeValue')),
+        'fuelConsumption': ('fuelConsumption', 'http://schema.org/fuelConsumption', ('QuantitativeValue',)),
+        'mileageFromOdometer': ('mileageFromOdometer', 'http://schema.org/mileageFromOdometer', ('QuantitativeValue',)),
+        'vehicleInteriorType': ('vehicleInteriorType', 'http://schema.org/vehicleInteriorType', ('Text',)),
+        'fuelEfficiency': ('fuelEfficiency', 'http://schema.org/fuelEfficiency', ('QuantitativeValue',)),
+        'vehicleModelDate': ('vehicleModelDate', 'http://schema.org/vehicleModelDate', ('Date',)),
+        'cargoVolume': ('cargoVolume', 'http://schema.org/cargoVolume', ('QuantitativeValue',)),
+        'vehicleSeatingCapacity': ('vehicleSeatingCapacity', 'http://schema.org/vehicleSeatingCapacity', ('Number', 'QuantitativeValue')),
+        'numberOfForwardGears': ('numberOfForwardGears', 'http://schema.org/numberOfForwardGears', ('Number', 'QuantitativeValue')),
+        'seatingCapacity': ('seatingCapacity', 'http://schema.org/seatingCapacity', ('Number', 'QuantitativeValue')),
+        'emissionsCO2': ('emissionsCO2', 'http://schema.org/emissionsCO2', ('Number',)),
+        'productionDate': ('productionDate', 'http://schema.org/productionDate', ('Date',)),
+        'steeringPosition': ('steeringPosition', 'http://schema.org/steeringPosition', ('SteeringPositionValue',)),
+        'numberOfDoors': ('numberOfDoors', 'http://schema.org/numberOfDoors', ('Number', 'QuantitativeValue')),
+        'tongueWeight': ('tongueWeight', 'http://schema.org/tongueWeight', ('QuantitativeValue',)),
+        'purchaseDate': ('purchaseDate', 'http://schema.org/purchaseDate', ('Date',)),
+        'vehicleEngine': ('vehicleEngine', 'http://schema.org/vehicleEngine', ('EngineSpecification',)),
+        'vehicleTransmission': ('vehicleTransmission', 'http://schema.org/vehicleTransmission', ('URL', 'Text', 'QualitativeValue')),
+        'payload': ('payload', 'http://schema.org/payload', ('QuantitativeValue',)),
+        'vehicleIdentificationNumber': ('vehicleIdentificationNumber', 'http://schema.org/vehicleIdentificationNumber', ('Text',)),
+        'dateVehicleFirstRegistered': ('dateVehicleFirstRegistered', 'http://schema.org/dateVehicleFirstRegistered', ('Date',)),
+        'driveWheelConfiguration': ('driveWheelConfiguration', 'http://schema.org/driveWheelConfiguration', ('Text', 'DriveWheelConfigurationValue')),
+        'meetsEmissionStandard': ('meetsEmissionStandard', 'http://schema.org/meetsEmissionStandard', ('URL', 'Text', 'QualitativeValue')),
+        'vehicleSpecialUsage': ('vehicleSpecialUsage', 'http://schema.org/vehicleSpecialUsage', ('Text', 'CarUsageType')),
+        'fuelCapacity': ('fuelCapacity', 'http://schema.org/fuelCapacity', ('QuantitativeValue',)),
+        'knownVehicleDamages': ('knownVehicleDamages', 'http://schema.org/knownVehicleDamages', ('Text',)),
+        'trailerWeight': ('trailerWeight', 'http://schema.org/trailerWeight', ('QuantitativeValue',)),
+        'weightTotal': ('weightTotal', 'http://schema.org/weightTotal', ('QuantitativeValue',)),
+        'numberOfAirbags': ('numberOfAirbags', 'http://schema.org/numberOfAirbags', ('Number', 'Text')),
+        'vehicleConfiguration': ('vehicleConfiguration', 'http://schema.org/vehicleConfiguration', ('Text',)),
+        'callSign': ('callSign', 'http://schema.org/callSign', ('Text',)),
+        'accelerationTime': ('accelerationTime', 'http://schema.org/accelerationTime', ('QuantitativeValue',)),
+        'numberOfAxles': ('numberOfAxles', 'http://schema.org/numberOfAxles', ('Number', 'QuantitativeValue')),
+        'modelDate': ('modelDate', 'http://schema.org/modelDate', ('Date',)),
+        'bodyType': ('bodyType', 'http://schema.org/bodyType', ('URL', 'Text', 'QualitativeValue')),
+        'vehicleInteriorColor': ('vehicleInteriorColor', 'http://schema.org/vehicleInteriorColor', ('Text',)),
+        'numberOfPreviousOwners': ('numberOfPreviousOwners', 'http://schema.org/numberOfPreviousOwners', ('Number', 'QuantitativeValue')),
+        'wheelbase': ('wheelbase', 'http://schema.org/wheelbase', ('QuantitativeValue',)),
+        'speed': ('speed', 'http://schema.org/speed', ('QuantitativeValue',)),
+    }),
+    'Vein': ('Vessel', {
+        'tributary': ('tributary', 'http://schema.org/tributary', ('AnatomicalStructure',)),
+        'regionDrained': ('regionDrained', 'http://schema.org/regionDrained', ('AnatomicalStructure', 'AnatomicalSystem')),
+        'drainsTo': ('drainsTo', 'http://schema.org/drainsTo', ('Vessel',)),
+    }),
+    'Vessel': ('AnatomicalStructure', {}),
+    'VeterinaryCare': ('MedicalOrganization', {}),
+    'VideoGallery': ('MediaGallery', {}),
+    'VideoGame': ('Game', {
+        'cheatCode': ('cheatCode', 'http://schema.org/cheatCode', ('CreativeWork',)),
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'gameServer': ('gameServer', 'http://schema.org/gameServer', ('GameServer',)),
+        'playMode': ('playMode', 'http://schema.org/playMode', ('GamePlayMode',)),
+        'gameTip': ('gameTip', 'http://schema.org/gameTip', ('CreativeWork',)),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'gamePlatform': ('gamePlatform', 'http://schema.org/gamePlatform', ('URL', 'Text', 'Thing')),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'gameEdition': ('gameEdition', 'http://schema.org/gameEdition', ('Text',)),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+    }),
+    'VideoGameClip': ('Clip', {}),
+    'VideoGameSeries': ('CreativeWorkSeries', {
+        'episodes': ('episodes', 'http://schema.org/episodes', ('Episode',)),
+        'cheatCode': ('cheatCode', 'http://schema.org/cheatCode', ('CreativeWork',)),
+        'trailer': ('trailer', 'http://schema.org/trailer', ('VideoObject',)),
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'season': ('season', 'http://schema.org/season', ('URL', 'CreativeWorkSeason')),
+        'characterAttribute': ('characterAttribute', 'http://schema.org/characterAttribute', ('Thing',)),
+        'playMode': ('playMode', 'http://schema.org/playMode', ('GamePlayMode',)),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'numberOfSeasons': ('numberOfSeasons', 'http://schema.org/numberOfSeasons', ('Integer',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'gamePlatform': ('gamePlatform', 'http://schema.org/gamePlatform', ('URL', 'Text', 'Thing')),
+        'numberOfPlayers': ('numberOfPlayers', 'http://schema.org/numberOfPlayers', ('QuantitativeValue',)),
+        'episode': ('episode', 'http://schema.org/episode', ('Episode',)),
+        'gameItem': ('gameItem', 'http://schema.org/gameItem', ('Thing',)),
+        'numberOfEpisodes': ('numberOfEpisodes', 'http://schema.org/numberOfEpisodes', ('Integer',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'gameLocation': ('gameLocation', 'http://schema.org/gameLocation', ('URL', 'Place', 'PostalAddress')),
+        'quest': ('quest', 'http://schema.org/quest', ('Thing',)),
+        'containsSeason': ('containsSeason', 'http://schema.org/containsSeason', ('CreativeWorkSeason',)),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+        'seasons': ('seasons', 'http://schema.org/seasons', ('CreativeWorkSeason',)),
+        'productionCompany': ('productionCompany', 'http://schema.org/productionCompany', ('Organization',)),
+    }),
+    'VideoObject': ('MediaObject', {
+        'actor': ('actor', 'http://schema.org/actor', ('PerformingGroup', 'Person')),
+        'caption': ('caption', 'http://schema.org/caption', ('Text', 'MediaObject')),
+        'videoQuality': ('videoQuality', 'http://schema.org/videoQuality', ('Text',)),
+        'director': ('director', 'http://schema.org/director', ('Person',)),
+        'directors': ('directors', 'http://schema.org/directors', ('Person',)),
+        'transcript': ('transcript', 'http://schema.org/transcript', ('Text',)),
+        'musicBy': ('musicBy', 'http://schema.org/musicBy', ('MusicGroup', 'Person')),
+        'videoFrameSize': ('videoFrameSize', 'http://schema.org/videoFrameSize', ('Text',)),
+        'embeddedTextCaption': ('embeddedTextCaption', 'http://schema.org/embeddedTextCaption', ('Text',)),
+        'actors': ('actors', 'http://schema.org/actors', ('Person',)),
+    }),
+    'VideoObjectSnapshot': ('VideoObject', {}),
+    'ViewAction': ('ConsumeAction', {}),
+    'VirtualLocation': ('Intangible', {}),
+    'VisualArtsEvent': ('Event', {}),
+    'VisualArtwork': ('CreativeWork', {
+        'artist': ('artist', 'http://schema.org/artist', ('Person',)),
+        'penciler': ('penciler', 'http://schema.org/penciler', ('Person',)),
+        'artEdition': ('artEdition', 'http://schema.org/artEdition', ('Integer', 'Text')),
+        'height': ('height', 'http://schema.org/height', ('Distance', 'QuantitativeValue')),
+        'artMedium': ('artMedium', 'http://schema.org/artMedium', ('URL', 'Text')),
+        'surface': ('surface', 'http://schema.org/surface', ('URL', 'Text')),
+        'width': ('width', 'http://schema.org/width', ('Distance', 'QuantitativeValue')),
+        'artworkSurface': ('artworkSurface', 'http://schema.org/artworkSurface', ('URL', 'Text')),
+        'letterer': ('letterer', 'http://schema.org/letterer', ('Person',)),
+        'depth': ('depth', 'http://schema.org/depth', ('QuantitativeValue', 'Distance')),
+        'weight': ('weight', 'http://schema.org/weight', ('Mass', 'QuantitativeValue')),
+        'colorist': ('colorist', 'http://schema.org/colorist', ('Person',)),
+        'inker': ('inker', 'http://schema.org/inker', ('Person',)),
+        'artform': ('artform', 'http://schema.org/artform', ('URL', 'Text')),
+    }),
+    'VitalSign': ('MedicalSign', {}),
+    'Volcano': ('Landform', {}),
+    'VoteAction': ('ChooseAction', {
+        'candidate': ('candidate', 'http://schema.org/candidate', ('Person',)),
+    }),
+    'WPAdBlock': ('WebPageElement', {}),
+    'WPFooter': ('WebPageElement', {}),
+    'WPHeader': ('WebPageElement', {}),
+    'WPSideBar': ('WebPageElement', {}),
+    'WantAction': ('ReactAction', {}),
+    'WarrantyPromise': ('StructuredValue', {
+        'durationOfWarranty': ('durationOfWarranty', 'http://schema.org/durationOfWarranty', ('QuantitativeValue',)),
+        'warrantyScope': ('warrantyScope', 'http://schema.org/warrantyScope', ('WarrantyScope',)),
+    }),
+    'WarrantyScope': ('Enumeration', {}),
+    'WatchAction': ('ConsumeAction', {}),
+    'Waterfall': ('BodyOfWater', {}),
+    'WearAction': ('UseAction', {}),
+    'WebAPI': ('Service', {
+        'documentation': ('documentation', 'http://schema.org/documentation', ('URL', 'CreativeWork')),
+    }),
+    'WebApplication': ('SoftwareApplication', {
+        'browserRequirements': ('browserRequirements', 'http://schema.org/browserRequirements', ('Text',)),
+    }),
+    'WebContent': ('CreativeWork', {}),
+    'WebPage': ('CreativeWork', {
+        'mainContentOfPage': ('mainContentOfPage', 'http://schema.org/mainContentOfPage', ('WebPageElement',)),
+        'specialty': ('specialty', 'http://schema.org/specialty', ('Specialty',)),
+        'significantLink': ('significantLink', 'http://schema.org/significantLink', ('URL',)),
+        'relatedLink': ('relatedLink', 'http://schema.org/relatedLink', ('URL',)),
+        'primaryImageOfPage': ('primaryImageOfPage', 'http://schema.org/primaryImageOfPage', ('ImageObject',)),
+        'significantLinks': ('significantLinks', 'http://schema.org/significantLinks', ('URL',)),
+        'breadcrumb': ('breadcrumb', 'http://schema.org/breadcrumb', ('Text', 'BreadcrumbList')),
+        'reviewedBy': ('reviewedBy', 'http://schema.org/reviewedBy', ('Organization', 'Person')),
+        'speakable': ('speakable', 'http://schema.org/speakable', ('URL', 'SpeakableSpecification')),
+        'lastReviewed': ('lastReviewed', 'http://schema.org/lastReviewed', ('Date',)),
+    }),
+    'WebPageElement': ('CreativeWork', {
+        'xpath': ('xpath', 'http://schema.org/xpath', ('Text',)),
+        'cssSelector': ('cssSelector', 'http://schema.org/cssSelector', ('Text',)),
+    }),
+    'WebSite': ('CreativeWork', {
+        'issn': ('issn', 'http://schema.org/issn', ('Text',)),
+    }),
+    'WholesaleStore': ('Store', {}),
+    'WinAction': ('AchieveAction', {
+        'loser': ('loser', 'http://schema.org/loser', ('Person',)),
+    }),
+    'Winery': ('FoodEstablishment', {}),
+    'WorkBasedProgram': ('EducationalOccupationalProgram', {
+        'occupationalCategory': ('occupationalCategory', 'http://schema.org/occupationalCategory', ('Text', 'CategoryCode')),
+        'trainingSalary': ('trainingSalary', 'http://schema.org/trainingSalary', ('MonetaryAmountDistribution',)),
+    }),
+    'WorkersUnion': ('Organization', {}),
+    'WriteAction': ('CreateAction', {
+        'language': ('language', 'http://schema.org/language', ('Language',)),
+        'inLanguage': ('inLanguage', 'http://schema.org/inLanguage', ('Text', 'Language')),
+    }),
+    'XPathType': (None, {}),
+    'Zoo': ('CivicStructure', {}),
+}
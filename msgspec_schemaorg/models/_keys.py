@@ -0,0 +1,1515 @@
+"""Short keys of the Schema.org properties.
+
+Maps every property name to the key it is encoded under by the short key
+variants of the models. Regenerating the models keeps the assigned keys.
+"""
+
+KEYS = {
+    'about': '0',
+    'abridged': '1',
+    'abstract': '2',
+    'accelerationTime': '3',
+    'acceptedAnswer': '4',
+    'acceptedOffer': '5',
+    'acceptedPaymentMethod': '6',
+    'acceptsReservations': '7',
+    'accessCode': '8',
+    'accessMode': '9',
+    'accessModeSufficient': 'a',
+    'accessibilityAPI': 'b',
+    'accessibilityControl': 'c',
+    'accessibilityFeature': 'd',
+    'accessibilityHazard': 'e',
+    'accessibilitySummary': 'f',
+    'accommodationCategory': 'g',
+    'accommodationFloorPlan': 'h',
+    'accountId': 'i',
+    'accountMinimumInflow': 'j',
+    'accountOverdraftLimit': 'k',
+    'accountablePerson': 'l',
+    'acquireLicensePage': 'm',
+    'acquiredFrom': 'n',
+    'acrissCode': 'o',
+    'actionAccessibilityRequirement': 'p',
+    'actionApplication': 'q',
+    'actionOption': 'r',
+    'actionPlatform': 's',
+    'actionProcess': 't',
+    'actionStatus': 'u',
+    'actionableFeedbackPolicy': 'v',
+    'activeIngredient': 'w',
+    'activityDuration': 'x',
+    'activityFrequency': 'y',
+    'actor': 'z',
+    'actors': 'A',
+    'addOn': 'B',
+    'additionalName': 'C',
+    'additionalNumberOfGuests': 'D',
+    'additionalProperty': 'E',
+    'additionalType': 'F',
+    'additionalVariable': 'G',
+    'address': 'H',
+    'addressCountry': 'I',
+    'addressLocality': 'J',
+    'addressRegion': 'K',
+    'administrationRoute': 'L',
+    'advanceBookingRequirement': 'M',
+    'adverseOutcome': 'N',
+    'affectedBy': 'O',
+    'affiliation': 'P',
+    'afterMedia': 'Q',
+    'agent': 'R',
+    'agentInteractionStatistic': 'S',
+    'aggregateElement': 'T',
+    'aggregateRating': 'U',
+    'aircraft': 'V',
+    'album': 'W',
+    'albumProductionType': 'X',
+    'albumRelease': 'Y',
+    'albumReleaseType': 'Z',
+    'albums': '00',
+    'alcoholWarning': '01',
+    'algorithm': '02',
+    'alignmentType': '03',
+    'alternateName': '04',
+    'alternativeHeadline': '05',
+    'alternativeOf': '06',
+    'alumni': '07',
+    'alumniOf': '08',
+    'amenityFeature': '09',
+    'amount': '0a',
+    'amountOfThisGood': '0b',
+    'announcementLocation': '0c',
+    'annualPercentageRate': '0d',
+    'answerCount': '0e',
+    'answerExplanation': '0f',
+    'antagonist': '0g',
+    'appearance': '0h',
+    'applicableCountry': '0i',
+    'applicableLocation': '0j',
+    'applicantLocationRequirements': '0k',
+    'application': '0l',
+    'applicationCategory': '0m',
+    'applicationContact': '0n',
+    'applicationDeadline': '0o',
+    'applicationStartDate': '0p',
+    'applicationSubCategory': '0q',
+    'applicationSuite': '0r',
+    'appliesToDeliveryMethod': '0s',
+    'appliesToPaymentMethod': '0t',
+    'archiveHeld': '0u',
+    'archivedAt': '0v',
+    'area': '0w',
+    'areaServed': '0x',
+    'arrivalAirport': '0y',
+    'arrivalBoatTerminal': '0z',
+    'arrivalBusStop': '0A',
+    'arrivalGate': '0B',
+    'arrivalPlatform': '0C',
+    'arrivalStation': '0D',
+    'arrivalTerminal': '0E',
+    'arrivalTime': '0F',
+    'artEdition': '0G',
+    'artMedium': '0H',
+    'arterialBranch': '0I',
+    'artform': '0J',
+    'articleBody': '0K',
+    'articleSection': '0L',
+    'artist': '0M',
+    'artworkSurface': '0N',
+    'asin': '0O',
+    'aspect': '0P',
+    'assembly': '0Q',
+    'assemblyVersion': '0R',
+    'assesses': '0S',
+    'associatedAnatomy': '0T',
+    'associatedArticle': '0U',
+    'associatedClaimReview': '0V',
+    'associatedDisease': '0W',
+    'associatedMedia': '0X',
+    'associatedMediaReview': '0Y',
+    'associatedPathophysiology': '0Z',
+    'associatedReview': '10',
+    'athlete': '11',
+    'attendee': '12',
+    'attendees': '13',
+    'audience': '14',
+    'audienceType': '15',
+    'audio': '16',
+    'auditDate': '17',
+    'authenticator': '18',
+    'author': '19',
+    'availability': '1a',
+    'availabilityEnds': '1b',
+    'availabilityStarts': '1c',
+    'availableAtOrFrom': '1d',
+    'availableChannel': '1e',
+    'availableDeliveryMethod': '1f',
+    'availableFrom': '1g',
+    'availableIn': '1h',
+    'availableLanguage': '1i',
+    'availableOnDevice': '1j',
+    'availableService': '1k',
+    'availableStrength': '1l',
+    'availableTest': '1m',
+    'availableThrough': '1n',
+    'award': '1o',
+    'awards': '1p',
+    'awayTeam': '1q',
+    'backstory': '1r',
+    'bankAccountType': '1s',
+    'baseSalary': '1t',
+    'bccRecipient': '1u',
+    'bed': '1v',
+    'beforeMedia': '1w',
+    'beneficiaryBank': '1x',
+    'benefits': '1y',
+    'benefitsSummaryUrl': '1z',
+    'bestRating': '1A',
+    'billingAddress': '1B',
+    'billingDuration': '1C',
+    'billingIncrement': '1D',
+    'billingPeriod': '1E',
+    'billingStart': '1F',
+    'bioChemInteraction': '1G',
+    'bioChemSimilarity': '1H',
+    'biologicalRole': '1I',
+    'biomechnicalClass': '1J',
+    'birthDate': '1K',
+    'birthPlace': '1L',
+    'bitrate': '1M',
+    'blogPost': '1N',
+    'blogPosts': '1O',
+    'bloodSupply': '1P',
+    'boardingGroup': '1Q',
+    'boardingPolicy': '1R',
+    'bodyLocation': '1S',
+    'bodyType': '1T',
+    'bookEdition': '1U',
+    'bookFormat': '1V',
+    'bookingAgent': '1W',
+    'bookingTime': '1X',
+    'borrower': '1Y',
+    'box': '1Z',
+    'branch': '20',
+    'branchCode': '21',
+    'branchOf': '22',
+    'brand': '23',
+    'breadcrumb': '24',
+    'breastfeedingWarning': '25',
+    'broadcastAffiliateOf': '26',
+    'broadcastChannelId': '27',
+    'broadcastDisplayName': '28',
+    'broadcastFrequency': '29',
+    'broadcastFrequencyValue': '2a',
+    'broadcastOfEvent': '2b',
+    'broadcastServiceTier': '2c',
+    'broadcastSignalModulation': '2d',
+    'broadcastSubChannel': '2e',
+    'broadcastTimezone': '2f',
+    'broadcaster': '2g',
+    'broker': '2h',
+    'browserRequirements': '2i',
+    'busName': '2j',
+    'busNumber': '2k',
+    'businessDays': '2l',
+    'businessFunction': '2m',
+    'buyer': '2n',
+    'byArtist': '2o',
+    'byDay': '2p',
+    'byMonth': '2q',
+    'byMonthDay': '2r',
+    'byMonthWeek': '2s',
+    'callSign': '2t',
+    'calories': '2u',
+    'candidate': '2v',
+    'caption': '2w',
+    'carbohydrateContent': '2x',
+    'cargoVolume': '2y',
+    'carrier': '2z',
+    'carrierRequirements': '2A',
+    'cashBack': '2B',
+    'catalog': '2C',
+    'catalogNumber': '2D',
+    'category': '2E',
+    'causeOf': '2F',
+    'ccRecipient': '2G',
+    'certificationIdentification': '2H',
+    'certificationRating': '2I',
+    'certificationStatus': '2J',
+    'character': '2K',
+    'characterAttribute': '2L',
+    'characterName': '2M',
+    'cheatCode': '2N',
+    'checkinTime': '2O',
+    'checkoutPageURLTemplate': '2P',
+    'checkoutTime': '2Q',
+    'chemicalComposition': '2R',
+    'chemicalRole': '2S',
+    'childMaxAge': '2T',
+    'childMinAge': '2U',
+    'childTaxon': '2V',
+    'children': '2W',
+    'cholesterolContent': '2X',
+    'circle': '2Y',
+    'citation': '2Z',
+    'claimInterpreter': '30',
+    'claimReviewed': '31',
+    'clincalPharmacology': '32',
+    'clinicalPharmacology': '33',
+    'clipNumber': '34',
+    'closes': '35',
+    'coach': '36',
+    'code': '37',
+    'codeRepository': '38',
+    'codeSampleType': '39',
+    'codeValue': '3a',
+    'codingSystem': '3b',
+    'colleague': '3c',
+    'colleagues': '3d',
+    'collection': '3e',
+    'collectionSize': '3f',
+    'color': '3g',
+    'colorSwatch': '3h',
+    'colorist': '3i',
+    'comment': '3j',
+    'commentCount': '3k',
+    'commentText': '3l',
+    'commentTime': '3m',
+    'companyRegistration': '3n',
+    'competencyRequired': '3o',
+    'competitor': '3p',
+    'composer': '3q',
+    'comprisedOf': '3r',
+    'conditionsOfAccess': '3s',
+    'confirmationNumber': '3t',
+    'connectedTo': '3u',
+    'constraintProperty': '3v',
+    'contactOption': '3w',
+    'contactPoint': '3x',
+    'contactPoints': '3y',
+    'contactType': '3z',
+    'contactlessPayment': '3A',
+    'containedIn': '3B',
+    'containedInPlace': '3C',
+    'containsPlace': '3D',
+    'containsSeason': '3E',
+    'contentLocation': '3F',
+    'contentRating': '3G',
+    'contentReferenceTime': '3H',
+    'contentSize': '3I',
+    'contentType': '3J',
+    'contentUrl': '3K',
+    'contraindication': '3L',
+    'contributor': '3M',
+    'cookTime': '3N',
+    'cookingMethod': '3O',
+    'copyrightHolder': '3P',
+    'copyrightNotice': '3Q',
+    'copyrightYear': '3R',
+    'correction': '3S',
+    'correctionsPolicy': '3T',
+    'costCategory': '3U',
+    'costCurrency': '3V',
+    'costOrigin': '3W',
+    'costPerUnit': '3X',
+    'countriesNotSupported': '3Y',
+    'countriesSupported': '3Z',
+    'countryOfAssembly': '40',
+    'countryOfLastProcessing': '41',
+    'countryOfOrigin': '42',
+    'course': '43',
+    'courseCode': '44',
+    'courseMode': '45',
+    'coursePrerequisites': '46',
+    'courseSchedule': '47',
+    'courseWorkload': '48',
+    'coverageEndTime': '49',
+    'coverageStartTime': '4a',
+    'creativeWorkStatus': '4b',
+    'creator': '4c',
+    'credentialCategory': '4d',
+    'creditText': '4e',
+    'creditedTo': '4f',
+    'cssSelector': '4g',
+    'currenciesAccepted': '4h',
+    'currency': '4i',
+    'currentExchangeRate': '4j',
+    'customer': '4k',
+    'customerRemorseReturnFees': '4l',
+    'customerRemorseReturnLabelSource': '4m',
+    'customerRemorseReturnShippingFeesAmount': '4n',
+    'cutoffTime': '4o',
+    'cvdCollectionDate': '4p',
+    'cvdFacilityCounty': '4q',
+    'cvdFacilityId': '4r',
+    'cvdNumBeds': '4s',
+    'cvdNumBedsOcc': '4t',
+    'cvdNumC19Died': '4u',
+    'cvdNumC19HOPats': '4v',
+    'cvdNumC19HospPats': '4w',
+    'cvdNumC19MechVentPats': '4x',
+    'cvdNumC19OFMechVentPats': '4y',
+    'cvdNumC19OverflowPats': '4z',
+    'cvdNumICUBeds': '4A',
+    'cvdNumICUBedsOcc': '4B',
+    'cvdNumTotBeds': '4C',
+    'cvdNumVent': '4D',
+    'cvdNumVentUse': '4E',
+    'dataFeedElement': '4F',
+    'dataset': '4G',
+    'datasetTimeInterval': '4H',
+    'dateCreated': '4I',
+    'dateDeleted': '4J',
+    'dateIssued': '4K',
+    'dateModified': '4L',
+    'datePosted': '4M',
+    'datePublished': '4N',
+    'dateRead': '4O',
+    'dateReceived': '4P',
+    'dateSent': '4Q',
+    'dateVehicleFirstRegistered': '4R',
+    'dateline': '4S',
+    'dayOfWeek': '4T',
+    'deathDate': '4U',
+    'deathPlace': '4V',
+    'defaultValue': '4W',
+    'deliveryAddress': '4X',
+    'deliveryLeadTime': '4Y',
+    'deliveryMethod': '4Z',
+    'deliveryStatus': '50',
+    'deliveryTime': '51',
+    'department': '52',
+    'departureAirport': '53',
+    'departureBoatTerminal': '54',
+    'departureBusStop': '55',
+    'departureGate': '56',
+    'departurePlatform': '57',
+    'departureStation': '58',
+    'departureTerminal': '59',
+    'departureTime': '5a',
+    'dependencies': '5b',
+    'depth': '5c',
+    'description': '5d',
+    'device': '5e',
+    'diagnosis': '5f',
+    'diagram': '5g',
+    'diet': '5h',
+    'dietFeatures': '5i',
+    'differentialDiagnosis': '5j',
+    'digitalSourceType': '5k',
+    'directApply': '5l',
+    'director': '5m',
+    'directors': '5n',
+    'disambiguatingDescription': '5o',
+    'discount': '5p',
+    'discountCode': '5q',
+    'discountCurrency': '5r',
+    'discusses': '5s',
+    'discussionUrl': '5t',
+    'diseasePreventionInfo': '5u',
+    'diseaseSpreadStatistics': '5v',
+    'dissolutionDate': '5w',
+    'distance': '5x',
+    'distinguishingSign': '5y',
+    'distribution': '5z',
+    'diversityPolicy': '5A',
+    'diversityStaffingReport': '5B',
+    'documentation': '5C',
+    'doesNotShip': '5D',
+    'domainIncludes': '5E',
+    'domiciledMortgage': '5F',
+    'doorTime': '5G',
+    'dosageForm': '5H',
+    'doseSchedule': '5I',
+    'doseUnit': '5J',
+    'doseValue': '5K',
+    'downPayment': '5L',
+    'downloadUrl': '5M',
+    'downvoteCount': '5N',
+    'drainsTo': '5O',
+    'driveWheelConfiguration': '5P',
+    'dropoffLocation': '5Q',
+    'dropoffTime': '5R',
+    'drug': '5S',
+    'drugClass': '5T',
+    'drugUnit': '5U',
+    'duns': '5V',
+    'duplicateTherapy': '5W',
+    'duration': '5X',
+    'durationOfWarranty': '5Y',
+    'duringMedia': '5Z',
+    'earlyPrepaymentPenalty': '60',
+    'editEIDR': '61',
+    'editor': '62',
+    'eduQuestionType': '63',
+    'educationRequirements': '64',
+    'educationalAlignment': '65',
+    'educationalCredentialAwarded': '66',
+    'educationalFramework': '67',
+    'educationalLevel': '68',
+    'educationalProgramMode': '69',
+    'educationalRole': '6a',
+    'educationalUse': '6b',
+    'elevation': '6c',
+    'eligibilityToWorkRequirement': '6d',
+    'eligibleCustomerType': '6e',
+    'eligibleDuration': '6f',
+    'eligibleQuantity': '6g',
+    'eligibleRegion': '6h',
+    'eligibleTransactionVolume': '6i',
+    'eligibleWithSupplier': '6j',
+    'email': '6k',
+    'embedUrl': '6l',
+    'embeddedTextCaption': '6m',
+    'emissionsCO2': '6n',
+    'employee': '6o',
+    'employees': '6p',
+    'employerOverview': '6q',
+    'employmentType': '6r',
+    'employmentUnit': '6s',
+    'encodesBioChemEntity': '6t',
+    'encodesCreativeWork': '6u',
+    'encoding': '6v',
+    'encodingFormat': '6w',
+    'encodingType': '6x',
+    'encodings': '6y',
+    'endDate': '6z',
+    'endOffset': '6A',
+    'endTime': '6B',
+    'endorsee': '6C',
+    'endorsers': '6D',
+    'energyEfficiencyScaleMax': '6E',
+    'energyEfficiencyScaleMin': '6F',
+    'engineDisplacement': '6G',
+    'enginePower': '6H',
+    'engineType': '6I',
+    'entertainmentBusiness': '6J',
+    'epidemiology': '6K',
+    'episode': '6L',
+    'episodeNumber': '6M',
+    'episodes': '6N',
+    'equal': '6O',
+    'error': '6P',
+    'estimatedCost': '6Q',
+    'estimatedFlightDuration': '6R',
+    'estimatedSalary': '6S',
+    'estimatesRiskOf': '6T',
+    'ethicsPolicy': '6U',
+    'event': '6V',
+    'eventAttendanceMode': '6W',
+    'eventSchedule': '6X',
+    'eventStatus': '6Y',
+    'events': '6Z',
+    'evidenceLevel': '70',
+    'evidenceOrigin': '71',
+    'exampleOfWork': '72',
+    'exceptDate': '73',
+    'exchangeRateSpread': '74',
+    'executableLibraryName': '75',
+    'exerciseCourse': '76',
+    'exercisePlan': '77',
+    'exerciseRelatedDiet': '78',
+    'exerciseType': '79',
+    'exifData': '7a',
+    'expectedArrivalFrom': '7b',
+    'expectedArrivalUntil': '7c',
+    'expectedPrognosis': '7d',
+    'expectsAcceptanceOf': '7e',
+    'experienceInPlaceOfEducation': '7f',
+    'experienceRequirements': '7g',
+    'expertConsiderations': '7h',
+    'expires': '7i',
+    'expressedIn': '7j',
+    'extendedAddress': '7k',
+    'familyName': '7l',
+    'fatContent': '7m',
+    'faxNumber': '7n',
+    'featureList': '7o',
+    'feesAndCommissionsSpecification': '7p',
+    'fiberContent': '7q',
+    'fileFormat': '7r',
+    'fileSize': '7s',
+    'financialAidEligible': '7t',
+    'firstAppearance': '7u',
+    'firstPerformance': '7v',
+    'flightDistance': '7w',
+    'flightNumber': '7x',
+    'floorLevel': '7y',
+    'floorLimit': '7z',
+    'floorSize': '7A',
+    'followee': '7B',
+    'follows': '7C',
+    'followup': '7D',
+    'foodEstablishment': '7E',
+    'foodEvent': '7F',
+    'foodWarning': '7G',
+    'founder': '7H',
+    'founders': '7I',
+    'foundingDate': '7J',
+    'foundingLocation': '7K',
+    'free': '7L',
+    'freeShippingThreshold': '7M',
+    'frequency': '7N',
+    'fromLocation': '7O',
+    'fuelCapacity': '7P',
+    'fuelConsumption': '7Q',
+    'fuelEfficiency': '7R',
+    'fuelType': '7S',
+    'fulfillmentType': '7T',
+    'functionalClass': '7U',
+    'fundedItem': '7V',
+    'funder': '7W',
+    'funding': '7X',
+    'game': '7Y',
+    'gameAvailabilityType': '7Z',
+    'gameEdition': '80',
+    'gameItem': '81',
+    'gameLocation': '82',
+    'gamePlatform': '83',
+    'gameServer': '84',
+    'gameTip': '85',
+    'gender': '86',
+    'genre': '87',
+    'geo': '88',
+    'geoContains': '89',
+    'geoCoveredBy': '8a',
+    'geoCovers': '8b',
+    'geoCrosses': '8c',
+    'geoDisjoint': '8d',
+    'geoEquals': '8e',
+    'geoIntersects': '8f',
+    'geoMidpoint': '8g',
+    'geoOverlaps': '8h',
+    'geoRadius': '8i',
+    'geoTouches': '8j',
+    'geoWithin': '8k',
+    'geographicArea': '8l',
+    'gettingTestedInfo': '8m',
+    'givenName': '8n',
+    'globalLocationNumber': '8o',
+    'governmentBenefitsInfo': '8p',
+    'gracePeriod': '8q',
+    'grantee': '8r',
+    'greater': '8s',
+    'greaterOrEqual': '8t',
+    'gtin': '8u',
+    'gtin12': '8v',
+    'gtin13': '8w',
+    'gtin14': '8x',
+    'gtin8': '8y',
+    'guideline': '8z',
+    'guidelineDate': '8A',
+    'guidelineSubject': '8B',
+    'handlingTime': '8C',
+    'hasAdultConsideration': '8D',
+    'hasBioChemEntityPart': '8E',
+    'hasBioPolymerSequence': '8F',
+    'hasBroadcastChannel': '8G',
+    'hasCategoryCode': '8H',
+    'hasCertification': '8I',
+    'hasCourse': '8J',
+    'hasCourseInstance': '8K',
+    'hasCredential': '8L',
+    'hasDefinedTerm': '8M',
+    'hasDeliveryMethod': '8N',
+    'hasDigitalDocumentPermission': '8O',
+    'hasDriveThroughService': '8P',
+    'hasEnergyConsumptionDetails': '8Q',
+    'hasEnergyEfficiencyCategory': '8R',
+    'hasGS1DigitalLink': '8S',
+    'hasHealthAspect': '8T',
+    'hasMap': '8U',
+    'hasMeasurement': '8V',
+    'hasMemberProgram': '8W',
+    'hasMenu': '8X',
+    'hasMenuItem': '8Y',
+    'hasMenuSection': '8Z',
+    'hasMerchantReturnPolicy': '90',
+    'hasMolecularFunction': '91',
+    'hasOccupation': '92',
+    'hasOfferCatalog': '93',
+    'hasPOS': '94',
+    'hasPart': '95',
+    'hasRepresentation': '96',
+    'hasShippingService': '97',
+    'hasTierBenefit': '98',
+    'hasTierRequirement': '99',
+    'hasTiers': '9a',
+    'hasVariant': '9b',
+    'headline': '9c',
+    'healthCondition': '9d',
+    'healthPlanCoinsuranceOption': '9e',
+    'healthPlanCoinsuranceRate': '9f',
+    'healthPlanCopay': '9g',
+    'healthPlanCopayOption': '9h',
+    'healthPlanCostSharing': '9i',
+    'healthPlanDrugOption': '9j',
+    'healthPlanDrugTier': '9k',
+    'healthPlanId': '9l',
+    'healthPlanMarketingUrl': '9m',
+    'healthPlanNetworkId': '9n',
+    'healthPlanNetworkTier': '9o',
+    'healthPlanPharmacyCategory': '9p',
+    'healthcareReportingData': '9q',
+    'height': '9r',
+    'highPrice': '9s',
+    'hiringOrganization': '9t',
+    'holdingArchive': '9u',
+    'homeLocation': '9v',
+    'homeTeam': '9w',
+    'honorificPrefix': '9x',
+    'honorificSuffix': '9y',
+    'hospitalAffiliation': '9z',
+    'hostingOrganization': '9A',
+    'hoursAvailable': '9B',
+    'howPerformed': '9C',
+    'httpMethod': '9D',
+    'iataCode': '9E',
+    'icaoCode': '9F',
+    'identifier': '9G',
+    'identifyingExam': '9H',
+    'identifyingTest': '9I',
+    'illustrator': '9J',
+    'image': '9K',
+    'imagingTechnique': '9L',
+    'inAlbum': '9M',
+    'inBroadcastLineup': '9N',
+    'inChI': '9O',
+    'inChIKey': '9P',
+    'inCodeSet': '9Q',
+    'inDefinedTermSet': '9R',
+    'inLanguage': '9S',
+    'inPlaylist': '9T',
+    'inProductGroupWithID': '9U',
+    'inStoreReturnsOffered': '9V',
+    'inSupportOf': '9W',
+    'incentiveAmount': '9X',
+    'incentiveCompensation': '9Y',
+    'incentiveStatus': '9Z',
+    'incentiveType': 'a0',
+    'incentives': 'a1',
+    'incentivizedItem': 'a2',
+    'includedComposition': 'a3',
+    'includedDataCatalog': 'a4',
+    'includedInDataCatalog': 'a5',
+    'includedInHealthInsurancePlan': 'a6',
+    'includedRiskFactor': 'a7',
+    'includesAttraction': 'a8',
+    'includesHealthPlanFormulary': 'a9',
+    'includesHealthPlanNetwork': 'aa',
+    'includesObject': 'ab',
+    'incomeLimit': 'ac',
+    'increasesRiskOf': 'ad',
+    'industry': 'ae',
+    'ineligibleRegion': 'af',
+    'infectiousAgent': 'ag',
+    'infectiousAgentClass': 'ah',
+    'ingredients': 'ai',
+    'inker': 'aj',
+    'insertion': 'ak',
+    'installUrl': 'al',
+    'instructor': 'am',
+    'instrument': 'an',
+    'intensity': 'ao',
+    'interactingDrug': 'ap',
+    'interactionService': 'aq',
+    'interactionStatistic': 'ar',
+    'interactionType': 'as',
+    'interactivityType': 'at',
+    'interestRate': 'au',
+    'interpretedAsClaim': 'av',
+    'inventoryLevel': 'aw',
+    'inverseOf': 'ax',
+    'isAcceptingNewPatients': 'ay',
+    'isAccessibleForFree': 'az',
+    'isAccessoryOrSparePartFor': 'aA',
+    'isAvailableGenerically': 'aB',
+    'isBasedOn': 'aC',
+    'isBasedOnUrl': 'aD',
+    'isConsumableFor': 'aE',
+    'isEncodedByBioChemEntity': 'aF',
+    'isFamilyFriendly': 'aG',
+    'isGift': 'aH',
+    'isInvolvedInBiologicalProcess': 'aI',
+    'isLiveBroadcast': 'aJ',
+    'isLocatedInSubcellularLocation': 'aK',
+    'isPartOf': 'aL',
+    'isPartOfBioChemEntity': 'aM',
+    'isPlanForApartment': 'aN',
+    'isProprietary': 'aO',
+    'isRelatedTo': 'aP',
+    'isResizable': 'aQ',
+    'isSimilarTo': 'aR',
+    'isTierOf': 'aS',
+    'isUnlabelledFallback': 'aT',
+    'isVariantOf': 'aU',
+    'isbn': 'aV',
+    'isicV4': 'aW',
+    'iso6523Code': 'aX',
+    'isrcCode': 'aY',
+    'issn': 'aZ',
+    'issueNumber': 'b0',
+    'issuedBy': 'b1',
+    'issuedThrough': 'b2',
+    'iswcCode': 'b3',
+    'item': 'b4',
+    'itemCondition': 'b5',
+    'itemDefectReturnFees': 'b6',
+    'itemDefectReturnLabelSource': 'b7',
+    'itemDefectReturnShippingFeesAmount': 'b8',
+    'itemListElement': 'b9',
+    'itemListOrder': 'ba',
+    'itemLocation': 'bb',
+    'itemOffered': 'bc',
+    'itemReviewed': 'bd',
+    'itemShipped': 'be',
+    'itinerary': 'bf',
+    'iupacName': 'bg',
+    'jobBenefits': 'bh',
+    'jobImmediateStart': 'bi',
+    'jobLocation': 'bj',
+    'jobLocationType': 'bk',
+    'jobStartDate': 'bl',
+    'jobTitle': 'bm',
+    'jurisdiction': 'bn',
+    'keywords': 'bo',
+    'knownVehicleDamages': 'bp',
+    'knows': 'bq',
+    'knowsAbout': 'br',
+    'knowsLanguage': 'bs',
+    'labelDetails': 'bt',
+    'landlord': 'bu',
+    'language': 'bv',
+    'lastReviewed': 'bw',
+    'latitude': 'bx',
+    'layoutImage': 'by',
+    'learningResourceType': 'bz',
+    'leaseLength': 'bA',
+    'legalAddress': 'bB',
+    'legalName': 'bC',
+    'legalRepresentative': 'bD',
+    'legalStatus': 'bE',
+    'legislationAmends': 'bF',
+    'legislationApplies': 'bG',
+    'legislationChanges': 'bH',
+    'legislationCommences': 'bI',
+    'legislationConsolidates': 'bJ',
+    'legislationCorrects': 'bK',
+    'legislationCountersignedBy': 'bL',
+    'legislationDate': 'bM',
+    'legislationDateOfApplicability': 'bN',
+    'legislationDateVersion': 'bO',
+    'legislationEnsuresImplementationOf': 'bP',
+    'legislationIdentifier': 'bQ',
+    'legislationJurisdiction': 'bR',
+    'legislationLegalForce': 'bS',
+    'legislationLegalValue': 'bT',
+    'legislationPassedBy': 'bU',
+    'legislationRepeals': 'bV',
+    'legislationResponsible': 'bW',
+    'legislationTransposes': 'bX',
+    'legislationType': 'bY',
+    'leiCode': 'bZ',
+    'lender': 'c0',
+    'lesser': 'c1',
+    'lesserOrEqual': 'c2',
+    'letterer': 'c3',
+    'license': 'c4',
+    'line': 'c5',
+    'linkRelationship': 'c6',
+    'liveBlogUpdate': 'c7',
+    'loanMortgageMandateAmount': 'c8',
+    'loanPaymentAmount': 'c9',
+    'loanPaymentFrequency': 'ca',
+    'loanRepaymentForm': 'cb',
+    'loanTerm': 'cc',
+    'loanType': 'cd',
+    'location': 'ce',
+    'locationCreated': 'cf',
+    'lodgingUnitDescription': 'cg',
+    'lodgingUnitType': 'ch',
+    'logo': 'ci',
+    'longitude': 'cj',
+    'loser': 'ck',
+    'lowPrice': 'cl',
+    'lyricist': 'cm',
+    'lyrics': 'cn',
+    'mainContentOfPage': 'co',
+    'mainEntity': 'cp',
+    'mainEntityOfPage': 'cq',
+    'maintainer': 'cr',
+    'makesOffer': 'cs',
+    'manufacturer': 'ct',
+    'map': 'cu',
+    'mapType': 'cv',
+    'maps': 'cw',
+    'marginOfError': 'cx',
+    'masthead': 'cy',
+    'material': 'cz',
+    'materialExtent': 'cA',
+    'mathExpression': 'cB',
+    'maxPrice': 'cC',
+    'maxValue': 'cD',
+    'maximumAttendeeCapacity': 'cE',
+    'maximumEnrollment': 'cF',
+    'maximumIntake': 'cG',
+    'maximumPhysicalAttendeeCapacity': 'cH',
+    'maximumVirtualAttendeeCapacity': 'cI',
+    'mealService': 'cJ',
+    'measuredProperty': 'cK',
+    'measurementDenominator': 'cL',
+    'measurementMethod': 'cM',
+    'measurementQualifier': 'cN',
+    'measurementTechnique': 'cO',
+    'mechanismOfAction': 'cP',
+    'mediaAuthenticityCategory': 'cQ',
+    'mediaItemAppearance': 'cR',
+    'median': 'cS',
+    'medicalAudience': 'cT',
+    'medicalSpecialty': 'cU',
+    'medicineSystem': 'cV',
+    'meetsEmissionStandard': 'cW',
+    'member': 'cX',
+    'memberOf': 'cY',
+    'members': 'cZ',
+    'membershipNumber': 'd0',
+    'membershipPointsEarned': 'd1',
+    'memoryRequirements': 'd2',
+    'mentions': 'd3',
+    'menu': 'd4',
+    'menuAddOn': 'd5',
+    'merchant': 'd6',
+    'merchantReturnDays': 'd7',
+    'merchantReturnLink': 'd8',
+    'messageAttachment': 'd9',
+    'mileageFromOdometer': 'da',
+    'minPrice': 'db',
+    'minValue': 'dc',
+    'minimumPaymentDue': 'dd',
+    'missionCoveragePrioritiesPolicy': 'de',
+    'mobileUrl': 'df',
+    'model': 'dg',
+    'modelDate': 'dh',
+    'modifiedTime': 'di',
+    'molecularFormula': 'dj',
+    'molecularWeight': 'dk',
+    'monoisotopicMolecularWeight': 'dl',
+    'monthlyMinimumRepaymentAmount': 'dm',
+    'monthsOfExperience': 'dn',
+    'mpn': 'do',
+    'multipleValues': 'dp',
+    'muscleAction': 'dq',
+    'musicArrangement': 'dr',
+    'musicBy': 'ds',
+    'musicCompositionForm': 'dt',
+    'musicGroupMember': 'du',
+    'musicReleaseFormat': 'dv',
+    'musicalKey': 'dw',
+    'naics': 'dx',
+    'name': 'dy',
+    'namedPosition': 'dz',
+    'nationality': 'dA',
+    'naturalProgression': 'dB',
+    'negativeNotes': 'dC',
+    'nerve': 'dD',
+    'nerveMotor': 'dE',
+    'netWorth': 'dF',
+    'newsUpdatesAndGuidelines': 'dG',
+    'nextItem': 'dH',
+    'noBylinesPolicy': 'dI',
+    'nonEqual': 'dJ',
+    'nonProprietaryName': 'dK',
+    'nonprofitStatus': 'dL',
+    'normalRange': 'dM',
+    'nsn': 'dN',
+    'numAdults': 'dO',
+    'numChildren': 'dP',
+    'numConstraints': 'dQ',
+    'numItems': 'dR',
+    'numTracks': 'dS',
+    'numberOfAccommodationUnits': 'dT',
+    'numberOfAirbags': 'dU',
+    'numberOfAvailableAccommodationUnits': 'dV',
+    'numberOfAxles': 'dW',
+    'numberOfBathroomsTotal': 'dX',
+    'numberOfBedrooms': 'dY',
+    'numberOfBeds': 'dZ',
+    'numberOfCredits': 'e0',
+    'numberOfDoors': 'e1',
+    'numberOfEmployees': 'e2',
+    'numberOfEpisodes': 'e3',
+    'numberOfForwardGears': 'e4',
+    'numberOfFullBathrooms': 'e5',
+    'numberOfItems': 'e6',
+    'numberOfLoanPayments': 'e7',
+    'numberOfPages': 'e8',
+    'numberOfPartialBathrooms': 'e9',
+    'numberOfPlayers': 'ea',
+    'numberOfPreviousOwners': 'eb',
+    'numberOfRooms': 'ec',
+    'numberOfSeasons': 'ed',
+    'numberedPosition': 'ee',
+    'nutrition': 'ef',
+    'object': 'eg',
+    'observationAbout': 'eh',
+    'observationDate': 'ei',
+    'observationPeriod': 'ej',
+    'occupancy': 'ek',
+    'occupationLocation': 'el',
+    'occupationalCategory': 'em',
+    'occupationalCredentialAwarded': 'en',
+    'offerCount': 'eo',
+    'offeredBy': 'ep',
+    'offers': 'eq',
+    'offersPrescriptionByMail': 'er',
+    'openingHours': 'es',
+    'openingHoursSpecification': 'et',
+    'opens': 'eu',
+    'operatingSystem': 'ev',
+    'opponent': 'ew',
+    'option': 'ex',
+    'orderDate': 'ey',
+    'orderDelivery': 'ez',
+    'orderItemNumber': 'eA',
+    'orderItemStatus': 'eB',
+    'orderNumber': 'eC',
+    'orderPercentage': 'eD',
+    'orderQuantity': 'eE',
+    'orderStatus': 'eF',
+    'orderValue': 'eG',
+    'orderedItem': 'eH',
+    'organizer': 'eI',
+    'originAddress': 'eJ',
+    'originalMediaContextDescription': 'eK',
+    'originalMediaLink': 'eL',
+    'originatesFrom': 'eM',
+    'overdosage': 'eN',
+    'ownedFrom': 'eO',
+    'ownedThrough': 'eP',
+    'ownershipFundingInfo': 'eQ',
+    'owns': 'eR',
+    'pageEnd': 'eS',
+    'pageStart': 'eT',
+    'pagination': 'eU',
+    'parent': 'eV',
+    'parentItem': 'eW',
+    'parentOrganization': 'eX',
+    'parentService': 'eY',
+    'parentTaxon': 'eZ',
+    'parents': 'f0',
+    'partOfEpisode': 'f1',
+    'partOfInvoice': 'f2',
+    'partOfOrder': 'f3',
+    'partOfSeason': 'f4',
+    'partOfSeries': 'f5',
+    'partOfSystem': 'f6',
+    'partOfTVSeries': 'f7',
+    'partOfTrip': 'f8',
+    'participant': 'f9',
+    'partySize': 'fa',
+    'passengerPriorityStatus': 'fb',
+    'passengerSequenceNumber': 'fc',
+    'pathophysiology': 'fd',
+    'pattern': 'fe',
+    'payload': 'ff',
+    'paymentAccepted': 'fg',
+    'paymentDue': 'fh',
+    'paymentDueDate': 'fi',
+    'paymentMethod': 'fj',
+    'paymentMethodId': 'fk',
+    'paymentMethodType': 'fl',
+    'paymentStatus': 'fm',
+    'paymentUrl': 'fn',
+    'penciler': 'fo',
+    'percentile10': 'fp',
+    'percentile25': 'fq',
+    'percentile75': 'fr',
+    'percentile90': 'fs',
+    'performTime': 'ft',
+    'performer': 'fu',
+    'performerIn': 'fv',
+    'performers': 'fw',
+    'permissionType': 'fx',
+    'permissions': 'fy',
+    'permitAudience': 'fz',
+    'permittedUsage': 'fA',
+    'petsAllowed': 'fB',
+    'phoneticText': 'fC',
+    'photo': 'fD',
+    'photos': 'fE',
+    'physicalRequirement': 'fF',
+    'physiologicalBenefits': 'fG',
+    'pickupLocation': 'fH',
+    'pickupTime': 'fI',
+    'playMode': 'fJ',
+    'playerType': 'fK',
+    'playersOnline': 'fL',
+    'polygon': 'fM',
+    'populationType': 'fN',
+    'position': 'fO',
+    'positiveNotes': 'fP',
+    'possibleComplication': 'fQ',
+    'possibleTreatment': 'fR',
+    'postOfficeBoxNumber': 'fS',
+    'postOp': 'fT',
+    'postalCode': 'fU',
+    'postalCodeBegin': 'fV',
+    'postalCodeEnd': 'fW',
+    'postalCodePrefix': 'fX',
+    'postalCodeRange': 'fY',
+    'potentialAction': 'fZ',
+    'potentialUse': 'g0',
+    'practicesAt': 'g1',
+    'preOp': 'g2',
+    'predecessorOf': 'g3',
+    'pregnancyCategory': 'g4',
+    'pregnancyWarning': 'g5',
+    'prepTime': 'g6',
+    'preparation': 'g7',
+    'prescribingInfo': 'g8',
+    'prescriptionStatus': 'g9',
+    'previousItem': 'ga',
+    'previousStartDate': 'gb',
+    'price': 'gc',
+    'priceComponent': 'gd',
+    'priceComponentType': 'ge',
+    'priceCurrency': 'gf',
+    'priceRange': 'gg',
+    'priceSpecification': 'gh',
+    'priceType': 'gi',
+    'priceValidUntil': 'gj',
+    'primaryImageOfPage': 'gk',
+    'primaryPrevention': 'gl',
+    'printColumn': 'gm',
+    'printEdition': 'gn',
+    'printPage': 'go',
+    'printSection': 'gp',
+    'procedure': 'gq',
+    'procedureType': 'gr',
+    'processingTime': 'gs',
+    'processorRequirements': 'gt',
+    'producer': 'gu',
+    'produces': 'gv',
+    'productGroupID': 'gw',
+    'productID': 'gx',
+    'productSupported': 'gy',
+    'productionCompany': 'gz',
+    'productionDate': 'gA',
+    'proficiencyLevel': 'gB',
+    'program': 'gC',
+    'programMembershipUsed': 'gD',
+    'programName': 'gE',
+    'programPrerequisites': 'gF',
+    'programType': 'gG',
+    'programmingLanguage': 'gH',
+    'programmingModel': 'gI',
+    'pronouns': 'gJ',
+    'propertyID': 'gK',
+    'proprietaryName': 'gL',
+    'proteinContent': 'gM',
+    'provider': 'gN',
+    'providerMobility': 'gO',
+    'providesBroadcastService': 'gP',
+    'providesService': 'gQ',
+    'publicAccess': 'gR',
+    'publicTransportClosuresInfo': 'gS',
+    'publication': 'gT',
+    'publicationType': 'gU',
+    'publishedBy': 'gV',
+    'publishedOn': 'gW',
+    'publisher': 'gX',
+    'publisherImprint': 'gY',
+    'publishingPrinciples': 'gZ',
+    'purchaseDate': 'h0',
+    'purchasePriceLimit': 'h1',
+    'purchaseType': 'h2',
+    'qualifications': 'h3',
+    'qualifiedExpense': 'h4',
+    'quarantineGuidelines': 'h5',
+    'query': 'h6',
+    'quest': 'h7',
+    'question': 'h8',
+    'rangeIncludes': 'h9',
+    'ratingCount': 'ha',
+    'ratingExplanation': 'hb',
+    'ratingValue': 'hc',
+    'readBy': 'hd',
+    'readonlyValue': 'he',
+    'realEstateAgent': 'hf',
+    'recipe': 'hg',
+    'recipeCategory': 'hh',
+    'recipeCuisine': 'hi',
+    'recipeIngredient': 'hj',
+    'recipeInstructions': 'hk',
+    'recipeYield': 'hl',
+    'recipient': 'hm',
+    'recognizedBy': 'hn',
+    'recognizingAuthority': 'ho',
+    'recommendationStrength': 'hp',
+    'recommendedIntake': 'hq',
+    'recordLabel': 'hr',
+    'recordedAs': 'hs',
+    'recordedAt': 'ht',
+    'recordedIn': 'hu',
+    'recordingOf': 'hv',
+    'recourseLoan': 'hw',
+    'referee': 'hx',
+    'referenceQuantity': 'hy',
+    'referencesOrder': 'hz',
+    'refundType': 'hA',
+    'regionDrained': 'hB',
+    'regionsAllowed': 'hC',
+    'relatedAnatomy': 'hD',
+    'relatedCondition': 'hE',
+    'relatedDrug': 'hF',
+    'relatedLink': 'hG',
+    'relatedStructure': 'hH',
+    'relatedTherapy': 'hI',
+    'relatedTo': 'hJ',
+    'releaseDate': 'hK',
+    'releaseNotes': 'hL',
+    'releaseOf': 'hM',
+    'releasedEvent': 'hN',
+    'relevantOccupation': 'hO',
+    'relevantSpecialty': 'hP',
+    'remainingAttendeeCapacity': 'hQ',
+    'renegotiableLoan': 'hR',
+    'repeatCount': 'hS',
+    'repeatFrequency': 'hT',
+    'repetitions': 'hU',
+    'replacee': 'hV',
+    'replacer': 'hW',
+    'replyToUrl': 'hX',
+    'reportNumber': 'hY',
+    'representativeOfPage': 'hZ',
+    'requiredCollateral': 'i0',
+    'requiredGender': 'i1',
+    'requiredMaxAge': 'i2',
+    'requiredMinAge': 'i3',
+    'requiredQuantity': 'i4',
+    'requirements': 'i5',
+    'requiresSubscription': 'i6',
+    'reservationFor': 'i7',
+    'reservationId': 'i8',
+    'reservationStatus': 'i9',
+    'reservedTicket': 'ia',
+    'responsibilities': 'ib',
+    'restPeriods': 'ic',
+    'restockingFee': 'id',
+    'result': 'ie',
+    'resultComment': 'if',
+    'resultReview': 'ig',
+    'returnFees': 'ih',
+    'returnLabelSource': 'ii',
+    'returnMethod': 'ij',
+    'returnPolicyCategory': 'ik',
+    'returnPolicyCountry': 'il',
+    'returnPolicySeasonalOverride': 'im',
+    'returnShippingFeesAmount': 'in',
+    'review': 'io',
+    'reviewAspect': 'ip',
+    'reviewBody': 'iq',
+    'reviewCount': 'ir',
+    'reviewRating': 'is',
+    'reviewedBy': 'it',
+    'reviews': 'iu',
+    'riskFactor': 'iv',
+    'risks': 'iw',
+    'roleName': 'ix',
+    'roofLoad': 'iy',
+    'rsvpResponse': 'iz',
+    'runsTo': 'iA',
+    'runtime': 'iB',
+    'runtimePlatform': 'iC',
+    'rxcui': 'iD',
+    'safetyConsideration': 'iE',
+    'salaryCurrency': 'iF',
+    'salaryUponCompletion': 'iG',
+    'sameAs': 'iH',
+    'sampleType': 'iI',
+    'saturatedFatContent': 'iJ',
+    'scheduleTimezone': 'iK',
+    'scheduledPaymentDate': 'iL',
+    'scheduledTime': 'iM',
+    'schemaVersion': 'iN',
+    'schoolClosuresInfo': 'iO',
+    'screenCount': 'iP',
+    'screenshot': 'iQ',
+    'sdDatePublished': 'iR',
+    'sdLicense': 'iS',
+    'sdPublisher': 'iT',
+    'season': 'iU',
+    'seasonNumber': 'iV',
+    'seasonalOverride': 'iW',
+    'seasons': 'iX',
+    'seatNumber': 'iY',
+    'seatRow': 'iZ',
+    'seatSection': 'j0',
+    'seatingCapacity': 'j1',
+    'seatingType': 'j2',
+    'secondaryPrevention': 'j3',
+    'securityClearanceRequirement': 'j4',
+    'securityScreening': 'j5',
+    'seeks': 'j6',
+    'seller': 'j7',
+    'sender': 'j8',
+    'sensoryRequirement': 'j9',
+    'sensoryUnit': 'ja',
+    'serialNumber': 'jb',
+    'seriousAdverseOutcome': 'jc',
+    'serverStatus': 'jd',
+    'servesCuisine': 'je',
+    'serviceArea': 'jf',
+    'serviceAudience': 'jg',
+    'serviceLocation': 'jh',
+    'serviceOperator': 'ji',
+    'serviceOutput': 'jj',
+    'servicePhone': 'jk',
+    'servicePostalAddress': 'jl',
+    'serviceSmsNumber': 'jm',
+    'serviceType': 'jn',
+    'serviceUrl': 'jo',
+    'servingSize': 'jp',
+    'sha256': 'jq',
+    'sharedContent': 'jr',
+    'shippingConditions': 'js',
+    'shippingDestination': 'jt',
+    'shippingDetails': 'ju',
+    'shippingOrigin': 'jv',
+    'shippingRate': 'jw',
+    'sibling': 'jx',
+    'siblings': 'jy',
+    'signDetected': 'jz',
+    'signOrSymptom': 'jA',
+    'significance': 'jB',
+    'significantLink': 'jC',
+    'significantLinks': 'jD',
+    'size': 'jE',
+    'sizeGroup': 'jF',
+    'sizeSystem': 'jG',
+    'skills': 'jH',
+    'sku': 'jI',
+    'slogan': 'jJ',
+    'smiles': 'jK',
+    'smokingAllowed': 'jL',
+    'sodiumContent': 'jM',
+    'softwareAddOn': 'jN',
+    'softwareHelp': 'jO',
+    'softwareRequirements': 'jP',
+    'softwareVersion': 'jQ',
+    'sourceOrganization': 'jR',
+    'sourcedFrom': 'jS',
+    'spatial': 'jT',
+    'spatialCoverage': 'jU',
+    'speakable': 'jV',
+    'specialCommitments': 'jW',
+    'specialOpeningHoursSpecification': 'jX',
+    'specialty': 'jY',
+    'speechToTextMarkup': 'jZ',
+    'speed': 'k0',
+    'spokenByCharacter': 'k1',
+    'sponsor': 'k2',
+    'sport': 'k3',
+    'sportsActivityLocation': 'k4',
+    'sportsEvent': 'k5',
+    'sportsTeam': 'k6',
+    'spouse': 'k7',
+    'stage': 'k8',
+    'stageAsNumber': 'k9',
+    'starRating': 'ka',
+    'startDate': 'kb',
+    'startOffset': 'kc',
+    'startTime': 'kd',
+    'statType': 'ke',
+    'status': 'kf',
+    'steeringPosition': 'kg',
+    'step': 'kh',
+    'stepValue': 'ki',
+    'steps': 'kj',
+    'storageRequirements': 'kk',
+    'streetAddress': 'kl',
+    'strengthUnit': 'km',
+    'strengthValue': 'kn',
+    'structuralClass': 'ko',
+    'study': 'kp',
+    'studyDesign': 'kq',
+    'studyLocation': 'kr',
+    'studySubject': 'ks',
+    'subEvent': 'kt',
+    'subEvents': 'ku',
+    'subOrganization': 'kv',
+    'subReservation': 'kw',
+    'subStageSuffix': 'kx',
+    'subStructure': 'ky',
+    'subTest': 'kz',
+    'subTrip': 'kA',
+    'subjectOf': 'kB',
+    'subtitleLanguage': 'kC',
+    'successorOf': 'kD',
+    'sugarContent': 'kE',
+    'suggestedAge': 'kF',
+    'suggestedAnswer': 'kG',
+    'suggestedGender': 'kH',
+    'suggestedMaxAge': 'kI',
+    'suggestedMeasurement': 'kJ',
+    'suggestedMinAge': 'kK',
+    'suitableForDiet': 'kL',
+    'superEvent': 'kM',
+    'supersededBy': 'kN',
+    'supply': 'kO',
+    'supplyTo': 'kP',
+    'supportingData': 'kQ',
+    'surface': 'kR',
+    'syllabusSections': 'kS',
+    'target': 'kT',
+    'targetCollection': 'kU',
+    'targetDescription': 'kV',
+    'targetName': 'kW',
+    'targetPlatform': 'kX',
+    'targetPopulation': 'kY',
+    'targetProduct': 'kZ',
+    'targetUrl': 'l0',
+    'taxID': 'l1',
+    'taxonRank': 'l2',
+    'taxonomicRange': 'l3',
+    'teaches': 'l4',
+    'telephone': 'l5',
+    'temporal': 'l6',
+    'temporalCoverage': 'l7',
+    'termCode': 'l8',
+    'termDuration': 'l9',
+    'termsOfService': 'la',
+    'termsPerYear': 'lb',
+    'text': 'lc',
+    'textValue': 'ld',
+    'thumbnail': 'le',
+    'thumbnailUrl': 'lf',
+    'tickerSymbol': 'lg',
+    'ticketNumber': 'lh',
+    'ticketToken': 'li',
+    'ticketedSeat': 'lj',
+    'timeOfDay': 'lk',
+    'timeRequired': 'll',
+    'timeToComplete': 'lm',
+    'tissueSample': 'ln',
+    'title': 'lo',
+    'titleEIDR': 'lp',
+    'toLocation': 'lq',
+    'toRecipient': 'lr',
+    'tocContinuation': 'ls',
+    'tocEntry': 'lt',
+    'tongueWeight': 'lu',
+    'tool': 'lv',
+    'torque': 'lw',
+    'totalHistoricalEnrollment': 'lx',
+    'totalJobOpenings': 'ly',
+    'totalPaymentDue': 'lz',
+    'totalPrice': 'lA',
+    'totalTime': 'lB',
+    'tourBookingPage': 'lC',
+    'touristType': 'lD',
+    'track': 'lE',
+    'trackingNumber': 'lF',
+    'trackingUrl': 'lG',
+    'tracks': 'lH',
+    'trailer': 'lI',
+    'trailerWeight': 'lJ',
+    'trainName': 'lK',
+    'trainNumber': 'lL',
+    'trainingSalary': 'lM',
+    'transFatContent': 'lN',
+    'transcript': 'lO',
+    'transitTime': 'lP',
+    'translationOfWork': 'lQ',
+    'translator': 'lR',
+    'transmissionMethod': 'lS',
+    'travelBans': 'lT',
+    'trialDesign': 'lU',
+    'tributary': 'lV',
+    'tripOrigin': 'lW',
+    'typeOfBed': 'lX',
+    'typeOfGood': 'lY',
+    'typicalAgeRange': 'lZ',
+    'typicalCreditsPerTerm': 'm0',
+    'typicalTest': 'm1',
+    'underName': 'm2',
+    'unitCode': 'm3',
+    'unitText': 'm4',
+    'unnamedSourcesPolicy': 'm5',
+    'unsaturatedFatContent': 'm6',
+    'uploadDate': 'm7',
+    'upvoteCount': 'm8',
+    'url': 'm9',
+    'urlTemplate': 'ma',
+    'usNPI': 'mb',
+    'usageInfo': 'mc',
+    'usedToDiagnose': 'md',
+    'userInteractionCount': 'me',
+    'usesDevice': 'mf',
+    'usesHealthPlanIdStandard': 'mg',
+    'utterances': 'mh',
+    'validFor': 'mi',
+    'validForMemberTier': 'mj',
+    'validFrom': 'mk',
+    'validIn': 'ml',
+    'validThrough': 'mm',
+    'validUntil': 'mn',
+    'value': 'mo',
+    'valueAddedTaxIncluded': 'mp',
+    'valueMaxLength': 'mq',
+    'valueMinLength': 'mr',
+    'valueName': 'ms',
+    'valuePattern': 'mt',
+    'valueReference': 'mu',
+    'valueRequired': 'mv',
+    'variableMeasured': 'mw',
+    'variantCover': 'mx',
+    'variesBy': 'my',
+    'vatID': 'mz',
+    'vehicleConfiguration': 'mA',
+    'vehicleEngine': 'mB',
+    'vehicleIdentificationNumber': 'mC',
+    'vehicleInteriorColor': 'mD',
+    'vehicleInteriorType': 'mE',
+    'vehicleModelDate': 'mF',
+    'vehicleSeatingCapacity': 'mG',
+    'vehicleSpecialUsage': 'mH',
+    'vehicleTransmission': 'mI',
+    'vendor': 'mJ',
+    'verificationFactCheckingPolicy': 'mK',
+    'version': 'mL',
+    'video': 'mM',
+    'videoFormat': 'mN',
+    'videoFrameSize': 'mO',
+    'videoQuality': 'mP',
+    'volumeNumber': 'mQ',
+    'warning': 'mR',
+    'warranty': 'mS',
+    'warrantyPromise': 'mT',
+    'warrantyScope': 'mU',
+    'webCheckinTime': 'mV',
+    'webFeed': 'mW',
+    'weight': 'mX',
+    'weightPercentage': 'mY',
+    'weightTotal': 'mZ',
+    'wheelbase': 'n0',
+    'width': 'n1',
+    'winner': 'n2',
+    'wordCount': 'n3',
+    'workExample': 'n4',
+    'workFeatured': 'n5',
+    'workHours': 'n6',
+    'workLocation': 'n7',
+    'workPerformed': 'n8',
+    'workPresented': 'n9',
+    'workTranslation': 'na',
+    'workload': 'nb',
+    'worksFor': 'nc',
+    'worstRating': 'nd',
+    'xpath': 'ne',
+    'yearBuilt': 'nf',
+    'yearlyRevenue': 'ng',
+    'yearsInOperation': 'nh',
+    'yield': 'ni',
+}
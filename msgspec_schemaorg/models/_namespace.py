@@ -0,0 +1,920 @@
+"""Runtime namespace of the generated Schema.org models.
+
+Maps every class name used in a model annotation to the module defining it.
+"""
+
+MODULES = {
+    'AMRadioChannel': 'msgspec_schemaorg.models.intangible.AMRadioChannel',
+    'APIReference': 'msgspec_schemaorg.models.creativework.APIReference',
+    'AboutPage': 'msgspec_schemaorg.models.creativework.AboutPage',
+    'AcceptAction': 'msgspec_schemaorg.models.action.AcceptAction',
+    'Accommodation': 'msgspec_schemaorg.models.place.Accommodation',
+    'AccountingService': 'msgspec_schemaorg.models.organization.AccountingService',
+    'AchieveAction': 'msgspec_schemaorg.models.action.AchieveAction',
+    'Action': 'msgspec_schemaorg.models.action.Action',
+    'ActionAccessSpecification': 'msgspec_schemaorg.models.intangible.ActionAccessSpecification',
+    'ActionStatusType': 'msgspec_schemaorg.enums.intangible.ActionStatusType',
+    'ActivateAction': 'msgspec_schemaorg.models.action.ActivateAction',
+    'AddAction': 'msgspec_schemaorg.models.action.AddAction',
+    'AdministrativeArea': 'msgspec_schemaorg.models.place.AdministrativeArea',
+    'AdultEntertainment': 'msgspec_schemaorg.models.organization.AdultEntertainment',
+    'AdultOrientedEnumeration': 'msgspec_schemaorg.enums.intangible.AdultOrientedEnumeration',
+    'AdvertiserContentArticle': 'msgspec_schemaorg.models.creativework.AdvertiserContentArticle',
+    'AggregateOffer': 'msgspec_schemaorg.models.intangible.AggregateOffer',
+    'AggregateRating': 'msgspec_schemaorg.models.intangible.AggregateRating',
+    'AgreeAction': 'msgspec_schemaorg.models.action.AgreeAction',
+    'Airline': 'msgspec_schemaorg.models.organization.Airline',
+    'Airport': 'msgspec_schemaorg.models.place.Airport',
+    'AlignmentObject': 'msgspec_schemaorg.models.intangible.AlignmentObject',
+    'AllocateAction': 'msgspec_schemaorg.models.action.AllocateAction',
+    'AmpStory': 'msgspec_schemaorg.models.creativework.AmpStory',
+    'AmusementPark': 'msgspec_schemaorg.models.organization.AmusementPark',
+    'AnalysisNewsArticle': 'msgspec_schemaorg.models.creativework.AnalysisNewsArticle',
+    'AnatomicalStructure': 'msgspec_schemaorg.models.thing.AnatomicalStructure',
+    'AnatomicalSystem': 'msgspec_schemaorg.models.thing.AnatomicalSystem',
+    'AnimalShelter': 'msgspec_schemaorg.models.organization.AnimalShelter',
+    'Answer': 'msgspec_schemaorg.models.creativework.Answer',
+    'Apartment': 'msgspec_schemaorg.models.place.Apartment',
+    'ApartmentComplex': 'msgspec_schemaorg.models.place.ApartmentComplex',
+    'AppendAction': 'msgspec_schemaorg.models.action.AppendAction',
+    'ApplyAction': 'msgspec_schemaorg.models.action.ApplyAction',
+    'ApprovedIndication': 'msgspec_schemaorg.models.thing.ApprovedIndication',
+    'Aquarium': 'msgspec_schemaorg.models.place.Aquarium',
+    'ArchiveComponent': 'msgspec_schemaorg.models.creativework.ArchiveComponent',
+    'ArchiveOrganization': 'msgspec_schemaorg.models.organization.ArchiveOrganization',
+    'ArriveAction': 'msgspec_schemaorg.models.action.ArriveAction',
+    'ArtGallery': 'msgspec_schemaorg.models.organization.ArtGallery',
+    'Artery': 'msgspec_schemaorg.models.thing.Artery',
+    'Article': 'msgspec_schemaorg.models.creativework.Article',
+    'AskAction': 'msgspec_schemaorg.models.action.AskAction',
+    'AskPublicNewsArticle': 'msgspec_schemaorg.models.creativework.AskPublicNewsArticle',
+    'AssessAction': 'msgspec_schemaorg.models.action.AssessAction',
+    'AssignAction': 'msgspec_schemaorg.models.action.AssignAction',
+    'Atlas': 'msgspec_schemaorg.models.creativework.Atlas',
+    'Attorney': 'msgspec_schemaorg.models.organization.Attorney',
+    'Audience': 'msgspec_schemaorg.models.intangible.Audience',
+    'AudioObject': 'msgspec_schemaorg.models.creativework.AudioObject',
+    'AudioObjectSnapshot': 'msgspec_schemaorg.models.creativework.AudioObjectSnapshot',
+    'Audiobook': 'msgspec_schemaorg.models.creativework.Audiobook',
+    'AuthorizeAction': 'msgspec_schemaorg.models.action.AuthorizeAction',
+    'AutoBodyShop': 'msgspec_schemaorg.models.organization.AutoBodyShop',
+    'AutoDealer': 'msgspec_schemaorg.models.organization.AutoDealer',
+    'AutoPartsStore': 'msgspec_schemaorg.models.organization.AutoPartsStore',
+    'AutoRental': 'msgspec_schemaorg.models.organization.AutoRental',
+    'AutoRepair': 'msgspec_schemaorg.models.organization.AutoRepair',
+    'AutoWash': 'msgspec_schemaorg.models.organization.AutoWash',
+    'AutomatedTeller': 'msgspec_schemaorg.models.organization.AutomatedTeller',
+    'AutomotiveBusiness': 'msgspec_schemaorg.models.organization.AutomotiveBusiness',
+    'BackgroundNewsArticle': 'msgspec_schemaorg.models.creativework.BackgroundNewsArticle',
+    'Bakery': 'msgspec_schemaorg.models.organization.Bakery',
+    'BankAccount': 'msgspec_schemaorg.models.intangible.BankAccount',
+    'BankOrCreditUnion': 'msgspec_schemaorg.models.organization.BankOrCreditUnion',
+    'BarOrPub': 'msgspec_schemaorg.models.organization.BarOrPub',
+    'Barcode': 'msgspec_schemaorg.models.creativework.Barcode',
+    'Beach': 'msgspec_schemaorg.models.place.Beach',
+    'BeautySalon': 'msgspec_schemaorg.models.organization.BeautySalon',
+    'BedAndBreakfast': 'msgspec_schemaorg.models.organization.BedAndBreakfast',
+    'BedDetails': 'msgspec_schemaorg.models.intangible.BedDetails',
+    'BedType': 'msgspec_schemaorg.models.intangible.BedType',
+    'BefriendAction': 'msgspec_schemaorg.models.action.BefriendAction',
+    'BikeStore': 'msgspec_schemaorg.models.organization.BikeStore',
+    'BioChemEntity': 'msgspec_schemaorg.models.thing.BioChemEntity',
+    'Blog': 'msgspec_schemaorg.models.creativework.Blog',
+    'BlogPosting': 'msgspec_schemaorg.models.creativework.BlogPosting',
+    'BloodTest': 'msgspec_schemaorg.models.thing.BloodTest',
+    'BoardingPolicyType': 'msgspec_schemaorg.enums.intangible.BoardingPolicyType',
+    'BoatReservation': 'msgspec_schemaorg.models.intangible.BoatReservation',
+    'BoatTerminal': 'msgspec_schemaorg.models.place.BoatTerminal',
+    'BoatTrip': 'msgspec_schemaorg.models.intangible.BoatTrip',
+    'BodyMeasurementTypeEnumeration': 'msgspec_schemaorg.enums.intangible.BodyMeasurementTypeEnumeration',
+    'BodyOfWater': 'msgspec_schemaorg.models.place.BodyOfWater',
+    'Bone': 'msgspec_schemaorg.models.thing.Bone',
+    'Book': 'msgspec_schemaorg.models.creativework.Book',
+    'BookFormatType': 'msgspec_schemaorg.enums.intangible.BookFormatType',
+    'BookSeries': 'msgspec_schemaorg.models.creativework.BookSeries',
+    'BookStore': 'msgspec_schemaorg.models.organization.BookStore',
+    'BookmarkAction': 'msgspec_schemaorg.models.action.BookmarkAction',
+    'BorrowAction': 'msgspec_schemaorg.models.action.BorrowAction',
+    'BowlingAlley': 'msgspec_schemaorg.models.organization.BowlingAlley',
+    'BrainStructure': 'msgspec_schemaorg.models.thing.BrainStructure',
+    'Brand': 'msgspec_schemaorg.models.intangible.Brand',
+    'BreadcrumbList': 'msgspec_schemaorg.models.intangible.BreadcrumbList',
+    'Brewery': 'msgspec_schemaorg.models.organization.Brewery',
+    'Bridge': 'msgspec_schemaorg.models.place.Bridge',
+    'BroadcastChannel': 'msgspec_schemaorg.models.intangible.BroadcastChannel',
+    'BroadcastEvent': 'msgspec_schemaorg.models.event.BroadcastEvent',
+    'BroadcastFrequencySpecification': 'msgspec_schemaorg.models.intangible.BroadcastFrequencySpecification',
+    'BroadcastService': 'msgspec_schemaorg.models.intangible.BroadcastService',
+    'BrokerageAccount': 'msgspec_schemaorg.models.intangible.BrokerageAccount',
+    'BuddhistTemple': 'msgspec_schemaorg.models.place.BuddhistTemple',
+    'BusOrCoach': 'msgspec_schemaorg.models.product.BusOrCoach',
+    'BusReservation': 'msgspec_schemaorg.models.intangible.BusReservation',
+    'BusStation': 'msgspec_schemaorg.models.place.BusStation',
+    'BusStop': 'msgspec_schemaorg.models.place.BusStop',
+    'BusTrip': 'msgspec_schemaorg.models.intangible.BusTrip',
+    'BusinessAudience': 'msgspec_schemaorg.models.intangible.BusinessAudience',
+    'BusinessEntityType': 'msgspec_schemaorg.models.intangible.BusinessEntityType',
+    'BusinessEvent': 'msgspec_schemaorg.models.event.BusinessEvent',
+    'BusinessFunction': 'msgspec_schemaorg.models.intangible.BusinessFunction',
+    'BuyAction': 'msgspec_schemaorg.models.action.BuyAction',
+    'CDCPMDRecord': 'msgspec_schemaorg.models.intangible.CDCPMDRecord',
+    'CableOrSatelliteService': 'msgspec_schemaorg.models.intangible.CableOrSatelliteService',
+    'CafeOrCoffeeShop': 'msgspec_schemaorg.models.organization.CafeOrCoffeeShop',
+    'Campground': 'msgspec_schemaorg.models.place.Campground',
+    'CampingPitch': 'msgspec_schemaorg.models.place.CampingPitch',
+    'Canal': 'msgspec_schemaorg.models.place.Canal',
+    'CancelAction': 'msgspec_schemaorg.models.action.CancelAction',
+    'Car': 'msgspec_schemaorg.models.product.Car',
+    'CarUsageType': 'msgspec_schemaorg.enums.intangible.CarUsageType',
+    'Casino': 'msgspec_schemaorg.models.organization.Casino',
+    'CategoryCode': 'msgspec_schemaorg.models.intangible.CategoryCode',
+    'CategoryCodeSet': 'msgspec_schemaorg.models.creativework.CategoryCodeSet',
+    'CatholicChurch': 'msgspec_schemaorg.models.place.CatholicChurch',
+    'Cemetery': 'msgspec_schemaorg.models.place.Cemetery',
+    'Certification': 'msgspec_schemaorg.models.creativework.Certification',
+    'CertificationStatusEnumeration': 'msgspec_schemaorg.enums.intangible.CertificationStatusEnumeration',
+    'Chapter': 'msgspec_schemaorg.models.creativework.Chapter',
+    'CheckAction': 'msgspec_schemaorg.models.action.CheckAction',
+    'CheckInAction': 'msgspec_schemaorg.models.action.CheckInAction',
+    'CheckOutAction': 'msgspec_schemaorg.models.action.CheckOutAction',
+    'CheckoutPage': 'msgspec_schemaorg.models.creativework.CheckoutPage',
+    'ChemicalSubstance': 'msgspec_schemaorg.models.thing.ChemicalSubstance',
+    'ChildCare': 'msgspec_schemaorg.models.organization.ChildCare',
+    'ChildrensEvent': 'msgspec_schemaorg.models.event.ChildrensEvent',
+    'ChooseAction': 'msgspec_schemaorg.models.action.ChooseAction',
+    'Church': 'msgspec_schemaorg.models.place.Church',
+    'City': 'msgspec_schemaorg.models.place.City',
+    'CityHall': 'msgspec_schemaorg.models.place.CityHall',
+    'CivicStructure': 'msgspec_schemaorg.models.place.CivicStructure',
+    'Claim': 'msgspec_schemaorg.models.creativework.Claim',
+    'ClaimReview': 'msgspec_schemaorg.models.creativework.ClaimReview',
+    'Class': 'msgspec_schemaorg.models.intangible.Class',
+    'Clip': 'msgspec_schemaorg.models.creativework.Clip',
+    'ClothingStore': 'msgspec_schemaorg.models.organization.ClothingStore',
+    'Code': 'msgspec_schemaorg.models.creativework.Code',
+    'Collection': 'msgspec_schemaorg.models.creativework.Collection',
+    'CollectionPage': 'msgspec_schemaorg.models.creativework.CollectionPage',
+    'CollegeOrUniversity': 'msgspec_schemaorg.models.place.CollegeOrUniversity',
+    'ComedyClub': 'msgspec_schemaorg.models.organization.ComedyClub',
+    'ComedyEvent': 'msgspec_schemaorg.models.event.ComedyEvent',
+    'ComicCoverArt': 'msgspec_schemaorg.models.creativework.ComicCoverArt',
+    'ComicIssue': 'msgspec_schemaorg.models.creativework.ComicIssue',
+    'ComicSeries': 'msgspec_schemaorg.models.creativework.ComicSeries',
+    'ComicStory': 'msgspec_schemaorg.models.creativework.ComicStory',
+    'Comment': 'msgspec_schemaorg.models.creativework.Comment',
+    'CommentAction': 'msgspec_schemaorg.models.action.CommentAction',
+    'CommunicateAction': 'msgspec_schemaorg.models.action.CommunicateAction',
+    'CompleteDataFeed': 'msgspec_schemaorg.models.creativework.CompleteDataFeed',
+    'CompoundPriceSpecification': 'msgspec_schemaorg.models.intangible.CompoundPriceSpecification',
+    'ComputerLanguage': 'msgspec_schemaorg.models.intangible.ComputerLanguage',
+    'ComputerStore': 'msgspec_schemaorg.models.organization.ComputerStore',
+    'ConfirmAction': 'msgspec_schemaorg.models.action.ConfirmAction',
+    'Consortium': 'msgspec_schemaorg.models.organization.Consortium',
+    'ConstraintNode': 'msgspec_schemaorg.models.intangible.ConstraintNode',
+    'ConsumeAction': 'msgspec_schemaorg.models.action.ConsumeAction',
+    'ContactPage': 'msgspec_schemaorg.models.creativework.ContactPage',
+    'ContactPoint': 'msgspec_schemaorg.models.intangible.ContactPoint',
+    'ContactPointOption': 'msgspec_schemaorg.enums.intangible.ContactPointOption',
+    'Continent': 'msgspec_schemaorg.models.place.Continent',
+    'ControlAction': 'msgspec_schemaorg.models.action.ControlAction',
+    'ConvenienceStore': 'msgspec_schemaorg.models.organization.ConvenienceStore',
+    'Conversation': 'msgspec_schemaorg.models.creativework.Conversation',
+    'CookAction': 'msgspec_schemaorg.models.action.CookAction',
+    'Cooperative': 'msgspec_schemaorg.models.organization.Cooperative',
+    'Corporation': 'msgspec_schemaorg.models.organization.Corporation',
+    'CorrectionComment': 'msgspec_schemaorg.models.creativework.CorrectionComment',
+    'Country': 'msgspec_schemaorg.models.place.Country',
+    'Course': 'msgspec_schemaorg.models.creativework.Course',
+    'CourseInstance': 'msgspec_schemaorg.models.event.CourseInstance',
+    'Courthouse': 'msgspec_schemaorg.models.place.Courthouse',
+    'CoverArt': 'msgspec_schemaorg.models.creativework.CoverArt',
+    'CovidTestingFacility': 'msgspec_schemaorg.models.organization.CovidTestingFacility',
+    'CreateAction': 'msgspec_schemaorg.models.action.CreateAction',
+    'CreativeWork': 'msgspec_schemaorg.models.creativework.CreativeWork',
+    'CreativeWorkSeason': 'msgspec_schemaorg.models.creativework.CreativeWorkSeason',
+    'CreativeWorkSeries': 'msgspec_schemaorg.models.creativework.CreativeWorkSeries',
+    'CreditCard': 'msgspec_schemaorg.models.intangible.CreditCard',
+    'Crematorium': 'msgspec_schemaorg.models.place.Crematorium',
+    'CriticReview': 'msgspec_schemaorg.models.creativework.CriticReview',
+    'CssSelectorType': 'msgspec_schemaorg.models.misc.CssSelectorType',
+    'CurrencyConversionService': 'msgspec_schemaorg.models.intangible.CurrencyConversionService',
+    'DDxElement': 'msgspec_schemaorg.models.thing.DDxElement',
+    'DanceEvent': 'msgspec_schemaorg.models.event.DanceEvent',
+    'DanceGroup': 'msgspec_schemaorg.models.organization.DanceGroup',
+    'DataCatalog': 'msgspec_schemaorg.models.creativework.DataCatalog',
+    'DataDownload': 'msgspec_schemaorg.models.creativework.DataDownload',
+    'DataFeed': 'msgspec_schemaorg.models.creativework.DataFeed',
+    'DataFeedItem': 'msgspec_schemaorg.models.intangible.DataFeedItem',
+    'DataType': 'msgspec_schemaorg.models.misc.DataType',
+    'Dataset': 'msgspec_schemaorg.models.creativework.Dataset',
+    'DatedMoneySpecification': 'msgspec_schemaorg.models.intangible.DatedMoneySpecification',
+    'DayOfWeek': 'msgspec_schemaorg.enums.intangible.DayOfWeek',
+    'DaySpa': 'msgspec_schemaorg.models.organization.DaySpa',
+    'DeactivateAction': 'msgspec_schemaorg.models.action.DeactivateAction',
+    'DefenceEstablishment': 'msgspec_schemaorg.models.place.DefenceEstablishment',
+    'DefinedRegion': 'msgspec_schemaorg.models.intangible.DefinedRegion',
+    'DefinedTerm': 'msgspec_schemaorg.models.intangible.DefinedTerm',
+    'DefinedTermSet': 'msgspec_schemaorg.models.creativework.DefinedTermSet',
+    'DeleteAction': 'msgspec_schemaorg.models.action.DeleteAction',
+    'DeliveryChargeSpecification': 'msgspec_schemaorg.models.intangible.DeliveryChargeSpecification',
+    'DeliveryEvent': 'msgspec_schemaorg.models.event.DeliveryEvent',
+    'DeliveryMethod': 'msgspec_schemaorg.enums.intangible.DeliveryMethod',
+    'Demand': 'msgspec_schemaorg.models.intangible.Demand',
+    'Dentist': 'msgspec_schemaorg.models.organization.Dentist',
+    'DepartAction': 'msgspec_schemaorg.models.action.DepartAction',
+    'DepartmentStore': 'msgspec_schemaorg.models.organization.DepartmentStore',
+    'DepositAccount': 'msgspec_schemaorg.models.intangible.DepositAccount',
+    'DiagnosticLab': 'msgspec_schemaorg.models.organization.DiagnosticLab',
+    'DiagnosticProcedure': 'msgspec_schemaorg.models.thing.DiagnosticProcedure',
+    'Diet': 'msgspec_schemaorg.models.creativework.Diet',
+    'DietarySupplement': 'msgspec_schemaorg.models.thing.DietarySupplement',
+    'DigitalDocument': 'msgspec_schemaorg.models.creativework.DigitalDocument',
+    'DigitalDocumentPermission': 'msgspec_schemaorg.models.intangible.DigitalDocumentPermission',
+    'DigitalDocumentPermissionType': 'msgspec_schemaorg.enums.intangible.DigitalDocumentPermissionType',
+    'DigitalPlatformEnumeration': 'msgspec_schemaorg.enums.intangible.DigitalPlatformEnumeration',
+    'DisagreeAction': 'msgspec_schemaorg.models.action.DisagreeAction',
+    'DiscoverAction': 'msgspec_schemaorg.models.action.DiscoverAction',
+    'DiscussionForumPosting': 'msgspec_schemaorg.models.creativework.DiscussionForumPosting',
+    'DislikeAction': 'msgspec_schemaorg.models.action.DislikeAction',
+    'Distance': 'msgspec_schemaorg.models.intangible.Distance',
+    'Distillery': 'msgspec_schemaorg.models.organization.Distillery',
+    'DonateAction': 'msgspec_schemaorg.models.action.DonateAction',
+    'DoseSchedule': 'msgspec_schemaorg.models.thing.DoseSchedule',
+    'DownloadAction': 'msgspec_schemaorg.models.action.DownloadAction',
+    'DrawAction': 'msgspec_schemaorg.models.action.DrawAction',
+    'Drawing': 'msgspec_schemaorg.models.creativework.Drawing',
+    'DrinkAction': 'msgspec_schemaorg.models.action.DrinkAction',
+    'DriveWheelConfigurationValue': 'msgspec_schemaorg.enums.intangible.DriveWheelConfigurationValue',
+    'Drug': 'msgspec_schemaorg.models.product.Drug',
+    'DrugClass': 'msgspec_schemaorg.models.thing.DrugClass',
+    'DrugCost': 'msgspec_schemaorg.models.thing.DrugCost',
+    'DrugCostCategory': 'msgspec_schemaorg.enums.intangible.DrugCostCategory',
+    'DrugLegalStatus': 'msgspec_schemaorg.models.thing.DrugLegalStatus',
+    'DrugPregnancyCategory': 'msgspec_schemaorg.enums.intangible.DrugPregnancyCategory',
+    'DrugPrescriptionStatus': 'msgspec_schemaorg.enums.intangible.DrugPrescriptionStatus',
+    'DrugStrength': 'msgspec_schemaorg.models.thing.DrugStrength',
+    'DryCleaningOrLaundry': 'msgspec_schemaorg.models.organization.DryCleaningOrLaundry',
+    'Duration': 'msgspec_schemaorg.models.intangible.Duration',
+    'EUEnergyEfficiencyEnumeration': 'msgspec_schemaorg.enums.intangible.EUEnergyEfficiencyEnumeration',
+    'EatAction': 'msgspec_schemaorg.models.action.EatAction',
+    'EducationEvent': 'msgspec_schemaorg.models.event.EducationEvent',
+    'EducationalAudience': 'msgspec_schemaorg.models.intangible.EducationalAudience',
+    'EducationalOccupationalCredential': 'msgspec_schemaorg.models.creativework.EducationalOccupationalCredential',
+    'EducationalOccupationalProgram': 'msgspec_schemaorg.models.intangible.EducationalOccupationalProgram',
+    'EducationalOrganization': 'msgspec_schemaorg.models.place.EducationalOrganization',
+    'Electrician': 'msgspec_schemaorg.models.organization.Electrician',
+    'ElectronicsStore': 'msgspec_schemaorg.models.organization.ElectronicsStore',
+    'ElementarySchool': 'msgspec_schemaorg.models.place.ElementarySchool',
+    'EmailMessage': 'msgspec_schemaorg.models.creativework.EmailMessage',
+    'Embassy': 'msgspec_schemaorg.models.place.Embassy',
+    'EmergencyService': 'msgspec_schemaorg.models.organization.EmergencyService',
+    'EmployeeRole': 'msgspec_schemaorg.models.intangible.EmployeeRole',
+    'EmployerAggregateRating': 'msgspec_schemaorg.models.intangible.EmployerAggregateRating',
+    'EmployerReview': 'msgspec_schemaorg.models.creativework.EmployerReview',
+    'EmploymentAgency': 'msgspec_schemaorg.models.organization.EmploymentAgency',
+    'EndorseAction': 'msgspec_schemaorg.models.action.EndorseAction',
+    'EndorsementRating': 'msgspec_schemaorg.models.intangible.EndorsementRating',
+    'Energy': 'msgspec_schemaorg.models.intangible.Energy',
+    'EnergyConsumptionDetails': 'msgspec_schemaorg.models.intangible.EnergyConsumptionDetails',
+    'EnergyEfficiencyEnumeration': 'msgspec_schemaorg.models.intangible.EnergyEfficiencyEnumeration',
+    'EnergyStarEnergyEfficiencyEnumeration': 'msgspec_schemaorg.enums.intangible.EnergyStarEnergyEfficiencyEnumeration',
+    'EngineSpecification': 'msgspec_schemaorg.models.intangible.EngineSpecification',
+    'EntertainmentBusiness': 'msgspec_schemaorg.models.organization.EntertainmentBusiness',
+    'EntryPoint': 'msgspec_schemaorg.models.intangible.EntryPoint',
+    'Enumeration': 'msgspec_schemaorg.models.intangible.Enumeration',
+    'Episode': 'msgspec_schemaorg.models.creativework.Episode',
+    'Event': 'msgspec_schemaorg.models.event.Event',
+    'EventAttendanceModeEnumeration': 'msgspec_schemaorg.enums.intangible.EventAttendanceModeEnumeration',
+    'EventReservation': 'msgspec_schemaorg.models.intangible.EventReservation',
+    'EventSeries': 'msgspec_schemaorg.models.intangible.EventSeries',
+    'EventStatusType': 'msgspec_schemaorg.enums.intangible.EventStatusType',
+    'EventVenue': 'msgspec_schemaorg.models.place.EventVenue',
+    'ExchangeRateSpecification': 'msgspec_schemaorg.models.intangible.ExchangeRateSpecification',
+    'ExerciseAction': 'msgspec_schemaorg.models.action.ExerciseAction',
+    'ExerciseGym': 'msgspec_schemaorg.models.organization.ExerciseGym',
+    'ExercisePlan': 'msgspec_schemaorg.models.thing.ExercisePlan',
+    'ExhibitionEvent': 'msgspec_schemaorg.models.event.ExhibitionEvent',
+    'FAQPage': 'msgspec_schemaorg.models.creativework.FAQPage',
+    'FMRadioChannel': 'msgspec_schemaorg.models.intangible.FMRadioChannel',
+    'FastFoodRestaurant': 'msgspec_schemaorg.models.organization.FastFoodRestaurant',
+    'Festival': 'msgspec_schemaorg.models.event.Festival',
+    'FilmAction': 'msgspec_schemaorg.models.action.FilmAction',
+    'FinancialIncentive': 'msgspec_schemaorg.models.intangible.FinancialIncentive',
+    'FinancialProduct': 'msgspec_schemaorg.models.intangible.FinancialProduct',
+    'FinancialService': 'msgspec_schemaorg.models.organization.FinancialService',
+    'FindAction': 'msgspec_schemaorg.models.action.FindAction',
+    'FireStation': 'msgspec_schemaorg.models.place.FireStation',
+    'Flight': 'msgspec_schemaorg.models.intangible.Flight',
+    'FlightReservation': 'msgspec_schemaorg.models.intangible.FlightReservation',
+    'Float': 'msgspec_schemaorg.models.misc.Float',
+    'FloorPlan': 'msgspec_schemaorg.models.intangible.FloorPlan',
+    'Florist': 'msgspec_schemaorg.models.organization.Florist',
+    'FollowAction': 'msgspec_schemaorg.models.action.FollowAction',
+    'FoodEstablishment': 'msgspec_schemaorg.models.organization.FoodEstablishment',
+    'FoodEstablishmentReservation': 'msgspec_schemaorg.models.intangible.FoodEstablishmentReservation',
+    'FoodEvent': 'msgspec_schemaorg.models.event.FoodEvent',
+    'FoodService': 'msgspec_schemaorg.models.intangible.FoodService',
+    'FulfillmentTypeEnumeration': 'msgspec_schemaorg.enums.intangible.FulfillmentTypeEnumeration',
+    'FundingAgency': 'msgspec_schemaorg.models.organization.FundingAgency',
+    'FundingScheme': 'msgspec_schemaorg.models.organization.FundingScheme',
+    'FurnitureStore': 'msgspec_schemaorg.models.organization.FurnitureStore',
+    'Game': 'msgspec_schemaorg.models.creativework.Game',
+    'GameAvailabilityEnumeration': 'msgspec_schemaorg.enums.intangible.GameAvailabilityEnumeration',
+    'GamePlayMode': 'msgspec_schemaorg.enums.intangible.GamePlayMode',
+    'GameServer': 'msgspec_schemaorg.models.intangible.GameServer',
+    'GameServerStatus': 'msgspec_schemaorg.enums.intangible.GameServerStatus',
+    'GardenStore': 'msgspec_schemaorg.models.organization.GardenStore',
+    'GasStation': 'msgspec_schemaorg.models.organization.GasStation',
+    'GatedResidenceCommunity': 'msgspec_schemaorg.models.place.GatedResidenceCommunity',
+    'GenderType': 'msgspec_schemaorg.enums.intangible.GenderType',
+    'Gene': 'msgspec_schemaorg.models.thing.Gene',
+    'GeneralContractor': 'msgspec_schemaorg.models.organization.GeneralContractor',
+    'GeoCircle': 'msgspec_schemaorg.models.intangible.GeoCircle',
+    'GeoCoordinates': 'msgspec_schemaorg.models.intangible.GeoCoordinates',
+    'GeoShape': 'msgspec_schemaorg.models.intangible.GeoShape',
+    'GeospatialGeometry': 'msgspec_schemaorg.models.intangible.GeospatialGeometry',
+    'GiveAction': 'msgspec_schemaorg.models.action.GiveAction',
+    'GolfCourse': 'msgspec_schemaorg.models.organization.GolfCourse',
+    'GovernmentBenefitsType': 'msgspec_schemaorg.enums.intangible.GovernmentBenefitsType',
+    'GovernmentBuilding': 'msgspec_schemaorg.models.place.GovernmentBuilding',
+    'GovernmentOffice': 'msgspec_schemaorg.models.organization.GovernmentOffice',
+    'GovernmentOrganization': 'msgspec_schemaorg.models.organization.GovernmentOrganization',
+    'GovernmentPermit': 'msgspec_schemaorg.models.intangible.GovernmentPermit',
+    'GovernmentService': 'msgspec_schemaorg.models.intangible.GovernmentService',
+    'Grant': 'msgspec_schemaorg.models.intangible.Grant',
+    'GroceryStore': 'msgspec_schemaorg.models.organization.GroceryStore',
+    'Guide': 'msgspec_schemaorg.models.creativework.Guide',
+    'HVACBusiness': 'msgspec_schemaorg.models.organization.HVACBusiness',
+    'Hackathon': 'msgspec_schemaorg.models.event.Hackathon',
+    'HairSalon': 'msgspec_schemaorg.models.organization.HairSalon',
+    'HardwareStore': 'msgspec_schemaorg.models.organization.HardwareStore',
+    'HealthAndBeautyBusiness': 'msgspec_schemaorg.models.organization.HealthAndBeautyBusiness',
+    'HealthAspectEnumeration': 'msgspec_schemaorg.enums.intangible.HealthAspectEnumeration',
+    'HealthClub': 'msgspec_schemaorg.models.organization.HealthClub',
+    'HealthInsurancePlan': 'msgspec_schemaorg.models.intangible.HealthInsurancePlan',
+    'HealthPlanCostSharingSpecification': 'msgspec_schemaorg.models.intangible.HealthPlanCostSharingSpecification',
+    'HealthPlanFormulary': 'msgspec_schemaorg.models.intangible.HealthPlanFormulary',
+    'HealthPlanNetwork': 'msgspec_schemaorg.models.intangible.HealthPlanNetwork',
+    'HealthTopicContent': 'msgspec_schemaorg.models.creativework.HealthTopicContent',
+    'HighSchool': 'msgspec_schemaorg.models.place.HighSchool',
+    'HinduTemple': 'msgspec_schemaorg.models.place.HinduTemple',
+    'HobbyShop': 'msgspec_schemaorg.models.organization.HobbyShop',
+    'HomeAndConstructionBusiness': 'msgspec_schemaorg.models.organization.HomeAndConstructionBusiness',
+    'HomeGoodsStore': 'msgspec_schemaorg.models.organization.HomeGoodsStore',
+    'Hospital': 'msgspec_schemaorg.models.organization.Hospital',
+    'Hostel': 'msgspec_schemaorg.models.organization.Hostel',
+    'Hotel': 'msgspec_schemaorg.models.organization.Hotel',
+    'HotelRoom': 'msgspec_schemaorg.models.place.HotelRoom',
+    'House': 'msgspec_schemaorg.models.place.House',
+    'HousePainter': 'msgspec_schemaorg.models.organization.HousePainter',
+    'HowTo': 'msgspec_schemaorg.models.creativework.HowTo',
+    'HowToDirection': 'msgspec_schemaorg.models.intangible.HowToDirection',
+    'HowToItem': 'msgspec_schemaorg.models.intangible.HowToItem',
+    'HowToSection': 'msgspec_schemaorg.models.creativework.HowToSection',
+    'HowToStep': 'msgspec_schemaorg.models.intangible.HowToStep',
+    'HowToSupply': 'msgspec_schemaorg.models.intangible.HowToSupply',
+    'HowToTip': 'msgspec_schemaorg.models.creativework.HowToTip',
+    'HowToTool': 'msgspec_schemaorg.models.intangible.HowToTool',
+    'HyperToc': 'msgspec_schemaorg.models.creativework.HyperToc',
+    'HyperTocEntry': 'msgspec_schemaorg.models.creativework.HyperTocEntry',
+    'IPTCDigitalSourceEnumeration': 'msgspec_schemaorg.enums.intangible.IPTCDigitalSourceEnumeration',
+    'IceCreamShop': 'msgspec_schemaorg.models.organization.IceCreamShop',
+    'IgnoreAction': 'msgspec_schemaorg.models.action.IgnoreAction',
+    'ImageGallery': 'msgspec_schemaorg.models.creativework.ImageGallery',
+    'ImageObject': 'msgspec_schemaorg.models.creativework.ImageObject',
+    'ImageObjectSnapshot': 'msgspec_schemaorg.models.creativework.ImageObjectSnapshot',
+    'ImagingTest': 'msgspec_schemaorg.models.thing.ImagingTest',
+    'IncentiveQualifiedExpenseType': 'msgspec_schemaorg.enums.intangible.IncentiveQualifiedExpenseType',
+    'IncentiveStatus': 'msgspec_schemaorg.enums.intangible.IncentiveStatus',
+    'IncentiveType': 'msgspec_schemaorg.enums.intangible.IncentiveType',
+    'IndividualPhysician': 'msgspec_schemaorg.models.organization.IndividualPhysician',
+    'IndividualProduct': 'msgspec_schemaorg.models.product.IndividualProduct',
+    'InfectiousAgentClass': 'msgspec_schemaorg.enums.intangible.InfectiousAgentClass',
+    'InfectiousDisease': 'msgspec_schemaorg.models.thing.InfectiousDisease',
+    'InformAction': 'msgspec_schemaorg.models.action.InformAction',
+    'InsertAction': 'msgspec_schemaorg.models.action.InsertAction',
+    'InstallAction': 'msgspec_schemaorg.models.action.InstallAction',
+    'InsuranceAgency': 'msgspec_schemaorg.models.organization.InsuranceAgency',
+    'Intangible': 'msgspec_schemaorg.models.intangible.Intangible',
+    'Integer': 'msgspec_schemaorg.models.misc.Integer',
+    'InteractAction': 'msgspec_schemaorg.models.action.InteractAction',
+    'InteractionCounter': 'msgspec_schemaorg.models.intangible.InteractionCounter',
+    'InternetCafe': 'msgspec_schemaorg.models.organization.InternetCafe',
+    'InvestmentFund': 'msgspec_schemaorg.models.intangible.InvestmentFund',
+    'InvestmentOrDeposit': 'msgspec_schemaorg.models.intangible.InvestmentOrDeposit',
+    'InviteAction': 'msgspec_schemaorg.models.action.InviteAction',
+    'Invoice': 'msgspec_schemaorg.models.intangible.Invoice',
+    'ItemAvailability': 'msgspec_schemaorg.enums.intangible.ItemAvailability',
+    'ItemList': 'msgspec_schemaorg.models.intangible.ItemList',
+    'ItemListOrderType': 'msgspec_schemaorg.enums.intangible.ItemListOrderType',
+    'ItemPage': 'msgspec_schemaorg.models.creativework.ItemPage',
+    'JewelryStore': 'msgspec_schemaorg.models.organization.JewelryStore',
+    'JobPosting': 'msgspec_schemaorg.models.intangible.JobPosting',
+    'JoinAction': 'msgspec_schemaorg.models.action.JoinAction',
+    'Joint': 'msgspec_schemaorg.models.thing.Joint',
+    'LakeBodyOfWater': 'msgspec_schemaorg.models.place.LakeBodyOfWater',
+    'Landform': 'msgspec_schemaorg.models.place.Landform',
+    'LandmarksOrHistoricalBuildings': 'msgspec_schemaorg.models.place.LandmarksOrHistoricalBuildings',
+    'Language': 'msgspec_schemaorg.models.intangible.Language',
+    'LearningResource': 'msgspec_schemaorg.models.creativework.LearningResource',
+    'LeaveAction': 'msgspec_schemaorg.models.action.LeaveAction',
+    'LegalForceStatus': 'msgspec_schemaorg.enums.intangible.LegalForceStatus',
+    'LegalService': 'msgspec_schemaorg.models.organization.LegalService',
+    'LegalValueLevel': 'msgspec_schemaorg.enums.intangible.LegalValueLevel',
+    'Legislation': 'msgspec_schemaorg.models.creativework.Legislation',
+    'LegislationObject': 'msgspec_schemaorg.models.creativework.LegislationObject',
+    'LegislativeBuilding': 'msgspec_schemaorg.models.place.LegislativeBuilding',
+    'LendAction': 'msgspec_schemaorg.models.action.LendAction',
+    'Library': 'msgspec_schemaorg.models.organization.Library',
+    'LibrarySystem': 'msgspec_schemaorg.models.organization.LibrarySystem',
+    'LifestyleModification': 'msgspec_schemaorg.models.thing.LifestyleModification',
+    'Ligament': 'msgspec_schemaorg.models.thing.Ligament',
+    'LikeAction': 'msgspec_schemaorg.models.action.LikeAction',
+    'LinkRole': 'msgspec_schemaorg.models.intangible.LinkRole',
+    'LiquorStore': 'msgspec_schemaorg.models.organization.LiquorStore',
+    'ListItem': 'msgspec_schemaorg.models.intangible.ListItem',
+    'ListenAction': 'msgspec_schemaorg.models.action.ListenAction',
+    'LiteraryEvent': 'msgspec_schemaorg.models.event.LiteraryEvent',
+    'LiveBlogPosting': 'msgspec_schemaorg.models.creativework.LiveBlogPosting',
+    'LoanOrCredit': 'msgspec_schemaorg.models.intangible.LoanOrCredit',
+    'LocalBusiness': 'msgspec_schemaorg.models.organization.LocalBusiness',
+    'LocationFeatureSpecification': 'msgspec_schemaorg.models.intangible.LocationFeatureSpecification',
+    'Locksmith': 'msgspec_schemaorg.models.organization.Locksmith',
+    'LodgingBusiness': 'msgspec_schemaorg.models.organization.LodgingBusiness',
+    'LodgingReservation': 'msgspec_schemaorg.models.intangible.LodgingReservation',
+    'LoseAction': 'msgspec_schemaorg.models.action.LoseAction',
+    'LymphaticVessel': 'msgspec_schemaorg.models.thing.LymphaticVessel',
+    'Manuscript': 'msgspec_schemaorg.models.creativework.Manuscript',
+    'Map': 'msgspec_schemaorg.models.creativework.Map',
+    'MapCategoryType': 'msgspec_schemaorg.enums.intangible.MapCategoryType',
+    'MarryAction': 'msgspec_schemaorg.models.action.MarryAction',
+    'Mass': 'msgspec_schemaorg.models.intangible.Mass',
+    'MathSolver': 'msgspec_schemaorg.models.creativework.MathSolver',
+    'MaximumDoseSchedule': 'msgspec_schemaorg.models.thing.MaximumDoseSchedule',
+    'MeasurementMethodEnum': 'msgspec_schemaorg.enums.intangible.MeasurementMethodEnum',
+    'MeasurementTypeEnumeration': 'msgspec_schemaorg.models.intangible.MeasurementTypeEnumeration',
+    'MediaEnumeration': 'msgspec_schemaorg.models.intangible.MediaEnumeration',
+    'MediaGallery': 'msgspec_schemaorg.models.creativework.MediaGallery',
+    'MediaManipulationRatingEnumeration': 'msgspec_schemaorg.enums.intangible.MediaManipulationRatingEnumeration',
+    'MediaObject': 'msgspec_schemaorg.models.creativework.MediaObject',
+    'MediaReview': 'msgspec_schemaorg.models.creativework.MediaReview',
+    'MediaReviewItem': 'msgspec_schemaorg.models.creativework.MediaReviewItem',
+    'MediaSubscription': 'msgspec_schemaorg.models.intangible.MediaSubscription',
+    'MedicalAudience': 'msgspec_schemaorg.models.intangible.MedicalAudience',
+    'MedicalAudienceType': 'msgspec_schemaorg.enums.intangible.MedicalAudienceType',
+    'MedicalBusiness': 'msgspec_schemaorg.models.organization.MedicalBusiness',
+    'MedicalCause': 'msgspec_schemaorg.models.thing.MedicalCause',
+    'MedicalClinic': 'msgspec_schemaorg.models.organization.MedicalClinic',
+    'MedicalCode': 'msgspec_schemaorg.models.thing.MedicalCode',
+    'MedicalCondition': 'msgspec_schemaorg.models.thing.MedicalCondition',
+    'MedicalConditionStage': 'msgspec_schemaorg.models.thing.MedicalConditionStage',
+    'MedicalContraindication': 'msgspec_schemaorg.models.thing.MedicalContraindication',
+    'MedicalDevice': 'msgspec_schemaorg.models.thing.MedicalDevice',
+    'MedicalDevicePurpose': 'msgspec_schemaorg.enums.intangible.MedicalDevicePurpose',
+    'MedicalEntity': 'msgspec_schemaorg.models.thing.MedicalEntity',
+    'MedicalEnumeration': 'msgspec_schemaorg.models.intangible.MedicalEnumeration',
+    'MedicalEvidenceLevel': 'msgspec_schemaorg.enums.intangible.MedicalEvidenceLevel',
+    'MedicalGuideline': 'msgspec_schemaorg.models.thing.MedicalGuideline',
+    'MedicalGuidelineContraindication': 'msgspec_schemaorg.models.thing.MedicalGuidelineContraindication',
+    'MedicalGuidelineRecommendation': 'msgspec_schemaorg.models.thing.MedicalGuidelineRecommendation',
+    'MedicalImagingTechnique': 'msgspec_schemaorg.enums.intangible.MedicalImagingTechnique',
+    'MedicalIndication': 'msgspec_schemaorg.models.thing.MedicalIndication',
+    'MedicalIntangible': 'msgspec_schemaorg.models.thing.MedicalIntangible',
+    'MedicalObservationalStudy': 'msgspec_schemaorg.models.thing.MedicalObservationalStudy',
+    'MedicalObservationalStudyDesign': 'msgspec_schemaorg.enums.intangible.MedicalObservationalStudyDesign',
+    'MedicalOrganization': 'msgspec_schemaorg.models.organization.MedicalOrganization',
+    'MedicalProcedure': 'msgspec_schemaorg.models.thing.MedicalProcedure',
+    'MedicalProcedureType': 'msgspec_schemaorg.enums.intangible.MedicalProcedureType',
+    'MedicalRiskCalculator': 'msgspec_schemaorg.models.thing.MedicalRiskCalculator',
+    'MedicalRiskEstimator': 'msgspec_schemaorg.models.thing.MedicalRiskEstimator',
+    'MedicalRiskFactor': 'msgspec_schemaorg.models.thing.MedicalRiskFactor',
+    'MedicalRiskScore': 'msgspec_schemaorg.models.thing.MedicalRiskScore',
+    'MedicalScholarlyArticle': 'msgspec_schemaorg.models.creativework.MedicalScholarlyArticle',
+    'MedicalSign': 'msgspec_schemaorg.models.thing.MedicalSign',
+    'MedicalSignOrSymptom': 'msgspec_schemaorg.models.thing.MedicalSignOrSymptom',
+    'MedicalSpecialty': 'msgspec_schemaorg.enums.intangible.MedicalSpecialty',
+    'MedicalStudy': 'msgspec_schemaorg.models.thing.MedicalStudy',
+    'MedicalStudyStatus': 'msgspec_schemaorg.enums.intangible.MedicalStudyStatus',
+    'MedicalSymptom': 'msgspec_schemaorg.models.thing.MedicalSymptom',
+    'MedicalTest': 'msgspec_schemaorg.models.thing.MedicalTest',
+    'MedicalTestPanel': 'msgspec_schemaorg.models.thing.MedicalTestPanel',
+    'MedicalTherapy': 'msgspec_schemaorg.models.thing.MedicalTherapy',
+    'MedicalTrial': 'msgspec_schemaorg.models.thing.MedicalTrial',
+    'MedicalTrialDesign': 'msgspec_schemaorg.enums.intangible.MedicalTrialDesign',
+    'MedicalWebPage': 'msgspec_schemaorg.models.creativework.MedicalWebPage',
+    'MedicineSystem': 'msgspec_schemaorg.enums.intangible.MedicineSystem',
+    'MeetingRoom': 'msgspec_schemaorg.models.place.MeetingRoom',
+    'MemberProgram': 'msgspec_schemaorg.models.intangible.MemberProgram',
+    'MemberProgramTier': 'msgspec_schemaorg.models.intangible.MemberProgramTier',
+    'MensClothingStore': 'msgspec_schemaorg.models.organization.MensClothingStore',
+    'Menu': 'msgspec_schemaorg.models.creativework.Menu',
+    'MenuItem': 'msgspec_schemaorg.models.intangible.MenuItem',
+    'MenuSection': 'msgspec_schemaorg.models.creativework.MenuSection',
+    'MerchantReturnEnumeration': 'msgspec_schemaorg.enums.intangible.MerchantReturnEnumeration',
+    'MerchantReturnPolicy': 'msgspec_schemaorg.models.intangible.MerchantReturnPolicy',
+    'MerchantReturnPolicySeasonalOverride': 'msgspec_schemaorg.models.intangible.MerchantReturnPolicySeasonalOverride',
+    'Message': 'msgspec_schemaorg.models.creativework.Message',
+    'MiddleSchool': 'msgspec_schemaorg.models.place.MiddleSchool',
+    'MobileApplication': 'msgspec_schemaorg.models.creativework.MobileApplication',
+    'MobilePhoneStore': 'msgspec_schemaorg.models.organization.MobilePhoneStore',
+    'Model3DModel': 'msgspec_schemaorg.models.creativework.Model3DModel',
+    'MolecularEntity': 'msgspec_schemaorg.models.thing.MolecularEntity',
+    'MonetaryAmount': 'msgspec_schemaorg.models.intangible.MonetaryAmount',
+    'MonetaryAmountDistribution': 'msgspec_schemaorg.models.intangible.MonetaryAmountDistribution',
+    'MonetaryGrant': 'msgspec_schemaorg.models.intangible.MonetaryGrant',
+    'MoneyTransfer': 'msgspec_schemaorg.models.action.MoneyTransfer',
+    'MortgageLoan': 'msgspec_schemaorg.models.intangible.MortgageLoan',
+    'Mosque': 'msgspec_schemaorg.models.place.Mosque',
+    'Motel': 'msgspec_schemaorg.models.organization.Motel',
+    'Motorcycle': 'msgspec_schemaorg.models.product.Motorcycle',
+    'MotorcycleDealer': 'msgspec_schemaorg.models.organization.MotorcycleDealer',
+    'MotorcycleRepair': 'msgspec_schemaorg.models.organization.MotorcycleRepair',
+    'MotorizedBicycle': 'msgspec_schemaorg.models.product.MotorizedBicycle',
+    'Mountain': 'msgspec_schemaorg.models.place.Mountain',
+    'MoveAction': 'msgspec_schemaorg.models.action.MoveAction',
+    'Movie': 'msgspec_schemaorg.models.creativework.Movie',
+    'MovieClip': 'msgspec_schemaorg.models.creativework.MovieClip',
+    'MovieRentalStore': 'msgspec_schemaorg.models.organization.MovieRentalStore',
+    'MovieSeries': 'msgspec_schemaorg.models.creativework.MovieSeries',
+    'MovieTheater': 'msgspec_schemaorg.models.place.MovieTheater',
+    'MovingCompany': 'msgspec_schemaorg.models.organization.MovingCompany',
+    'Muscle': 'msgspec_schemaorg.models.thing.Muscle',
+    'Museum': 'msgspec_schemaorg.models.place.Museum',
+    'MusicAlbum': 'msgspec_schemaorg.models.creativework.MusicAlbum',
+    'MusicAlbumProductionType': 'msgspec_schemaorg.enums.intangible.MusicAlbumProductionType',
+    'MusicAlbumReleaseType': 'msgspec_schemaorg.enums.intangible.MusicAlbumReleaseType',
+    'MusicComposition': 'msgspec_schemaorg.models.creativework.MusicComposition',
+    'MusicEvent': 'msgspec_schemaorg.models.event.MusicEvent',
+    'MusicGroup': 'msgspec_schemaorg.models.organization.MusicGroup',
+    'MusicPlaylist': 'msgspec_schemaorg.models.creativework.MusicPlaylist',
+    'MusicRecording': 'msgspec_schemaorg.models.creativework.MusicRecording',
+    'MusicRelease': 'msgspec_schemaorg.models.creativework.MusicRelease',
+    'MusicReleaseFormatType': 'msgspec_schemaorg.enums.intangible.MusicReleaseFormatType',
+    'MusicStore': 'msgspec_schemaorg.models.organization.MusicStore',
+    'MusicVenue': 'msgspec_schemaorg.models.place.MusicVenue',
+    'MusicVideoObject': 'msgspec_schemaorg.models.creativework.MusicVideoObject',
+    'NGO': 'msgspec_schemaorg.models.organization.NGO',
+    'NLNonprofitType': 'msgspec_schemaorg.enums.intangible.NLNonprofitType',
+    'NailSalon': 'msgspec_schemaorg.models.organization.NailSalon',
+    'Nerve': 'msgspec_schemaorg.models.thing.Nerve',
+    'NewsArticle': 'msgspec_schemaorg.models.creativework.NewsArticle',
+    'NewsMediaOrganization': 'msgspec_schemaorg.models.organization.NewsMediaOrganization',
+    'Newspaper': 'msgspec_schemaorg.models.creativework.Newspaper',
+    'NightClub': 'msgspec_schemaorg.models.organization.NightClub',
+    'NonprofitType': 'msgspec_schemaorg.models.intangible.NonprofitType',
+    'Notary': 'msgspec_schemaorg.models.organization.Notary',
+    'NoteDigitalDocument': 'msgspec_schemaorg.models.creativework.NoteDigitalDocument',
+    'NutritionInformation': 'msgspec_schemaorg.models.intangible.NutritionInformation',
+    'Observation': 'msgspec_schemaorg.models.intangible.Observation',
+    'Occupation': 'msgspec_schemaorg.models.intangible.Occupation',
+    'OccupationalExperienceRequirements': 'msgspec_schemaorg.models.intangible.OccupationalExperienceRequirements',
+    'OccupationalTherapy': 'msgspec_schemaorg.models.thing.OccupationalTherapy',
+    'OceanBodyOfWater': 'msgspec_schemaorg.models.place.OceanBodyOfWater',
+    'Offer': 'msgspec_schemaorg.models.intangible.Offer',
+    'OfferCatalog': 'msgspec_schemaorg.models.intangible.OfferCatalog',
+    'OfferForLease': 'msgspec_schemaorg.models.intangible.OfferForLease',
+    'OfferForPurchase': 'msgspec_schemaorg.models.intangible.OfferForPurchase',
+    'OfferItemCondition': 'msgspec_schemaorg.enums.intangible.OfferItemCondition',
+    'OfferShippingDetails': 'msgspec_schemaorg.models.intangible.OfferShippingDetails',
+    'OfficeEquipmentStore': 'msgspec_schemaorg.models.organization.OfficeEquipmentStore',
+    'OnDemandEvent': 'msgspec_schemaorg.models.event.OnDemandEvent',
+    'OnlineBusiness': 'msgspec_schemaorg.models.organization.OnlineBusiness',
+    'OnlineStore': 'msgspec_schemaorg.models.organization.OnlineStore',
+    'OpeningHoursSpecification': 'msgspec_schemaorg.models.intangible.OpeningHoursSpecification',
+    'OpinionNewsArticle': 'msgspec_schemaorg.models.creativework.OpinionNewsArticle',
+    'Optician': 'msgspec_schemaorg.models.organization.Optician',
+    'Order': 'msgspec_schemaorg.models.intangible.Order',
+    'OrderAction': 'msgspec_schemaorg.models.action.OrderAction',
+    'OrderItem': 'msgspec_schemaorg.models.intangible.OrderItem',
+    'OrderStatus': 'msgspec_schemaorg.enums.intangible.OrderStatus',
+    'Organization': 'msgspec_schemaorg.models.organization.Organization',
+    'OrganizationRole': 'msgspec_schemaorg.models.intangible.OrganizationRole',
+    'OrganizeAction': 'msgspec_schemaorg.models.action.OrganizeAction',
+    'OutletStore': 'msgspec_schemaorg.models.organization.OutletStore',
+    'OwnershipInfo': 'msgspec_schemaorg.models.intangible.OwnershipInfo',
+    'PaintAction': 'msgspec_schemaorg.models.action.PaintAction',
+    'Painting': 'msgspec_schemaorg.models.creativework.Painting',
+    'PalliativeProcedure': 'msgspec_schemaorg.models.thing.PalliativeProcedure',
+    'ParcelDelivery': 'msgspec_schemaorg.models.intangible.ParcelDelivery',
+    'ParentAudience': 'msgspec_schemaorg.models.intangible.ParentAudience',
+    'Park': 'msgspec_schemaorg.models.place.Park',
+    'ParkingFacility': 'msgspec_schemaorg.models.place.ParkingFacility',
+    'PathologyTest': 'msgspec_schemaorg.models.thing.PathologyTest',
+    'Patient': 'msgspec_schemaorg.models.intangible.Patient',
+    'PawnShop': 'msgspec_schemaorg.models.organization.PawnShop',
+    'PayAction': 'msgspec_schemaorg.models.action.PayAction',
+    'PaymentCard': 'msgspec_schemaorg.models.intangible.PaymentCard',
+    'PaymentChargeSpecification': 'msgspec_schemaorg.models.intangible.PaymentChargeSpecification',
+    'PaymentMethod': 'msgspec_schemaorg.models.intangible.PaymentMethod',
+    'PaymentMethodType': 'msgspec_schemaorg.enums.intangible.PaymentMethodType',
+    'PaymentService': 'msgspec_schemaorg.models.intangible.PaymentService',
+    'PaymentStatusType': 'msgspec_schemaorg.enums.intangible.PaymentStatusType',
+    'PeopleAudience': 'msgspec_schemaorg.models.intangible.PeopleAudience',
+    'PerformAction': 'msgspec_schemaorg.models.action.PerformAction',
+    'PerformanceRole': 'msgspec_schemaorg.models.intangible.PerformanceRole',
+    'PerformingArtsTheater': 'msgspec_schemaorg.models.place.PerformingArtsTheater',
+    'PerformingGroup': 'msgspec_schemaorg.models.organization.PerformingGroup',
+    'Periodical': 'msgspec_schemaorg.models.creativework.Periodical',
+    'Permit': 'msgspec_schemaorg.models.intangible.Permit',
+    'Person': 'msgspec_schemaorg.models.person.Person',
+    'PetStore': 'msgspec_schemaorg.models.organization.PetStore',
+    'Pharmacy': 'msgspec_schemaorg.models.organization.Pharmacy',
+    'Photograph': 'msgspec_schemaorg.models.creativework.Photograph',
+    'PhotographAction': 'msgspec_schemaorg.models.action.PhotographAction',
+    'PhysicalActivity': 'msgspec_schemaorg.models.thing.PhysicalActivity',
+    'PhysicalActivityCategory': 'msgspec_schemaorg.enums.intangible.PhysicalActivityCategory',
+    'PhysicalExam': 'msgspec_schemaorg.enums.intangible.PhysicalExam',
+    'PhysicalTherapy': 'msgspec_schemaorg.models.thing.PhysicalTherapy',
+    'Physician': 'msgspec_schemaorg.models.organization.Physician',
+    'PhysiciansOffice': 'msgspec_schemaorg.models.organization.PhysiciansOffice',
+    'Place': 'msgspec_schemaorg.models.place.Place',
+    'PlaceOfWorship': 'msgspec_schemaorg.models.place.PlaceOfWorship',
+    'PlanAction': 'msgspec_schemaorg.models.action.PlanAction',
+    'Play': 'msgspec_schemaorg.models.creativework.Play',
+    'PlayAction': 'msgspec_schemaorg.models.action.PlayAction',
+    'PlayGameAction': 'msgspec_schemaorg.models.action.PlayGameAction',
+    'Playground': 'msgspec_schemaorg.models.place.Playground',
+    'Plumber': 'msgspec_schemaorg.models.organization.Plumber',
+    'PodcastEpisode': 'msgspec_schemaorg.models.creativework.PodcastEpisode',
+    'PodcastSeason': 'msgspec_schemaorg.models.creativework.PodcastSeason',
+    'PodcastSeries': 'msgspec_schemaorg.models.creativework.PodcastSeries',
+    'PoliceStation': 'msgspec_schemaorg.models.place.PoliceStation',
+    'PoliticalParty': 'msgspec_schemaorg.models.organization.PoliticalParty',
+    'Pond': 'msgspec_schemaorg.models.place.Pond',
+    'PostOffice': 'msgspec_schemaorg.models.organization.PostOffice',
+    'PostalAddress': 'msgspec_schemaorg.models.intangible.PostalAddress',
+    'PostalCodeRangeSpecification': 'msgspec_schemaorg.models.intangible.PostalCodeRangeSpecification',
+    'Poster': 'msgspec_schemaorg.models.creativework.Poster',
+    'PreOrderAction': 'msgspec_schemaorg.models.action.PreOrderAction',
+    'PrependAction': 'msgspec_schemaorg.models.action.PrependAction',
+    'Preschool': 'msgspec_schemaorg.models.place.Preschool',
+    'PresentationDigitalDocument': 'msgspec_schemaorg.models.creativework.PresentationDigitalDocument',
+    'PreventionIndication': 'msgspec_schemaorg.models.thing.PreventionIndication',
+    'PriceComponentTypeEnumeration': 'msgspec_schemaorg.enums.intangible.PriceComponentTypeEnumeration',
+    'PriceSpecification': 'msgspec_schemaorg.models.intangible.PriceSpecification',
+    'PriceTypeEnumeration': 'msgspec_schemaorg.enums.intangible.PriceTypeEnumeration',
+    'Product': 'msgspec_schemaorg.models.product.Product',
+    'ProductCollection': 'msgspec_schemaorg.models.product.ProductCollection',
+    'ProductGroup': 'msgspec_schemaorg.models.product.ProductGroup',
+    'ProductModel': 'msgspec_schemaorg.models.product.ProductModel',
+    'ProfessionalService': 'msgspec_schemaorg.models.organization.ProfessionalService',
+    'ProfilePage': 'msgspec_schemaorg.models.creativework.ProfilePage',
+    'ProgramMembership': 'msgspec_schemaorg.models.intangible.ProgramMembership',
+    'Project': 'msgspec_schemaorg.models.organization.Project',
+    'PronounceableText': 'msgspec_schemaorg.models.misc.PronounceableText',
+    'Property': 'msgspec_schemaorg.models.intangible.Property',
+    'PropertyValue': 'msgspec_schemaorg.models.intangible.PropertyValue',
+    'PropertyValueSpecification': 'msgspec_schemaorg.models.intangible.PropertyValueSpecification',
+    'Protein': 'msgspec_schemaorg.models.thing.Protein',
+    'PsychologicalTreatment': 'msgspec_schemaorg.models.thing.PsychologicalTreatment',
+    'PublicSwimmingPool': 'msgspec_schemaorg.models.organization.PublicSwimmingPool',
+    'PublicToilet': 'msgspec_schemaorg.models.place.PublicToilet',
+    'PublicationEvent': 'msgspec_schemaorg.models.event.PublicationEvent',
+    'PublicationIssue': 'msgspec_schemaorg.models.creativework.PublicationIssue',
+    'PublicationVolume': 'msgspec_schemaorg.models.creativework.PublicationVolume',
+    'PurchaseType': 'msgspec_schemaorg.enums.intangible.PurchaseType',
+    'QAPage': 'msgspec_schemaorg.models.creativework.QAPage',
+    'QualitativeValue': 'msgspec_schemaorg.models.intangible.QualitativeValue',
+    'QuantitativeValue': 'msgspec_schemaorg.models.intangible.QuantitativeValue',
+    'QuantitativeValueDistribution': 'msgspec_schemaorg.models.intangible.QuantitativeValueDistribution',
+    'Quantity': 'msgspec_schemaorg.models.intangible.Quantity',
+    'Question': 'msgspec_schemaorg.models.creativework.Question',
+    'Quiz': 'msgspec_schemaorg.models.creativework.Quiz',
+    'Quotation': 'msgspec_schemaorg.models.creativework.Quotation',
+    'QuoteAction': 'msgspec_schemaorg.models.action.QuoteAction',
+    'RVPark': 'msgspec_schemaorg.models.place.RVPark',
+    'RadiationTherapy': 'msgspec_schemaorg.models.thing.RadiationTherapy',
+    'RadioBroadcastService': 'msgspec_schemaorg.models.intangible.RadioBroadcastService',
+    'RadioChannel': 'msgspec_schemaorg.models.intangible.RadioChannel',
+    'RadioClip': 'msgspec_schemaorg.models.creativework.RadioClip',
+    'RadioEpisode': 'msgspec_schemaorg.models.creativework.RadioEpisode',
+    'RadioSeason': 'msgspec_schemaorg.models.creativework.RadioSeason',
+    'RadioSeries': 'msgspec_schemaorg.models.creativework.RadioSeries',
+    'RadioStation': 'msgspec_schemaorg.models.organization.RadioStation',
+    'Rating': 'msgspec_schemaorg.models.intangible.Rating',
+    'ReactAction': 'msgspec_schemaorg.models.action.ReactAction',
+    'ReadAction': 'msgspec_schemaorg.models.action.ReadAction',
+    'RealEstateAgent': 'msgspec_schemaorg.models.organization.RealEstateAgent',
+    'RealEstateListing': 'msgspec_schemaorg.models.creativework.RealEstateListing',
+    'ReceiveAction': 'msgspec_schemaorg.models.action.ReceiveAction',
+    'Recipe': 'msgspec_schemaorg.models.creativework.Recipe',
+    'Recommendation': 'msgspec_schemaorg.models.creativework.Recommendation',
+    'RecommendedDoseSchedule': 'msgspec_schemaorg.models.thing.RecommendedDoseSchedule',
+    'RecyclingCenter': 'msgspec_schemaorg.models.organization.RecyclingCenter',
+    'RefundTypeEnumeration': 'msgspec_schemaorg.enums.intangible.RefundTypeEnumeration',
+    'RegisterAction': 'msgspec_schemaorg.models.action.RegisterAction',
+    'RejectAction': 'msgspec_schemaorg.models.action.RejectAction',
+    'RentAction': 'msgspec_schemaorg.models.action.RentAction',
+    'RentalCarReservation': 'msgspec_schemaorg.models.intangible.RentalCarReservation',
+    'RepaymentSpecification': 'msgspec_schemaorg.models.intangible.RepaymentSpecification',
+    'ReplaceAction': 'msgspec_schemaorg.models.action.ReplaceAction',
+    'ReplyAction': 'msgspec_schemaorg.models.action.ReplyAction',
+    'Report': 'msgspec_schemaorg.models.creativework.Report',
+    'ReportageNewsArticle': 'msgspec_schemaorg.models.creativework.ReportageNewsArticle',
+    'ReportedDoseSchedule': 'msgspec_schemaorg.models.thing.ReportedDoseSchedule',
+    'ResearchOrganization': 'msgspec_schemaorg.models.organization.ResearchOrganization',
+    'ResearchProject': 'msgspec_schemaorg.models.organization.ResearchProject',
+    'Researcher': 'msgspec_schemaorg.models.intangible.Researcher',
+    'Reservation': 'msgspec_schemaorg.models.intangible.Reservation',
+    'ReservationPackage': 'msgspec_schemaorg.models.intangible.ReservationPackage',
+    'ReservationStatusType': 'msgspec_schemaorg.enums.intangible.ReservationStatusType',
+    'ReserveAction': 'msgspec_schemaorg.models.action.ReserveAction',
+    'Reservoir': 'msgspec_schemaorg.models.place.Reservoir',
+    'Residence': 'msgspec_schemaorg.models.place.Residence',
+    'Resort': 'msgspec_schemaorg.models.organization.Resort',
+    'Restaurant': 'msgspec_schemaorg.models.organization.Restaurant',
+    'RestrictedDiet': 'msgspec_schemaorg.enums.intangible.RestrictedDiet',
+    'ResumeAction': 'msgspec_schemaorg.models.action.ResumeAction',
+    'ReturnAction': 'msgspec_schemaorg.models.action.ReturnAction',
+    'ReturnFeesEnumeration': 'msgspec_schemaorg.enums.intangible.ReturnFeesEnumeration',
+    'ReturnLabelSourceEnumeration': 'msgspec_schemaorg.enums.intangible.ReturnLabelSourceEnumeration',
+    'ReturnMethodEnumeration': 'msgspec_schemaorg.enums.intangible.ReturnMethodEnumeration',
+    'Review': 'msgspec_schemaorg.models.creativework.Review',
+    'ReviewAction': 'msgspec_schemaorg.models.action.ReviewAction',
+    'ReviewNewsArticle': 'msgspec_schemaorg.models.creativework.ReviewNewsArticle',
+    'RiverBodyOfWater': 'msgspec_schemaorg.models.place.RiverBodyOfWater',
+    'Role': 'msgspec_schemaorg.models.intangible.Role',
+    'RoofingContractor': 'msgspec_schemaorg.models.organization.RoofingContractor',
+    'Room': 'msgspec_schemaorg.models.place.Room',
+    'RsvpAction': 'msgspec_schemaorg.models.action.RsvpAction',
+    'RsvpResponseType': 'msgspec_schemaorg.enums.intangible.RsvpResponseType',
+    'SaleEvent': 'msgspec_schemaorg.models.event.SaleEvent',
+    'SatiricalArticle': 'msgspec_schemaorg.models.creativework.SatiricalArticle',
+    'Schedule': 'msgspec_schemaorg.models.intangible.Schedule',
+    'ScheduleAction': 'msgspec_schemaorg.models.action.ScheduleAction',
+    'ScholarlyArticle': 'msgspec_schemaorg.models.creativework.ScholarlyArticle',
+    'School': 'msgspec_schemaorg.models.place.School',
+    'SchoolDistrict': 'msgspec_schemaorg.models.place.SchoolDistrict',
+    'ScreeningEvent': 'msgspec_schemaorg.models.event.ScreeningEvent',
+    'Sculpture': 'msgspec_schemaorg.models.creativework.Sculpture',
+    'SeaBodyOfWater': 'msgspec_schemaorg.models.place.SeaBodyOfWater',
+    'SearchAction': 'msgspec_schemaorg.models.action.SearchAction',
+    'SearchRescueOrganization': 'msgspec_schemaorg.models.organization.SearchRescueOrganization',
+    'SearchResultsPage': 'msgspec_schemaorg.models.creativework.SearchResultsPage',
+    'Season': 'msgspec_schemaorg.models.creativework.Season',
+    'Seat': 'msgspec_schemaorg.models.intangible.Seat',
+    'SeekToAction': 'msgspec_schemaorg.models.action.SeekToAction',
+    'SelfStorage': 'msgspec_schemaorg.models.organization.SelfStorage',
+    'SellAction': 'msgspec_schemaorg.models.action.SellAction',
+    'SendAction': 'msgspec_schemaorg.models.action.SendAction',
+    'Series': 'msgspec_schemaorg.models.intangible.Series',
+    'Service': 'msgspec_schemaorg.models.intangible.Service',
+    'ServiceChannel': 'msgspec_schemaorg.models.intangible.ServiceChannel',
+    'ServicePeriod': 'msgspec_schemaorg.models.intangible.ServicePeriod',
+    'ShareAction': 'msgspec_schemaorg.models.action.ShareAction',
+    'SheetMusic': 'msgspec_schemaorg.models.creativework.SheetMusic',
+    'ShippingConditions': 'msgspec_schemaorg.models.intangible.ShippingConditions',
+    'ShippingDeliveryTime': 'msgspec_schemaorg.models.intangible.ShippingDeliveryTime',
+    'ShippingRateSettings': 'msgspec_schemaorg.models.intangible.ShippingRateSettings',
+    'ShippingService': 'msgspec_schemaorg.models.intangible.ShippingService',
+    'ShoeStore': 'msgspec_schemaorg.models.organization.ShoeStore',
+    'ShoppingCenter': 'msgspec_schemaorg.models.organization.ShoppingCenter',
+    'ShortStory': 'msgspec_schemaorg.models.creativework.ShortStory',
+    'SingleFamilyResidence': 'msgspec_schemaorg.models.place.SingleFamilyResidence',
+    'SiteNavigationElement': 'msgspec_schemaorg.models.creativework.SiteNavigationElement',
+    'SizeGroupEnumeration': 'msgspec_schemaorg.models.intangible.SizeGroupEnumeration',
+    'SizeSpecification': 'msgspec_schemaorg.models.intangible.SizeSpecification',
+    'SizeSystemEnumeration': 'msgspec_schemaorg.enums.intangible.SizeSystemEnumeration',
+    'SkiResort': 'msgspec_schemaorg.models.organization.SkiResort',
+    'SocialEvent': 'msgspec_schemaorg.models.event.SocialEvent',
+    'SocialMediaPosting': 'msgspec_schemaorg.models.creativework.SocialMediaPosting',
+    'SoftwareApplication': 'msgspec_schemaorg.models.creativework.SoftwareApplication',
+    'SoftwareSourceCode': 'msgspec_schemaorg.models.creativework.SoftwareSourceCode',
+    'SolveMathAction': 'msgspec_schemaorg.models.action.SolveMathAction',
+    'SomeProducts': 'msgspec_schemaorg.models.product.SomeProducts',
+    'SpeakableSpecification': 'msgspec_schemaorg.models.intangible.SpeakableSpecification',
+    'SpecialAnnouncement': 'msgspec_schemaorg.models.creativework.SpecialAnnouncement',
+    'Specialty': 'msgspec_schemaorg.models.intangible.Specialty',
+    'SportingGoodsStore': 'msgspec_schemaorg.models.organization.SportingGoodsStore',
+    'SportsActivityLocation': 'msgspec_schemaorg.models.organization.SportsActivityLocation',
+    'SportsClub': 'msgspec_schemaorg.models.organization.SportsClub',
+    'SportsEvent': 'msgspec_schemaorg.models.event.SportsEvent',
+    'SportsOrganization': 'msgspec_schemaorg.models.organization.SportsOrganization',
+    'SportsTeam': 'msgspec_schemaorg.models.organization.SportsTeam',
+    'SpreadsheetDigitalDocument': 'msgspec_schemaorg.models.creativework.SpreadsheetDigitalDocument',
+    'StadiumOrArena': 'msgspec_schemaorg.models.organization.StadiumOrArena',
+    'State': 'msgspec_schemaorg.models.place.State',
+    'Statement': 'msgspec_schemaorg.models.creativework.Statement',
+    'StatisticalPopulation': 'msgspec_schemaorg.models.intangible.StatisticalPopulation',
+    'StatisticalVariable': 'msgspec_schemaorg.models.intangible.StatisticalVariable',
+    'StatusEnumeration': 'msgspec_schemaorg.models.intangible.StatusEnumeration',
+    'SteeringPositionValue': 'msgspec_schemaorg.enums.intangible.SteeringPositionValue',
+    'Store': 'msgspec_schemaorg.models.organization.Store',
+    'StructuredValue': 'msgspec_schemaorg.models.intangible.StructuredValue',
+    'SubscribeAction': 'msgspec_schemaorg.models.action.SubscribeAction',
+    'Substance': 'msgspec_schemaorg.models.thing.Substance',
+    'SubwayStation': 'msgspec_schemaorg.models.place.SubwayStation',
+    'Suite': 'msgspec_schemaorg.models.place.Suite',
+    'SuperficialAnatomy': 'msgspec_schemaorg.models.thing.SuperficialAnatomy',
+    'SurgicalProcedure': 'msgspec_schemaorg.models.thing.SurgicalProcedure',
+    'SuspendAction': 'msgspec_schemaorg.models.action.SuspendAction',
+    'Syllabus': 'msgspec_schemaorg.models.creativework.Syllabus',
+    'Synagogue': 'msgspec_schemaorg.models.place.Synagogue',
+    'TVClip': 'msgspec_schemaorg.models.creativework.TVClip',
+    'TVEpisode': 'msgspec_schemaorg.models.creativework.TVEpisode',
+    'TVSeason': 'msgspec_schemaorg.models.creativework.TVSeason',
+    'TVSeries': 'msgspec_schemaorg.models.creativework.TVSeries',
+    'Table': 'msgspec_schemaorg.models.creativework.Table',
+    'TakeAction': 'msgspec_schemaorg.models.action.TakeAction',
+    'TattooParlor': 'msgspec_schemaorg.models.organization.TattooParlor',
+    'Taxi': 'msgspec_schemaorg.models.intangible.Taxi',
+    'TaxiReservation': 'msgspec_schemaorg.models.intangible.TaxiReservation',
+    'TaxiService': 'msgspec_schemaorg.models.intangible.TaxiService',
+    'TaxiStand': 'msgspec_schemaorg.models.place.TaxiStand',
+    'Taxon': 'msgspec_schemaorg.models.thing.Taxon',
+    'TechArticle': 'msgspec_schemaorg.models.creativework.TechArticle',
+    'TelevisionChannel': 'msgspec_schemaorg.models.intangible.TelevisionChannel',
+    'TelevisionStation': 'msgspec_schemaorg.models.organization.TelevisionStation',
+    'TennisComplex': 'msgspec_schemaorg.models.organization.TennisComplex',
+    'TextDigitalDocument': 'msgspec_schemaorg.models.creativework.TextDigitalDocument',
+    'TextObject': 'msgspec_schemaorg.models.creativework.TextObject',
+    'TheaterEvent': 'msgspec_schemaorg.models.event.TheaterEvent',
+    'TheaterGroup': 'msgspec_schemaorg.models.organization.TheaterGroup',
+    'TherapeuticProcedure': 'msgspec_schemaorg.models.thing.TherapeuticProcedure',
+    'Thesis': 'msgspec_schemaorg.models.creativework.Thesis',
+    'Thing': 'msgspec_schemaorg.models.thing.Thing',
+    'Ticket': 'msgspec_schemaorg.models.intangible.Ticket',
+    'TieAction': 'msgspec_schemaorg.models.action.TieAction',
+    'TierBenefitEnumeration': 'msgspec_schemaorg.enums.intangible.TierBenefitEnumeration',
+    'TipAction': 'msgspec_schemaorg.models.action.TipAction',
+    'TireShop': 'msgspec_schemaorg.models.organization.TireShop',
+    'TouristAttraction': 'msgspec_schemaorg.models.place.TouristAttraction',
+    'TouristDestination': 'msgspec_schemaorg.models.place.TouristDestination',
+    'TouristInformationCenter': 'msgspec_schemaorg.models.organization.TouristInformationCenter',
+    'TouristTrip': 'msgspec_schemaorg.models.intangible.TouristTrip',
+    'ToyStore': 'msgspec_schemaorg.models.organization.ToyStore',
+    'TrackAction': 'msgspec_schemaorg.models.action.TrackAction',
+    'TradeAction': 'msgspec_schemaorg.models.action.TradeAction',
+    'TrainReservation': 'msgspec_schemaorg.models.intangible.TrainReservation',
+    'TrainStation': 'msgspec_schemaorg.models.place.TrainStation',
+    'TrainTrip': 'msgspec_schemaorg.models.intangible.TrainTrip',
+    'TransferAction': 'msgspec_schemaorg.models.action.TransferAction',
+    'TravelAction': 'msgspec_schemaorg.models.action.TravelAction',
+    'TravelAgency': 'msgspec_schemaorg.models.organization.TravelAgency',
+    'TreatmentIndication': 'msgspec_schemaorg.models.thing.TreatmentIndication',
+    'Trip': 'msgspec_schemaorg.models.intangible.Trip',
+    'TypeAndQuantityNode': 'msgspec_schemaorg.models.intangible.TypeAndQuantityNode',
+    'UKNonprofitType': 'msgspec_schemaorg.enums.intangible.UKNonprofitType',
+    'URL': 'msgspec_schemaorg.models.misc.URL',
+    'USNonprofitType': 'msgspec_schemaorg.enums.intangible.USNonprofitType',
+    'UnRegisterAction': 'msgspec_schemaorg.models.action.UnRegisterAction',
+    'UnitPriceSpecification': 'msgspec_schemaorg.models.intangible.UnitPriceSpecification',
+    'UpdateAction': 'msgspec_schemaorg.models.action.UpdateAction',
+    'UseAction': 'msgspec_schemaorg.models.action.UseAction',
+    'UserBlocks': 'msgspec_schemaorg.models.event.UserBlocks',
+    'UserCheckins': 'msgspec_schemaorg.models.event.UserCheckins',
+    'UserComments': 'msgspec_schemaorg.models.event.UserComments',
+    'UserDownloads': 'msgspec_schemaorg.models.event.UserDownloads',
+    'UserInteraction': 'msgspec_schemaorg.models.event.UserInteraction',
+    'UserLikes': 'msgspec_schemaorg.models.event.UserLikes',
+    'UserPageVisits': 'msgspec_schemaorg.models.event.UserPageVisits',
+    'UserPlays': 'msgspec_schemaorg.models.event.UserPlays',
+    'UserPlusOnes': 'msgspec_schemaorg.models.event.UserPlusOnes',
+    'UserReview': 'msgspec_schemaorg.models.creativework.UserReview',
+    'UserTweets': 'msgspec_schemaorg.models.event.UserTweets',
+    'VacationRental': 'msgspec_schemaorg.models.organization.VacationRental',
+    'Vehicle': 'msgspec_schemaorg.models.product.Vehicle',
+    'Vein': 'msgspec_schemaorg.models.thing.Vein',
+    'Vessel': 'msgspec_schemaorg.models.thing.Vessel',
+    'VeterinaryCare': 'msgspec_schemaorg.models.organization.VeterinaryCare',
+    'VideoGallery': 'msgspec_schemaorg.models.creativework.VideoGallery',
+    'VideoGame': 'msgspec_schemaorg.models.creativework.VideoGame',
+    'VideoGameClip': 'msgspec_schemaorg.models.creativework.VideoGameClip',
+    'VideoGameSeries': 'msgspec_schemaorg.models.creativework.VideoGameSeries',
+    'VideoObject': 'msgspec_schemaorg.models.creativework.VideoObject',
+    'VideoObjectSnapshot': 'msgspec_schemaorg.models.creativework.VideoObjectSnapshot',
+    'ViewAction': 'msgspec_schemaorg.models.action.ViewAction',
+    'VirtualLocation': 'msgspec_schemaorg.models.intangible.VirtualLocation',
+    'VisualArtsEvent': 'msgspec_schemaorg.models.event.VisualArtsEvent',
+    'VisualArtwork': 'msgspec_schemaorg.models.creativework.VisualArtwork',
+    'VitalSign': 'msgspec_schemaorg.models.thing.VitalSign',
+    'Volcano': 'msgspec_schemaorg.models.place.Volcano',
+    'VoteAction': 'msgspec_schemaorg.models.action.VoteAction',
+    'WPAdBlock': 'msgspec_schemaorg.models.creativework.WPAdBlock',
+    'WPFooter': 'msgspec_schemaorg.models.creativework.WPFooter',
+    'WPHeader': 'msgspec_schemaorg.models.creativework.WPHeader',
+    'WPSideBar': 'msgspec_schemaorg.models.creativework.WPSideBar',
+    'WantAction': 'msgspec_schemaorg.models.action.WantAction',
+    'WarrantyPromise': 'msgspec_schemaorg.models.intangible.WarrantyPromise',
+    'WarrantyScope': 'msgspec_schemaorg.models.intangible.WarrantyScope',
+    'WatchAction': 'msgspec_schemaorg.models.action.WatchAction',
+    'Waterfall': 'msgspec_schemaorg.models.place.Waterfall',
+    'WearAction': 'msgspec_schemaorg.models.action.WearAction',
+    'WearableMeasurementTypeEnumeration': 'msgspec_schemaorg.enums.intangible.WearableMeasurementTypeEnumeration',
+    'WearableSizeGroupEnumeration': 'msgspec_schemaorg.enums.intangible.WearableSizeGroupEnumeration',
+    'WearableSizeSystemEnumeration': 'msgspec_schemaorg.enums.intangible.WearableSizeSystemEnumeration',
+    'WebAPI': 'msgspec_schemaorg.models.intangible.WebAPI',
+    'WebApplication': 'msgspec_schemaorg.models.creativework.WebApplication',
+    'WebContent': 'msgspec_schemaorg.models.creativework.WebContent',
+    'WebPage': 'msgspec_schemaorg.models.creativework.WebPage',
+    'WebPageElement': 'msgspec_schemaorg.models.creativework.WebPageElement',
+    'WebSite': 'msgspec_schemaorg.models.creativework.WebSite',
+    'WholesaleStore': 'msgspec_schemaorg.models.organization.WholesaleStore',
+    'WinAction': 'msgspec_schemaorg.models.action.WinAction',
+    'Winery': 'msgspec_schemaorg.models.organization.Winery',
+    'WorkBasedProgram': 'msgspec_schemaorg.models.intangible.WorkBasedProgram',
+    'WorkersUnion': 'msgspec_schemaorg.models.organization.WorkersUnion',
+    'WriteAction': 'msgspec_schemaorg.models.action.WriteAction',
+    'XPathType': 'msgspec_schemaorg.models.misc.XPathType',
+    'Zoo': 'msgspec_schemaorg.models.place.Zoo',
+}
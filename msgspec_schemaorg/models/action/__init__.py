@@ -1,118 +1,123 @@
 """Generated Schema.org action models using msgspec."""
 
-from .JoinAction import JoinAction
-from .RejectAction import RejectAction
-from .DrawAction import DrawAction
-from .ReviewAction import ReviewAction
-from .ViewAction import ViewAction
-from .FilmAction import FilmAction
-from .PerformAction import PerformAction
-from .ReadAction import ReadAction
-from .SeekToAction import SeekToAction
-from .DislikeAction import DislikeAction
-from .PayAction import PayAction
-from .BookmarkAction import BookmarkAction
-from .AskAction import AskAction
-from .ReserveAction import ReserveAction
-from .FollowAction import FollowAction
-from .PreOrderAction import PreOrderAction
-from .ScheduleAction import ScheduleAction
-from .CheckAction import CheckAction
-from .LikeAction import LikeAction
-from .ExerciseAction import ExerciseAction
-from .PlayAction import PlayAction
-from .RsvpAction import RsvpAction
-from .ListenAction import ListenAction
-from .ReplyAction import ReplyAction
-from .SendAction import SendAction
-from .SearchAction import SearchAction
-from .WriteAction import WriteAction
-from .CheckOutAction import CheckOutAction
-from .AcceptAction import AcceptAction
-from .ReplaceAction import ReplaceAction
-from .TieAction import TieAction
-from .WinAction import WinAction
-from .ConfirmAction import ConfirmAction
-from .SolveMathAction import SolveMathAction
-from .LeaveAction import LeaveAction
-from .InviteAction import InviteAction
-from .PaintAction import PaintAction
-from .AssignAction import AssignAction
-from .CancelAction import CancelAction
-from .SubscribeAction import SubscribeAction
-from .PhotographAction import PhotographAction
-from .DiscoverAction import DiscoverAction
-from .CheckInAction import CheckInAction
-from .PrependAction import PrependAction
-from .InformAction import InformAction
-from .BorrowAction import BorrowAction
-from .EatAction import EatAction
-from .ResumeAction import ResumeAction
-from .MarryAction import MarryAction
-from .WantAction import WantAction
-from .DonateAction import DonateAction
-from .CommentAction import CommentAction
-from .DeactivateAction import DeactivateAction
-from .TipAction import TipAction
-from .TrackAction import TrackAction
-from .FindAction import FindAction
-from .DrinkAction import DrinkAction
-from .UnRegisterAction import UnRegisterAction
-from .ReceiveAction import ReceiveAction
-from .LoseAction import LoseAction
-from .AchieveAction import AchieveAction
-from .DeleteAction import DeleteAction
-from .WearAction import WearAction
-from .AuthorizeAction import AuthorizeAction
-from .AllocateAction import AllocateAction
-from .MoneyTransfer import MoneyTransfer
-from .EndorseAction import EndorseAction
-from .PlayGameAction import PlayGameAction
-from .DisagreeAction import DisagreeAction
-from .AppendAction import AppendAction
-from .InsertAction import InsertAction
-from .GiveAction import GiveAction
-from .IgnoreAction import IgnoreAction
-from .WatchAction import WatchAction
-from .DownloadAction import DownloadAction
-from .RentAction import RentAction
-from .ArriveAction import ArriveAction
-from .PlanAction import PlanAction
-from .SuspendAction import SuspendAction
-from .InstallAction import InstallAction
-from .ActivateAction import ActivateAction
-from .ControlAction import ControlAction
-from .AgreeAction import AgreeAction
-from .ReactAction import ReactAction
-from .RegisterAction import RegisterAction
-from .SellAction import SellAction
-from .DepartAction import DepartAction
-from .ReturnAction import ReturnAction
-from .OrderAction import OrderAction
-from .QuoteAction import QuoteAction
-from .UseAction import UseAction
-from .ConsumeAction import ConsumeAction
-from .AddAction import AddAction
-from .UpdateAction import UpdateAction
-from .VoteAction import VoteAction
-from .ChooseAction import ChooseAction
-from .AssessAction import AssessAction
-from .CookAction import CookAction
-from .CreateAction import CreateAction
-from .BefriendAction import BefriendAction
-from .LendAction import LendAction
-from .TravelAction import TravelAction
-from .MoveAction import MoveAction
-from .BuyAction import BuyAction
-from .TradeAction import TradeAction
-from .ShareAction import ShareAction
-from .CommunicateAction import CommunicateAction
-from .InteractAction import InteractAction
-from .ApplyAction import ApplyAction
-from .OrganizeAction import OrganizeAction
-from .TakeAction import TakeAction
-from .TransferAction import TransferAction
-from .Action import Action
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .AcceptAction import AcceptAction
+    from .AchieveAction import AchieveAction
+    from .Action import Action
+    from .ActivateAction import ActivateAction
+    from .AddAction import AddAction
+    from .AgreeAction import AgreeAction
+    from .AllocateAction import AllocateAction
+    from .AppendAction import AppendAction
+    from .ApplyAction import ApplyAction
+    from .ArriveAction import ArriveAction
+    from .AskAction import AskAction
+    from .AssessAction import AssessAction
+    from .AssignAction import AssignAction
+    from .AuthorizeAction import AuthorizeAction
+    from .BefriendAction import BefriendAction
+    from .BookmarkAction import BookmarkAction
+    from .BorrowAction import BorrowAction
+    from .BuyAction import BuyAction
+    from .CancelAction import CancelAction
+    from .CheckAction import CheckAction
+    from .CheckInAction import CheckInAction
+    from .CheckOutAction import CheckOutAction
+    from .ChooseAction import ChooseAction
+    from .CommentAction import CommentAction
+    from .CommunicateAction import CommunicateAction
+    from .ConfirmAction import ConfirmAction
+    from .ConsumeAction import ConsumeAction
+    from .ControlAction import ControlAction
+    from .CookAction import CookAction
+    from .CreateAction import CreateAction
+    from .DeactivateAction import DeactivateAction
+    from .DeleteAction import DeleteAction
+    from .DepartAction import DepartAction
+    from .DisagreeAction import DisagreeAction
+    from .DiscoverAction import DiscoverAction
+    from .DislikeAction import DislikeAction
+    from .DonateAction import DonateAction
+    from .DownloadAction import DownloadAction
+    from .DrawAction import DrawAction
+    from .DrinkAction import DrinkAction
+    from .EatAction import EatAction
+    from .EndorseAction import EndorseAction
+    from .ExerciseAction import ExerciseAction
+    from .FilmAction import FilmAction
+    from .FindAction import FindAction
+    from .FollowAction import FollowAction
+    from .GiveAction import GiveAction
+    from .IgnoreAction import IgnoreAction
+    from .InformAction import InformAction
+    from .InsertAction import InsertAction
+    from .InstallAction import InstallAction
+    from .InteractAction import InteractAction
+    from .InviteAction import InviteAction
+    from .JoinAction import JoinAction
+    from .LeaveAction import LeaveAction
+    from .LendAction import LendAction
+    from .LikeAction import LikeAction
+    from .ListenAction import ListenAction
+    from .LoseAction import LoseAction
+    from .MarryAction import MarryAction
+    from .MoneyTransfer import MoneyTransfer
+    from .MoveAction import MoveAction
+    from .OrderAction import OrderAction
+    from .OrganizeAction import OrganizeAction
+    from .PaintAction import PaintAction
+    from .PayAction import PayAction
+    from .PerformAction import PerformAction
+    from .PhotographAction import PhotographAction
+    from .PlanAction import PlanAction
+    from .PlayAction import PlayAction
+    from .PlayGameAction import PlayGameAction
+    from .PreOrderAction import PreOrderAction
+    from .PrependAction import PrependAction
+    from .QuoteAction import QuoteAction
+    from .ReactAction import ReactAction
+    from .ReadAction import ReadAction
+    from .ReceiveAction import ReceiveAction
+    from .RegisterAction import RegisterAction
+    from .RejectAction import RejectAction
+    from .RentAction import RentAction
+    from .ReplaceAction import ReplaceAction
+    from .ReplyAction import ReplyAction
+    from .ReserveAction import ReserveAction
+    from .ResumeAction import ResumeAction
+    from .ReturnAction import ReturnAction
+    from .ReviewAction import ReviewAction
+    from .RsvpAction import RsvpAction
+    from .ScheduleAction import ScheduleAction
+    from .SearchAction import SearchAction
+    from .SeekToAction import SeekToAction
+    from .SellAction import SellAction
+    from .SendAction import SendAction
+    from .ShareAction import ShareAction
+    from .SolveMathAction import SolveMathAction
+    from .SubscribeAction import SubscribeAction
+    from .SuspendAction import SuspendAction
+    from .TakeAction import TakeAction
+    from .TieAction import TieAction
+    from .TipAction import TipAction
+    from .TrackAction import TrackAction
+    from .TradeAction import TradeAction
+    from .TransferAction import TransferAction
+    from .TravelAction import TravelAction
+    from .UnRegisterAction import UnRegisterAction
+    from .UpdateAction import UpdateAction
+    from .UseAction import UseAction
+    from .ViewAction import ViewAction
+    from .VoteAction import VoteAction
+    from .WantAction import WantAction
+    from .WatchAction import WatchAction
+    from .WearAction import WearAction
+    from .WinAction import WinAction
+    from .WriteAction import WriteAction
 
 __all__ = [
     'AcceptAction',
@@ -229,3 +234,122 @@ __all__ = [
     'WinAction',
     'WriteAction',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'AcceptAction': 'AcceptAction',
+        'AchieveAction': 'AchieveAction',
+        'Action': 'Action',
+        'ActivateAction': 'ActivateAction',
+        'AddAction': 'AddAction',
+        'AgreeAction': 'AgreeAction',
+        'AllocateAction': 'AllocateAction',
+        'AppendAction': 'AppendAction',
+        'ApplyAction': 'ApplyAction',
+        'ArriveAction': 'ArriveAction',
+        'AskAction': 'AskAction',
+        'AssessAction': 'AssessAction',
+        'AssignAction': 'AssignAction',
+        'AuthorizeAction': 'AuthorizeAction',
+        'BefriendAction': 'BefriendAction',
+        'BookmarkAction': 'BookmarkAction',
+        'BorrowAction': 'BorrowAction',
+        'BuyAction': 'BuyAction',
+        'CancelAction': 'CancelAction',
+        'CheckAction': 'CheckAction',
+        'CheckInAction': 'CheckInAction',
+        'CheckOutAction': 'CheckOutAction',
+        'ChooseAction': 'ChooseAction',
+        'CommentAction': 'CommentAction',
+        'CommunicateAction': 'CommunicateAction',
+        'ConfirmAction': 'ConfirmAction',
+        'ConsumeAction': 'ConsumeAction',
+        'ControlAction': 'ControlAction',
+        'CookAction': 'CookAction',
+        'CreateAction': 'CreateAction',
+        'DeactivateAction': 'DeactivateAction',
+        'DeleteAction': 'DeleteAction',
+        'DepartAction': 'DepartAction',
+        'DisagreeAction': 'DisagreeAction',
+        'DiscoverAction': 'DiscoverAction',
+        'DislikeAction': 'DislikeAction',
+        'DonateAction': 'DonateAction',
+        'DownloadAction': 'DownloadAction',
+        'DrawAction': 'DrawAction',
+        'DrinkAction': 'DrinkAction',
+        'EatAction': 'EatAction',
+        'EndorseAction': 'EndorseAction',
+        'ExerciseAction': 'ExerciseAction',
+        'FilmAction': 'FilmAction',
+        'FindAction': 'FindAction',
+        'FollowAction': 'FollowAction',
+        'GiveAction': 'GiveAction',
+        'IgnoreAction': 'IgnoreAction',
+        'InformAction': 'InformAction',
+        'InsertAction': 'InsertAction',
+        'InstallAction': 'InstallAction',
+        'InteractAction': 'InteractAction',
+        'InviteAction': 'InviteAction',
+        'JoinAction': 'JoinAction',
+        'LeaveAction': 'LeaveAction',
+        'LendAction': 'LendAction',
+        'LikeAction': 'LikeAction',
+        'ListenAction': 'ListenAction',
+        'LoseAction': 'LoseAction',
+        'MarryAction': 'MarryAction',
+        'MoneyTransfer': 'MoneyTransfer',
+        'MoveAction': 'MoveAction',
+        'OrderAction': 'OrderAction',
+        'OrganizeAction': 'OrganizeAction',
+        'PaintAction': 'PaintAction',
+        'PayAction': 'PayAction',
+        'PerformAction': 'PerformAction',
+        'PhotographAction': 'PhotographAction',
+        'PlanAction': 'PlanAction',
+        'PlayAction': 'PlayAction',
+        'PlayGameAction': 'PlayGameAction',
+        'PreOrderAction': 'PreOrderAction',
+        'PrependAction': 'PrependAction',
+        'QuoteAction': 'QuoteAction',
+        'ReactAction': 'ReactAction',
+        'ReadAction': 'ReadAction',
+        'ReceiveAction': 'ReceiveAction',
+        'RegisterAction': 'RegisterAction',
+        'RejectAction': 'RejectAction',
+        'RentAction': 'RentAction',
+        'ReplaceAction': 'ReplaceAction',
+        'ReplyAction': 'ReplyAction',
+        'ReserveAction': 'ReserveAction',
+        'ResumeAction': 'ResumeAction',
+        'ReturnAction': 'ReturnAction',
+        'ReviewAction': 'ReviewAction',
+        'RsvpAction': 'RsvpAction',
+        'ScheduleAction': 'ScheduleAction',
+        'SearchAction': 'SearchAction',
+        'SeekToAction': 'SeekToAction',
+        'SellAction': 'SellAction',
+        'SendAction': 'SendAction',
+        'ShareAction': 'ShareAction',
+        'SolveMathAction': 'SolveMathAction',
+        'SubscribeAction': 'SubscribeAction',
+        'SuspendAction': 'SuspendAction',
+        'TakeAction': 'TakeAction',
+        'TieAction': 'TieAction',
+        'TipAction': 'TipAction',
+        'TrackAction': 'TrackAction',
+        'TradeAction': 'TradeAction',
+        'TransferAction': 'TransferAction',
+        'TravelAction': 'TravelAction',
+        'UnRegisterAction': 'UnRegisterAction',
+        'UpdateAction': 'UpdateAction',
+        'UseAction': 'UseAction',
+        'ViewAction': 'ViewAction',
+        'VoteAction': 'VoteAction',
+        'WantAction': 'WantAction',
+        'WatchAction': 'WatchAction',
+        'WearAction': 'WearAction',
+        'WinAction': 'WinAction',
+        'WriteAction': 'WriteAction',
+    },
+)
@@ -1,174 +1,179 @@
 """Generated Schema.org creativework models using msgspec."""
 
-from .Newspaper import Newspaper
-from .EmployerReview import EmployerReview
-from .AudioObjectSnapshot import AudioObjectSnapshot
-from .TVEpisode import TVEpisode
-from .WPAdBlock import WPAdBlock
-from .Movie import Movie
-from .PublicationVolume import PublicationVolume
-from .Model3DModel import Model3DModel
-from .LegislationObject import LegislationObject
-from .ItemPage import ItemPage
-from .TextObject import TextObject
-from .ImageGallery import ImageGallery
-from .Chapter import Chapter
-from .Map import Map
-from .RadioSeason import RadioSeason
-from .Code import Code
-from .APIReference import APIReference
-from .Table import Table
-from .TVSeason import TVSeason
-from .RadioClip import RadioClip
-from .ProfilePage import ProfilePage
-from .Drawing import Drawing
-from .VideoGameSeries import VideoGameSeries
-from .TVSeries import TVSeries
-from .HowToSection import HowToSection
-from .SiteNavigationElement import SiteNavigationElement
-from .PodcastSeries import PodcastSeries
-from .Barcode import Barcode
-from .Manuscript import Manuscript
-from .Answer import Answer
-from .MusicRecording import MusicRecording
-from .HyperTocEntry import HyperTocEntry
-from .CheckoutPage import CheckoutPage
-from .LiveBlogPosting import LiveBlogPosting
-from .FAQPage import FAQPage
-from .CompleteDataFeed import CompleteDataFeed
-from .DataFeed import DataFeed
-from .Syllabus import Syllabus
-from .DataCatalog import DataCatalog
-from .MusicVideoObject import MusicVideoObject
-from .OpinionNewsArticle import OpinionNewsArticle
-from .NoteDigitalDocument import NoteDigitalDocument
-from .Dataset import Dataset
-from .VideoGame import VideoGame
-from .Photograph import Photograph
-from .Collection import Collection
-from .Game import Game
-from .MovieSeries import MovieSeries
-from .BookSeries import BookSeries
-from .ReportageNewsArticle import ReportageNewsArticle
-from .AboutPage import AboutPage
-from .VideoGallery import VideoGallery
-from .Audiobook import Audiobook
-from .AskPublicNewsArticle import AskPublicNewsArticle
-from .CoverArt import CoverArt
-from .VisualArtwork import VisualArtwork
-from .MathSolver import MathSolver
-from .Claim import Claim
-from .RadioEpisode import RadioEpisode
-from .WebApplication import WebApplication
-from .HealthTopicContent import HealthTopicContent
-from .TVClip import TVClip
-from .SearchResultsPage import SearchResultsPage
-from .Blog import Blog
-from .WPHeader import WPHeader
-from .Recommendation import Recommendation
-from .AmpStory import AmpStory
-from .ArchiveComponent import ArchiveComponent
-from .Atlas import Atlas
-from .Sculpture import Sculpture
-from .CorrectionComment import CorrectionComment
-from .CriticReview import CriticReview
-from .AdvertiserContentArticle import AdvertiserContentArticle
-from .HyperToc import HyperToc
-from .RealEstateListing import RealEstateListing
-from .Thesis import Thesis
-from .SpecialAnnouncement import SpecialAnnouncement
-from .MenuSection import MenuSection
-from .MusicAlbum import MusicAlbum
-from .Play import Play
-from .MovieClip import MovieClip
-from .WPSideBar import WPSideBar
-from .RadioSeries import RadioSeries
-from .SpreadsheetDigitalDocument import SpreadsheetDigitalDocument
-from .ShortStory import ShortStory
-from .VideoObjectSnapshot import VideoObjectSnapshot
-from .Diet import Diet
-from .MedicalWebPage import MedicalWebPage
-from .SoftwareSourceCode import SoftwareSourceCode
-from .Painting import Painting
-from .WebContent import WebContent
-from .EducationalOccupationalCredential import EducationalOccupationalCredential
-from .Poster import Poster
-from .Recipe import Recipe
-from .PodcastSeason import PodcastSeason
-from .CreativeWorkSeason import CreativeWorkSeason
-from .Book import Book
-from .BlogPosting import BlogPosting
-from .ReviewNewsArticle import ReviewNewsArticle
-from .VideoGameClip import VideoGameClip
-from .Clip import Clip
-from .Menu import Menu
-from .UserReview import UserReview
-from .Question import Question
-from .Comment import Comment
-from .DataDownload import DataDownload
-from .ComicIssue import ComicIssue
-from .PublicationIssue import PublicationIssue
-from .BackgroundNewsArticle import BackgroundNewsArticle
-from .Season import Season
-from .PodcastEpisode import PodcastEpisode
-from .Quiz import Quiz
-from .ComicCoverArt import ComicCoverArt
-from .WPFooter import WPFooter
-from .WebPageElement import WebPageElement
-from .EmailMessage import EmailMessage
-from .Message import Message
-from .Episode import Episode
-from .SatiricalArticle import SatiricalArticle
-from .AudioObject import AudioObject
-from .SheetMusic import SheetMusic
-from .MediaReview import MediaReview
-from .MobileApplication import MobileApplication
-from .SoftwareApplication import SoftwareApplication
-from .Certification import Certification
-from .MusicRelease import MusicRelease
-from .MusicPlaylist import MusicPlaylist
-from .CategoryCodeSet import CategoryCodeSet
-from .DefinedTermSet import DefinedTermSet
-from .ImageObjectSnapshot import ImageObjectSnapshot
-from .ImageObject import ImageObject
-from .HowToTip import HowToTip
-from .QAPage import QAPage
-from .WebSite import WebSite
-from .TextDigitalDocument import TextDigitalDocument
-from .MediaGallery import MediaGallery
-from .Quotation import Quotation
-from .CollectionPage import CollectionPage
-from .TechArticle import TechArticle
-from .ComicStory import ComicStory
-from .MedicalScholarlyArticle import MedicalScholarlyArticle
-from .ScholarlyArticle import ScholarlyArticle
-from .ClaimReview import ClaimReview
-from .PresentationDigitalDocument import PresentationDigitalDocument
-from .DigitalDocument import DigitalDocument
-from .DiscussionForumPosting import DiscussionForumPosting
-from .SocialMediaPosting import SocialMediaPosting
-from .Statement import Statement
-from .Report import Report
-from .Review import Review
-from .Course import Course
-from .LearningResource import LearningResource
-from .MediaReviewItem import MediaReviewItem
-from .Conversation import Conversation
-from .HowTo import HowTo
-from .Legislation import Legislation
-from .VideoObject import VideoObject
-from .MediaObject import MediaObject
-from .Guide import Guide
-from .AnalysisNewsArticle import AnalysisNewsArticle
-from .NewsArticle import NewsArticle
-from .ContactPage import ContactPage
-from .WebPage import WebPage
-from .Article import Article
-from .ComicSeries import ComicSeries
-from .Periodical import Periodical
-from .CreativeWorkSeries import CreativeWorkSeries
-from .MusicComposition import MusicComposition
-from .CreativeWork import CreativeWork
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .APIReference import APIReference
+    from .AboutPage import AboutPage
+    from .AdvertiserContentArticle import AdvertiserContentArticle
+    from .AmpStory import AmpStory
+    from .AnalysisNewsArticle import AnalysisNewsArticle
+    from .Answer import Answer
+    from .ArchiveComponent import ArchiveComponent
+    from .Article import Article
+    from .AskPublicNewsArticle import AskPublicNewsArticle
+    from .Atlas import Atlas
+    from .AudioObject import AudioObject
+    from .AudioObjectSnapshot import AudioObjectSnapshot
+    from .Audiobook import Audiobook
+    from .BackgroundNewsArticle import BackgroundNewsArticle
+    from .Barcode import Barcode
+    from .Blog import Blog
+    from .BlogPosting import BlogPosting
+    from .Book import Book
+    from .BookSeries import BookSeries
+    from .CategoryCodeSet import CategoryCodeSet
+    from .Certification import Certification
+    from .Chapter import Chapter
+    from .CheckoutPage import CheckoutPage
+    from .Claim import Claim
+    from .ClaimReview import ClaimReview
+    from .Clip import Clip
+    from .Code import Code
+    from .Collection import Collection
+    from .CollectionPage import CollectionPage
+    from .ComicCoverArt import ComicCoverArt
+    from .ComicIssue import ComicIssue
+    from .ComicSeries import ComicSeries
+    from .ComicStory import ComicStory
+    from .Comment import Comment
+    from .CompleteDataFeed import CompleteDataFeed
+    from .ContactPage import ContactPage
+    from .Conversation import Conversation
+    from .CorrectionComment import CorrectionComment
+    from .Course import Course
+    from .CoverArt import CoverArt
+    from .CreativeWork import CreativeWork
+    from .CreativeWorkSeason import CreativeWorkSeason
+    from .CreativeWorkSeries import CreativeWorkSeries
+    from .CriticReview import CriticReview
+    from .DataCatalog import DataCatalog
+    from .DataDownload import DataDownload
+    from .DataFeed import DataFeed
+    from .Dataset import Dataset
+    from .DefinedTermSet import DefinedTermSet
+    from .Diet import Diet
+    from .DigitalDocument import DigitalDocument
+    from .DiscussionForumPosting import DiscussionForumPosting
+    from .Drawing import Drawing
+    from .EducationalOccupationalCredential import EducationalOccupationalCredential
+    from .EmailMessage import EmailMessage
+    from .EmployerReview import EmployerReview
+    from .Episode import Episode
+    from .FAQPage import FAQPage
+    from .Game import Game
+    from .Guide import Guide
+    from .HealthTopicContent import HealthTopicContent
+    from .HowTo import HowTo
+    from .HowToSection import HowToSection
+    from .HowToTip import HowToTip
+    from .HyperToc import HyperToc
+    from .HyperTocEntry import HyperTocEntry
+    from .ImageGallery import ImageGallery
+    from .ImageObject import ImageObject
+    from .ImageObjectSnapshot import ImageObjectSnapshot
+    from .ItemPage import ItemPage
+    from .LearningResource import LearningResource
+    from .Legislation import Legislation
+    from .LegislationObject import LegislationObject
+    from .LiveBlogPosting import LiveBlogPosting
+    from .Manuscript import Manuscript
+    from .Map import Map
+    from .MathSolver import MathSolver
+    from .MediaGallery import MediaGallery
+    from .MediaObject import MediaObject
+    from .MediaReview import MediaReview
+    from .MediaReviewItem import MediaReviewItem
+    from .MedicalScholarlyArticle import MedicalScholarlyArticle
+    from .MedicalWebPage import MedicalWebPage
+    from .Menu import Menu
+    from .MenuSection import MenuSection
+    from .Message import Message
+    from .MobileApplication import MobileApplication
+    from .Model3DModel import Model3DModel
+    from .Movie import Movie
+    from .MovieClip import MovieClip
+    from .MovieSeries import MovieSeries
+    from .MusicAlbum import MusicAlbum
+    from .MusicComposition import MusicComposition
+    from .MusicPlaylist import MusicPlaylist
+    from .MusicRecording import MusicRecording
+    from .MusicRelease import MusicRelease
+    from .MusicVideoObject import MusicVideoObject
+    from .NewsArticle import NewsArticle
+    from .Newspaper import Newspaper
+    from .NoteDigitalDocument import NoteDigitalDocument
+    from .OpinionNewsArticle import OpinionNewsArticle
+    from .Painting import Painting
+    from .Periodical import Periodical
+    from .Photograph import Photograph
+    from .Play import Play
+    from .PodcastEpisode import PodcastEpisode
+    from .PodcastSeason import PodcastSeason
+    from .PodcastSeries import PodcastSeries
+    from .Poster import Poster
+    from .PresentationDigitalDocument import PresentationDigitalDocument
+    from .ProfilePage import ProfilePage
+    from .PublicationIssue import PublicationIssue
+    from .PublicationVolume import PublicationVolume
+    from .QAPage import QAPage
+    from .Question import Question
+    from .Quiz import Quiz
+    from .Quotation import Quotation
+    from .RadioClip import RadioClip
+    from .RadioEpisode import RadioEpisode
+    from .RadioSeason import RadioSeason
+    from .RadioSeries import RadioSeries
+    from .RealEstateListing import RealEstateListing
+    from .Recipe import Recipe
+    from .Recommendation import Recommendation
+    from .Report import Report
+    from .ReportageNewsArticle import ReportageNewsArticle
+    from .Review import Review
+    from .ReviewNewsArticle import ReviewNewsArticle
+    from .SatiricalArticle import SatiricalArticle
+    from .ScholarlyArticle import ScholarlyArticle
+    from .Sculpture import Sculpture
+    from .SearchResultsPage import SearchResultsPage
+    from .Season import Season
+    from .SheetMusic import SheetMusic
+    from .ShortStory import ShortStory
+    from .SiteNavigationElement import SiteNavigationElement
+    from .SocialMediaPosting import SocialMediaPosting
+    from .SoftwareApplication import SoftwareApplication
+    from .SoftwareSourceCode import SoftwareSourceCode
+    from .SpecialAnnouncement import SpecialAnnouncement
+    from .SpreadsheetDigitalDocument import SpreadsheetDigitalDocument
+    from .Statement import Statement
+    from .Syllabus import Syllabus
+    from .TVClip import TVClip
+    from .TVEpisode import TVEpisode
+    from .TVSeason import TVSeason
+    from .TVSeries import TVSeries
+    from .Table import Table
+    from .TechArticle import TechArticle
+    from .TextDigitalDocument import TextDigitalDocument
+    from .TextObject import TextObject
+    from .Thesis import Thesis
+    from .UserReview import UserReview
+    from .VideoGallery import VideoGallery
+    from .VideoGame import VideoGame
+    from .VideoGameClip import VideoGameClip
+    from .VideoGameSeries import VideoGameSeries
+    from .VideoObject import VideoObject
+    from .VideoObjectSnapshot import VideoObjectSnapshot
+    from .VisualArtwork import VisualArtwork
+    from .WPAdBlock import WPAdBlock
+    from .WPFooter import WPFooter
+    from .WPHeader import WPHeader
+    from .WPSideBar import WPSideBar
+    from .WebApplication import WebApplication
+    from .WebContent import WebContent
+    from .WebPage import WebPage
+    from .WebPageElement import WebPageElement
+    from .WebSite import WebSite
 
 __all__ = [
     'APIReference',
@@ -341,3 +346,178 @@ __all__ = [
     'WebPageElement',
     'WebSite',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'APIReference': 'APIReference',
+        'AboutPage': 'AboutPage',
+        'AdvertiserContentArticle': 'AdvertiserContentArticle',
+        'AmpStory': 'AmpStory',
+        'AnalysisNewsArticle': 'AnalysisNewsArticle',
+        'Answer': 'Answer',
+        'ArchiveComponent': 'ArchiveComponent',
+        'Article': 'Article',
+        'AskPublicNewsArticle': 'AskPublicNewsArticle',
+        'Atlas': 'Atlas',
+        'AudioObject': 'AudioObject',
+        'AudioObjectSnapshot': 'AudioObjectSnapshot',
+        'Audiobook': 'Audiobook',
+        'BackgroundNewsArticle': 'BackgroundNewsArticle',
+        'Barcode': 'Barcode',
+        'Blog': 'Blog',
+        'BlogPosting': 'BlogPosting',
+        'Book': 'Book',
+        'BookSeries': 'BookSeries',
+        'CategoryCodeSet': 'CategoryCodeSet',
+        'Certification': 'Certification',
+        'Chapter': 'Chapter',
+        'CheckoutPage': 'CheckoutPage',
+        'Claim': 'Claim',
+        'ClaimReview': 'ClaimReview',
+        'Clip': 'Clip',
+        'Code': 'Code',
+        'Collection': 'Collection',
+        'CollectionPage': 'CollectionPage',
+        'ComicCoverArt': 'ComicCoverArt',
+        'ComicIssue': 'ComicIssue',
+        'ComicSeries': 'ComicSeries',
+        'ComicStory': 'ComicStory',
+        'Comment': 'Comment',
+        'CompleteDataFeed': 'CompleteDataFeed',
+        'ContactPage': 'ContactPage',
+        'Conversation': 'Conversation',
+        'CorrectionComment': 'CorrectionComment',
+        'Course': 'Course',
+        'CoverArt': 'CoverArt',
+        'CreativeWork': 'CreativeWork',
+        'CreativeWorkSeason': 'CreativeWorkSeason',
+        'CreativeWorkSeries': 'CreativeWorkSeries',
+        'CriticReview': 'CriticReview',
+        'DataCatalog': 'DataCatalog',
+        'DataDownload': 'DataDownload',
+        'DataFeed': 'DataFeed',
+        'Dataset': 'Dataset',
+        'DefinedTermSet': 'DefinedTermSet',
+        'Diet': 'Diet',
+        'DigitalDocument': 'DigitalDocument',
+        'DiscussionForumPosting': 'DiscussionForumPosting',
+        'Drawing': 'Drawing',
+        'EducationalOccupationalCredential': 'EducationalOccupationalCredential',
+        'EmailMessage': 'EmailMessage',
+        'EmployerReview': 'EmployerReview',
+        'Episode': 'Episode',
+        'FAQPage': 'FAQPage',
+        'Game': 'Game',
+        'Guide': 'Guide',
+        'HealthTopicContent': 'HealthTopicContent',
+        'HowTo': 'HowTo',
+        'HowToSection': 'HowToSection',
+        'HowToTip': 'HowToTip',
+        'HyperToc': 'HyperToc',
+        'HyperTocEntry': 'HyperTocEntry',
+        'ImageGallery': 'ImageGallery',
+        'ImageObject': 'ImageObject',
+        'ImageObjectSnapshot': 'ImageObjectSnapshot',
+        'ItemPage': 'ItemPage',
+        'LearningResource': 'LearningResource',
+        'Legislation': 'Legislation',
+        'LegislationObject': 'LegislationObject',
+        'LiveBlogPosting': 'LiveBlogPosting',
+        'Manuscript': 'Manuscript',
+        'Map': 'Map',
+        'MathSolver': 'MathSolver',
+        'MediaGallery': 'MediaGallery',
+        'MediaObject': 'MediaObject',
+        'MediaReview': 'MediaReview',
+        'MediaReviewItem': 'MediaReviewItem',
+        'MedicalScholarlyArticle': 'MedicalScholarlyArticle',
+        'MedicalWebPage': 'MedicalWebPage',
+        'Menu': 'Menu',
+        'MenuSection': 'MenuSection',
+        'Message': 'Message',
+        'MobileApplication': 'MobileApplication',
+        'Model3DModel': 'Model3DModel',
+        'Movie': 'Movie',
+        'MovieClip': 'MovieClip',
+        'MovieSeries': 'MovieSeries',
+        'MusicAlbum': 'MusicAlbum',
+        'MusicComposition': 'MusicComposition',
+        'MusicPlaylist': 'MusicPlaylist',
+        'MusicRecording': 'MusicRecording',
+        'MusicRelease': 'MusicRelease',
+        'MusicVideoObject': 'MusicVideoObject',
+        'NewsArticle': 'NewsArticle',
+        'Newspaper': 'Newspaper',
+        'NoteDigitalDocument': 'NoteDigitalDocument',
+        'OpinionNewsArticle': 'OpinionNewsArticle',
+        'Painting': 'Painting',
+        'Periodical': 'Periodical',
+        'Photograph': 'Photograph',
+        'Play': 'Play',
+        'PodcastEpisode': 'PodcastEpisode',
+        'PodcastSeason': 'PodcastSeason',
+        'PodcastSeries': 'PodcastSeries',
+        'Poster': 'Poster',
+        'PresentationDigitalDocument': 'PresentationDigitalDocument',
+        'ProfilePage': 'ProfilePage',
+        'PublicationIssue': 'PublicationIssue',
+        'PublicationVolume': 'PublicationVolume',
+        'QAPage': 'QAPage',
+        'Question': 'Question',
+        'Quiz': 'Quiz',
+        'Quotation': 'Quotation',
+        'RadioClip': 'RadioClip',
+        'RadioEpisode': 'RadioEpisode',
+        'RadioSeason': 'RadioSeason',
+        'RadioSeries': 'RadioSeries',
+        'RealEstateListing': 'RealEstateListing',
+        'Recipe': 'Recipe',
+        'Recommendation': 'Recommendation',
+        'Report': 'Report',
+        'ReportageNewsArticle': 'ReportageNewsArticle',
+        'Review': 'Review',
+        'ReviewNewsArticle': 'ReviewNewsArticle',
+        'SatiricalArticle': 'SatiricalArticle',
+        'ScholarlyArticle': 'ScholarlyArticle',
+        'Sculpture': 'Sculpture',
+        'SearchResultsPage': 'SearchResultsPage',
+        'Season': 'Season',
+        'SheetMusic': 'SheetMusic',
+        'ShortStory': 'ShortStory',
+        'SiteNavigationElement': 'SiteNavigationElement',
+        'SocialMediaPosting': 'SocialMediaPosting',
+        'SoftwareApplication': 'SoftwareApplication',
+        'SoftwareSourceCode': 'SoftwareSourceCode',
+        'SpecialAnnouncement': 'SpecialAnnouncement',
+        'SpreadsheetDigitalDocument': 'SpreadsheetDigitalDocument',
+        'Statement': 'Statement',
+        'Syllabus': 'Syllabus',
+        'TVClip': 'TVClip',
+        'TVEpisode': 'TVEpisode',
+        'TVSeason': 'TVSeason',
+        'TVSeries': 'TVSeries',
+        'Table': 'Table',
+        'TechArticle': 'TechArticle',
+        'TextDigitalDocument': 'TextDigitalDocument',
+        'TextObject': 'TextObject',
+        'Thesis': 'Thesis',
+        'UserReview': 'UserReview',
+        'VideoGallery': 'VideoGallery',
+        'VideoGame': 'VideoGame',
+        'VideoGameClip': 'VideoGameClip',
+        'VideoGameSeries': 'VideoGameSeries',
+        'VideoObject': 'VideoObject',
+        'VideoObjectSnapshot': 'VideoObjectSnapshot',
+        'VisualArtwork': 'VisualArtwork',
+        'WPAdBlock': 'WPAdBlock',
+        'WPFooter': 'WPFooter',
+        'WPHeader': 'WPHeader',
+        'WPSideBar': 'WPSideBar',
+        'WebApplication': 'WebApplication',
+        'WebContent': 'WebContent',
+        'WebPage': 'WebPage',
+        'WebPageElement': 'WebPageElement',
+        'WebSite': 'WebSite',
+    },
+)
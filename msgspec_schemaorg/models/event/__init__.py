@@ -1,38 +1,43 @@
 """Generated Schema.org event models using msgspec."""
 
-from .UserLikes import UserLikes
-from .Festival import Festival
-from .DeliveryEvent import DeliveryEvent
-from .UserPageVisits import UserPageVisits
-from .ChildrensEvent import ChildrensEvent
-from .CourseInstance import CourseInstance
-from .SportsEvent import SportsEvent
-from .BroadcastEvent import BroadcastEvent
-from .UserCheckins import UserCheckins
-from .ExhibitionEvent import ExhibitionEvent
-from .UserTweets import UserTweets
-from .UserPlays import UserPlays
-from .TheaterEvent import TheaterEvent
-from .OnDemandEvent import OnDemandEvent
-from .UserBlocks import UserBlocks
-from .VisualArtsEvent import VisualArtsEvent
-from .EducationEvent import EducationEvent
-from .SocialEvent import SocialEvent
-from .SaleEvent import SaleEvent
-from .FoodEvent import FoodEvent
-from .UserComments import UserComments
-from .UserDownloads import UserDownloads
-from .Hackathon import Hackathon
-from .PublicationEvent import PublicationEvent
-from .ScreeningEvent import ScreeningEvent
-from .UserPlusOnes import UserPlusOnes
-from .MusicEvent import MusicEvent
-from .DanceEvent import DanceEvent
-from .UserInteraction import UserInteraction
-from .LiteraryEvent import LiteraryEvent
-from .BusinessEvent import BusinessEvent
-from .ComedyEvent import ComedyEvent
-from .Event import Event
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .BroadcastEvent import BroadcastEvent
+    from .BusinessEvent import BusinessEvent
+    from .ChildrensEvent import ChildrensEvent
+    from .ComedyEvent import ComedyEvent
+    from .CourseInstance import CourseInstance
+    from .DanceEvent import DanceEvent
+    from .DeliveryEvent import DeliveryEvent
+    from .EducationEvent import EducationEvent
+    from .Event import Event
+    from .ExhibitionEvent import ExhibitionEvent
+    from .Festival import Festival
+    from .FoodEvent import FoodEvent
+    from .Hackathon import Hackathon
+    from .LiteraryEvent import LiteraryEvent
+    from .MusicEvent import MusicEvent
+    from .OnDemandEvent import OnDemandEvent
+    from .PublicationEvent import PublicationEvent
+    from .SaleEvent import SaleEvent
+    from .ScreeningEvent import ScreeningEvent
+    from .SocialEvent import SocialEvent
+    from .SportsEvent import SportsEvent
+    from .TheaterEvent import TheaterEvent
+    from .UserBlocks import UserBlocks
+    from .UserCheckins import UserCheckins
+    from .UserComments import UserComments
+    from .UserDownloads import UserDownloads
+    from .UserInteraction import UserInteraction
+    from .UserLikes import UserLikes
+    from .UserPageVisits import UserPageVisits
+    from .UserPlays import UserPlays
+    from .UserPlusOnes import UserPlusOnes
+    from .UserTweets import UserTweets
+    from .VisualArtsEvent import VisualArtsEvent
 
 __all__ = [
     'BroadcastEvent',
@@ -69,3 +74,42 @@ __all__ = [
     'UserTweets',
     'VisualArtsEvent',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'BroadcastEvent': 'BroadcastEvent',
+        'BusinessEvent': 'BusinessEvent',
+        'ChildrensEvent': 'ChildrensEvent',
+        'ComedyEvent': 'ComedyEvent',
+        'CourseInstance': 'CourseInstance',
+        'DanceEvent': 'DanceEvent',
+        'DeliveryEvent': 'DeliveryEvent',
+        'EducationEvent': 'EducationEvent',
+        'Event': 'Event',
+        'ExhibitionEvent': 'ExhibitionEvent',
+        'Festival': 'Festival',
+        'FoodEvent': 'FoodEvent',
+        'Hackathon': 'Hackathon',
+        'LiteraryEvent': 'LiteraryEvent',
+        'MusicEvent': 'MusicEvent',
+        'OnDemandEvent': 'OnDemandEvent',
+        'PublicationEvent': 'PublicationEvent',
+        'SaleEvent': 'SaleEvent',
+        'ScreeningEvent': 'ScreeningEvent',
+        'SocialEvent': 'SocialEvent',
+        'SportsEvent': 'SportsEvent',
+        'TheaterEvent': 'TheaterEvent',
+        'UserBlocks': 'UserBlocks',
+        'UserCheckins': 'UserCheckins',
+        'UserComments': 'UserComments',
+        'UserDownloads': 'UserDownloads',
+        'UserInteraction': 'UserInteraction',
+        'UserLikes': 'UserLikes',
+        'UserPageVisits': 'UserPageVisits',
+        'UserPlays': 'UserPlays',
+        'UserPlusOnes': 'UserPlusOnes',
+        'UserTweets': 'UserTweets',
+        'VisualArtsEvent': 'VisualArtsEvent',
+    },
+)
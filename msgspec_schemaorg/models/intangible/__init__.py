@@ -1,199 +1,202 @@
 """Generated Schema.org intangible models using msgspec."""
 
-from .InteractionCounter import InteractionCounter
-from .GameServer import GameServer
-from .InvestmentFund import InvestmentFund
-from .BedType import BedType
-from .EventReservation import EventReservation
-from .NutritionInformation import NutritionInformation
-from .Language import Language
-from .EngineSpecification import EngineSpecification
-from .RentalCarReservation import RentalCarReservation
-from .MonetaryGrant import MonetaryGrant
-from .FoodService import FoodService
-from .LinkRole import LinkRole
-from .HowToTool import HowToTool
-from .LocationFeatureSpecification import LocationFeatureSpecification
-from .ComputerLanguage import ComputerLanguage
-from .SizeGroupEnumeration import SizeGroupEnumeration
-from .BusTrip import BusTrip
-from .DeliveryChargeSpecification import DeliveryChargeSpecification
-from .Brand import Brand
-from .BroadcastFrequencySpecification import BroadcastFrequencySpecification
-from .OfferForLease import OfferForLease
-from .TrainTrip import TrainTrip
-from .GovernmentPermit import GovernmentPermit
-from .BoatTrip import BoatTrip
-from .FinancialIncentive import FinancialIncentive
-from .MonetaryAmountDistribution import MonetaryAmountDistribution
-from .QuantitativeValueDistribution import QuantitativeValueDistribution
-from .MemberProgramTier import MemberProgramTier
-from .Permit import Permit
-from .HowToStep import HowToStep
-from .OfferCatalog import OfferCatalog
-from .PropertyValue import PropertyValue
-from .BusReservation import BusReservation
-from .ServiceChannel import ServiceChannel
-from .BusinessAudience import BusinessAudience
-from .UnitPriceSpecification import UnitPriceSpecification
-from .OwnershipInfo import OwnershipInfo
-from .RepaymentSpecification import RepaymentSpecification
-from .WarrantyScope import WarrantyScope
-from .DigitalDocumentPermission import DigitalDocumentPermission
-from .OfferShippingDetails import OfferShippingDetails
-from .Occupation import Occupation
-from .FoodEstablishmentReservation import FoodEstablishmentReservation
-from .TaxiService import TaxiService
-from .WorkBasedProgram import WorkBasedProgram
-from .EducationalOccupationalProgram import EducationalOccupationalProgram
-from .BusinessEntityType import BusinessEntityType
-from .Grant import Grant
-from .Distance import Distance
-from .BedDetails import BedDetails
-from .GeospatialGeometry import GeospatialGeometry
-from .Ticket import Ticket
-from .ServicePeriod import ServicePeriod
-from .CableOrSatelliteService import CableOrSatelliteService
-from .LodgingReservation import LodgingReservation
-from .CurrencyConversionService import CurrencyConversionService
-from .HowToSupply import HowToSupply
-from .HowToItem import HowToItem
-from .BrokerageAccount import BrokerageAccount
-from .InvestmentOrDeposit import InvestmentOrDeposit
-from .CompoundPriceSpecification import CompoundPriceSpecification
-from .Mass import Mass
-from .EventSeries import EventSeries
-from .Series import Series
-from .MediaSubscription import MediaSubscription
-from .OccupationalExperienceRequirements import OccupationalExperienceRequirements
-from .WarrantyPromise import WarrantyPromise
-from .PostalAddress import PostalAddress
-from .ParentAudience import ParentAudience
-from .TaxiReservation import TaxiReservation
-from .Taxi import Taxi
-from .Energy import Energy
-from .MerchantReturnPolicySeasonalOverride import MerchantReturnPolicySeasonalOverride
-from .StatisticalPopulation import StatisticalPopulation
-from .MeasurementTypeEnumeration import MeasurementTypeEnumeration
-from .AggregateOffer import AggregateOffer
-from .VirtualLocation import VirtualLocation
-from .HealthPlanFormulary import HealthPlanFormulary
-from .ReservationPackage import ReservationPackage
-from .TypeAndQuantityNode import TypeAndQuantityNode
-from .FloorPlan import FloorPlan
-from .QuantitativeValue import QuantitativeValue
-from .PropertyValueSpecification import PropertyValueSpecification
-from .MemberProgram import MemberProgram
-from .ParcelDelivery import ParcelDelivery
-from .EnergyConsumptionDetails import EnergyConsumptionDetails
-from .EmployerAggregateRating import EmployerAggregateRating
-from .JobPosting import JobPosting
-from .HealthPlanCostSharingSpecification import HealthPlanCostSharingSpecification
-from .FMRadioChannel import FMRadioChannel
-from .EmployeeRole import EmployeeRole
-from .ShippingRateSettings import ShippingRateSettings
-from .MortgageLoan import MortgageLoan
-from .EducationalAudience import EducationalAudience
-from .WebAPI import WebAPI
-from .Patient import Patient
-from .MedicalAudience import MedicalAudience
-from .PeopleAudience import PeopleAudience
-from .Duration import Duration
-from .ProgramMembership import ProgramMembership
-from .Demand import Demand
-from .BusinessFunction import BusinessFunction
-from .DefinedRegion import DefinedRegion
-from .MerchantReturnPolicy import MerchantReturnPolicy
-from .OfferForPurchase import OfferForPurchase
-from .Offer import Offer
-from .SizeSpecification import SizeSpecification
-from .QualitativeValue import QualitativeValue
-from .HowToDirection import HowToDirection
-from .GeoCircle import GeoCircle
-from .GeoShape import GeoShape
-from .AMRadioChannel import AMRadioChannel
-from .RadioChannel import RadioChannel
-from .DatedMoneySpecification import DatedMoneySpecification
-from .ContactPoint import ContactPoint
-from .BreadcrumbList import BreadcrumbList
-from .ItemList import ItemList
-from .ActionAccessSpecification import ActionAccessSpecification
-from .HealthInsurancePlan import HealthInsurancePlan
-from .ShippingConditions import ShippingConditions
-from .EntryPoint import EntryPoint
-from .MenuItem import MenuItem
-from .Class import Class
-from .ExchangeRateSpecification import ExchangeRateSpecification
-from .MonetaryAmount import MonetaryAmount
-from .ShippingDeliveryTime import ShippingDeliveryTime
-from .FlightReservation import FlightReservation
-from .PaymentService import PaymentService
-from .Invoice import Invoice
-from .DataFeedItem import DataFeedItem
-from .BoatReservation import BoatReservation
-from .OrganizationRole import OrganizationRole
-from .OrderItem import OrderItem
-from .PerformanceRole import PerformanceRole
-from .Role import Role
-from .Schedule import Schedule
-from .GeoCoordinates import GeoCoordinates
-from .RadioBroadcastService import RadioBroadcastService
-from .BroadcastService import BroadcastService
-from .Seat import Seat
-from .AlignmentObject import AlignmentObject
-from .Specialty import Specialty
-from .Flight import Flight
-from .PostalCodeRangeSpecification import PostalCodeRangeSpecification
-from .DepositAccount import DepositAccount
-from .BankAccount import BankAccount
-from .EnergyEfficiencyEnumeration import EnergyEfficiencyEnumeration
-from .CreditCard import CreditCard
-from .PaymentCard import PaymentCard
-from .SpeakableSpecification import SpeakableSpecification
-from .EndorsementRating import EndorsementRating
-from .OpeningHoursSpecification import OpeningHoursSpecification
-from .TelevisionChannel import TelevisionChannel
-from .BroadcastChannel import BroadcastChannel
-from .PaymentMethod import PaymentMethod
-from .MediaEnumeration import MediaEnumeration
-from .NonprofitType import NonprofitType
-from .Property import Property
-from .CDCPMDRecord import CDCPMDRecord
-from .TrainReservation import TrainReservation
-from .Reservation import Reservation
-from .MedicalEnumeration import MedicalEnumeration
-from .CategoryCode import CategoryCode
-from .DefinedTerm import DefinedTerm
-from .GovernmentService import GovernmentService
-from .Order import Order
-from .Researcher import Researcher
-from .Audience import Audience
-from .AggregateRating import AggregateRating
-from .Rating import Rating
-from .Quantity import Quantity
-from .PaymentChargeSpecification import PaymentChargeSpecification
-from .PriceSpecification import PriceSpecification
-from .ShippingService import ShippingService
-from .StructuredValue import StructuredValue
-from .ListItem import ListItem
-from .StatusEnumeration import StatusEnumeration
-from .Observation import Observation
-from .TouristTrip import TouristTrip
-from .Trip import Trip
-from .LoanOrCredit import LoanOrCredit
-from .FinancialProduct import FinancialProduct
-from .Service import Service
-from .HealthPlanNetwork import HealthPlanNetwork
-from .Enumeration import Enumeration
-from .StatisticalVariable import StatisticalVariable
-from .ConstraintNode import ConstraintNode
-from .Intangible import Intangible
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .AMRadioChannel import AMRadioChannel
+    from .ActionAccessSpecification import ActionAccessSpecification
+    from .AggregateOffer import AggregateOffer
+    from .AggregateRating import AggregateRating
+    from .AlignmentObject import AlignmentObject
+    from .Audience import Audience
+    from .BankAccount import BankAccount
+    from .BedDetails import BedDetails
+    from .BedType import BedType
+    from .BoatReservation import BoatReservation
+    from .BoatTrip import BoatTrip
+    from .Brand import Brand
+    from .BreadcrumbList import BreadcrumbList
+    from .BroadcastChannel import BroadcastChannel
+    from .BroadcastFrequencySpecification import BroadcastFrequencySpecification
+    from .BroadcastService import BroadcastService
+    from .BrokerageAccount import BrokerageAccount
+    from .BusReservation import BusReservation
+    from .BusTrip import BusTrip
+    from .BusinessAudience import BusinessAudience
+    from .BusinessEntityType import BusinessEntityType
+    from .BusinessFunction import BusinessFunction
+    from .CDCPMDRecord import CDCPMDRecord
+    from .CableOrSatelliteService import CableOrSatelliteService
+    from .CategoryCode import CategoryCode
+    from .Class import Class
+    from .CompoundPriceSpecification import CompoundPriceSpecification
+    from .ComputerLanguage import ComputerLanguage
+    from .ConstraintNode import ConstraintNode
+    from .ContactPoint import ContactPoint
+    from .CreditCard import CreditCard
+    from .CurrencyConversionService import CurrencyConversionService
+    from .DataFeedItem import DataFeedItem
+    from .DatedMoneySpecification import DatedMoneySpecification
+    from .DefinedRegion import DefinedRegion
+    from .DefinedTerm import DefinedTerm
+    from .DeliveryChargeSpecification import DeliveryChargeSpecification
+    from .Demand import Demand
+    from .DepositAccount import DepositAccount
+    from .DigitalDocumentPermission import DigitalDocumentPermission
+    from .Distance import Distance
+    from .Duration import Duration
+    from .EducationalAudience import EducationalAudience
+    from .EducationalOccupationalProgram import EducationalOccupationalProgram
+    from .EmployeeRole import EmployeeRole
+    from .EmployerAggregateRating import EmployerAggregateRating
+    from .EndorsementRating import EndorsementRating
+    from .Energy import Energy
+    from .EnergyConsumptionDetails import EnergyConsumptionDetails
+    from .EnergyEfficiencyEnumeration import EnergyEfficiencyEnumeration
+    from .EngineSpecification import EngineSpecification
+    from .EntryPoint import EntryPoint
+    from .Enumeration import Enumeration
+    from .EventReservation import EventReservation
+    from .EventSeries import EventSeries
+    from .ExchangeRateSpecification import ExchangeRateSpecification
+    from .FMRadioChannel import FMRadioChannel
+    from .FinancialIncentive import FinancialIncentive
+    from .FinancialProduct import FinancialProduct
+    from .Flight import Flight
+    from .FlightReservation import FlightReservation
+    from .FloorPlan import FloorPlan
+    from .FoodEstablishmentReservation import FoodEstablishmentReservation
+    from .FoodService import FoodService
+    from .GameServer import GameServer
+    from .GeoCircle import GeoCircle
+    from .GeoCoordinates import GeoCoordinates
+    from .GeoShape import GeoShape
+    from .GeospatialGeometry import GeospatialGeometry
+    from .GovernmentPermit import GovernmentPermit
+    from .GovernmentService import GovernmentService
+    from .Grant import Grant
+    from .HealthInsurancePlan import HealthInsurancePlan
+    from .HealthPlanCostSharingSpecification import HealthPlanCostSharingSpecification
+    from .HealthPlanFormulary import HealthPlanFormulary
+    from .HealthPlanNetwork import HealthPlanNetwork
+    from .HowToDirection import HowToDirection
+    from .HowToItem import HowToItem
+    from .HowToStep import HowToStep
+    from .HowToSupply import HowToSupply
+    from .HowToTool import HowToTool
+    from .Intangible import Intangible
+    from .InteractionCounter import InteractionCounter
+    from .InvestmentFund import InvestmentFund
+    from .InvestmentOrDeposit import InvestmentOrDeposit
+    from .Invoice import Invoice
+    from .ItemList import ItemList
+    from .JobPosting import JobPosting
+    from .Language import Language
+    from .LinkRole import LinkRole
+    from .ListItem import ListItem
+    from .LoanOrCredit import LoanOrCredit
+    from .LocationFeatureSpecification import LocationFeatureSpecification
+    from .LodgingReservation import LodgingReservation
+    from .Mass import Mass
+    from .MeasurementTypeEnumeration import MeasurementTypeEnumeration
+    from .MediaEnumeration import MediaEnumeration
+    from .MediaSubscription import MediaSubscription
+    from .MedicalAudience import MedicalAudience
+    from .MedicalEnumeration import MedicalEnumeration
+    from .MemberProgram import MemberProgram
+    from .MemberProgramTier import MemberProgramTier
+    from .MenuItem import MenuItem
+    from .MerchantReturnPolicy import MerchantReturnPolicy
+    from .MerchantReturnPolicySeasonalOverride import MerchantReturnPolicySeasonalOverride
+    from .MonetaryAmount import MonetaryAmount
+    from .MonetaryAmountDistribution import MonetaryAmountDistribution
+    from .MonetaryGrant import MonetaryGrant
+    from .MortgageLoan import MortgageLoan
+    from .NonprofitType import NonprofitType
+    from .NutritionInformation import NutritionInformation
+    from .Observation import Observation
+    from .Occupation import Occupation
+    from .OccupationalExperienceRequirements import OccupationalExperienceRequirements
+    from .Offer import Offer
+    from .OfferCatalog import OfferCatalog
+    from .OfferForLease import OfferForLease
+    from .OfferForPurchase import OfferForPurchase
+    from .OfferShippingDetails import OfferShippingDetails
+    from .OpeningHoursSpecification import OpeningHoursSpecification
+    from .Order import Order
+    from .OrderItem import OrderItem
+    from .OrganizationRole import OrganizationRole
+    from .OwnershipInfo import OwnershipInfo
+    from .ParcelDelivery import ParcelDelivery
+    from .ParentAudience import ParentAudience
+    from .Patient import Patient
+    from .PaymentCard import PaymentCard
+    from .PaymentChargeSpecification import PaymentChargeSpecification
+    from .PaymentMethod import PaymentMethod
+    from .PaymentService import PaymentService
+    from .PeopleAudience import PeopleAudience
+    from .PerformanceRole import PerformanceRole
+    from .Permit import Permit
+    from .PostalAddress import PostalAddress
+    from .PostalCodeRangeSpecification import PostalCodeRangeSpecification
+    from .PriceSpecification import PriceSpecification
+    from .ProgramMembership import ProgramMembership
+    from .Property import Property
+    from .PropertyValue import PropertyValue
+    from .PropertyValueSpecification import PropertyValueSpecification
+    from .QualitativeValue import QualitativeValue
+    from .QuantitativeValue import QuantitativeValue
+    from .QuantitativeValueDistribution import QuantitativeValueDistribution
+    from .Quantity import Quantity
+    from .RadioBroadcastService import RadioBroadcastService
+    from .RadioChannel import RadioChannel
+    from .Rating import Rating
+    from .RentalCarReservation import RentalCarReservation
+    from .RepaymentSpecification import RepaymentSpecification
+    from .Researcher import Researcher
+    from .Reservation import Reservation
+    from .ReservationPackage import ReservationPackage
+    from .Role import Role
+    from .Schedule import Schedule
+    from .Seat import Seat
+    from .Series import Series
+    from .Service import Service
+    from .ServiceChannel import ServiceChannel
+    from .ServicePeriod import ServicePeriod
+    from .ShippingConditions import ShippingConditions
+    from .ShippingDeliveryTime import ShippingDeliveryTime
+    from .ShippingRateSettings import ShippingRateSettings
+    from .ShippingService import ShippingService
+    from .SizeGroupEnumeration import SizeGroupEnumeration
+    from .SizeSpecification import SizeSpecification
+    from .SpeakableSpecification import SpeakableSpecification
+    from .Specialty import Specialty
+    from .StatisticalPopulation import StatisticalPopulation
+    from .StatisticalVariable import StatisticalVariable
+    from .StatusEnumeration import StatusEnumeration
+    from .StructuredValue import StructuredValue
+    from .Taxi import Taxi
+    from .TaxiReservation import TaxiReservation
+    from .TaxiService import TaxiService
+    from .TelevisionChannel import TelevisionChannel
+    from .Ticket import Ticket
+    from .TouristTrip import TouristTrip
+    from .TrainReservation import TrainReservation
+    from .TrainTrip import TrainTrip
+    from .Trip import Trip
+    from .TypeAndQuantityNode import TypeAndQuantityNode
+    from .UnitPriceSpecification import UnitPriceSpecification
+    from .VirtualLocation import VirtualLocation
+    from .WarrantyPromise import WarrantyPromise
+    from .WarrantyScope import WarrantyScope
+    from .WebAPI import WebAPI
+    from .WorkBasedProgram import WorkBasedProgram
 
 __all__ = [
     'AMRadioChannel',
     'ActionAccessSpecification',
-    
-    
     'AggregateOffer',
     'AggregateRating',
     'AlignmentObject',
@@ -201,11 +204,8 @@ __all__ = [
     'BankAccount',
     'BedDetails',
     'BedType',
-    
     'BoatReservation',
     'BoatTrip',
-    
-    
     'Brand',
     'BreadcrumbList',
     'BroadcastChannel',
@@ -219,36 +219,24 @@ __all__ = [
     'BusinessFunction',
     'CDCPMDRecord',
     'CableOrSatelliteService',
-    
     'CategoryCode',
-    
     'Class',
     'CompoundPriceSpecification',
     'ComputerLanguage',
     'ConstraintNode',
     'ContactPoint',
-    
     'CreditCard',
     'CurrencyConversionService',
     'DataFeedItem',
     'DatedMoneySpecification',
-    
     'DefinedRegion',
     'DefinedTerm',
     'DeliveryChargeSpecification',
-    
     'Demand',
     'DepositAccount',
     'DigitalDocumentPermission',
-    
-    
     'Distance',
-    
-    
-    
-    
     'Duration',
-    
     'EducationalAudience',
     'EducationalOccupationalProgram',
     'EmployeeRole',
@@ -257,14 +245,11 @@ __all__ = [
     'Energy',
     'EnergyConsumptionDetails',
     'EnergyEfficiencyEnumeration',
-    
     'EngineSpecification',
     'EntryPoint',
     'Enumeration',
-    
     'EventReservation',
     'EventSeries',
-    
     'ExchangeRateSpecification',
     'FMRadioChannel',
     'FinancialIncentive',
@@ -274,21 +259,14 @@ __all__ = [
     'FloorPlan',
     'FoodEstablishmentReservation',
     'FoodService',
-    
-    
-    
     'GameServer',
-    
-    
     'GeoCircle',
     'GeoCoordinates',
     'GeoShape',
     'GeospatialGeometry',
-    
     'GovernmentPermit',
     'GovernmentService',
     'Grant',
-    
     'HealthInsurancePlan',
     'HealthPlanCostSharingSpecification',
     'HealthPlanFormulary',
@@ -298,61 +276,34 @@ __all__ = [
     'HowToStep',
     'HowToSupply',
     'HowToTool',
-    
-    
-    
-    
-    
     'Intangible',
     'InteractionCounter',
     'InvestmentFund',
     'InvestmentOrDeposit',
     'Invoice',
-    
     'ItemList',
-    
     'JobPosting',
     'Language',
-    
-    
     'LinkRole',
     'ListItem',
     'LoanOrCredit',
     'LocationFeatureSpecification',
     'LodgingReservation',
-    
     'Mass',
-    
     'MeasurementTypeEnumeration',
     'MediaEnumeration',
-    
     'MediaSubscription',
     'MedicalAudience',
-    
-    
     'MedicalEnumeration',
-    
-    
-    
-    
-    
-    
-    
-    
     'MemberProgram',
     'MemberProgramTier',
     'MenuItem',
-    
     'MerchantReturnPolicy',
     'MerchantReturnPolicySeasonalOverride',
     'MonetaryAmount',
     'MonetaryAmountDistribution',
     'MonetaryGrant',
     'MortgageLoan',
-    
-    
-    
-    
     'NonprofitType',
     'NutritionInformation',
     'Observation',
@@ -362,12 +313,10 @@ __all__ = [
     'OfferCatalog',
     'OfferForLease',
     'OfferForPurchase',
-    
     'OfferShippingDetails',
     'OpeningHoursSpecification',
     'Order',
     'OrderItem',
-    
     'OrganizationRole',
     'OwnershipInfo',
     'ParcelDelivery',
@@ -376,24 +325,17 @@ __all__ = [
     'PaymentCard',
     'PaymentChargeSpecification',
     'PaymentMethod',
-    
     'PaymentService',
-    
     'PeopleAudience',
     'PerformanceRole',
     'Permit',
-    
-    
     'PostalAddress',
     'PostalCodeRangeSpecification',
-    
     'PriceSpecification',
-    
     'ProgramMembership',
     'Property',
     'PropertyValue',
     'PropertyValueSpecification',
-    
     'QualitativeValue',
     'QuantitativeValue',
     'QuantitativeValueDistribution',
@@ -401,19 +343,12 @@ __all__ = [
     'RadioBroadcastService',
     'RadioChannel',
     'Rating',
-    
     'RentalCarReservation',
     'RepaymentSpecification',
     'Researcher',
     'Reservation',
     'ReservationPackage',
-    
-    
-    
-    
-    
     'Role',
-    
     'Schedule',
     'Seat',
     'Series',
@@ -426,34 +361,220 @@ __all__ = [
     'ShippingService',
     'SizeGroupEnumeration',
     'SizeSpecification',
-    
     'SpeakableSpecification',
     'Specialty',
     'StatisticalPopulation',
     'StatisticalVariable',
     'StatusEnumeration',
-    
     'StructuredValue',
     'Taxi',
     'TaxiReservation',
     'TaxiService',
     'TelevisionChannel',
     'Ticket',
-    
     'TouristTrip',
     'TrainReservation',
     'TrainTrip',
     'Trip',
     'TypeAndQuantityNode',
-    
-    
     'UnitPriceSpecification',
     'VirtualLocation',
     'WarrantyPromise',
     'WarrantyScope',
-    
-    
-    
     'WebAPI',
     'WorkBasedProgram',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'AMRadioChannel': 'AMRadioChannel',
+        'ActionAccessSpecification': 'ActionAccessSpecification',
+        'AggregateOffer': 'AggregateOffer',
+        'AggregateRating': 'AggregateRating',
+        'AlignmentObject': 'AlignmentObject',
+        'Audience': 'Audience',
+        'BankAccount': 'BankAccount',
+        'BedDetails': 'BedDetails',
+        'BedType': 'BedType',
+        'BoatReservation': 'BoatReservation',
+        'BoatTrip': 'BoatTrip',
+        'Brand': 'Brand',
+        'BreadcrumbList': 'BreadcrumbList',
+        'BroadcastChannel': 'BroadcastChannel',
+        'BroadcastFrequencySpecification': 'BroadcastFrequencySpecification',
+        'BroadcastService': 'BroadcastService',
+        'BrokerageAccount': 'BrokerageAccount',
+        'BusReservation': 'BusReservation',
+        'BusTrip': 'BusTrip',
+        'BusinessAudience': 'BusinessAudience',
+        'BusinessEntityType': 'BusinessEntityType',
+        'BusinessFunction': 'BusinessFunction',
+        'CDCPMDRecord': 'CDCPMDRecord',
+        'CableOrSatelliteService': 'CableOrSatelliteService',
+        'CategoryCode': 'CategoryCode',
+        'Class': 'Class',
+        'CompoundPriceSpecification': 'CompoundPriceSpecification',
+        'ComputerLanguage': 'ComputerLanguage',
+        'ConstraintNode': 'ConstraintNode',
+        'ContactPoint': 'ContactPoint',
+        'CreditCard': 'CreditCard',
+        'CurrencyConversionService': 'CurrencyConversionService',
+        'DataFeedItem': 'DataFeedItem',
+        'DatedMoneySpecification': 'DatedMoneySpecification',
+        'DefinedRegion': 'DefinedRegion',
+        'DefinedTerm': 'DefinedTerm',
+        'DeliveryChargeSpecification': 'DeliveryChargeSpecification',
+        'Demand': 'Demand',
+        'DepositAccount': 'DepositAccount',
+        'DigitalDocumentPermission': 'DigitalDocumentPermission',
+        'Distance': 'Distance',
+        'Duration': 'Duration',
+        'EducationalAudience': 'EducationalAudience',
+        'EducationalOccupationalProgram': 'EducationalOccupationalProgram',
+        'EmployeeRole': 'EmployeeRole',
+        'EmployerAggregateRating': 'EmployerAggregateRating',
+        'EndorsementRating': 'EndorsementRating',
+        'Energy': 'Energy',
+        'EnergyConsumptionDetails': 'EnergyConsumptionDetails',
+        'EnergyEfficiencyEnumeration': 'EnergyEfficiencyEnumeration',
+        'EngineSpecification': 'EngineSpecification',
+        'EntryPoint': 'EntryPoint',
+        'Enumeration': 'Enumeration',
+        'EventReservation': 'EventReservation',
+        'EventSeries': 'EventSeries',
+        'ExchangeRateSpecification': 'ExchangeRateSpecification',
+        'FMRadioChannel': 'FMRadioChannel',
+        'FinancialIncentive': 'FinancialIncentive',
+        'FinancialProduct': 'FinancialProduct',
+        'Flight': 'Flight',
+        'FlightReservation': 'FlightReservation',
+        'FloorPlan': 'FloorPlan',
+        'FoodEstablishmentReservation': 'FoodEstablishmentReservation',
+        'FoodService': 'FoodService',
+        'GameServer': 'GameServer',
+        'GeoCircle': 'GeoCircle',
+        'GeoCoordinates': 'GeoCoordinates',
+        'GeoShape': 'GeoShape',
+        'GeospatialGeometry': 'GeospatialGeometry',
+        'GovernmentPermit': 'GovernmentPermit',
+        'GovernmentService': 'GovernmentService',
+        'Grant': 'Grant',
+        'HealthInsurancePlan': 'HealthInsurancePlan',
+        'HealthPlanCostSharingSpecification': 'HealthPlanCostSharingSpecification',
+        'HealthPlanFormulary': 'HealthPlanFormulary',
+        'HealthPlanNetwork': 'HealthPlanNetwork',
+        'HowToDirection': 'HowToDirection',
+        'HowToItem': 'HowToItem',
+        'HowToStep': 'HowToStep',
+        'HowToSupply': 'HowToSupply',
+        'HowToTool': 'HowToTool',
+        'Intangible': 'Intangible',
+        'InteractionCounter': 'InteractionCounter',
+        'InvestmentFund': 'InvestmentFund',
+        'InvestmentOrDeposit': 'InvestmentOrDeposit',
+        'Invoice': 'Invoice',
+        'ItemList': 'ItemList',
+        'JobPosting': 'JobPosting',
+        'Language': 'Language',
+        'LinkRole': 'LinkRole',
+        'ListItem': 'ListItem',
+        'LoanOrCredit': 'LoanOrCredit',
+        'LocationFeatureSpecification': 'LocationFeatureSpecification',
+        'LodgingReservation': 'LodgingReservation',
+        'Mass': 'Mass',
+        'MeasurementTypeEnumeration': 'MeasurementTypeEnumeration',
+        'MediaEnumeration': 'MediaEnumeration',
+        'MediaSubscription': 'MediaSubscription',
+        'MedicalAudience': 'MedicalAudience',
+        'MedicalEnumeration': 'MedicalEnumeration',
+        'MemberProgram': 'MemberProgram',
+        'MemberProgramTier': 'MemberProgramTier',
+        'MenuItem': 'MenuItem',
+        'MerchantReturnPolicy': 'MerchantReturnPolicy',
+        'MerchantReturnPolicySeasonalOverride': 'MerchantReturnPolicySeasonalOverride',
+        'MonetaryAmount': 'MonetaryAmount',
+        'MonetaryAmountDistribution': 'MonetaryAmountDistribution',
+        'MonetaryGrant': 'MonetaryGrant',
+        'MortgageLoan': 'MortgageLoan',
+        'NonprofitType': 'NonprofitType',
+        'NutritionInformation': 'NutritionInformation',
+        'Observation': 'Observation',
+        'Occupation': 'Occupation',
+        'OccupationalExperienceRequirements': 'OccupationalExperienceRequirements',
+        'Offer': 'Offer',
+        'OfferCatalog': 'OfferCatalog',
+        'OfferForLease': 'OfferForLease',
+        'OfferForPurchase': 'OfferForPurchase',
+        'OfferShippingDetails': 'OfferShippingDetails',
+        'OpeningHoursSpecification': 'OpeningHoursSpecification',
+        'Order': 'Order',
+        'OrderItem': 'OrderItem',
+        'OrganizationRole': 'OrganizationRole',
+        'OwnershipInfo': 'OwnershipInfo',
+        'ParcelDelivery': 'ParcelDelivery',
+        'ParentAudience': 'ParentAudience',
+        'Patient': 'Patient',
+        'PaymentCard': 'PaymentCard',
+        'PaymentChargeSpecification': 'PaymentChargeSpecification',
+        'PaymentMethod': 'PaymentMethod',
+        'PaymentService': 'PaymentService',
+        'PeopleAudience': 'PeopleAudience',
+        'PerformanceRole': 'PerformanceRole',
+        'Permit': 'Permit',
+        'PostalAddress': 'PostalAddress',
+        'PostalCodeRangeSpecification': 'PostalCodeRangeSpecification',
+        'PriceSpecification': 'PriceSpecification',
+        'ProgramMembership': 'ProgramMembership',
+        'Property': 'Property',
+        'PropertyValue': 'PropertyValue',
+        'PropertyValueSpecification': 'PropertyValueSpecification',
+        'QualitativeValue': 'QualitativeValue',
+        'QuantitativeValue': 'QuantitativeValue',
+        'QuantitativeValueDistribution': 'QuantitativeValueDistribution',
+        'Quantity': 'Quantity',
+        'RadioBroadcastService': 'RadioBroadcastService',
+        'RadioChannel': 'RadioChannel',
+        'Rating': 'Rating',
+        'RentalCarReservation': 'RentalCarReservation',
+        'RepaymentSpecification': 'RepaymentSpecification',
+        'Researcher': 'Researcher',
+        'Reservation': 'Reservation',
+        'ReservationPackage': 'ReservationPackage',
+        'Role': 'Role',
+        'Schedule': 'Schedule',
+        'Seat': 'Seat',
+        'Series': 'Series',
+        'Service': 'Service',
+        'ServiceChannel': 'ServiceChannel',
+        'ServicePeriod': 'ServicePeriod',
+        'ShippingConditions': 'ShippingConditions',
+        'ShippingDeliveryTime': 'ShippingDeliveryTime',
+        'ShippingRateSettings': 'ShippingRateSettings',
+        'ShippingService': 'ShippingService',
+        'SizeGroupEnumeration': 'SizeGroupEnumeration',
+        'SizeSpecification': 'SizeSpecification',
+        'SpeakableSpecification': 'SpeakableSpecification',
+        'Specialty': 'Specialty',
+        'StatisticalPopulation': 'StatisticalPopulation',
+        'StatisticalVariable': 'StatisticalVariable',
+        'StatusEnumeration': 'StatusEnumeration',
+        'StructuredValue': 'StructuredValue',
+        'Taxi': 'Taxi',
+        'TaxiReservation': 'TaxiReservation',
+        'TaxiService': 'TaxiService',
+        'TelevisionChannel': 'TelevisionChannel',
+        'Ticket': 'Ticket',
+        'TouristTrip': 'TouristTrip',
+        'TrainReservation': 'TrainReservation',
+        'TrainTrip': 'TrainTrip',
+        'Trip': 'Trip',
+        'TypeAndQuantityNode': 'TypeAndQuantityNode',
+        'UnitPriceSpecification': 'UnitPriceSpecification',
+        'VirtualLocation': 'VirtualLocation',
+        'WarrantyPromise': 'WarrantyPromise',
+        'WarrantyScope': 'WarrantyScope',
+        'WebAPI': 'WebAPI',
+        'WorkBasedProgram': 'WorkBasedProgram',
+    },
+)
@@ -1,12 +1,17 @@
 """Generated Schema.org misc models using msgspec."""
 
-from .DataType import DataType
-from .Float import Float
-from .XPathType import XPathType
-from .URL import URL
-from .Integer import Integer
-from .PronounceableText import PronounceableText
-from .CssSelectorType import CssSelectorType
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .CssSelectorType import CssSelectorType
+    from .DataType import DataType
+    from .Float import Float
+    from .Integer import Integer
+    from .PronounceableText import PronounceableText
+    from .URL import URL
+    from .XPathType import XPathType
 
 __all__ = [
     'CssSelectorType',
@@ -17,3 +22,16 @@ __all__ = [
     'URL',
     'XPathType',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'CssSelectorType': 'CssSelectorType',
+        'DataType': 'DataType',
+        'Float': 'Float',
+        'Integer': 'Integer',
+        'PronounceableText': 'PronounceableText',
+        'URL': 'URL',
+        'XPathType': 'XPathType',
+    },
+)
@@ -1,160 +1,165 @@
 """Generated Schema.org organization models using msgspec."""
 
-from .Plumber import Plumber
-from .EmploymentAgency import EmploymentAgency
-from .BookStore import BookStore
-from .VeterinaryCare import VeterinaryCare
-from .Motel import Motel
-from .MovingCompany import MovingCompany
-from .Airline import Airline
-from .BankOrCreditUnion import BankOrCreditUnion
-from .RealEstateAgent import RealEstateAgent
-from .Notary import Notary
-from .PostOffice import PostOffice
-from .PublicSwimmingPool import PublicSwimmingPool
-from .PawnShop import PawnShop
-from .ShoeStore import ShoeStore
-from .SelfStorage import SelfStorage
-from .AutoBodyShop import AutoBodyShop
-from .BedAndBreakfast import BedAndBreakfast
-from .MensClothingStore import MensClothingStore
-from .FundingScheme import FundingScheme
-from .TelevisionStation import TelevisionStation
-from .InsuranceAgency import InsuranceAgency
-from .ExerciseGym import ExerciseGym
-from .ShoppingCenter import ShoppingCenter
-from .AnimalShelter import AnimalShelter
-from .WholesaleStore import WholesaleStore
-from .AccountingService import AccountingService
-from .SportingGoodsStore import SportingGoodsStore
-from .OnlineStore import OnlineStore
-from .GeneralContractor import GeneralContractor
-from .FastFoodRestaurant import FastFoodRestaurant
-from .ResearchOrganization import ResearchOrganization
-from .DepartmentStore import DepartmentStore
-from .SportsTeam import SportsTeam
-from .MotorcycleRepair import MotorcycleRepair
-from .Pharmacy import Pharmacy
-from .VacationRental import VacationRental
-from .OutletStore import OutletStore
-from .DiagnosticLab import DiagnosticLab
-from .HousePainter import HousePainter
-from .PhysiciansOffice import PhysiciansOffice
-from .SportsOrganization import SportsOrganization
-from .GardenStore import GardenStore
-from .ComputerStore import ComputerStore
-from .ResearchProject import ResearchProject
-from .AutoDealer import AutoDealer
-from .Hotel import Hotel
-from .Hospital import Hospital
-from .ArchiveOrganization import ArchiveOrganization
-from .DryCleaningOrLaundry import DryCleaningOrLaundry
-from .StadiumOrArena import StadiumOrArena
-from .TennisComplex import TennisComplex
-from .WorkersUnion import WorkersUnion
-from .Cooperative import Cooperative
-from .Optician import Optician
-from .IndividualPhysician import IndividualPhysician
-from .Physician import Physician
-from .FundingAgency import FundingAgency
-from .RadioStation import RadioStation
-from .JewelryStore import JewelryStore
-from .AutoRepair import AutoRepair
-from .PetStore import PetStore
-from .AutoWash import AutoWash
-from .BikeStore import BikeStore
-from .ProfessionalService import ProfessionalService
-from .MobilePhoneStore import MobilePhoneStore
-from .TouristInformationCenter import TouristInformationCenter
-from .BarOrPub import BarOrPub
-from .BowlingAlley import BowlingAlley
-from .TireShop import TireShop
-from .NGO import NGO
-from .GolfCourse import GolfCourse
-from .Distillery import Distillery
-from .DanceGroup import DanceGroup
-from .GroceryStore import GroceryStore
-from .MovieRentalStore import MovieRentalStore
-from .FurnitureStore import FurnitureStore
-from .NewsMediaOrganization import NewsMediaOrganization
-from .MusicGroup import MusicGroup
-from .TravelAgency import TravelAgency
-from .Hostel import Hostel
-from .BeautySalon import BeautySalon
-from .HomeGoodsStore import HomeGoodsStore
-from .HardwareStore import HardwareStore
-from .Project import Project
-from .Attorney import Attorney
-from .LegalService import LegalService
-from .AutomatedTeller import AutomatedTeller
-from .AdultEntertainment import AdultEntertainment
-from .Corporation import Corporation
-from .Dentist import Dentist
-from .Brewery import Brewery
-from .HobbyShop import HobbyShop
-from .Restaurant import Restaurant
-from .PoliticalParty import PoliticalParty
-from .SearchRescueOrganization import SearchRescueOrganization
-from .MedicalBusiness import MedicalBusiness
-from .ToyStore import ToyStore
-from .LibrarySystem import LibrarySystem
-from .Electrician import Electrician
-from .ElectronicsStore import ElectronicsStore
-from .Florist import Florist
-from .LiquorStore import LiquorStore
-from .DaySpa import DaySpa
-from .ChildCare import ChildCare
-from .InternetCafe import InternetCafe
-from .NailSalon import NailSalon
-from .HealthClub import HealthClub
-from .AmusementPark import AmusementPark
-from .TheaterGroup import TheaterGroup
-from .ArtGallery import ArtGallery
-from .Winery import Winery
-from .Locksmith import Locksmith
-from .OnlineBusiness import OnlineBusiness
-from .MusicStore import MusicStore
-from .ConvenienceStore import ConvenienceStore
-from .AutoRental import AutoRental
-from .EmergencyService import EmergencyService
-from .CovidTestingFacility import CovidTestingFacility
-from .MedicalClinic import MedicalClinic
-from .MedicalOrganization import MedicalOrganization
-from .HairSalon import HairSalon
-from .TattooParlor import TattooParlor
-from .HealthAndBeautyBusiness import HealthAndBeautyBusiness
-from .NightClub import NightClub
-from .PerformingGroup import PerformingGroup
-from .MotorcycleDealer import MotorcycleDealer
-from .AutoPartsStore import AutoPartsStore
-from .Casino import Casino
-from .FinancialService import FinancialService
-from .RecyclingCenter import RecyclingCenter
-from .OfficeEquipmentStore import OfficeEquipmentStore
-from .Consortium import Consortium
-from .RoofingContractor import RoofingContractor
-from .Bakery import Bakery
-from .GovernmentOrganization import GovernmentOrganization
-from .IceCreamShop import IceCreamShop
-from .SkiResort import SkiResort
-from .Resort import Resort
-from .LodgingBusiness import LodgingBusiness
-from .ClothingStore import ClothingStore
-from .Store import Store
-from .SportsClub import SportsClub
-from .SportsActivityLocation import SportsActivityLocation
-from .GovernmentOffice import GovernmentOffice
-from .GasStation import GasStation
-from .AutomotiveBusiness import AutomotiveBusiness
-from .Library import Library
-from .CafeOrCoffeeShop import CafeOrCoffeeShop
-from .FoodEstablishment import FoodEstablishment
-from .HVACBusiness import HVACBusiness
-from .HomeAndConstructionBusiness import HomeAndConstructionBusiness
-from .ComedyClub import ComedyClub
-from .EntertainmentBusiness import EntertainmentBusiness
-from .LocalBusiness import LocalBusiness
-from .Organization import Organization
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .AccountingService import AccountingService
+    from .AdultEntertainment import AdultEntertainment
+    from .Airline import Airline
+    from .AmusementPark import AmusementPark
+    from .AnimalShelter import AnimalShelter
+    from .ArchiveOrganization import ArchiveOrganization
+    from .ArtGallery import ArtGallery
+    from .Attorney import Attorney
+    from .AutoBodyShop import AutoBodyShop
+    from .AutoDealer import AutoDealer
+    from .AutoPartsStore import AutoPartsStore
+    from .AutoRental import AutoRental
+    from .AutoRepair import AutoRepair
+    from .AutoWash import AutoWash
+    from .AutomatedTeller import AutomatedTeller
+    from .AutomotiveBusiness import AutomotiveBusiness
+    from .Bakery import Bakery
+    from .BankOrCreditUnion import BankOrCreditUnion
+    from .BarOrPub import BarOrPub
+    from .BeautySalon import BeautySalon
+    from .BedAndBreakfast import BedAndBreakfast
+    from .BikeStore import BikeStore
+    from .BookStore import BookStore
+    from .BowlingAlley import BowlingAlley
+    from .Brewery import Brewery
+    from .CafeOrCoffeeShop import CafeOrCoffeeShop
+    from .Casino import Casino
+    from .ChildCare import ChildCare
+    from .ClothingStore import ClothingStore
+    from .ComedyClub import ComedyClub
+    from .ComputerStore import ComputerStore
+    from .Consortium import Consortium
+    from .ConvenienceStore import ConvenienceStore
+    from .Cooperative import Cooperative
+    from .Corporation import Corporation
+    from .CovidTestingFacility import CovidTestingFacility
+    from .DanceGroup import DanceGroup
+    from .DaySpa import DaySpa
+    from .Dentist import Dentist
+    from .DepartmentStore import DepartmentStore
+    from .DiagnosticLab import DiagnosticLab
+    from .Distillery import Distillery
+    from .DryCleaningOrLaundry import DryCleaningOrLaundry
+    from .Electrician import Electrician
+    from .ElectronicsStore import ElectronicsStore
+    from .EmergencyService import EmergencyService
+    from .EmploymentAgency import EmploymentAgency
+    from .EntertainmentBusiness import EntertainmentBusiness
+    from .ExerciseGym import ExerciseGym
+    from .FastFoodRestaurant import FastFoodRestaurant
+    from .FinancialService import FinancialService
+    from .Florist import Florist
+    from .FoodEstablishment import FoodEstablishment
+    from .FundingAgency import FundingAgency
+    from .FundingScheme import FundingScheme
+    from .FurnitureStore import FurnitureStore
+    from .GardenStore import GardenStore
+    from .GasStation import GasStation
+    from .GeneralContractor import GeneralContractor
+    from .GolfCourse import GolfCourse
+    from .GovernmentOffice import GovernmentOffice
+    from .GovernmentOrganization import GovernmentOrganization
+    from .GroceryStore import GroceryStore
+    from .HVACBusiness import HVACBusiness
+    from .HairSalon import HairSalon
+    from .HardwareStore import HardwareStore
+    from .HealthAndBeautyBusiness import HealthAndBeautyBusiness
+    from .HealthClub import HealthClub
+    from .HobbyShop import HobbyShop
+    from .HomeAndConstructionBusiness import HomeAndConstructionBusiness
+    from .HomeGoodsStore import HomeGoodsStore
+    from .Hospital import Hospital
+    from .Hostel import Hostel
+    from .Hotel import Hotel
+    from .HousePainter import HousePainter
+    from .IceCreamShop import IceCreamShop
+    from .IndividualPhysician import IndividualPhysician
+    from .InsuranceAgency import InsuranceAgency
+    from .InternetCafe import InternetCafe
+    from .JewelryStore import JewelryStore
+    from .LegalService import LegalService
+    from .Library import Library
+    from .LibrarySystem import LibrarySystem
+    from .LiquorStore import LiquorStore
+    from .LocalBusiness import LocalBusiness
+    from .Locksmith import Locksmith
+    from .LodgingBusiness import LodgingBusiness
+    from .MedicalBusiness import MedicalBusiness
+    from .MedicalClinic import MedicalClinic
+    from .MedicalOrganization import MedicalOrganization
+    from .MensClothingStore import MensClothingStore
+    from .MobilePhoneStore import MobilePhoneStore
+    from .Motel import Motel
+    from .MotorcycleDealer import MotorcycleDealer
+    from .MotorcycleRepair import MotorcycleRepair
+    from .MovieRentalStore import MovieRentalStore
+    from .MovingCompany import MovingCompany
+    from .MusicGroup import MusicGroup
+    from .MusicStore import MusicStore
+    from .NGO import NGO
+    from .NailSalon import NailSalon
+    from .NewsMediaOrganization import NewsMediaOrganization
+    from .NightClub import NightClub
+    from .Notary import Notary
+    from .OfficeEquipmentStore import OfficeEquipmentStore
+    from .OnlineBusiness import OnlineBusiness
+    from .OnlineStore import OnlineStore
+    from .Optician import Optician
+    from .Organization import Organization
+    from .OutletStore import OutletStore
+    from .PawnShop import PawnShop
+    from .PerformingGroup import PerformingGroup
+    from .PetStore import PetStore
+    from .Pharmacy import Pharmacy
+    from .Physician import Physician
+    from .PhysiciansOffice import PhysiciansOffice
+    from .Plumber import Plumber
+    from .PoliticalParty import PoliticalParty
+    from .PostOffice import PostOffice
+    from .ProfessionalService import ProfessionalService
+    from .Project import Project
+    from .PublicSwimmingPool import PublicSwimmingPool
+    from .RadioStation import RadioStation
+    from .RealEstateAgent import RealEstateAgent
+    from .RecyclingCenter import RecyclingCenter
+    from .ResearchOrganization import ResearchOrganization
+    from .ResearchProject import ResearchProject
+    from .Resort import Resort
+    from .Restaurant import Restaurant
+    from .RoofingContractor import RoofingContractor
+    from .SearchRescueOrganization import SearchRescueOrganization
+    from .SelfStorage import SelfStorage
+    from .ShoeStore import ShoeStore
+    from .ShoppingCenter import ShoppingCenter
+    from .SkiResort import SkiResort
+    from .SportingGoodsStore import SportingGoodsStore
+    from .SportsActivityLocation import SportsActivityLocation
+    from .SportsClub import SportsClub
+    from .SportsOrganization import SportsOrganization
+    from .SportsTeam import SportsTeam
+    from .StadiumOrArena import StadiumOrArena
+    from .Store import Store
+    from .TattooParlor import TattooParlor
+    from .TelevisionStation import TelevisionStation
+    from .TennisComplex import TennisComplex
+    from .TheaterGroup import TheaterGroup
+    from .TireShop import TireShop
+    from .TouristInformationCenter import TouristInformationCenter
+    from .ToyStore import ToyStore
+    from .TravelAgency import TravelAgency
+    from .VacationRental import VacationRental
+    from .VeterinaryCare import VeterinaryCare
+    from .WholesaleStore import WholesaleStore
+    from .Winery import Winery
+    from .WorkersUnion import WorkersUnion
 
 __all__ = [
     'AccountingService',
@@ -313,3 +318,164 @@ __all__ = [
     'Winery',
     'WorkersUnion',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'AccountingService': 'AccountingService',
+        'AdultEntertainment': 'AdultEntertainment',
+        'Airline': 'Airline',
+        'AmusementPark': 'AmusementPark',
+        'AnimalShelter': 'AnimalShelter',
+        'ArchiveOrganization': 'ArchiveOrganization',
+        'ArtGallery': 'ArtGallery',
+        'Attorney': 'Attorney',
+        'AutoBodyShop': 'AutoBodyShop',
+        'AutoDealer': 'AutoDealer',
+        'AutoPartsStore': 'AutoPartsStore',
+        'AutoRental': 'AutoRental',
+        'AutoRepair': 'AutoRepair',
+        'AutoWash': 'AutoWash',
+        'AutomatedTeller': 'AutomatedTeller',
+        'AutomotiveBusiness': 'AutomotiveBusiness',
+        'Bakery': 'Bakery',
+        'BankOrCreditUnion': 'BankOrCreditUnion',
+        'BarOrPub': 'BarOrPub',
+        'BeautySalon': 'BeautySalon',
+        'BedAndBreakfast': 'BedAndBreakfast',
+        'BikeStore': 'BikeStore',
+        'BookStore': 'BookStore',
+        'BowlingAlley': 'BowlingAlley',
+        'Brewery': 'Brewery',
+        'CafeOrCoffeeShop': 'CafeOrCoffeeShop',
+        'Casino': 'Casino',
+        'ChildCare': 'ChildCare',
+        'ClothingStore': 'ClothingStore',
+        'ComedyClub': 'ComedyClub',
+        'ComputerStore': 'ComputerStore',
+        'Consortium': 'Consortium',
+        'ConvenienceStore': 'ConvenienceStore',
+        'Cooperative': 'Cooperative',
+        'Corporation': 'Corporation',
+        'CovidTestingFacility': 'CovidTestingFacility',
+        'DanceGroup': 'DanceGroup',
+        'DaySpa': 'DaySpa',
+        'Dentist': 'Dentist',
+        'DepartmentStore': 'DepartmentStore',
+        'DiagnosticLab': 'DiagnosticLab',
+        'Distillery': 'Distillery',
+        'DryCleaningOrLaundry': 'DryCleaningOrLaundry',
+        'Electrician': 'Electrician',
+        'ElectronicsStore': 'ElectronicsStore',
+        'EmergencyService': 'EmergencyService',
+        'EmploymentAgency': 'EmploymentAgency',
+        'EntertainmentBusiness': 'EntertainmentBusiness',
+        'ExerciseGym': 'ExerciseGym',
+        'FastFoodRestaurant': 'FastFoodRestaurant',
+        'FinancialService': 'FinancialService',
+        'Florist': 'Florist',
+        'FoodEstablishment': 'FoodEstablishment',
+        'FundingAgency': 'FundingAgency',
+        'FundingScheme': 'FundingScheme',
+        'FurnitureStore': 'FurnitureStore',
+        'GardenStore': 'GardenStore',
+        'GasStation': 'GasStation',
+        'GeneralContractor': 'GeneralContractor',
+        'GolfCourse': 'GolfCourse',
+        'GovernmentOffice': 'GovernmentOffice',
+        'GovernmentOrganization': 'GovernmentOrganization',
+        'GroceryStore': 'GroceryStore',
+        'HVACBusiness': 'HVACBusiness',
+        'HairSalon': 'HairSalon',
+        'HardwareStore': 'HardwareStore',
+        'HealthAndBeautyBusiness': 'HealthAndBeautyBusiness',
+        'HealthClub': 'HealthClub',
+        'HobbyShop': 'HobbyShop',
+        'HomeAndConstructionBusiness': 'HomeAndConstructionBusiness',
+        'HomeGoodsStore': 'HomeGoodsStore',
+        'Hospital': 'Hospital',
+        'Hostel': 'Hostel',
+        'Hotel': 'Hotel',
+        'HousePainter': 'HousePainter',
+        'IceCreamShop': 'IceCreamShop',
+        'IndividualPhysician': 'IndividualPhysician',
+        'InsuranceAgency': 'InsuranceAgency',
+        'InternetCafe': 'InternetCafe',
+        'JewelryStore': 'JewelryStore',
+        'LegalService': 'LegalService',
+        'Library': 'Library',
+        'LibrarySystem': 'LibrarySystem',
+        'LiquorStore': 'LiquorStore',
+        'LocalBusiness': 'LocalBusiness',
+        'Locksmith': 'Locksmith',
+        'LodgingBusiness': 'LodgingBusiness',
+        'MedicalBusiness': 'MedicalBusiness',
+        'MedicalClinic': 'MedicalClinic',
+        'MedicalOrganization': 'MedicalOrganization',
+        'MensClothingStore': 'MensClothingStore',
+        'MobilePhoneStore': 'MobilePhoneStore',
+        'Motel': 'Motel',
+        'MotorcycleDealer': 'MotorcycleDealer',
+        'MotorcycleRepair': 'MotorcycleRepair',
+        'MovieRentalStore': 'MovieRentalStore',
+        'MovingCompany': 'MovingCompany',
+        'MusicGroup': 'MusicGroup',
+        'MusicStore': 'MusicStore',
+        'NGO': 'NGO',
+        'NailSalon': 'NailSalon',
+        'NewsMediaOrganization': 'NewsMediaOrganization',
+        'NightClub': 'NightClub',
+        'Notary': 'Notary',
+        'OfficeEquipmentStore': 'OfficeEquipmentStore',
+        'OnlineBusiness': 'OnlineBusiness',
+        'OnlineStore': 'OnlineStore',
+        'Optician': 'Optician',
+        'Organization': 'Organization',
+        'OutletStore': 'OutletStore',
+        'PawnShop': 'PawnShop',
+        'PerformingGroup': 'PerformingGroup',
+        'PetStore': 'PetStore',
+        'Pharmacy': 'Pharmacy',
+        'Physician': 'Physician',
+        'PhysiciansOffice': 'PhysiciansOffice',
+        'Plumber': 'Plumber',
+        'PoliticalParty': 'PoliticalParty',
+        'PostOffice': 'PostOffice',
+        'ProfessionalService': 'ProfessionalService',
+        'Project': 'Project',
+        'PublicSwimmingPool': 'PublicSwimmingPool',
+        'RadioStation': 'RadioStation',
+        'RealEstateAgent': 'RealEstateAgent',
+        'RecyclingCenter': 'RecyclingCenter',
+        'ResearchOrganization': 'ResearchOrganization',
+        'ResearchProject': 'ResearchProject',
+        'Resort': 'Resort',
+        'Restaurant': 'Restaurant',
+        'RoofingContractor': 'RoofingContractor',
+        'SearchRescueOrganization': 'SearchRescueOrganization',
+        'SelfStorage': 'SelfStorage',
+        'ShoeStore': 'ShoeStore',
+        'ShoppingCenter': 'ShoppingCenter',
+        'SkiResort': 'SkiResort',
+        'SportingGoodsStore': 'SportingGoodsStore',
+        'SportsActivityLocation': 'SportsActivityLocation',
+        'SportsClub': 'SportsClub',
+        'SportsOrganization': 'SportsOrganization',
+        'SportsTeam': 'SportsTeam',
+        'StadiumOrArena': 'StadiumOrArena',
+        'Store': 'Store',
+        'TattooParlor': 'TattooParlor',
+        'TelevisionStation': 'TelevisionStation',
+        'TennisComplex': 'TennisComplex',
+        'TheaterGroup': 'TheaterGroup',
+        'TireShop': 'TireShop',
+        'TouristInformationCenter': 'TouristInformationCenter',
+        'ToyStore': 'ToyStore',
+        'TravelAgency': 'TravelAgency',
+        'VacationRental': 'VacationRental',
+        'VeterinaryCare': 'VeterinaryCare',
+        'WholesaleStore': 'WholesaleStore',
+        'Winery': 'Winery',
+        'WorkersUnion': 'WorkersUnion',
+    },
+)
@@ -1,7 +1,19 @@
 """Generated Schema.org person models using msgspec."""
 
-from .Person import Person
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .Person import Person
 
 __all__ = [
     'Person',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'Person': 'Person',
+    },
+)
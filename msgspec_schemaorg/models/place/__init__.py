@@ -1,86 +1,91 @@
 """Generated Schema.org place models using msgspec."""
 
-from .PerformingArtsTheater import PerformingArtsTheater
-from .Aquarium import Aquarium
-from .Apartment import Apartment
-from .Cemetery import Cemetery
-from .HinduTemple import HinduTemple
-from .LegislativeBuilding import LegislativeBuilding
-from .TrainStation import TrainStation
-from .Suite import Suite
-from .CatholicChurch import CatholicChurch
-from .SingleFamilyResidence import SingleFamilyResidence
-from .Park import Park
-from .SchoolDistrict import SchoolDistrict
-from .Church import Church
-from .School import School
-from .Embassy import Embassy
-from .Zoo import Zoo
-from .Canal import Canal
-from .Mountain import Mountain
-from .RiverBodyOfWater import RiverBodyOfWater
-from .TouristAttraction import TouristAttraction
-from .MiddleSchool import MiddleSchool
-from .Reservoir import Reservoir
-from .ElementarySchool import ElementarySchool
-from .Airport import Airport
-from .MeetingRoom import MeetingRoom
-from .Country import Country
-from .Courthouse import Courthouse
-from .LandmarksOrHistoricalBuildings import LandmarksOrHistoricalBuildings
-from .Continent import Continent
-from .HotelRoom import HotelRoom
-from .MusicVenue import MusicVenue
-from .RVPark import RVPark
-from .Room import Room
-from .Volcano import Volcano
-from .PoliceStation import PoliceStation
-from .Mosque import Mosque
-from .Museum import Museum
-from .Synagogue import Synagogue
-from .CityHall import CityHall
-from .LakeBodyOfWater import LakeBodyOfWater
-from .DefenceEstablishment import DefenceEstablishment
-from .GovernmentBuilding import GovernmentBuilding
-from .Crematorium import Crematorium
-from .BusStation import BusStation
-from .Preschool import Preschool
-from .Playground import Playground
-from .BoatTerminal import BoatTerminal
-from .PublicToilet import PublicToilet
-from .Campground import Campground
-from .House import House
-from .Pond import Pond
-from .Beach import Beach
-from .ApartmentComplex import ApartmentComplex
-from .TaxiStand import TaxiStand
-from .City import City
-from .TouristDestination import TouristDestination
-from .SubwayStation import SubwayStation
-from .State import State
-from .AdministrativeArea import AdministrativeArea
-from .CollegeOrUniversity import CollegeOrUniversity
-from .BuddhistTemple import BuddhistTemple
-from .PlaceOfWorship import PlaceOfWorship
-from .GatedResidenceCommunity import GatedResidenceCommunity
-from .Residence import Residence
-from .HighSchool import HighSchool
-from .EducationalOrganization import EducationalOrganization
-from .ParkingFacility import ParkingFacility
-from .Waterfall import Waterfall
-from .MovieTheater import MovieTheater
-from .Bridge import Bridge
-from .OceanBodyOfWater import OceanBodyOfWater
-from .FireStation import FireStation
-from .SeaBodyOfWater import SeaBodyOfWater
-from .BodyOfWater import BodyOfWater
-from .Landform import Landform
-from .BusStop import BusStop
-from .EventVenue import EventVenue
-from .CivicStructure import CivicStructure
-from .CampingPitch import CampingPitch
-from .Accommodation import Accommodation
-from .Place import Place
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .Accommodation import Accommodation
+    from .AdministrativeArea import AdministrativeArea
+    from .Airport import Airport
+    from .Apartment import Apartment
+    from .ApartmentComplex import ApartmentComplex
+    from .Aquarium import Aquarium
+    from .Beach import Beach
+    from .BoatTerminal import BoatTerminal
+    from .BodyOfWater import BodyOfWater
+    from .Bridge import Bridge
+    from .BuddhistTemple import BuddhistTemple
+    from .BusStation import BusStation
+    from .BusStop import BusStop
+    from .Campground import Campground
+    from .CampingPitch import CampingPitch
+    from .Canal import Canal
+    from .CatholicChurch import CatholicChurch
+    from .Cemetery import Cemetery
+    from .Church import Church
+    from .City import City
+    from .CityHall import CityHall
+    from .CivicStructure import CivicStructure
+    from .CollegeOrUniversity import CollegeOrUniversity
+    from .Continent import Continent
+    from .Country import Country
+    from .Courthouse import Courthouse
+    from .Crematorium import Crematorium
+    from .DefenceEstablishment import DefenceEstablishment
+    from .EducationalOrganization import EducationalOrganization
+    from .ElementarySchool import ElementarySchool
+    from .Embassy import Embassy
+    from .EventVenue import EventVenue
+    from .FireStation import FireStation
+    from .GatedResidenceCommunity import GatedResidenceCommunity
+    from .GovernmentBuilding import GovernmentBuilding
+    from .HighSchool import HighSchool
+    from .HinduTemple import HinduTemple
+    from .HotelRoom import HotelRoom
+    from .House import House
+    from .LakeBodyOfWater import LakeBodyOfWater
+    from .Landform import Landform
+    from .LandmarksOrHistoricalBuildings import LandmarksOrHistoricalBuildings
+    from .LegislativeBuilding import LegislativeBuilding
+    from .MeetingRoom import MeetingRoom
+    from .MiddleSchool import MiddleSchool
+    from .Mosque import Mosque
+    from .Mountain import Mountain
+    from .MovieTheater import MovieTheater
+    from .Museum import Museum
+    from .MusicVenue import MusicVenue
+    from .OceanBodyOfWater import OceanBodyOfWater
+    from .Park import Park
+    from .ParkingFacility import ParkingFacility
+    from .PerformingArtsTheater import PerformingArtsTheater
+    from .Place import Place
+    from .PlaceOfWorship import PlaceOfWorship
+    from .Playground import Playground
+    from .PoliceStation import PoliceStation
+    from .Pond import Pond
+    from .Preschool import Preschool
+    from .PublicToilet import PublicToilet
+    from .RVPark import RVPark
+    from .Reservoir import Reservoir
+    from .Residence import Residence
+    from .RiverBodyOfWater import RiverBodyOfWater
+    from .Room import Room
+    from .School import School
+    from .SchoolDistrict import SchoolDistrict
+    from .SeaBodyOfWater import SeaBodyOfWater
+    from .SingleFamilyResidence import SingleFamilyResidence
+    from .State import State
+    from .SubwayStation import SubwayStation
+    from .Suite import Suite
+    from .Synagogue import Synagogue
+    from .TaxiStand import TaxiStand
+    from .TouristAttraction import TouristAttraction
+    from .TouristDestination import TouristDestination
+    from .TrainStation import TrainStation
+    from .Volcano import Volcano
+    from .Waterfall import Waterfall
+    from .Zoo import Zoo
 
 __all__ = [
     'Accommodation',
@@ -165,3 +170,90 @@ __all__ = [
     'Waterfall',
     'Zoo',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'Accommodation': 'Accommodation',
+        'AdministrativeArea': 'AdministrativeArea',
+        'Airport': 'Airport',
+        'Apartment': 'Apartment',
+        'ApartmentComplex': 'ApartmentComplex',
+        'Aquarium': 'Aquarium',
+        'Beach': 'Beach',
+        'BoatTerminal': 'BoatTerminal',
+        'BodyOfWater': 'BodyOfWater',
+        'Bridge': 'Bridge',
+        'BuddhistTemple': 'BuddhistTemple',
+        'BusStation': 'BusStation',
+        'BusStop': 'BusStop',
+        'Campground': 'Campground',
+        'CampingPitch': 'CampingPitch',
+        'Canal': 'Canal',
+        'CatholicChurch': 'CatholicChurch',
+        'Cemetery': 'Cemetery',
+        'Church': 'Church',
+        'City': 'City',
+        'CityHall': 'CityHall',
+        'CivicStructure': 'CivicStructure',
+        'CollegeOrUniversity': 'CollegeOrUniversity',
+        'Continent': 'Continent',
+        'Country': 'Country',
+        'Courthouse': 'Courthouse',
+        'Crematorium': 'Crematorium',
+        'DefenceEstablishment': 'DefenceEstablishment',
+        'EducationalOrganization': 'EducationalOrganization',
+        'ElementarySchool': 'ElementarySchool',
+        'Embassy': 'Embassy',
+        'EventVenue': 'EventVenue',
+        'FireStation': 'FireStation',
+        'GatedResidenceCommunity': 'GatedResidenceCommunity',
+        'GovernmentBuilding': 'GovernmentBuilding',
+        'HighSchool': 'HighSchool',
+        'HinduTemple': 'HinduTemple',
+        'HotelRoom': 'HotelRoom',
+        'House': 'House',
+        'LakeBodyOfWater': 'LakeBodyOfWater',
+        'Landform': 'Landform',
+        'LandmarksOrHistoricalBuildings': 'LandmarksOrHistoricalBuildings',
+        'LegislativeBuilding': 'LegislativeBuilding',
+        'MeetingRoom': 'MeetingRoom',
+        'MiddleSchool': 'MiddleSchool',
+        'Mosque': 'Mosque',
+        'Mountain': 'Mountain',
+        'MovieTheater': 'MovieTheater',
+        'Museum': 'Museum',
+        'MusicVenue': 'MusicVenue',
+        'OceanBodyOfWater': 'OceanBodyOfWater',
+        'Park': 'Park',
+        'ParkingFacility': 'ParkingFacility',
+        'PerformingArtsTheater': 'PerformingArtsTheater',
+        'Place': 'Place',
+        'PlaceOfWorship': 'PlaceOfWorship',
+        'Playground': 'Playground',
+        'PoliceStation': 'PoliceStation',
+        'Pond': 'Pond',
+        'Preschool': 'Preschool',
+        'PublicToilet': 'PublicToilet',
+        'RVPark': 'RVPark',
+        'Reservoir': 'Reservoir',
+        'Residence': 'Residence',
+        'RiverBodyOfWater': 'RiverBodyOfWater',
+        'Room': 'Room',
+        'School': 'School',
+        'SchoolDistrict': 'SchoolDistrict',
+        'SeaBodyOfWater': 'SeaBodyOfWater',
+        'SingleFamilyResidence': 'SingleFamilyResidence',
+        'State': 'State',
+        'SubwayStation': 'SubwayStation',
+        'Suite': 'Suite',
+        'Synagogue': 'Synagogue',
+        'TaxiStand': 'TaxiStand',
+        'TouristAttraction': 'TouristAttraction',
+        'TouristDestination': 'TouristDestination',
+        'TrainStation': 'TrainStation',
+        'Volcano': 'Volcano',
+        'Waterfall': 'Waterfall',
+        'Zoo': 'Zoo',
+    },
+)
@@ -1,17 +1,22 @@
 """Generated Schema.org product models using msgspec."""
 
-from .ProductCollection import ProductCollection
-from .Car import Car
-from .SomeProducts import SomeProducts
-from .ProductGroup import ProductGroup
-from .ProductModel import ProductModel
-from .MotorizedBicycle import MotorizedBicycle
-from .Drug import Drug
-from .BusOrCoach import BusOrCoach
-from .Motorcycle import Motorcycle
-from .IndividualProduct import IndividualProduct
-from .Vehicle import Vehicle
-from .Product import Product
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .BusOrCoach import BusOrCoach
+    from .Car import Car
+    from .Drug import Drug
+    from .IndividualProduct import IndividualProduct
+    from .Motorcycle import Motorcycle
+    from .MotorizedBicycle import MotorizedBicycle
+    from .Product import Product
+    from .ProductCollection import ProductCollection
+    from .ProductGroup import ProductGroup
+    from .ProductModel import ProductModel
+    from .SomeProducts import SomeProducts
+    from .Vehicle import Vehicle
 
 __all__ = [
     'BusOrCoach',
@@ -27,3 +32,21 @@ __all__ = [
     'SomeProducts',
     'Vehicle',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'BusOrCoach': 'BusOrCoach',
+        'Car': 'Car',
+        'Drug': 'Drug',
+        'IndividualProduct': 'IndividualProduct',
+        'Motorcycle': 'Motorcycle',
+        'MotorizedBicycle': 'MotorizedBicycle',
+        'Product': 'Product',
+        'ProductCollection': 'ProductCollection',
+        'ProductGroup': 'ProductGroup',
+        'ProductModel': 'ProductModel',
+        'SomeProducts': 'SomeProducts',
+        'Vehicle': 'Vehicle',
+    },
+)
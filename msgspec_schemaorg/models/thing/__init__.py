@@ -1,81 +1,86 @@
 """Generated Schema.org thing models using msgspec."""
 
-from .MedicalObservationalStudy import MedicalObservationalStudy
-from .BrainStructure import BrainStructure
-from .Bone import Bone
-from .DrugCost import DrugCost
-from .Vein import Vein
-from .RecommendedDoseSchedule import RecommendedDoseSchedule
-from .PalliativeProcedure import PalliativeProcedure
-from .Artery import Artery
-from .Protein import Protein
-from .Joint import Joint
-from .Ligament import Ligament
-from .DietarySupplement import DietarySupplement
-from .Substance import Substance
-from .MedicalDevice import MedicalDevice
-from .MaximumDoseSchedule import MaximumDoseSchedule
-from .ApprovedIndication import ApprovedIndication
-from .MolecularEntity import MolecularEntity
-from .Muscle import Muscle
-from .RadiationTherapy import RadiationTherapy
-from .VitalSign import VitalSign
-from .InfectiousDisease import InfectiousDisease
-from .MedicalContraindication import MedicalContraindication
-from .LymphaticVessel import LymphaticVessel
-from .MedicalCause import MedicalCause
-from .PathologyTest import PathologyTest
-from .MedicalRiskFactor import MedicalRiskFactor
-from .MedicalRiskScore import MedicalRiskScore
-from .ExercisePlan import ExercisePlan
-from .PhysicalActivity import PhysicalActivity
-from .PhysicalTherapy import PhysicalTherapy
-from .DiagnosticProcedure import DiagnosticProcedure
-from .MedicalCode import MedicalCode
-from .Taxon import Taxon
-from .MedicalGuidelineRecommendation import MedicalGuidelineRecommendation
-from .MedicalGuidelineContraindication import MedicalGuidelineContraindication
-from .MedicalGuideline import MedicalGuideline
-from .MedicalTestPanel import MedicalTestPanel
-from .MedicalSign import MedicalSign
-from .MedicalSymptom import MedicalSymptom
-from .PsychologicalTreatment import PsychologicalTreatment
-from .DDxElement import DDxElement
-from .Vessel import Vessel
-from .Gene import Gene
-from .SuperficialAnatomy import SuperficialAnatomy
-from .MedicalSignOrSymptom import MedicalSignOrSymptom
-from .MedicalCondition import MedicalCondition
-from .ReportedDoseSchedule import ReportedDoseSchedule
-from .ChemicalSubstance import ChemicalSubstance
-from .OccupationalTherapy import OccupationalTherapy
-from .MedicalTherapy import MedicalTherapy
-from .BioChemEntity import BioChemEntity
-from .TherapeuticProcedure import TherapeuticProcedure
-from .ImagingTest import ImagingTest
-from .BloodTest import BloodTest
-from .MedicalTest import MedicalTest
-from .SurgicalProcedure import SurgicalProcedure
-from .MedicalProcedure import MedicalProcedure
-from .DrugLegalStatus import DrugLegalStatus
-from .TreatmentIndication import TreatmentIndication
-from .MedicalConditionStage import MedicalConditionStage
-from .MedicalRiskCalculator import MedicalRiskCalculator
-from .MedicalRiskEstimator import MedicalRiskEstimator
-from .PreventionIndication import PreventionIndication
-from .MedicalIndication import MedicalIndication
-from .DoseSchedule import DoseSchedule
-from .LifestyleModification import LifestyleModification
-from .DrugClass import DrugClass
-from .MedicalTrial import MedicalTrial
-from .MedicalStudy import MedicalStudy
-from .Nerve import Nerve
-from .AnatomicalStructure import AnatomicalStructure
-from .DrugStrength import DrugStrength
-from .MedicalIntangible import MedicalIntangible
-from .AnatomicalSystem import AnatomicalSystem
-from .MedicalEntity import MedicalEntity
-from .Thing import Thing
+from typing import TYPE_CHECKING
+
+from msgspec_schemaorg.lazy import install_lazy_module
+
+if TYPE_CHECKING:
+    from .AnatomicalStructure import AnatomicalStructure
+    from .AnatomicalSystem import AnatomicalSystem
+    from .ApprovedIndication import ApprovedIndication
+    from .Artery import Artery
+    from .BioChemEntity import BioChemEntity
+    from .BloodTest import BloodTest
+    from .Bone import Bone
+    from .BrainStructure import BrainStructure
+    from .ChemicalSubstance import ChemicalSubstance
+    from .DDxElement import DDxElement
+    from .DiagnosticProcedure import DiagnosticProcedure
+    from .DietarySupplement import DietarySupplement
+    from .DoseSchedule import DoseSchedule
+    from .DrugClass import DrugClass
+    from .DrugCost import DrugCost
+    from .DrugLegalStatus import DrugLegalStatus
+    from .DrugStrength import DrugStrength
+    from .ExercisePlan import ExercisePlan
+    from .Gene import Gene
+    from .ImagingTest import ImagingTest
+    from .InfectiousDisease import InfectiousDisease
+    from .Joint import Joint
+    from .LifestyleModification import LifestyleModification
+    from .Ligament import Ligament
+    from .LymphaticVessel import LymphaticVessel
+    from .MaximumDoseSchedule import MaximumDoseSchedule
+    from .MedicalCause import MedicalCause
+    from .MedicalCode import MedicalCode
+    from .MedicalCondition import MedicalCondition
+    from .MedicalConditionStage import MedicalConditionStage
+    from .MedicalContraindication import MedicalContraindication
+    from .MedicalDevice import MedicalDevice
+    from .MedicalEntity import MedicalEntity
+    from .MedicalGuideline import MedicalGuideline
+    from .MedicalGuidelineContraindication import MedicalGuidelineContraindication
+    from .MedicalGuidelineRecommendation import MedicalGuidelineRecommendation
+    from .MedicalIndication import MedicalIndication
+    from .MedicalIntangible import MedicalIntangible
+    from .MedicalObservationalStudy import MedicalObservationalStudy
+    from .MedicalProcedure import MedicalProcedure
+    from .MedicalRiskCalculator import MedicalRiskCalculator
+    from .MedicalRiskEstimator import MedicalRiskEstimator
+    from .MedicalRiskFactor import MedicalRiskFactor
+    from .MedicalRiskScore import MedicalRiskScore
+    from .MedicalSign import MedicalSign
+    from .MedicalSignOrSymptom import MedicalSignOrSymptom
+    from .MedicalStudy import MedicalStudy
+    from .MedicalSymptom import MedicalSymptom
+    from .MedicalTest import MedicalTest
+    from .MedicalTestPanel import MedicalTestPanel
+    from .MedicalTherapy import MedicalTherapy
+    from .MedicalTrial import MedicalTrial
+    from .MolecularEntity import MolecularEntity
+    from .Muscle import Muscle
+    from .Nerve import Nerve
+    from .OccupationalTherapy import OccupationalTherapy
+    from .PalliativeProcedure import PalliativeProcedure
+    from .PathologyTest import PathologyTest
+    from .PhysicalActivity import PhysicalActivity
+    from .PhysicalTherapy import PhysicalTherapy
+    from .PreventionIndication import PreventionIndication
+    from .Protein import Protein
+    from .PsychologicalTreatment import PsychologicalTreatment
+    from .RadiationTherapy import RadiationTherapy
+    from .RecommendedDoseSchedule import RecommendedDoseSchedule
+    from .ReportedDoseSchedule import ReportedDoseSchedule
+    from .Substance import Substance
+    from .SuperficialAnatomy import SuperficialAnatomy
+    from .SurgicalProcedure import SurgicalProcedure
+    from .Taxon import Taxon
+    from .TherapeuticProcedure import TherapeuticProcedure
+    from .Thing import Thing
+    from .TreatmentIndication import TreatmentIndication
+    from .Vein import Vein
+    from .Vessel import Vessel
+    from .VitalSign import VitalSign
 
 __all__ = [
     'AnatomicalStructure',
@@ -155,3 +160,85 @@ __all__ = [
     'Vessel',
     'VitalSign',
 ]
+
+install_lazy_module(
+    __name__,
+    {
+        'AnatomicalStructure': 'AnatomicalStructure',
+        'AnatomicalSystem': 'AnatomicalSystem',
+        'ApprovedIndication': 'ApprovedIndication',
+        'Artery': 'Artery',
+        'BioChemEntity': 'BioChemEntity',
+        'BloodTest': 'BloodTest',
+        'Bone': 'Bone',
+        'BrainStructure': 'BrainStructure',
+        'ChemicalSubstance': 'ChemicalSubstance',
+        'DDxElement': 'DDxElement',
+        'DiagnosticProcedure': 'DiagnosticProcedure',
+        'DietarySupplement': 'DietarySupplement',
+        'DoseSchedule': 'DoseSchedule',
+        'DrugClass': 'DrugClass',
+        'DrugCost': 'DrugCost',
+        'DrugLegalStatus': 'DrugLegalStatus',
+        'DrugStrength': 'DrugStrength',
+        'ExercisePlan': 'ExercisePlan',
+        'Gene': 'Gene',
+        'ImagingTest': 'ImagingTest',
+        'InfectiousDisease': 'InfectiousDisease',
+        'Joint': 'Joint',
+        'LifestyleModification': 'LifestyleModification',
+        'Ligament': 'Ligament',
+        'LymphaticVessel': 'LymphaticVessel',
+        'MaximumDoseSchedule': 'MaximumDoseSchedule',
+        'MedicalCause': 'MedicalCause',
+        'MedicalCode': 'MedicalCode',
+        'MedicalCondition': 'MedicalCondition',
+        'MedicalConditionStage': 'MedicalConditionStage',
+        'MedicalContraindication': 'MedicalContraindication',
+        'MedicalDevice': 'MedicalDevice',
+        'MedicalEntity': 'MedicalEntity',
+        'MedicalGuideline': 'MedicalGuideline',
+        'MedicalGuidelineContraindication': 'MedicalGuidelineContraindication',
+        'MedicalGuidelineRecommendation': 'MedicalGuidelineRecommendation',
+        'MedicalIndication': 'MedicalIndication',
+        'MedicalIntangible': 'MedicalIntangible',
+        'MedicalObservationalStudy': 'MedicalObservationalStudy',
+        'MedicalProcedure': 'MedicalProcedure',
+        'MedicalRiskCalculator': 'MedicalRiskCalculator',
+        'MedicalRiskEstimator': 'MedicalRiskEstimator',
+        'MedicalRiskFactor': 'MedicalRiskFactor',
+        'MedicalRiskScore': 'MedicalRiskScore',
+        'MedicalSign': 'MedicalSign',
+        'MedicalSignOrSymptom': 'MedicalSignOrSymptom',
+        'MedicalStudy': 'MedicalStudy',
+        'MedicalSymptom': 'MedicalSymptom',
+        'MedicalTest': 'MedicalTest',
+        'MedicalTestPanel': 'MedicalTestPanel',
+        'MedicalTherapy': 'MedicalTherapy',
+        'MedicalTrial': 'MedicalTrial',
+        'MolecularEntity': 'MolecularEntity',
+        'Muscle': 'Muscle',
+        'Nerve': 'Nerve',
+        'OccupationalTherapy': 'OccupationalTherapy',
+        'PalliativeProcedure': 'PalliativeProcedure',
+        'PathologyTest': 'PathologyTest',
+        'PhysicalActivity': 'PhysicalActivity',
+        'PhysicalTherapy': 'PhysicalTherapy',
+        'PreventionIndication': 'PreventionIndication',
+        'Protein': 'Protein',
+        'PsychologicalTreatment': 'PsychologicalTreatment',
+        'RadiationTherapy': 'RadiationTherapy',
+        'RecommendedDoseSchedule': 'RecommendedDoseSchedule',
+        'ReportedDoseSchedule': 'ReportedDoseSchedule',
+        'Substance': 'Substance',
+        'SuperficialAnatomy': 'SuperficialAnatomy',
+        'SurgicalProcedure': 'SurgicalProcedure',
+        'Taxon': 'Taxon',
+        'TherapeuticProcedure': 'TherapeuticProcedure',
+        'Thing': 'Thing',
+        'TreatmentIndication': 'TreatmentIndication',
+        'Vein': 'Vein',
+        'Vessel': 'Vessel',
+        'VitalSign': 'VitalSign',
+    },
+)
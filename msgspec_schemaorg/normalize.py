@@ -0,0 +1,251 @@
+"""
+Compaction of expanded and prefixed Schema.org terms in JSON-LD documents.
+
+Crawled JSON-LD often writes properties as ``"http://schema.org/name"`` or
+``"schema:name"`` and types as ``"http://schema.org/Product"``. The models only
+know the compact terms, so such properties are ignored as unknown fields and
+such types are not found. This module rewrites them to their compact form
+without a JSON-LD processor, using the schema.org context as it applies to the
+generated vocabulary: every class and property name under the ``schema:``
+prefix and both schema.org namespaces. The table of terms is built from the
+generated namespace and property tables on first use.
+
+Expanded documents also write URLs as node references, ``{"@id": "..."}``.
+These are replaced by the URL in the properties whose range has no model
+class, such as ``url``, which the models decode as plain strings.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+import msgspec
+
+__all__ = ["normalize", "normalize_json"]
+
+# Namespaces of Schema.org terms, as written in documents
+NAMESPACES = ("http://schema.org/", "https://schema.org/", "schema:")
+
+# Parts of a document that normalize() may rewrite: a key in a schema.org
+# namespace, a @type array or @type in a namespace, a value object, and a
+# @context that may define other prefixes. Each starts with a literal, which
+# the regular expression engine searches for quickly, so they are searched
+# for one by one rather than as an alternation.
+_REWRITTEN = (
+    re.compile(rb'schema(?::|\.org/)[^"]*"\s*:'),
+    re.compile(rb'"@type"\s*:\s*(?:\[|"(?:https?://schema\.org/|schema:))'),
+    re.compile(rb'"@value"'),
+    re.compile(rb'"@context"\s*:\s*[\[{]'),
+)
+
+# A node reference, and the key of the property holding it, searched for
+# backwards from the reference. References are common in compact documents,
+# so they only count as rewritten in properties that hold no nodes.
+_REFERENCE = re.compile(rb'"@id"\s*:\s*"[^"]*"\s*}')
+_REFERENCE_KEY = re.compile(rb'"([^"\\]*)"\s*:\s*\[?\s*\{\s*\Z')
+
+_lock = threading.Lock()
+_terms: Optional[Dict[str, str]] = None
+
+# Properties of each class whose range has no model class, by class name,
+# and of all classes
+_value_properties: Dict[str, FrozenSet[str]] = {}
+_all_value_properties: Optional[FrozenSet[str]] = None
+
+
+def _get_terms() -> Dict[str, str]:
+    """The compact name of each expanded or prefixed class and property name."""
+    global _terms
+
+    if _terms is None:
+        with _lock:
+            if _terms is None:
+                from .models._namespace import MODULES
+                from .properties import _get_classes
+
+                names = set(MODULES)
+                for _, properties in _get_classes().values():
+                    names.update(info[0] for info in properties.values())
+                _terms = {
+                    namespace + name: name for namespace in NAMESPACES for name in names
+                }
+    return _terms
+
+
+def _get_value_properties(class_name: str) -> FrozenSet[str]:
+    """The properties of a class that hold URLs and other values, not nodes."""
+    properties = _value_properties.get(class_name)
+    if properties is None:
+        from .mapping import SCHEMA_TO_PYTHON_TYPE_MAPPING
+        from .properties import _get_classes, get_properties
+
+        classes = _get_classes()
+        # Data types such as URL are model classes as well, but properties
+        # hold them as Python values
+        properties = _value_properties[class_name] = frozenset(
+            info.property
+            for info in get_properties(class_name).values()
+            if not any(
+                name in classes and name not in SCHEMA_TO_PYTHON_TYPE_MAPPING
+                for name in info.range
+            )
+        )
+    return properties
+
+
+def _get_all_value_properties() -> FrozenSet[str]:
+    """The properties of any class that hold URLs and other values, not nodes."""
+    global _all_value_properties
+
+    if _all_value_properties is None:
+        from .mapping import SCHEMA_TO_PYTHON_TYPE_MAPPING
+        from .properties import _get_classes
+
+        classes = _get_classes()
+        _all_value_properties = frozenset(
+            prop
+            for _, properties in classes.values()
+            for prop, _, range_ in properties.values()
+            if not any(
+                name in classes and name not in SCHEMA_TO_PYTHON_TYPE_MAPPING for name in range_
+            )
+        )
+    return _all_value_properties
+
+
+def _has_value_reference(data: Union[bytes, bytearray, memoryview]) -> bool:
+    """Check whether a document holds a node reference in a property holding no nodes."""
+    values = _get_all_value_properties()
+    for match in _REFERENCE.finditer(data):
+        start = match.start()
+        key = _REFERENCE_KEY.search(data, max(0, start - 256), start)
+        if key is not None and key.group(1).decode("utf-8", "replace") in values:
+            return True
+    return False
+
+
+def _class_name(types: Any, terms: Dict[str, str]) -> Optional[str]:
+    """The first generated model class among the @type of an object."""
+    from .properties import _get_classes
+
+    classes = _get_classes()
+    for name in types if type(types) is list else [types]:
+        if type(name) is str:
+            name = terms.get(name, name)
+            if name in classes:
+                return name
+    return None
+
+
+def _unwrap_reference(value: Any) -> Any:
+    """Replace node references by their @id."""
+    if type(value) is dict and len(value) == 1 and "@id" in value:
+        return value["@id"]
+    if type(value) is list:
+        return [_unwrap_reference(item) for item in value]
+    return value
+
+
+def _context_terms(context: Any, terms: Dict[str, str]) -> Dict[str, str]:
+    """Add the terms of prefixes a document defines for schema.org."""
+    contexts = context if isinstance(context, list) else [context]
+    prefixes = [
+        prefix
+        for item in contexts
+        if isinstance(item, dict)
+        for prefix, iri in item.items()
+        if iri in NAMESPACES[:2] and not prefix.startswith("@") and prefix != "schema"
+    ]
+    if not prefixes:
+        return terms
+
+    terms = dict(terms)
+    names = [name for key, name in terms.items() if key.startswith(NAMESPACES[2])]
+    for prefix in prefixes:
+        terms.update((f"{prefix}:{name}", name) for name in names)
+    return terms
+
+
+def _compact(value: Any, terms: Dict[str, str]) -> Any:
+    if type(value) is dict:
+        if "@value" in value:
+            # A value object of the expanded form
+            return value["@value"]
+
+        class_name = _class_name(value.get("@type"), terms)
+        values = _get_value_properties(class_name) if class_name is not None else ()
+        compacted = {}
+        for key, item in value.items():
+            key = terms.get(key, key)
+            if key == "@type":
+                if type(item) is list:
+                    item = [terms.get(name, name) if type(name) is str else name for name in item]
+                    if len(item) == 1:
+                        item = item[0]
+                elif type(item) is str:
+                    item = terms.get(item, item)
+            elif key != "@context":
+                item = _compact(item, terms)
+                if key in values:
+                    item = _unwrap_reference(item)
+            compacted[key] = item
+        return compacted
+
+    if type(value) is list:
+        return [_compact(item, terms) for item in value]
+    return value
+
+
+def normalize(document: Any) -> Any:
+    """
+    Rewrite the Schema.org terms of a decoded JSON-LD document in compact form.
+
+    Property names and @type values written with the ``schema:`` prefix, a
+    schema.org namespace, or a prefix the top-level @context defines for
+    schema.org are replaced by the bare name. Value objects such as
+    ``{"@value": "Jane"}`` are replaced by their value, and @type arrays of a
+    single type by the type. Terms that are not in the generated vocabulary
+    are left as they are. Node references such as ``{"@id": "https://..."}``
+    are replaced by their @id in properties of the object's class whose
+    range has no model class.
+
+    Args:
+        document: A JSON-LD object or array, as decoded into builtin types
+
+    Returns:
+        A copy of the document with compact terms. Strings and other values
+        are shared with the input.
+    """
+    terms = _get_terms()
+    if type(document) is dict and "@context" in document:
+        terms = _context_terms(document["@context"], terms)
+    return _compact(document, terms)
+
+
+def normalize_json(buf: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Rewrite the Schema.org terms of a JSON-LD document in compact form.
+
+    Documents are first scanned for keys and types in a schema.org namespace
+    and the other constructs normalize() rewrites, node references only in
+    properties that hold no nodes. Only documents holding one are decoded,
+    passed through normalize() and encoded again, so compact documents cost
+    a few scans of their bytes.
+
+    Args:
+        buf: The JSON document
+
+    Returns:
+        buf itself if it holds no term to rewrite, else the rewritten document
+        as bytes
+    """
+    data = buf.encode("utf-8") if isinstance(buf, str) else buf
+    for pattern in _REWRITTEN:
+        if pattern.search(data) is not None:
+            break
+    else:
+        if not _has_value_reference(data):
+            return buf
+    return msgspec.json.encode(normalize(msgspec.json.decode(data)))
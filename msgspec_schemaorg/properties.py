@@ -0,0 +1,114 @@
+"""
+Schema.org property metadata of the generated models.
+
+The generator emits ``msgspec_schemaorg.models._fields``, a table of the
+properties each class declares with their IRI and range types. The table is
+loaded on first use, and the properties of each class, including inherited
+ones, are collected once and cached, so looking them up does not introspect
+the classes or evaluate their annotations.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+__all__ = ["PropertyInfo", "get_properties", "get_property"]
+
+
+class PropertyInfo(NamedTuple):
+    """Metadata of a model field."""
+
+    # Python field name
+    name: str
+    # Schema.org property name, the JSON key of the field
+    property: str
+    # IRI of the property, e.g. http://schema.org/price
+    iri: str
+    # Schema.org names of the range types, most specific first as ordered by
+    # msgspec_schemaorg.mapping.TYPE_SPECIFICITY
+    range: Tuple[str, ...]
+    # Name of the class declaring the property
+    declared_by: str
+
+
+_lock = threading.Lock()
+_classes: Optional[Dict[str, tuple]] = None
+_properties: Dict[str, Dict[str, PropertyInfo]] = {}
+
+
+def _get_classes() -> Dict[str, tuple]:
+    global _classes
+
+    if _classes is None:
+        from .models._fields import CLASSES
+
+        _classes = CLASSES
+    return _classes
+
+
+def _class_name(cls: Union[type, str]) -> str:
+    """Find the generated class a class or class name stands for."""
+    classes = _get_classes()
+    if isinstance(cls, str):
+        if cls in classes:
+            return cls
+    else:
+        # Subclasses defined outside the package have the properties of
+        # their closest generated class
+        for klass in cls.__mro__:
+            if klass.__name__ in classes:
+                return klass.__name__
+    raise KeyError(f"{cls!r} is not a generated Schema.org model class")
+
+
+def get_properties(cls: Union[type, str]) -> Dict[str, PropertyInfo]:
+    """
+    Get the metadata of all fields of a model class, including inherited ones.
+
+    Args:
+        cls: A model class, its compact variant, a subclass, or a class name
+
+    Returns:
+        PropertyInfo by field name, the inherited properties first. The
+        mapping is shared between callers and must not be modified.
+
+    Raises:
+        KeyError: If cls is not a generated model class
+    """
+    name = _class_name(cls)
+    properties = _properties.get(name)
+    if properties is not None:
+        return properties
+
+    with _lock:
+        classes = _get_classes()
+        chain = []
+        current: Optional[str] = name
+        while current is not None:
+            chain.append(current)
+            current = classes[current][0]
+
+        properties = {}
+        for class_name in reversed(chain):
+            for field_name, (prop, iri, range_) in classes[class_name][1].items():
+                properties[field_name] = PropertyInfo(field_name, prop, iri, range_, class_name)
+        _properties[name] = properties
+    return properties
+
+
+def get_property(cls: Union[type, str], name: str) -> PropertyInfo:
+    """
+    Get the metadata of one field of a model class.
+
+    Args:
+        cls: A model class, its compact variant, a subclass, or a class name
+        name: The Python field name
+
+    Returns:
+        The PropertyInfo of the field
+
+    Raises:
+        KeyError: If cls is not a generated model class or has no such field
+    """
+    return get_properties(cls)[name]
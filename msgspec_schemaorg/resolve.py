@@ -0,0 +1,264 @@
+"""
+Runtime resolution of the forward references in generated model annotations.
+
+The generated class modules only import the classes they reference under
+``TYPE_CHECKING`` and quote them in annotations, so msgspec cannot evaluate
+those annotations from the module globals. The generator therefore also emits
+``msgspec_schemaorg.models._namespace``, a table mapping every class name used
+in an annotation to the module that defines it. The functions here evaluate
+the annotations against that table, importing referenced classes on demand, and
+replace them with types msgspec can build a decoder for.
+
+Resolution happens once per class, the first time a decoder needs it.
+"""
+
+from __future__ import annotations
+
+import enum
+import importlib
+import threading
+import types
+from datetime import date, datetime, time
+from typing import Annotated, Any, Dict, ForwardRef, Iterator, List, Optional, Set, Union
+from typing import get_args, get_origin
+
+from .base import SchemaOrgBase, _own_field_kinds
+from .utils import url_type
+
+# Types msgspec decodes from JSON strings. A msgspec type union may contain only
+# one of these, so unions mixing them are decoded as plain str.
+_STR_LIKE_TYPES = (str, date, datetime, time)
+
+# Names that are not generated classes. They take precedence over model classes
+# of the same name (e.g. the schema:URL data type). URL is replaced with the
+# type of the URL policy, see set_url_policy.
+_FIXED_NAMES: Dict[str, Any] = {
+    "Any": Any,
+    "Dict": Dict,
+    "List": List,
+    "Optional": Optional,
+    "Union": Union,
+    "date": date,
+    "datetime": datetime,
+    "time": time,
+    "URL": str,
+}
+
+_lock = threading.RLock()
+_resolved: Set[type] = set()
+_all_resolved = False
+_url_policy = "none"
+
+
+def set_url_policy(policy: str) -> None:
+    """
+    Set how the URL fields of the models are validated while decoding.
+
+    URL fields are resolved to ``msgspec_schemaorg.utils.url_type(policy)``,
+    so msgspec checks them as it decodes: ``"strict"`` matches the full URL
+    pattern, ``"fast"`` only an http(s) scheme and a host, and ``"none"``,
+    the default, accepts any string. Invalid URLs raise
+    ``msgspec.ValidationError``.
+
+    msgspec builds the decoder of a class once, so the policy applies to the
+    whole process and must be set before the first model class is resolved,
+    i.e. before creating the first decoder.
+
+    Args:
+        policy: One of ``msgspec_schemaorg.utils.URL_POLICIES``
+
+    Raises:
+        ValueError: If the policy is not supported
+        RuntimeError: If model classes were resolved under another policy
+    """
+    global _url_policy
+
+    tp = url_type(policy)
+    with _lock:
+        if policy == _url_policy:
+            return
+        if _resolved:
+            raise RuntimeError(
+                f"URL policy {_url_policy!r} is already in use, set_url_policy "
+                "must be called before the first decoder is created"
+            )
+        _url_policy = policy
+        if _namespace is not None:
+            _namespace["URL"] = tp
+
+
+def get_url_policy() -> str:
+    """Return the URL policy set with set_url_policy."""
+    return _url_policy
+
+
+class _LazyNamespace(dict):
+    """Evaluation namespace that imports generated classes on first lookup."""
+
+    def __init__(self, modules: Dict[str, str]):
+        super().__init__(_FIXED_NAMES)
+        self["URL"] = url_type(_url_policy)
+        self.modules = modules
+
+    def __missing__(self, name: str) -> Any:
+        module_name = self.modules.get(name)
+        if module_name is None:
+            raise KeyError(name)
+        value = getattr(importlib.import_module(module_name), name)
+        self[name] = value
+        return value
+
+
+_namespace: Optional[_LazyNamespace] = None
+
+
+def _get_namespace() -> _LazyNamespace:
+    global _namespace
+
+    if _namespace is None:
+        from .models._namespace import MODULES
+
+        _namespace = _LazyNamespace(MODULES)
+    return _namespace
+
+
+def _evaluate(annotation: str, namespace: _LazyNamespace) -> Any:
+    # The namespace is passed as locals: unlike globals, locals may be any
+    # mapping, so names missing from it are looked up through __missing__
+    return eval(annotation, {}, namespace)
+
+
+def _is_str_like(tp: Any) -> bool:
+    # Constrained strings such as URL are str to msgspec as well
+    if get_origin(tp) is Annotated:
+        tp = get_args(tp)[0]
+    return tp in _STR_LIKE_TYPES
+
+
+def _normalize_type(tp: Any, namespace: _LazyNamespace) -> Any:
+    """
+    Evaluate a generated annotation into a type msgspec can decode.
+
+    Forward references are resolved from the namespace, enums are decoded as
+    their string values, and unions holding several string-like types, URL
+    included, are collapsed to str. Model classes are kept as declared, so a nested object
+    must carry a @type from the property's range whenever that range holds
+    more than one class.
+
+    Args:
+        tp: A type, a string annotation or a forward reference
+        namespace: Namespace to resolve names from
+
+    Returns:
+        The normalized type
+    """
+    if isinstance(tp, str):
+        tp = _evaluate(tp, namespace)
+    if isinstance(tp, ForwardRef):
+        tp = _evaluate(tp.__forward_arg__, namespace)
+
+    origin = get_origin(tp)
+    if origin is Union or origin is types.UnionType:
+        members: List[Any] = []
+        for arg in get_args(tp):
+            arg = _normalize_type(arg, namespace)
+            if get_origin(arg) is Union:
+                members.extend(get_args(arg))
+            else:
+                members.append(arg)
+
+        str_like = [m for m in members if _is_str_like(m)]
+        if len(str_like) > 1:
+            members = [m for m in members if not _is_str_like(m)]
+            members.insert(0, str)
+        return Union[tuple(members)]
+
+    if origin is list:
+        return List[_normalize_type(get_args(tp)[0], namespace)]
+
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        return str
+
+    return tp
+
+
+def _model_classes_in(tp: Any) -> Iterator[type]:
+    """Yield the model classes referenced by a type."""
+    if isinstance(tp, type):
+        if issubclass(tp, SchemaOrgBase) and tp is not SchemaOrgBase:
+            yield tp
+        return
+    for arg in get_args(tp):
+        yield from _model_classes_in(arg)
+
+
+def _is_generated(cls: type) -> bool:
+    return cls.__module__.startswith(f"{__package__}.models.")
+
+
+def resolve(tp: Any) -> None:
+    """
+    Resolve the annotations of every model class reachable from a type.
+
+    Generated classes reached through inheritance or field types have their
+    string annotations replaced with runtime types, so msgspec can build a
+    fully typed decoder for ``tp``. Classes are only resolved once, so calling
+    this again is cheap. Subclasses of the models defined outside this package
+    are traversed but their own annotations are left untouched.
+
+    Args:
+        tp: A model class or any type containing model classes,
+            e.g. ``List[Person]``
+    """
+    with _lock:
+        pending = list(_model_classes_in(tp))
+        if not pending:
+            return
+
+        namespace = _get_namespace()
+        while pending:
+            cls = pending.pop()
+            if cls in _resolved:
+                continue
+            _resolved.add(cls)
+
+            pending.extend(
+                base
+                for base in cls.__mro__[1:]
+                if issubclass(base, SchemaOrgBase) and base is not SchemaOrgBase
+            )
+            if not _is_generated(cls):
+                continue
+
+            # Field kinds are only recognizable from the unresolved annotations
+            _own_field_kinds(cls)
+            annotations = {
+                name: _normalize_type(annotation, namespace)
+                for name, annotation in cls.__dict__.get("__annotations__", {}).items()
+            }
+            cls.__annotations__ = annotations
+            for annotation in annotations.values():
+                pending.extend(_model_classes_in(annotation))
+
+
+def resolve_all() -> List[type]:
+    """
+    Import and resolve every generated model class.
+
+    Returns:
+        All generated model classes, in the order of the namespace table
+    """
+    global _all_resolved
+
+    with _lock:
+        classes = []
+        for name, module_name in _get_namespace().modules.items():
+            value = getattr(importlib.import_module(module_name), name)
+            if isinstance(value, type) and issubclass(value, SchemaOrgBase):
+                classes.append(value)
+
+        if not _all_resolved:
+            for cls in classes:
+                resolve(cls)
+            _all_resolved = True
+        return classes
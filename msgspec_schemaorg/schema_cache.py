@@ -0,0 +1,262 @@
+"""
+Loading of the Schema.org vocabulary for the code generators.
+
+Downloads are stored in an on-disk cache under the SHA-256 of their content,
+with an index mapping each URL to its ETag and content hash. A cached copy is
+revalidated with a conditional request, used as is in offline mode, and used
+as a fallback when the network is unavailable. Within one process each
+distinct schema is parsed only once and the parsed data is shared between
+callers, so it must not be modified.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import msgspec
+
+DEFAULT_SCHEMA_URL = "https://schema.org/version/latest/schemaorg-current-https.jsonld"
+
+INDEX_NAME = "index.json"
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the cache directory used when none is given.
+
+    ``MSGSPEC_SCHEMAORG_CACHE_DIR`` takes precedence, then ``XDG_CACHE_HOME``,
+    then ``~/.cache``.
+    """
+    cache_dir = os.environ.get("MSGSPEC_SCHEMAORG_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "msgspec-schemaorg"
+
+
+# Parsed schemas by content hash, and the hash last loaded for each URL
+_parsed: Dict[str, Dict[str, Any]] = {}
+_url_hashes: Dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def _parse(content: bytes) -> Tuple[str, Dict[str, Any]]:
+    digest = hashlib.sha256(content).hexdigest()
+    with _lock:
+        schema_data = _parsed.get(digest)
+        if schema_data is None:
+            schema_data = _parsed[digest] = msgspec.json.decode(content)
+    return digest, schema_data
+
+
+def _read_index(cache_dir: Path) -> Dict[str, Dict[str, Optional[str]]]:
+    try:
+        return json.loads((cache_dir / INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    # Write to a temporary file first so readers never see a partial file
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _read_cached(cache_dir: Path, entry: Optional[Dict[str, Optional[str]]]) -> Optional[bytes]:
+    if not entry:
+        return None
+    try:
+        content = (cache_dir / f"{entry['sha256']}.jsonld").read_bytes()
+    except OSError:
+        return None
+    # A corrupted cache file is treated as missing
+    if hashlib.sha256(content).hexdigest() != entry["sha256"]:
+        return None
+    return content
+
+
+def _store(cache_dir: Path, url: str, content: bytes, etag: Optional[str]) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256(content).hexdigest()
+    blob = cache_dir / f"{digest}.jsonld"
+    if not blob.exists():
+        _write_atomic(blob, content)
+
+    index = _read_index(cache_dir)
+    index[url] = {"etag": etag, "sha256": digest}
+    _write_atomic(cache_dir / INDEX_NAME, json.dumps(index, indent=2).encode())
+
+
+def fetch_schema_bytes(
+    url: str = DEFAULT_SCHEMA_URL,
+    cache_dir: Optional[Union[str, Path]] = None,
+    offline: bool = False,
+    refresh: bool = False,
+) -> bytes:
+    """
+    Return the raw JSON-LD document at a URL, using the on-disk cache.
+
+    Args:
+        url: URL of the Schema.org JSON-LD data
+        cache_dir: Cache directory, default_cache_dir() if None
+        offline: Only use the cache, never access the network
+        refresh: Download again even if the cached copy is still valid
+
+    Returns:
+        The document content
+
+    Raises:
+        FileNotFoundError: If offline and the URL is not cached
+        requests.RequestException: If the download fails and nothing is cached
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    entry = _read_index(cache_dir).get(url)
+    cached = _read_cached(cache_dir, entry)
+
+    if offline:
+        if cached is None:
+            raise FileNotFoundError(
+                f"Schema.org data for {url} is not cached in {cache_dir}, "
+                "run once without --offline or pass --schema-file"
+            )
+        print(f"Using cached Schema.org data for {url}")
+        return cached
+
+    import requests
+
+    headers = {}
+    if cached is not None and not refresh and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+
+    print(f"Downloading Schema.org data from {url}...")
+    try:
+        response = requests.get(url, headers=headers, timeout=60)
+        if response.status_code == 304 and cached is not None:
+            print("Cached Schema.org data is up to date.")
+            return cached
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if cached is None:
+            raise
+        print(f"Download failed ({e}), using cached Schema.org data.")
+        return cached
+
+    content = response.content
+    _store(cache_dir, url, content, response.headers.get("ETag"))
+    print("Schema.org data downloaded successfully.")
+    return content
+
+
+def load_schema(
+    url: str = DEFAULT_SCHEMA_URL,
+    schema_file: Optional[Union[str, Path]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    offline: bool = False,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    Load and parse the Schema.org JSON-LD data.
+
+    Repeated calls in one process return the same parsed object without
+    downloading or parsing again, unless refresh is set.
+
+    Args:
+        url: URL of the Schema.org JSON-LD data
+        schema_file: Local JSON-LD file to use instead of the URL
+        cache_dir: Cache directory, default_cache_dir() if None
+        offline: Only use the cache, never access the network
+        refresh: Download again even if the cached copy is still valid
+
+    Returns:
+        The parsed JSON-LD data, shared between callers
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist, or if offline
+            and the URL is not cached
+        requests.RequestException: If the download fails and nothing is cached
+        msgspec.DecodeError: If the data is not valid JSON
+    """
+    if schema_file is not None:
+        _, schema_data = _parse(Path(schema_file).read_bytes())
+        print(f"Loaded Schema.org data from {schema_file}")
+        return schema_data
+
+    if not refresh:
+        with _lock:
+            digest = _url_hashes.get(url)
+            if digest is not None:
+                return _parsed[digest]
+
+    digest, schema_data = _parse(fetch_schema_bytes(url, cache_dir, offline, refresh))
+    with _lock:
+        _url_hashes[url] = digest
+    return schema_data
+
+
+def add_schema_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the options selecting the Schema.org data to a command line parser.
+
+    Args:
+        parser: Parser to add --schema-url, --schema-file, --offline,
+            --refresh-schema and --cache-dir to
+    """
+    parser.add_argument(
+        "--schema-url",
+        default=DEFAULT_SCHEMA_URL,
+        help=f"URL to download the Schema.org data from (default: {DEFAULT_SCHEMA_URL})",
+    )
+    parser.add_argument(
+        "--schema-file",
+        type=Path,
+        help="Path to a local Schema.org JSON-LD file (overrides --schema-url if specified)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use the cached Schema.org data without accessing the network",
+    )
+    parser.add_argument(
+        "--refresh-schema",
+        action="store_true",
+        help="Download the Schema.org data even if the cached copy is current",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=f"Directory of the schema download cache (default: {default_cache_dir()})",
+    )
+
+
+def load_schema_from_args(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Load the Schema.org data selected by the options of add_schema_arguments().
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        The parsed JSON-LD data
+    """
+    return load_schema(
+        url=args.schema_url,
+        schema_file=args.schema_file,
+        cache_dir=args.cache_dir,
+        offline=args.offline,
+        refresh=args.refresh_schema,
+    )
@@ -0,0 +1,145 @@
+"""
+Streaming NDJSON (JSON lines) decoding and encoding of Schema.org models.
+
+Files are processed in fixed-size chunks, so memory use depends on the chunk
+size and the longest line rather than on the size of the file. Lines are
+decoded from memoryview slices of the read buffer without copying them.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from .codecs import get_decoder, get_encoder
+from .decode import get_default_decoder
+
+# Default number of bytes read from, or buffered before writing to, a file
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Lines holding only whitespace are skipped
+_BLANK_LINE = re.compile(rb"[ \t\r]*")
+
+
+def _get_decode(type: Any) -> Callable[[Any], Any]:
+    if type is None:
+        return get_default_decoder().decode
+    return get_decoder(type).decode
+
+
+def iter_decode(
+    fileobj: IO[bytes],
+    type: Any = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Decode a binary NDJSON stream one line at a time.
+
+    Args:
+        fileobj: Binary file object with a ``read`` method
+        type: Type to decode each line into. If None, each line is decoded
+            into the model class named by its @type, as with decode_any
+        chunk_size: Number of bytes to read at a time
+
+    Yields:
+        One decoded object per non-blank line
+
+    Raises:
+        msgspec.DecodeError: If a line is not valid JSON or does not match the type
+    """
+    decode = _get_decode(type)
+    buffer = bytearray()
+
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            continue
+
+        # The view must be released before the consumed lines are dropped
+        with memoryview(buffer) as view:
+            start = 0
+            while start <= end:
+                newline = buffer.find(b"\n", start, end + 1)
+                if not _BLANK_LINE.fullmatch(buffer, start, newline):
+                    yield decode(view[start:newline])
+                start = newline + 1
+        del buffer[: end + 1]
+
+    # Last line without a trailing newline
+    if not _BLANK_LINE.fullmatch(buffer):
+        yield decode(buffer)
+
+
+def iter_encode(
+    objects: Iterable[Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytearray]:
+    """
+    Encode objects as NDJSON, batched into buffers of about ``chunk_size`` bytes.
+
+    Each object is encoded directly into the current batch with
+    ``Encoder.encode_into``, so no intermediate bytes object is created per line.
+
+    Args:
+        objects: Objects to encode, one per line
+        chunk_size: Size in bytes after which a batch is yielded
+
+    Yields:
+        Buffers holding one or more complete, newline-terminated lines
+    """
+    encode_into = get_encoder().encode_into
+    buffer = bytearray()
+
+    for obj in objects:
+        encode_into(obj, buffer, -1)
+        buffer.append(0x0A)
+        if len(buffer) >= chunk_size:
+            yield buffer
+            buffer = bytearray()
+
+    if buffer:
+        yield buffer
+
+
+def write_ndjson(
+    fileobj: IO[bytes],
+    objects: Iterable[Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write objects to a binary file as NDJSON.
+
+    A single buffer is reused for all batches, so writing does not allocate
+    per object or per batch.
+
+    Args:
+        fileobj: Binary file object with a ``write`` method
+        objects: Objects to encode, one per line
+        chunk_size: Size in bytes after which the buffer is written out
+
+    Returns:
+        The number of objects written
+    """
+    encode_into = get_encoder().encode_into
+    buffer = bytearray()
+    offset = 0
+    count = 0
+
+    for obj in objects:
+        # Encoding at offset 0 after a flush overwrites the written batch
+        encode_into(obj, buffer, offset)
+        buffer.append(0x0A)
+        offset = -1
+        count += 1
+        if len(buffer) >= chunk_size:
+            fileobj.write(buffer)
+            offset = 0
+
+    if offset == -1:
+        fileobj.write(buffer)
+    return count
@@ -2,10 +2,10 @@
 Utility functions for msgspec-schemaorg.
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 import re
-from urllib.parse import urlparse
-from typing import Annotated
+from typing import Annotated, Any, Dict, Iterable, List
+import msgspec
 from msgspec import Meta
 
 
@@ -39,11 +39,108 @@ def parse_iso8601(value):
         return value
 
 
+# Values converted together by parse_iso8601_many. A chunk holding an invalid
+# value falls back to parsing its values one by one.
+_ISO8601_CHUNK_SIZE = 1024
+
+
+def _convert_chunks(values: List[str], type: Any) -> List[Any]:
+    results = []
+    for start in range(0, len(values), _ISO8601_CHUNK_SIZE):
+        chunk = values[start : start + _ISO8601_CHUNK_SIZE]
+        try:
+            results.extend(msgspec.convert(chunk, List[type]))
+        except msgspec.ValidationError:
+            results.extend(parse_iso8601(value) for value in chunk)
+    return results
+
+
+def parse_iso8601_many(values: Iterable[Any]) -> List[Any]:
+    """
+    Parse many ISO8601 date/datetime strings at once.
+
+    Returns the same results as calling parse_iso8601 on each value, but
+    converts date and datetime strings in bulk with msgspec's RFC3339 parser
+    instead of rewriting and parsing each string in Python.
+
+    Args:
+        values: Strings in ISO8601 format, or any other values
+
+    Returns:
+        A list with parsed date/datetime objects in place of the strings that
+        could be parsed, and all other values unchanged
+    """
+    results = list(values)
+    date_indices = []
+    datetime_indices = []
+    for i, value in enumerate(results):
+        if value and isinstance(value, str):
+            # Same classification as parse_iso8601
+            if "T" not in value and value.count("-") == 2:
+                date_indices.append(i)
+            else:
+                datetime_indices.append(i)
+
+    for indices, type in ((date_indices, date), (datetime_indices, datetime)):
+        if indices:
+            parsed = _convert_chunks([results[i] for i in indices], type)
+            for i, value in zip(indices, parsed):
+                results[i] = value
+    return results
+
+
+def parse_iso8601_array(values: Iterable[Any], unit: str = "us"):
+    """
+    Parse ISO8601 strings into a NumPy ``datetime64`` array.
+
+    Timezone-aware datetimes are converted to UTC, since ``datetime64`` has no
+    timezone. Values that cannot be parsed become ``NaT``. Requires NumPy.
+
+    Args:
+        values: Strings in ISO8601 format
+        unit: The ``datetime64`` unit of the result, e.g. ``"D"``, ``"s"`` or ``"us"``
+
+    Returns:
+        A ``numpy.ndarray`` of dtype ``datetime64[unit]``
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "parse_iso8601_array requires NumPy, install it with "
+            "'pip install msgspec-schemaorg[numpy]'"
+        ) from e
+
+    column = []
+    for value in parse_iso8601_many(values):
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        elif not isinstance(value, date):
+            value = None
+        column.append(value)
+    return np.array(column, dtype=f"datetime64[{unit}]")
+
+
 # URL regex pattern - matches valid URLs with scheme and domain
 URL_PATTERN = r"^(?:http|https)://(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|localhost|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?::\d+)?(?:/?|[/?]\S+)$"
 
-# Define URL as an Annotated str with a pattern constraint
-URL = Annotated[str, Meta(pattern=URL_PATTERN)]
+# Compiled once, matching is case-insensitive like scheme and host names
+_URL_REGEX = re.compile(URL_PATTERN, re.IGNORECASE)
+
+# Define URL as an Annotated str with a pattern constraint. msgspec matches
+# patterns case-sensitively, so the flag is part of the pattern.
+URL = Annotated[str, Meta(pattern="(?i)" + URL_PATTERN)]
+
+# An http or https scheme followed by a host and no whitespace, the check of
+# is_valid_url_fast as a pattern
+FAST_URL_PATTERN = r"^(?i:https?)://[^\s/?#:]\S*\Z"
+
+# Supported URL validation policies, see url_type
+URL_POLICIES = ("strict", "fast", "none")
 
 
 def is_valid_url(value: str) -> bool:
@@ -59,13 +156,71 @@ def is_valid_url(value: str) -> bool:
     if not isinstance(value, str):
         return False
 
-    # Check URL format with regex
-    if not re.match(URL_PATTERN, value, re.IGNORECASE):
+    # The pattern requires an http(s) scheme and a host, so no further parsing
+    # is needed once it matches
+    return _URL_REGEX.match(value) is not None
+
+
+def is_valid_url_fast(value: str) -> bool:
+    """
+    Check the structure of a URL without a regular expression.
+
+    Accepts any http or https URL with a non-empty host and no whitespace or
+    control characters. This is much cheaper than is_valid_url but does not
+    check the host name syntax.
+
+    Args:
+        value: The string to validate
+
+    Returns:
+        True if the string looks like an http(s) URL, False otherwise
+    """
+    if not isinstance(value, str):
         return False
 
-    # More thorough check using urlparse
-    try:
-        result = urlparse(value)
-        return all([result.scheme, result.netloc])
-    except Exception:
+    scheme = value[:8].lower()
+    if scheme.startswith("https://"):
+        rest = value[8:]
+    elif scheme.startswith("http://"):
+        rest = value[7:]
+    else:
         return False
+
+    return (
+        rest != ""
+        and rest[0] not in "/?#:"
+        and " " not in rest
+        and rest.isprintable()
+    )
+
+
+_URL_TYPES: Dict[str, Any] = {
+    "strict": URL,
+    "fast": Annotated[str, Meta(pattern=FAST_URL_PATTERN)],
+    "none": str,
+}
+
+
+def url_type(policy: str) -> Any:
+    """
+    Return the type URL fields are decoded as under a validation policy.
+
+    - ``"strict"``: URL, matching the full URL_PATTERN regex
+    - ``"fast"``: a str matching FAST_URL_PATTERN, an http(s) scheme, a host
+      and no whitespace
+    - ``"none"``: str, accepting any string
+
+    The patterns are checked by msgspec while decoding.
+
+    Args:
+        policy: One of URL_POLICIES
+
+    Returns:
+        The type of URL fields
+
+    Raises:
+        ValueError: If the policy is not supported
+    """
+    if policy not in URL_POLICIES:
+        raise ValueError(f"Unsupported URL policy {policy!r}, expected one of {URL_POLICIES}")
+    return _URL_TYPES[policy]
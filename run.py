@@ -23,6 +23,9 @@ from pathlib import Path
 
 PROJECT_DIR = Path(__file__).parent
 
+sys.path.insert(0, str(PROJECT_DIR))
+from msgspec_schemaorg.schema_cache import add_schema_arguments, load_schema_from_args
+
 
 def run_command(cmd, cwd=None):
     """Run a command and stream output."""
@@ -48,14 +51,28 @@ def run_command(cmd, cwd=None):
         sys.exit(process.returncode)
 
 
-def generate_models():
+def schema_options(args):
+    """Command line options forwarding the Schema.org data selection."""
+    options = ["--schema-url", args.schema_url]
+    if args.schema_file:
+        options += ["--schema-file", str(args.schema_file)]
+    if args.offline:
+        options.append("--offline")
+    if args.refresh_schema:
+        options.append("--refresh-schema")
+    if args.cache_dir:
+        options += ["--cache-dir", str(args.cache_dir)]
+    return options
+
+
+def generate_models(args):
     """Generate Schema.org models."""
-    run_command(["python", "scripts/generate_models.py", "--clean"])
+    run_command(["python", "scripts/generate_models.py", *schema_options(args)])
 
 
-def generate_enums():
+def generate_enums(args):
     """Generate Schema.org enum classes."""
-    run_command(["python", "scripts/generate_enums.py"])
+    run_command(["python", "scripts/generate_enums.py", *schema_options(args)])
 
 
 def run_example(example_name="usage_example.py"):
@@ -75,11 +92,13 @@ def run_tests():
     run_command(["pytest", "tests/"])
 
 
-def run_all():
-    """Run all tasks: generate models, generate enums, and run tests."""
-    generate_models()
-    generate_enums()
-    generate_models()
+def run_all(args):
+    """Run all tasks: generate models and enums, and run tests."""
+    sys.path.insert(0, str(PROJECT_DIR / "scripts"))
+    import generate_models as model_script
+
+    # Models and enums are generated together in one pass over the schema
+    model_script.generate(load_schema_from_args(args))
     run_tests()
 
 
@@ -90,28 +109,42 @@ def main():
     )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
+    # Options selecting the Schema.org data, shared by the generating commands
+    schema_parser = argparse.ArgumentParser(add_help=False)
+    add_schema_arguments(schema_parser)
+
     # Generate models command
-    subparsers.add_parser("generate_models", help="Generate Schema.org models")
+    subparsers.add_parser(
+        "generate_models", parents=[schema_parser], help="Generate Schema.org models"
+    )
 
     # Generate enums command
-    subparsers.add_parser("generate_enums", help="Generate Schema.org enum classes")
+    subparsers.add_parser(
+        "generate_enums",
+        parents=[schema_parser],
+        help="Generate Schema.org enum classes",
+    )
 
     # Test command
     subparsers.add_parser("test", help="Run unit tests")
 
     # All command
-    subparsers.add_parser("all", help="Generate models, generate enums, and run tests")
+    subparsers.add_parser(
+        "all",
+        parents=[schema_parser],
+        help="Generate models and enums, and run tests",
+    )
 
     args = parser.parse_args()
 
     if args.command == "generate_models":
-        generate_models()
+        generate_models(args)
     elif args.command == "generate_enums":
-        generate_enums()
+        generate_enums(args)
     elif args.command == "test":
         run_tests()
     elif args.command == "all":
-        run_all()
+        run_all(args)
     else:
         parser.print_help()
         sys.exit(1)
@@ -12,10 +12,21 @@ from pathlib import Path
 
 # Add parent directory to path to allow imports from msgspec_schemaorg
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from msgspec_schemaorg.generate import fetch_and_generate
-
-# Default Schema.org URL and output file
-DEFAULT_SCHEMA_URL = "https://schema.org/version/latest/schemaorg-current-https.jsonld"
+sys.path.insert(0, str(Path(__file__).parent))
+from generate_enums import save_enum_outputs
+from msgspec_schemaorg.generate import (
+    SchemaProcessor,
+    generate_package,
+    write_generated_files,
+)
+from msgspec_schemaorg.schema_cache import (
+    DEFAULT_SCHEMA_URL,
+    add_schema_arguments,
+    load_schema,
+    load_schema_from_args,
+)
+
+# Default output directory
 DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "msgspec_schemaorg" / "models"
 ENUMS_DIR = Path(__file__).parent.parent / "msgspec_schemaorg" / "enums"
 
@@ -29,7 +40,7 @@ def ensure_dir_exists(directory: Path):
 
 def download_schema(url: str = DEFAULT_SCHEMA_URL) -> dict:
     """
-    Download the Schema.org JSON-LD data.
+    Download the Schema.org JSON-LD data, or load it from the schema cache.
 
     Args:
         url: URL to download the Schema.org data from
@@ -37,277 +48,95 @@ def download_schema(url: str = DEFAULT_SCHEMA_URL) -> dict:
     Returns:
         Parsed JSON data
     """
-    print(f"Downloading Schema.org data from {url}...")
-    response = requests.get(url)
-    response.raise_for_status()  # Raise an exception for HTTP errors
-
-    print("Schema.org data downloaded successfully.")
-    return response.json()
-
-
-def get_existing_enum_types():
-    """
-    Get a list of types that already have enum implementations.
-
-    Returns:
-        A set of type names (without namespace) that have enum implementations
-    """
-    enum_types = set()
-
-    if not ENUMS_DIR.exists():
-        return enum_types
-
-    # Walk through the enums directory to find all enum files
-    for root, _, files in os.walk(ENUMS_DIR):
-        for file in files:
-            if file.endswith(".py") and not file.startswith("__"):
-                # Remove the .py extension to get the type name
-                enum_name = os.path.splitext(file)[0]
-                enum_types.add(enum_name)
-
-    return enum_types
-
-
-def get_enum_categories():
-    """
-    Get a mapping of enum types to their categories.
-
-    Returns:
-        A dictionary mapping enum type names to their categories
-    """
-    enum_categories = {}
-
-    if not ENUMS_DIR.exists():
-        return enum_categories
-
-    for root, _, files in os.walk(ENUMS_DIR):
-        category = os.path.basename(root)
-        if category == "enums":  # Skip the root enums directory
-            continue
-
-        for file in files:
-            if file.endswith(".py") and not file.startswith("__"):
-                enum_name = os.path.splitext(file)[0]
-                enum_categories[enum_name] = category
-
-    return enum_categories
-
-
-def modify_imports_for_enums(files, enum_types):
-    """
-    Modify import statements in generated files to use enum types from the enums package.
-
-    Args:
-        files: Dictionary mapping file paths to generated code
-        enum_types: Set of type names that have enum implementations
-    """
-    # Get enum categories
-    enum_categories = get_enum_categories()
-
-    # Now update imports in all files
-    for file_path, content in files.items():
-        if file_path.name == "__init__.py":
-            continue
+    return load_schema(url)
 
-        modified_content = content
-
-        # Look for import statements for enum types
-        for enum_type in enum_types:
-            if enum_type not in enum_categories:
-                continue
-
-            category = enum_categories[enum_type]
-
-            # Patterns for imports from models (handle various potential patterns)
-            old_import_patterns = [
-                f"from msgspec_schemaorg.models.intangible.{enum_type} import {enum_type}",
-                f"from msgspec_schemaorg.models.{category}.{enum_type} import {enum_type}",
-                f"from .{enum_type} import {enum_type}",
-                f"from ..{category}.{enum_type} import {enum_type}",
-            ]
-
-            # Pattern for corrected import from enums
-            new_import = f"from msgspec_schemaorg.enums.{category}.{enum_type} import {enum_type}"
-
-            # Replace the import statement
-            for old_pattern in old_import_patterns:
-                if old_pattern in modified_content:
-                    modified_content = modified_content.replace(old_pattern, new_import)
-                    print(f"Updated import for {enum_type} in {file_path}")
-
-        # Update the content in the files dictionary
-        files[file_path] = modified_content
-
-
-def modify_init_files(files, enum_types):
-    """
-    Modify __init__.py files to remove imports of enum types.
 
-    Args:
-        files: Dictionary mapping file paths to generated code
-        enum_types: Set of type names that have enum implementations
-    """
-    for file_path, content in files.items():
-        if file_path.name != "__init__.py":
-            continue
-
-        modified_content = content
-        modified = False
-
-        # Remove imports for enum types
-        for enum_type in enum_types:
-            import_line = f"from .{enum_type} import {enum_type}\n"
-            if import_line in modified_content:
-                modified_content = modified_content.replace(import_line, "")
-                modified = True
-                print(f"Removed import for {enum_type} in {file_path}")
-
-        # Update __all__ list if present
-        if "__all__ = [" in modified_content:
-            # Find __all__ list
-            all_list_start = modified_content.find("__all__ = [")
-            all_list_end = modified_content.find("]", all_list_start)
-            if all_list_end > all_list_start:  # Ensure we found the end bracket
-                all_list = modified_content[all_list_start : all_list_end + 1]
-                original_all_list = all_list
-
-                # Remove enum types from __all__ list
-                for enum_type in enum_types:
-                    # Look for different patterns in __all__ list
-                    patterns = [
-                        f"'{enum_type}',",
-                        f"'{enum_type}'",
-                        f'"{enum_type}",',
-                        f'"{enum_type}"',
-                    ]
-
-                    for pattern in patterns:
-                        if pattern in all_list:
-                            # Replace with empty string
-                            all_list = all_list.replace(pattern, "")
-                            modified = True
-                            print(
-                                f"Removed {enum_type} from __all__ list in {file_path}"
-                            )
-
-                # Clean up any empty commas or double commas
-                all_list = all_list.replace(",,", ",")
-                all_list = all_list.replace(", ,", ",")
-                all_list = all_list.replace("[,", "[")
-                all_list = all_list.replace(",]", "]")
-
-                # Replace the old __all__ list with the cleaned up one
-                if all_list != original_all_list:
-                    modified_content = modified_content.replace(
-                        original_all_list, all_list
-                    )
-
-        # Update the content in the files dictionary if modified
-        if modified:
-            files[file_path] = modified_content
-
-    # Also update the root models/__init__.py if it exists
-    root_init_path = Path(DEFAULT_OUTPUT_DIR) / "__init__.py"
-    if root_init_path.exists():
-        try:
-            with open(root_init_path, "r") as f:
-                root_init_content = f.read()
-
-            modified_root_init = root_init_content
-            modified = False
-
-            # Update __all__ list if present
-            if "__all__ = [" in modified_root_init:
-                # Find __all__ list
-                all_list_start = modified_root_init.find("__all__ = [")
-                all_list_end = modified_root_init.find("]", all_list_start)
-                if all_list_end > all_list_start:  # Ensure we found the end bracket
-                    all_list = modified_root_init[all_list_start : all_list_end + 1]
-                    original_all_list = all_list
-
-                    # Remove enum types from __all__ list
-                    for enum_type in enum_types:
-                        patterns = [
-                            f"'{enum_type}',",
-                            f"'{enum_type}'",
-                            f'"{enum_type}",',
-                            f'"{enum_type}"',
-                        ]
-
-                        for pattern in patterns:
-                            if pattern in all_list:
-                                # Replace with empty string
-                                all_list = all_list.replace(pattern, "")
-                                modified = True
-                                print(
-                                    f"Removed {enum_type} from __all__ list in root __init__.py"
-                                )
-
-                    # Clean up any empty commas or double commas
-                    all_list = all_list.replace(",,", ",")
-                    all_list = all_list.replace(", ,", ",")
-                    all_list = all_list.replace("[,", "[")
-                    all_list = all_list.replace(",]", "]")
-
-                    # Replace the old __all__ list with the cleaned up one
-                    if all_list != original_all_list:
-                        modified_root_init = modified_root_init.replace(
-                            original_all_list, all_list
-                        )
-
-                # Write the modified content back to the file if changed
-                if modified:
-                    with open(root_init_path, "w") as f:
-                        f.write(modified_root_init)
-        except Exception as e:
-            print(f"Error updating root __init__.py: {e}")
-
-
-def save_outputs(files: dict[Path, str], enum_types: set):
+def save_outputs(
+    files: dict[Path, str], output_dir: Path = DEFAULT_OUTPUT_DIR, jobs: int = 1
+):
     """
     Save the generated Python code to multiple files.
 
+    Only files whose content changed are written, and files generated by a
+    previous run that are no longer produced are removed.
+
     Args:
         files: Dictionary mapping file paths to generated code
-        enum_types: Set of type names that already have enum implementations
+        output_dir: Root directory of the generated models
+        jobs: Number of threads writing files
     """
-    # First, modify import statements to use enum types from enums package
-    modify_imports_for_enums(files, enum_types)
-
-    # Then remove enum imports from __init__.py files
-    modify_init_files(files, enum_types)
-
     # Count files by type for summary
     categories = {}
-    skipped_enums = 0
-
-    for file_path, content in files.items():
-        # Skip if this is an enum type that already has an implementation
-        if file_path.name != "__init__.py" and file_path.stem in enum_types:
-            print(f"Skipping {file_path.stem} as it already has an enum implementation")
-            skipped_enums += 1
-            continue
-
-        ensure_dir_exists(file_path.parent)
 
-        with open(file_path, "w") as f:
-            f.write(content)
-
-        # Count for summary
-        if file_path.name != "__init__.py":
+    for file_path in files:
+        # Combined modules of the other layouts are directly in output_dir
+        if not file_path.name.startswith("_") and file_path.parent != Path(output_dir):
             category = file_path.parent.name
             if category not in categories:
                 categories[category] = 0
             categories[category] += 1
 
+    counts = write_generated_files(files, output_dir, jobs=jobs)
+
     # Print summary
-    total_files = sum(count for _, count in categories.items())
-    print(f"Generated {total_files} class files across {len(categories)} categories:")
-    for category, count in sorted(categories.items()):
-        print(f"  - {category}: {count} classes")
+    if categories:
+        total_files = sum(count for _, count in categories.items())
+        print(f"Generated {total_files} class files across {len(categories)} categories:")
+        for category, count in sorted(categories.items()):
+            print(f"  - {category}: {count} classes")
+    else:
+        print(f"Generated {len(files)} modules")
+
+    print(
+        f"Files: {counts['added']} added, {counts['changed']} changed, "
+        f"{counts['removed']} removed, {counts['unchanged']} unchanged"
+    )
 
-    if skipped_enums > 0:
-        print(f"Skipped {skipped_enums} classes that already have enum implementations")
+
+def generate(
+    schema_data: dict,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    include_enums: bool = False,
+    enums_dir: Path = ENUMS_DIR,
+    jobs: int = 1,
+    include: list[str] | None = None,
+    include_depth: int | None = None,
+    layout: str = "files",
+):
+    """
+    Generate the model and enum classes from already loaded Schema.org data.
+
+    Args:
+        schema_data: The loaded JSON-LD Schema.org data
+        output_dir: Directory to save the generated code to
+        include_enums: Generate Struct classes for enumeration types instead of
+            enum classes, the enums package is left untouched
+        enums_dir: Directory to save the generated enum classes to
+        jobs: Number of processes rendering, and threads writing, the files
+        include: Names of the classes to generate, with their parents and the
+            classes they refer to. All classes are generated if None.
+        include_depth: Number of property references followed from the
+            included classes, unlimited if None
+        layout: "files" for one module per class, "categories" for one
+            module per category or "bundle" for a single module
+    """
+    # Generate Python code
+    print("Generating Python code...")
+    model_files, enum_files = generate_package(
+        schema_data,
+        output_dir,
+        enums_dir,
+        include_enums,
+        jobs,
+        include,
+        include_depth,
+        layout,
+    )
+
+    # Save generated files
+    save_outputs(model_files, output_dir, jobs)
+    if enum_files:
+        save_enum_outputs(enum_files, enums_dir, jobs)
 
 
 def main():
@@ -315,11 +144,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Generate Python msgspec.Struct classes from Schema.org vocabulary."
     )
-    parser.add_argument(
-        "--schema-url",
-        default=DEFAULT_SCHEMA_URL,
-        help=f"URL to download the Schema.org data from (default: {DEFAULT_SCHEMA_URL})",
-    )
+    add_schema_arguments(parser)
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -334,7 +159,9 @@ def main():
     parser.add_argument(
         "--clean",
         action="store_true",
-        help="Clean output directory before generating files",
+        help="Clean output directory before generating files, keeping the short "
+        "property keys of _keys.py (stale files from previous runs are removed "
+        "without it)",
     )
 
     parser.add_argument(
@@ -343,10 +170,50 @@ def main():
         help="Do not generate any code",
     )
 
+    parser.add_argument(
+        "--enums-dir",
+        type=Path,
+        default=ENUMS_DIR,
+        help=f"Directory to save the generated enum classes to (default: {ENUMS_DIR})",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes rendering, and threads writing, the generated "
+        "files (default: 1, 0 uses one per CPU)",
+    )
+
+    parser.add_argument(
+        "--include",
+        type=lambda value: [name.strip() for name in value.split(",") if name.strip()],
+        default=None,
+        help="Comma-separated Schema.org types to generate, e.g. Product,Event. "
+        "Their parents and the types they refer to are generated as well, other "
+        "references become Dict[str, Any] (default: all types)",
+    )
+
+    parser.add_argument(
+        "--include-depth",
+        type=int,
+        default=None,
+        help="Number of property references followed from the --include types, "
+        "0 generates only them and their parents (default: unlimited)",
+    )
+
+    parser.add_argument(
+        "--layout",
+        choices=SchemaProcessor.LAYOUTS,
+        default="files",
+        help="Module layout of the models: one file per class, one module per "
+        "category, or the whole vocabulary in one module (default: files)",
+    )
+
     parser.add_argument(
         "--include-enums",
         action="store_true",
-        help="Generate Struct classes even for types that have enum implementations",
+        help="Generate Struct classes for enumeration types instead of enum classes",
     )
 
     args = parser.parse_args()
@@ -357,6 +224,10 @@ def main():
 
             print(f"Cleaning output directory: {args.output_dir}")
             for item in args.output_dir.glob("*"):
+                # Short keys are kept stable across runs, so that data encoded
+                # with them can still be decoded
+                if item.name == "_keys.py":
+                    continue
                 if item.is_dir() and not item.name.startswith("__"):
                     shutil.rmtree(item)
                 elif item.is_file() and not item.name.startswith("__"):
@@ -364,8 +235,8 @@ def main():
         if args.no_generate:
             print("No code generated")
             return
-        # Download schema
-        schema_data = download_schema(args.schema_url)
+        # Load schema data from file, the schema cache or download it
+        schema_data = load_schema_from_args(args)
 
         # Save schema data if requested
         if args.save_schema:
@@ -375,15 +246,17 @@ def main():
                 json.dump(schema_data, f, indent=2)
             print(f"Saved schema data to {schema_file}")
 
-        # Get types that already have enum implementations
-        enum_types = set() if args.include_enums else get_existing_enum_types()
-
-        # Generate Python code
-        print("Generating Python code...")
-        generated_files = fetch_and_generate(schema_data, args.output_dir)
-
-        # Save generated files
-        save_outputs(generated_files, enum_types)
+        jobs = args.jobs or os.cpu_count() or 1
+        generate(
+            schema_data,
+            args.output_dir,
+            args.include_enums,
+            args.enums_dir,
+            jobs,
+            args.include,
+            args.include_depth,
+            args.layout,
+        )
 
         print(f"Code generation completed successfully.")
 
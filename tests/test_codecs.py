@@ -0,0 +1,146 @@
+"""
+Tests for the cached encoder and decoder registry.
+"""
+import sys
+import threading
+import unittest
+from pathlib import Path
+from typing import List
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg import codecs
+from msgspec_schemaorg.models import (
+    Corporation,
+    IndividualProduct,
+    Offer,
+    Organization,
+    Person,
+    PostalAddress,
+    Product,
+    Thing,
+)
+
+
+class TestCodecs(unittest.TestCase):
+    """Test decoder caching, counters and formats."""
+
+    def setUp(self):
+        codecs.cache_clear()
+        self.addCleanup(codecs.set_cache_size, codecs.DEFAULT_MAXSIZE)
+
+    def test_decoder_is_cached(self):
+        """The same decoder instance is returned for repeated lookups."""
+        decoder = codecs.get_decoder(Person)
+        self.assertIs(codecs.get_decoder(Person), decoder)
+        self.assertIsNot(codecs.get_decoder(Person, format="msgpack"), decoder)
+
+        info = codecs.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_json_and_msgpack_round_trip(self):
+        """Cached codecs round trip nested models in both formats."""
+        person = Person(name="Jane", worksFor=Organization(name="ACME"))
+        for format in codecs.FORMATS:
+            data = codecs.get_encoder(format).encode(person)
+            self.assertEqual(codecs.get_decoder(Person, format).decode(data), person)
+
+    def test_nested_subtypes(self):
+        """Model decoders keep the class of nested objects of a subclass."""
+        decoder = codecs.get_decoder(List[Offer])
+        self.assertIsInstance(decoder, codecs.ModelDecoder)
+        offers = decoder.decode(
+            b'[{"price": 1}, {"seller": {"@type": "Corporation", "name": "A"}}]'
+        )
+        self.assertEqual(offers, [Offer(price=1), Offer(seller=Corporation(name="A"))])
+
+    def test_subtypes_and_several_types(self):
+        """Objects of a subclass or with a @type array decode into that class."""
+        for format in codecs.FORMATS:
+            decoder = codecs.get_decoder(Product, format)
+            for document in (
+                {"@type": "IndividualProduct", "name": "Anvil"},
+                {"@type": ["IndividualProduct", "Thing"], "name": "Anvil"},
+            ):
+                data = codecs.get_encoder(format).encode(document)
+                self.assertEqual(decoder.decode(data), IndividualProduct(name="Anvil"))
+            with self.assertRaises(msgspec.ValidationError):
+                decoder.decode(codecs.get_encoder(format).encode({"@type": "Person"}))
+
+    def test_unknown_types(self):
+        """Objects of an unknown @type fall back to the class of their property or are dropped."""
+        thing = codecs.get_decoder(Thing).decode(b'{"@type": "Foo", "name": "x"}')
+        self.assertEqual(thing, Thing(name="x"))
+
+        person = codecs.get_decoder(Person).decode(
+            b'{"address": {"@type": "Foo", "postalCode": "12345"},'
+            b' "worksFor": [{"@type": "Foo", "name": "A"}, {"@type": "Corporation", "name": "B"}]}'
+        )
+        self.assertEqual(
+            person,
+            Person(
+                address=PostalAddress(postalCode="12345"),
+                worksFor=[Organization(name="A"), Corporation(name="B")],
+            ),
+        )
+
+        # seller accepts Organization and Person, so there is no class to fall back to
+        offer = codecs.get_decoder(Offer).decode(
+            b'{"seller": [{"@type": "Foo", "name": "A"}, {"@type": "Person", "name": "B"}],'
+            b' "offeredBy": {"@type": ["Foo", "Bar"], "name": "C"}}'
+        )
+        self.assertEqual(offer, Offer(seller=[Person(name="B")]))
+
+        # Known classes outside the range are still rejected
+        with self.assertRaises(msgspec.ValidationError):
+            codecs.get_decoder(Product).decode(b'{"@type": "Person"}')
+
+    def test_non_class_types(self):
+        """Any msgspec type can be used as a cache key."""
+        people = codecs.get_decoder(List[Person]).decode(
+            b'[{"@type": "Person", "name": "A"}, {"name": "B"}]'
+        )
+        self.assertEqual([p.name for p in people], ["A", "B"])
+
+    def test_lru_eviction(self):
+        """The least recently used decoder is dropped beyond maxsize."""
+        codecs.set_cache_size(2)
+        person = codecs.get_decoder(Person)
+        codecs.get_decoder(Organization)
+        codecs.get_decoder(Person)
+        codecs.get_decoder(int)
+
+        self.assertEqual(codecs.cache_info().currsize, 2)
+        self.assertIs(codecs.get_decoder(Person), person)
+        misses = codecs.cache_info().misses
+        codecs.get_decoder(Organization)
+        self.assertEqual(codecs.cache_info().misses, misses + 1)
+
+    def test_concurrent_construction(self):
+        """Concurrent lookups build a decoder only once."""
+        decoders = []
+        threads = [
+            threading.Thread(target=lambda: decoders.append(codecs.get_decoder(Person)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(d) for d in decoders}), 1)
+        self.assertEqual(codecs.cache_info().misses, 1)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            codecs.get_decoder(Person, format="yaml")
+        with self.assertRaises(ValueError):
+            codecs.get_encoder("yaml")
+        with self.assertRaises(ValueError):
+            codecs.set_cache_size(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
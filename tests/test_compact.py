@@ -0,0 +1,128 @@
+"""
+Tests for the compact, garbage collector free variants of the models.
+"""
+import gc
+import sys
+import unittest
+from pathlib import Path
+from typing import List
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg import AnyThingDecoder
+from msgspec_schemaorg.codecs import get_decoder
+from msgspec_schemaorg.compact import compact_class, from_compact, to_compact
+from msgspec_schemaorg.models import AggregateOffer, Corporation, Offer, Organization, Person
+
+
+class TestCompact(unittest.TestCase):
+    """Test deriving compact classes and converting instances."""
+
+    def setUp(self):
+        self.offer = Offer(
+            price=1.5,
+            priceCurrency="USD",
+            url="https://example.com/offer",
+            seller=[Organization(name="Shop", founder=Person(name="Jane"))],
+        )
+
+    def test_compact_class(self):
+        """Compact classes keep the fields and tag and are not tracked by the GC."""
+        from msgspec_schemaorg.compact.models import Offer as CompactOffer
+
+        self.assertIs(compact_class(Offer), CompactOffer)
+        self.assertEqual(CompactOffer.__struct_fields__, Offer.__struct_fields__)
+        self.assertEqual(CompactOffer.__struct_config__.tag, "Offer")
+        self.assertFalse(gc.is_tracked(CompactOffer(price=1)))
+
+        with self.assertRaises(TypeError):
+            compact_class(dict)
+
+    def test_conversion(self):
+        """Nested model instances are converted in both directions."""
+        compact = to_compact(self.offer)
+        self.assertIs(type(compact), compact_class(Offer))
+        self.assertIs(type(compact.seller[0]), compact_class(Organization))
+        self.assertIs(type(compact.seller[0].founder), compact_class(Person))
+        self.assertEqual(from_compact(compact), self.offer)
+
+        with self.assertRaises(TypeError):
+            from_compact(self.offer)
+
+    def test_same_documents(self):
+        """Compact instances encode and decode like the model instances."""
+        compact = to_compact(self.offer)
+        for format, module in (("json", msgspec.json), ("msgpack", msgspec.msgpack)):
+            buf = module.encode(self.offer)
+            self.assertEqual(module.encode(compact), buf)
+            decoded = get_decoder(compact_class(Offer), format).decode(buf)
+            self.assertEqual(decoded, compact)
+            self.assertFalse(gc.is_tracked(decoded.seller[0]))
+
+    def test_subtypes(self):
+        """Objects of a subclass of the range decode into its compact variant."""
+        from msgspec_schemaorg.compact.models import Offer as CompactOffer
+
+        buf = b'[{"seller": {"@type": "Corporation", "name": "A"}}, {"@type": "AggregateOffer", "lowPrice": 1}]'
+        offers = get_decoder(List[CompactOffer]).decode(buf)
+        self.assertEqual(
+            offers,
+            [
+                CompactOffer(seller=compact_class(Corporation)(name="A")),
+                compact_class(AggregateOffer)(lowPrice=1),
+            ],
+        )
+        self.assertEqual(
+            [from_compact(offer) for offer in offers], get_decoder(List[Offer]).decode(buf)
+        )
+
+    def test_short_keys(self):
+        """Short key classes encode properties under their generated keys."""
+        from msgspec_schemaorg.compact.keyed import Offer as KeyedOffer
+        from msgspec_schemaorg.models._keys import KEYS
+
+        self.assertIs(compact_class(Offer, short_keys=True), KeyedOffer)
+        self.assertIsNot(KeyedOffer, compact_class(Offer))
+
+        compact = to_compact(self.offer, short_keys=True)
+        self.assertIs(type(compact.seller[0]), compact_class(Organization, short_keys=True))
+        self.assertEqual(from_compact(compact), self.offer)
+
+        document = msgspec.json.decode(msgspec.json.encode(compact))
+        self.assertEqual(document["@type"], "Offer")
+        self.assertEqual(document[KEYS["price"]], 1.5)
+        self.assertEqual(document[KEYS["seller"]][0][KEYS["founder"]][KEYS["name"]], "Jane")
+        self.assertNotIn("price", document)
+
+        buf = msgspec.msgpack.encode(compact)
+        self.assertLess(len(buf), len(msgspec.msgpack.encode(self.offer)))
+        self.assertEqual(get_decoder(KeyedOffer, "msgpack").decode(buf), compact)
+
+    def test_short_keys_any_type(self):
+        """AnyThingDecoder decodes short key documents by their @type."""
+        decoder = AnyThingDecoder("msgpack", short_keys=True)
+        compact = to_compact(self.offer, short_keys=True)
+        decoded = decoder.decode(msgspec.msgpack.encode(compact))
+        self.assertEqual(decoded, compact)
+        self.assertEqual(from_compact(decoded), self.offer)
+
+
+    def test_short_keys_subtypes(self):
+        """Short key documents holding subclasses of a property's range round-trip."""
+        offer = Offer(seller=Corporation(name="A"))
+        compact = to_compact(offer, short_keys=True)
+        buf = msgspec.msgpack.encode(compact)
+        for decoder in (
+            AnyThingDecoder("msgpack", short_keys=True),
+            get_decoder(compact_class(Offer, short_keys=True), "msgpack"),
+        ):
+            decoded = decoder.decode(buf)
+            self.assertEqual(decoded, compact)
+            self.assertIs(type(decoded.seller), compact_class(Corporation, short_keys=True))
+            self.assertEqual(from_compact(decoded), offer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Tests for polymorphic decoding by @type.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg import AnyThingDecoder, decode_any
+from msgspec_schemaorg.generate import SchemaProcessor
+from msgspec_schemaorg.models import (
+    AggregateOffer,
+    AggregateRating,
+    Corporation,
+    Model3DModel,
+    Offer,
+    Organization,
+    Person,
+    Product,
+)
+
+
+PRODUCT_JSON = b"""{
+    "@context": "https://schema.org",
+    "@type": "Product",
+    "@id": "https://example.com/products/1",
+    "name": "Executive Anvil",
+    "sku": "0446310786",
+    "offers": {
+        "@type": "Offer",
+        "price": 119.99,
+        "priceCurrency": "USD",
+        "url": "https://example.com/anvil",
+        "seller": {"@type": "Organization", "name": "Executive Objects"}
+    },
+    "aggregateRating": {"@type": "AggregateRating", "ratingValue": 4.4, "reviewCount": 89}
+}"""
+
+
+class TestDecodeAny(unittest.TestCase):
+    """Test decoding JSON-LD into the class named by its @type."""
+
+    def test_decode_nested_product(self):
+        """Top-level and nested objects are decoded into their model classes."""
+        product = decode_any(PRODUCT_JSON)
+
+        self.assertIsInstance(product, Product)
+        self.assertEqual(product.type, "Product")
+        self.assertEqual(product.id, "https://example.com/products/1")
+        self.assertEqual(product.name, "Executive Anvil")
+        self.assertIsInstance(product.offers, Offer)
+        self.assertEqual(product.offers.price, 119.99)
+        self.assertIsInstance(product.offers.seller, Organization)
+        self.assertIsInstance(product.aggregateRating, AggregateRating)
+        self.assertEqual(product.aggregateRating.reviewCount, 89)
+
+    def test_decode_list_values(self):
+        """List-valued properties decode into lists of model instances."""
+        person = decode_any(
+            b'{"@type": "Person", "name": "Jane", "knows": ['
+            b'{"@type": "Person", "name": "John"}, {"@type": "Person", "name": "Ann"}]}'
+        )
+        self.assertIsInstance(person, Person)
+        self.assertEqual([p.name for p in person.knows], ["John", "Ann"])
+
+    def test_nested_subtypes(self):
+        """Nested objects of a subclass of the property's range keep their class."""
+        product = decode_any(
+            b'{"@type": "Product", "offers": {"@type": "AggregateOffer", "lowPrice": "1"}}'
+        )
+        self.assertIsInstance(product.offers, AggregateOffer)
+        self.assertEqual(product.offers.lowPrice, "1")
+
+        product = decode_any(
+            b'{"@type": "Product", "offers": [{"@type": "Offer", "price": 2}, '
+            b'{"@type": "AggregateOffer", "lowPrice": 1, '
+            b'"offers": {"@type": "Offer", "seller": {"@type": "Corporation", "name": "A"}}}], '
+            b'"aggregateRating": {"ratingValue": 4.4}}'
+        )
+        self.assertEqual([type(offer) for offer in product.offers], [Offer, AggregateOffer])
+        self.assertEqual(product.offers[1].offers.seller, Corporation(name="A"))
+        # Untyped objects get the class of their property
+        self.assertEqual(product.aggregateRating, AggregateRating(ratingValue=4.4))
+
+        buf = msgspec.msgpack.encode(product)
+        self.assertEqual(decode_any(buf, format="msgpack"), product)
+
+    def test_several_types(self):
+        """Objects with a @type array decode into the most specific known type."""
+        product = decode_any(
+            b'{"@type": ["Thing", "Product"], "name": "Anvil", '
+            b'"offers": {"@type": ["https://example.com/Deal", "Offer"], "price": 1}}'
+        )
+        self.assertEqual(product, Product(name="Anvil", offers=Offer(price=1)))
+        self.assertIsInstance(decode_any(b'{"@type": ["Organization", "Person"]}'), Organization)
+        with self.assertRaises(msgspec.ValidationError):
+            decode_any(b'{"@type": ["https://example.com/Deal"]}')
+
+    def test_nested_subtype_errors(self):
+        """Errors in objects decoded into a subclass report their location."""
+        with self.assertRaisesRegex(msgspec.ValidationError, r"\$\.offers\[1\]\.seller\.name"):
+            decode_any(
+                b'{"@type": "Product", "offers": [{"@type": "Offer"}, '
+                b'{"@type": "Offer", "seller": {"@type": "Corporation", "name": 1}}]}'
+            )
+
+    def test_tag_differs_from_class_name(self):
+        """Classes renamed for Python use the Schema.org name as @type."""
+        model = decode_any(b'{"@type": "3DModel", "name": "Teapot"}')
+        self.assertIsInstance(model, Model3DModel)
+        self.assertEqual(model.type, "3DModel")
+
+    def test_round_trip(self):
+        """Encoding a decoded object writes @type back out."""
+        product = decode_any(PRODUCT_JSON)
+        self.assertEqual(decode_any(msgspec.json.encode(product)), product)
+        self.assertIn(b'"@type":"Offer"', msgspec.json.encode(product.offers))
+
+    def test_unknown_or_missing_type(self):
+        """Unknown or missing @type values raise ValidationError."""
+        with self.assertRaises(msgspec.ValidationError):
+            decode_any(b'{"@type": "NotASchemaOrgClass", "name": "x"}')
+        with self.assertRaises(msgspec.ValidationError):
+            decode_any(b'{"name": "x"}')
+
+    def test_decoder_instance(self):
+        """AnyThingDecoder can be used directly and covers all model classes."""
+        decoder = AnyThingDecoder()
+        self.assertIn(Product, decoder.types)
+        self.assertIsInstance(decoder.decode('{"@type": "Organization"}'), Organization)
+
+        # References without @type are typed from the nodes of their document
+        offer = decoder.decode_builtins(
+            {"@type": "Offer", "seller": {"@id": "#a"}}, {"#a": "Corporation"}
+        )
+        self.assertIs(type(offer.seller), Organization)
+        with self.assertRaises(msgspec.ValidationError):
+            decoder.decode_builtins({"@type": "Offer", "seller": {"@id": "#a"}})
+
+    def test_msgpack(self):
+        """The msgpack decoder selects classes by @type like the JSON decoder."""
+        product = decode_any(PRODUCT_JSON)
+        buf = msgspec.msgpack.encode(product)
+        self.assertEqual(decode_any(buf, format="msgpack"), product)
+        self.assertIsInstance(
+            decode_any(buf, format="msgpack").offers.seller, Organization
+        )
+        with self.assertRaises(ValueError):
+            decode_any(buf, format="xml")
+
+    def test_type_property(self):
+        """The type property reports the @type tag of constructed objects."""
+        self.assertEqual(Person(name="Jane").type, "Person")
+        self.assertEqual(msgspec.json.encode(Person(name="Jane")), b'{"@type":"Person","name":"Jane"}')
+
+
+class TestTypeTagGeneration(unittest.TestCase):
+    """Test that generated classes declare their @type tag."""
+
+    def test_generated_class_tag(self):
+        schema = {
+            "@graph": [
+                {"@id": "schema:Thing", "@type": "rdfs:Class", "rdfs:label": "Thing"},
+                {
+                    "@id": "schema:3DModel",
+                    "@type": "rdfs:Class",
+                    "rdfs:label": "3DModel",
+                    "rdfs:subClassOf": {"@id": "schema:Thing"},
+                },
+            ]
+        }
+        processor = SchemaProcessor(schema)
+
+        code, _ = processor.generate_struct_code("schema:3DModel")
+        self.assertIn('class Model3DModel(Thing, tag="3DModel"):', code)
+        self.assertNotIn("type: str", code)
+
+        code, _ = processor.generate_struct_code("schema:Thing")
+        self.assertIn('class Thing(SchemaOrgBase, tag="Thing"):', code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,5 +54,42 @@ def test_enum_usage():
     print("All enum usage tests passed!")
 
 
+def test_enum_parsing():
+    """Enumeration values and IRIs are converted to members when enabled."""
+    from msgspec_schemaorg.codecs import get_decoder
+    from msgspec_schemaorg.enums.intangible.ItemAvailability import ItemAvailability
+    from msgspec_schemaorg.enums.intangible.OfferItemCondition import OfferItemCondition
+    from msgspec_schemaorg.enums.intangible.PriceTypeEnumeration import PriceTypeEnumeration
+    from msgspec_schemaorg.models import CompoundPriceSpecification, Offer
+
+    doc = (
+        b'{"@type": "Offer", "availability": "https://schema.org/InStock",'
+        b' "itemCondition": ["schema:NewCondition", "http://schema.org/UsedCondition",'
+        b' "DamagedCondition", "https://example.com/Unknown"]}'
+    )
+    assert get_decoder(Offer).decode(doc).availability == "https://schema.org/InStock"
+
+    offer = get_decoder(Offer, parse_enums=True).decode(doc)
+    assert offer.availability is ItemAvailability.InStock
+    assert offer.itemCondition == [
+        OfferItemCondition.NewCondition,
+        OfferItemCondition.UsedCondition,
+        OfferItemCondition.DamagedCondition,
+        "https://example.com/Unknown",
+    ]
+    assert type(offer.itemCondition[3]) is str
+    # Members encode to the bare value
+    assert msgspec.json.encode(Offer(availability=ItemAvailability.SoldOut)) == (
+        b'{"@type":"Offer","availability":"SoldOut"}'
+    )
+
+    # Fields accepting text only convert IRIs
+    spec = get_decoder(CompoundPriceSpecification, parse_enums=True).decode(
+        b'{"priceType": ["SRP", "https://schema.org/SRP"]}'
+    )
+    assert spec.priceType == ["SRP", PriceTypeEnumeration.SRP]
+    assert type(spec.priceType[0]) is str
+
 if __name__ == "__main__":
-    test_enum_usage() 
\ No newline at end of file
+    test_enum_usage()
+    test_enum_parsing() 
\ No newline at end of file
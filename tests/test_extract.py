@@ -0,0 +1,176 @@
+"""
+Tests for extracting JSON-LD script blocks from HTML pages.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.extract import extract_json_ld, iter_json_ld
+from msgspec_schemaorg.models import Corporation, Offer, Organization, Person, Product, WebPage
+
+
+PAGE = b"""<!DOCTYPE html>
+<html><head>
+<title>Executive Anvil</title>
+<script src="/app.js"></script>
+<script type="application/ld+json">
+{"@type": "Product", "name": "Executive Anvil", "description": "<b>Sleek</b> and <i>heavy</i>"}
+</script>
+<script async data-type="x" type='application/ld+json; charset=utf-8' id=offer>
+<!--
+{"@type": "Offer", "price": 119.99}
+-->
+</script>
+<SCRIPT TYPE=APPLICATION/LD+JSON>//<![CDATA[
+[{"@type": "Person", "name": "Jane"}, {"@type": "Person", "name": "John"}]
+//]]></SCRIPT>
+</head>
+<body><p>Uses application/ld+json & other formats.</p></body>
+</html>"""
+
+
+class TestIterJsonLd(unittest.TestCase):
+    """Test finding the blocks of a page."""
+
+    def test_blocks(self):
+        """Blocks are found whatever the attribute order, quoting and case."""
+        blocks = [bytes(block) for block in iter_json_ld(PAGE)]
+        self.assertEqual(
+            blocks,
+            [
+                b'{"@type": "Product", "name": "Executive Anvil", '
+                b'"description": "<b>Sleek</b> and <i>heavy</i>"}',
+                b'{"@type": "Offer", "price": 119.99}',
+                b'[{"@type": "Person", "name": "Jane"}, {"@type": "Person", "name": "John"}]',
+            ],
+        )
+
+    def test_zero_copy(self):
+        """Blocks are slices of the page, not copies."""
+        for block in iter_json_ld(PAGE):
+            self.assertIsInstance(block, memoryview)
+            self.assertIs(block.obj, PAGE)
+
+    def test_text_page(self):
+        """Text pages are encoded, other buffers are searched as bytes."""
+        expected = [bytes(block) for block in iter_json_ld(PAGE)]
+        for page in (PAGE.decode(), bytearray(PAGE), memoryview(PAGE)):
+            self.assertEqual([bytes(block) for block in iter_json_ld(page)], expected)
+
+    def test_wrappers(self):
+        """CDATA sections written inside block comments are removed."""
+        page = (
+            b'<script type="application/ld+json">/*<![CDATA[*/ {"@type": "Person"} /*]]>*/'
+            b"</script>"
+        )
+        self.assertEqual([bytes(block) for block in iter_json_ld(page)], [b'{"@type": "Person"}'])
+
+    def test_entities(self):
+        """JSON written with HTML entities is unescaped."""
+        page = (
+            b'<script type="application/ld+json">'
+            b"{&quot;@type&quot;: &quot;Organization&quot;, &quot;name&quot;: &quot;A &amp; B&quot;}"
+            b"</script>"
+        )
+        self.assertEqual(
+            list(iter_json_ld(page)), [b'{"@type": "Organization", "name": "A & B"}']
+        )
+
+    def test_skipped(self):
+        """Empty blocks, other types and media types outside a tag are skipped."""
+        page = (
+            b'<script type="application/ld+json">  </script>'
+            b'<script data-type="application/ld+json">{}</script>'
+            b'<script type="application/json">{}</script>'
+            b"<p>type=application/ld+json</p>"
+            b'<script type="text/javascript">var t = "application/ld+json";</script>'
+        )
+        self.assertEqual(list(iter_json_ld(page)), [])
+
+    def test_many_plus_signs(self):
+        """Blocks are found after scripts full of "+"."""
+        script = b"<script>" + b"a = b + c;\n" * 200 + b"</script>"
+        page = script + PAGE.replace(b"LD+JSON", b"ld+json") + script + PAGE
+        self.assertEqual(len(list(iter_json_ld(page))), 6)
+
+    def test_unclosed(self):
+        """A block not closed by the end of the page runs to the end."""
+        page = b'<script type="application/ld+json">{"@type": "Person"}'
+        self.assertEqual([bytes(block) for block in iter_json_ld(page)], [b'{"@type": "Person"}'])
+
+
+class TestExtractJsonLd(unittest.TestCase):
+    """Test decoding the blocks of a page."""
+
+    def test_decode_by_type(self):
+        """Objects are decoded by @type, arrays give one object per item."""
+        objects = extract_json_ld(PAGE)
+        self.assertEqual([type(obj) for obj in objects], [Product, Offer, Person, Person])
+        self.assertEqual(objects[0].name, "Executive Anvil")
+        self.assertEqual(objects[1].price, 119.99)
+        self.assertEqual(objects[3].name, "John")
+
+    def test_type(self):
+        """With a type, every object is decoded into it."""
+        page = b'<script type="application/ld+json">{"name": "Jane"}</script>'
+        self.assertEqual(extract_json_ld(page, type=Person), [Person(name="Jane")])
+
+    def test_nested_subtypes(self):
+        """Nested objects of a subclass of the property's range keep their class."""
+        page = (
+            b'<script type="application/ld+json">[{"@type": "Offer", "price": 1, '
+            b'"seller": {"@type": "Corporation", "name": "A"}}]</script>'
+        )
+        for type in (None, Offer):
+            (offer,) = extract_json_ld(page, type=type)
+            self.assertEqual(offer, Offer(price=1, seller=Corporation(name="A")))
+
+    def test_graph(self):
+        """The nodes of a @graph are decoded as with Graph.decode."""
+        page = b"""<script type="application/ld+json">{
+            "@context": "https://schema.org",
+            "@graph": [
+                {"@type": "WebPage", "@id": "https://example.com/#page", "author": {"@id": "#jane"}},
+                {"@type": "Person", "@id": "#jane", "name": "Jane"}
+            ]
+        }</script>"""
+        page_node, person = extract_json_ld(page)
+        self.assertIsInstance(page_node, WebPage)
+        self.assertEqual(page_node.author.id, "#jane")
+        self.assertEqual(person, Person(id="#jane", name="Jane"))
+
+    def test_invalid(self):
+        """Invalid blocks raise, or are skipped with skip_invalid."""
+        page = (
+            b'<script type="application/ld+json">{"@type": "Organization", "name": "A"}</script>'
+            b'<script type="application/ld+json">{"@type": "Organization",}</script>'
+            b'<script type="application/ld+json">{"@type": "NoSuchType"}</script>'
+        )
+        with self.assertRaises(msgspec.DecodeError):
+            extract_json_ld(page)
+        self.assertEqual(
+            extract_json_ld(page, skip_invalid=True), [Organization(name="A")]
+        )
+
+    def test_invalid_items(self):
+        """Invalid objects of an array or @graph are skipped one by one."""
+        page = (
+            b'<script type="application/ld+json">[{"@type": "Person", "name": "A"}, '
+            b'{"@type": "Person", "name": 1}, {"@type": "Person", "name": "B"}]</script>'
+            b'<script type="application/ld+json">{"@graph": [{"@type": "Person", "name": 2}, '
+            b'{"@type": "Person", "name": "C"}]}</script>'
+        )
+        with self.assertRaises(msgspec.ValidationError):
+            extract_json_ld(page)
+        self.assertEqual(
+            extract_json_ld(page, skip_invalid=True),
+            [Person(name="A"), Person(name="B"), Person(name="C")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,297 @@
+"""
+Tests for generating the models and enums packages in a single pass.
+"""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.generate import (
+    SchemaProcessor,
+    generate_package,
+    load_short_keys,
+    render_keys_module,
+)
+
+
+def get_schema():
+    """A minimal schema with an enumeration type and two of its members."""
+    return {
+        "@graph": [
+            {"@id": "schema:Thing", "@type": "rdfs:Class", "rdfs:label": "Thing"},
+            {
+                "@id": "schema:Intangible",
+                "@type": "rdfs:Class",
+                "rdfs:subClassOf": {"@id": "schema:Thing"},
+            },
+            {
+                "@id": "schema:Enumeration",
+                "@type": "rdfs:Class",
+                "rdfs:subClassOf": {"@id": "schema:Intangible"},
+            },
+            {
+                "@id": "schema:ItemAvailability",
+                "@type": "rdfs:Class",
+                "rdfs:subClassOf": {"@id": "schema:Enumeration"},
+            },
+            {
+                "@id": "schema:Offer",
+                "@type": "rdfs:Class",
+                "rdfs:subClassOf": {"@id": "schema:Intangible"},
+            },
+            {
+                "@id": "schema:Organization",
+                "@type": "rdfs:Class",
+                "rdfs:subClassOf": {"@id": "schema:Thing"},
+            },
+            {
+                "@id": "schema:seller",
+                "@type": "rdf:Property",
+                "schema:domainIncludes": {"@id": "schema:Offer"},
+                "schema:rangeIncludes": {"@id": "schema:Organization"},
+            },
+            {
+                "@id": "schema:availability",
+                "@type": "rdf:Property",
+                "schema:domainIncludes": {"@id": "schema:Offer"},
+                "schema:rangeIncludes": {"@id": "schema:ItemAvailability"},
+            },
+            {
+                "@id": "schema:InStock",
+                "@type": "schema:ItemAvailability",
+                "rdfs:comment": "Indicates that the item is in stock.",
+                "rdfs:label": "InStock",
+            },
+            {
+                "@id": "schema:SoldOut",
+                "@type": "schema:ItemAvailability",
+                "rdfs:label": "SoldOut",
+            },
+        ]
+    }
+
+
+class TestGenerationPipeline(unittest.TestCase):
+    """Test that models refer to the enums generated in the same pass."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.models_dir = Path(tmp.name) / "models"
+        self.enums_dir = Path(tmp.name) / "enums"
+
+    def test_models_and_enums(self):
+        model_files, enum_files = generate_package(
+            get_schema(), self.models_dir, self.enums_dir
+        )
+
+        # The enumeration is generated as an enum, not as a Struct
+        self.assertNotIn(self.models_dir / "intangible" / "ItemAvailability.py", model_files)
+        enum_code = enum_files[self.enums_dir / "intangible" / "ItemAvailability.py"]
+        self.assertIn("class ItemAvailability(SchemaOrgEnum):", enum_code)
+        self.assertIn('InStock = "InStock"', enum_code)
+        self.assertIn('SoldOut = "SoldOut"', enum_code)
+        self.assertIn(
+            "'ItemAvailability': 'ItemAvailability',",
+            enum_files[self.enums_dir / "intangible" / "__init__.py"],
+        )
+        self.assertIn(
+            "'ItemAvailability': 'intangible',", enum_files[self.enums_dir / "__init__.py"]
+        )
+
+        # Member metadata is kept out of the enum modules
+        self.assertNotIn("metadata", enum_code)
+        namespace = {}
+        exec(enum_files[self.enums_dir / "_metadata.py"], namespace)
+        self.assertEqual(
+            namespace["METADATA"]["ItemAvailability"]["InStock"],
+            ("schema:InStock", "InStock", "Indicates that the item is in stock."),
+        )
+
+        # Models import it from the enums package and do not export it
+        offer_code = model_files[self.models_dir / "intangible" / "Offer.py"]
+        self.assertIn(
+            "from msgspec_schemaorg.enums.intangible.ItemAvailability import ItemAvailability",
+            offer_code,
+        )
+        self.assertNotIn(
+            "'ItemAvailability'", model_files[self.models_dir / "intangible" / "__init__.py"]
+        )
+        self.assertNotIn("'ItemAvailability'", model_files[self.models_dir / "__init__.py"])
+        self.assertIn(
+            "'ItemAvailability': 'msgspec_schemaorg.enums.intangible.ItemAvailability',",
+            model_files[self.models_dir / "_namespace.py"],
+        )
+
+    def test_property_metadata(self):
+        """The property table lists the parent and own properties of each class."""
+        model_files, _ = generate_package(get_schema(), self.models_dir, self.enums_dir)
+        fields_code = model_files[self.models_dir / "_fields.py"]
+        namespace = {}
+        exec(compile(fields_code, "_fields.py", "exec"), namespace)
+
+        classes = namespace["CLASSES"]
+        self.assertEqual(classes["Thing"], (None, {}))
+        self.assertEqual(classes["Organization"], ("Thing", {}))
+        self.assertEqual(
+            classes["Offer"][1]["seller"],
+            ("seller", "http://schema.org/seller", ("Organization",)),
+        )
+        self.assertNotIn("ItemAvailability", classes)
+
+    def test_short_keys_are_kept(self):
+        """Regenerating keeps the short keys assigned before, new properties get unused keys."""
+        model_files, _ = generate_package(get_schema(), self.models_dir, self.enums_dir)
+        keys_path = self.models_dir / "_keys.py"
+        keys_path.parent.mkdir(parents=True, exist_ok=True)
+        keys_path.write_text(model_files[keys_path])
+        self.assertEqual(load_short_keys(keys_path), {"availability": "0", "seller": "1"})
+
+        keys_path.write_text(render_keys_module({"retired": "0", "seller": "1"}))
+        model_files, _ = generate_package(get_schema(), self.models_dir, self.enums_dir)
+        keys_path.write_text(model_files[keys_path])
+        self.assertEqual(
+            load_short_keys(keys_path), {"availability": "2", "retired": "0", "seller": "1"}
+        )
+
+    def test_include_enums(self):
+        """With include_enums, enumerations are generated as Structs."""
+        model_files, enum_files = generate_package(
+            get_schema(), self.models_dir, self.enums_dir, include_enums=True
+        )
+        self.assertEqual(enum_files, {})
+        self.assertIn(self.models_dir / "intangible" / "ItemAvailability.py", model_files)
+        self.assertIn(
+            "from msgspec_schemaorg.models.intangible.ItemAvailability import ItemAvailability",
+            model_files[self.models_dir / "intangible" / "Offer.py"],
+        )
+
+    def test_parallel_rendering_is_deterministic(self):
+        """Rendering in worker processes gives the same files in the same order."""
+        serial, _ = generate_package(get_schema(), self.models_dir, self.enums_dir)
+        parallel, _ = generate_package(
+            get_schema(), self.models_dir, self.enums_dir, jobs=2
+        )
+        self.assertEqual(list(parallel.items()), list(serial.items()))
+
+    def test_bundle_layout(self):
+        """The bundle defines all classes in one module, parents first."""
+        model_files, _ = generate_package(
+            get_schema(), self.models_dir, self.enums_dir, layout="bundle"
+        )
+        bundle = model_files[self.models_dir / "_bundle.py"]
+        compile(bundle, "_bundle.py", "exec")
+
+        self.assertNotIn("TYPE_CHECKING", bundle)
+        self.assertNotIn("msgspec_schemaorg.models", bundle)
+        self.assertIn(
+            "from msgspec_schemaorg.enums.intangible.ItemAvailability import ItemAvailability",
+            bundle,
+        )
+        positions = [
+            bundle.index(f"class {name}(")
+            for name in ("Thing", "Intangible", "Offer")
+        ]
+        self.assertEqual(positions, sorted(positions))
+
+        # Categories re-export their classes from the bundle
+        self.assertNotIn(self.models_dir / "intangible" / "Offer.py", model_files)
+        self.assertIn(
+            "from ._bundle import (\n    Enumeration,\n    Intangible,\n    Offer,\n)",
+            model_files[self.models_dir / "intangible.py"],
+        )
+        self.assertIn("'Offer': '_bundle',", model_files[self.models_dir / "__init__.py"])
+        self.assertIn(
+            "'Offer': 'msgspec_schemaorg.models._bundle',",
+            model_files[self.models_dir / "_namespace.py"],
+        )
+
+    def test_categories_layout(self):
+        """Each category is one module importing parents from other categories."""
+        schema = get_schema()
+        schema["@graph"].append(
+            {
+                "@id": "schema:url",
+                "@type": "rdf:Property",
+                "schema:domainIncludes": {"@id": "schema:Thing"},
+                "schema:rangeIncludes": {"@id": "schema:URL"},
+            }
+        )
+        model_files, _ = generate_package(
+            schema, self.models_dir, self.enums_dir, layout="categories"
+        )
+        intangible = model_files[self.models_dir / "intangible.py"]
+        compile(intangible, "intangible.py", "exec")
+        self.assertIn("from msgspec_schemaorg.models.thing import Thing", intangible)
+        # Utilities are only imported by the modules referring to them
+        self.assertNotIn("msgspec_schemaorg.utils", intangible)
+        self.assertIn(
+            "from msgspec_schemaorg.utils import URL\n", model_files[self.models_dir / "thing.py"]
+        )
+        self.assertFalse(any("parse_iso8601" in code for code in model_files.values()))
+        self.assertIn(
+            "if TYPE_CHECKING:\n    from msgspec_schemaorg.models.organization import Organization",
+            intangible,
+        )
+        self.assertIn(
+            "'Offer': 'msgspec_schemaorg.models.intangible',",
+            model_files[self.models_dir / "_namespace.py"],
+        )
+
+        with self.assertRaises(ValueError):
+            generate_package(get_schema(), self.models_dir, self.enums_dir, layout="zip")
+
+
+class TestVocabularySubset(unittest.TestCase):
+    """Test generating only the classes needed by an include list."""
+
+    def test_closure(self):
+        """Parents and referenced classes of included classes are generated."""
+        processor = SchemaProcessor(get_schema(), use_enums=True, include=["Offer"])
+        self.assertEqual(
+            processor.included_classes,
+            {
+                "schema:Offer",
+                "schema:Intangible",
+                "schema:Thing",
+                "schema:Organization",
+                "schema:ItemAvailability",
+            },
+        )
+        self.assertFalse(processor.is_included("schema:Enumeration"))
+
+        with self.assertRaises(ValueError):
+            SchemaProcessor(get_schema(), include=["NoSuchType"])
+
+    def test_excluded_references_are_collapsed(self):
+        """References beyond the include depth become dictionaries and strings."""
+        with tempfile.TemporaryDirectory() as tmp:
+            model_files, enum_files = generate_package(
+                get_schema(),
+                Path(tmp) / "models",
+                Path(tmp) / "enums",
+                include=["Offer"],
+                include_depth=0,
+            )
+
+        names = sorted(path.name for path in model_files if not path.name.startswith("_"))
+        self.assertEqual(names, ["Intangible.py", "Offer.py", "Thing.py"])
+        self.assertNotIn(Path(tmp) / "enums" / "intangible" / "ItemAvailability.py", enum_files)
+
+        offer_code = model_files[Path(tmp) / "models" / "intangible" / "Offer.py"]
+        self.assertIn(
+            "seller: Union[List[Dict[str, Any]], Dict[str, Any], None] = None", offer_code
+        )
+        self.assertIn("availability: Union[List[str], str, None] = None", offer_code)
+        self.assertNotIn("Organization", offer_code)
+
+        # Only the generated classes are in the runtime namespace
+        self.assertNotIn(
+            "Organization", model_files[Path(tmp) / "models" / "_namespace.py"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for @graph documents with an @id index.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.graph import Graph
+from msgspec_schemaorg.models import (
+    CreativeWork,
+    ItemPage,
+    Organization,
+    Person,
+    ReadAction,
+    WebPage,
+    WebSite,
+)
+
+
+GRAPH_JSON = b"""{
+    "@context": "https://schema.org",
+    "@graph": [
+        {
+            "@type": "WebPage",
+            "@id": "https://example.com/#webpage",
+            "name": "Home",
+            "isPartOf": {"@id": "https://example.com/#website"},
+            "author": {"@id": "https://example.com/#person"},
+            "publisher": {"@id": "https://example.com/#org"}
+        },
+        {
+            "@type": "WebSite",
+            "@id": "https://example.com/#website",
+            "name": "Example",
+            "publisher": {"@id": "https://example.com/#org"}
+        },
+        {"@type": "Organization", "@id": "https://example.com/#org", "name": "Example Org"},
+        {
+            "@type": "Person",
+            "@id": "https://example.com/#person",
+            "name": "Jane",
+            "worksFor": [{"@id": "https://example.com/#org"}]
+        }
+    ]
+}"""
+
+
+class TestGraph(unittest.TestCase):
+    """Test decoding and dereferencing @graph documents."""
+
+    def setUp(self):
+        self.graph = Graph.decode(GRAPH_JSON)
+
+    def test_decode_typed_nodes(self):
+        """Every node is decoded into its model class and indexed by @id."""
+        self.assertEqual(len(self.graph), 4)
+        self.assertEqual(self.graph.context, "https://schema.org")
+        self.assertEqual(
+            [type(node) for node in self.graph], [WebPage, WebSite, Organization, Person]
+        )
+        self.assertIn("https://example.com/#org", self.graph)
+        self.assertIsInstance(self.graph["https://example.com/#person"], Person)
+        self.assertIsNone(self.graph.get("https://example.com/#missing"))
+
+    def test_resolve_references(self):
+        """Untyped references are decoded as references and resolved by @id."""
+        page = self.graph["https://example.com/#webpage"]
+
+        # The property only accepts CreativeWork, the reference keeps that type
+        self.assertIs(type(page.isPartOf), CreativeWork)
+        self.assertIsNone(page.isPartOf.name)
+        self.assertIsInstance(self.graph.resolve(page.isPartOf), WebSite)
+
+        # Properties accepting several classes use the referenced node's type
+        self.assertIsInstance(page.author, Person)
+        self.assertEqual(self.graph.resolve(page.author).name, "Jane")
+        self.assertEqual(self.graph.resolve("https://example.com/#org").name, "Example Org")
+        with self.assertRaises(KeyError):
+            self.graph.resolve("https://example.com/#missing")
+
+    def test_follow(self):
+        """follow() dereferences single values and lists."""
+        page = self.graph["https://example.com/#webpage"]
+        person = self.graph["https://example.com/#person"]
+
+        self.assertEqual(self.graph.follow(page, "publisher").name, "Example Org")
+        self.assertEqual([org.name for org in self.graph.follow(person, "worksFor")], ["Example Org"])
+        self.assertEqual(self.graph.follow(page, "name"), "Home")
+        self.assertIsNone(self.graph.follow(page, "description"))
+
+    def test_of_type(self):
+        """of_type() filters nodes by class, including subclasses."""
+        self.assertEqual(len(self.graph.of_type(CreativeWork)), 2)
+        self.assertEqual(self.graph.of_type(Person)[0].name, "Jane")
+
+    def test_other_document_shapes(self):
+        """A node array or a single node are accepted as well."""
+        graph = Graph.decode(b'[{"@type": "Person", "@id": "#a", "name": "A"}]')
+        self.assertEqual(graph["#a"].name, "A")
+
+        graph = Graph.decode(b'{"@type": "Person", "@id": "#b", "name": "B"}')
+        self.assertEqual(len(graph), 1)
+        self.assertEqual(graph["#b"].name, "B")
+
+    def test_nested_subtypes(self):
+        """Nested objects of a subclass of the property's range keep their class."""
+        graph = Graph.decode(
+            b'{"@context": "https://schema.org", "@graph": ['
+            b'{"@type": "WebPage", "@id": "https://example.com/#webpage", '
+            b'"isPartOf": {"@id": "https://example.com/#website"}, '
+            b'"potentialAction": [{"@type": "ReadAction", "target": ["https://example.com/"]}]}, '
+            b'{"@type": "WebSite", "@id": "https://example.com/#website"}]}'
+        )
+        page = graph["https://example.com/#webpage"]
+        self.assertEqual(page.potentialAction, [ReadAction(target=["https://example.com/"])])
+        self.assertIs(type(page.isPartOf), CreativeWork)
+
+    def test_several_types(self):
+        """Nodes with a @type array decode into the most specific known type."""
+        graph = Graph.decode(
+            b'{"@graph": [{"@type": ["WebPage", "ItemPage"], "@id": "#page", '
+            b'"author": {"@id": "#org"}}, {"@type": ["Thing", "Organization"], "@id": "#org"}]}'
+        )
+        self.assertIsInstance(graph["#page"], ItemPage)
+        self.assertIs(type(graph["#page"].author), Organization)
+        self.assertIs(type(graph["#org"]), Organization)
+
+    def test_unknown_type(self):
+        with self.assertRaises(msgspec.ValidationError):
+            Graph.decode(b'{"@graph": [{"@type": "NotASchemaOrgClass"}]}')
+
+    def test_skip_invalid(self):
+        """Invalid nodes can be left out instead of failing the whole graph."""
+        document = (
+            b'{"@graph": [{"@type": "NotASchemaOrgClass", "@id": "#x"}, '
+            b'{"@type": "Person", "@id": "#a", "name": 1}, '
+            b'{"@type": "Person", "@id": "#b", "name": "B", "knows": {"@id": "#x"}}]}'
+        )
+        with self.assertRaises(msgspec.ValidationError):
+            Graph.decode(document)
+
+        graph = Graph.decode(document, skip_invalid=True)
+        self.assertEqual(len(graph), 1)
+        self.assertNotIn("#a", graph)
+        self.assertEqual(graph["#b"].name, "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
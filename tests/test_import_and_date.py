@@ -14,7 +14,11 @@ try:
         PostalAddress, 
         BlogPosting
     )
-    from msgspec_schemaorg.utils import parse_iso8601
+    from msgspec_schemaorg.utils import (
+        parse_iso8601,
+        parse_iso8601_array,
+        parse_iso8601_many,
+    )
 except ImportError:
     print("Error: Models not found. Please generate them first by running scripts/generate_models.py")
     sys.exit(1)
@@ -109,5 +113,73 @@ class TestImportsAndDates(unittest.TestCase):
         self.assertEqual(blog.dateModified.minute, 30)
 
 
+
+class TestBatchDates(unittest.TestCase):
+    """Test batch date parsing and parsing date fields during decoding."""
+
+    VALUES = [
+        "2023-05-15",
+        "2023-05-15T14:30:45Z",
+        "2023-05-15T14:30",
+        "2023-05-15T14:30:45+02:00",
+        "2023-02-30",
+        "not a date",
+        "",
+        None,
+        42,
+    ]
+
+    def test_parse_many_matches_single(self):
+        """Batch parsing gives the same results as parse_iso8601."""
+        self.assertEqual(
+            parse_iso8601_many(self.VALUES),
+            [parse_iso8601(value) for value in self.VALUES],
+        )
+        values = ["2023-05-%02d" % (i % 28 + 1) for i in range(3000)] + ["bad"]
+        self.assertEqual(
+            parse_iso8601_many(values), [parse_iso8601(value) for value in values]
+        )
+
+    def test_parse_array(self):
+        """The NumPy variant returns datetime64 values in UTC with NaT for failures."""
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+
+        array = parse_iso8601_array(self.VALUES, unit="s")
+        self.assertEqual(array.dtype, np.dtype("datetime64[s]"))
+        self.assertEqual(array[0], np.datetime64("2023-05-15T00:00:00"))
+        self.assertEqual(array[3], np.datetime64("2023-05-15T12:30:45"))
+        self.assertTrue(np.isnat(array[4]))
+        self.assertTrue(np.isnat(array[-1]))
+
+    def test_parse_dates_while_decoding(self):
+        """Date fields decoded as strings are parsed by decoders with parse_dates."""
+        from msgspec_schemaorg.codecs import get_decoder
+        from msgspec_schemaorg.models import Event
+
+        doc = b'{"startDate": "2024-05-01T19:00:00Z", "endDate": ["2024-05-02", "soon"]}'
+        self.assertEqual(get_decoder(Event).decode(doc).startDate, "2024-05-01T19:00:00Z")
+
+        event = get_decoder(Event, parse_dates=True).decode(doc)
+        self.assertIsInstance(event.startDate, datetime)
+        self.assertEqual(event.startDate.hour, 19)
+        self.assertEqual(event.endDate, [date(2024, 5, 2), "soon"])
+
+        # Models built directly are left as they are
+        self.assertEqual(Event(startDate="2024-05-02").startDate, "2024-05-02")
+
+    def test_parse_single_date_field(self):
+        """A class with a single date field to parse is handled as well."""
+        from msgspec_schemaorg.base import _field_kinds
+        from msgspec_schemaorg.codecs import get_decoder
+        from msgspec_schemaorg.models import Invoice
+
+        self.assertEqual(_field_kinds(Invoice).dates, ("paymentDueDate",))
+        decoder = get_decoder(Invoice, parse_dates=True)
+        self.assertEqual(decoder.decode(b'{"paymentDueDate": "2024-05-02"}').paymentDueDate, date(2024, 5, 2))
+        self.assertIsNone(decoder.decode(b"{}").paymentDueDate)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
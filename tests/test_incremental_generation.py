@@ -0,0 +1,94 @@
+"""
+Tests for incremental writing of generated files.
+"""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.generate import MANIFEST_NAME, write_generated_files
+
+
+class TestIncrementalGeneration(unittest.TestCase):
+    """Test that only changed files are written and stale files removed."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output_dir = Path(tmp.name)
+        self.files = {
+            self.output_dir / "__init__.py": "# init\n",
+            self.output_dir / "thing" / "Thing.py": "class Thing: pass\n",
+            self.output_dir / "person" / "Person.py": "class Person: pass\n",
+        }
+
+    def test_first_and_repeated_run(self):
+        counts = write_generated_files(self.files, self.output_dir)
+        self.assertEqual(counts, {"added": 3, "changed": 0, "unchanged": 0, "removed": 0})
+
+        thing = self.output_dir / "thing" / "Thing.py"
+        mtime = thing.stat().st_mtime_ns
+        counts = write_generated_files(self.files, self.output_dir)
+        self.assertEqual(counts, {"added": 0, "changed": 0, "unchanged": 3, "removed": 0})
+        self.assertEqual(thing.stat().st_mtime_ns, mtime)
+
+        manifest = json.loads((self.output_dir / MANIFEST_NAME).read_text())
+        self.assertEqual(
+            sorted(manifest["files"]), ["__init__.py", "person/Person.py", "thing/Thing.py"]
+        )
+
+    def test_threaded_writes(self):
+        counts = write_generated_files(self.files, self.output_dir, jobs=4)
+        self.assertEqual(counts, {"added": 3, "changed": 0, "unchanged": 0, "removed": 0})
+
+        files = dict(self.files)
+        files[self.output_dir / "thing" / "Thing.py"] = "class Thing:\n    pass\n"
+        counts = write_generated_files(files, self.output_dir, jobs=4)
+        self.assertEqual(counts, {"added": 0, "changed": 1, "unchanged": 2, "removed": 0})
+        for file_path, content in files.items():
+            self.assertEqual(file_path.read_text(), content)
+
+    def test_changed_and_stale_files(self):
+        write_generated_files(self.files, self.output_dir)
+        unrelated = self.output_dir / "thing" / "handwritten.py"
+        unrelated.write_text("# not generated\n")
+
+        files = dict(self.files)
+        files[self.output_dir / "thing" / "Thing.py"] = "class Thing:\n    pass\n"
+        del files[self.output_dir / "person" / "Person.py"]
+
+        counts = write_generated_files(files, self.output_dir)
+        self.assertEqual(counts, {"added": 0, "changed": 1, "unchanged": 1, "removed": 1})
+        self.assertEqual(
+            (self.output_dir / "thing" / "Thing.py").read_text(), "class Thing:\n    pass\n"
+        )
+        self.assertFalse((self.output_dir / "person").exists())
+        self.assertTrue(unrelated.exists())
+
+    def test_layout_switch(self):
+        # Category packages without a manifest, as in a fresh checkout
+        for file_path, content in self.files.items():
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+        (self.output_dir / "person" / "__init__.py").write_text("# person\n")
+        (self.output_dir / "thing" / "__init__.py").write_text("# thing\n")
+        (self.output_dir / "place.py").write_text("# place\n")
+
+        files = {
+            self.output_dir / "__init__.py": "# init\n",
+            self.output_dir / "person.py": "class Person: pass\n",
+            self.output_dir / "thing" / "__init__.py": "# thing\n",
+            self.output_dir / "place" / "__init__.py": "# place\n",
+        }
+        counts = write_generated_files(files, self.output_dir)
+        self.assertEqual(counts, {"added": 2, "changed": 0, "unchanged": 2, "removed": 3})
+        self.assertFalse((self.output_dir / "person").exists())
+        self.assertFalse((self.output_dir / "place.py").exists())
+        self.assertTrue((self.output_dir / "thing" / "Thing.py").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -234,5 +234,34 @@ class TestInheritance(unittest.TestCase):
         self.assertEqual(decoded["@context"], "https://schema.org")
 
 
+class TestSchemaProcessorIndexes(unittest.TestCase):
+    """Test the lookup indexes built by SchemaProcessor."""
+
+    def test_domain_and_name_indexes(self):
+        """Properties are indexed by domain and class IDs by normalized name."""
+        processor = SchemaProcessor(MockSchemaData.get_basic_schema())
+
+        self.assertEqual(
+            processor.domain_properties["http://schema.org/Thing"],
+            ["http://schema.org/name", "http://schema.org/url"],
+        )
+        self.assertEqual(
+            processor.class_ids_by_name["Book"], "http://schema.org/Book"
+        )
+
+        # Direct properties come from the index, inherited ones from parents
+        self.assertEqual(
+            list(processor.direct_class_properties["http://schema.org/Book"]), ["isbn"]
+        )
+        self.assertEqual(
+            set(processor.class_properties["http://schema.org/Book"]),
+            {"name", "url", "author", "isbn"},
+        )
+        self.assertEqual(
+            processor.class_dependencies["http://schema.org/CreativeWork"],
+            {"http://schema.org/Person"},
+        )
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
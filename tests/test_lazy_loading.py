@@ -0,0 +1,85 @@
+"""
+Tests for lazy loading of the generated model packages.
+"""
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.generate import render_lazy_init
+
+
+class TestLazyLoading(unittest.TestCase):
+    """Test that generated packages resolve classes on first access."""
+
+    def run_snippet(self, code: str) -> str:
+        """Run code in a fresh interpreter so the import state is clean."""
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip()
+
+    def test_import_only_loads_requested_class(self):
+        """Importing one class should not import unrelated class modules."""
+        output = self.run_snippet(
+            "import sys\n"
+            "from msgspec_schemaorg.models import Person\n"
+            "print('msgspec_schemaorg.models.person.Person' in sys.modules)\n"
+            "print('msgspec_schemaorg.models.product.Product' in sys.modules)\n"
+        )
+        self.assertEqual(output.split(), ["True", "False"])
+
+    def test_parent_module_does_not_shadow_class(self):
+        """Loading a subclass imports its parent module without hiding the class."""
+        output = self.run_snippet(
+            "from msgspec_schemaorg.models.creativework import Book\n"
+            "from msgspec_schemaorg.models.creativework import CreativeWork\n"
+            "from msgspec_schemaorg.models.thing import Thing\n"
+            "print(isinstance(CreativeWork, type), isinstance(Thing, type))\n"
+            "print(issubclass(Book, CreativeWork), issubclass(Book, Thing))\n"
+        )
+        self.assertEqual(output.split(), ["True"] * 4)
+
+    def test_all_dir_and_star_import(self):
+        """__all__, dir() and star imports still expose every class."""
+        import msgspec_schemaorg.models as models
+
+        self.assertIn("Person", models.__all__)
+        self.assertIn("person", models.__all__)
+        self.assertIn("Person", dir(models))
+        self.assertIs(models.person.Person, models.Person)
+
+        namespace = {}
+        exec("from msgspec_schemaorg.models.product import *", namespace)
+        self.assertIn("Product", namespace)
+        self.assertIsInstance(namespace["Product"], type)
+
+    def test_unknown_attribute(self):
+        """Unknown names raise AttributeError."""
+        import msgspec_schemaorg.models as models
+
+        with self.assertRaises(AttributeError):
+            models.NotASchemaOrgClass
+
+    def test_render_lazy_init(self):
+        """The rendered __init__ lists exports and registers the lookup table."""
+        code = render_lazy_init(
+            "Generated Schema.org models using msgspec.",
+            {"Person": "person", "Thing": "thing"},
+            submodules=["person", "thing"],
+        )
+        compile(code, "__init__.py", "exec")
+        self.assertIn("    from .person import Person", code)
+        self.assertIn("        'Person': 'person',", code)
+        self.assertIn("submodules=['person', 'thing']", code)
+        self.assertNotIn("import *", code)
+
+
+if __name__ == "__main__":
+    unittest.main()
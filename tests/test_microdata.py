@@ -0,0 +1,210 @@
+"""
+Tests for extracting microdata and RDFa into the models.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg import decode_any
+from msgspec_schemaorg.microdata import MicrodataParser, extract_microdata
+from msgspec_schemaorg.models import Corporation, Organization, Person, PostalAddress, Product
+
+
+MICRODATA_PAGE = """<!DOCTYPE html>
+<html><body>
+<div itemscope itemtype="https://schema.org/Product" itemid="https://example.com/anvil">
+  <h1 itemprop="name">Executive
+    Anvil</h1>
+  <img itemprop="image" src="https://example.com/anvil.jpg" alt="">
+  <p itemprop="description">Sleek &amp; <b>heavy</b>.
+  <div itemprop="aggregateRating" itemscope itemtype="http://schema.org/AggregateRating">
+    Rated <span itemprop="ratingValue">4.4</span>/5
+    from <span itemprop="reviewCount">89</span> reviews
+  </div>
+  <div itemprop="offers" itemscope itemtype="https://schema.org/Offer">
+    <span itemprop="priceCurrency" content="USD">$</span>
+    <span itemprop="price" content="119.99">119.99</span>
+    <link itemprop="availability" href="https://schema.org/InStock">In stock
+    <a itemprop="seller" href="https://example.com/#org">Executive Objects</a>
+  </div>
+</div>
+</body></html>"""
+
+MICRODATA_JSON_LD = b"""{
+    "@type": "Product",
+    "@id": "https://example.com/anvil",
+    "name": "Executive Anvil",
+    "image": "https://example.com/anvil.jpg",
+    "description": "Sleek & heavy.",
+    "aggregateRating": {"@type": "AggregateRating", "ratingValue": "4.4", "reviewCount": 89},
+    "offers": {
+        "@type": "Offer",
+        "priceCurrency": "USD",
+        "price": "119.99",
+        "availability": "https://schema.org/InStock",
+        "seller": {"@type": "Organization", "@id": "https://example.com/#org"}
+    }
+}"""
+
+RDFA_PAGE = """<div vocab="https://schema.org/" typeof="Person" resource="#jane">
+  <span property="name">Jane Doe</span>
+  <span property="schema:jobTitle">Professor</span>
+  <div property="address" typeof="PostalAddress">
+    <span property="streetAddress">20341 Whitworth Institute</span>
+  </div>
+  <a property="url" href="https://jane.example.com">Home page</a>
+  <meta property="og:title" content="Jane">
+</div>"""
+
+
+class TestExtractMicrodata(unittest.TestCase):
+    """Test building models from microdata and RDFa."""
+
+    def test_microdata(self):
+        """Items decode into the same instances as the equivalent JSON-LD."""
+        self.assertEqual(extract_microdata(MICRODATA_PAGE), [decode_any(MICRODATA_JSON_LD)])
+
+    def test_rdfa(self):
+        """RDFa items are read the same way."""
+        (person,) = extract_microdata(RDFA_PAGE.encode())
+        self.assertEqual(
+            person,
+            Person(
+                id="#jane",
+                name="Jane Doe",
+                jobTitle="Professor",
+                address=PostalAddress(streetAddress="20341 Whitworth Institute"),
+                url="https://jane.example.com",
+            ),
+        )
+
+    def test_values(self):
+        """Values are converted to the range of their property."""
+        page = """<div itemscope itemtype="https://schema.org/Accommodation">
+            <span itemprop="yearBuilt">1999</span>
+            <span itemprop="smokingAllowed">False</span>
+            <span itemprop="name">Flat</span><span itemprop="name">Apartment</span>
+            <span itemprop="numberOfRooms">many</span>
+            <div itemprop="floorSize" itemscope><span itemprop="value">40</span></div>
+            <span itemprop="noSuchProperty">x</span>
+        </div>"""
+        (flat,) = extract_microdata(page)
+        self.assertEqual(flat.yearBuilt, 1999)
+        self.assertIs(flat.smokingAllowed, False)
+        self.assertEqual(flat.name, ["Flat", "Apartment"])
+        # Neither a number nor a QuantitativeValue
+        self.assertIsNone(flat.numberOfRooms)
+        (flat,) = extract_microdata(page.replace("many", "3"))
+        self.assertEqual(flat.numberOfRooms, 3)
+        # The untyped item gets the only class of the range
+        self.assertEqual(flat.floorSize.value, "40")
+
+    def test_nested_subtypes(self):
+        """Nested items of a subclass of the property's range keep their class."""
+        page = """<div itemscope itemtype="https://schema.org/Offer">
+            <div itemprop="seller" itemscope itemtype="https://schema.org/Corporation">
+                <span itemprop="name">Acme</span>
+            </div>
+        </div>"""
+        (offer,) = extract_microdata(page)
+        self.assertEqual(offer.seller, Corporation(name="Acme"))
+
+    def test_dropped_values(self):
+        """Text of properties holding only nodes, and unknown types, are left out."""
+        page = """
+            <div itemscope itemtype="http://data-vocabulary.org/Breadcrumb">
+                <span itemprop="title">Home</span>
+            </div>
+            <div itemscope itemtype="https://schema.org/Book">
+                <span itemprop="name">Dune</span>
+                <span itemprop="author">Frank Herbert</span>
+            </div>"""
+        (book,) = extract_microdata(page)
+        self.assertEqual(book.name, "Dune")
+        self.assertIsNone(book.author)
+
+    def test_page_order(self):
+        """Top-level items nested in other items keep their page order."""
+        page = """<div itemscope itemtype="https://schema.org/Organization">
+            <span itemprop="name">Acme</span>
+            <div itemscope itemtype="https://schema.org/Person"><span itemprop="name">Jane</span></div>
+        </div>"""
+        self.assertEqual(
+            extract_microdata(page), [Organization(name="Acme"), Person(name="Jane")]
+        )
+
+    def test_base_url(self):
+        """Relative URLs are resolved against the page and its base element."""
+        page = """<div itemscope itemtype="https://schema.org/Product" itemid="#anvil">
+            <img itemprop="image" src="/images/anvil.jpg">
+            <a itemprop="url" href="anvil">Anvil</a>
+            <meta itemprop="sku" content="anvil">
+        </div>"""
+        (product,) = extract_microdata(page, base_url="https://example.com/products/")
+        self.assertEqual(
+            product,
+            Product(
+                id="https://example.com/products/#anvil",
+                image="https://example.com/images/anvil.jpg",
+                url="https://example.com/products/anvil",
+                sku="anvil",
+            ),
+        )
+
+        (product,) = extract_microdata(
+            '<base href="/shop/">' + page, base_url="https://example.com/products/"
+        )
+        self.assertEqual(product.url, "https://example.com/shop/anvil")
+        # Without a base URL relative URLs are kept
+        self.assertEqual(extract_microdata(page)[0].url, "anvil")
+
+    def test_invalid(self):
+        """Items that do not match their model raise, or are skipped."""
+        page = """
+            <div itemscope itemtype="https://schema.org/Accommodation">
+                <span itemprop="yearBuilt">long ago</span>
+            </div>
+            <div itemscope itemtype="https://schema.org/Person"><span itemprop="name">Jane</span></div>"""
+        with self.assertRaises(msgspec.ValidationError):
+            extract_microdata(page)
+        self.assertEqual(extract_microdata(page, skip_invalid=True), [Person(name="Jane")])
+
+
+class TestMicrodataParser(unittest.TestCase):
+    """Test feeding a page in chunks."""
+
+    def test_streaming(self):
+        """Items are available as soon as their element is closed."""
+        parser = MicrodataParser()
+        page = MICRODATA_PAGE + RDFA_PAGE
+        split = page.index("<div vocab")
+        for start in range(0, split, 50):
+            parser.feed(page[start : min(start + 50, split)])
+        (product,) = parser.pop_objects()
+        self.assertIsInstance(product, Product)
+
+        parser.feed(page[split:])
+        parser.close()
+        (person,) = parser.pop_objects()
+        self.assertEqual(person.name, "Jane Doe")
+        self.assertEqual(parser.pop_objects(), [])
+
+    def test_unclosed_elements(self):
+        """Elements left open are closed with their parent or at the end."""
+        parser = MicrodataParser()
+        parser.feed(
+            '<ul itemscope itemtype="https://schema.org/Person">'
+            '<li itemprop="name">Jane<li itemprop="email">jane@example.com</ul>'
+            '<div itemscope itemtype="https://schema.org/Organization"><p itemprop="name">Acme'
+        )
+        self.assertEqual(parser.pop_objects(), [Person(name="Jane", email="jane@example.com")])
+        parser.close()
+        self.assertEqual(parser.pop_objects(), [Organization(name="Acme")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tests for compacting expanded and prefixed Schema.org terms.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg import decode_any
+from msgspec_schemaorg.models import ImageObject, Offer, Product
+from msgspec_schemaorg.normalize import normalize, normalize_json
+
+
+EXPANDED_JSON = b"""{
+    "@context": "https://schema.org/",
+    "@type": ["http://schema.org/Product"],
+    "http://schema.org/name": [{"@value": "Executive Anvil", "@language": "en"}],
+    "schema:sku": "0446310786",
+    "https://schema.org/offers": {
+        "@type": "schema:Offer",
+        "schema:price": 119.99,
+        "availability": "https://schema.org/InStock"
+    }
+}"""
+
+
+# As written by the expansion algorithm of a JSON-LD processor
+EXPANDED_DOCUMENT = b"""{
+    "@id": "https://example.com/anvil",
+    "@type": ["http://schema.org/Product"],
+    "http://schema.org/name": [{"@value": "Executive Anvil"}],
+    "http://schema.org/url": [{"@id": "https://example.com/anvil"}],
+    "http://schema.org/sameAs": [
+        {"@id": "https://www.wikidata.org/wiki/Q1"},
+        {"@id": "https://en.wikipedia.org/wiki/Anvil"}
+    ],
+    "http://schema.org/image": [{"@id": "https://example.com/anvil.jpg"}],
+    "http://schema.org/offers": [{
+        "@type": ["http://schema.org/Offer"],
+        "http://schema.org/availability": [{"@id": "http://schema.org/InStock"}],
+        "http://schema.org/price": [{"@value": 119.99}]
+    }]
+}"""
+
+
+class TestNormalize(unittest.TestCase):
+    """Test rewriting decoded documents."""
+
+    def test_terms(self):
+        """Keys and types in every namespace are compacted."""
+        document = normalize(
+            {
+                "@context": {"@vocab": "http://schema.org/"},
+                "@type": "https://schema.org/Offer",
+                "http://schema.org/seller": {"@type": "schema:Organization", "schema:name": "A"},
+                "schema:eligibleRegion": [{"@type": "Place"}, {"@type": "http://schema.org/Country"}],
+            }
+        )
+        self.assertEqual(
+            document,
+            {
+                "@context": {"@vocab": "http://schema.org/"},
+                "@type": "Offer",
+                "seller": {"@type": "Organization", "name": "A"},
+                "eligibleRegion": [{"@type": "Place"}, {"@type": "Country"}],
+            },
+        )
+
+    def test_values_are_kept(self):
+        """Values, @id and terms outside the vocabulary are not rewritten."""
+        document = {
+            "@type": ["schema:Product", "schema:NoSuchClass"],
+            "@id": "schema:anvil",
+            "schema:noSuchProperty": 1,
+            "http://example.com/name": "x",
+            "name": "schema:name",
+        }
+        self.assertEqual(
+            normalize(document),
+            {
+                "@type": ["Product", "schema:NoSuchClass"],
+                "@id": "schema:anvil",
+                "schema:noSuchProperty": 1,
+                "http://example.com/name": "x",
+                "name": "schema:name",
+            },
+        )
+
+    def test_context_prefix(self):
+        """Prefixes the document defines for schema.org are compacted too."""
+        document = {
+            "@context": [{"s": "https://schema.org/", "ex": "http://example.com/"}],
+            "@type": "s:Person",
+            "s:name": "Jane",
+            "ex:name": "x",
+        }
+        self.assertEqual(
+            normalize(document),
+            {
+                "@context": document["@context"],
+                "@type": "Person",
+                "name": "Jane",
+                "ex:name": "x",
+            },
+        )
+
+
+class TestNormalizeJson(unittest.TestCase):
+    """Test rewriting encoded documents."""
+
+    def test_decode(self):
+        """Expanded documents decode into the models once normalized."""
+        product = decode_any(normalize_json(EXPANDED_JSON))
+        self.assertIsInstance(product, Product)
+        self.assertEqual(product.name, ["Executive Anvil"])
+        self.assertEqual(product.sku, "0446310786")
+        self.assertEqual(product.offers, Offer(price=119.99, availability="https://schema.org/InStock"))
+
+    def test_references(self):
+        """Node references in properties that hold no nodes are replaced by their @id."""
+        product = decode_any(normalize_json(EXPANDED_DOCUMENT))
+        self.assertEqual(product.url, ["https://example.com/anvil"])
+        self.assertEqual(
+            product.sameAs,
+            ["https://www.wikidata.org/wiki/Q1", "https://en.wikipedia.org/wiki/Anvil"],
+        )
+        self.assertEqual(product.offers, [Offer(availability=["http://schema.org/InStock"], price=[119.99])])
+        # References in properties accepting nodes are kept
+        self.assertEqual(product.image, [ImageObject(id="https://example.com/anvil.jpg")])
+
+        buf = b'{"@type":"http://schema.org/Product","http://schema.org/url":{"@id":"https://ex.com/p"}}'
+        self.assertEqual(decode_any(normalize_json(buf)).url, "https://ex.com/p")
+        # Compact documents are rewritten as well
+        buf = b'{"@type": "Product", "url": {"@id": "https://ex.com/p"}}'
+        self.assertEqual(decode_any(normalize_json(buf)).url, "https://ex.com/p")
+        buf = b'{"@type": "Product", "sameAs": [{"@id": "https://ex.com/a"}, {"@id": "b"}]}'
+        self.assertEqual(decode_any(normalize_json(buf)).sameAs, ["https://ex.com/a", "b"])
+
+    def test_compact_document_unchanged(self):
+        """Documents without terms to rewrite are returned as they are."""
+        for buf in (
+            b'{"@context": "https://schema.org/", "@type": "Offer", '
+            b'"availability": "https://schema.org/InStock", "url": "https://example.com/schema:x"}',
+            memoryview(b'{"@type": "Product", "name": "schema.org/"}'),
+            # References in properties accepting nodes are decoded as they are
+            b'{"@type": "WebPage", "author": {"@id": "#person"}, "hasPart": [{"@id": "#a"}]}',
+        ):
+            self.assertIs(normalize_json(buf), buf)
+
+        text = '{"@type": "schema:Product"}'
+        self.assertEqual(normalize_json(text), b'{"@type":"Product"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
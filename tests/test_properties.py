@@ -0,0 +1,59 @@
+"""
+Tests for the property metadata of the generated models.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.compact import compact_class
+from msgspec_schemaorg.models import AggregateOffer, HowTo, Offer
+from msgspec_schemaorg.properties import PropertyInfo, get_properties, get_property
+
+
+class TestProperties(unittest.TestCase):
+    """Test looking up the properties of model classes."""
+
+    def test_own_and_inherited(self):
+        """Properties include those of the parent classes, inherited ones first."""
+        properties = get_properties(Offer)
+        self.assertEqual(
+            properties["price"],
+            PropertyInfo("price", "price", "http://schema.org/price", ("Number", "Text"), "Offer"),
+        )
+        self.assertEqual(properties["name"].declared_by, "Thing")
+        self.assertEqual(properties["url"].range, ("URL",))
+        names = list(properties)
+        self.assertLess(names.index("name"), names.index("price"))
+
+        # Fields of subclasses extend those of their parents
+        self.assertIn("price", get_properties(AggregateOffer))
+        self.assertEqual(get_property(AggregateOffer, "highPrice").declared_by, "AggregateOffer")
+
+    def test_keyword_fields(self):
+        """Fields renamed to avoid Python keywords keep the Schema.org property name."""
+        info = get_property(HowTo, "yield_")
+        self.assertEqual(info.property, "yield")
+        self.assertEqual(info.iri, "http://schema.org/yield")
+
+    def test_class_lookup(self):
+        """Class names, compact classes and subclasses have the properties of the model."""
+        class CustomOffer(Offer):
+            pass
+
+        properties = get_properties(Offer)
+        self.assertIs(get_properties("Offer"), properties)
+        self.assertIs(get_properties(compact_class(Offer)), properties)
+        self.assertIs(get_properties(CustomOffer), properties)
+
+        with self.assertRaises(KeyError):
+            get_properties("NotAClass")
+        with self.assertRaises(KeyError):
+            get_properties(int)
+        with self.assertRaises(KeyError):
+            get_property(Offer, "notAField")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for runtime resolution of forward references in model annotations.
+"""
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from typing import List, get_args
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.generate import render_namespace_module
+from msgspec_schemaorg.models import Offer, Organization, Person, PostalAddress
+from msgspec_schemaorg.models._namespace import MODULES
+from msgspec_schemaorg.resolve import resolve
+
+
+class TestResolve(unittest.TestCase):
+    """Test resolving generated annotations into runtime types."""
+
+    def test_resolved_annotations(self):
+        """Quoted class names are replaced with the classes themselves."""
+        resolve(Person)
+
+        annotation = Person.__annotations__["worksFor"]
+        self.assertNotIsInstance(annotation, str)
+        self.assertIn(Organization, get_args(annotation))
+        self.assertIn(List[Organization], get_args(annotation))
+
+        # Inherited and referenced classes are resolved as well
+        self.assertNotIsInstance(Organization.__annotations__["address"], str)
+
+    def test_plain_msgspec_decode(self):
+        """After resolving, msgspec decodes nested objects into typed Structs."""
+        resolve(List[Person])
+        people = msgspec.json.decode(
+            b'[{"name": "Jane", "address": {"@type": "PostalAddress", "postalCode": "12345"}}]',
+            type=List[Person],
+        )
+        self.assertIsInstance(people[0].address, PostalAddress)
+        self.assertEqual(people[0].address.postalCode, "12345")
+
+    def test_enums_decode_as_strings(self):
+        """Enumeration-typed fields accept their string values."""
+        resolve(Offer)
+        offer = msgspec.json.decode(
+            b'{"availability": "https://schema.org/InStock"}', type=Offer
+        )
+        self.assertEqual(offer.availability, "https://schema.org/InStock")
+
+    def test_resolution_is_lazy(self):
+        """Resolving one class only imports the classes reachable from it."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "from msgspec_schemaorg.models import PostalAddress\n"
+                "from msgspec_schemaorg.resolve import resolve\n"
+                "resolve(PostalAddress)\n"
+                "print('msgspec_schemaorg.models.intangible.ContactPoint' in sys.modules)\n"
+                "print('msgspec_schemaorg.models.creativework.Recipe' in sys.modules)\n",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split(), ["True", "False"])
+
+    def test_namespace_table(self):
+        """The generated namespace maps class names to their modules."""
+        self.assertEqual(MODULES["Person"], "msgspec_schemaorg.models.person.Person")
+
+        code = render_namespace_module(
+            {"Person": "msgspec_schemaorg.models.person.Person"}
+        )
+        namespace = {}
+        exec(code, namespace)
+        self.assertEqual(
+            namespace["MODULES"], {"Person": "msgspec_schemaorg.models.person.Person"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the cached Schema.org loader used by the generator scripts.
+"""
+import hashlib
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg import schema_cache
+from msgspec_schemaorg.schema_cache import fetch_schema_bytes, load_schema
+
+URL = "https://example.com/schema.jsonld"
+CONTENT = b'{"@graph": [{"@id": "schema:Thing", "@type": "rdfs:Class"}]}'
+
+
+def fake_response(status_code=200, content=b"", etag=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+class TestSchemaCache(unittest.TestCase):
+    """Test the on-disk schema cache and in-process reuse."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        # Start every test without parsed schemas from other tests
+        patcher = mock.patch.multiple(schema_cache, _parsed={}, _url_hashes={})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_download_is_stored_by_content_hash(self):
+        """A download is cached under its hash and indexed with its ETag."""
+        with mock.patch("requests.get", return_value=fake_response(content=CONTENT, etag='"v1"')):
+            content = fetch_schema_bytes(URL, self.cache_dir)
+
+        digest = hashlib.sha256(CONTENT).hexdigest()
+        self.assertEqual(content, CONTENT)
+        self.assertEqual((self.cache_dir / f"{digest}.jsonld").read_bytes(), CONTENT)
+        index = json.loads((self.cache_dir / "index.json").read_text())
+        self.assertEqual(index[URL], {"etag": '"v1"', "sha256": digest})
+
+    def test_revalidation_and_offline(self):
+        """Cached data is revalidated by ETag and used without network offline."""
+        with mock.patch("requests.get", return_value=fake_response(content=CONTENT, etag='"v1"')):
+            fetch_schema_bytes(URL, self.cache_dir)
+
+        with mock.patch("requests.get", return_value=fake_response(304)) as get:
+            self.assertEqual(fetch_schema_bytes(URL, self.cache_dir), CONTENT)
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+
+        with mock.patch("requests.get") as get:
+            self.assertEqual(fetch_schema_bytes(URL, self.cache_dir, offline=True), CONTENT)
+        get.assert_not_called()
+
+        # The cached copy is also used when the network is unavailable
+        with mock.patch("requests.get", side_effect=requests.ConnectionError("offline")):
+            self.assertEqual(fetch_schema_bytes(URL, self.cache_dir), CONTENT)
+
+    def test_offline_without_cache(self):
+        """Offline mode fails clearly if the URL was never downloaded."""
+        with self.assertRaises(FileNotFoundError):
+            fetch_schema_bytes(URL, self.cache_dir, offline=True)
+
+    def test_parsed_once_per_process(self):
+        """Loading the same schema again returns the already parsed data."""
+        with mock.patch("requests.get", return_value=fake_response(content=CONTENT)) as get:
+            first = load_schema(URL, cache_dir=self.cache_dir)
+            second = load_schema(URL, cache_dir=self.cache_dir)
+        self.assertIs(first, second)
+        self.assertEqual(get.call_count, 1)
+
+        # A local file with the same content shares the parsed data as well
+        schema_file = self.cache_dir / "schema.jsonld"
+        schema_file.write_bytes(CONTENT)
+        self.assertIs(load_schema(schema_file=schema_file), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests for streaming NDJSON decoding and encoding.
+"""
+import io
+import sys
+import unittest
+from pathlib import Path
+
+import msgspec
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from msgspec_schemaorg.models import Organization, Person, Product
+from msgspec_schemaorg.stream import iter_decode, iter_encode, write_ndjson
+
+
+class TestStream(unittest.TestCase):
+    """Test NDJSON streaming helpers."""
+
+    def test_iter_decode_typed(self):
+        """Lines are split across chunk boundaries and decoded into the type."""
+        data = b"".join(
+            b'{"@type": "Person", "name": "Person %d"}\n' % i for i in range(50)
+        )
+        people = list(iter_decode(io.BytesIO(data), type=Person, chunk_size=7))
+        self.assertEqual(len(people), 50)
+        self.assertEqual(people[-1], Person(name="Person 49"))
+
+    def test_iter_decode_dispatch(self):
+        """Without a type, each line is decoded into the class named by @type."""
+        data = (
+            b'{"@type": "Person", "name": "Jane"}\r\n'
+            b"\n"
+            b"   \n"
+            b'{"@type": "Product", "name": "Anvil"}\n'
+            b'{"@type": "Organization", "name": "ACME"}'
+        )
+        objects = list(iter_decode(io.BytesIO(data)))
+        self.assertEqual(
+            [type(obj) for obj in objects], [Person, Product, Organization]
+        )
+
+    def test_invalid_line(self):
+        """Malformed lines raise a msgspec error."""
+        with self.assertRaises(msgspec.DecodeError):
+            list(iter_decode(io.BytesIO(b'{"name": "ok"}\n{"name": \n'), type=Person))
+
+    def test_write_and_read_back(self):
+        """write_ndjson output round trips through iter_decode."""
+        people = [Person(name=f"Person {i}") for i in range(100)]
+        out = io.BytesIO()
+
+        self.assertEqual(write_ndjson(out, people, chunk_size=64), 100)
+        self.assertEqual(out.getvalue().count(b"\n"), 100)
+        self.assertEqual(list(iter_decode(io.BytesIO(out.getvalue()), type=Person)), people)
+
+    def test_iter_encode_batches(self):
+        """iter_encode yields batches of complete lines."""
+        people = [Person(name=f"Person {i}") for i in range(10)]
+        batches = list(iter_encode(people, chunk_size=100))
+
+        self.assertGreater(len(batches), 1)
+        for batch in batches:
+            self.assertTrue(batch.endswith(b"\n"))
+        self.assertEqual(
+            b"".join(batches),
+            b"".join(msgspec.json.encode(p) + b"\n" for p in people),
+        )
+        self.assertEqual(list(iter_encode([])), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
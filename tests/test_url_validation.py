@@ -3,15 +3,25 @@
 Tests for URL validation functionality.
 """
 
+import subprocess
 import sys
+import textwrap
 import unittest
 import re
+from pathlib import Path
 from typing import Annotated
 
 from msgspec import Meta, ValidationError, Struct
 
 try:
-    from msgspec_schemaorg.utils import URL, is_valid_url, URL_PATTERN
+    from msgspec_schemaorg.utils import (
+        FAST_URL_PATTERN,
+        URL,
+        URL_PATTERN,
+        is_valid_url,
+        is_valid_url_fast,
+        url_type,
+    )
 except ImportError:
     print("Error: Utils not found. Please check the installation.")
     sys.exit(1)
@@ -66,5 +76,130 @@ class TestURLValidation(unittest.TestCase):
             json.decode(invalid_json, type=URLStruct)
 
 
+
+class TestURLPolicy(unittest.TestCase):
+    """Test URL validation of model fields under each policy."""
+
+    def test_is_valid_url_fast(self):
+        """The structural check accepts http(s) URLs with a host."""
+        self.assertTrue(is_valid_url_fast("https://example.com"))
+        self.assertTrue(is_valid_url_fast("HTTP://example.com/path?q=1"))
+        self.assertTrue(is_valid_url_fast("http://localhost:8080"))
+
+        self.assertFalse(is_valid_url_fast("example.com"))
+        self.assertFalse(is_valid_url_fast("ftp://example.com"))
+        self.assertFalse(is_valid_url_fast("https://"))
+        self.assertFalse(is_valid_url_fast("https:///path"))
+        self.assertFalse(is_valid_url_fast("https://example.com/a b"))
+        self.assertFalse(is_valid_url_fast("https://example.com/\n"))
+        self.assertFalse(is_valid_url_fast(None))
+
+    def test_url_type(self):
+        """URL types are checked by msgspec, ignoring case."""
+        from msgspec import json
+
+        class Page(Struct):
+            url: URL
+
+        self.assertEqual(json.decode(b'{"url": "HTTPS://EXAMPLE.COM"}', type=Page).url, "HTTPS://EXAMPLE.COM")
+        with self.assertRaises(ValidationError):
+            json.decode(b'{"url": "not-a-url"}', type=Page)
+
+        for url in ["https://example.com", "HTTP://example.com/path?q=1", "https://my_host/path",
+                    "example.com", "ftp://example.com", "https://", "https:///path",
+                    "https://example.com/a b", "https://example.com/\n"]:
+            self.assertEqual(bool(re.search(FAST_URL_PATTERN, url)), is_valid_url_fast(url), url)
+
+        self.assertIs(url_type("strict"), URL)
+        self.assertIs(url_type("none"), str)
+        with self.assertRaises(ValueError):
+            url_type("lenient")
+
+    def run_with_policy(self, policy, code):
+        """Run code in a new process whose URL policy is set first."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from msgspec_schemaorg.resolve import set_url_policy\n"
+                f"set_url_policy({policy!r})\n" + textwrap.dedent(code),
+            ],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.split()
+
+    def test_model_fields(self):
+        """URL fields are validated under the strict policy."""
+        output = self.run_with_policy(
+            "strict",
+            """
+            from msgspec import ValidationError
+            from msgspec_schemaorg.codecs import get_decoder
+            from msgspec_schemaorg.models import Person
+
+            decoder = get_decoder(Person)
+            for doc in [
+                b'{"sameAs": ["https://example.com", "not-a-url"]}',
+                b'{"worksFor": {"@type": "Organization", "url": "example.com"}}',
+                b'{"worksFor": {"@type": "Corporation", "url": "example.com"}}',
+            ]:
+                try:
+                    decoder.decode(doc)
+                except ValidationError as e:
+                    print(str(e).rsplit(" ", 1)[-1])
+            print(decoder.decode(b'{"url": "HTTPS://EXAMPLE.COM"}').url)
+            # Fields that also accept text are not validated
+            print(decoder.decode(b'{"identifier": "abc"}').identifier)
+            """,
+        )
+        # Nested objects of a subclass of the range are checked as well
+        self.assertEqual(
+            output,
+            ["`$.sameAs[1]`", "`$.worksFor.url`", "`$.worksFor.url`", "HTTPS://EXAMPLE.COM", "abc"],
+        )
+
+    def test_policies(self):
+        """Each policy accepts a different set of values."""
+        code = """
+            from msgspec import ValidationError
+            from msgspec_schemaorg import AnyThingDecoder
+            from msgspec_schemaorg.codecs import get_decoder
+            from msgspec_schemaorg.models import WebSite
+
+            for decoder in [get_decoder(WebSite), AnyThingDecoder()]:
+                for url in [b"https://example.com", b"https://my_host/path", b"not-a-url"]:
+                    try:
+                        decoder.decode(b'{"@type": "WebSite", "url": "' + url + b'"}')
+                        print("valid")
+                    except ValidationError:
+                        print("invalid")
+            """
+        self.assertEqual(self.run_with_policy("strict", code), ["valid", "invalid", "invalid"] * 2)
+        self.assertEqual(self.run_with_policy("fast", code), ["valid", "valid", "invalid"] * 2)
+        self.assertEqual(self.run_with_policy("none", code), ["valid", "valid", "valid"] * 2)
+
+    def test_default_policy(self):
+        """URLs are not validated by default, and the policy is fixed once in use."""
+        from msgspec_schemaorg.codecs import get_decoder
+        from msgspec_schemaorg.models import WebSite
+        from msgspec_schemaorg.resolve import get_url_policy, set_url_policy
+
+        self.assertEqual(get_url_policy(), "none")
+        decoder = get_decoder(WebSite)
+        self.assertEqual(decoder.decode(b'{"url": "not-a-url"}').url, "not-a-url")
+        # Models are not checked when built directly
+        self.assertEqual(WebSite(url="not-a-url").url, "not-a-url")
+
+        set_url_policy("none")
+        with self.assertRaises(RuntimeError):
+            set_url_policy("strict")
+        with self.assertRaises(ValueError):
+            set_url_policy("lenient")
+        self.assertEqual(get_url_policy(), "none")
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file